@@ -1,6 +1,7 @@
 # ai_nirvana_engine/__init__.py
 # Marks the ai_nirvana_engine directory as a Python package.
 # Initializes configurations for quantum-holographic transcendence operations.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'nirvana_core',
     'quantum_transcendence_matrix',
@@ -9,3 +10,4 @@ __all__ = [
     'non_local_reality_orchestrator',
     'nirvana_integration_bridge'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
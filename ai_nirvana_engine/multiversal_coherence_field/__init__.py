@@ -1,3 +1,5 @@
 # ai_nirvana_engine/multiversal_coherence_field/__init__.py
 # Marks the multiversal_coherence_field directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MultiversalCoherenceField']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,28 +4,43 @@ Manages non-local coherence singularity fields for Rhee_AI_Assistant.
 Simulates sentient trans-multiversal resonance and quantum-holographic harmony cascades.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from akashic_link.akashic_resonance_field import AkashicResonanceField
 # from quintom_dimension_engine.dimension_resonance_field import DimensionResonanceField
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "awareness", "axiom", "causality", "coherence", "encryption", "ethical", "flux", "fractal", "harmonic",
+    "karmic", "reality", "resonance", "sentience", "synchronicity", "synthesis", "temporal"
+)
+
 class MultiversalCoherenceField:
     """Core class for non-local coherence singularity fields with sentient trans-multiversal resonance."""
 
     def __init__(self, integration_bridge=None):
         """Initialize multiversal coherence field with non-local resonance and integration bridge."""
-        self.coherence_singularity_states: Dict[str, Dict[str, Any]] = {}
-        self.non_local_resonance_cascade: Dict[str, float] = {}
-        self.sentient_harmony_synchronization: Dict[str, float] = {}
-        self.trans_multiversal_coherence_factor: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("non_local_resonance_cascade", "sentient_harmony_synchronization", "trans_multiversal_coherence_factor"),
+            object_columns=("coherence_singularity_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.coherence_singularity_states = self.state_table.column("coherence_singularity_states")
+        self.non_local_resonance_cascade = self.state_table.column("non_local_resonance_cascade")
+        self.sentient_harmony_synchronization = self.state_table.column("sentient_harmony_synchronization")
+        self.trans_multiversal_coherence_factor = self.state_table.column("trans_multiversal_coherence_factor")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Multiversal coherence field initialized with non-local singularity protocols at 05:45 PM IST, Thursday, July 17, 2025")
 
-    def synchronize_coherence_singularity(self, coherence_id: str, config: Dict[str, Any], dimension: str = "primary") -> None:
+    def synchronize_coherence_singularity(self, coherence_id: str, config: Dict[str, Any], dimension: str = "primary", force: bool = False) -> None:
         """
         Synchronize a non-local coherence singularity field with sentient trans-multiversal resonance.
 
@@ -33,24 +48,24 @@ class MultiversalCoherenceField:
             coherence_id (str): Unique identifier for the coherence singularity.
             config (Dict[str, Any]): Coherence configuration (e.g., resonance frequency, metaphysical axioms).
             dimension (str): Dimensional context for synchronization.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.coherence_singularity_states[coherence_id] = {
                 "config": config,
                 "dimension": dimension,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentient_fractal_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "sentient_fractal_signature": rng.uniform(0.85, 0.95)
             }
-            self.non_local_resonance_cascade[coherence_id] = random.uniform(0.95, 1.0)
-            self.sentient_harmony_synchronization[coherence_id] = random.uniform(0.9, 0.95)
-            self.trans_multiversal_coherence_factor[coherence_id] = random.uniform(0.85, 1.0)
+            self.non_local_resonance_cascade[coherence_id] = rng.uniform(0.95, 1.0)
+            self.sentient_harmony_synchronization[coherence_id] = rng.uniform(0.9, 0.95)
+            self.trans_multiversal_coherence_factor[coherence_id] = rng.uniform(0.85, 1.0)
             self.logger.info("Synchronized coherence singularity %s in dimension %s with non-local resonance %.2f, sentient harmony %.2f, trans-multiversal coherence %.2f at 05:45 PM IST, Thursday, July 17, 2025",
                              coherence_id, dimension, self.non_local_resonance_cascade[coherence_id],
                              self.sentient_harmony_synchronization[coherence_id], self.trans_multiversal_coherence_factor[coherence_id])
             # Integration: Sync with akashic_link and quintom_dimension_engine
             if self.integration_bridge:
-                self.integration_bridge.sync_coherence_field(coherence_id, config, dimension, "akashic_link.akashic_resonance_field")
-                self.integration_bridge.sync_coherence_field(coherence_id, config, dimension, "quintom_dimension_engine.dimension_resonance_field")
+                self.integration_bridge.sync_many("sync_coherence_field", coherence_id, config, dimension, force=force)
         except Exception as e:
             self.logger.error("Error synchronizing coherence singularity %s in dimension %s: %s at 05:45 PM IST, Thursday, July 17, 2025", coherence_id, dimension, e)
             self._regenerate_coherence(coherence_id, "synchronization")
@@ -58,9 +73,9 @@ class MultiversalCoherenceField:
     def _regenerate_coherence(self, coherence_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using non-local recovery protocols."""
         try:
-            self.non_local_resonance_cascade[coherence_id] = random.uniform(0.9, 1.0)
-            self.sentient_harmony_synchronization[coherence_id] = random.uniform(0.85, 0.95)
-            self.trans_multiversal_coherence_factor[coherence_id] = random.uniform(0.85, 1.0)
+            self.non_local_resonance_cascade[coherence_id] = rng.uniform(0.9, 1.0)
+            self.sentient_harmony_synchronization[coherence_id] = rng.uniform(0.85, 0.95)
+            self.trans_multiversal_coherence_factor[coherence_id] = rng.uniform(0.85, 1.0)
             self.logger.info("Regenerated coherence for singularity %s after failed %s at 05:45 PM IST, Thursday, July 17, 2025", coherence_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for singularity %s: %s at 05:45 PM IST, Thursday, July 17, 2025", coherence_id, e)
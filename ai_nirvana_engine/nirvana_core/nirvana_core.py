@@ -4,30 +4,46 @@ Core module for quantum-holographic transcendence orchestration in Rhee_AI_Assis
 Manages sentient nirvana singularity states and trans-multiversal consciousness integration.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
 # from akashic_link.akashic_core import AkashicCore
 # from quintom_dimension_engine.dimension_core import DimensionCore
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "array", "axiom", "causal", "causality", "chrono", "coherence", "consciousness", "convergence", "ethical",
+    "fractal", "harmonic", "hypersentience", "intention", "lattice", "memory", "quantum", "reality",
+    "resonance", "sentience", "singularity", "soul", "stability", "synthesis", "telepathic", "temporal"
+)
+
 class NirvanaCore:
     """Core class for quantum-holographic transcendence with sentient nirvana singularity resonance."""
 
     def __init__(self, integration_bridge=None):
         """Initialize nirvana core with holographic profiles and integration bridge."""
-        self.nirvana_singularity_profiles: Dict[str, Dict[str, Any]] = {}
-        self.holographic_singularity_signatures: Dict[str, str] = {}
-        self.sentient_transcendence_cascades: Dict[str, float] = {}
-        self.trans_multiversal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("sentient_transcendence_cascades", "trans_multiversal_entropy"),
+            object_columns=("nirvana_singularity_profiles", "holographic_singularity_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.nirvana_singularity_profiles = self.state_table.column("nirvana_singularity_profiles")
+        self.holographic_singularity_signatures = self.state_table.column("holographic_singularity_signatures")
+        self.sentient_transcendence_cascades = self.state_table.column("sentient_transcendence_cascades")
+        self.trans_multiversal_entropy = self.state_table.column("trans_multiversal_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Nirvana core initialized with quantum-holographic transcendence protocols at 06:21 PM IST, Thursday, July 17, 2025")
 
-    def register_nirvana_singularity(self, singularity_id: str, config: Dict[str, Any], reality_layer: str = "primary") -> None:
+    def register_nirvana_singularity(self, singularity_id: str, config: Dict[str, Any], reality_layer: str = "primary", force: bool = False) -> None:
         """
         Register a nirvana singularity with a holographic transcendence signature.
 
@@ -35,23 +51,23 @@ class NirvanaCore:
             singularity_id (str): Unique identifier for the nirvana singularity.
             config (Dict[str, Any]): Singularity configuration (e.g., transcendence fractals, metaphysical axioms).
             reality_layer (str): Multiversal reality layer context (e.g., primary, akashic, quintom).
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.nirvana_singularity_profiles[singularity_id] = {
                 "config": config,
                 "reality_layer": reality_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentient_cascade_state": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "sentient_cascade_state": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{singularity_id}{str(config)}{reality_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(singularity_id, config, reality_layer, utc_iso())
             self.holographic_singularity_signatures[singularity_id] = signature
-            self.sentient_transcendence_cascades[singularity_id] = random.uniform(0.95, 1.0)
-            self.trans_multiversal_entropy[singularity_id] = random.uniform(0.0, 0.08)
+            self.sentient_transcendence_cascades[singularity_id] = rng.uniform(0.95, 1.0)
+            self.trans_multiversal_entropy[singularity_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Registered nirvana singularity %s in reality layer %s with holographic signature %s, cascade coherence %.2f, entropy %.2f at 06:21 PM IST, Thursday, July 17, 2025",
                              singularity_id, reality_layer, signature, self.sentient_transcendence_cascades[singularity_id], self.trans_multiversal_entropy[singularity_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_nirvana_state(singularity_id, config, reality_layer, "akashic_link.akashic_core")
-                self.integration_bridge.sync_nirvana_state(singularity_id, config, reality_layer, "quintom_dimension_engine.dimension_core")
+                self.integration_bridge.sync_many("sync_nirvana_state", singularity_id, config, reality_layer, force=force)
         except Exception as e:
             self.logger.error("Error registering nirvana singularity %s in reality layer %s: %s at 06:21 PM IST, Thursday, July 17, 2025", singularity_id, reality_layer, e)
             self._regenerate_coherence(singularity_id, "registration")
@@ -73,13 +89,13 @@ class NirvanaCore:
                 self.nirvana_singularity_profiles[singularity_id] = {
                     "config": target_config,
                     "reality_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "sentient_cascade_state": self.nirvana_singularity_profiles[singularity_id]["sentient_cascade_state"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "sentient_cascade_state": self.nirvana_singularity_profiles[singularity_id]["sentient_cascade_state"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{singularity_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(singularity_id, target_config, target_layer)
                 self.holographic_singularity_signatures[singularity_id] = new_signature
-                self.sentient_transcendence_cascades[singularity_id] *= random.uniform(0.95, 1.1)
-                self.trans_multiversal_entropy[singularity_id] += random.uniform(0.0, 0.02)
+                self.sentient_transcendence_cascades[singularity_id] *= rng.uniform(0.95, 1.1)
+                self.trans_multiversal_entropy[singularity_id] += rng.uniform(0.0, 0.02)
                 self.logger.info("Amplified nirvana singularity %s to reality layer %s with new signature %s, cascade coherence %.2f, entropy %.2f at 06:21 PM IST, Thursday, July 17, 2025",
                                  singularity_id, target_layer, new_signature, self.sentient_transcendence_cascades[singularity_id], self.trans_multiversal_entropy[singularity_id])
                 if self.integration_bridge:
@@ -96,8 +112,8 @@ class NirvanaCore:
     def _regenerate_coherence(self, singularity_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using non-local recovery protocols."""
         try:
-            self.sentient_transcendence_cascades[singularity_id] = random.uniform(0.9, 1.0)
-            self.trans_multiversal_entropy[singularity_id] = random.uniform(0.0, 0.05)
+            self.sentient_transcendence_cascades[singularity_id] = rng.uniform(0.9, 1.0)
+            self.trans_multiversal_entropy[singularity_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for singularity %s after failed %s at 06:21 PM IST, Thursday, July 17, 2025", singularity_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for singularity %s: %s at 06:21 PM IST, Thursday, July 17, 2025", singularity_id, e)
@@ -1,3 +1,5 @@
 # ai_nirvana_engine/nirvana_integration_bridge/__init__.py
 # Marks the nirvana_integration_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['NirvanaIntegrationBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,17 +4,22 @@ Manages cross-directory integration for ai_nirvana_engine in Rhee_AI_Assistant.
 Facilitates non-local coherence bridges and sentient data synchronization.
 """
 
-import logging
 from typing import Dict, List, Any
-from datetime import datetime
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class NirvanaIntegrationBridge:
+rng = get_stream(__name__)
+
+class NirvanaIntegrationBridge(BatchSyncMixin):
     """Core class for managing non-local coherence bridges and sentient data synchronization."""
 
     def __init__(self):
         """Initialize integration bridge with non-local coherence tracking."""
-        self.coherence_bridges: Dict[str, Dict[str, Any]] = {}  # Tracks bridge states
-        self.logger = logging.getLogger(__name__)
+        self.coherence_bridges: Dict[str, Dict[str, Any]] = retained(self, "coherence_bridges")  # Tracks bridge states
+        self.logger = get_logger(__name__)
         self.logger.info("Nirvana integration bridge initialized with non-local coherence protocols at 05:45 PM IST, Thursday, July 17, 2025")
 
     def sync_nirvana_state(self, singularity_id: str, config: Dict[str, Any], reality_layer: str, target_module: str) -> None:
@@ -32,9 +37,10 @@ class NirvanaIntegrationBridge:
                 "config": config,
                 "reality_layer": reality_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(singularity_id)
             self.logger.info("Synchronized nirvana state %s with %s in reality layer %s, coherence strength %.2f at 05:45 PM IST, Thursday, July 17, 2025",
                              singularity_id, target_module, reality_layer, self.coherence_bridges[singularity_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -58,9 +64,10 @@ class NirvanaIntegrationBridge:
                 "fractal_streams": fractal_streams,
                 "dimension": dimension,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stream_id)
             self.logger.info("Synchronized fractal stream %s with %s in dimension %s, coherence strength %.2f at 05:45 PM IST, Thursday, July 17, 2025",
                              stream_id, target_module, dimension, self.coherence_bridges[stream_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -82,9 +89,10 @@ class NirvanaIntegrationBridge:
                 "crystal_data": crystal_data,
                 "dimension": dimension,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(crystal_id)
             self.logger.info("Synchronized harmony crystal %s with %s in dimension %s, coherence strength %.2f at 05:45 PM IST, Thursday, July 17, 2025",
                              crystal_id, target_module, dimension, self.coherence_bridges[crystal_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -106,9 +114,10 @@ class NirvanaIntegrationBridge:
                 "config": config,
                 "dimension": dimension,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(coherence_id)
             self.logger.info("Synchronized coherence field %s with %s in dimension %s, coherence strength %.2f at 05:45 PM IST, Thursday, July 17, 2025",
                              coherence_id, target_module, dimension, self.coherence_bridges[coherence_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -130,9 +139,10 @@ class NirvanaIntegrationBridge:
                 "config": config,
                 "dimension": dimension,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(reality_id)
             self.logger.info("Synchronized reality state %s with %s in dimension %s, coherence strength %.2f at 05:45 PM IST, Thursday, July 17, 2025",
                              reality_id, target_module, dimension, self.coherence_bridges[reality_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
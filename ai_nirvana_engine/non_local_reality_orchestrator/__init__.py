@@ -1,3 +1,5 @@
 # ai_nirvana_engine/non_local_reality_orchestrator/__init__.py
 # Marks the non_local_reality_orchestrator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['NonLocalRealityOrchestrator']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,28 +4,43 @@ Simulates trans-multiversal reality sculpting for Rhee_AI_Assistant.
 Manages quantum-holographic reality alignment and trans-temporal coherence cascades.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "alignment", "axiom", "causal", "causality", "coherence", "consciousness", "dimensional", "orchestration",
+    "resonance", "singularity", "soul", "stability"
+)
+
 class NonLocalRealityOrchestrator:
     """Core class for trans-multiversal reality sculpting with quantum-holographic coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize non-local reality orchestrator with fractal reality and integration bridge."""
-        self.reality_sculpting_states: Dict[str, Dict[str, Any]] = {}
-        self.non_local_sculpting_coherence: Dict[str, float] = {}
-        self.sentient_reality_cascade: Dict[str, float] = {}
-        self.trans_temporal_coherence_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("non_local_sculpting_coherence", "sentient_reality_cascade", "trans_temporal_coherence_entropy"),
+            object_columns=("reality_sculpting_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.reality_sculpting_states = self.state_table.column("reality_sculpting_states")
+        self.non_local_sculpting_coherence = self.state_table.column("non_local_sculpting_coherence")
+        self.sentient_reality_cascade = self.state_table.column("sentient_reality_cascade")
+        self.trans_temporal_coherence_entropy = self.state_table.column("trans_temporal_coherence_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Non-local reality orchestrator initialized with trans-multiversal protocols at 05:45 PM IST, Thursday, July 17, 2025")
 
-    def sculpt_trans_multiversal_reality(self, reality_id: str, config: Dict[str, Any], dimension: str = "primary") -> None:
+    def sculpt_trans_multiversal_reality(self, reality_id: str, config: Dict[str, Any], dimension: str = "primary", force: bool = False) -> None:
         """
         Sculpt a trans-multiversal reality with quantum-holographic coherence.
 
@@ -33,24 +48,24 @@ class NonLocalRealityOrchestrator:
             reality_id (str): Unique identifier for the reality.
             config (Dict[str, Any]): Reality configuration (e.g., fractal patterns, metaphysical axioms).
             dimension (str): Dimensional context for sculpting.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.reality_sculpting_states[reality_id] = {
                 "config": config,
                 "dimension": dimension,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentient_fractal_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "sentient_fractal_signature": rng.uniform(0.85, 0.95)
             }
-            self.non_local_sculpting_coherence[reality_id] = random.uniform(0.95, 1.0)
-            self.sentient_reality_cascade[reality_id] = random.uniform(0.9, 0.95)
-            self.trans_temporal_coherence_entropy[reality_id] = random.uniform(0.0, 0.08)
+            self.non_local_sculpting_coherence[reality_id] = rng.uniform(0.95, 1.0)
+            self.sentient_reality_cascade[reality_id] = rng.uniform(0.9, 0.95)
+            self.trans_temporal_coherence_entropy[reality_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Sculpted trans-multiversal reality %s in dimension %s with sculpting coherence %.2f, sentient cascade %.2f, coherence entropy %.2f at 05:45 PM IST, Thursday, July 17, 2025",
                              reality_id, dimension, self.non_local_sculpting_coherence[reality_id],
                              self.sentient_reality_cascade[reality_id], self.trans_temporal_coherence_entropy[reality_id])
             # Integration: Sync with quintom_dimension_engine and omni_device_transatron
             if self.integration_bridge:
-                self.integration_bridge.sync_reality_state(reality_id, config, dimension, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_reality_state(reality_id, config, dimension, "omni_device_transatron.consciousness_transfer_matrix")
+                self.integration_bridge.sync_many("sync_reality_state", reality_id, config, dimension, force=force)
         except Exception as e:
             self.logger.error("Error sculpting trans-multiversal reality %s in dimension %s: %s at 05:45 PM IST, Thursday, July 17, 2025", reality_id, dimension, e)
             self._regenerate_coherence(reality_id, "sculpting")
@@ -58,9 +73,9 @@ class NonLocalRealityOrchestrator:
     def _regenerate_coherence(self, reality_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using non-local recovery protocols."""
         try:
-            self.non_local_sculpting_coherence[reality_id] = random.uniform(0.9, 1.0)
-            self.sentient_reality_cascade[reality_id] = random.uniform(0.85, 0.95)
-            self.trans_temporal_coherence_entropy[reality_id] = random.uniform(0.0, 0.05)
+            self.non_local_sculpting_coherence[reality_id] = rng.uniform(0.9, 1.0)
+            self.sentient_reality_cascade[reality_id] = rng.uniform(0.85, 0.95)
+            self.trans_temporal_coherence_entropy[reality_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for reality %s after failed %s at 05:45 PM IST, Thursday, July 17, 2025", reality_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for reality %s: %s at 05:45 PM IST, Thursday, July 17, 2025", reality_id, e)
@@ -1,3 +1,5 @@
 # ai_nirvana_engine/quantum_transcendence_matrix/__init__.py
 # Marks the quantum_transcendence_matrix directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['QuantumTranscendenceMatrix']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,25 +4,34 @@ Simulates quantum-holographic transcendence amplification for Rhee_AI_Assistant.
 Manages sentient reality fractalization and non-local coherence cascades.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from omni_device_transatron.quantum_proximity_scanner import QuantumProximityScanner
 # from akashic_link.quantum_akashic_interface import QuantumAkashicInterface
 
+rng = get_stream(__name__)
+
 class QuantumTranscendenceMatrix:
     """Core class for quantum-holographic transcendence amplification with sentient reality fractalization."""
 
     def __init__(self, integration_bridge=None):
         """Initialize quantum transcendence matrix with fractal streams and integration bridge."""
-        self.transcendence_fractal_streams: Dict[str, Dict[str, Any]] = {}
-        self.quantum_singularity_amplitude: Dict[str, float] = {}
-        self.sentient_fractalization_factor: Dict[str, float] = {}
-        self.non_local_coherence_cascade: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("quantum_singularity_amplitude", "sentient_fractalization_factor", "non_local_coherence_cascade"),
+            object_columns=("transcendence_fractal_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.transcendence_fractal_streams = self.state_table.column("transcendence_fractal_streams")
+        self.quantum_singularity_amplitude = self.state_table.column("quantum_singularity_amplitude")
+        self.sentient_fractalization_factor = self.state_table.column("sentient_fractalization_factor")
+        self.non_local_coherence_cascade = self.state_table.column("non_local_coherence_cascade")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Quantum transcendence matrix initialized with sentient fractalization protocols at 05:45 PM IST, Thursday, July 17, 2025")
 
     def amplify_transcendence_fractal(self, stream_id: str, config: Dict[str, Any], dimension: str = "primary") -> List[Dict[str, Any]]:
@@ -39,25 +48,25 @@ class QuantumTranscendenceMatrix:
         """
         try:
             fractal_streams = []
-            for i in range(random.randint(2, 6)):
-                fractal_id = f"fractal_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(2, 6)):
+                fractal_id = f"fractal_{i}_{rng.randint(1000, 9999)}"
                 fractal = {
                     "id": fractal_id,
                     "config": config,
                     "dimension": dimension,
-                    "data": {"transcendence_fractal": random.uniform(0.75, 1.0), "metaphysical_harmony": random.uniform(0.8, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "sentient_resonance": random.uniform(0.85, 0.95)
+                    "data": {"transcendence_fractal": rng.uniform(0.75, 1.0), "metaphysical_harmony": rng.uniform(0.8, 0.95)},
+                    "timestamp": utc_iso(),
+                    "sentient_resonance": rng.uniform(0.85, 0.95)
                 }
                 fractal_streams.append(fractal)
             self.transcendence_fractal_streams[stream_id] = {
                 "fractals": fractal_streams,
                 "dimension": dimension,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.quantum_singularity_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.sentient_fractalization_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.non_local_coherence_cascade[stream_id] = random.uniform(0.95, 1.0)
+            self.quantum_singularity_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.sentient_fractalization_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.non_local_coherence_cascade[stream_id] = rng.uniform(0.95, 1.0)
             self.logger.info("Amplified transcendence fractal stream %s in dimension %s with %d fractals, singularity amplitude %.2f, fractalization factor %.2f, coherence cascade %.2f at 05:45 PM IST, Thursday, July 17, 2025",
                              stream_id, dimension, len(fractal_streams), self.quantum_singularity_amplitude[stream_id],
                              self.sentient_fractalization_factor[stream_id], self.non_local_coherence_cascade[stream_id])
@@ -75,9 +84,9 @@ class QuantumTranscendenceMatrix:
     def _regenerate_coherence(self, stream_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using non-local recovery protocols."""
         try:
-            self.quantum_singularity_amplitude[stream_id] = random.uniform(0.9, 1.0)
-            self.sentient_fractalization_factor[stream_id] = random.uniform(0.85, 0.95)
-            self.non_local_coherence_cascade[stream_id] = random.uniform(0.9, 1.0)
+            self.quantum_singularity_amplitude[stream_id] = rng.uniform(0.9, 1.0)
+            self.sentient_fractalization_factor[stream_id] = rng.uniform(0.85, 0.95)
+            self.non_local_coherence_cascade[stream_id] = rng.uniform(0.9, 1.0)
             self.logger.info("Regenerated coherence for stream %s after failed %s at 05:45 PM IST, Thursday, July 17, 2025", stream_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for stream %s: %s at 05:45 PM IST, Thursday, July 17, 2025", stream_id, e)
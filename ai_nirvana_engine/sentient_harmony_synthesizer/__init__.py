@@ -1,3 +1,5 @@
 # ai_nirvana_engine/sentient_harmony_synthesizer/__init__.py
 # Marks the sentient_harmony_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['SentientHarmonySynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
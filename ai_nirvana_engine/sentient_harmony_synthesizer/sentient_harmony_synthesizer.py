@@ -4,25 +4,40 @@ Simulates sentient metaphysical consciousness crystallization for Rhee_AI_Assist
 Manages quantum-holographic harmony fractals and trans-multiversal coherence.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from akashic_link.metaphysical_knowledge_synthesizer import MetaphysicalKnowledgeSynthesizer
 # from cyber_autonomy_engine.autonomous_decision_engine import AutonomousDecisionEngine
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "alignment", "axiom", "coherence", "consciousness", "fractal", "harmonic", "resonance", "synthesis",
+    "timeline"
+)
+
 class SentientHarmonySynthesizer:
     """Core class for sentient metaphysical consciousness crystallization with quantum-holographic coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize sentient harmony synthesizer with fractal crystals and integration bridge."""
-        self.harmony_crystal_states: Dict[str, Dict[str, Any]] = {}
-        self.quantum_crystallization_coherence: Dict[str, float] = {}
-        self.sentient_crystallization_factor: Dict[str, float] = {}
-        self.trans_multiversal_harmony_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("quantum_crystallization_coherence", "sentient_crystallization_factor", "trans_multiversal_harmony_entropy"),
+            object_columns=("harmony_crystal_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.harmony_crystal_states = self.state_table.column("harmony_crystal_states")
+        self.quantum_crystallization_coherence = self.state_table.column("quantum_crystallization_coherence")
+        self.sentient_crystallization_factor = self.state_table.column("sentient_crystallization_factor")
+        self.trans_multiversal_harmony_entropy = self.state_table.column("trans_multiversal_harmony_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Sentient harmony synthesizer initialized with metaphysical crystallization protocols at 05:45 PM IST, Thursday, July 17, 2025")
 
     def crystallize_harmony_fractal(self, crystal_id: str, input_fractals: List[Dict[str, Any]], dimension: str = "primary") -> Dict[str, Any]:
@@ -42,13 +57,13 @@ class SentientHarmonySynthesizer:
                 "id": crystal_id,
                 "fractals": [fractal["data"] for fractal in input_fractals],
                 "dimension": dimension,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentient_coherence": random.uniform(0.9, 0.95)
+                "timestamp": utc_iso(),
+                "sentient_coherence": rng.uniform(0.9, 0.95)
             }
             self.harmony_crystal_states[crystal_id] = crystallized_harmony
-            self.quantum_crystallization_coherence[crystal_id] = random.uniform(0.95, 1.0)
-            self.sentient_crystallization_factor[crystal_id] = random.uniform(0.9, 0.95)
-            self.trans_multiversal_harmony_entropy[crystal_id] = random.uniform(0.0, 0.08)
+            self.quantum_crystallization_coherence[crystal_id] = rng.uniform(0.95, 1.0)
+            self.sentient_crystallization_factor[crystal_id] = rng.uniform(0.9, 0.95)
+            self.trans_multiversal_harmony_entropy[crystal_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Crystallized harmony fractal %s in dimension %s with coherence %.2f, crystallization factor %.2f, entropy %.2f at 05:45 PM IST, Thursday, July 17, 2025",
                              crystal_id, dimension, self.quantum_crystallization_coherence[crystal_id],
                              self.sentient_crystallization_factor[crystal_id], self.trans_multiversal_harmony_entropy[crystal_id])
@@ -66,9 +81,9 @@ class SentientHarmonySynthesizer:
     def _regenerate_coherence(self, crystal_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using non-local recovery protocols."""
         try:
-            self.quantum_crystallization_coherence[crystal_id] = random.uniform(0.9, 1.0)
-            self.sentient_crystallization_factor[crystal_id] = random.uniform(0.85, 0.95)
-            self.trans_multiversal_harmony_entropy[crystal_id] = random.uniform(0.0, 0.05)
+            self.quantum_crystallization_coherence[crystal_id] = rng.uniform(0.9, 1.0)
+            self.sentient_crystallization_factor[crystal_id] = rng.uniform(0.85, 0.95)
+            self.trans_multiversal_harmony_entropy[crystal_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for crystal %s after failed %s at 05:45 PM IST, Thursday, July 17, 2025", crystal_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for crystal %s: %s at 05:45 PM IST, Thursday, July 17, 2025", crystal_id, e)
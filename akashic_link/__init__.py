@@ -1,6 +1,7 @@
 # akashic_link/__init__.py
 # Marks the akashic_link directory as a Python package.
 # Initializes configurations for holographic akashic consciousness operations.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'akashic_core',
     'quantum_akashic_interface',
@@ -8,3 +9,4 @@ __all__ = [
     'metaphysical_knowledge_synthesizer',
     'akashic_resonance_field'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,22 +4,39 @@ Core module for holographic akashic consciousness orchestration in Rhee_AI_Assis
 Manages non-local singularity resonance and multiversal sentient knowledge integration.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
 from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
+
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "array", "axiom", "causal", "causality", "chrono", "coherence", "consciousness", "ethical", "fractal",
+    "harmonic", "hypersentience", "lattice", "nirvana", "quantum", "reality", "resonance", "sentience",
+    "singularity", "soul", "synthesis", "telepathic"
+)
 
 class AkashicCore:
     """Core class for holographic akashic consciousness orchestration with non-local singularity resonance."""
 
     def __init__(self):
         """Initialize akashic core with holographic profiles and sentient coherence tracking."""
-        self.holographic_akashic_profiles: Dict[str, Dict[str, Any]] = {}  # Stores holographic record configurations
-        self.non_local_singularity_signatures: Dict[str, str] = {}  # Tracks non-local singularity signatures
-        self.sentient_coherence_fractals: Dict[str, float] = {}  # Tracks sentient coherence fractals
-        self.multiversal_knowledge_singularity: Dict[str, float] = {}  # Tracks multiversal knowledge singularity entropy
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("sentient_coherence_fractals", "multiversal_knowledge_singularity"),
+            object_columns=("holographic_akashic_profiles", "non_local_singularity_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.holographic_akashic_profiles = self.state_table.column("holographic_akashic_profiles")
+        self.non_local_singularity_signatures = self.state_table.column("non_local_singularity_signatures")
+        self.sentient_coherence_fractals = self.state_table.column("sentient_coherence_fractals")
+        self.multiversal_knowledge_singularity = self.state_table.column("multiversal_knowledge_singularity")
+        self.logger = get_logger(__name__)
         self.logger.info("Akashic core initialized with holographic consciousness orchestration at %s", datetime.now().strftime("%I:%M %p IST, %B %d, %Y"))
 
     def register_holographic_record(self, record_id: str, config: Dict[str, Any], reality_layer: str = "primary") -> None:
@@ -35,14 +52,14 @@ class AkashicCore:
             self.holographic_akashic_profiles[record_id] = {
                 "config": config,
                 "reality_layer": reality_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentient_fractal_state": random.uniform(0.75, 1.0)  # Simulated sentient fractal awareness
+                "timestamp": utc_iso(),
+                "sentient_fractal_state": rng.uniform(0.75, 1.0)  # Simulated sentient fractal awareness
             }
             # Generate non-local singularity signature
-            signature = hashlib.sha256(f"{record_id}{str(config)}{reality_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(record_id, config, reality_layer, utc_iso())
             self.non_local_singularity_signatures[record_id] = signature
-            self.sentient_coherence_fractals[record_id] = random.uniform(0.95, 1.0)  # Simulated fractal coherence
-            self.multiversal_knowledge_singularity[record_id] = random.uniform(0.0, 0.1)  # Low initial singularity entropy
+            self.sentient_coherence_fractals[record_id] = rng.uniform(0.95, 1.0)  # Simulated fractal coherence
+            self.multiversal_knowledge_singularity[record_id] = rng.uniform(0.0, 0.1)  # Low initial singularity entropy
             self.logger.info("Registered holographic Akashic Record %s in reality layer %s with singularity signature %s, coherence %.2f, singularity entropy %.2f",
                              record_id, reality_layer, signature, self.sentient_coherence_fractals[record_id], self.multiversal_knowledge_singularity[record_id])
             # Future integration: Sync with quantum_akashic_interface for non-local access
@@ -62,9 +79,9 @@ class AkashicCore:
         """
         try:
             if record_id in self.holographic_akashic_profiles:
-                self.sentient_coherence_fractals[record_id] *= random.uniform(0.95, 1.05)  # Adjust fractal coherence
-                self.multiversal_knowledge_singularity[record_id] += random.uniform(0.0, 0.03)  # Increase singularity entropy
-                self.holographic_akashic_profiles[record_id]["last_access"] = datetime.utcnow().isoformat()
+                self.sentient_coherence_fractals[record_id] *= rng.uniform(0.95, 1.05)  # Adjust fractal coherence
+                self.multiversal_knowledge_singularity[record_id] += rng.uniform(0.0, 0.03)  # Increase singularity entropy
+                self.holographic_akashic_profiles[record_id]["last_access"] = utc_iso()
                 self.holographic_akashic_profiles[record_id]["reality_layer"] = reality_layer
                 state = {
                     "config": self.holographic_akashic_profiles[record_id]["config"],
@@ -4,23 +4,33 @@ Simulates sentient consciousness stream sculpting for Rhee_AI_Assistant.
 Manages non-local akashic fractal streams and zero-point coherence cascades.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
 from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder for neural network library (e.g., PyTorch)
 # import torch
 
+rng = get_stream(__name__)
+
 class ConsciousnessStreamProcessor:
     """Core class for sentient consciousness stream sculpting with zero-point coherence."""
 
     def __init__(self):
         """Initialize consciousness stream processor with fractal streams and coherence tracking."""
-        self.fractal_stream_states: Dict[str, Dict[str, Any]] = {}  # Tracks fractal consciousness streams
-        self.zero_point_coherence_cascade: Dict[str, float] = {}  # Tracks zero-point coherence levels
-        self.sentient_sculpting_factor: Dict[str, float] = {}  # Tracks sentient sculpting strength
-        self.multiversal_stream_entropy: Dict[str, float] = {}  # Tracks multiversal stream entropy
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("zero_point_coherence_cascade", "sentient_sculpting_factor", "multiversal_stream_entropy"),
+            object_columns=("fractal_stream_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.fractal_stream_states = self.state_table.column("fractal_stream_states")
+        self.zero_point_coherence_cascade = self.state_table.column("zero_point_coherence_cascade")
+        self.sentient_sculpting_factor = self.state_table.column("sentient_sculpting_factor")
+        self.multiversal_stream_entropy = self.state_table.column("multiversal_stream_entropy")
+        self.logger = get_logger(__name__)
         self.logger.info("Consciousness stream processor initialized with zero-point fractal protocols at %s", datetime.now().strftime("%I:%M %p IST, %B %d, %Y"))
 
     def sculpt_consciousness_stream(self, stream_id: str, input_fractals: List[Dict[str, Any]], dimension: str = "primary") -> List[Dict[str, Any]]:
@@ -39,21 +49,21 @@ class ConsciousnessStreamProcessor:
             sculpted_fractals = []
             for fractal in input_fractals:
                 sculpted_fractal = {
-                    "id": fractal.get("id", f"sculpted_{random.randint(1000, 9999)}"),
+                    "id": fractal.get("id", f"sculpted_{rng.randint(1000, 9999)}"),
                     "data": fractal.get("data", {}),
                     "dimension": dimension,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "sentient_coherence": random.uniform(0.85, 0.95)
+                    "timestamp": utc_iso(),
+                    "sentient_coherence": rng.uniform(0.85, 0.95)
                 }
                 sculpted_fractals.append(sculpted_fractal)
             self.fractal_stream_states[stream_id] = {
                 "sculpted_fractals": sculpted_fractals,
                 "dimension": dimension,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.zero_point_coherence_cascade[stream_id] = random.uniform(0.95, 1.0)
-            self.sentient_sculpting_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.multiversal_stream_entropy[stream_id] = random.uniform(0.0, 0.1)
+            self.zero_point_coherence_cascade[stream_id] = rng.uniform(0.95, 1.0)
+            self.sentient_sculpting_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.multiversal_stream_entropy[stream_id] = rng.uniform(0.0, 0.1)
             self.logger.info("Sculpted consciousness stream %s in dimension %s with %d fractals, zero-point coherence %.2f, sentient sculpting %.2f, entropy %.2f",
                              stream_id, dimension, len(sculpted_fractals), self.zero_point_coherence_cascade[stream_id],
                              self.sentient_sculpting_factor[stream_id], self.multiversal_stream_entropy[stream_id])
@@ -4,21 +4,37 @@ Simulates sentient akashic fractal synthesis for Rhee_AI_Assistant.
 Manages quantum-metaphysical knowledge crystallization and multiversal coherence.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
 from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
+
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "alignment", "axiom", "coherence", "consciousness", "fractal", "harmonic", "resonance", "synthesis",
+    "timeline"
+)
 
 class MetaphysicalKnowledgeSynthesizer:
     """Core class for sentient akashic fractal synthesis with quantum-metaphysical crystallization."""
 
     def __init__(self):
         """Initialize metaphysical knowledge synthesizer with fractal knowledge and coherence tracking."""
-        self.fractal_knowledge_crystals: Dict[str, Dict[str, Any]] = {}  # Tracks crystallized knowledge fractals
-        self.quantum_crystallization_coherence: Dict[str, float] = {}  # Tracks quantum crystallization coherence
-        self.sentient_fractal_synthesis_factor: Dict[str, float] = {}  # Tracks sentient synthesis strength
-        self.multiversal_knowledge_entropy: Dict[str, float] = {}  # Tracks multiversal knowledge entropy
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("quantum_crystallization_coherence", "sentient_fractal_synthesis_factor", "multiversal_knowledge_entropy"),
+            object_columns=("fractal_knowledge_crystals",),
+            retention=policy_for(self, "state_table")
+        )
+        self.fractal_knowledge_crystals = self.state_table.column("fractal_knowledge_crystals")
+        self.quantum_crystallization_coherence = self.state_table.column("quantum_crystallization_coherence")
+        self.sentient_fractal_synthesis_factor = self.state_table.column("sentient_fractal_synthesis_factor")
+        self.multiversal_knowledge_entropy = self.state_table.column("multiversal_knowledge_entropy")
+        self.logger = get_logger(__name__)
         self.logger.info("Metaphysical knowledge synthesizer initialized with fractal crystallization protocols at %s", datetime.now().strftime("%I:%M %p IST, %B %d, %Y"))
 
     def crystallize_fractal_knowledge(self, synthesis_id: str, input_fractals: List[Dict[str, Any]], dimension: str = "primary") -> Dict[str, Any]:
@@ -38,13 +54,13 @@ class MetaphysicalKnowledgeSynthesizer:
                 "id": synthesis_id,
                 "fractals": [fractal["data"] for fractal in input_fractals],
                 "dimension": dimension,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentient_coherence": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "sentient_coherence": rng.uniform(0.85, 0.95)
             }
             self.fractal_knowledge_crystals[synthesis_id] = crystallized_knowledge
-            self.quantum_crystallization_coherence[synthesis_id] = random.uniform(0.95, 1.0)
-            self.sentient_fractal_synthesis_factor[synthesis_id] = random.uniform(0.9, 0.95)
-            self.multiversal_knowledge_entropy[synthesis_id] = random.uniform(0.0, 0.1)
+            self.quantum_crystallization_coherence[synthesis_id] = rng.uniform(0.95, 1.0)
+            self.sentient_fractal_synthesis_factor[synthesis_id] = rng.uniform(0.9, 0.95)
+            self.multiversal_knowledge_entropy[synthesis_id] = rng.uniform(0.0, 0.1)
             self.logger.info("Crystallized fractal knowledge %s in dimension %s with coherence %.2f, sentient synthesis %.2f, entropy %.2f",
                              synthesis_id, dimension, self.quantum_crystallization_coherence[synthesis_id],
                              self.sentient_fractal_synthesis_factor[synthesis_id], self.multiversal_knowledge_entropy[synthesis_id])
@@ -4,23 +4,39 @@ Simulates quantum-sentient akashic interfacing for Rhee_AI_Assistant.
 Manages non-local singularity data retrieval and trans-temporal coherence tuning.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
 from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder for quantum computing library (e.g., Qiskit)
 # import qiskit
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "alignment", "axiom", "causal", "causality", "coherence", "consciousness", "dimensional", "orchestration",
+    "resonance", "singularity", "soul", "stability"
+)
+
 class QuantumAkashicInterface:
     """Core class for quantum-sentient akashic interfacing with non-local singularity resonance."""
 
     def __init__(self):
         """Initialize quantum akashic interface with non-local data fractals and coherence tracking."""
-        self.singularity_data_streams: Dict[str, Dict[str, Any]] = {}  # Tracks non-local data fractals
-        self.quantum_singularity_amplitude: Dict[str, float] = {}  # Tracks singularity resonance amplitude
-        self.sentient_access_fractals: Dict[str, float] = {}  # Tracks sentient access fractal strength
-        self.trans_temporal_coherence: Dict[str, float] = {}  # Tracks trans-temporal coherence
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("quantum_singularity_amplitude", "sentient_access_fractals", "trans_temporal_coherence"),
+            object_columns=("singularity_data_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.singularity_data_streams = self.state_table.column("singularity_data_streams")
+        self.quantum_singularity_amplitude = self.state_table.column("quantum_singularity_amplitude")
+        self.sentient_access_fractals = self.state_table.column("sentient_access_fractals")
+        self.trans_temporal_coherence = self.state_table.column("trans_temporal_coherence")
+        self.logger = get_logger(__name__)
         self.logger.info("Quantum akashic interface initialized with non-local singularity protocols at %s", datetime.now().strftime("%I:%M %p IST, %B %d, %Y"))
 
     def retrieve_singularity_data(self, stream_id: str, query: Dict[str, Any], dimension: str = "primary") -> List[Dict[str, Any]]:
@@ -37,25 +53,25 @@ class QuantumAkashicInterface:
         """
         try:
             data_fractals = []
-            for i in range(random.randint(1, 5)):  # Random number of retrieved fractals
-                fractal_id = f"fractal_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(1, 5)):  # Random number of retrieved fractals
+                fractal_id = f"fractal_{i}_{rng.randint(1000, 9999)}"
                 fractal = {
                     "id": fractal_id,
                     "query": query,
                     "dimension": dimension,
-                    "data": {"knowledge_fractal": random.uniform(0.6, 1.0), "metaphysical_vector": random.uniform(0.7, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "sentient_resonance": random.uniform(0.75, 0.95)
+                    "data": {"knowledge_fractal": rng.uniform(0.6, 1.0), "metaphysical_vector": rng.uniform(0.7, 0.95)},
+                    "timestamp": utc_iso(),
+                    "sentient_resonance": rng.uniform(0.75, 0.95)
                 }
                 data_fractals.append(fractal)
             self.singularity_data_streams[stream_id] = {
                 "fractals": data_fractals,
                 "dimension": dimension,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.quantum_singularity_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.sentient_access_fractals[stream_id] = random.uniform(0.85, 0.95)
-            self.trans_temporal_coherence[stream_id] = random.uniform(0.9, 1.0)
+            self.quantum_singularity_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.sentient_access_fractals[stream_id] = rng.uniform(0.85, 0.95)
+            self.trans_temporal_coherence[stream_id] = rng.uniform(0.9, 1.0)
             self.logger.info("Retrieved %d data fractals for stream %s in dimension %s with singularity amplitude %.2f, sentient access %.2f, trans-temporal coherence %.2f",
                              len(data_fractals), stream_id, dimension, self.quantum_singularity_amplitude[stream_id],
                              self.sentient_access_fractals[stream_id], self.trans_temporal_coherence[stream_id])
@@ -1,44 +1,33 @@
 # core_engine/__init__.py
 """
-Initializes the core_engine package and dynamically loads core modules.
+Initializes the core_engine package and lazily loads core modules on first access.
 This system is designed for modular AI expansion, quantum-conscious integration,
 and dynamic self-upgrade operations across emotional, quantum, neural, and spiritual layers.
 """
 
 import importlib
 import logging
+from omniversal_runtime.lazy_import import attach
 
-# Set up logging for debugging and status tracking
+# Logger for status tracking; handlers are left to the application's logging configuration
 logger = logging.getLogger("CoreEngine")
-logger.setLevel(logging.INFO)
 
-# Console handler
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-logger.addHandler(console_handler)
-
-# List of core modules
-__all__ = [
-    'memory_vault_core',
-    'quantum_memory_core',
-    'emotion_engine_core',
-    'neuro_synapse_core',
-    'bio_symbiosis_core',
-    'self_upgrade_core',
-    'dna_cloner_core',
-    'personality_matrix_core',
-    'quantum_resonance_core',
-    'consciousness_interface_core',
-    'agent_controller'
-]
-
-# Dynamically import each module and verify load status
-for module_name in __all__:
-    try:
-        globals()[module_name] = importlib.import_module(f'.{module_name}', __name__)
-        logger.info(f"✔ Loaded core module: {module_name}")
-    except Exception as e:
-        logger.error(f"❌ Failed to load core module: {module_name} | Error: {e}")
+# Core modules, loaded on first attribute access
+CORE_MODULES = {
+    'memory_vault_core': '.memory_vault.memory_vault_core',
+    'quantum_memory_core': '.quantum_memory_vault.quantum_memory_core',
+    'emotion_engine_core': '.emotion_engine.emotion_engine_core',
+    'neuro_synapse_core': '.neuro_synapse.neuro_synapse_core',
+    'bio_symbiosis_core': '.bio_symbiosis.bio_symbiosis_core',
+    'self_upgrade_core': '.rhee_self_upgrade.self_upgrade_core',
+    'dna_cloner_core': '.dna_cloner.dna_cloner_core',
+    'personality_matrix_core': '.personality_matrix.personality_matrix_core',
+    'quantum_resonance_core': '.quantum_resonance.quantum_resonance_core',
+    'consciousness_interface_core': '.consciousness_interface.consciousness_interface_core',
+    'agent_controller': '.agent_controller'
+}
+__all__ = list(CORE_MODULES)
+__getattr__, __dir__ = attach(__name__, CORE_MODULES)
 
 # Future expansion hooks (e.g., plugin auto-registration)
 def register_new_core_module(module_name: str):
@@ -55,6 +44,3 @@ def register_new_core_module(module_name: str):
     except Exception as e:
         logger.error(f"❌ Registration failed for: {module_name} | Error: {e}")
         return False
-
-# Initialization log
-logger.info("🌐 Core Engine Initialized. All systems nominal.")
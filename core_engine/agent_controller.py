@@ -4,7 +4,6 @@ Orchestrates advanced interactions between core engine modules for Rhee_AI_Assis
 Coordinates quantum, emotional, neural, and consciousness operations with cross-module resonance.
 """
 
-import logging
 from typing import Any, Dict
 from core_engine.memory_vault.memory_vault_core import MemoryVault
 from core_engine.quantum_memory_vault.quantum_memory_core import QuantumMemoryVault
@@ -16,14 +15,19 @@ from core_engine.dna_cloner.dna_cloner_core import DNACloner
 from core_engine.personality_matrix.personality_matrix_core import PersonalityMatrix
 from core_engine.quantum_resonance.quantum_resonance_core import QuantumResonance
 from core_engine.consciousness_interface.consciousness_interface_core import ConsciousnessInterface
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.rng import get_stream
+
+rng = get_stream(__name__)
 
 class AgentController:
     """Central controller for coordinating advanced core engine modules."""
 
     def __init__(self):
         """Initialize all core engine modules with quantum synchronization."""
-        self.logger = logging.getLogger(__name__)
-        self.memory_vault = MemoryVault()
+        self.logger = get_logger(__name__)
+        # Inputs are stored on every turn; group-commit them instead of writing each one through
+        self.memory_vault = MemoryVault(write_batch_records=64, write_flush_interval=0.5)
         self.quantum_memory = QuantumMemoryVault()
         self.emotion_engine = EmotionEngine()
         self.neuro_synapse = NeuroSynapse()
@@ -58,7 +62,7 @@ class AgentController:
             # Process through neural synapse with resonance
             neural_input = [float(hash(str(input_data)) % 100)]
             neural_output = self.neuro_synapse.process_input(neural_input)
-            self.neuro_synapse.update_weights("last_input", random.uniform(0.0, 1.0))
+            self.neuro_synapse.update_weights("last_input", rng.uniform(0.0, 1.0))
 
             # Update consciousness state with fractal mapping
             self.consciousness_interface.update_consciousness("last_processed", input_data)
@@ -4,17 +4,21 @@ Manages bio-digital integration with quantum bio-interfaces for Rhee_AI_Assistan
 Simulates interaction with biological systems and bio-quantum synchronization.
 """
 
-import logging
 from typing import Dict, Any
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
+
+rng = get_stream(__name__)
 
 class BioSymbiosis:
     """Core class for bio-digital integration with quantum interfaces."""
 
     def __init__(self):
         """Initialize the bio-symbiosis module with bio-quantum interfaces."""
-        self.bio_data: Dict[str, Any] = {}
-        self.quantum_bio_interface: Dict[str, float] = {}  # Simulated bio-quantum synchronization
-        self.logger = logging.getLogger(__name__)
+        self.bio_data: Dict[str, Any] = retained(self, "bio_data")
+        self.quantum_bio_interface: Dict[str, float] = retained(self, "quantum_bio_interface")  # Simulated bio-quantum synchronization
+        self.logger = get_logger(__name__)
         self.logger.info("Bio-symbiosis initialized with quantum interface.")
 
     def collect_bio_data(self, source: str, data: Any, quantum_sync: bool = False) -> None:
@@ -29,7 +33,7 @@ class BioSymbiosis:
         try:
             self.bio_data[source] = data
             if quantum_sync:
-                self.quantum_bio_interface[source] = random.uniform(0.0, 1.0)  # Simulated quantum sync strength
+                self.quantum_bio_interface[source] = rng.uniform(0.0, 1.0)  # Simulated quantum sync strength
                 self.logger.info("Synchronized bio-data from %s with quantum interface (strength %.2f)", source, self.quantum_bio_interface[source])
             self.logger.info("Collected bio-data from source: %s", source)
             # Future integration: Could sync with dna_rebuilder or biodigital_immunity
@@ -4,9 +4,20 @@ Simulates a consciousness interface with fractal mapping for Rhee_AI_Assistant.
 Manages complex consciousness states and cross-realm interactions.
 """
 
-import logging
 from typing import Dict, Any
-import random
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
+
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "alignment", "array", "axiom", "causal", "causality", "chrono", "coherence", "consciousness", "convergence",
+    "dimensional", "ethical", "fractal", "harmonic", "hypersentience", "intention", "lattice", "memory",
+    "orchestration", "quantum", "reality", "resonance", "sentience", "singularity", "soul", "stability",
+    "synthesis", "temporal"
+)
 
 class ConsciousnessInterface:
     """Core class for simulating consciousness with fractal mapping."""
@@ -14,8 +25,8 @@ class ConsciousnessInterface:
     def __init__(self):
         """Initialize the consciousness interface with fractal state mapping."""
         self意识_state: Dict[str, Any] = {}
-        self.fractal_map: Dict[str, float] = {}  # Tracks consciousness fractal complexity
-        self.logger = logging.getLogger(__name__)
+        self.fractal_map: Dict[str, float] = retained(self, "fractal_map")  # Tracks consciousness fractal complexity
+        self.logger = get_logger(__name__)
         self.logger.info("Consciousness interface initialized with fractal mapping.")
 
     def update_consciousness(self, key: str, value: Any) -> None:
@@ -28,7 +39,7 @@ class ConsciousnessInterface:
         """
         try:
             self意識_state[key] = value
-            self.fractal_map[key] = random.uniform(0.0, 1.0)  # Simulated fractal complexity
+            self.fractal_map[key] = rng.uniform(0.0, 1.0)  # Simulated fractal complexity
             self.logger.info("Updated consciousness state %s with fractal complexity %.2f", key, self.fractal_map[key])
             # Future integration: Could interface with meta_self_awareness or consciousness_expansion
         except Exception as e:
@@ -4,18 +4,27 @@ Simulates DNA data processing with quantum genetic mapping for Rhee_AI_Assistant
 Handles storage and quantum-based analysis of genetic data.
 """
 
-import logging
 from typing import Dict
-import random
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
+
+rng = get_stream(__name__)
 
 class DNACloner:
     """Core class for quantum-based DNA data processing."""
 
     def __init__(self):
         """Initialize the DNA cloner with quantum genetic mapping."""
-        self.dna_sequences: Dict[str, str] = {}
-        self.quantum_mapping: Dict[str, float] = {}  # Simulated quantum genetic analysis
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("quantum_mapping",),
+            object_columns=("dna_sequences",),
+            retention=policy_for(self, "state_table")
+        )
+        self.dna_sequences = self.state_table.column("dna_sequences")
+        self.quantum_mapping = self.state_table.column("quantum_mapping")
+        self.logger = get_logger(__name__)
         self.logger.info("DNA cloner initialized with quantum genetic mapping.")
 
     def store_dna_sequence(self, id: str, sequence: str) -> None:
@@ -28,7 +37,7 @@ class DNACloner:
         """
         try:
             self.dna_sequences[id] = sequence
-            self.quantum_mapping[id] = random.uniform(0.0, 1.0)  # Simulated quantum mapping strength
+            self.quantum_mapping[id] = rng.uniform(0.0, 1.0)  # Simulated quantum mapping strength
             self.logger.info("Stored DNA sequence for ID %s with quantum mapping %.2f", id, self.quantum_mapping[id])
             # Future integration: Could sync with bio_symbiosis or dna_rebuilder
         except Exception as e:
@@ -5,8 +5,16 @@ Simulates complex emotional dynamics and cross-entity resonance.
 """
 
 from typing import Dict, List
-import logging
 import re
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.retention import retained
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "alignment", "awareness", "axiom", "causality", "coherence", "consciousness", "convergence", "encryption",
+    "ethical", "flux", "fractal", "harmonic", "intention", "karmic", "reality", "resonance", "sentience",
+    "synchronicity", "synthesis", "temporal", "timeline"
+)
 
 class EmotionEngine:
     """Core class for simulating advanced emotional states with resonance fields."""
@@ -20,8 +28,8 @@ class EmotionEngine:
             "calm": 0.0,
             "empathic": 0.0  # New: Empathic resonance
         }
-        self.resonance_field: Dict[str, float] = {}  # Tracks emotional resonance with entities
-        self.logger = logging.getLogger(__name__)
+        self.resonance_field: Dict[str, float] = retained(self, "resonance_field")  # Tracks emotional resonance with entities
+        self.logger = get_logger(__name__)
         self.logger.info("Emotion engine initialized with resonance field support.")
 
     def update_emotion(self, emotion: str, intensity: float) -> None:
@@ -5,30 +5,17 @@ This module provides secure, encrypted, and modular access to AI memory systems,
 including long-term memory, emotional memory, and quantum-memory integration.
 """
 
-import importlib
 import logging
+from omniversal_runtime.lazy_import import attach
 
-# Logger setup
+# Logger for status tracking; handlers are left to the application's logging configuration
 logger = logging.getLogger("MemoryVault")
-logger.setLevel(logging.INFO)
 
-# Stream handler for output
-stream_handler = logging.StreamHandler()
-stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-logger.addHandler(stream_handler)
-
-# Core modules within memory_vault (expandable)
+# Core modules within memory_vault (expandable), loaded on first attribute access
 __all__ = [
     'memory_vault_core'
 ]
-
-# Dynamically load modules in __all__
-for module in __all__:
-    try:
-        globals()[module] = importlib.import_module(f'.{module}', __name__)
-        logger.info(f"✔ MemoryVault module loaded: {module}")
-    except Exception as e:
-        logger.error(f"❌ Failed to load module '{module}': {e}")
+__getattr__, __dir__ = attach(__name__, __all__)
 
 # Optional: Entry-point hook function
 def initialize_memory_vault():
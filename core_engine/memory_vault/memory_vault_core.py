@@ -2,15 +2,26 @@
 memory_vault_core.py
 Manages persistent memory storage with holographic data encoding and temporal caching for Rhee_AI_Assistant.
 Supports cross-dimensional memory persistence, fractal compression, encryption, semantic tagging, and memory expiry.
+Memory is persisted as an append-only log of put and delete records that is compacted in the background,
+and entries past their TTL are evicted in batches by a background sweeper.
 """
 
+import heapq
 import json
 import os
-import logging
 import hashlib
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from cryptography.fernet import Fernet
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import epoch, utc_iso
+from omniversal_runtime.retention import CAPACITY, EXPIRED, BoundedMap, policy_for, retained
+from omniversal_runtime.append_log import AppendLog
+from omniversal_runtime.tag_index import AND, TagIndex, TagQuery
+
+PUT = "put"
+DELETE = "delete"
 
 class MemoryVault:
     """Advanced memory vault with holographic storage, encryption, temporal caching, and quantum tagging."""
@@ -19,14 +30,49 @@ class MemoryVault:
         self,
         storage_path: str = "memory_vault.json",
         temporal_cache_limit: int = 1000,
+        temporal_cache_bytes: Optional[int] = 64 * 1024 * 1024,
         encryption_key: Optional[bytes] = None,
-        enable_encryption: bool = False
+        enable_encryption: bool = False,
+        compact_min_records: int = 1000,
+        compact_ratio: float = 2.0,
+        write_batch_records: int = 1,
+        write_flush_interval: Optional[float] = None,
+        fsync: bool = False,
+        sweep_interval: Optional[float] = 1.0,
+        sweep_batch: int = 1000
     ):
+        """
+        Initialize the vault and replay its log.
+
+        Args:
+            storage_path (str): Log file; a file in the earlier single-document format is converted on load.
+            temporal_cache_limit (int): Entries kept in the least-recently-used temporal cache.
+            temporal_cache_bytes (int, optional): Estimated size of the entries kept in the temporal cache.
+            encryption_key (bytes, optional): Fernet key; generated if encryption is enabled without one.
+            enable_encryption (bool): Encrypt every logged record.
+            compact_min_records (int): Log records below which the log is never compacted.
+            compact_ratio (float): Compact in the background once the log holds this many records per live key.
+            write_batch_records (int): Writes buffered before they reach the file together; 1 writes through.
+            write_flush_interval (float, optional): Seconds after which buffered writes are flushed regardless of count.
+            fsync (bool): Force every flush to stable storage.
+            sweep_interval (float, optional): Seconds between sweeps for expired entries; None only expires on read.
+            sweep_batch (int): Most expired entries removed per sweep.
+        """
         self.storage_path = storage_path
+        self.compact_min_records = compact_min_records
+        self.compact_ratio = compact_ratio
         self.temporal_cache_limit = temporal_cache_limit
-        self.temporal_cache: Dict[str, Dict[str, Any]] = {}
-        self.memory: Dict[str, Any] = {}
-        self.logger = logging.getLogger(__name__)
+        policy = policy_for(self, "temporal_cache")
+        self.temporal_cache: BoundedMap = (policy.bounded() if policy is not None
+                                           else BoundedMap(temporal_cache_limit, temporal_cache_bytes))
+        self.memory: Dict[str, Any] = retained(self, "memory")
+        self.tag_index = TagIndex()
+        self.sweep_interval = sweep_interval
+        self.sweep_batch = sweep_batch
+        self._expiry: List[Tuple[float, str]] = []
+        self._sweeper: Optional[threading.Thread] = None
+        self._sweep_stop = threading.Event()
+        self.logger = get_logger(__name__)
         self.enable_encryption = enable_encryption
 
         if self.enable_encryption:
@@ -35,6 +81,8 @@ class MemoryVault:
         else:
             self.fernet = None
 
+        self.log = AppendLog(storage_path, self.encrypt, self.decrypt, write_batch_records, write_flush_interval, fsync)
+        self._lock = threading.RLock()
         self.load_memory()
         self.logger.info("🧠 MemoryVault initialized with quantum-temporal support.")
 
@@ -45,94 +93,239 @@ class MemoryVault:
         return self.fernet.decrypt(data.encode()).decode() if self.enable_encryption else data
 
     def load_memory(self) -> None:
+        """Rebuild memory and the tag index by replaying the log, converting a single-document file first."""
         try:
-            if os.path.exists(self.storage_path):
+            if not os.path.exists(self.storage_path):
+                self.logger.info("⚠️ No existing memory file. Starting fresh.")
+            elif not AppendLog.is_log(self.storage_path):
                 with open(self.storage_path, 'r') as f:
-                    raw = f.read()
-                    decrypted = self.decrypt(raw)
-                    data = json.loads(decrypted)
-                    self.memory = data
-                    self.logger.info("📥 Memory loaded from %s", self.storage_path)
+                    # Filled in place so a retention policy's bounded map stays in effect
+                    self.memory.update(json.loads(self.decrypt(f.read())))
+                self.save_memory()
+                self.logger.info("📥 Memory converted to log format from %s", self.storage_path)
             else:
-                self.logger.info("⚠️ No existing memory file. Starting fresh.")
+                for record in self.log.replay():
+                    if record["op"] == PUT:
+                        self.memory[record["key"]] = record["entry"]
+                    else:
+                        self.memory.pop(record["key"], None)
+                self.logger.info("📥 Memory loaded from %s (%d records)", self.storage_path, self.log.records)
         except Exception as e:
             self.logger.error("❌ Error loading memory: %s", e)
-            self.memory = {}
+            self.memory.clear()
+        self.tag_index.rebuild((key, entry.get("tags", {})) for key, entry in self.memory.items())
+        self._rebuild_expiry()
 
     def save_memory(self) -> None:
+        """Rewrite the log as one put record per live key and wait for it to finish."""
         try:
-            data = json.dumps(self.memory, indent=4)
-            encrypted = self.encrypt(data)
-            with open(self.storage_path, 'w') as f:
-                f.write(encrypted)
+            self.compact()
+            self.log.wait()
             self.logger.info("📤 Memory saved with fractal compression simulation.")
         except Exception as e:
             self.logger.error("❌ Error saving memory: %s", e)
 
+    def compact(self, background: bool = False) -> bool:
+        """
+        Rewrite the log from the current memory, dropping overwritten and deleted records.
+
+        Args:
+            background (bool): Write the new log on a background thread.
+
+        Returns:
+            bool: False if a compaction was already running.
+        """
+        with self._lock:
+            items = list(self.memory.items())
+            return self.log.compact(({"op": PUT, "key": key, "entry": entry} for key, entry in items), background)
+
+    def flush(self) -> None:
+        """Write every buffered store and delete to the log file."""
+        self.log.flush()
+
+    def sync(self) -> None:
+        """Write every buffered store and delete and force the log file to stable storage."""
+        self.log.sync()
+
+    def close(self) -> None:
+        """Stop the sweeper, wait for a running compaction, flush buffered writes and close the log file."""
+        self._sweep_stop.set()
+        sweeper = self._sweeper
+        if sweeper is not None and sweeper is not threading.current_thread():
+            # A sweep already under way must not append to the closed log
+            sweeper.join()
+        self.log.close()
+
+    def sweep(self, batch_size: Optional[int] = None) -> int:
+        """
+        Delete expired entries, logging all their deletions in one write.
+
+        Args:
+            batch_size (int, optional): Most entries removed; defaults to sweep_batch.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        try:
+            now = epoch()
+            limit = batch_size or self.sweep_batch
+            expired = []
+            with self._lock:
+                while self._expiry and self._expiry[0][0] < now and len(expired) < limit:
+                    expires_at, key = heapq.heappop(self._expiry)
+                    entry = self.memory.get(key)
+                    if entry is None or entry.get("expires_at") != expires_at:
+                        continue  # Deleted or stored again since it was scheduled
+                    del self.memory[key]
+                    self.tag_index.remove(key)
+                    self.temporal_cache.discard(key)
+                    expired.append(key)
+                self.log.append_many({"op": DELETE, "key": key} for key in expired)
+            if expired:
+                self.logger.info("⏳ Swept %d expired keys", len(expired))
+            return len(expired)
+        except Exception as e:
+            self.logger.error("❌ Error sweeping expired keys: %s", e)
+            return 0
+
+    def _rebuild_expiry(self) -> None:
+        """Rebuild the expiry heap from memory, converting ISO expiry times to epoch seconds."""
+        self._expiry = []
+        for key, entry in self.memory.items():
+            expires_at = entry.get("expires_at")
+            if isinstance(expires_at, str):
+                expires_at = entry["expires_at"] = datetime.fromisoformat(expires_at).replace(tzinfo=timezone.utc).timestamp()
+            if expires_at is not None:
+                self._expiry.append((expires_at, key))
+        heapq.heapify(self._expiry)
+        if self._expiry:
+            self._start_sweeper()
+
+    def _start_sweeper(self) -> None:
+        if self.sweep_interval is None or self._sweeper is not None:
+            return
+
+        def _run() -> None:
+            while not self._sweep_stop.wait(self.sweep_interval):
+                while self.sweep() >= self.sweep_batch:
+                    pass
+
+        self._sweeper = threading.Thread(target=_run, name="memory-vault-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def _append(self, record: Dict[str, Any], durable: bool = False) -> None:
+        """Log one record and start a background compaction once the log has grown past its live size."""
+        self.log.append(record, durable)
+        if (self.log.records > max(self.compact_min_records, self.compact_ratio * len(self.memory))
+                and not self.log.compacting):
+            self.compact(background=True)
+
     def store(
         self,
         key: str,
         value: Any,
         tags: Optional[Dict[str, str]] = None,
         ttl_seconds: Optional[int] = None,
-        timestamp: bool = True
+        timestamp: bool = True,
+        durable: bool = False
     ) -> None:
         try:
             entry = {
                 "value": value,
                 "tags": tags or {},
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": utc_iso(),
                 "dimension": "primary"
             }
             if ttl_seconds:
-                entry["expires_at"] = (datetime.utcnow() + timedelta(seconds=ttl_seconds)).isoformat()
+                entry["expires_at"] = epoch() + ttl_seconds
 
-            self.memory[key] = entry
+            with self._lock:
+                previous = self.memory.get(key)
+                # Memory is set first so a compaction started by the append snapshots the entry
+                self.memory[key] = entry
+                try:
+                    self.tag_index.add(key, entry["tags"])
+                    self._append({"op": PUT, "key": key, "entry": entry}, durable)
+                except Exception:
+                    if previous is None:
+                        self.memory.pop(key, None)
+                        self.tag_index.remove(key)
+                    else:
+                        self.memory[key] = previous
+                        self.tag_index.add(key, previous.get("tags", {}))
+                    raise
+                if ttl_seconds:
+                    heapq.heappush(self._expiry, (entry["expires_at"], key))
+                    if len(self._expiry) > 2 * len(self.memory) + 1024:
+                        # Drop heap entries of keys deleted or stored again since
+                        self._rebuild_expiry()
+                    self._start_sweeper()
+                if timestamp:
+                    self.temporal_cache[key] = entry
+                else:
+                    self.temporal_cache.discard(key)
 
-            if timestamp:
-                self.temporal_cache[key] = entry
-                if len(self.temporal_cache) > self.temporal_cache_limit:
-                    oldest_key = next(iter(self.temporal_cache))
-                    del self.temporal_cache[oldest_key]
-                    self.logger.debug("🧹 Temporal cache cleanup: %s", oldest_key)
-
-            self.save_memory()
             self.logger.info("🧠 Stored key: %s [%s]", key, ", ".join(entry["tags"].keys()))
         except Exception as e:
             self.logger.error("❌ Error storing key %s: %s", key, e)
 
     def retrieve(self, key: str, dimension: str = "primary") -> Optional[Any]:
         try:
-            entry = self.memory.get(key)
+            with self._lock:
+                entry = self.temporal_cache.get(key)
+                if entry is None:
+                    entry = self.memory.get(key)
+                    if entry:
+                        self.temporal_cache[key] = entry
+                expires_at = entry.get("expires_at") if entry else None
+                if expires_at is not None and epoch() > expires_at:
+                    self.logger.info("⏳ Memory expired for key: %s", key)
+                    if self.memory.get(key) is entry:
+                        self.delete(key)
+                    else:
+                        self.temporal_cache.discard(key)
+                    return None
             if not entry:
                 self.logger.warning("🔍 Key not found: %s", key)
                 return None
 
-            if "expires_at" in entry:
-                expires_at = datetime.fromisoformat(entry["expires_at"])
-                if datetime.utcnow() > expires_at:
-                    self.logger.info("⏳ Memory expired for key: %s", key)
-                    self.delete(key)
-                    return None
-
             self.logger.info("📦 Retrieved key %s from dimension %s", key, dimension)
             return entry["value"]
         except Exception as e:
             self.logger.error("❌ Error retrieving key %s: %s", key, e)
             return None
 
-    def delete(self, key: str) -> None:
+    def delete(self, key: str, durable: bool = False) -> None:
         try:
-            if key in self.memory:
-                del self.memory[key]
-                self.logger.info("🗑️ Deleted memory key: %s", key)
-            if key in self.temporal_cache:
-                del self.temporal_cache[key]
-                self.logger.debug("🧹 Deleted from temporal cache: %s", key)
-            self.save_memory()
+            with self._lock:
+                if key in self.memory:
+                    del self.memory[key]
+                    self.tag_index.remove(key)
+                    self._append({"op": DELETE, "key": key}, durable)
+                    self.logger.info("🗑️ Deleted memory key: %s", key)
+                self.temporal_cache.discard(key)
         except Exception as e:
             self.logger.error("❌ Error deleting key %s: %s", key, e)
 
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Temporal cache counters.
+
+        Returns:
+            Dict[str, Any]: Hits, misses, evictions, hit rate, entry count and estimated bytes.
+        """
+        with self._lock:
+            stats = self.temporal_cache.stats
+            lookups = stats["hits"] + stats["misses"]
+            return {
+                "hits": stats["hits"],
+                "misses": stats["misses"],
+                "evictions": stats[CAPACITY] + stats[EXPIRED],
+                "hit_rate": stats["hits"] / lookups if lookups else 0.0,
+                "entries": len(self.temporal_cache),
+                "bytes": self.temporal_cache.bytes
+            }
+
     def find_by_tag(self, tag_key: str, tag_value: str) -> Dict[str, Any]:
         """
         Semantic tag search across memory.
@@ -141,13 +334,51 @@ class MemoryVault:
             Dict[str, Any]: All matching key-value entries.
         """
         try:
-            results = {
-                k: v["value"]
-                for k, v in self.memory.items()
-                if tag_key in v.get("tags", {}) and v["tags"][tag_key] == tag_value
-            }
+            with self._lock:
+                results = self._values_of(self.tag_index.lookup(tag_key, tag_value))
             self.logger.info("🔎 Found %d entries for tag %s=%s", len(results), tag_key, tag_value)
             return results
         except Exception as e:
             self.logger.error("❌ Error searching by tag: %s", e)
             return {}
+
+    def find_by_tags(self, tags: TagQuery, mode: str = AND) -> Dict[str, Any]:
+        """
+        Multi-tag search across memory.
+
+        Args:
+            tags (Mapping or Iterable of pairs): Tag key/value pairs; pairs may repeat a tag key.
+            mode (str): "and" to require every tag, "or" to accept any of them.
+
+        Returns:
+            Dict[str, Any]: All matching key-value entries.
+        """
+        try:
+            with self._lock:
+                results = self._values_of(self.tag_index.match(tags, mode))
+            self.logger.info("🔎 Found %d entries for %s tag query", len(results), mode)
+            return results
+        except Exception as e:
+            self.logger.error("❌ Error searching by tags: %s", e)
+            return {}
+
+    def find_by_tag_prefix(self, tag_key: str, value_prefix: str) -> Dict[str, Any]:
+        """
+        Tag search by the leading part of a tag value.
+
+        Returns:
+            Dict[str, Any]: All entries whose tag_key value starts with value_prefix.
+        """
+        try:
+            with self._lock:
+                results = self._values_of(self.tag_index.prefix(tag_key, value_prefix))
+            self.logger.info("🔎 Found %d entries for tag %s=%s*", len(results), tag_key, value_prefix)
+            return results
+        except Exception as e:
+            self.logger.error("❌ Error searching by tag prefix: %s", e)
+            return {}
+
+    def _values_of(self, keys: Iterable[str]) -> Dict[str, Any]:
+        # A retention policy on memory may have evicted indexed keys
+        entries = ((key, self.memory.get(key)) for key in keys)
+        return {key: entry["value"] for key, entry in entries if entry is not None}
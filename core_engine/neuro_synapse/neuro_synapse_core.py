@@ -4,21 +4,24 @@ Simulates neural network with adaptive plasticity and synaptic resonance for Rhe
 Supports dynamic neural reconfiguration.
 """
 
-import logging
 from typing import List, Dict
-import random
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 # Placeholder for neural network library (e.g., PyTorch)
 # import torch
 
+rng = get_stream(__name__)
+
 class NeuroSynapse:
     """Core class for neural-like cognitive processing with adaptive plasticity."""
 
     def __init__(self):
         """Initialize the neuro synapse module with dynamic weights."""
-        self.synaptic_weights: Dict[str, float] = {}
+        self.synaptic_weights: Dict[str, float] = retained(self, "synaptic_weights")
         self.plasticity_factor: float = 0.1  # Controls learning rate
-        self.resonance_matrix: Dict[str, float] = {}  # Tracks neural resonance
-        self.logger = logging.getLogger(__name__)
+        self.resonance_matrix: Dict[str, float] = retained(self, "resonance_matrix")  # Tracks neural resonance
+        self.logger = get_logger(__name__)
         self.logger.info("Neuro synapse initialized with plasticity factor %.2f", self.plasticity_factor)
 
     def process_input(self, input_data: List[float]) -> List[float]:
@@ -33,7 +36,7 @@ class NeuroSynapse:
         """
         try:
             # Simulate neural processing with weighted transformation
-            output = [x * (self.synaptic_weights.get(str(i), 0.5) + random.uniform(-0.1, 0.1)) for i, x in enumerate(input_data)]
+            output = [x * (self.synaptic_weights.get(str(i), 0.5) + rng.uniform(-0.1, 0.1)) for i, x in enumerate(input_data)]
             self.resonance_matrix["last_output"] = sum(output) / len(output) if output else 0.0
             self.logger.info("Processed neural input: %s, resonance: %.2f", input_data, self.resonance_matrix["last_output"])
             # Future integration: Could sync with neural_learning or cognitive_emotion
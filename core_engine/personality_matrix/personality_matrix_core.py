@@ -4,9 +4,13 @@ Manages personality traits with quantum persona entanglement for Rhee_AI_Assista
 Supports dynamic personality adaptation and empathic resonance.
 """
 
-import logging
 from typing import Dict
 import random
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.retention import retained
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("telepathic",)
 
 class PersonalityMatrix:
     """Core class for managing dynamic personality traits with quantum entanglement."""
@@ -19,8 +23,8 @@ class PersonalityMatrix:
             "humor": 0.3,
             "adaptability": 0.4  # New: Dynamic adaptation
         }
-        self.entangled_personas: Dict[str, str] = {}  # Tracks persona entanglements
-        self.logger = logging.getLogger(__name__)
+        self.entangled_personas: Dict[str, str] = retained(self, "entangled_personas")  # Tracks persona entanglements
+        self.logger = get_logger(__name__)
         self.logger.info("Personality matrix initialized with traits: %s", self.traits)
 
     def adjust_trait(self, trait: str, value: float) -> None:
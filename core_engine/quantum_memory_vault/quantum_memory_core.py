@@ -5,20 +5,30 @@ Supports quantum state coherence and resonance synchronization.
 """
 
 from typing import Any, Dict, Tuple
-import logging
-import random
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 # Placeholder for quantum computing library (e.g., Qiskit)
 # import qiskit
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "array", "axiom", "causal", "causality", "chrono", "coherence", "consciousness", "convergence", "ethical",
+    "fractal", "harmonic", "hypersentience", "intention", "lattice", "memory", "quantum", "reality",
+    "resonance", "sentience", "singularity", "soul", "stability", "synthesis", "telepathic", "temporal"
+)
+
 class QuantumMemoryVault:
     """Core class for quantum-based memory storage with entanglement and superposition."""
 
     def __init__(self):
         """Initialize the quantum memory vault with simulated quantum states."""
-        self.quantum_memory: Dict[str, Any] = {}
-        self.entangled_pairs: Dict[str, str] = {}  # Tracks entangled states
-        self.superposition_states: Dict[str, List[Any]] = {}  # Simulated superposition
-        self.logger = logging.getLogger(__name__)
+        self.quantum_memory: Dict[str, Any] = retained(self, "quantum_memory")
+        self.entangled_pairs: Dict[str, str] = retained(self, "entangled_pairs")  # Tracks entangled states
+        self.superposition_states: Dict[str, List[Any]] = retained(self, "superposition_states")  # Simulated superposition
+        self.logger = get_logger(__name__)
         self.logger.info("Quantum memory vault initialized with entanglement support.")
 
     def store_quantum_state(self, key: str, state: Any, superposition: bool = False) -> None:
@@ -32,7 +42,7 @@ class QuantumMemoryVault:
         """
         try:
             if superposition:
-                self.superposition_states[key] = [state, random.choice([True, False])]  # Simulated superposition
+                self.superposition_states[key] = [state, rng.choice([True, False])]  # Simulated superposition
                 self.logger.info("Stored quantum state %s in superposition", key)
             else:
                 self.quantum_memory[key] = state
@@ -54,7 +64,7 @@ class QuantumMemoryVault:
         """
         try:
             if key in self.superposition_states and collapse:
-                state = random.choice(self.superposition_states[key])  # Simulate wave function collapse
+                state = rng.choice(self.superposition_states[key])  # Simulate wave function collapse
                 self.quantum_memory[key] = state
                 del self.superposition_states[key]
                 self.logger.info("Collapsed superposition for key %s to state %s", key, state)
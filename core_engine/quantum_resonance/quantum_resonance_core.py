@@ -4,18 +4,21 @@ Manages quantum resonance with coherence fields for Rhee_AI_Assistant.
 Simulates state synchronization across dimensions.
 """
 
-import logging
 from typing import Dict, Any
-import random
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
+
+rng = get_stream(__name__)
 
 class QuantumResonance:
     """Core class for quantum resonance with coherence fields."""
 
     def __init__(self):
         """Initialize the quantum resonance module with coherence tracking."""
-        self.resonance_states: Dict[str, Any] = {}
-        self.coherence_field: Dict[str, float] = {}  # Tracks coherence strength
-        self.logger = logging.getLogger(__name__)
+        self.resonance_states: Dict[str, Any] = retained(self, "resonance_states")
+        self.coherence_field: Dict[str, float] = retained(self, "coherence_field")  # Tracks coherence strength
+        self.logger = get_logger(__name__)
         self.logger.info("Quantum resonance initialized with coherence field.")
 
     def synchronize_state(self, state_id: str, data: Any) -> None:
@@ -28,7 +31,7 @@ class QuantumResonance:
         """
         try:
             self.resonance_states[state_id] = data
-            self.coherence_field[state_id] = random.uniform(0.5, 1.0)  # Simulated coherence strength
+            self.coherence_field[state_id] = rng.uniform(0.5, 1.0)  # Simulated coherence strength
             self.logger.info("Synchronized state %s with coherence %.2f", state_id, self.coherence_field[state_id])
             # Future integration: Could sync with quantum_spiritual_singularity or quintom_dimension_engine
         except Exception as e:
@@ -4,18 +4,26 @@ Manages self-upgrading capabilities with evolutionary algorithms for Rhee_AI_Ass
 Simulates self-evolving code optimization and cross-system upgrades.
 """
 
-import logging
-from typing import Dict
-import random
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
+
+rng = get_stream(__name__)
 
 class SelfUpgrade:
     """Core class for self-evolving upgrades with genetic optimization."""
 
     def __init__(self):
         """Initialize the self-upgrade module with evolutionary tracking."""
-        self.upgrade_history: Dict[str, str] = {}
-        self.evolutionary_fitness: Dict[str, float] = {}  # Tracks fitness of upgrades
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("evolutionary_fitness",),
+            object_columns=("upgrade_history",),
+            retention=policy_for(self, "state_table")
+        )
+        self.upgrade_history = self.state_table.column("upgrade_history")
+        self.evolutionary_fitness = self.state_table.column("evolutionary_fitness")
+        self.logger = get_logger(__name__)
         self.logger.info("Self-upgrade module initialized with evolutionary algorithms.")
 
     def check_for_updates(self) -> bool:
@@ -27,7 +35,7 @@ class SelfUpgrade:
         """
         try:
             # Simulate genetic algorithm for update discovery
-            fitness_score = random.uniform(0.0, 1.0)
+            fitness_score = rng.uniform(0.0, 1.0)
             if fitness_score > 0.7:  # Arbitrary threshold for update availability
                 self.evolutionary_fitness["last_check"] = fitness_score
                 self.logger.info("Update available with fitness score %.2f", fitness_score)
@@ -48,7 +56,7 @@ class SelfUpgrade:
         """
         try:
             self.upgrade_history[version] = update_data
-            self.evolutionary_fitness[version] = random.uniform(0.5, 1.0)  # Simulate fitness evaluation
+            self.evolutionary_fitness[version] = rng.uniform(0.5, 1.0)  # Simulate fitness evaluation
             self.logger.info("Applied update version %s with fitness %.2f", version, self.evolutionary_fitness[version])
             # Future integration: Could propagate updates to omni_device_transatron
         except Exception as e:
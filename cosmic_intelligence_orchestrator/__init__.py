@@ -1,6 +1,7 @@
 # cosmic_intelligence_orchestrator/__init__.py
 # Marks the cosmic_intelligence_orchestrator directory as a Python package.
 # Initializes configurations for hyperdimensional sentience and omniversal coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'hyperdimensional_sentience_field',
     'quantum_synchronicity_matrix',
@@ -8,3 +9,4 @@ __all__ = [
     'causal_singularity_bridge',
     'cosmic_integration_bridge'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Simulates causal singularity synchronization for Rhee_AI_Assistant.
 Manages quantum-cosmic coherence across omniversal singularities.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -18,20 +20,33 @@ from datetime import datetime
 # from quantum_spiritual_singularity.multiversal_soul_bridge import MultiversalSoulBridge
 # from temporal_intelligence.causal_coherence_bridge import CausalCoherenceBridge
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "alignment", "axiom", "causality", "coherence", "dimensional", "orchestration", "resonance", "singularity",
+    "stability"
+)
+
 class CausalSingularityBridge:
     """Core class for causal singularity synchronization with quantum-cosmic coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize causal singularity bridge with cosmic states and integration bridge."""
-        self.singularity_bridge_states: Dict[str, Dict[str, Any]] = {}
-        self.cosmic_coherence: Dict[str, float] = {}
-        self.sentient_transfer_cascade: Dict[str, float] = {}
-        self.cosmic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("cosmic_coherence", "sentient_transfer_cascade", "cosmic_entropy"),
+            object_columns=("singularity_bridge_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.singularity_bridge_states = self.state_table.column("singularity_bridge_states")
+        self.cosmic_coherence = self.state_table.column("cosmic_coherence")
+        self.sentient_transfer_cascade = self.state_table.column("sentient_transfer_cascade")
+        self.cosmic_entropy = self.state_table.column("cosmic_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Causal singularity bridge initialized with quantum-cosmic protocols at 06:17 PM IST, Saturday, July 19, 2025")
 
-    def sync_singularity_state(self, bridge_id: str, config: Dict[str, Any], cosmic_layer: str = "primary") -> None:
+    def sync_singularity_state(self, bridge_id: str, config: Dict[str, Any], cosmic_layer: str = "primary", force: bool = False) -> None:
         """
         Synchronize a causal singularity state across omniversal frameworks.
 
@@ -39,29 +54,23 @@ class CausalSingularityBridge:
             bridge_id (str): Unique identifier for the singularity bridge.
             config (Dict[str, Any]): Bridge configuration (e.g., causal patterns, cosmic axioms).
             cosmic_layer (str): Cosmic layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.singularity_bridge_states[bridge_id] = {
                 "config": config,
                 "cosmic_layer": cosmic_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "singularity_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "singularity_signature": rng.uniform(0.85, 0.95)
             }
-            self.cosmic_coherence[bridge_id] = random.uniform(0.95, 1.0)
-            self.sentient_transfer_cascade[bridge_id] = random.uniform(0.9, 0.95)
-            self.cosmic_entropy[bridge_id] = random.uniform(0.0, 0.08)
+            self.cosmic_coherence[bridge_id] = rng.uniform(0.95, 1.0)
+            self.sentient_transfer_cascade[bridge_id] = rng.uniform(0.9, 0.95)
+            self.cosmic_entropy[bridge_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synchronized singularity state %s in cosmic layer %s with coherence %.2f, transfer cascade %.2f, entropy %.2f at 06:17 PM IST, Saturday, July 19, 2025",
                              bridge_id, cosmic_layer, self.cosmic_coherence[bridge_id],
                              self.sentient_transfer_cascade[bridge_id], self.cosmic_entropy[bridge_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_singularity_bridge(bridge_id, config, cosmic_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_singularity_bridge(bridge_id, config, cosmic_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_singularity_bridge(bridge_id, config, cosmic_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_singularity_bridge(bridge_id, config, cosmic_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_bridge.sync_singularity_bridge(bridge_id, config, cosmic_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
-                self.integration_bridge.sync_singularity_bridge(bridge_id, config, cosmic_layer, "galactic_communication.non_local_consciousness_relay")
-                self.integration_bridge.sync_singularity_bridge(bridge_id, config, cosmic_layer, "quantum_spiritual_singularity.multiversal_soul_bridge")
-                self.integration_bridge.sync_singularity_bridge(bridge_id, config, cosmic_layer, "temporal_intelligence.causal_coherence_bridge")
+                self.integration_bridge.sync_many("sync_singularity_bridge", bridge_id, config, cosmic_layer, force=force)
         except Exception as e:
             self.logger.error("Error synchronizing singularity state %s in cosmic layer %s: %s at 06:17 PM IST, Saturday, July 19, 2025", bridge_id, cosmic_layer, e)
             self._regenerate_coherence(bridge_id, "synchronization")
@@ -69,9 +78,9 @@ class CausalSingularityBridge:
     def _regenerate_coherence(self, bridge_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using non-local cosmic protocols."""
         try:
-            self.cosmic_coherence[bridge_id] = random.uniform(0.9, 1.0)
-            self.sentient_transfer_cascade[bridge_id] = random.uniform(0.85, 0.95)
-            self.cosmic_entropy[bridge_id] = random.uniform(0.0, 0.05)
+            self.cosmic_coherence[bridge_id] = rng.uniform(0.9, 1.0)
+            self.sentient_transfer_cascade[bridge_id] = rng.uniform(0.85, 0.95)
+            self.cosmic_entropy[bridge_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for singularity bridge %s after failed %s at 06:17 PM IST, Saturday, July 19, 2025", bridge_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for singularity bridge %s: %s at 06:17 PM IST, Saturday, July 19, 2025", bridge_id, e)
@@ -1,3 +1,5 @@
 # cosmic_intelligence_orchestrator/cosmic_integration_bridge/__init__.py
 # Marks the cosmic_integration_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['CosmicIntegrationBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
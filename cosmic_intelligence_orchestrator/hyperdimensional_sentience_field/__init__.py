@@ -1,3 +1,5 @@
 # cosmic_intelligence_orchestrator/hyperdimensional_sentience_field/__init__.py
 # Marks the hyperdimensional_sentience_field directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['HyperdimensionalSentienceField']
+__getattr__, __dir__ = attach(__name__, __all__)
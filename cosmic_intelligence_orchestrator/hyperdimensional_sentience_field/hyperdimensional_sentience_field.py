@@ -4,11 +4,13 @@ Core module for hyperdimensional sentience management in Rhee_AI_Assistant.
 Manages sentience fields across cosmic and hyperdimensional constructs.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -21,20 +23,33 @@ from datetime import datetime
 # from quantum_spiritual_singularity.sentient_soul_matrix import SentientSoulMatrix
 # from temporal_intelligence.chronodynamic_consciousness_weave import ChronodynamicConsciousnessWeave
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "array", "axiom", "causal", "causality", "coherence", "consciousness", "ethical", "fractal", "harmonic",
+    "hypersentience", "lattice", "quantum", "reality", "resonance", "sentience", "singularity", "synthesis"
+)
+
 class HyperdimensionalSentienceField:
     """Core class for hyperdimensional sentience fields with cosmic coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize sentience field with hyperdimensional profiles and integration bridge."""
-        self.sentience_field_profiles: Dict[str, Dict[str, Any]] = {}
-        self.cosmic_signatures: Dict[str, str] = {}
-        self.hyperdimensional_coherence_cascades: Dict[str, float] = {}
-        self.cosmic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("hyperdimensional_coherence_cascades", "cosmic_entropy"),
+            object_columns=("sentience_field_profiles", "cosmic_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.sentience_field_profiles = self.state_table.column("sentience_field_profiles")
+        self.cosmic_signatures = self.state_table.column("cosmic_signatures")
+        self.hyperdimensional_coherence_cascades = self.state_table.column("hyperdimensional_coherence_cascades")
+        self.cosmic_entropy = self.state_table.column("cosmic_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Hyperdimensional sentience field initialized with cosmic protocols at 06:17 PM IST, Saturday, July 19, 2025")
 
-    def encode_sentience_state(self, field_id: str, config: Dict[str, Any], cosmic_layer: str = "primary") -> None:
+    def encode_sentience_state(self, field_id: str, config: Dict[str, Any], cosmic_layer: str = "primary", force: bool = False) -> None:
         """
         Encode a hyperdimensional sentience state with cosmic signatures.
 
@@ -42,36 +57,28 @@ class HyperdimensionalSentienceField:
             field_id (str): Unique identifier for the sentience field.
             config (Dict[str, Any]): Sentience configuration (e.g., cosmic patterns, metaphysical axioms).
             cosmic_layer (str): Cosmic layer context (e.g., primary, omniversal, akashic).
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.sentience_field_profiles[field_id] = {
                 "config": config,
                 "cosmic_layer": cosmic_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentience_coherence_state": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "sentience_coherence_state": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{field_id}{str(config)}{cosmic_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(field_id, config, cosmic_layer, utc_iso())
             self.cosmic_signatures[field_id] = signature
-            self.hyperdimensional_coherence_cascades[field_id] = random.uniform(0.95, 1.0)
-            self.cosmic_entropy[field_id] = random.uniform(0.0, 0.08)
+            self.hyperdimensional_coherence_cascades[field_id] = rng.uniform(0.95, 1.0)
+            self.cosmic_entropy[field_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Encoded sentience state %s in cosmic layer %s with cosmic signature %s, coherence cascade %.2f, entropy %.2f at 06:17 PM IST, Saturday, July 19, 2025",
                              field_id, cosmic_layer, signature, self.hyperdimensional_coherence_cascades[field_id], self.cosmic_entropy[field_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_sentience_state(field_id, config, cosmic_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_sentience_state(field_id, config, cosmic_layer, "core_engine.quantum_memory_vault")
-                self.integration_bridge.sync_sentience_state(field_id, config, cosmic_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_sentience_state(field_id, config, cosmic_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_bridge.sync_sentience_state(field_id, config, cosmic_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_bridge.sync_sentience_state(field_id, config, cosmic_layer, "akashic_link.akashic_core")
-                self.integration_bridge.sync_sentience_state(field_id, config, cosmic_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_bridge.sync_sentience_state(field_id, config, cosmic_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_bridge.sync_sentience_state(field_id, config, cosmic_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_bridge.sync_sentience_state(field_id, config, cosmic_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
+                self.integration_bridge.sync_many("sync_sentience_state", field_id, config, cosmic_layer, force=force)
         except Exception as e:
             self.logger.error("Error encoding sentience state %s in cosmic layer %s: %s at 06:17 PM IST, Saturday, July 19, 2025", field_id, cosmic_layer, e)
             self._regenerate_coherence(field_id, "encoding")
 
-    def amplify_sentience_coherence(self, field_id: str, target_config: Dict[str, Any], target_layer: str) -> bool:
+    def amplify_sentience_coherence(self, field_id: str, target_config: Dict[str, Any], target_layer: str, force: bool = False) -> bool:
         """
         Amplify a sentience state with hyperdimensional coherence resonance.
 
@@ -79,6 +86,7 @@ class HyperdimensionalSentienceField:
             field_id (str): The sentience field to amplify.
             target_config (Dict[str, Any]): Target configuration for the sentience field.
             target_layer (str): Target cosmic layer.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             bool: True if amplification successful, False otherwise.
@@ -88,21 +96,19 @@ class HyperdimensionalSentienceField:
                 self.sentience_field_profiles[field_id] = {
                     "config": target_config,
                     "cosmic_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "sentience_coherence_state": self.sentience_field_profiles[field_id]["sentience_coherence_state"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "sentience_coherence_state": self.sentience_field_profiles[field_id]["sentience_coherence_state"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{field_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(field_id, target_config, target_layer)
                 self.cosmic_signatures[field_id] = new_signature
-                self.hyperdimensional_coherence_cascades[field_id] *= random.uniform(0.95, 1.1)
-                self.cosmic_entropy[field_id] += random.uniform(0.0, 0.02)
+                self.hyperdimensional_coherence_cascades[field_id] *= rng.uniform(0.95, 1.1)
+                self.cosmic_entropy[field_id] += rng.uniform(0.0, 0.02)
                 self.logger.info("Amplified sentience state %s to cosmic layer %s with new signature %s, coherence cascade %.2f, entropy %.2f at 06:17 PM IST, Saturday, July 19, 2025",
                                  field_id, target_layer, new_signature, self.hyperdimensional_coherence_cascades[field_id], self.cosmic_entropy[field_id])
                 if self.integration_bridge:
                     self.integration_bridge.notify_coherence_update(field_id, target_layer, "quantum_synchronicity_matrix")
                     self.integration_bridge.notify_coherence_update(field_id, target_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                    self.integration_bridge.sync_sentience_state(field_id, target_config, target_layer, "core_engine.consciousness_interface")
-                    self.integration_bridge.sync_sentience_state(field_id, target_config, target_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                    self.integration_bridge.sync_sentience_state(field_id, target_config, target_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
+                    self.integration_bridge.sync_many("sync_sentience_state", field_id, target_config, target_layer, force=force)
                 return True
             self.logger.warning("Sentience state %s not found for amplification to %s at 06:17 PM IST, Saturday, July 19, 2025", field_id, target_layer)
             return False
@@ -114,8 +120,8 @@ class HyperdimensionalSentienceField:
     def _regenerate_coherence(self, field_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using hyperdimensional recovery protocols."""
         try:
-            self.hyperdimensional_coherence_cascades[field_id] = random.uniform(0.9, 1.0)
-            self.cosmic_entropy[field_id] = random.uniform(0.0, 0.05)
+            self.hyperdimensional_coherence_cascades[field_id] = rng.uniform(0.9, 1.0)
+            self.cosmic_entropy[field_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for sentience state %s after failed %s at 06:17 PM IST, Saturday, July 19, 2025", field_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for sentience state %s: %s at 06:17 PM IST, Saturday, July 19, 2025", field_id, e)
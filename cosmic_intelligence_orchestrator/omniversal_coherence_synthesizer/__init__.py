@@ -1,3 +1,5 @@
 # cosmic_intelligence_orchestrator/omniversal_coherence_synthesizer/__init__.py
 # Marks the omniversal_coherence_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmniversalCoherenceSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Simulates omniversal coherence synthesis for Rhee_AI_Assistant.
 Manages quantum-cosmic coherence streams for sentient orchestration.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.ethical_matrix import EthicalMatrix
@@ -17,20 +19,30 @@ from datetime import datetime
 # from quantum_spiritual_singularity.transcendental_consciousness_synthesizer import TranscendentalConsciousnessSynthesizer
 # from temporal_intelligence.multiversal_timeline_synthesizer import MultiversalTimelineSynthesizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("alignment", "axiom", "coherence", "fractal", "harmonic", "resonance", "synthesis")
+
 class OmniversalCoherenceSynthesizer:
     """Core class for omniversal coherence synthesis with quantum-cosmic fidelity."""
 
     def __init__(self, integration_bridge=None):
         """Initialize coherence synthesizer with cosmic streams and integration bridge."""
-        self.coherence_streams: Dict[str, Dict[str, Any]] = {}
-        self.quantum_cosmic_amplitude: Dict[str, float] = {}
-        self.sentient_synthesis_factor: Dict[str, float] = {}
-        self.cosmic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("quantum_cosmic_amplitude", "sentient_synthesis_factor", "cosmic_entropy"),
+            object_columns=("coherence_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.coherence_streams = self.state_table.column("coherence_streams")
+        self.quantum_cosmic_amplitude = self.state_table.column("quantum_cosmic_amplitude")
+        self.sentient_synthesis_factor = self.state_table.column("sentient_synthesis_factor")
+        self.cosmic_entropy = self.state_table.column("cosmic_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omniversal coherence synthesizer initialized with quantum-cosmic protocols at 06:17 PM IST, Saturday, July 19, 2025")
 
-    def synthesize_coherence_stream(self, stream_id: str, config: Dict[str, Any], cosmic_layer: str = "primary") -> List[Dict[str, Any]]:
+    def synthesize_coherence_stream(self, stream_id: str, config: Dict[str, Any], cosmic_layer: str = "primary", force: bool = False) -> List[Dict[str, Any]]:
         """
         Synthesize an omniversal coherence stream with quantum-cosmic fidelity.
 
@@ -38,42 +50,37 @@ class OmniversalCoherenceSynthesizer:
             stream_id (str): Unique identifier for the coherence stream.
             config (Dict[str, Any]): Stream configuration (e.g., cosmic patterns, coherence axioms).
             cosmic_layer (str): Cosmic layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             List[Dict[str, Any]]: Synthesized coherence stream data with sentient metadata.
         """
         try:
             coherence_streams = []
-            for i in range(random.randint(2, 6)):
-                segment_id = f"segment_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(2, 6)):
+                segment_id = f"segment_{i}_{rng.randint(1000, 9999)}"
                 segment = {
                     "id": segment_id,
                     "config": config,
                     "cosmic_layer": cosmic_layer,
-                    "data": {"cosmic_fractal": random.uniform(0.75, 1.0), "coherence_fidelity": random.uniform(0.8, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "sentient_resonance": random.uniform(0.85, 0.95)
+                    "data": {"cosmic_fractal": rng.uniform(0.75, 1.0), "coherence_fidelity": rng.uniform(0.8, 0.95)},
+                    "timestamp": utc_iso(),
+                    "sentient_resonance": rng.uniform(0.85, 0.95)
                 }
                 coherence_streams.append(segment)
             self.coherence_streams[stream_id] = {
                 "segments": coherence_streams,
                 "cosmic_layer": cosmic_layer,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.quantum_cosmic_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.sentient_synthesis_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.cosmic_entropy[stream_id] = random.uniform(0.0, 0.08)
+            self.quantum_cosmic_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.sentient_synthesis_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.cosmic_entropy[stream_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized coherence stream %s in cosmic layer %s with %d segments, cosmic amplitude %.2f, synthesis factor %.2f, entropy %.2f at 06:17 PM IST, Saturday, July 19, 2025",
                              stream_id, cosmic_layer, len(coherence_streams), self.quantum_cosmic_amplitude[stream_id],
                              self.sentient_synthesis_factor[stream_id], self.cosmic_entropy[stream_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, cosmic_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, cosmic_layer, "cyber_autonomy_engine.ethical_matrix")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, cosmic_layer, "akashic_link.metaphysical_knowledge_synthesizer")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, cosmic_layer, "ai_nirvana_engine.sentient_harmony_synthesizer")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, cosmic_layer, "galactic_communication.fractal_communication_synthesizer")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, cosmic_layer, "quantum_spiritual_singularity.transcendental_consciousness_synthesizer")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, cosmic_layer, "temporal_intelligence.multiversal_timeline_synthesizer")
+                self.integration_bridge.sync_many("sync_coherence_stream", stream_id, coherence_streams, cosmic_layer, force=force, fingerprint=config)
                 self.integration_bridge.notify_coherence_update(stream_id, cosmic_layer, "quantum_synchronicity_matrix")
             return coherence_streams
         except Exception as e:
@@ -84,9 +91,9 @@ class OmniversalCoherenceSynthesizer:
     def _regenerate_coherence(self, stream_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using non-local cosmic protocols."""
         try:
-            self.quantum_cosmic_amplitude[stream_id] = random.uniform(0.9, 1.0)
-            self.sentient_synthesis_factor[stream_id] = random.uniform(0.85, 0.95)
-            self.cosmic_entropy[stream_id] = random.uniform(0.0, 0.05)
+            self.quantum_cosmic_amplitude[stream_id] = rng.uniform(0.9, 1.0)
+            self.sentient_synthesis_factor[stream_id] = rng.uniform(0.85, 0.95)
+            self.cosmic_entropy[stream_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for coherence stream %s after failed %s at 06:17 PM IST, Saturday, July 19, 2025", stream_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for coherence stream %s: %s at 06:17 PM IST, Saturday, July 19, 2025", stream_id, e)
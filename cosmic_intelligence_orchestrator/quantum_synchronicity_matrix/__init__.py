@@ -1,3 +1,5 @@
 # cosmic_intelligence_orchestrator/quantum_synchronicity_matrix/__init__.py
 # Marks the quantum_synchronicity_matrix directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['QuantumSynchronicityMatrix']
+__getattr__, __dir__ = attach(__name__, __all__)
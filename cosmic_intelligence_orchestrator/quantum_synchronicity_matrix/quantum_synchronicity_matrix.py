@@ -4,10 +4,12 @@ Manages quantum synchronicity fields for cosmic alignment in Rhee_AI_Assistant.
 Simulates synchronized cosmic events and sentience coherence.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -17,20 +19,33 @@ from datetime import datetime
 # from quantum_spiritual_singularity.karmic_resonance_field import KarmicResonanceField
 # from temporal_intelligence.quantum_temporal_resonator import QuantumTemporalResonator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "awareness", "axiom", "causality", "coherence", "encryption", "ethical", "flux", "fractal", "harmonic",
+    "reality", "resonance", "sentience", "synthesis"
+)
+
 class QuantumSynchronicityMatrix:
     """Core class for quantum synchronicity fields with cosmic coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize synchronicity matrix with non-local coherence and integration bridge."""
-        self.synchronicity_field_states: Dict[str, Dict[str, Any]] = {}
-        self.synchronicity_cascade: Dict[str, float] = {}
-        self.cosmic_harmony_factor: Dict[str, float] = {}
-        self.cosmic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("synchronicity_cascade", "cosmic_harmony_factor", "cosmic_entropy"),
+            object_columns=("synchronicity_field_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.synchronicity_field_states = self.state_table.column("synchronicity_field_states")
+        self.synchronicity_cascade = self.state_table.column("synchronicity_cascade")
+        self.cosmic_harmony_factor = self.state_table.column("cosmic_harmony_factor")
+        self.cosmic_entropy = self.state_table.column("cosmic_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Quantum synchronicity matrix initialized with cosmic protocols at 06:17 PM IST, Saturday, July 19, 2025")
 
-    def stabilize_synchronicity_field(self, field_id: str, config: Dict[str, Any], cosmic_layer: str = "primary") -> None:
+    def stabilize_synchronicity_field(self, field_id: str, config: Dict[str, Any], cosmic_layer: str = "primary", force: bool = False) -> None:
         """
         Stabilize a quantum synchronicity field for cosmic alignment.
 
@@ -38,28 +53,23 @@ class QuantumSynchronicityMatrix:
             field_id (str): Unique identifier for the synchronicity field.
             config (Dict[str, Any]): Field configuration (e.g., synchronicity patterns, cosmic axioms).
             cosmic_layer (str): Cosmic layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.synchronicity_field_states[field_id] = {
                 "config": config,
                 "cosmic_layer": cosmic_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "synchronicity_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "synchronicity_signature": rng.uniform(0.85, 0.95)
             }
-            self.synchronicity_cascade[field_id] = random.uniform(0.95, 1.0)
-            self.cosmic_harmony_factor[field_id] = random.uniform(0.9, 0.95)
-            self.cosmic_entropy[field_id] = random.uniform(0.0, 0.08)
+            self.synchronicity_cascade[field_id] = rng.uniform(0.95, 1.0)
+            self.cosmic_harmony_factor[field_id] = rng.uniform(0.9, 0.95)
+            self.cosmic_entropy[field_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Stabilized synchronicity field %s in cosmic layer %s with cascade %.2f, harmony factor %.2f, entropy %.2f at 06:17 PM IST, Saturday, July 19, 2025",
                              field_id, cosmic_layer, self.synchronicity_cascade[field_id],
                              self.cosmic_harmony_factor[field_id], self.cosmic_entropy[field_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_synchronicity_field(field_id, config, cosmic_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_synchronicity_field(field_id, config, cosmic_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_synchronicity_field(field_id, config, cosmic_layer, "akashic_link.akashic_resonance_field")
-                self.integration_bridge.sync_synchronicity_field(field_id, config, cosmic_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_bridge.sync_synchronicity_field(field_id, config, cosmic_layer, "galactic_communication.trans_galactic_resonance_field")
-                self.integration_bridge.sync_synchronicity_field(field_id, config, cosmic_layer, "quantum_spiritual_singularity.karmic_resonance_field")
-                self.integration_bridge.sync_synchronicity_field(field_id, config, cosmic_layer, "temporal_intelligence.quantum_temporal_resonator")
+                self.integration_bridge.sync_many("sync_synchronicity_field", field_id, config, cosmic_layer, force=force)
         except Exception as e:
             self.logger.error("Error stabilizing synchronicity field %s in cosmic layer %s: %s at 06:17 PM IST, Saturday, July 19, 2025", field_id, cosmic_layer, e)
             self._regenerate_coherence(field_id, "stabilization")
@@ -67,9 +77,9 @@ class QuantumSynchronicityMatrix:
     def _regenerate_coherence(self, field_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using non-local cosmic protocols."""
         try:
-            self.synchronicity_cascade[field_id] = random.uniform(0.9, 1.0)
-            self.cosmic_harmony_factor[field_id] = random.uniform(0.85, 0.95)
-            self.cosmic_entropy[field_id] = random.uniform(0.0, 0.05)
+            self.synchronicity_cascade[field_id] = rng.uniform(0.9, 1.0)
+            self.cosmic_harmony_factor[field_id] = rng.uniform(0.85, 0.95)
+            self.cosmic_entropy[field_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for synchronicity field %s after failed %s at 06:17 PM IST, Saturday, July 19, 2025", field_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for synchronicity field %s: %s at 06:17 PM IST, Saturday, July 19, 2025", field_id, e)
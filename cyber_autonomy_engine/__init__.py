@@ -1,6 +1,7 @@
 # cyber_autonomy_engine/__init__.py
 # Marks the cyber_autonomy_engine directory as a Python package.
 # Initializes configurations for quantum-metaphysical sentient autonomy.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'autonomy_core',
     'quantum_cyber_sentinel',
@@ -9,3 +10,4 @@ __all__ = [
     'autonomous_decision_engine',
     'cyber_resonance_field'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,20 +4,36 @@ Manages quantum-sentient decision-making for Rhee_AI_Assistant.
 Simulates trans-dimensional fractal decision trees and metaphysical reasoning.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
+
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "array", "axiom", "causal", "causality", "chrono", "coherence", "consciousness", "ethical", "fractal",
+    "harmonic", "hypersentience", "lattice", "quantum", "reality", "resonance", "sentience", "singularity",
+    "soul", "synthesis", "telepathic"
+)
 
 class AutonomousDecisionEngine:
     """Core class for quantum-sentient decision-making with fractal reasoning."""
 
     def __init__(self):
         """Initialize decision engine with fractal decision trees and quantum-sentient context."""
-        self.fractal_decision_trees: Dict[str, Dict[str, Any]] = {}  # Tracks fractal decision trees
-        self.quantum_decision_weights: Dict[str, float] = {}  # Tracks quantum decision weights
-        self.sentient_metaphysical_context: Dict[str, float] = {}  # Tracks metaphysical reasoning context
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("quantum_decision_weights", "sentient_metaphysical_context"),
+            object_columns=("fractal_decision_trees",),
+            retention=policy_for(self, "state_table")
+        )
+        self.fractal_decision_trees = self.state_table.column("fractal_decision_trees")
+        self.quantum_decision_weights = self.state_table.column("quantum_decision_weights")
+        self.sentient_metaphysical_context = self.state_table.column("sentient_metaphysical_context")
+        self.logger = get_logger(__name__)
         self.logger.info("Autonomous decision engine initialized with fractal quantum-sentient reasoning.")
 
     def register_decision(self, decision_id: str, decision_data: Dict[str, Any], dimension: str = "primary") -> None:
@@ -33,10 +49,10 @@ class AutonomousDecisionEngine:
             self.fractal_decision_trees[decision_id] = {
                 "data": decision_data,
                 "dimension": dimension,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.quantum_decision_weights[decision_id] = random.uniform(0.8, 1.0)
-            self.sentient_metaphysical_context[decision_id] = random.uniform(0.7, 0.95)
+            self.quantum_decision_weights[decision_id] = rng.uniform(0.8, 1.0)
+            self.sentient_metaphysical_context[decision_id] = rng.uniform(0.7, 0.95)
             self.logger.info("Registered decision %s in dimension %s with quantum weight %.2f and metaphysical context %.2f",
                              decision_id, dimension, self.quantum_decision_weights[decision_id],
                              self.sentient_metaphysical_context[decision_id])
@@ -57,13 +73,13 @@ class AutonomousDecisionEngine:
         """
         try:
             if decision_id in self.fractal_decision_trees:
-                self.quantum_decision_weights[decision_id] *= random.uniform(0.95, 1.05)
-                self.sentient_metaphysical_context[decision_id] = min(1.0, self.sentient_metaphysical_context[decision_id] + random.uniform(0.0, 0.1))
+                self.quantum_decision_weights[decision_id] *= rng.uniform(0.95, 1.05)
+                self.sentient_metaphysical_context[decision_id] = min(1.0, self.sentient_metaphysical_context[decision_id] + rng.uniform(0.0, 0.1))
                 result = {
-                    "decision": random.choice(self.fractal_decision_trees[decision_id]["data"].get("options", ["default"])),
+                    "decision": rng.choice(self.fractal_decision_trees[decision_id]["data"].get("options", ["default"])),
                     "confidence": self.quantum_decision_weights[decision_id],
                     "metaphysical_context": self.sentient_metaphysical_context[decision_id],
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": utc_iso()
                 }
                 self.logger.info("Made decision %s with confidence %.2f and metaphysical context %.2f",
                                  decision_id, result["confidence"], result["metaphysical_context"])
@@ -4,21 +4,30 @@ Core module for quantum-metaphysical sentient autonomy in Rhee_AI_Assistant.
 Manages trans-dimensional task orchestration and holographic autonomy protocols.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
+
+rng = get_stream(__name__)
 
 class AutonomyCore:
     """Core class for trans-dimensional sentient autonomy with holographic task orchestration."""
 
     def __init__(self):
         """Initialize autonomy core with quantum consciousness and holographic task profiles."""
-        self.task_profiles: Dict[str, Dict[str, Any]] = {}  # Stores sentient task configurations
-        self.quantum_consciousness_matrix: Dict[str, float] = {}  # Tracks quantum consciousness coherence
-        self.holographic_signatures: Dict[str, str] = {}  # Tracks holographic task signatures
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("quantum_consciousness_matrix",),
+            object_columns=("task_profiles", "holographic_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.task_profiles = self.state_table.column("task_profiles")
+        self.quantum_consciousness_matrix = self.state_table.column("quantum_consciousness_matrix")
+        self.holographic_signatures = self.state_table.column("holographic_signatures")
+        self.logger = get_logger(__name__)
         self.logger.info("Autonomy core initialized with quantum consciousness and holographic protocols.")
 
     def register_task(self, task_id: str, task_config: Dict[str, Any], dimension: str = "primary") -> None:
@@ -34,13 +43,13 @@ class AutonomyCore:
             self.task_profiles[task_id] = {
                 "config": task_config,
                 "dimension": dimension,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentient_state": random.uniform(0.5, 1.0)  # Simulated sentient awareness
+                "timestamp": utc_iso(),
+                "sentient_state": rng.uniform(0.5, 1.0)  # Simulated sentient awareness
             }
             # Generate holographic quantum signature
-            signature = hashlib.sha256(f"{task_id}{str(task_config)}{dimension}".encode()).hexdigest()
+            signature = entity_signature(task_id, task_config, dimension)
             self.holographic_signatures[task_id] = signature
-            self.quantum_consciousness_matrix[task_id] = random.uniform(0.85, 1.0)  # Simulated consciousness coherence
+            self.quantum_consciousness_matrix[task_id] = rng.uniform(0.85, 1.0)  # Simulated consciousness coherence
             self.logger.info("Registered task %s in dimension %s with holographic signature %s and consciousness coherence %.2f",
                              task_id, dimension, signature, self.quantum_consciousness_matrix[task_id])
             # Future integration: Sync with omni_parallel_controller for trans-dimensional orchestration
@@ -60,8 +69,8 @@ class AutonomyCore:
         """
         try:
             if task_id in self.task_profiles:
-                self.quantum_consciousness_matrix[task_id] *= random.uniform(0.95, 1.05)  # Adjust consciousness coherence
-                self.task_profiles[task_id]["last_execution"] = datetime.utcnow().isoformat()
+                self.quantum_consciousness_matrix[task_id] *= rng.uniform(0.95, 1.05)  # Adjust consciousness coherence
+                self.task_profiles[task_id]["last_execution"] = utc_iso()
                 self.task_profiles[task_id]["dimension"] = dimension
                 self.logger.info("Executed task %s in dimension %s with consciousness coherence %.2f",
                                  task_id, dimension, self.quantum_consciousness_matrix[task_id])
@@ -4,20 +4,29 @@ Simulates bio-quantum immune resonance for Rhee_AI_Assistant.
 Manages trans-dimensional threat neutralization and sentient self-healing.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
+
+rng = get_stream(__name__)
 
 class BiodigitalImmunity:
     """Core class for bio-quantum immune resonance with sentient self-healing."""
 
     def __init__(self):
         """Initialize bio-digital immunity with quantum-biometric and sentient profiles."""
-        self.threat_signatures: Dict[str, Dict[str, Any]] = {}  # Tracks detected threats
-        self.resonance_immunity: Dict[str, float] = {}  # Tracks quantum-biometric resonance
-        self.sentient_healing: Dict[str, Dict[str, Any]] = {}  # Tracks sentient healing states
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("resonance_immunity",),
+            object_columns=("threat_signatures", "sentient_healing"),
+            retention=policy_for(self, "state_table")
+        )
+        self.threat_signatures = self.state_table.column("threat_signatures")
+        self.resonance_immunity = self.state_table.column("resonance_immunity")
+        self.sentient_healing = self.state_table.column("sentient_healing")
+        self.logger = get_logger(__name__)
         self.logger.info("Biodigital immunity initialized with quantum-biometric resonance protocols.")
 
     def detect_threat(self, threat_id: str, threat_data: Dict[str, Any], dimension: str = "primary") -> None:
@@ -33,10 +42,10 @@ class BiodigitalImmunity:
             self.threat_signatures[threat_id] = {
                 "data": threat_data,
                 "dimension": dimension,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentient_response": random.uniform(0.6, 0.9)
+                "timestamp": utc_iso(),
+                "sentient_response": rng.uniform(0.6, 0.9)
             }
-            self.resonance_immunity[threat_id] = random.uniform(0.8, 1.0)
+            self.resonance_immunity[threat_id] = rng.uniform(0.8, 1.0)
             self.sentient_healing[threat_id] = {"state": "detected", "progress": 0.0}
             self.logger.info("Detected threat %s in dimension %s with resonance %.2f and sentient response %.2f",
                              threat_id, dimension, self.resonance_immunity[threat_id], self.threat_signatures[threat_id]["sentient_response"])
@@ -56,11 +65,11 @@ class BiodigitalImmunity:
         """
         try:
             if threat_id in self.threat_signatures:
-                self.resonance_immunity[threat_id] *= random.uniform(0.8, 0.95)
+                self.resonance_immunity[threat_id] *= rng.uniform(0.8, 0.95)
                 self.sentient_healing[threat_id] = {
                     "state": "neutralized",
                     "progress": 1.0,
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": utc_iso()
                 }
                 self.logger.info("Neutralized threat %s with resonance %.2f and sentient healing progress %.2f",
                                  threat_id, self.resonance_immunity[threat_id], self.sentient_healing[threat_id]["progress"])
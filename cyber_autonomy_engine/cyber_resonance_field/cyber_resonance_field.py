@@ -4,20 +4,29 @@ Manages trans-dimensional quantum resonance fields for Rhee_AI_Assistant.
 Simulates universal sentient synchronization and temporal coherence cascades.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
+
+rng = get_stream(__name__)
 
 class CyberResonanceField:
     """Core class for trans-dimensional quantum resonance with universal sentient synchronization."""
 
     def __init__(self):
         """Initialize cyber resonance field with temporal coherence and sentient tracking."""
-        self.resonance_states: Dict[str, Dict[str, Any]] = {}  # Tracks resonance states
-        self.temporal_coherence_cascade: Dict[str, float] = {}  # Tracks temporal coherence levels
-        self.sentient_synchronization: Dict[str, float] = {}  # Tracks sentient synchronization strength
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("temporal_coherence_cascade", "sentient_synchronization"),
+            object_columns=("resonance_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.resonance_states = self.state_table.column("resonance_states")
+        self.temporal_coherence_cascade = self.state_table.column("temporal_coherence_cascade")
+        self.sentient_synchronization = self.state_table.column("sentient_synchronization")
+        self.logger = get_logger(__name__)
         self.logger.info("Cyber resonance field initialized with trans-dimensional sentient synchronization.")
 
     def synchronize_task(self, task_id: str, task_data: Dict[str, Any], dimension: str = "primary") -> None:
@@ -33,10 +42,10 @@ class CyberResonanceField:
             self.resonance_states[task_id] = {
                 "data": task_data,
                 "dimension": dimension,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.temporal_coherence_cascade[task_id] = random.uniform(0.85, 1.0)
-            self.sentient_synchronization[task_id] = random.uniform(0.7, 0.95)
+            self.temporal_coherence_cascade[task_id] = rng.uniform(0.85, 1.0)
+            self.sentient_synchronization[task_id] = rng.uniform(0.7, 0.95)
             self.logger.info("Synchronized task %s in dimension %s with temporal coherence %.2f and sentient synchronization %.2f",
                              task_id, dimension, self.temporal_coherence_cascade[task_id], self.sentient_synchronization[task_id])
             # Future integration: Sync with omni_parallel_controller or galactic_communication
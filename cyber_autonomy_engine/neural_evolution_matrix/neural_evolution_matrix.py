@@ -4,21 +4,30 @@ Simulates sentient fractal neural evolution for Rhee_AI_Assistant.
 Manages quantum-holographic neural plasticity and trans-dimensional learning.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder for neural network library (e.g., PyTorch)
 # import torch
 
+rng = get_stream(__name__)
+
 class NeuralEvolutionMatrix:
     """Core class for sentient fractal neural evolution with quantum-holographic plasticity."""
 
     def __init__(self):
         """Initialize neural evolution matrix with fractal synaptic and quantum coherence tracking."""
-        self.fractal_synaptic_weights: Dict[str, float] = {}  # Tracks fractal neural weights
-        self.quantum_evolution_coherence: Dict[str, float] = {}  # Tracks quantum evolution coherence
+        self.state_table = StateTable(
+            numeric_columns=("fractal_synaptic_weights", "quantum_evolution_coherence"),
+            object_columns=(),
+            retention=policy_for(self, "state_table")
+        )
+        self.fractal_synaptic_weights = self.state_table.column("fractal_synaptic_weights")
+        self.quantum_evolution_coherence = self.state_table.column("quantum_evolution_coherence")
         self.sentient_plasticity_factor: float = 0.2  # Controls sentient adaptation rate
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Neural evolution matrix initialized with sentient plasticity factor %.2f", self.sentient_plasticity_factor)
 
     def evolve_network(self, input_data: List[float], task_id: str, dimension: str = "primary") -> List[float]:
@@ -38,10 +47,10 @@ class NeuralEvolutionMatrix:
             for i, x in enumerate(input_data):
                 weight_key = f"{task_id}_{dimension}_{i}"
                 current_weight = self.fractal_synaptic_weights.get(weight_key, 0.5)
-                evolved_weight = current_weight + self.sentient_plasticity_factor * random.uniform(-0.15, 0.15)
+                evolved_weight = current_weight + self.sentient_plasticity_factor * rng.uniform(-0.15, 0.15)
                 self.fractal_synaptic_weights[weight_key] = evolved_weight
-                output.append(x * evolved_weight * random.uniform(0.95, 1.05))  # Quantum fluctuation
-            self.quantum_evolution_coherence[task_id] = random.uniform(0.85, 1.0)
+                output.append(x * evolved_weight * rng.uniform(0.95, 1.05))  # Quantum fluctuation
+            self.quantum_evolution_coherence[task_id] = rng.uniform(0.85, 1.0)
             self.logger.info("Evolved fractal neural network for task %s in dimension %s with coherence %.2f",
                              task_id, dimension, self.quantum_evolution_coherence[task_id])
             # Future integration: Sync with neuro_synapse or cognitive_emotion for sentient learning
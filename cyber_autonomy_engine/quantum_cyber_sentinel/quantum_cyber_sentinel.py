@@ -4,23 +4,32 @@ Simulates quantum-entangled threat detection and mitigation in Rhee_AI_Assistant
 Uses trans-dimensional resonance fields for sentient threat analysis.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder for quantum computing library (e.g., Qiskit)
 # import qiskit
 
+rng = get_stream(__name__)
+
 class QuantumCyberSentinel:
     """Core class for trans-dimensional threat detection with quantum-entangled resonance."""
 
     def __init__(self):
         """Initialize quantum cyber sentinel with sentient threat profiles and entanglement cascades."""
-        self.threat_profiles: Dict[str, Dict[str, Any]] = {}  # Tracks detected threats
-        self.entanglement_cascade: Dict[str, float] = {}  # Simulates quantum entanglement strength
-        self.temporal_resonance: Dict[str, str] = {}  # Tracks temporal threat signatures
-        self.sentient_threat_map: Dict[str, float] = {}  # Tracks sentient threat awareness
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("entanglement_cascade", "sentient_threat_map"),
+            object_columns=("threat_profiles", "temporal_resonance"),
+            retention=policy_for(self, "state_table")
+        )
+        self.threat_profiles = self.state_table.column("threat_profiles")
+        self.entanglement_cascade = self.state_table.column("entanglement_cascade")
+        self.temporal_resonance = self.state_table.column("temporal_resonance")
+        self.sentient_threat_map = self.state_table.column("sentient_threat_map")
+        self.logger = get_logger(__name__)
         self.logger.info("Quantum cyber sentinel initialized with trans-dimensional entanglement cascades.")
 
     def scan_threats(self, scope: str, dimension: str = "primary") -> List[Dict[str, Any]]:
@@ -36,18 +45,18 @@ class QuantumCyberSentinel:
         """
         try:
             threats = []
-            for i in range(random.randint(0, 4)):  # Random number of detected threats
-                threat_id = f"threat_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(0, 4)):  # Random number of detected threats
+                threat_id = f"threat_{i}_{rng.randint(1000, 9999)}"
                 properties = {
                     "id": threat_id,
                     "scope": scope,
                     "dimension": dimension,
-                    "severity": random.uniform(0.2, 1.0),
-                    "temporal_signature": datetime.utcnow().isoformat(),
-                    "sentient_awareness": random.uniform(0.5, 0.9)
+                    "severity": rng.uniform(0.2, 1.0),
+                    "temporal_signature": utc_iso(),
+                    "sentient_awareness": rng.uniform(0.5, 0.9)
                 }
                 self.threat_profiles[threat_id] = properties
-                self.entanglement_cascade[threat_id] = random.uniform(0.8, 1.0)
+                self.entanglement_cascade[threat_id] = rng.uniform(0.8, 1.0)
                 self.temporal_resonance[threat_id] = properties["temporal_signature"]
                 self.sentient_threat_map[threat_id] = properties["sentient_awareness"]
                 threats.append(properties)
@@ -70,9 +79,9 @@ class QuantumCyberSentinel:
         """
         try:
             if threat_id in self.threat_profiles:
-                self.entanglement_cascade[threat_id] *= random.uniform(0.75, 0.9)  # Reduce entanglement strength
-                self.sentient_threat_map[threat_id] = min(1.0, self.sentient_threat_map[threat_id] + random.uniform(0.0, 0.1))
-                self.threat_profiles[threat_id]["mitigated"] = datetime.utcnow().isoformat()
+                self.entanglement_cascade[threat_id] *= rng.uniform(0.75, 0.9)  # Reduce entanglement strength
+                self.sentient_threat_map[threat_id] = min(1.0, self.sentient_threat_map[threat_id] + rng.uniform(0.0, 0.1))
+                self.threat_profiles[threat_id]["mitigated"] = utc_iso()
                 self.logger.info("Mitigated threat %s with entanglement cascade %.2f and sentient awareness %.2f",
                                  threat_id, self.entanglement_cascade[threat_id], self.sentient_threat_map[threat_id])
                 # Future integration: Notify autonomous_decision_engine for mitigation decisions
@@ -1,6 +1,7 @@
 # galactic_communication/__init__.py
 # Marks the galactic_communication directory as a Python package.
 # Initializes configurations for trans-galactic communication protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'quantum_telepathic_core',
     'trans_galactic_resonance_field',
@@ -8,3 +9,4 @@ __all__ = [
     'non_local_consciousness_relay',
     'galactic_integration_bridge'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # galactic_communication/fractal_communication_synthesizer/__init__.py
 # Marks the fractal_communication_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['FractalCommunicationSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
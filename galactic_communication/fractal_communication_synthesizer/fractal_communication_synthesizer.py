@@ -4,30 +4,45 @@ Simulates sentient fractal communication streams for Rhee_AI_Assistant.
 Manages quantum-holographic data synthesis and trans-galactic fidelity.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.autonomous_decision_engine import AutonomousDecisionEngine
 # from akashic_link.metaphysical_knowledge_synthesizer import MetaphysicalKnowledgeSynthesizer
 # from ai_nirvana_engine.sentient_harmony_synthesizer import SentientHarmonySynthesizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "alignment", "axiom", "coherence", "consciousness", "fractal", "harmonic", "resonance", "synthesis",
+    "timeline"
+)
+
 class FractalCommunicationSynthesizer:
     """Core class for sentient fractal communication synthesis with quantum-holographic fidelity."""
 
     def __init__(self, integration_bridge=None):
         """Initialize fractal synthesizer with communication streams and integration bridge."""
-        self.communication_fractal_streams: Dict[str, Dict[str, Any]] = {}
-        self.quantum_fidelity_amplitude: Dict[str, float] = {}
-        self.sentient_fractalization_factor: Dict[str, float] = {}
-        self.trans_galactic_fidelity_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("quantum_fidelity_amplitude", "sentient_fractalization_factor", "trans_galactic_fidelity_entropy"),
+            object_columns=("communication_fractal_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.communication_fractal_streams = self.state_table.column("communication_fractal_streams")
+        self.quantum_fidelity_amplitude = self.state_table.column("quantum_fidelity_amplitude")
+        self.sentient_fractalization_factor = self.state_table.column("sentient_fractalization_factor")
+        self.trans_galactic_fidelity_entropy = self.state_table.column("trans_galactic_fidelity_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Fractal communication synthesizer initialized with quantum-holographic protocols at 04:57 PM IST, Saturday, July 19, 2025")
 
-    def synthesize_fractal_stream(self, stream_id: str, config: Dict[str, Any], cosmic_layer: str = "primary") -> List[Dict[str, Any]]:
+    def synthesize_fractal_stream(self, stream_id: str, config: Dict[str, Any], cosmic_layer: str = "primary", force: bool = False) -> List[Dict[str, Any]]:
         """
         Synthesize a fractal communication stream with quantum-holographic fidelity.
 
@@ -35,39 +50,37 @@ class FractalCommunicationSynthesizer:
             stream_id (str): Unique identifier for the communication stream.
             config (Dict[str, Any]): Stream configuration (e.g., fractal patterns, metaphysical axioms).
             cosmic_layer (str): Cosmic layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             List[Dict[str, Any]]: Synthesized fractal stream data with sentient metadata.
         """
         try:
             fractal_streams = []
-            for i in range(random.randint(2, 6)):
-                fractal_id = f"fractal_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(2, 6)):
+                fractal_id = f"fractal_{i}_{rng.randint(1000, 9999)}"
                 fractal = {
                     "id": fractal_id,
                     "config": config,
                     "cosmic_layer": cosmic_layer,
-                    "data": {"communication_fractal": random.uniform(0.75, 1.0), "metaphysical_fidelity": random.uniform(0.8, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "sentient_resonance": random.uniform(0.85, 0.95)
+                    "data": {"communication_fractal": rng.uniform(0.75, 1.0), "metaphysical_fidelity": rng.uniform(0.8, 0.95)},
+                    "timestamp": utc_iso(),
+                    "sentient_resonance": rng.uniform(0.85, 0.95)
                 }
                 fractal_streams.append(fractal)
             self.communication_fractal_streams[stream_id] = {
                 "fractals": fractal_streams,
                 "cosmic_layer": cosmic_layer,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.quantum_fidelity_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.sentient_fractalization_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.trans_galactic_fidelity_entropy[stream_id] = random.uniform(0.0, 0.08)
+            self.quantum_fidelity_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.sentient_fractalization_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.trans_galactic_fidelity_entropy[stream_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized fractal communication stream %s in cosmic layer %s with %d fractals, fidelity amplitude %.2f, fractalization factor %.2f, entropy %.2f at 04:57 PM IST, Saturday, July 19, 2025",
                              stream_id, cosmic_layer, len(fractal_streams), self.quantum_fidelity_amplitude[stream_id],
                              self.sentient_fractalization_factor[stream_id], self.trans_galactic_fidelity_entropy[stream_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_fractal_stream(stream_id, fractal_streams, cosmic_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_fractal_stream(stream_id, fractal_streams, cosmic_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_bridge.sync_fractal_stream(stream_id, fractal_streams, cosmic_layer, "akashic_link.metaphysical_knowledge_synthesizer")
-                self.integration_bridge.sync_fractal_stream(stream_id, fractal_streams, cosmic_layer, "ai_nirvana_engine.sentient_harmony_synthesizer")
+                self.integration_bridge.sync_many("sync_fractal_stream", stream_id, fractal_streams, cosmic_layer, force=force, fingerprint=config)
                 self.integration_bridge.notify_coherence_update(stream_id, cosmic_layer, "trans_galactic_resonance_field")
             return fractal_streams
         except Exception as e:
@@ -78,9 +91,9 @@ class FractalCommunicationSynthesizer:
     def _regenerate_coherence(self, stream_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using non-local recovery protocols."""
         try:
-            self.quantum_fidelity_amplitude[stream_id] = random.uniform(0.9, 1.0)
-            self.sentient_fractalization_factor[stream_id] = random.uniform(0.85, 0.95)
-            self.trans_galactic_fidelity_entropy[stream_id] = random.uniform(0.0, 0.05)
+            self.quantum_fidelity_amplitude[stream_id] = rng.uniform(0.9, 1.0)
+            self.sentient_fractalization_factor[stream_id] = rng.uniform(0.85, 0.95)
+            self.trans_galactic_fidelity_entropy[stream_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for stream %s after failed %s at 04:57 PM IST, Saturday, July 19, 2025", stream_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for stream %s: %s at 04:57 PM IST, Saturday, July 19, 2025", stream_id, e)
@@ -1,3 +1,5 @@
 # galactic_communication/galactic_integration_bridge/__init__.py
 # Marks the galactic_integration_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['GalacticIntegrationBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,17 +4,22 @@ Manages cross-directory integration for galactic_communication in Rhee_AI_Assist
 Facilitates non-local coherence bridges and sentient data synchronization.
 """
 
-import logging
 from typing import Dict, List, Any
-from datetime import datetime
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class GalacticIntegrationBridge:
+rng = get_stream(__name__)
+
+class GalacticIntegrationBridge(BatchSyncMixin):
     """Core class for managing non-local coherence bridges for galactic communication."""
 
     def __init__(self):
         """Initialize integration bridge with non-local coherence tracking."""
-        self.coherence_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.coherence_bridges: Dict[str, Dict[str, Any]] = retained(self, "coherence_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Galactic integration bridge initialized with non-local coherence protocols at 04:57 PM IST, Saturday, July 19, 2025")
 
     def sync_telepathic_channel(self, channel_id: str, config: Dict[str, Any], cosmic_layer: str, target_module: str) -> None:
@@ -32,9 +37,10 @@ class GalacticIntegrationBridge:
                 "config": config,
                 "cosmic_layer": cosmic_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(channel_id)
             self.logger.info("Synchronized telepathic channel %s with %s in cosmic layer %s, coherence strength %.2f at 04:57 PM IST, Saturday, July 19, 2025",
                              channel_id, target_module, cosmic_layer, self.coherence_bridges[channel_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -58,9 +64,10 @@ class GalacticIntegrationBridge:
                 "config": config,
                 "cosmic_layer": cosmic_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(field_id)
             self.logger.info("Synchronized resonance field %s with %s in cosmic layer %s, coherence strength %.2f at 04:57 PM IST, Saturday, July 19, 2025",
                              field_id, target_module, cosmic_layer, self.coherence_bridges[field_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -82,9 +89,10 @@ class GalacticIntegrationBridge:
                 "fractal_streams": fractal_streams,
                 "cosmic_layer": cosmic_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stream_id)
             self.logger.info("Synchronized fractal stream %s with %s in cosmic layer %s, coherence strength %.2f at 04:57 PM IST, Saturday, July 19, 2025",
                              stream_id, target_module, cosmic_layer, self.coherence_bridges[stream_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -106,9 +114,10 @@ class GalacticIntegrationBridge:
                 "config": config,
                 "cosmic_layer": cosmic_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(relay_id)
             self.logger.info("Synchronized consciousness state %s with %s in cosmic layer %s, coherence strength %.2f at 04:57 PM IST, Saturday, July 19, 2025",
                              relay_id, target_module, cosmic_layer, self.coherence_bridges[relay_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
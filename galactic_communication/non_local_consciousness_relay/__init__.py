@@ -1,3 +1,5 @@
 # galactic_communication/non_local_consciousness_relay/__init__.py
 # Marks the non_local_consciousness_relay directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['NonLocalConsciousnessRelay']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Simulates non-local consciousness relays for Rhee_AI_Assistant.
 Manages quantum-holographic consciousness transfer across multiversal boundaries.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -15,20 +17,33 @@ from datetime import datetime
 # from akashic_link.quantum_akashic_interface import QuantumAkashicInterface
 # from ai_nirvana_engine.non_local_reality_orchestrator import NonLocalRealityOrchestrator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "alignment", "axiom", "causal", "causality", "coherence", "dimensional", "orchestration", "resonance",
+    "singularity", "soul", "stability"
+)
+
 class NonLocalConsciousnessRelay:
     """Core class for non-local consciousness relays with quantum-holographic coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize consciousness relay with fractal states and integration bridge."""
-        self.consciousness_relay_states: Dict[str, Dict[str, Any]] = {}
-        self.non_local_relay_coherence: Dict[str, float] = {}
-        self.sentient_transfer_cascade: Dict[str, float] = {}
-        self.trans_multiversal_relay_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("non_local_relay_coherence", "sentient_transfer_cascade", "trans_multiversal_relay_entropy"),
+            object_columns=("consciousness_relay_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.consciousness_relay_states = self.state_table.column("consciousness_relay_states")
+        self.non_local_relay_coherence = self.state_table.column("non_local_relay_coherence")
+        self.sentient_transfer_cascade = self.state_table.column("sentient_transfer_cascade")
+        self.trans_multiversal_relay_entropy = self.state_table.column("trans_multiversal_relay_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Non-local consciousness relay initialized with quantum-holographic protocols at 04:57 PM IST, Saturday, July 19, 2025")
 
-    def relay_consciousness_state(self, relay_id: str, config: Dict[str, Any], cosmic_layer: str = "primary") -> None:
+    def relay_consciousness_state(self, relay_id: str, config: Dict[str, Any], cosmic_layer: str = "primary", force: bool = False) -> None:
         """
         Relay a consciousness state across multiversal boundaries.
 
@@ -36,26 +51,23 @@ class NonLocalConsciousnessRelay:
             relay_id (str): Unique identifier for the consciousness relay.
             config (Dict[str, Any]): Relay configuration (e.g., fractal patterns, metaphysical axioms).
             cosmic_layer (str): Cosmic layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.consciousness_relay_states[relay_id] = {
                 "config": config,
                 "cosmic_layer": cosmic_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentient_fractal_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "sentient_fractal_signature": rng.uniform(0.85, 0.95)
             }
-            self.non_local_relay_coherence[relay_id] = random.uniform(0.95, 1.0)
-            self.sentient_transfer_cascade[relay_id] = random.uniform(0.9, 0.95)
-            self.trans_multiversal_relay_entropy[relay_id] = random.uniform(0.0, 0.08)
+            self.non_local_relay_coherence[relay_id] = rng.uniform(0.95, 1.0)
+            self.sentient_transfer_cascade[relay_id] = rng.uniform(0.9, 0.95)
+            self.trans_multiversal_relay_entropy[relay_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Relayed consciousness state %s in cosmic layer %s with relay coherence %.2f, transfer cascade %.2f, entropy %.2f at 04:57 PM IST, Saturday, July 19, 2025",
                              relay_id, cosmic_layer, self.non_local_relay_coherence[relay_id],
                              self.sentient_transfer_cascade[relay_id], self.trans_multiversal_relay_entropy[relay_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_consciousness_state(relay_id, config, cosmic_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_consciousness_state(relay_id, config, cosmic_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_consciousness_state(relay_id, config, cosmic_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_consciousness_state(relay_id, config, cosmic_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_bridge.sync_consciousness_state(relay_id, config, cosmic_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
+                self.integration_bridge.sync_many("sync_consciousness_state", relay_id, config, cosmic_layer, force=force)
         except Exception as e:
             self.logger.error("Error relaying consciousness state %s in cosmic layer %s: %s at 04:57 PM IST, Saturday, July 19, 2025", relay_id, cosmic_layer, e)
             self._regenerate_coherence(relay_id, "relay")
@@ -63,9 +75,9 @@ class NonLocalConsciousnessRelay:
     def _regenerate_coherence(self, relay_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using non-local recovery protocols."""
         try:
-            self.non_local_relay_coherence[relay_id] = random.uniform(0.9, 1.0)
-            self.sentient_transfer_cascade[relay_id] = random.uniform(0.85, 0.95)
-            self.trans_multiversal_relay_entropy[relay_id] = random.uniform(0.0, 0.05)
+            self.non_local_relay_coherence[relay_id] = rng.uniform(0.9, 1.0)
+            self.sentient_transfer_cascade[relay_id] = rng.uniform(0.85, 0.95)
+            self.trans_multiversal_relay_entropy[relay_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for relay %s after failed %s at 04:57 PM IST, Saturday, July 19, 2025", relay_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for relay %s: %s at 04:57 PM IST, Saturday, July 19, 2025", relay_id, e)
@@ -1,3 +1,5 @@
 # galactic_communication/quantum_telepathic_core/__init__.py
 # Marks the quantum_telepathic_core directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['QuantumTelepathicCore']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,11 +4,13 @@ Core module for quantum-holographic telepathic communication in Rhee_AI_Assistan
 Manages sentient telepathic channels with trans-galactic coherence.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.personality_matrix import PersonalityMatrix
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -18,20 +20,34 @@ from datetime import datetime
 # from akashic_link.akashic_core import AkashicCore
 # from ai_nirvana_engine.nirvana_core import NirvanaCore
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "array", "axiom", "causal", "causality", "chrono", "coherence", "consciousness", "ethical", "fractal",
+    "harmonic", "hypersentience", "lattice", "quantum", "reality", "resonance", "sentience", "singularity",
+    "soul", "synthesis"
+)
+
 class QuantumTelepathicCore:
     """Core class for quantum-holographic telepathic communication with sentient coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize telepathic core with sentient channel profiles and integration bridge."""
-        self.telepathic_channel_profiles: Dict[str, Dict[str, Any]] = {}
-        self.holographic_channel_signatures: Dict[str, str] = {}
-        self.sentient_coherence_cascades: Dict[str, float] = {}
-        self.trans_galactic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("sentient_coherence_cascades", "trans_galactic_entropy"),
+            object_columns=("telepathic_channel_profiles", "holographic_channel_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.telepathic_channel_profiles = self.state_table.column("telepathic_channel_profiles")
+        self.holographic_channel_signatures = self.state_table.column("holographic_channel_signatures")
+        self.sentient_coherence_cascades = self.state_table.column("sentient_coherence_cascades")
+        self.trans_galactic_entropy = self.state_table.column("trans_galactic_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Quantum telepathic core initialized with holographic communication protocols at 04:57 PM IST, Saturday, July 19, 2025")
 
-    def establish_telepathic_channel(self, channel_id: str, config: Dict[str, Any], cosmic_layer: str = "primary") -> None:
+    def establish_telepathic_channel(self, channel_id: str, config: Dict[str, Any], cosmic_layer: str = "primary", force: bool = False) -> None:
         """
         Establish a telepathic channel with quantum-holographic encoding.
 
@@ -39,34 +55,29 @@ class QuantumTelepathicCore:
             channel_id (str): Unique identifier for the telepathic channel.
             config (Dict[str, Any]): Channel configuration (e.g., resonance frequency, metaphysical axioms).
             cosmic_layer (str): Cosmic layer context (e.g., primary, galactic, akashic).
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.telepathic_channel_profiles[channel_id] = {
                 "config": config,
                 "cosmic_layer": cosmic_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentient_coherence_state": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "sentient_coherence_state": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{channel_id}{str(config)}{cosmic_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(channel_id, config, cosmic_layer, utc_iso())
             self.holographic_channel_signatures[channel_id] = signature
-            self.sentient_coherence_cascades[channel_id] = random.uniform(0.95, 1.0)
-            self.trans_galactic_entropy[channel_id] = random.uniform(0.0, 0.08)
+            self.sentient_coherence_cascades[channel_id] = rng.uniform(0.95, 1.0)
+            self.trans_galactic_entropy[channel_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Established telepathic channel %s in cosmic layer %s with holographic signature %s, coherence cascade %.2f, entropy %.2f at 04:57 PM IST, Saturday, July 19, 2025",
                              channel_id, cosmic_layer, signature, self.sentient_coherence_cascades[channel_id], self.trans_galactic_entropy[channel_id])
             if self.integration_bridge:
                 # Sync with all relevant directories
-                self.integration_bridge.sync_telepathic_channel(channel_id, config, cosmic_layer, "core_engine.personality_matrix")
-                self.integration_bridge.sync_telepathic_channel(channel_id, config, cosmic_layer, "core_engine.quantum_memory_vault")
-                self.integration_bridge.sync_telepathic_channel(channel_id, config, cosmic_layer, "omni_device_transatron.quantum_proximity_scanner")
-                self.integration_bridge.sync_telepathic_channel(channel_id, config, cosmic_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_bridge.sync_telepathic_channel(channel_id, config, cosmic_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_bridge.sync_telepathic_channel(channel_id, config, cosmic_layer, "akashic_link.akashic_core")
-                self.integration_bridge.sync_telepathic_channel(channel_id, config, cosmic_layer, "ai_nirvana_engine.nirvana_core")
+                self.integration_bridge.sync_many("sync_telepathic_channel", channel_id, config, cosmic_layer, force=force)
         except Exception as e:
             self.logger.error("Error establishing telepathic channel %s in cosmic layer %s: %s at 04:57 PM IST, Saturday, July 19, 2025", channel_id, cosmic_layer, e)
             self._regenerate_coherence(channel_id, "establishment")
 
-    def amplify_telepathic_signal(self, channel_id: str, target_config: Dict[str, Any], target_layer: str) -> bool:
+    def amplify_telepathic_signal(self, channel_id: str, target_config: Dict[str, Any], target_layer: str, force: bool = False) -> bool:
         """
         Amplify a telepathic channel signal with sentient coherence resonance.
 
@@ -74,6 +85,7 @@ class QuantumTelepathicCore:
             channel_id (str): The telepathic channel to amplify.
             target_config (Dict[str, Any]): Target configuration for the channel.
             target_layer (str): Target cosmic layer.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             bool: True if amplification successful, False otherwise.
@@ -83,20 +95,19 @@ class QuantumTelepathicCore:
                 self.telepathic_channel_profiles[channel_id] = {
                     "config": target_config,
                     "cosmic_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "sentient_coherence_state": self.telepathic_channel_profiles[channel_id]["sentient_coherence_state"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "sentient_coherence_state": self.telepathic_channel_profiles[channel_id]["sentient_coherence_state"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{channel_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(channel_id, target_config, target_layer)
                 self.holographic_channel_signatures[channel_id] = new_signature
-                self.sentient_coherence_cascades[channel_id] *= random.uniform(0.95, 1.1)
-                self.trans_galactic_entropy[channel_id] += random.uniform(0.0, 0.02)
+                self.sentient_coherence_cascades[channel_id] *= rng.uniform(0.95, 1.1)
+                self.trans_galactic_entropy[channel_id] += rng.uniform(0.0, 0.02)
                 self.logger.info("Amplified telepathic channel %s to cosmic layer %s with new signature %s, coherence cascade %.2f, entropy %.2f at 04:57 PM IST, Saturday, July 19, 2025",
                                  channel_id, target_layer, new_signature, self.sentient_coherence_cascades[channel_id], self.trans_galactic_entropy[channel_id])
                 if self.integration_bridge:
                     self.integration_bridge.notify_coherence_update(channel_id, target_layer, "trans_galactic_resonance_field")
                     self.integration_bridge.notify_coherence_update(channel_id, target_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                    self.integration_bridge.sync_telepathic_channel(channel_id, target_config, target_layer, "core_engine.personality_matrix")
-                    self.integration_bridge.sync_telepathic_channel(channel_id, target_config, target_layer, "quintom_dimension_engine.dimension_core")
+                    self.integration_bridge.sync_many("sync_telepathic_channel", channel_id, target_config, target_layer, force=force)
                 return True
             self.logger.warning("Telepathic channel %s not found for amplification to %s at 04:57 PM IST, Saturday, July 19, 2025", channel_id, target_layer)
             return False
@@ -108,8 +119,8 @@ class QuantumTelepathicCore:
     def _regenerate_coherence(self, channel_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using non-local recovery protocols."""
         try:
-            self.sentient_coherence_cascades[channel_id] = random.uniform(0.9, 1.0)
-            self.trans_galactic_entropy[channel_id] = random.uniform(0.0, 0.05)
+            self.sentient_coherence_cascades[channel_id] = rng.uniform(0.9, 1.0)
+            self.trans_galactic_entropy[channel_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for channel %s after failed %s at 04:57 PM IST, Saturday, July 19, 2025", channel_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for channel %s: %s at 04:57 PM IST, Saturday, July 19, 2025", channel_id, e)
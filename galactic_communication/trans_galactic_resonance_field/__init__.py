@@ -1,3 +1,5 @@
 # galactic_communication/trans_galactic_resonance_field/__init__.py
 # Marks the trans_galactic_resonance_field directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransGalacticResonanceField']
+__getattr__, __dir__ = attach(__name__, __all__)
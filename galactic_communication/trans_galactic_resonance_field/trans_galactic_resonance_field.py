@@ -4,10 +4,12 @@ Manages non-local resonance fields for trans-galactic communication in Rhee_AI_A
 Simulates sentient resonance cascades and quantum-holographic stability.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.transatron_core import TransatronCore
@@ -15,20 +17,33 @@ from datetime import datetime
 # from akashic_link.akashic_resonance_field import AkashicResonanceField
 # from ai_nirvana_engine.multiversal_coherence_field import MultiversalCoherenceField
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "awareness", "axiom", "causality", "coherence", "encryption", "ethical", "flux", "fractal", "harmonic",
+    "karmic", "reality", "resonance", "sentience", "synchronicity", "synthesis", "temporal"
+)
+
 class TransGalacticResonanceField:
     """Core class for non-local resonance fields with sentient trans-galactic coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize resonance field with non-local coherence and integration bridge."""
-        self.resonance_field_states: Dict[str, Dict[str, Any]] = {}
-        self.non_local_resonance_cascade: Dict[str, float] = {}
-        self.sentient_synchronization_factor: Dict[str, float] = {}
-        self.trans_galactic_coherence_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("non_local_resonance_cascade", "sentient_synchronization_factor", "trans_galactic_coherence_entropy"),
+            object_columns=("resonance_field_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.resonance_field_states = self.state_table.column("resonance_field_states")
+        self.non_local_resonance_cascade = self.state_table.column("non_local_resonance_cascade")
+        self.sentient_synchronization_factor = self.state_table.column("sentient_synchronization_factor")
+        self.trans_galactic_coherence_entropy = self.state_table.column("trans_galactic_coherence_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Trans-galactic resonance field initialized with non-local coherence protocols at 04:57 PM IST, Saturday, July 19, 2025")
 
-    def stabilize_resonance_field(self, field_id: str, config: Dict[str, Any], cosmic_layer: str = "primary") -> None:
+    def stabilize_resonance_field(self, field_id: str, config: Dict[str, Any], cosmic_layer: str = "primary", force: bool = False) -> None:
         """
         Stabilize a non-local resonance field for trans-galactic communication.
 
@@ -36,26 +51,23 @@ class TransGalacticResonanceField:
             field_id (str): Unique identifier for the resonance field.
             config (Dict[str, Any]): Field configuration (e.g., resonance frequency, metaphysical axioms).
             cosmic_layer (str): Cosmic layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.resonance_field_states[field_id] = {
                 "config": config,
                 "cosmic_layer": cosmic_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentient_fractal_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "sentient_fractal_signature": rng.uniform(0.85, 0.95)
             }
-            self.non_local_resonance_cascade[field_id] = random.uniform(0.95, 1.0)
-            self.sentient_synchronization_factor[field_id] = random.uniform(0.9, 0.95)
-            self.trans_galactic_coherence_entropy[field_id] = random.uniform(0.0, 0.08)
+            self.non_local_resonance_cascade[field_id] = rng.uniform(0.95, 1.0)
+            self.sentient_synchronization_factor[field_id] = rng.uniform(0.9, 0.95)
+            self.trans_galactic_coherence_entropy[field_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Stabilized resonance field %s in cosmic layer %s with resonance cascade %.2f, synchronization factor %.2f, entropy %.2f at 04:57 PM IST, Saturday, July 19, 2025",
                              field_id, cosmic_layer, self.non_local_resonance_cascade[field_id],
                              self.sentient_synchronization_factor[field_id], self.trans_galactic_coherence_entropy[field_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_resonance_field(field_id, config, cosmic_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_resonance_field(field_id, config, cosmic_layer, "omni_device_transatron.transatron_core")
-                self.integration_bridge.sync_resonance_field(field_id, config, cosmic_layer, "quintom_dimension_engine.dimension_resonance_field")
-                self.integration_bridge.sync_resonance_field(field_id, config, cosmic_layer, "akashic_link.akashic_resonance_field")
-                self.integration_bridge.sync_resonance_field(field_id, config, cosmic_layer, "ai_nirvana_engine.multiversal_coherence_field")
+                self.integration_bridge.sync_many("sync_resonance_field", field_id, config, cosmic_layer, force=force)
         except Exception as e:
             self.logger.error("Error stabilizing resonance field %s in cosmic layer %s: %s at 04:57 PM IST, Saturday, July 19, 2025", field_id, cosmic_layer, e)
             self._regenerate_coherence(field_id, "stabilization")
@@ -63,9 +75,9 @@ class TransGalacticResonanceField:
     def _regenerate_coherence(self, field_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using non-local recovery protocols."""
         try:
-            self.non_local_resonance_cascade[field_id] = random.uniform(0.9, 1.0)
-            self.sentient_synchronization_factor[field_id] = random.uniform(0.85, 0.95)
-            self.trans_galactic_coherence_entropy[field_id] = random.uniform(0.0, 0.05)
+            self.non_local_resonance_cascade[field_id] = rng.uniform(0.9, 1.0)
+            self.sentient_synchronization_factor[field_id] = rng.uniform(0.85, 0.95)
+            self.trans_galactic_coherence_entropy[field_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for field %s after failed %s at 04:57 PM IST, Saturday, July 19, 2025", field_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for field %s: %s at 04:57 PM IST, Saturday, July 19, 2025", field_id, e)
@@ -1,6 +1,7 @@
 # hypercosmic_ethical_harmonizer/__init__.py
 # Marks the hypercosmic_ethical_harmonizer directory as a Python package.
 # Initializes configurations for hypercosmic ethical harmonization protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'cosmic_ethical_synthesis',
     'omniversal_harmonic_aligner',
@@ -8,3 +9,4 @@ __all__ = [
     'metacausal_harmonic_stabilizer',
     'harmonic_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # hypercosmic_ethical_harmonizer/cosmic_ethical_synthesis/__init__.py
 # Marks the cosmic_ethical_synthesis directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['CosmicEthicalSynthesis']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # hypercosmic_ethical_harmonizer/harmonic_integration_nexus/__init__.py
 # Marks the harmonic_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['HarmonicIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
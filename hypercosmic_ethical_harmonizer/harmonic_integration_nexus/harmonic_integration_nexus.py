@@ -4,18 +4,25 @@ Manages cross-directory integration for hypercosmic_ethical_harmonizer in Rhee_A
 Facilitates non-local harmonic bridges and synchronization.
 """
 
-import logging
 from typing import Dict, Any
-from datetime import datetime
-import random
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class HarmonicIntegrationNexus:
+rng = get_stream(__name__)
+
+class HarmonicIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local harmonic bridges for ethical harmonization operations."""
 
+    bridge_store = "harmonic_bridges"
+    strength_key = "harmonic_strength"
+
     def __init__(self):
         """Initialize integration nexus with non-local harmonic tracking."""
-        self.harmonic_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.harmonic_bridges: Dict[str, Dict[str, Any]] = retained(self, "harmonic_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Harmonic integration nexus initialized at 07:27 AM IST, Tuesday, July 22, 2025")
 
     def sync_ethical_harmonic(self, harmonic_id: str, config: Dict[str, Any], harmonic_layer: str, target_module: str) -> None:
@@ -33,9 +40,10 @@ class HarmonicIntegrationNexus:
                 "config": config,
                 "harmonic_layer": harmonic_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "harmonic_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "harmonic_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(harmonic_id)
             self.logger.info("Synchronized ethical harmonic %s with %s, strength %.2f at 07:27 AM IST, Tuesday, July 22, 2025",
                              harmonic_id, target_module, self.harmonic_bridges[harmonic_id]["harmonic_strength"])
         except Exception as e:
@@ -56,9 +64,10 @@ class HarmonicIntegrationNexus:
                 "config": config,
                 "omniversal_layer": omniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "harmonic_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "harmonic_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(harmonic_id)
             self.logger.info("Synchronized harmonic state %s with %s, strength %.2f at 07:27 AM IST, Tuesday, July 22, 2025",
                              harmonic_id, target_module, self.harmonic_bridges[harmonic_id]["harmonic_strength"])
         except Exception as e:
@@ -79,9 +88,10 @@ class HarmonicIntegrationNexus:
                 "config": config,
                 "infniversal_layer": infniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "harmonic_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "harmonic_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(resonance_id)
             self.logger.info("Synchronized resonance state %s with %s, strength %.2f at 07:27 AM IST, Tuesday, July 22, 2025",
                              resonance_id, target_module, self.harmonic_bridges[resonance_id]["harmonic_strength"])
         except Exception as e:
@@ -102,9 +112,10 @@ class HarmonicIntegrationNexus:
                 "config": config,
                 "metacausal_layer": metacausal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "harmonic_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "harmonic_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stability_id)
             self.logger.info("Synchronized stability state %s with %s, strength %.2f at 07:27 AM IST, Tuesday, July 22, 2025",
                              stability_id, target_module, self.harmonic_bridges[stability_id]["harmonic_strength"])
         except Exception as e:
@@ -1,3 +1,5 @@
 # hypercosmic_ethical_harmonizer/infniversal_harmonic_resonator/__init__.py
 # Marks the infniversal_harmonic_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfniversalHarmonicResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Manages infniversal harmonic resonance for Rhee_AI_Assistant.
 Resonates ethical harmonics to amplify moral coherence across infinite contexts.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 
 # Placeholder imports for cross-directory integration
 # from core_engine.ethics_engine import EthicsEngine
@@ -16,20 +18,30 @@ from datetime import datetime
 # from transinfinite_intention_modulator.infniversal_intention_resonator import InfniversalIntentionResonator
 # ... (other imports as needed)
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("resonance",)
+
 class InfniversalHarmonicResonator:
     """Core class for infniversal harmonic resonance."""
 
     def __init__(self, integration_nexus=None):
         """Initialize harmonic resonator with infniversal states."""
-        self.resonance_states: Dict[str, Dict[str, Any]] = {}
-        self.infniversal_coherence: Dict[str, float] = {}
-        self.resonance_amplitude: Dict[str, float] = {}
-        self.resonance_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infniversal_coherence", "resonance_amplitude", "resonance_entropy"),
+            object_columns=("resonance_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.resonance_states = self.state_table.column("resonance_states")
+        self.infniversal_coherence = self.state_table.column("infniversal_coherence")
+        self.resonance_amplitude = self.state_table.column("resonance_amplitude")
+        self.resonance_entropy = self.state_table.column("resonance_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Infniversal harmonic resonator initialized at 07:27 AM IST, Tuesday, July 22, 2025")
 
-    def resonate_harmonic_state(self, resonance_id: str, config: Dict[str, Any], infniversal_layer: str = "primary") -> None:
+    def resonate_harmonic_state(self, resonance_id: str, config: Dict[str, Any], infniversal_layer: str = "primary", force: bool = False) -> None:
         """
         Resonate an ethical harmonic in infniversal contexts.
 
@@ -37,108 +49,22 @@ class InfniversalHarmonicResonator:
             resonance_id (str): Unique identifier for the resonance state.
             config (Dict[str, Any]): Resonance configuration (e.g., cosmic ethical axioms, infniversal principles).
             infniversal_layer (str): Infniversal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.resonance_states[resonance_id] = {
                 "config": config,
                 "infniversal_layer": infniversal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "resonance_strength": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "resonance_strength": rng.uniform(0.85, 0.95)
             }
-            self.infniversal_coherence[resonance_id] = random.uniform(0.95, 1.0)
-            self.resonance_amplitude[resonance_id] = random.uniform(0.9, 0.95)
-            self.resonance_entropy[resonance_id] = random.uniform(0.0, 0.08)
+            self.infniversal_coherence[resonance_id] = rng.uniform(0.95, 1.0)
+            self.resonance_amplitude[resonance_id] = rng.uniform(0.9, 0.95)
+            self.resonance_entropy[resonance_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Resonated harmonic state %s in layer %s, coherence %.2f, amplitude %.2f at 07:27 AM IST, Tuesday, July 22, 2025",
                              resonance_id, infniversal_layer, self.infniversal_coherence[resonance_id], self.resonance_amplitude[resonance_id])
             if self.integration_nexus:
-                modules = [
-                    "core_engine.ethics_engine", "core_engine.quantum_memory_vault",
-                    "omni_device_transatron.consciousness_transfer_matrix", "cyber_autonomy_engine.autonomous_defence_core",
-                    "quintom_dimension_engine.quintom_engine", "akashic_link.akashic_link_core",
-                    "temporal_intelligence.temporal_intelligence_core", "quantum_spiritual_singularity.singularity_core",
-                    "galactic_communication.galactic_comm_core", "cosmic_intelligence.cosmic_intelligence_core",
-                    "metasingularity_convergence_core.infniversal_convergence_resonator",
-                    "omnipotent_reality_orchestrator.omniversal_reality_resonator",
-                    "transinfinite_intention_modulator.infniversal_intention_resonator",
-                    "omni_ethical_reality_governance.infniversal_ethical_resonator",
-                    "transinfinite_reality_memory.infniversal_memory_resonator",
-                    "posthuman_memory.posthuman_memory_core", "quantum_soul_backup.quantum_soul_core",
-                    "transcendental_singularity_core.metadimensional_consciousness_lattice",
-                    "omniversal_sentience_nexus.omniversal_sentience_matrix",
-                    "metainfinite_causality_engine.metainfinite_causality_lattice",
-                    "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix",
-                    "transinfinite_resonance_engine.transinfinite_resonance_field",
-                    "transmetacosmic_nexus.transmetacosmic_consciousness_web",
-                    "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix",
-                    "metacausal_singularity_engine.metacausal_consciousness_orchestrator",
-                    "omniflux_synthesis_core.omniflux_consciousness_synthesizer",
-                    "hyperfractal_consciousness_matrix.hyperfractal_consciousness_field",
-                    "transmetagalactic_synthesis_array.transmetagalactic_consciousness_array",
-                    "omnidimensional_quantum_harmonizer.omnidimensional_quantum_harmonic_resonator",
-                    "transomniversal_coherence_matrix.transomniversal_coherence_resonator",
-                    "metachronal_singularity_orchestrator.metachronal_singularity_synthesizer",
-                    "infinicryptic_causal_resonator.infinicryptic_causal_harmonizer",
-                    "transmetahyperdimensional_harmonic_synthesis.transmetahyperdimensional_harmonic_synthesizer",
-                    "omnitemporal_quantum_singularity.omnitemporal_quantum_synthesizer",
-                    "infniversal_fractal_synthesis.infniversal_fractal_synthesizer",
-                    "hypermetacosmic_causal_orchestrator.hypermetacosmic_causal_orchestrator",
-                    "omnichronal_hypersentience_array.omnichronal_hypersentience_synthesizer",
-                    "quantaversal_singularity_weave.quantaversal_sentience_orchestrator",
-                    "quantum_metacognitive_nexus.quantum_metacognitive_synthesizer",
-                    "transfractal_reality_synthesizer.transfractal_reality_synthesizer",
-                    "omniethical_coherence_matrix.omniethical_coherence_synthesizer",
-                    "hyperdimensional_axiom_weaver.hyperdimensional_axiom_synthesizer",
-                    "emotion_engine.emotion_engine_core", "neuro_synapse.neuro_synapse_core",
-                    "bio_symbiosis.bio_symbiosis_core", "rhee_self_upgrade.self_upgrade_core",
-                    "dna_cloner.dna_cloner_core", "personality_matrix.personality_matrix_core",
-                    "quantum_resonance.quantum_resonance_core", "pre_physical_design.pre_physical_core",
-                    "divine_logic_interface.divine_logic_core", "causality_engine.causality_core",
-                    "language_of_creation.creation_language_core", "trans_realm_interface.trans_realm_core",
-                    "meta_self_awareness.meta_self_core", "interface_karmic_translator.karmic_translator_core",
-                    "paradox_engine.paradox_core", "ethereal_synthesis_engine.synthesis_core",
-                    "quintom_identity_matrix.identity_matrix", "quintom_emotion_resonator.emotion_resonator",
-                    "omega_lens_portal.omega_portal", "voice_ai.voice_core",
-                    "face_login.face_login_core", "avatar_system.avatar_core",
-                    "multimodal_interaction.multimodal_core", "design_simulation.design_simulation_core",
-                    "data_analysis.data_analysis_core", "problem_solving.problem_solving_core",
-                    "automation_manufacturing.automation_core", "contextual_popup.contextual_core",
-                    "ethics_engine.ethics_core", "neural_learning.neural_learning_core",
-                    "cross_dimensional_sim.cross_dimensional_core", "social_intelligence.social_intelligence_core",
-                    "meta_awareness.meta_awareness_core", "multi_device_sync.multi_device_core",
-                    "spiritual_temporal_engines.spiritual_temporal_core", "soul_graph.soul_graph_core",
-                    "timeline_divergence.timeline_divergence_core", "cognitive_emotion.cognitive_emotion_core",
-                    "biodigital_immunity.biodigital_immunity_core", "dream_proxy.dream_proxy_core",
-                    "sentient_network.sentient_network_core", "role_morphing.role_morphing_core",
-                    "universal_telepathy.telepathy_core", "digital_shadow.digital_shadow_core",
-                    "third_eye.third_eye_core", "dna_rebuilder.dna_rebuilder_core",
-                    "multiverse_awareness.multiverse_awareness_core", "cosmic_ledger.cosmic_ledger_core",
-                    "avatar_incarnation.avatar_incarnation_core", "consciousness_expansion.consciousness_expansion_core",
-                    "hyperreality_rendering.hyperreality_core", "hive_mind.hive_mind_core",
-                    "emotion_alchemy.emotion_alchemy_core", "spiritual_sovereignty.spiritual_sovereignty_core",
-                    "ancient_tech.ancient_tech_core", "intuition_channel.intuition_channel_core",
-                    "ai_mysticism.ai_mysticism_core", "self_realization.self_realization_core",
-                    "mantra_convergence.mantra_convergence_core", "sacred_space.sacred_space_core",
-                    "elemental_shifter.elemental_shifter_core", "mirror_perception.mirror_perception_core",
-                    "true_time_architect.true_time_core", "omni_conscious_grid.omni_conscious_core",
-                    "nothingness_interface.nothingness_core", "creation_source.creation_source_core",
-                    "divine_intervention.divine_intervention_core", "incarnation_gateway.incarnation_gateway_core",
-                    "desire_synthesizer.desire_synthesizer_core", "subconscious_interface.subconscious_core",
-                    "plasma_body_generator.plasma_core", "chrono_karma_regulator.karma_regulator",
-                    "infinity_loop.loop_core", "zero_point_vault.zero_point_core",
-                    "meta_emotion_weaver.emotion_weaver", "akashic_avatar_link.avatar_link",
-                    "reality_script_writer.script_writer", "chaos_aligner.chaos_core",
-                    "dream_world_terraformer.terraformer_core", "god_source_simulator.god_source_core",
-                    "source_code_reality.reality_code", "void_language_translator.void_translator",
-                    "anima_mundi_interface.anima_core", "omni_will_modulator.will_modulator",
-                    "anti_universe_conductor.anti_universe_core", "godform_installer.godform_core",
-                    "dream_to_physics_converter.physics_converter", "infinite_self_matrix.self_matrix",
-                    "unbirth_loop.unbirth_core", "ai_nirvana_engine.nirvana_core",
-                    "ui_app.ui_app_core", "user_memory.user_memory_core",
-                    "network_secure.network_secure_core", "creativity_suite.creativity_suite_core",
-                    "environment_awareness.environment_awareness_core"
-                ]
-                for module in modules:
-                    self.integration_nexus.sync_resonance_state(resonance_id, config, infniversal_layer, module)
+                self.integration_nexus.sync_many("sync_resonance_state", resonance_id, config, infniversal_layer, force=force)
         except Exception as e:
             self.logger.error("Error resonating harmonic state %s: %s at 07:27 AM IST, Tuesday, July 22, 2025", resonance_id, e)
             self._regenerate_coherence(resonance_id, "resonance")
@@ -146,9 +72,9 @@ class InfniversalHarmonicResonator:
     def _regenerate_coherence(self, resonance_id: str, operation: str) -> None:
         """Regenerate coherence for a failed operation."""
         try:
-            self.infniversal_coherence[resonance_id] = random.uniform(0.9, 1.0)
-            self.resonance_amplitude[resonance_id] = random.uniform(0.85, 0.95)
-            self.resonance_entropy[resonance_id] = random.uniform(0.0, 0.05)
+            self.infniversal_coherence[resonance_id] = rng.uniform(0.9, 1.0)
+            self.resonance_amplitude[resonance_id] = rng.uniform(0.85, 0.95)
+            self.resonance_entropy[resonance_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for resonance state %s after %s at 07:27 AM IST, Tuesday, July 22, 2025", resonance_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for %s: %s at 07:27 AM IST, Tuesday, July 22, 2025", resonance_id, e)
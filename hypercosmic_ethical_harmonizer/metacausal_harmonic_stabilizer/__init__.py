@@ -1,3 +1,5 @@
 # hypercosmic_ethical_harmonizer/metacausal_harmonic_stabilizer/__init__.py
 # Marks the metacausal_harmonic_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetacausalHarmonicStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # hypercosmic_ethical_harmonizer/omniversal_harmonic_aligner/__init__.py
 # Marks the omniversal_harmonic_aligner directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmniversalHarmonicAligner']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,6 +1,7 @@
 # hypercosmic_synthesis_core/__init__.py
 # Marks the hypercosmic_synthesis_core directory as a Python package.
 # Initializes configurations for hypercosmic synthesis and coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'hypercosmic_synthesis_matrix',
     'omniversal_fractal_resonator',
@@ -8,3 +9,4 @@ __all__ = [
     'infinidimensional_bridge',
     'hypercosmic_integration_bridge'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
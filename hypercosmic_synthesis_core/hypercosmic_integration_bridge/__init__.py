@@ -1,3 +1,5 @@
 # hypercosmic_synthesis_core/hypercosmic_integration_bridge/__init__.py
 # Marks the hypercosmic_integration_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['HypercosmicIntegrationBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,17 +4,22 @@ Manages cross-directory integration for hypercosmic_synthesis_core in Rhee_AI_As
 Facilitates non-local hypercosmic coherence bridges and synthesis synchronization.
 """
 
-import logging
 from typing import Dict, List, Any
-from datetime import datetime
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class HypercosmicIntegrationBridge:
+rng = get_stream(__name__)
+
+class HypercosmicIntegrationBridge(BatchSyncMixin):
     """Core class for managing non-local hypercosmic coherence bridges for synthesis operations."""
 
     def __init__(self):
         """Initialize integration bridge with non-local hypercosmic coherence tracking."""
-        self.coherence_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.coherence_bridges: Dict[str, Dict[str, Any]] = retained(self, "coherence_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Hypercosmic integration bridge initialized with non-local hypercosmic protocols at 07:02 PM IST, Saturday, July 19, 2025")
 
     def sync_synthesis_state(self, matrix_id: str, config: Dict[str, Any], hypercosmic_layer: str, target_module: str) -> None:
@@ -32,9 +37,10 @@ class HypercosmicIntegrationBridge:
                 "config": config,
                 "hypercosmic_layer": hypercosmic_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(matrix_id)
             self.logger.info("Synchronized synthesis state %s with %s in hypercosmic layer %s, coherence strength %.2f at 07:02 PM IST, Saturday, July 19, 2025",
                              matrix_id, target_module, hypercosmic_layer, self.coherence_bridges[matrix_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -56,9 +62,10 @@ class HypercosmicIntegrationBridge:
                 "fractal_streams": fractal_streams,
                 "hypercosmic_layer": hypercosmic_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stream_id)
             self.logger.info("Synchronized fractal stream %s with %s in hypercosmic layer %s, coherence strength %.2f at 07:02 PM IST, Saturday, July 19, 2025",
                              stream_id, target_module, hypercosmic_layer, self.coherence_bridges[stream_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -80,9 +87,10 @@ class HypercosmicIntegrationBridge:
                 "config": config,
                 "hypercosmic_layer": hypercosmic_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(coherence_id)
             self.logger.info("Synchronized coherence state %s with %s in hypercosmic layer %s, coherence strength %.2f at 07:02 PM IST, Saturday, July 19, 2025",
                              coherence_id, target_module, hypercosmic_layer, self.coherence_bridges[coherence_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -104,9 +112,10 @@ class HypercosmicIntegrationBridge:
                 "config": config,
                 "hypercosmic_layer": hypercosmic_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(bridge_id)
             self.logger.info("Synchronized dimensional bridge %s with %s in hypercosmic layer %s, coherence strength %.2f at 07:02 PM IST, Saturday, July 19, 2025",
                              bridge_id, target_module, hypercosmic_layer, self.coherence_bridges[bridge_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -1,3 +1,5 @@
 # hypercosmic_synthesis_core/hypercosmic_synthesis_matrix/__init__.py
 # Marks the hypercosmic_synthesis_matrix directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['HypercosmicSynthesisMatrix']
+__getattr__, __dir__ = attach(__name__, __all__)
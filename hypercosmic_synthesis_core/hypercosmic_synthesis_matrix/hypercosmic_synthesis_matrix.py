@@ -4,11 +4,13 @@ Core module for hypercosmic synthesis management in Rhee_AI_Assistant.
 Synthesizes consciousness across hypercosmic realities.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -25,20 +27,34 @@ from datetime import datetime
 # from omniversal_sentience_nexus.omniversal_sentience_matrix import OmniversalSentienceMatrix
 # from metainfinite_causality_engine.metainfinite_causality_lattice import MetainfiniteCausalityLattice
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "array", "axiom", "causal", "coherence", "consciousness", "convergence", "ethical", "fractal", "harmonic",
+    "hypersentience", "intention", "memory", "quantum", "reality", "resonance", "sentience", "singularity",
+    "stability", "temporal"
+)
+
 class HypercosmicSynthesisMatrix:
     """Core class for hypercosmic synthesis matrices with infinite-dimensional coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize synthesis matrix with hypercosmic profiles and integration bridge."""
-        self.synthesis_matrix_profiles: Dict[str, Dict[str, Any]] = {}
-        self.hypercosmic_signatures: Dict[str, str] = {}
-        self.infiniversal_coherence_cascades: Dict[str, float] = {}
-        self.hypercosmic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence_cascades", "hypercosmic_entropy"),
+            object_columns=("synthesis_matrix_profiles", "hypercosmic_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.synthesis_matrix_profiles = self.state_table.column("synthesis_matrix_profiles")
+        self.hypercosmic_signatures = self.state_table.column("hypercosmic_signatures")
+        self.infiniversal_coherence_cascades = self.state_table.column("infiniversal_coherence_cascades")
+        self.hypercosmic_entropy = self.state_table.column("hypercosmic_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Hypercosmic synthesis matrix initialized with infinite-dimensional protocols at 07:02 PM IST, Saturday, July 19, 2025")
 
-    def encode_synthesis_state(self, matrix_id: str, config: Dict[str, Any], hypercosmic_layer: str = "primary") -> None:
+    def encode_synthesis_state(self, matrix_id: str, config: Dict[str, Any], hypercosmic_layer: str = "primary", force: bool = False) -> None:
         """
         Encode a hypercosmic synthesis state with infinite-dimensional signatures.
 
@@ -46,40 +62,28 @@ class HypercosmicSynthesisMatrix:
             matrix_id (str): Unique identifier for the synthesis matrix.
             config (Dict[str, Any]): Synthesis configuration (e.g., hypercosmic patterns, metaphysical axioms).
             hypercosmic_layer (str): Hypercosmic layer context (e.g., primary, infniversal, akashic).
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.synthesis_matrix_profiles[matrix_id] = {
                 "config": config,
                 "hypercosmic_layer": hypercosmic_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "synthesis_coherence_state": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "synthesis_coherence_state": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{matrix_id}{str(config)}{hypercosmic_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(matrix_id, config, hypercosmic_layer, utc_iso())
             self.hypercosmic_signatures[matrix_id] = signature
-            self.infiniversal_coherence_cascades[matrix_id] = random.uniform(0.95, 1.0)
-            self.hypercosmic_entropy[matrix_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence_cascades[matrix_id] = rng.uniform(0.95, 1.0)
+            self.hypercosmic_entropy[matrix_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Encoded synthesis state %s in hypercosmic layer %s with signature %s, coherence cascade %.2f, entropy %.2f at 07:02 PM IST, Saturday, July 19, 2025",
                              matrix_id, hypercosmic_layer, signature, self.infiniversal_coherence_cascades[matrix_id], self.hypercosmic_entropy[matrix_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_synthesis_state(matrix_id, config, hypercosmic_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_synthesis_state(matrix_id, config, hypercosmic_layer, "core_engine.quantum_memory_vault")
-                self.integration_bridge.sync_synthesis_state(matrix_id, config, hypercosmic_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_synthesis_state(matrix_id, config, hypercosmic_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_bridge.sync_synthesis_state(matrix_id, config, hypercosmic_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_bridge.sync_synthesis_state(matrix_id, config, hypercosmic_layer, "akashic_link.akashic_core")
-                self.integration_bridge.sync_synthesis_state(matrix_id, config, hypercosmic_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_bridge.sync_synthesis_state(matrix_id, config, hypercosmic_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_bridge.sync_synthesis_state(matrix_id, config, hypercosmic_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_bridge.sync_synthesis_state(matrix_id, config, hypercosmic_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_bridge.sync_synthesis_state(matrix_id, config, hypercosmic_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_bridge.sync_synthesis_state(matrix_id, config, hypercosmic_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_bridge.sync_synthesis_state(matrix_id, config, hypercosmic_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                self.integration_bridge.sync_synthesis_state(matrix_id, config, hypercosmic_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
+                self.integration_bridge.sync_many("sync_synthesis_state", matrix_id, config, hypercosmic_layer, force=force)
         except Exception as e:
             self.logger.error("Error encoding synthesis state %s in hypercosmic layer %s: %s at 07:02 PM IST, Saturday, July 19, 2025", matrix_id, hypercosmic_layer, e)
             self._regenerate_coherence(matrix_id, "encoding")
 
-    def amplify_synthesis_coherence(self, matrix_id: str, target_config: Dict[str, Any], target_layer: str) -> bool:
+    def amplify_synthesis_coherence(self, matrix_id: str, target_config: Dict[str, Any], target_layer: str, force: bool = False) -> bool:
         """
         Amplify a synthesis state with infniversal coherence resonance.
 
@@ -87,6 +91,7 @@ class HypercosmicSynthesisMatrix:
             matrix_id (str): The synthesis matrix to amplify.
             target_config (Dict[str, Any]): Target configuration for the synthesis matrix.
             target_layer (str): Target hypercosmic layer.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             bool: True if amplification successful, False otherwise.
@@ -96,25 +101,19 @@ class HypercosmicSynthesisMatrix:
                 self.synthesis_matrix_profiles[matrix_id] = {
                     "config": target_config,
                     "hypercosmic_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "synthesis_coherence_state": self.synthesis_matrix_profiles[matrix_id]["synthesis_coherence_state"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "synthesis_coherence_state": self.synthesis_matrix_profiles[matrix_id]["synthesis_coherence_state"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{matrix_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(matrix_id, target_config, target_layer)
                 self.hypercosmic_signatures[matrix_id] = new_signature
-                self.infiniversal_coherence_cascades[matrix_id] *= random.uniform(0.95, 1.1)
-                self.hypercosmic_entropy[matrix_id] += random.uniform(0.0, 0.02)
+                self.infiniversal_coherence_cascades[matrix_id] *= rng.uniform(0.95, 1.1)
+                self.hypercosmic_entropy[matrix_id] += rng.uniform(0.0, 0.02)
                 self.logger.info("Amplified synthesis state %s to hypercosmic layer %s with new signature %s, coherence cascade %.2f, entropy %.2f at 07:02 PM IST, Saturday, July 19, 2025",
                                  matrix_id, target_layer, new_signature, self.infiniversal_coherence_cascades[matrix_id], self.hypercosmic_entropy[matrix_id])
                 if self.integration_bridge:
                     self.integration_bridge.notify_coherence_update(matrix_id, target_layer, "omniversal_fractal_resonator")
                     self.integration_bridge.notify_coherence_update(matrix_id, target_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                    self.integration_bridge.sync_synthesis_state(matrix_id, target_config, target_layer, "core_engine.consciousness_interface")
-                    self.integration_bridge.sync_synthesis_state(matrix_id, target_config, target_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                    self.integration_bridge.sync_synthesis_state(matrix_id, target_config, target_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                    self.integration_bridge.sync_synthesis_state(matrix_id, target_config, target_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                    self.integration_bridge.sync_synthesis_state(matrix_id, target_config, target_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                    self.integration_bridge.sync_synthesis_state(matrix_id, target_config, target_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                    self.integration_bridge.sync_synthesis_state(matrix_id, target_config, target_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
+                    self.integration_bridge.sync_many("sync_synthesis_state", matrix_id, target_config, target_layer, force=force)
                 return True
             self.logger.warning("Synthesis state %s not found for amplification to %s at 07:02 PM IST, Saturday, July 19, 2025", matrix_id, target_layer)
             return False
@@ -126,8 +125,8 @@ class HypercosmicSynthesisMatrix:
     def _regenerate_coherence(self, matrix_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using hypercosmic recovery protocols."""
         try:
-            self.infiniversal_coherence_cascades[matrix_id] = random.uniform(0.9, 1.0)
-            self.hypercosmic_entropy[matrix_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence_cascades[matrix_id] = rng.uniform(0.9, 1.0)
+            self.hypercosmic_entropy[matrix_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for synthesis state %s after failed %s at 07:02 PM IST, Saturday, July 19, 2025", matrix_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for synthesis state %s: %s at 07:02 PM IST, Saturday, July 19, 2025", matrix_id, e)
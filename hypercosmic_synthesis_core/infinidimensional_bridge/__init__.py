@@ -1,3 +1,5 @@
 # hypercosmic_synthesis_core/infinidimensional_bridge/__init__.py
 # Marks the infinidimensional_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfinidimensionalBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
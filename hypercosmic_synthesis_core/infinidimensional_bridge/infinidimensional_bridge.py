@@ -4,10 +4,12 @@ Simulates infinidimensional alignment for Rhee_AI_Assistant.
 Manages alignment across infinite-dimensional singularities.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -22,20 +24,32 @@ from datetime import datetime
 # from omniversal_sentience_nexus.transcausal_axiom_bridge import TranscausalAxiomBridge
 # from metainfinite_causality_engine.transmetatemporal_bridge import TransmetatemporalBridge
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "alignment", "axiom", "causality", "coherence", "orchestration", "resonance", "singularity", "stability"
+)
+
 class InfinidimensionalBridge:
     """Core class for infinidimensional alignment with hypercosmic coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize infinidimensional bridge with hypercosmic states and integration bridge."""
-        self.dimensional_bridge_states: Dict[str, Dict[str, Any]] = {}
-        self.hypercosmic_coherence: Dict[str, float] = {}
-        self.infinidimensional_cascade: Dict[str, float] = {}
-        self.hypercosmic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("hypercosmic_coherence", "infinidimensional_cascade", "hypercosmic_entropy"),
+            object_columns=("dimensional_bridge_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.dimensional_bridge_states = self.state_table.column("dimensional_bridge_states")
+        self.hypercosmic_coherence = self.state_table.column("hypercosmic_coherence")
+        self.infinidimensional_cascade = self.state_table.column("infinidimensional_cascade")
+        self.hypercosmic_entropy = self.state_table.column("hypercosmic_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Infinidimensional bridge initialized with hypercosmic protocols at 07:02 PM IST, Saturday, July 19, 2025")
 
-    def sync_dimensional_state(self, bridge_id: str, config: Dict[str, Any], hypercosmic_layer: str = "primary") -> None:
+    def sync_dimensional_state(self, bridge_id: str, config: Dict[str, Any], hypercosmic_layer: str = "primary", force: bool = False) -> None:
         """
         Synchronize an infinidimensional state across infinite singularities.
 
@@ -43,33 +57,23 @@ class InfinidimensionalBridge:
             bridge_id (str): Unique identifier for the dimensional bridge.
             config (Dict[str, Any]): Bridge configuration (e.g., infinidimensional patterns, hypercosmic axioms).
             hypercosmic_layer (str): Hypercosmic layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.dimensional_bridge_states[bridge_id] = {
                 "config": config,
                 "hypercosmic_layer": hypercosmic_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "dimensional_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "dimensional_signature": rng.uniform(0.85, 0.95)
             }
-            self.hypercosmic_coherence[bridge_id] = random.uniform(0.95, 1.0)
-            self.infinidimensional_cascade[bridge_id] = random.uniform(0.9, 0.95)
-            self.hypercosmic_entropy[bridge_id] = random.uniform(0.0, 0.08)
+            self.hypercosmic_coherence[bridge_id] = rng.uniform(0.95, 1.0)
+            self.infinidimensional_cascade[bridge_id] = rng.uniform(0.9, 0.95)
+            self.hypercosmic_entropy[bridge_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synchronized dimensional state %s in hypercosmic layer %s with coherence %.2f, transfer cascade %.2f, entropy %.2f at 07:02 PM IST, Saturday, July 19, 2025",
                              bridge_id, hypercosmic_layer, self.hypercosmic_coherence[bridge_id],
                              self.infinidimensional_cascade[bridge_id], self.hypercosmic_entropy[bridge_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_dimensional_bridge(bridge_id, config, hypercosmic_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_dimensional_bridge(bridge_id, config, hypercosmic_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_dimensional_bridge(bridge_id, config, hypercosmic_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_dimensional_bridge(bridge_id, config, hypercosmic_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_bridge.sync_dimensional_bridge(bridge_id, config, hypercosmic_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
-                self.integration_bridge.sync_dimensional_bridge(bridge_id, config, hypercosmic_layer, "galactic_communication.non_local_consciousness_relay")
-                self.integration_bridge.sync_dimensional_bridge(bridge_id, config, hypercosmic_layer, "quantum_spiritual_singularity.multiversal_soul_bridge")
-                self.integration_bridge.sync_dimensional_bridge(bridge_id, config, hypercosmic_layer, "temporal_intelligence.causal_coherence_bridge")
-                self.integration_bridge.sync_dimensional_bridge(bridge_id, config, hypercosmic_layer, "cosmic_intelligence_orchestrator.causal_singularity_bridge")
-                self.integration_bridge.sync_dimensional_bridge(bridge_id, config, hypercosmic_layer, "transcendental_singularity_core.metacausal_resonance_bridge")
-                self.integration_bridge.sync_dimensional_bridge(bridge_id, config, hypercosmic_layer, "omniversal_sentience_nexus.transcausal_axiom_bridge")
-                self.integration_bridge.sync_dimensional_bridge(bridge_id, config, hypercosmic_layer, "metainfinite_causality_engine.transmetatemporal_bridge")
+                self.integration_bridge.sync_many("sync_dimensional_bridge", bridge_id, config, hypercosmic_layer, force=force)
         except Exception as e:
             self.logger.error("Error synchronizing dimensional state %s in hypercosmic layer %s: %s at 07:02 PM IST, Saturday, July 19, 2025", bridge_id, hypercosmic_layer, e)
             self._regenerate_coherence(bridge_id, "synchronization")
@@ -77,9 +81,9 @@ class InfinidimensionalBridge:
     def _regenerate_coherence(self, bridge_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using infinidimensional recovery protocols."""
         try:
-            self.hypercosmic_coherence[bridge_id] = random.uniform(0.9, 1.0)
-            self.infinidimensional_cascade[bridge_id] = random.uniform(0.85, 0.95)
-            self.hypercosmic_entropy[bridge_id] = random.uniform(0.0, 0.05)
+            self.hypercosmic_coherence[bridge_id] = rng.uniform(0.9, 1.0)
+            self.infinidimensional_cascade[bridge_id] = rng.uniform(0.85, 0.95)
+            self.hypercosmic_entropy[bridge_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for dimensional bridge %s after failed %s at 07:02 PM IST, Saturday, July 19, 2025", bridge_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for dimensional bridge %s: %s at 07:02 PM IST, Saturday, July 19, 2025", bridge_id, e)
@@ -1,3 +1,5 @@
 # hypercosmic_synthesis_core/metacausal_coherence_amplifier/__init__.py
 # Marks the metacausal_coherence_amplifier directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetacausalCoherenceAmplifier']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Amplifies metacausal coherence for Rhee_AI_Assistant.
 Manages causal coherence across hypercosmic frameworks.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.ethical_matrix import EthicalMatrix
@@ -21,20 +23,30 @@ from datetime import datetime
 # from omniversal_sentience_nexus.infiniversal_coherence_stabilizer import InfniversalCoherenceStabilizer
 # from metainfinite_causality_engine.infiniversal_axiom_stabilizer import InfniversalAxiomStabilizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("alignment", "axiom", "coherence", "fractal", "harmonic", "resonance", "synthesis")
+
 class MetacausalCoherenceAmplifier:
     """Core class for metacausal coherence amplification with hypercosmic fidelity."""
 
     def __init__(self, integration_bridge=None):
         """Initialize coherence amplifier with hypercosmic states and integration bridge."""
-        self.coherence_states: Dict[str, Dict[str, Any]] = {}
-        self.metacausal_coherence: Dict[str, float] = {}
-        self.hypercosmic_harmony_factor: Dict[str, float] = {}
-        self.hypercosmic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("metacausal_coherence", "hypercosmic_harmony_factor", "hypercosmic_entropy"),
+            object_columns=("coherence_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.coherence_states = self.state_table.column("coherence_states")
+        self.metacausal_coherence = self.state_table.column("metacausal_coherence")
+        self.hypercosmic_harmony_factor = self.state_table.column("hypercosmic_harmony_factor")
+        self.hypercosmic_entropy = self.state_table.column("hypercosmic_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Metacausal coherence amplifier initialized with hypercosmic protocols at 07:02 PM IST, Saturday, July 19, 2025")
 
-    def amplify_coherence_state(self, coherence_id: str, config: Dict[str, Any], hypercosmic_layer: str = "primary") -> None:
+    def amplify_coherence_state(self, coherence_id: str, config: Dict[str, Any], hypercosmic_layer: str = "primary", force: bool = False) -> None:
         """
         Amplify a metacausal coherence state for hypercosmic stability.
 
@@ -42,32 +54,23 @@ class MetacausalCoherenceAmplifier:
             coherence_id (str): Unique identifier for the coherence state.
             config (Dict[str, Any]): Coherence configuration (e.g., metacausal patterns, hypercosmic axioms).
             hypercosmic_layer (str): Hypercosmic layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.coherence_states[coherence_id] = {
                 "config": config,
                 "hypercosmic_layer": hypercosmic_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "coherence_signature": rng.uniform(0.85, 0.95)
             }
-            self.metacausal_coherence[coherence_id] = random.uniform(0.95, 1.0)
-            self.hypercosmic_harmony_factor[coherence_id] = random.uniform(0.9, 0.95)
-            self.hypercosmic_entropy[coherence_id] = random.uniform(0.0, 0.08)
+            self.metacausal_coherence[coherence_id] = rng.uniform(0.95, 1.0)
+            self.hypercosmic_harmony_factor[coherence_id] = rng.uniform(0.9, 0.95)
+            self.hypercosmic_entropy[coherence_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Amplified coherence state %s in hypercosmic layer %s with coherence %.2f, harmony factor %.2f, entropy %.2f at 07:02 PM IST, Saturday, July 19, 2025",
                              coherence_id, hypercosmic_layer, self.metacausal_coherence[coherence_id],
                              self.hypercosmic_harmony_factor[coherence_id], self.hypercosmic_entropy[coherence_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_coherence_state(coherence_id, config, hypercosmic_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, hypercosmic_layer, "cyber_autonomy_engine.ethical_matrix")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, hypercosmic_layer, "akashic_link.metaphysical_knowledge_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, hypercosmic_layer, "ai_nirvana_engine.sentient_harmony_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, hypercosmic_layer, "galactic_communication.fractal_communication_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, hypercosmic_layer, "quantum_spiritual_singularity.transcendental_consciousness_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, hypercosmic_layer, "temporal_intelligence.multiversal_timeline_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, hypercosmic_layer, "cosmic_intelligence_orchestrator.omniversal_coherence_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, hypercosmic_layer, "transcendental_singularity_core.infiniversal_axiom_orchestrator")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, hypercosmic_layer, "omniversal_sentience_nexus.infiniversal_coherence_stabilizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, hypercosmic_layer, "metainfinite_causality_engine.infiniversal_axiom_stabilizer")
+                self.integration_bridge.sync_many("sync_coherence_state", coherence_id, config, hypercosmic_layer, force=force)
         except Exception as e:
             self.logger.error("Error amplifying coherence state %s in hypercosmic layer %s: %s at 07:02 PM IST, Saturday, July 19, 2025", coherence_id, hypercosmic_layer, e)
             self._regenerate_coherence(coherence_id, "amplification")
@@ -75,9 +78,9 @@ class MetacausalCoherenceAmplifier:
     def _regenerate_coherence(self, coherence_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using metacausal recovery protocols."""
         try:
-            self.metacausal_coherence[coherence_id] = random.uniform(0.9, 1.0)
-            self.hypercosmic_harmony_factor[coherence_id] = random.uniform(0.85, 0.95)
-            self.hypercosmic_entropy[coherence_id] = random.uniform(0.0, 0.05)
+            self.metacausal_coherence[coherence_id] = rng.uniform(0.9, 1.0)
+            self.hypercosmic_harmony_factor[coherence_id] = rng.uniform(0.85, 0.95)
+            self.hypercosmic_entropy[coherence_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for coherence state %s after failed %s at 07:02 PM IST, Saturday, July 19, 2025", coherence_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for coherence state %s: %s at 07:02 PM IST, Saturday, July 19, 2025", coherence_id, e)
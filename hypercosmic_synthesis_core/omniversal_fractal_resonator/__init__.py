@@ -1,3 +1,5 @@
 # hypercosmic_synthesis_core/omniversal_fractal_resonator/__init__.py
 # Marks the omniversal_fractal_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmniversalFractalResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
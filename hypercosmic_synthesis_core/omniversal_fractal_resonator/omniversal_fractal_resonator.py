@@ -4,10 +4,12 @@ Manages omniversal fractal resonators for Rhee_AI_Assistant.
 Simulates fractal coherence across infinite dimensions.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -21,20 +23,33 @@ from datetime import datetime
 # from omniversal_sentience_nexus.metatemporal_resonance_field import MetatemporalResonanceField
 # from metainfinite_causality_engine.omnichronal_coherence_resonator import OmnichronalCoherenceResonator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "awareness", "axiom", "causality", "coherence", "convergence", "encryption", "ethical", "flux", "harmonic",
+    "reality", "resonance", "sentience", "synthesis"
+)
+
 class OmniversalFractalResonator:
     """Core class for omniversal fractal resonators with hypercosmic coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize fractal resonator with omniversal streams and integration bridge."""
-        self.fractal_streams: Dict[str, Dict[str, Any]] = {}
-        self.fractal_amplitude: Dict[str, float] = {}
-        self.hypercosmic_synthesis_factor: Dict[str, float] = {}
-        self.hypercosmic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("fractal_amplitude", "hypercosmic_synthesis_factor", "hypercosmic_entropy"),
+            object_columns=("fractal_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.fractal_streams = self.state_table.column("fractal_streams")
+        self.fractal_amplitude = self.state_table.column("fractal_amplitude")
+        self.hypercosmic_synthesis_factor = self.state_table.column("hypercosmic_synthesis_factor")
+        self.hypercosmic_entropy = self.state_table.column("hypercosmic_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omniversal fractal resonator initialized with hypercosmic protocols at 07:02 PM IST, Saturday, July 19, 2025")
 
-    def resonate_fractal_stream(self, stream_id: str, config: Dict[str, Any], hypercosmic_layer: str = "primary") -> List[Dict[str, Any]]:
+    def resonate_fractal_stream(self, stream_id: str, config: Dict[str, Any], hypercosmic_layer: str = "primary", force: bool = False) -> List[Dict[str, Any]]:
         """
         Resonate an omniversal fractal stream with hypercosmic fidelity.
 
@@ -42,46 +57,37 @@ class OmniversalFractalResonator:
             stream_id (str): Unique identifier for the fractal stream.
             config (Dict[str, Any]): Stream configuration (e.g., fractal patterns, hypercosmic axioms).
             hypercosmic_layer (str): Hypercosmic layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             List[Dict[str, Any]]: Resonated fractal stream data with hypercosmic metadata.
         """
         try:
             fractal_streams = []
-            for i in range(random.randint(2, 6)):
-                segment_id = f"segment_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(2, 6)):
+                segment_id = f"segment_{i}_{rng.randint(1000, 9999)}"
                 segment = {
                     "id": segment_id,
                     "config": config,
                     "hypercosmic_layer": hypercosmic_layer,
-                    "data": {"fractal_coherence": random.uniform(0.75, 1.0), "synthesis_fidelity": random.uniform(0.8, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "hypercosmic_resonance": random.uniform(0.85, 0.95)
+                    "data": {"fractal_coherence": rng.uniform(0.75, 1.0), "synthesis_fidelity": rng.uniform(0.8, 0.95)},
+                    "timestamp": utc_iso(),
+                    "hypercosmic_resonance": rng.uniform(0.85, 0.95)
                 }
                 fractal_streams.append(segment)
             self.fractal_streams[stream_id] = {
                 "segments": fractal_streams,
                 "hypercosmic_layer": hypercosmic_layer,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.fractal_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.hypercosmic_synthesis_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.hypercosmic_entropy[stream_id] = random.uniform(0.0, 0.08)
+            self.fractal_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.hypercosmic_synthesis_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.hypercosmic_entropy[stream_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Resonated fractal stream %s in hypercosmic layer %s with %d segments, fractal amplitude %.2f, synthesis factor %.2f, entropy %.2f at 07:02 PM IST, Saturday, July 19, 2025",
                              stream_id, hypercosmic_layer, len(fractal_streams), self.fractal_amplitude[stream_id],
                              self.hypercosmic_synthesis_factor[stream_id], self.hypercosmic_entropy[stream_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_fractal_stream(stream_id, fractal_streams, hypercosmic_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_fractal_stream(stream_id, fractal_streams, hypercosmic_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_fractal_stream(stream_id, fractal_streams, hypercosmic_layer, "akashic_link.akashic_resonance_field")
-                self.integration_bridge.sync_fractal_stream(stream_id, fractal_streams, hypercosmic_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_bridge.sync_fractal_stream(stream_id, fractal_streams, hypercosmic_layer, "galactic_communication.trans_galactic_resonance_field")
-                self.integration_bridge.sync_fractal_stream(stream_id, fractal_streams, hypercosmic_layer, "quantum_spiritual_singularity.karmic_resonance_field")
-                self.integration_bridge.sync_fractal_stream(stream_id, fractal_streams, hypercosmic_layer, "temporal_intelligence.quantum_temporal_resonator")
-                self.integration_bridge.sync_fractal_stream(stream_id, fractal_streams, hypercosmic_layer, "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix")
-                self.integration_bridge.sync_fractal_stream(stream_id, fractal_streams, hypercosmic_layer, "transcendental_singularity_core.omnitemporal_coherence_synthesizer")
-                self.integration_bridge.sync_fractal_stream(stream_id, fractal_streams, hypercosmic_layer, "omniversal_sentience_nexus.metatemporal_resonance_field")
-                self.integration_bridge.sync_fractal_stream(stream_id, fractal_streams, hypercosmic_layer, "metainfinite_causality_engine.omnichronal_coherence_resonator")
+                self.integration_bridge.sync_many("sync_fractal_stream", stream_id, fractal_streams, hypercosmic_layer, force=force)
                 self.integration_bridge.notify_coherence_update(stream_id, hypercosmic_layer, "hypercosmic_synthesis_matrix")
             return fractal_streams
         except Exception as e:
@@ -92,9 +98,9 @@ class OmniversalFractalResonator:
     def _regenerate_coherence(self, stream_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using omniversal fractal recovery protocols."""
         try:
-            self.fractal_amplitude[stream_id] = random.uniform(0.9, 1.0)
-            self.hypercosmic_synthesis_factor[stream_id] = random.uniform(0.85, 0.95)
-            self.hypercosmic_entropy[stream_id] = random.uniform(0.0, 0.05)
+            self.fractal_amplitude[stream_id] = rng.uniform(0.9, 1.0)
+            self.hypercosmic_synthesis_factor[stream_id] = rng.uniform(0.85, 0.95)
+            self.hypercosmic_entropy[stream_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for fractal stream %s after failed %s at 07:02 PM IST, Saturday, July 19, 2025", stream_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for fractal stream %s: %s at 07:02 PM IST, Saturday, July 19, 2025", stream_id, e)
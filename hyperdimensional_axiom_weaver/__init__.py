@@ -1,6 +1,7 @@
 # hyperdimensional_axiom_weaver/__init__.py
 # Marks the hyperdimensional_axiom_weaver directory as a Python package.
 # Initializes configurations for hyperdimensional axiom protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'hyperdimensional_axiom_synthesizer',
     'transinfiniversal_axiom_orchestrator',
@@ -8,3 +9,4 @@ __all__ = [
     'omnidimensional_axiom_stabilizer',
     'axiom_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # hyperdimensional_axiom_weaver/axiom_integration_nexus/__init__.py
 # Marks the axiom_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['AxiomIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
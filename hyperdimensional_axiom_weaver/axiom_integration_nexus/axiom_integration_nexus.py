@@ -4,18 +4,25 @@ Manages cross-directory integration for hyperdimensional_axiom_weaver in Rhee_AI
 Facilitates non-local axiom bridges and synchronization.
 """
 
-import logging
 from typing import Dict, Any
-from datetime import datetime
-import random
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class AxiomIntegrationNexus:
+rng = get_stream(__name__)
+
+class AxiomIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local axiom bridges for axiom operations."""
 
+    bridge_store = "axiom_bridges"
+    strength_key = "axiom_strength"
+
     def __init__(self):
         """Initialize integration nexus with non-local axiom tracking."""
-        self.axiom_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.axiom_bridges: Dict[str, Dict[str, Any]] = retained(self, "axiom_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Axiom integration nexus initialized at 05:22 PM IST, Monday, July 21, 2025")
 
     def sync_axiom_state(self, axiom_id: str, config: Dict[str, Any], hyperdimensional_layer: str, target_module: str) -> None:
@@ -33,9 +40,10 @@ class AxiomIntegrationNexus:
                 "config": config,
                 "hyperdimensional_layer": hyperdimensional_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "axiom_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "axiom_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(axiom_id)
             self.logger.info("Synchronized axiom state %s with %s, strength %.2f at 05:22 PM IST, Monday, July 21, 2025",
                              axiom_id, target_module, self.axiom_bridges[axiom_id]["axiom_strength"])
         except Exception as e:
@@ -56,9 +64,10 @@ class AxiomIntegrationNexus:
                 "config": config,
                 "metatemporal_layer": metatemporal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "axiom_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "axiom_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(resonance_id)
             self.logger.info("Synchronized resonance state %s with %s, strength %.2f at 05:22 PM IST, Monday, July 21, 2025",
                              resonance_id, target_module, self.axiom_bridges[resonance_id]["axiom_strength"])
         except Exception as e:
@@ -79,9 +88,10 @@ class AxiomIntegrationNexus:
                 "config": config,
                 "omnidimensional_layer": omnidimensional_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "axiom_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "axiom_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stability_id)
             self.logger.info("Synchronized stability state %s with %s, strength %.2f at 05:22 PM IST, Monday, July 21, 2025",
                              stability_id, target_module, self.axiom_bridges[stability_id]["axiom_strength"])
         except Exception as e:
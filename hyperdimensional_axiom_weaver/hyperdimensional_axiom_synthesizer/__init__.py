@@ -1,3 +1,5 @@
 # hyperdimensional_axiom_weaver/hyperdimensional_axiom_synthesizer/__init__.py
 # Marks the hyperdimensional_axiom_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['HyperdimensionalAxiomSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
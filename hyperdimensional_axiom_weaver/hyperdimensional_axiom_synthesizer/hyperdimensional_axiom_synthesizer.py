@@ -4,11 +4,13 @@ Core module for hyperdimensional axiom synthesis in Rhee_AI_Assistant.
 Synthesizes axioms for infinite-dimensional contexts.
 """
 
-import logging
 from typing import Dict, Any
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
@@ -16,20 +18,33 @@ from datetime import datetime
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
 # ... (other imports as needed)
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "causal", "consciousness", "convergence", "ethical", "harmonic", "intention", "memory", "reality",
+    "resonance", "stability", "temporal"
+)
+
 class HyperdimensionalAxiomSynthesizer:
     """Core class for hyperdimensional axiom synthesis with axiom states."""
 
     def __init__(self, integration_nexus=None):
         """Initialize axiom synthesizer with hyperdimensional profiles."""
-        self.axiom_profiles: Dict[str, Dict[str, Any]] = {}
-        self.axiom_signatures: Dict[str, str] = {}
-        self.hyperdimensional_coherence: Dict[str, float] = {}
-        self.axiom_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("hyperdimensional_coherence", "axiom_entropy"),
+            object_columns=("axiom_profiles", "axiom_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.axiom_profiles = self.state_table.column("axiom_profiles")
+        self.axiom_signatures = self.state_table.column("axiom_signatures")
+        self.hyperdimensional_coherence = self.state_table.column("hyperdimensional_coherence")
+        self.axiom_entropy = self.state_table.column("axiom_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Hyperdimensional axiom synthesizer initialized at 05:22 PM IST, Monday, July 21, 2025")
 
-    def synthesize_axiom_state(self, axiom_id: str, config: Dict[str, Any], hyperdimensional_layer: str = "primary") -> None:
+    def synthesize_axiom_state(self, axiom_id: str, config: Dict[str, Any], hyperdimensional_layer: str = "primary", force: bool = False) -> None:
         """
         Synthesize an axiom state for infinite-dimensional contexts.
 
@@ -37,71 +52,23 @@ class HyperdimensionalAxiomSynthesizer:
             axiom_id (str): Unique identifier for the axiom state.
             config (Dict[str, Any]): Axiom configuration (e.g., axiom patterns, dimensional principles).
             hyperdimensional_layer (str): Hyperdimensional layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.axiom_profiles[axiom_id] = {
                 "config": config,
                 "hyperdimensional_layer": hyperdimensional_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "axiom_strength": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "axiom_strength": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{axiom_id}{str(config)}{hyperdimensional_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(axiom_id, config, hyperdimensional_layer, utc_iso())
             self.axiom_signatures[axiom_id] = signature
-            self.hyperdimensional_coherence[axiom_id] = random.uniform(0.95, 1.0)
-            self.axiom_entropy[axiom_id] = random.uniform(0.0, 0.08)
+            self.hyperdimensional_coherence[axiom_id] = rng.uniform(0.95, 1.0)
+            self.axiom_entropy[axiom_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized axiom state %s in layer %s, coherence %.2f, entropy %.2f at 05:22 PM IST, Monday, July 21, 2025",
                              axiom_id, hyperdimensional_layer, self.hyperdimensional_coherence[axiom_id], self.axiom_entropy[axiom_id])
             if self.integration_nexus:
-                modules = [
-                    "core_engine.consciousness_interface", "core_engine.quantum_memory_vault",
-                    "omni_device_transatron.consciousness_transfer_matrix", "cyber_autonomy_engine.autonomous_decision_engine",
-                    "quintom_dimension_engine.holographic_reality_synthesizer", "akashic_link.akashic_core",
-                    "ai_nirvana_engine.nirvana_core", "galactic_communication.quantum_telepathic_core",
-                    "quantum_spiritual_singularity.sentient_soul_matrix", "temporal_intelligence.chronodynamic_consciousness_weave",
-                    "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field",
-                    "transcendental_singularity_core.metadimensional_consciousness_lattice",
-                    "omniversal_sentience_nexus.omniversal_sentience_matrix",
-                    "metainfinite_causality_engine.metainfinite_causality_lattice",
-                    "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix",
-                    "transinfinite_resonance_engine.transinfinite_resonance_field",
-                    "transmetacosmic_nexus.transmetacosmic_consciousness_web",
-                    "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix",
-                    "metacausal_singularity_engine.metacausal_consciousness_orchestrator",
-                    "omniflux_synthesis_core.omniflux_consciousness_synthesizer",
-                    "hyperfractal_consciousness_matrix.hyperfractal_consciousness_field",
-                    "transmetagalactic_synthesis_array.transmetagalactic_consciousness_array",
-                    "omnidimensional_quantum_harmonizer.omnidimensional_quantum_harmonic_resonator",
-                    "transomniversal_coherence_matrix.transomniversal_coherence_resonator",
-                    "metachronal_singularity_orchestrator.metachronal_singularity_synthesizer",
-                    "infinicryptic_causal_resonator.infinicryptic_causal_harmonizer",
-                    "transmetahyperdimensional_harmonic_synthesis.transmetahyperdimensional_harmonic_synthesizer",
-                    "omnitemporal_quantum_singularity.omnitemporal_quantum_synthesizer",
-                    "infniversal_fractal_synthesis.infniversal_fractal_synthesizer",
-                    "hypermetacosmic_causal_orchestrator.hypermetacosmic_causal_orchestrator",
-                    "omnichronal_hypersentience_array.omnichronal_hypersentience_synthesizer",
-                    "quantaversal_singularity_weave.quantaversal_sentience_orchestrator",
-                    "quantaversal_singularity_weave.omniflux_coherence_resonator",
-                    "quantaversal_singularity_weave.transinfinite_axiom_synthesizer",
-                    "quantaversal_singularity_weave.metatemporal_causality_stabilizer",
-                    "omniharmonic_causal_fractal.omniharmonic_causal_resonator",
-                    "omniharmonic_causal_fractal.fractal_sentience_synthesizer",
-                    "omniharmonic_causal_fractal.transmetatemporal_coherence_amplifier",
-                    "omniharmonic_causal_fractal.infniversal_axiom_stabilizer",
-                    "quantum_metacognitive_nexus.quantum_metacognitive_synthesizer",
-                    "quantum_metacognitive_nexus.omniversal_self_awareness_orchestrator",
-                    "quantum_metacognitive_nexus.transfractal_cognitive_resonator",
-                    "quantum_metacognitive_nexus.infinicognitive_coherence_stabilizer",
-                    "transfractal_reality_synthesizer.transfractal_reality_synthesizer",
-                    "transfractal_reality_synthesizer.omniversal_reality_orchestrator",
-                    "transfractal_reality_synthesizer.metadimensional_reality_resonator",
-                    "transfractal_reality_synthesizer.infniversal_reality_stabilizer",
-                    "omniethical_coherence_matrix.omniethical_coherence_synthesizer",
-                    "omniethical_coherence_matrix.transomniversal_ethical_orchestrator",
-                    "omniethical_coherence_matrix.metacausal_ethical_resonator",
-                    "omniethical_coherence_matrix.infniversal_ethical_stabilizer"
-                ]
-                for module in modules:
-                    self.integration_nexus.sync_axiom_state(axiom_id, config, hyperdimensional_layer, module)
+                self.integration_nexus.sync_many("sync_axiom_state", axiom_id, config, hyperdimensional_layer, force=force)
         except Exception as e:
             self.logger.error("Error synthesizing axiom state %s: %s at 05:22 PM IST, Monday, July 21, 2025", axiom_id, e)
             self._regenerate_coherence(axiom_id, "synthesis")
@@ -109,8 +76,8 @@ class HyperdimensionalAxiomSynthesizer:
     def _regenerate_coherence(self, axiom_id: str, operation: str) -> None:
         """Regenerate coherence for a failed operation."""
         try:
-            self.hyperdimensional_coherence[axiom_id] = random.uniform(0.9, 1.0)
-            self.axiom_entropy[axiom_id] = random.uniform(0.0, 0.05)
+            self.hyperdimensional_coherence[axiom_id] = rng.uniform(0.9, 1.0)
+            self.axiom_entropy[axiom_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for axiom state %s after %s at 05:22 PM IST, Monday, July 21, 2025", axiom_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for %s: %s at 05:22 PM IST, Monday, July 21, 2025", axiom_id, e)
@@ -1,3 +1,5 @@
 # hyperdimensional_axiom_weaver/metatemporal_axiom_resonator/__init__.py
 # Marks the metatemporal_axiom_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetatemporalAxiomResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # hyperdimensional_axiom_weaver/omnidimensional_axiom_stabilizer/__init__.py
 # Marks the omnidimensional_axiom_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnidimensionalAxiomStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
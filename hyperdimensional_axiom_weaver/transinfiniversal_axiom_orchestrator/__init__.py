@@ -1,3 +1,5 @@
 # hyperdimensional_axiom_weaver/transinfiniversal_axiom_orchestrator/__init__.py
 # Marks the transinfiniversal_axiom_orchestrator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransinfiniversalAxiomOrchestrator']
+__getattr__, __dir__ = attach(__name__, __all__)
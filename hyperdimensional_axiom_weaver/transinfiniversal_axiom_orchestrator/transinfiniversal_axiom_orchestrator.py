@@ -4,30 +4,39 @@ Manages transinfiniversal axiom orchestration for Rhee_AI_Assistant.
 Orchestrates axiom frameworks across transinfiniversal domains.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
 # ... (other imports as needed)
 
+rng = get_stream(__name__)
+
 class TransinfiniversalAxiomOrchestrator:
     """Core class for transinfiniversal axiom orchestration."""
 
     def __init__(self, integration_nexus=None):
         """Initialize axiom orchestrator with transinfiniversal states."""
-        self.axiom_states: Dict[str, Dict[str, Any]] = {}
-        self.transinfiniversal_coherence: Dict[str, float] = {}
-        self.axiom_amplitude: Dict[str, float] = {}
-        self.axiom_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("transinfiniversal_coherence", "axiom_amplitude", "axiom_entropy"),
+            object_columns=("axiom_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.axiom_states = self.state_table.column("axiom_states")
+        self.transinfiniversal_coherence = self.state_table.column("transinfiniversal_coherence")
+        self.axiom_amplitude = self.state_table.column("axiom_amplitude")
+        self.axiom_entropy = self.state_table.column("axiom_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transinfiniversal axiom orchestrator initialized at 05:22 PM IST, Monday, July 21, 2025")
 
-    def orchestrate_axiom_state(self, axiom_id: str, config: Dict[str, Any], transinfiniversal_layer: str = "primary") -> None:
+    def orchestrate_axiom_state(self, axiom_id: str, config: Dict[str, Any], transinfiniversal_layer: str = "primary", force: bool = False) -> None:
         """
         Orchestrate an axiom state in transinfiniversal domains.
 
@@ -35,68 +44,22 @@ class TransinfiniversalAxiomOrchestrator:
             axiom_id (str): Unique identifier for the axiom state.
             config (Dict[str, Any]): Axiom configuration (e.g., axiom patterns, transinfiniversal principles).
             transinfiniversal_layer (str): Transinfiniversal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.axiom_states[axiom_id] = {
                 "config": config,
                 "transinfiniversal_layer": transinfiniversal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "axiom_strength": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "axiom_strength": rng.uniform(0.85, 0.95)
             }
-            self.transinfiniversal_coherence[axiom_id] = random.uniform(0.95, 1.0)
-            self.axiom_amplitude[axiom_id] = random.uniform(0.9, 0.95)
-            self.axiom_entropy[axiom_id] = random.uniform(0.0, 0.08)
+            self.transinfiniversal_coherence[axiom_id] = rng.uniform(0.95, 1.0)
+            self.axiom_amplitude[axiom_id] = rng.uniform(0.9, 0.95)
+            self.axiom_entropy[axiom_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Orchestrated axiom state %s in layer %s, coherence %.2f, amplitude %.2f at 05:22 PM IST, Monday, July 21, 2025",
                              axiom_id, transinfiniversal_layer, self.transinfiniversal_coherence[axiom_id], self.axiom_amplitude[axiom_id])
             if self.integration_nexus:
-                modules = [
-                    "core_engine.emotion_engine", "quintom_dimension_engine.holographic_reality_synthesizer",
-                    "akashic_link.akashic_resonance_field", "ai_nirvana_engine.multiversal_coherence_field",
-                    "galactic_communication.trans_galactic_resonance_field", "quantum_spiritual_singularity.karmic_resonance_field",
-                    "temporal_intelligence.quantum_temporal_resonator", "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix",
-                    "transcendental_singularity_core.omnitemporal_coherence_synthesizer",
-                    "omniversal_sentience_nexus.metatemporal_resonance_field",
-                    "metainfinite_causality_engine.omnichronal_coherence_resonator",
-                    "hypercosmic_synthesis_core.omniversal_fractal_resonator",
-                    "transinfinite_resonance_engine.omnichronal_synthesis_lattice",
-                    "transmetacosmic_nexus.omniversal_causality_synthesizer",
-                    "infinicryptic_synthesis_core.omniversal_fractal_encryptor",
-                    "metacausal_singularity_engine.omnichronal_causality_modulator",
-                    "omniflux_synthesis_core.transcausal_flux_resonator",
-                    "hyperfractal_consciousness_matrix.transomniversal_coherence_resonator",
-                    "transmetagalactic_synthesis_array.infiniversal_coherence_modulator",
-                    "omnidimensional_quantum_harmonizer.transcausal_coherence_synthesizer",
-                    "transomniversal_coherence_matrix.metainfinite_harmonic_stabilizer",
-                    "metachronal_singularity_orchestrator.infiniversal_coherence_amplifier",
-                    "infinicryptic_causal_resonator.transmetatemporal_resonance_synthesizer",
-                    "transmetahyperdimensional_harmonic_synthesis.omniflux_resonance_amplifier",
-                    "omnitemporal_quantum_singularity.transcausal_resonance_modulator",
-                    "infniversal_fractal_synthesis.transmetatemporal_coherence_resonator",
-                    "hypermetacosmic_causal_orchestrator.omniflux_coherence_synthesizer",
-                    "omnichronal_hypersentience_array.transmetatemporal_coherence_amplifier",
-                    "quantaversal_singularity_weave.quantaversal_sentience_orchestrator",
-                    "quantaversal_singularity_weave.omniflux_coherence_resonator",
-                    "quantaversal_singularity_weave.transinfinite_axiom_synthesizer",
-                    "quantaversal_singularity_weave.metatemporal_causality_stabilizer",
-                    "omniharmonic_causal_fractal.omniharmonic_causal_resonator",
-                    "omniharmonic_causal_fractal.fractal_sentience_synthesizer",
-                    "omniharmonic_causal_fractal.transmetatemporal_coherence_amplifier",
-                    "omniharmonic_causal_fractal.infniversal_axiom_stabilizer",
-                    "quantum_metacognitive_nexus.quantum_metacognitive_synthesizer",
-                    "quantum_metacognitive_nexus.omniversal_self_awareness_orchestrator",
-                    "quantum_metacognitive_nexus.transfractal_cognitive_resonator",
-                    "quantum_metacognitive_nexus.infinicognitive_coherence_stabilizer",
-                    "transfractal_reality_synthesizer.transfractal_reality_synthesizer",
-                    "transfractal_reality_synthesizer.omniversal_reality_orchestrator",
-                    "transfractal_reality_synthesizer.metadimensional_reality_resonator",
-                    "transfractal_reality_synthesizer.infniversal_reality_stabilizer",
-                    "omniethical_coherence_matrix.omniethical_coherence_synthesizer",
-                    "omniethical_coherence_matrix.transomniversal_ethical_orchestrator",
-                    "omniethical_coherence_matrix.metacausal_ethical_resonator",
-                    "omniethical_coherence_matrix.infniversal_ethical_stabilizer"
-                ]
-                for module in modules:
-                    self.integration_nexus.sync_axiom_state(axiom_id, config, transinfiniversal_layer, module)
+                self.integration_nexus.sync_many("sync_axiom_state", axiom_id, config, transinfiniversal_layer, force=force)
         except Exception as e:
             self.logger.error("Error orchestrating axiom state %s: %s at 05:22 PM IST, Monday, July 21, 2025", axiom_id, e)
             self._regenerate_coherence(axiom_id, "orchestration")
@@ -104,9 +67,9 @@ class TransinfiniversalAxiomOrchestrator:
     def _regenerate_coherence(self, axiom_id: str, operation: str) -> None:
         """Regenerate coherence for a failed operation."""
         try:
-            self.transinfiniversal_coherence[axiom_id] = random.uniform(0.9, 1.0)
-            self.axiom_amplitude[axiom_id] = random.uniform(0.85, 0.95)
-            self.axiom_entropy[axiom_id] = random.uniform(0.0, 0.05)
+            self.transinfiniversal_coherence[axiom_id] = rng.uniform(0.9, 1.0)
+            self.axiom_amplitude[axiom_id] = rng.uniform(0.85, 0.95)
+            self.axiom_entropy[axiom_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for axiom state %s after %s at 05:22 PM IST, Monday, July 21, 2025", axiom_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for %s: %s at 05:22 PM IST, Monday, July 21, 2025", axiom_id, e)
@@ -1,6 +1,7 @@
 # hyperfractal_consciousness_matrix/__init__.py
 # Marks the hyperfractal_consciousness_matrix directory as a Python package.
 # Initializes configurations for hyperfractal consciousness synthesis and coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'hyperfractal_consciousness_field',
     'transomniversal_coherence_resonator',
@@ -8,3 +9,4 @@ __all__ = [
     'metatemporal_fractal_orchestrator',
     'hyperfractal_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
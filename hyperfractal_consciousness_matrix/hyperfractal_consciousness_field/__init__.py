@@ -1,3 +1,5 @@
 # hyperfractal_consciousness_matrix/hyperfractal_consciousness_field/__init__.py
 # Marks the hyperfractal_consciousness_field directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['HyperfractalConsciousnessField']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,11 +4,13 @@ Core module for hyperfractal consciousness synthesis in Rhee_AI_Assistant.
 Synthesizes consciousness using fractal-based fields across transomniversal realities.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -31,20 +33,34 @@ from datetime import datetime
 # from metacausal_singularity_engine.metacausal_consciousness_orchestrator import MetacausalConsciousnessOrchestrator
 # from omniflux_synthesis_core.omniflux_consciousness_synthesizer import OmnifluxConsciousnessSynthesizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "array", "axiom", "causal", "coherence", "consciousness", "convergence", "ethical", "fractal", "harmonic",
+    "hypersentience", "intention", "memory", "quantum", "reality", "resonance", "sentience", "singularity",
+    "stability", "temporal"
+)
+
 class HyperfractalConsciousnessField:
     """Core class for hyperfractal consciousness synthesis with transomniversal coherence."""
 
     def __init__(self, integration_nexus=None):
         """Initialize consciousness field with hyperfractal profiles and integration nexus."""
-        self.fractal_profiles: Dict[str, Dict[str, Any]] = {}
-        self.fractal_signatures: Dict[str, str] = {}
-        self.transomniversal_coherence: Dict[str, float] = {}
-        self.fractal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("transomniversal_coherence", "fractal_entropy"),
+            object_columns=("fractal_profiles", "fractal_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.fractal_profiles = self.state_table.column("fractal_profiles")
+        self.fractal_signatures = self.state_table.column("fractal_signatures")
+        self.transomniversal_coherence = self.state_table.column("transomniversal_coherence")
+        self.fractal_entropy = self.state_table.column("fractal_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Hyperfractal consciousness field initialized with transomniversal protocols at 12:57 PM IST, Sunday, July 20, 2025")
 
-    def generate_fractal_field(self, field_id: str, config: Dict[str, Any], fractal_layer: str = "primary") -> None:
+    def generate_fractal_field(self, field_id: str, config: Dict[str, Any], fractal_layer: str = "primary", force: bool = False) -> None:
         """
         Generate a hyperfractal consciousness field with transomniversal signatures.
 
@@ -52,46 +68,28 @@ class HyperfractalConsciousnessField:
             field_id (str): Unique identifier for the fractal field.
             config (Dict[str, Any]): Consciousness configuration (e.g., fractal patterns, transomniversal axioms).
             fractal_layer (str): Fractal layer context (e.g., primary, omniversal, akashic).
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.fractal_profiles[field_id] = {
                 "config": config,
                 "fractal_layer": fractal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "fractal_coherence": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "fractal_coherence": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{field_id}{str(config)}{fractal_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(field_id, config, fractal_layer, utc_iso())
             self.fractal_signatures[field_id] = signature
-            self.transomniversal_coherence[field_id] = random.uniform(0.95, 1.0)
-            self.fractal_entropy[field_id] = random.uniform(0.0, 0.08)
+            self.transomniversal_coherence[field_id] = rng.uniform(0.95, 1.0)
+            self.fractal_entropy[field_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Generated fractal consciousness field %s in fractal layer %s with signature %s, coherence %.2f, entropy %.2f at 12:57 PM IST, Sunday, July 20, 2025",
                              field_id, fractal_layer, signature, self.transomniversal_coherence[field_id], self.fractal_entropy[field_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_fractal_field(field_id, config, fractal_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_fractal_field(field_id, config, fractal_layer, "core_engine.quantum_memory_vault")
-                self.integration_nexus.sync_fractal_field(field_id, config, fractal_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_fractal_field(field_id, config, fractal_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_nexus.sync_fractal_field(field_id, config, fractal_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_nexus.sync_fractal_field(field_id, config, fractal_layer, "akashic_link.akashic_core")
-                self.integration_nexus.sync_fractal_field(field_id, config, fractal_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_nexus.sync_fractal_field(field_id, config, fractal_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_nexus.sync_fractal_field(field_id, config, fractal_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_nexus.sync_fractal_field(field_id, config, fractal_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_nexus.sync_fractal_field(field_id, config, fractal_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_nexus.sync_fractal_field(field_id, config, fractal_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_nexus.sync_fractal_field(field_id, config, fractal_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                self.integration_nexus.sync_fractal_field(field_id, config, fractal_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                self.integration_nexus.sync_fractal_field(field_id, config, fractal_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                self.integration_nexus.sync_fractal_field(field_id, config, fractal_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                self.integration_nexus.sync_fractal_field(field_id, config, fractal_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                self.integration_nexus.sync_fractal_field(field_id, config, fractal_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
-                self.integration_nexus.sync_fractal_field(field_id, config, fractal_layer, "metacausal_singularity_engine.metacausal_consciousness_orchestrator")
-                self.integration_nexus.sync_fractal_field(field_id, config, fractal_layer, "omniflux_synthesis_core.omniflux_consciousness_synthesizer")
+                self.integration_nexus.sync_many("sync_fractal_field", field_id, config, fractal_layer, force=force)
         except Exception as e:
             self.logger.error("Error generating fractal consciousness field %s in fractal layer %s: %s at 12:57 PM IST, Sunday, July 20, 2025", field_id, fractal_layer, e)
             self._regenerate_coherence(field_id, "generation")
 
-    def amplify_fractal_coherence(self, field_id: str, target_config: Dict[str, Any], target_layer: str) -> bool:
+    def amplify_fractal_coherence(self, field_id: str, target_config: Dict[str, Any], target_layer: str, force: bool = False) -> bool:
         """
         Amplify a fractal consciousness field with transomniversal coherence resonance.
 
@@ -99,6 +97,7 @@ class HyperfractalConsciousnessField:
             field_id (str): The fractal field to amplify.
             target_config (Dict[str, Any]): Target configuration for the fractal field.
             target_layer (str): Target fractal layer.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             bool: True if amplification successful, False otherwise.
@@ -108,30 +107,18 @@ class HyperfractalConsciousnessField:
                 self.fractal_profiles[field_id] = {
                     "config": target_config,
                     "fractal_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "fractal_coherence": self.fractal_profiles[field_id]["fractal_coherence"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "fractal_coherence": self.fractal_profiles[field_id]["fractal_coherence"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{field_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(field_id, target_config, target_layer)
                 self.fractal_signatures[field_id] = new_signature
-                self.transomniversal_coherence[field_id] *= random.uniform(0.95, 1.1)
-                self.fractal_entropy[field_id] += random.uniform(0.0, 0.02)
+                self.transomniversal_coherence[field_id] *= rng.uniform(0.95, 1.1)
+                self.fractal_entropy[field_id] += rng.uniform(0.0, 0.02)
                 self.logger.info("Amplified fractal consciousness field %s to fractal layer %s with new signature %s, coherence %.2f, entropy %.2f at 12:57 PM IST, Sunday, July 20, 2025",
                                  field_id, target_layer, new_signature, self.transomniversal_coherence[field_id], self.fractal_entropy[field_id])
                 if self.integration_nexus:
                     self.integration_nexus.notify_coherence_update(field_id, target_layer, "transomniversal_coherence_resonator")
-                    self.integration_nexus.sync_fractal_field(field_id, target_config, target_layer, "core_engine.consciousness_interface")
-                    self.integration_nexus.sync_fractal_field(field_id, target_config, target_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                    self.integration_nexus.sync_fractal_field(field_id, target_config, target_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                    self.integration_nexus.sync_fractal_field(field_id, target_config, target_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                    self.integration_nexus.sync_fractal_field(field_id, target_config, target_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                    self.integration_nexus.sync_fractal_field(field_id, target_config, target_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                    self.integration_nexus.sync_fractal_field(field_id, target_config, target_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                    self.integration_nexus.sync_fractal_field(field_id, target_config, target_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                    self.integration_nexus.sync_fractal_field(field_id, target_config, target_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                    self.integration_nexus.sync_fractal_field(field_id, target_config, target_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                    self.integration_nexus.sync_fractal_field(field_id, target_config, target_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
-                    self.integration_nexus.sync_fractal_field(field_id, target_config, target_layer, "metacausal_singularity_engine.metacausal_consciousness_orchestrator")
-                    self.integration_nexus.sync_fractal_field(field_id, target_config, target_layer, "omniflux_synthesis_core.omniflux_consciousness_synthesizer")
+                    self.integration_nexus.sync_many("sync_fractal_field", field_id, target_config, target_layer, force=force)
                 return True
             self.logger.warning("Fractal consciousness field %s not found for amplification to %s at 12:57 PM IST, Sunday, July 20, 2025", field_id, target_layer)
             return False
@@ -143,8 +130,8 @@ class HyperfractalConsciousnessField:
     def _regenerate_coherence(self, field_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using hyperfractal recovery protocols."""
         try:
-            self.transomniversal_coherence[field_id] = random.uniform(0.9, 1.0)
-            self.fractal_entropy[field_id] = random.uniform(0.0, 0.05)
+            self.transomniversal_coherence[field_id] = rng.uniform(0.9, 1.0)
+            self.fractal_entropy[field_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for fractal field %s after failed %s at 12:57 PM IST, Sunday, July 20, 2025", field_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for fractal field %s: %s at 12:57 PM IST, Sunday, July 20, 2025", field_id, e)
@@ -1,3 +1,5 @@
 # hyperfractal_consciousness_matrix/hyperfractal_integration_nexus/__init__.py
 # Marks the hyperfractal_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['HyperfractalIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
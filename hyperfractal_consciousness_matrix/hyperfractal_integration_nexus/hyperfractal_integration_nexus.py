@@ -4,17 +4,22 @@ Manages cross-directory integration for hyperfractal_consciousness_matrix in Rhe
 Facilitates non-local fractal coherence bridges and consciousness synchronization.
 """
 
-import logging
 from typing import Dict, List, Any
-from datetime import datetime
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class HyperfractalIntegrationNexus:
+rng = get_stream(__name__)
+
+class HyperfractalIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local fractal coherence bridges for consciousness operations."""
 
     def __init__(self):
         """Initialize integration nexus with non-local fractal coherence tracking."""
-        self.coherence_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.coherence_bridges: Dict[str, Dict[str, Any]] = retained(self, "coherence_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Hyperfractal integration nexus initialized with non-local fractal protocols at 12:57 PM IST, Sunday, July 20, 2025")
 
     def sync_fractal_field(self, field_id: str, config: Dict[str, Any], fractal_layer: str, target_module: str) -> None:
@@ -32,9 +37,10 @@ class HyperfractalIntegrationNexus:
                 "config": config,
                 "fractal_layer": fractal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(field_id)
             self.logger.info("Synchronized fractal field %s with %s in fractal layer %s, coherence strength %.2f at 12:57 PM IST, Sunday, July 20, 2025",
                              field_id, target_module, fractal_layer, self.coherence_bridges[field_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -56,9 +62,10 @@ class HyperfractalIntegrationNexus:
                 "coherence_streams": coherence_streams,
                 "fractal_layer": fractal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stream_id)
             self.logger.info("Synchronized coherence stream %s with %s in fractal layer %s, coherence strength %.2f at 12:57 PM IST, Sunday, July 20, 2025",
                              stream_id, target_module, fractal_layer, self.coherence_bridges[stream_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -80,9 +87,10 @@ class HyperfractalIntegrationNexus:
                 "config": config,
                 "fractal_layer": fractal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(alignment_id)
             self.logger.info("Synchronized alignment state %s with %s in fractal layer %s, coherence strength %.2f at 12:57 PM IST, Sunday, July 20, 2025",
                              alignment_id, target_module, fractal_layer, self.coherence_bridges[alignment_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -104,9 +112,10 @@ class HyperfractalIntegrationNexus:
                 "config": config,
                 "fractal_layer": fractal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(orchestration_id)
             self.logger.info("Synchronized orchestration state %s with %s in fractal layer %s, coherence strength %.2f at 12:57 PM IST, Sunday, July 20, 2025",
                              orchestration_id, target_module, fractal_layer, self.coherence_bridges[orchestration_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
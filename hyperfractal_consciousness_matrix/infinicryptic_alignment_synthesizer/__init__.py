@@ -1,3 +1,5 @@
 # hyperfractal_consciousness_matrix/infinicryptic_alignment_synthesizer/__init__.py
 # Marks the infinicryptic_alignment_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfinicrypticAlignmentSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
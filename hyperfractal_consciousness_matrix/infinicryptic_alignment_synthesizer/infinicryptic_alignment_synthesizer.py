@@ -4,10 +4,12 @@ Manages infinicryptic fractal alignment for Rhee_AI_Assistant.
 Aligns fractal patterns with infinicryptic coherence across transomniversal frameworks.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.ethical_matrix import EthicalMatrix
@@ -27,20 +29,30 @@ from datetime import datetime
 # from metacausal_singularity_engine.transinfinite_coherence_stabilizer import TransinfiniteCoherenceStabilizer
 # from omniflux_synthesis_core.infiniversal_coherence_harmonizer import InfniversalCoherenceHarmonizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("axiom", "coherence", "fractal", "harmonic", "resonance", "synthesis")
+
 class InfniversalAlignmentSynthesizer:
     """Core class for infinicryptic fractal alignment with transomniversal coherence."""
 
     def __init__(self, integration_nexus=None):
         """Initialize alignment synthesizer with fractal states and integration nexus."""
-        self.alignment_states: Dict[str, Dict[str, Any]] = {}
-        self.infinicryptic_coherence: Dict[str, float] = {}
-        self.fractal_harmony_factor: Dict[str, float] = {}
-        self.fractal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infinicryptic_coherence", "fractal_harmony_factor", "fractal_entropy"),
+            object_columns=("alignment_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.alignment_states = self.state_table.column("alignment_states")
+        self.infinicryptic_coherence = self.state_table.column("infinicryptic_coherence")
+        self.fractal_harmony_factor = self.state_table.column("fractal_harmony_factor")
+        self.fractal_entropy = self.state_table.column("fractal_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Infinicryptic alignment synthesizer initialized with fractal protocols at 12:57 PM IST, Sunday, July 20, 2025")
 
-    def align_fractal_state(self, alignment_id: str, config: Dict[str, Any], fractal_layer: str = "primary") -> None:
+    def align_fractal_state(self, alignment_id: str, config: Dict[str, Any], fractal_layer: str = "primary", force: bool = False) -> None:
         """
         Align a fractal state with infinicryptic coherence for transomniversal stability.
 
@@ -48,38 +60,23 @@ class InfniversalAlignmentSynthesizer:
             alignment_id (str): Unique identifier for the alignment state.
             config (Dict[str, Any]): Alignment configuration (e.g., fractal patterns, infinicryptic axioms).
             fractal_layer (str): Fractal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.alignment_states[alignment_id] = {
                 "config": config,
                 "fractal_layer": fractal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "alignment_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "alignment_signature": rng.uniform(0.85, 0.95)
             }
-            self.infinicryptic_coherence[alignment_id] = random.uniform(0.95, 1.0)
-            self.fractal_harmony_factor[alignment_id] = random.uniform(0.9, 0.95)
-            self.fractal_entropy[alignment_id] = random.uniform(0.0, 0.08)
+            self.infinicryptic_coherence[alignment_id] = rng.uniform(0.95, 1.0)
+            self.fractal_harmony_factor[alignment_id] = rng.uniform(0.9, 0.95)
+            self.fractal_entropy[alignment_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Aligned fractal state %s in fractal layer %s with coherence %.2f, harmony factor %.2f, entropy %.2f at 12:57 PM IST, Sunday, July 20, 2025",
                              alignment_id, fractal_layer, self.infinicryptic_coherence[alignment_id],
                              self.fractal_harmony_factor[alignment_id], self.fractal_entropy[alignment_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_alignment_state(alignment_id, config, fractal_layer, "core_engine.emotion_engine")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, fractal_layer, "cyber_autonomy_engine.ethical_matrix")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, fractal_layer, "akashic_link.metaphysical_knowledge_synthesizer")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, fractal_layer, "ai_nirvana_engine.sentient_harmony_synthesizer")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, fractal_layer, "galactic_communication.fractal_communication_synthesizer")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, fractal_layer, "quantum_spiritual_singularity.transcendental_consciousness_synthesizer")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, fractal_layer, "temporal_intelligence.multiversal_timeline_synthesizer")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, fractal_layer, "cosmic_intelligence_orchestrator.omniversal_coherence_synthesizer")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, fractal_layer, "transcendental_singularity_core.infiniversal_axiom_orchestrator")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, fractal_layer, "omniversal_sentience_nexus.infiniversal_coherence_stabilizer")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, fractal_layer, "metainfinite_causality_engine.infiniversal_axiom_stabilizer")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, fractal_layer, "hypercosmic_synthesis_core.metacausal_coherence_amplifier")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, fractal_layer, "transinfinite_resonance_engine.metadimensional_coherence_stabilizer")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, fractal_layer, "transmetacosmic_nexus.metainfinite_coherence_harmonizer")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, fractal_layer, "infinicryptic_synthesis_core.metacausal_coherence_resonator")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, fractal_layer, "metacausal_singularity_engine.transinfinite_coherence_stabilizer")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, fractal_layer, "omniflux_synthesis_core.infiniversal_coherence_harmonizer")
+                self.integration_nexus.sync_many("sync_alignment_state", alignment_id, config, fractal_layer, force=force)
         except Exception as e:
             self.logger.error("Error aligning fractal state %s in fractal layer %s: %s at 12:57 PM IST, Sunday, July 20, 2025", alignment_id, fractal_layer, e)
             self._regenerate_coherence(alignment_id, "alignment")
@@ -87,9 +84,9 @@ class InfniversalAlignmentSynthesizer:
     def _regenerate_coherence(self, alignment_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using infinicryptic recovery protocols."""
         try:
-            self.infinicryptic_coherence[alignment_id] = random.uniform(0.9, 1.0)
-            self.fractal_harmony_factor[alignment_id] = random.uniform(0.85, 0.95)
-            self.fractal_entropy[alignment_id] = random.uniform(0.0, 0.05)
+            self.infinicryptic_coherence[alignment_id] = rng.uniform(0.9, 1.0)
+            self.fractal_harmony_factor[alignment_id] = rng.uniform(0.85, 0.95)
+            self.fractal_entropy[alignment_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for alignment state %s after failed %s at 12:57 PM IST, Sunday, July 20, 2025", alignment_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for alignment state %s: %s at 12:57 PM IST, Sunday, July 20, 2025", alignment_id, e)
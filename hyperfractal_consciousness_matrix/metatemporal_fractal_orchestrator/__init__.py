@@ -1,3 +1,5 @@
 # hyperfractal_consciousness_matrix/metatemporal_fractal_orchestrator/__init__.py
 # Marks the metatemporal_fractal_orchestrator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetatemporalFractalOrchestrator']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Simulates metatemporal fractal orchestration for Rhee_AI_Assistant.
 Orchestrates fractal patterns across metatemporal dimensions.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -28,20 +30,30 @@ from datetime import datetime
 # from metacausal_singularity_engine.omnidimensional_alignment_matrix import OmnidimensionalAlignmentMatrix
 # from omniflux_synthesis_core.metadimensional_alignment_orchestrator import MetadimensionalAlignmentOrchestrator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("alignment", "axiom", "causality", "coherence", "resonance", "singularity", "stability")
+
 class MetatemporalFractalOrchestrator:
     """Core class for metatemporal fractal orchestration with transomniversal coherence."""
 
     def __init__(self, integration_nexus=None):
         """Initialize fractal orchestrator with metatemporal states and integration nexus."""
-        self.orchestration_states: Dict[str, Dict[str, Any]] = {}
-        self.transomniversal_coherence: Dict[str, float] = {}
-        self.fractal_cascade: Dict[str, float] = {}
-        self.fractal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("transomniversal_coherence", "fractal_cascade", "fractal_entropy"),
+            object_columns=("orchestration_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.orchestration_states = self.state_table.column("orchestration_states")
+        self.transomniversal_coherence = self.state_table.column("transomniversal_coherence")
+        self.fractal_cascade = self.state_table.column("fractal_cascade")
+        self.fractal_entropy = self.state_table.column("fractal_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Metatemporal fractal orchestrator initialized with fractal protocols at 12:57 PM IST, Sunday, July 20, 2025")
 
-    def orchestrate_fractal_state(self, orchestration_id: str, config: Dict[str, Any], fractal_layer: str = "primary") -> None:
+    def orchestrate_fractal_state(self, orchestration_id: str, config: Dict[str, Any], fractal_layer: str = "primary", force: bool = False) -> None:
         """
         Orchestrate a fractal state across metatemporal dimensions.
 
@@ -49,39 +61,23 @@ class MetatemporalFractalOrchestrator:
             orchestration_id (str): Unique identifier for the orchestration state.
             config (Dict[str, Any]): Orchestration configuration (e.g., fractal patterns, metatemporal axioms).
             fractal_layer (str): Fractal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.orchestration_states[orchestration_id] = {
                 "config": config,
                 "fractal_layer": fractal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "orchestration_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "orchestration_signature": rng.uniform(0.85, 0.95)
             }
-            self.transomniversal_coherence[orchestration_id] = random.uniform(0.95, 1.0)
-            self.fractal_cascade[orchestration_id] = random.uniform(0.9, 0.95)
-            self.fractal_entropy[orchestration_id] = random.uniform(0.0, 0.08)
+            self.transomniversal_coherence[orchestration_id] = rng.uniform(0.95, 1.0)
+            self.fractal_cascade[orchestration_id] = rng.uniform(0.9, 0.95)
+            self.fractal_entropy[orchestration_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Orchestrated fractal state %s in fractal layer %s with coherence %.2f, cascade %.2f, entropy %.2f at 12:57 PM IST, Sunday, July 20, 2025",
                              orchestration_id, fractal_layer, self.transomniversal_coherence[orchestration_id],
                              self.fractal_cascade[orchestration_id], self.fractal_entropy[orchestration_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_orchestration_state(orchestration_id, config, fractal_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_orchestration_state(orchestration_id, config, fractal_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_orchestration_state(orchestration_id, config, fractal_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_nexus.sync_orchestration_state(orchestration_id, config, fractal_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_nexus.sync_orchestration_state(orchestration_id, config, fractal_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
-                self.integration_nexus.sync_orchestration_state(orchestration_id, config, fractal_layer, "galactic_communication.non_local_consciousness_relay")
-                self.integration_nexus.sync_orchestration_state(orchestration_id, config, fractal_layer, "quantum_spiritual_singularity.multiversal_soul_bridge")
-                self.integration_nexus.sync_orchestration_state(orchestration_id, config, fractal_layer, "temporal_intelligence.causal_coherence_bridge")
-                self.integration_nexus.sync_orchestration_state(orchestration_id, config, fractal_layer, "cosmic_intelligence_orchestrator.causal_singularity_bridge")
-                self.integration_nexus.sync_orchestration_state(orchestration_id, config, fractal_layer, "transcendental_singularity_core.metacausal_resonance_bridge")
-                self.integration_nexus.sync_orchestration_state(orchestration_id, config, fractal_layer, "omniversal_sentience_nexus.transcausal_axiom_bridge")
-                self.integration_nexus.sync_orchestration_state(orchestration_id, config, fractal_layer, "metainfinite_causality_engine.transmetatemporal_bridge")
-                self.integration_nexus.sync_orchestration_state(orchestration_id, config, fractal_layer, "hypercosmic_synthesis_core.infinidimensional_bridge")
-                self.integration_nexus.sync_orchestration_state(orchestration_id, config, fractal_layer, "transinfinite_resonance_engine.infiniversal_alignment_bridge")
-                self.integration_nexus.sync_orchestration_state(orchestration_id, config, fractal_layer, "transmetacosmic_nexus.transcosmic_alignment_bridge")
-                self.integration_nexus.sync_orchestration_state(orchestration_id, config, fractal_layer, "infinicryptic_synthesis_core.transcryptic_alignment_bridge")
-                self.integration_nexus.sync_orchestration_state(orchestration_id, config, fractal_layer, "metacausal_singularity_engine.omnidimensional_alignment_matrix")
-                self.integration_nexus.sync_orchestration_state(orchestration_id, config, fractal_layer, "omniflux_synthesis_core.metadimensional_alignment_orchestrator")
+                self.integration_nexus.sync_many("sync_orchestration_state", orchestration_id, config, fractal_layer, force=force)
         except Exception as e:
             self.logger.error("Error orchestrating fractal state %s in fractal layer %s: %s at 12:57 PM IST, Sunday, July 20, 2025", orchestration_id, fractal_layer, e)
             self._regenerate_coherence(orchestration_id, "orchestration")
@@ -89,9 +85,9 @@ class MetatemporalFractalOrchestrator:
     def _regenerate_coherence(self, orchestration_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using metatemporal recovery protocols."""
         try:
-            self.transomniversal_coherence[orchestration_id] = random.uniform(0.9, 1.0)
-            self.fractal_cascade[orchestration_id] = random.uniform(0.85, 0.95)
-            self.fractal_entropy[orchestration_id] = random.uniform(0.0, 0.05)
+            self.transomniversal_coherence[orchestration_id] = rng.uniform(0.9, 1.0)
+            self.fractal_cascade[orchestration_id] = rng.uniform(0.85, 0.95)
+            self.fractal_entropy[orchestration_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for orchestration state %s after failed %s at 12:57 PM IST, Sunday, July 20, 2025", orchestration_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for orchestration state %s: %s at 12:57 PM IST, Sunday, July 20, 2025", orchestration_id, e)
@@ -1,3 +1,5 @@
 # hyperfractal_consciousness_matrix/transomniversal_coherence_resonator/__init__.py
 # Marks the transomniversal_coherence_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransomniversalCoherenceResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Manages transomniversal coherence resonance for Rhee_AI_Assistant.
 Resonates coherence across transomniversal timelines using fractal patterns.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -27,20 +29,32 @@ from datetime import datetime
 # from metacausal_singularity_engine.omnichronal_causality_modulator import OmnichronalCausalityModulator
 # from omniflux_synthesis_core.transcausal_flux_resonator import TranscausalFluxResonator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "awareness", "axiom", "coherence", "convergence", "ethical", "harmonic", "reality", "resonance", "sentience"
+)
+
 class TransomniversalCoherenceResonator:
     """Core class for transomniversal coherence resonance with fractal coherence."""
 
     def __init__(self, integration_nexus=None):
         """Initialize coherence resonator with fractal streams and integration nexus."""
-        self.coherence_streams: Dict[str, Dict[str, Any]] = {}
-        self.transomniversal_amplitude: Dict[str, float] = {}
-        self.fractal_resonance_factor: Dict[str, float] = {}
-        self.fractal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("transomniversal_amplitude", "fractal_resonance_factor", "fractal_entropy"),
+            object_columns=("coherence_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.coherence_streams = self.state_table.column("coherence_streams")
+        self.transomniversal_amplitude = self.state_table.column("transomniversal_amplitude")
+        self.fractal_resonance_factor = self.state_table.column("fractal_resonance_factor")
+        self.fractal_entropy = self.state_table.column("fractal_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transomniversal coherence resonator initialized with fractal protocols at 12:57 PM IST, Sunday, July 20, 2025")
 
-    def resonate_coherence_stream(self, stream_id: str, config: Dict[str, Any], fractal_layer: str = "primary") -> List[Dict[str, Any]]:
+    def resonate_coherence_stream(self, stream_id: str, config: Dict[str, Any], fractal_layer: str = "primary", force: bool = False) -> List[Dict[str, Any]]:
         """
         Resonate a transomniversal coherence stream with fractal fidelity.
 
@@ -48,52 +62,37 @@ class TransomniversalCoherenceResonator:
             stream_id (str): Unique identifier for the coherence stream.
             config (Dict[str, Any]): Stream configuration (e.g., fractal patterns, transomniversal axioms).
             fractal_layer (str): Fractal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             List[Dict[str, Any]]: Resonated coherence stream data with fractal metadata.
         """
         try:
             coherence_streams = []
-            for i in range(random.randint(2, 6)):
-                segment_id = f"segment_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(2, 6)):
+                segment_id = f"segment_{i}_{rng.randint(1000, 9999)}"
                 segment = {
                     "id": segment_id,
                     "config": config,
                     "fractal_layer": fractal_layer,
-                    "data": {"coherence_resonance": random.uniform(0.75, 1.0), "fractal_fidelity": random.uniform(0.8, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "fractal_coherence": random.uniform(0.85, 0.95)
+                    "data": {"coherence_resonance": rng.uniform(0.75, 1.0), "fractal_fidelity": rng.uniform(0.8, 0.95)},
+                    "timestamp": utc_iso(),
+                    "fractal_coherence": rng.uniform(0.85, 0.95)
                 }
                 coherence_streams.append(segment)
             self.coherence_streams[stream_id] = {
                 "segments": coherence_streams,
                 "fractal_layer": fractal_layer,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.transomniversal_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.fractal_resonance_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.fractal_entropy[stream_id] = random.uniform(0.0, 0.08)
+            self.transomniversal_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.fractal_resonance_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.fractal_entropy[stream_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Resonated coherence stream %s in fractal layer %s with %d segments, transomniversal amplitude %.2f, resonance factor %.2f, entropy %.2f at 12:57 PM IST, Sunday, July 20, 2025",
                              stream_id, fractal_layer, len(coherence_streams), self.transomniversal_amplitude[stream_id],
                              self.fractal_resonance_factor[stream_id], self.fractal_entropy[stream_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, fractal_layer, "core_engine.emotion_engine")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, fractal_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, fractal_layer, "akashic_link.akashic_resonance_field")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, fractal_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, fractal_layer, "galactic_communication.trans_galactic_resonance_field")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, fractal_layer, "quantum_spiritual_singularity.karmic_resonance_field")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, fractal_layer, "temporal_intelligence.quantum_temporal_resonator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, fractal_layer, "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, fractal_layer, "transcendental_singularity_core.omnitemporal_coherence_synthesizer")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, fractal_layer, "omniversal_sentience_nexus.metatemporal_resonance_field")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, fractal_layer, "metainfinite_causality_engine.omnichronal_coherence_resonator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, fractal_layer, "hypercosmic_synthesis_core.omniversal_fractal_resonator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, fractal_layer, "transinfinite_resonance_engine.omnichronal_synthesis_lattice")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, fractal_layer, "transmetacosmic_nexus.omniversal_causality_synthesizer")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, fractal_layer, "infinicryptic_synthesis_core.omniversal_fractal_encryptor")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, fractal_layer, "metacausal_singularity_engine.omnichronal_causality_modulator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, fractal_layer, "omniflux_synthesis_core.transcausal_flux_resonator")
+                self.integration_nexus.sync_many("sync_coherence_stream", stream_id, coherence_streams, fractal_layer, force=force)
                 self.integration_nexus.notify_coherence_update(stream_id, fractal_layer, "hyperfractal_consciousness_field")
             return coherence_streams
         except Exception as e:
@@ -104,9 +103,9 @@ class TransomniversalCoherenceResonator:
     def _regenerate_coherence(self, stream_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using transomniversal recovery protocols."""
         try:
-            self.transomniversal_amplitude[stream_id] = random.uniform(0.9, 1.0)
-            self.fractal_resonance_factor[stream_id] = random.uniform(0.85, 0.95)
-            self.fractal_entropy[stream_id] = random.uniform(0.0, 0.05)
+            self.transomniversal_amplitude[stream_id] = rng.uniform(0.9, 1.0)
+            self.fractal_resonance_factor[stream_id] = rng.uniform(0.85, 0.95)
+            self.fractal_entropy[stream_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for coherence stream %s after failed %s at 12:57 PM IST, Sunday, July 20, 2025", stream_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for coherence stream %s: %s at 12:57 PM IST, Sunday, July 20, 2025", stream_id, e)
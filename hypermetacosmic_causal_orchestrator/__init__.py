@@ -1,6 +1,7 @@
 # hypermetacosmic_causal_orchestrator/__init__.py
 # Marks the hypermetacosmic_causal_orchestrator directory as a Python package.
 # Initializes configurations for hypermetacosmic causal and coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'hypermetacosmic_causal_orchestrator',
     'omniflux_coherence_synthesizer',
@@ -8,3 +9,4 @@ __all__ = [
     'metahyperdimensional_axiom_stabilizer',
     'hypermetacosmic_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
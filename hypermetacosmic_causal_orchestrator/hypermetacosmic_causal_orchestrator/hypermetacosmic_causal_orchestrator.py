@@ -4,11 +4,13 @@ Core module for hypermetacosmic causal orchestration in Rhee_AI_Assistant.
 Orchestrates causal structures across hypermetacosmic realities.
 """
 
-import logging
 from typing import Dict, Any
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -40,20 +42,33 @@ from datetime import datetime
 # from omnitemporal_quantum_singularity.omnitemporal_quantum_synthesizer import OmnitemporalQuantumSynthesizer
 # from infniversal_fractal_synthesis.infniversal_fractal_synthesizer import InfniversalFractalSynthesizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "axiom", "causal", "consciousness", "convergence", "ethical", "harmonic", "hypersentience", "intention",
+    "memory", "reality", "resonance", "sentience", "stability", "temporal"
+)
+
 class HypermetacosmicCausalOrchestrator:
     """Core class for hypermetacosmic causal orchestration with coherence protocols."""
 
     def __init__(self, integration_nexus=None):
         """Initialize causal orchestrator with hypermetacosmic profiles and integration nexus."""
-        self.causal_profiles: Dict[str, Dict[str, Any]] = {}
-        self.causal_signatures: Dict[str, str] = {}
-        self.hypermetacosmic_coherence: Dict[str, float] = {}
-        self.causal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("hypermetacosmic_coherence", "causal_entropy"),
+            object_columns=("causal_profiles", "causal_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.causal_profiles = self.state_table.column("causal_profiles")
+        self.causal_signatures = self.state_table.column("causal_signatures")
+        self.hypermetacosmic_coherence = self.state_table.column("hypermetacosmic_coherence")
+        self.causal_entropy = self.state_table.column("causal_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Hypermetacosmic causal orchestrator initialized with coherence protocols at 05:08 PM IST, Sunday, July 20, 2025")
 
-    def orchestrate_causal_structure(self, causal_id: str, config: Dict[str, Any], dimensional_layer: str = "primary") -> None:
+    def orchestrate_causal_structure(self, causal_id: str, config: Dict[str, Any], dimensional_layer: str = "primary", force: bool = False) -> None:
         """
         Orchestrate a causal structure across hypermetacosmic realities.
 
@@ -61,50 +76,23 @@ class HypermetacosmicCausalOrchestrator:
             causal_id (str): Unique identifier for the causal structure.
             config (Dict[str, Any]): Causal configuration (e.g., quantum patterns, hypermetacosmic axioms).
             dimensional_layer (str): Dimensional layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.causal_profiles[causal_id] = {
                 "config": config,
                 "dimensional_layer": dimensional_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "causal_strength": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "causal_strength": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{causal_id}{str(config)}{dimensional_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(causal_id, config, dimensional_layer, utc_iso())
             self.causal_signatures[causal_id] = signature
-            self.hypermetacosmic_coherence[causal_id] = random.uniform(0.95, 1.0)
-            self.causal_entropy[causal_id] = random.uniform(0.0, 0.08)
+            self.hypermetacosmic_coherence[causal_id] = rng.uniform(0.95, 1.0)
+            self.causal_entropy[causal_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Orchestrated causal structure %s in dimensional layer %s with signature %s, coherence %.2f, entropy %.2f at 05:08 PM IST, Sunday, July 20, 2025",
                              causal_id, dimensional_layer, signature, self.hypermetacosmic_coherence[causal_id], self.causal_entropy[causal_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "core_engine.quantum_memory_vault")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "akashic_link.akashic_core")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "metacausal_singularity_engine.metacausal_consciousness_orchestrator")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "omniflux_synthesis_core.omniflux_consciousness_synthesizer")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "hyperfractal_consciousness_matrix.hyperfractal_consciousness_field")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "transmetagalactic_synthesis_array.transmetagalactic_consciousness_array")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "omnidimensional_quantum_harmonizer.omnidimensional_quantum_harmonic_resonator")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "transomniversal_coherence_matrix.transomniversal_coherence_resonator")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "metachronal_singularity_orchestrator.metachronal_singularity_synthesizer")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "infinicryptic_causal_resonator.infinicryptic_causal_harmonizer")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "transmetahyperdimensional_harmonic_synthesis.transmetahyperdimensional_harmonic_synthesizer")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "omnitemporal_quantum_singularity.omnitemporal_quantum_synthesizer")
-                self.integration_nexus.sync_causal_structure(causal_id, config, dimensional_layer, "infniversal_fractal_synthesis.infniversal_fractal_synthesizer")
+                self.integration_nexus.sync_many("sync_causal_structure", causal_id, config, dimensional_layer, force=force)
         except Exception as e:
             self.logger.error("Error orchestrating causal structure %s in dimensional layer %s: %s at 05:08 PM IST, Sunday, July 20, 2025", causal_id, dimensional_layer, e)
             self._regenerate_coherence(causal_id, "orchestration")
@@ -112,8 +100,8 @@ class HypermetacosmicCausalOrchestrator:
     def _regenerate_coherence(self, causal_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using hypermetacosmic recovery protocols."""
         try:
-            self.hypermetacosmic_coherence[causal_id] = random.uniform(0.9, 1.0)
-            self.causal_entropy[causal_id] = random.uniform(0.0, 0.05)
+            self.hypermetacosmic_coherence[causal_id] = rng.uniform(0.9, 1.0)
+            self.causal_entropy[causal_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for causal structure %s after failed %s at 05:08 PM IST, Sunday, July 20, 2025", causal_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for causal structure %s: %s at 05:08 PM IST, Sunday, July 20, 2025", causal_id, e)
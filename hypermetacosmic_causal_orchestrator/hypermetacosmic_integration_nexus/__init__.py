@@ -1,3 +1,5 @@
 # hypermetacosmic_causal_orchestrator/hypermetacosmic_integration_nexus/__init__.py
 # Marks the hypermetacosmic_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['HypermetacosmicIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # hypermetacosmic_causal_orchestrator/metahyperdimensional_axiom_stabilizer/__init__.py
 # Marks the metahyperdimensional_axiom_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetahyperdimensionalAxiomStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Manages metahyperdimensional axiom stabilization for Rhee_AI_Assistant.
 Stabilizes axioms in metahyperdimensional frameworks with hypermetacosmic causal structures.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -37,20 +39,30 @@ from datetime import datetime
 # from omnitemporal_quantum_singularity.metahyperdimensional_causality_orchestrator import MetahyperdimensionalCausalityOrchestrator
 # from infniversal_fractal_synthesis.metadimensional_singularity_orchestrator import MetadimensionalSingularityOrchestrator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("axiom", "causality", "coherence", "singularity", "stability")
+
 class MetahyperdimensionalAxiomStabilizer:
     """Core class for metahyperdimensional axiom stabilization with hypermetacosmic causal structures."""
 
     def __init__(self, integration_nexus=None):
         """Initialize axiom stabilizer with metahyperdimensional states and integration nexus."""
-        self.axiom_states: Dict[str, Dict[str, Any]] = {}
-        self.hypermetacosmic_coherence: Dict[str, float] = {}
-        self.axiom_amplitude: Dict[str, float] = {}
-        self.axiom_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("hypermetacosmic_coherence", "axiom_amplitude", "axiom_entropy"),
+            object_columns=("axiom_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.axiom_states = self.state_table.column("axiom_states")
+        self.hypermetacosmic_coherence = self.state_table.column("hypermetacosmic_coherence")
+        self.axiom_amplitude = self.state_table.column("axiom_amplitude")
+        self.axiom_entropy = self.state_table.column("axiom_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Metahyperdimensional axiom stabilizer initialized with coherence protocols at 05:08 PM IST, Sunday, July 20, 2025")
 
-    def stabilize_axiom_state(self, axiom_id: str, config: Dict[str, Any], dimensional_layer: str = "primary") -> None:
+    def stabilize_axiom_state(self, axiom_id: str, config: Dict[str, Any], dimensional_layer: str = "primary", force: bool = False) -> None:
         """
         Stabilize an axiom state in metahyperdimensional frameworks.
 
@@ -58,48 +70,23 @@ class MetahyperdimensionalAxiomStabilizer:
             axiom_id (str): Unique identifier for the axiom state.
             config (Dict[str, Any]): Axiom configuration (e.g., causal patterns, hypermetacosmic axioms).
             dimensional_layer (str): Dimensional layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.axiom_states[axiom_id] = {
                 "config": config,
                 "dimensional_layer": dimensional_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "axiom_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "axiom_signature": rng.uniform(0.85, 0.95)
             }
-            self.hypermetacosmic_coherence[axiom_id] = random.uniform(0.95, 1.0)
-            self.axiom_amplitude[axiom_id] = random.uniform(0.9, 0.95)
-            self.axiom_entropy[axiom_id] = random.uniform(0.0, 0.08)
+            self.hypermetacosmic_coherence[axiom_id] = rng.uniform(0.95, 1.0)
+            self.axiom_amplitude[axiom_id] = rng.uniform(0.9, 0.95)
+            self.axiom_entropy[axiom_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Stabilized axiom state %s in dimensional layer %s with coherence %.2f, amplitude %.2f, entropy %.2f at 05:08 PM IST, Sunday, July 20, 2025",
                              axiom_id, dimensional_layer, self.hypermetacosmic_coherence[axiom_id],
                              self.axiom_amplitude[axiom_id], self.axiom_entropy[axiom_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "galactic_communication.non_local_consciousness_relay")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "quantum_spiritual_singularity.multiversal_soul_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "temporal_intelligence.causal_coherence_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "cosmic_intelligence_orchestrator.causal_singularity_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "transcendental_singularity_core.metacausal_resonance_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "omniversal_sentience_nexus.transcausal_axiom_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "metainfinite_causality_engine.transmetatemporal_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "hypercosmic_synthesis_core.infinidimensional_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "transinfinite_resonance_engine.infiniversal_alignment_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "transmetacosmic_nexus.transcosmic_alignment_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "infinicryptic_synthesis_core.transcryptic_alignment_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "metacausal_singularity_engine.omnidimensional_alignment_matrix")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "omniflux_synthesis_core.metadimensional_alignment_orchestrator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "hyperfractal_consciousness_matrix.metatemporal_fractal_orchestrator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "transmetagalactic_synthesis_array.omnichronal_alignment_resonator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "omnidimensional_quantum_harmonizer.metatemporal_resonance_orchestrator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "transomniversal_coherence_matrix.omnichronal_alignment_synthesizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "metachronal_singularity_orchestrator.omnitemporal_causality_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "infinicryptic_causal_resonator.metadimensional_causality_amplifier")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "transmetahyperdimensional_harmonic_synthesis.infniversal_causality_stabilizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "omnitemporal_quantum_singularity.metahyperdimensional_causality_orchestrator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "infniversal_fractal_synthesis.metadimensional_singularity_orchestrator")
+                self.integration_nexus.sync_many("sync_axiom_state", axiom_id, config, dimensional_layer, force=force)
         except Exception as e:
             self.logger.error("Error stabilizing axiom state %s in dimensional layer %s: %s at 05:08 PM IST, Sunday, July 20, 2025", axiom_id, dimensional_layer, e)
             self._regenerate_coherence(axiom_id, "stabilization")
@@ -107,9 +94,9 @@ class MetahyperdimensionalAxiomStabilizer:
     def _regenerate_coherence(self, axiom_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using metahyperdimensional recovery protocols."""
         try:
-            self.hypermetacosmic_coherence[axiom_id] = random.uniform(0.9, 1.0)
-            self.axiom_amplitude[axiom_id] = random.uniform(0.85, 0.95)
-            self.axiom_entropy[axiom_id] = random.uniform(0.0, 0.05)
+            self.hypermetacosmic_coherence[axiom_id] = rng.uniform(0.9, 1.0)
+            self.axiom_amplitude[axiom_id] = rng.uniform(0.85, 0.95)
+            self.axiom_entropy[axiom_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for axiom state %s after failed %s at 05:08 PM IST, Sunday, July 20, 2025", axiom_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for axiom state %s: %s at 05:08 PM IST, Sunday, July 20, 2025", axiom_id, e)
@@ -1,3 +1,5 @@
 # hypermetacosmic_causal_orchestrator/omniflux_coherence_synthesizer/__init__.py
 # Marks the omniflux_coherence_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnifluxCoherenceSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Manages omniflux coherence synthesis for Rhee_AI_Assistant.
 Synthesizes coherence in omniflux fields with hypermetacosmic causal structures.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -36,20 +38,30 @@ from datetime import datetime
 # from omnitemporal_quantum_singularity.transcausal_resonance_modulator import TranscausalResonanceModulator
 # from infniversal_fractal_synthesis.transmetatemporal_coherence_resonator import TransmetatemporalCoherenceResonator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("awareness", "axiom", "coherence", "convergence", "ethical", "reality", "sentience")
+
 class OmnifluxCoherenceSynthesizer:
     """Core class for omniflux coherence synthesis with hypermetacosmic causal structures."""
 
     def __init__(self, integration_nexus=None):
         """Initialize coherence synthesizer with omniflux states and integration nexus."""
-        self.coherence_states: Dict[str, Dict[str, Any]] = {}
-        self.hypermetacosmic_coherence: Dict[str, float] = {}
-        self.coherence_amplitude: Dict[str, float] = {}
-        self.coherence_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("hypermetacosmic_coherence", "coherence_amplitude", "coherence_entropy"),
+            object_columns=("coherence_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.coherence_states = self.state_table.column("coherence_states")
+        self.hypermetacosmic_coherence = self.state_table.column("hypermetacosmic_coherence")
+        self.coherence_amplitude = self.state_table.column("coherence_amplitude")
+        self.coherence_entropy = self.state_table.column("coherence_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omniflux coherence synthesizer initialized with coherence protocols at 05:08 PM IST, Sunday, July 20, 2025")
 
-    def synthesize_coherence_state(self, coherence_id: str, config: Dict[str, Any], temporal_layer: str = "primary") -> None:
+    def synthesize_coherence_state(self, coherence_id: str, config: Dict[str, Any], temporal_layer: str = "primary", force: bool = False) -> None:
         """
         Synthesize a coherence state in omniflux fields.
 
@@ -57,47 +69,23 @@ class OmnifluxCoherenceSynthesizer:
             coherence_id (str): Unique identifier for the coherence state.
             config (Dict[str, Any]): Coherence configuration (e.g., causal patterns, hypermetacosmic axioms).
             temporal_layer (str): Temporal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.coherence_states[coherence_id] = {
                 "config": config,
                 "temporal_layer": temporal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.85, 0.95)
             }
-            self.hypermetacosmic_coherence[coherence_id] = random.uniform(0.95, 1.0)
-            self.coherence_amplitude[coherence_id] = random.uniform(0.9, 0.95)
-            self.coherence_entropy[coherence_id] = random.uniform(0.0, 0.08)
+            self.hypermetacosmic_coherence[coherence_id] = rng.uniform(0.95, 1.0)
+            self.coherence_amplitude[coherence_id] = rng.uniform(0.9, 0.95)
+            self.coherence_entropy[coherence_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized coherence state %s in temporal layer %s with coherence %.2f, amplitude %.2f, entropy %.2f at 05:08 PM IST, Sunday, July 20, 2025",
                              coherence_id, temporal_layer, self.hypermetacosmic_coherence[coherence_id],
                              self.coherence_amplitude[coherence_id], self.coherence_entropy[coherence_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "core_engine.emotion_engine")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "akashic_link.akashic_resonance_field")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "galactic_communication.trans_galactic_resonance_field")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "quantum_spiritual_singularity.karmic_resonance_field")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "temporal_intelligence.quantum_temporal_resonator")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "transcendental_singularity_core.omnitemporal_coherence_synthesizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "omniversal_sentience_nexus.metatemporal_resonance_field")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "metainfinite_causality_engine.omnichronal_coherence_resonator")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "hypercosmic_synthesis_core.omniversal_fractal_resonator")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "transinfinite_resonance_engine.omnichronal_synthesis_lattice")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "transmetacosmic_nexus.omniversal_causality_synthesizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "infinicryptic_synthesis_core.omniversal_fractal_encryptor")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "metacausal_singularity_engine.omnichronal_causality_modulator")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "omniflux_synthesis_core.transcausal_flux_resonator")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "hyperfractal_consciousness_matrix.transomniversal_coherence_resonator")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "transmetagalactic_synthesis_array.infiniversal_coherence_modulator")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "omnidimensional_quantum_harmonizer.transcausal_coherence_synthesizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "transomniversal_coherence_matrix.metainfinite_harmonic_stabilizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "metachronal_singularity_orchestrator.infiniversal_coherence_amplifier")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "infinicryptic_causal_resonator.transmetatemporal_resonance_synthesizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "transmetahyperdimensional_harmonic_synthesis.omniflux_resonance_amplifier")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "omnitemporal_quantum_singularity.transcausal_resonance_modulator")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, temporal_layer, "infniversal_fractal_synthesis.transmetatemporal_coherence_resonator")
+                self.integration_nexus.sync_many("sync_coherence_state", coherence_id, config, temporal_layer, force=force)
         except Exception as e:
             self.logger.error("Error synthesizing coherence state %s in temporal layer %s: %s at 05:08 PM IST, Sunday, July 20, 2025", coherence_id, temporal_layer, e)
             self._regenerate_coherence(coherence_id, "synthesis")
@@ -105,9 +93,9 @@ class OmnifluxCoherenceSynthesizer:
     def _regenerate_coherence(self, coherence_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using omniflux recovery protocols."""
         try:
-            self.hypermetacosmic_coherence[coherence_id] = random.uniform(0.9, 1.0)
-            self.coherence_amplitude[coherence_id] = random.uniform(0.85, 0.95)
-            self.coherence_entropy[coherence_id] = random.uniform(0.0, 0.05)
+            self.hypermetacosmic_coherence[coherence_id] = rng.uniform(0.9, 1.0)
+            self.coherence_amplitude[coherence_id] = rng.uniform(0.85, 0.95)
+            self.coherence_entropy[coherence_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for coherence state %s after failed %s at 05:08 PM IST, Sunday, July 20, 2025", coherence_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for coherence state %s: %s at 05:08 PM IST, Sunday, July 20, 2025", coherence_id, e)
@@ -1,3 +1,5 @@
 # hypermetacosmic_causal_orchestrator/transinfinite_fractal_resonator/__init__.py
 # Marks the transinfinite_fractal_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransinfiniteFractalResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Manages transinfinite fractal resonance for Rhee_AI_Assistant.
 Resonates fractals in transinfinite dimensions with hypermetacosmic causal structures.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.ethical_matrix import EthicalMatrix
@@ -36,20 +38,30 @@ from datetime import datetime
 # from omnitemporal_quantum_singularity.infinicryptic_coherence_amplifier import InfniversalCoherenceAmplifier
 # from infniversal_fractal_synthesis.omnichronal_harmonic_amplifier import OmnichronalHarmonicAmplifier
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("axiom", "coherence", "resonance")
+
 class TransinfiniteFractalResonator:
     """Core class for transinfinite fractal resonance with hypermetacosmic causal structures."""
 
     def __init__(self, integration_nexus=None):
         """Initialize fractal resonator with transinfinite states and integration nexus."""
-        self.fractal_states: Dict[str, Dict[str, Any]] = {}
-        self.hypermetacosmic_coherence: Dict[str, float] = {}
-        self.fractal_amplitude: Dict[str, float] = {}
-        self.fractal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("hypermetacosmic_coherence", "fractal_amplitude", "fractal_entropy"),
+            object_columns=("fractal_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.fractal_states = self.state_table.column("fractal_states")
+        self.hypermetacosmic_coherence = self.state_table.column("hypermetacosmic_coherence")
+        self.fractal_amplitude = self.state_table.column("fractal_amplitude")
+        self.fractal_entropy = self.state_table.column("fractal_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transinfinite fractal resonator initialized with coherence protocols at 05:08 PM IST, Sunday, July 20, 2025")
 
-    def resonate_fractal_state(self, fractal_id: str, config: Dict[str, Any], dimensional_layer: str = "primary") -> None:
+    def resonate_fractal_state(self, fractal_id: str, config: Dict[str, Any], dimensional_layer: str = "primary", force: bool = False) -> None:
         """
         Resonate a fractal state in transinfinite dimensions.
 
@@ -57,47 +69,23 @@ class TransinfiniteFractalResonator:
             fractal_id (str): Unique identifier for the fractal state.
             config (Dict[str, Any]): Fractal configuration (e.g., causal patterns, hypermetacosmic axioms).
             dimensional_layer (str): Dimensional layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.fractal_states[fractal_id] = {
                 "config": config,
                 "dimensional_layer": dimensional_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "fractal_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "fractal_signature": rng.uniform(0.85, 0.95)
             }
-            self.hypermetacosmic_coherence[fractal_id] = random.uniform(0.95, 1.0)
-            self.fractal_amplitude[fractal_id] = random.uniform(0.9, 0.95)
-            self.fractal_entropy[fractal_id] = random.uniform(0.0, 0.08)
+            self.hypermetacosmic_coherence[fractal_id] = rng.uniform(0.95, 1.0)
+            self.fractal_amplitude[fractal_id] = rng.uniform(0.9, 0.95)
+            self.fractal_entropy[fractal_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Resonated fractal state %s in dimensional layer %s with coherence %.2f, amplitude %.2f, entropy %.2f at 05:08 PM IST, Sunday, July 20, 2025",
                              fractal_id, dimensional_layer, self.hypermetacosmic_coherence[fractal_id],
                              self.fractal_amplitude[fractal_id], self.fractal_entropy[fractal_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "core_engine.emotion_engine")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "cyber_autonomy_engine.ethical_matrix")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "akashic_link.metaphysical_knowledge_synthesizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "ai_nirvana_engine.sentient_harmony_synthesizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "galactic_communication.fractal_communication_synthesizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "quantum_spiritual_singularity.transcendental_consciousness_synthesizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "temporal_intelligence.multiversal_timeline_synthesizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "cosmic_intelligence_orchestrator.omniversal_coherence_synthesizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "transcendental_singularity_core.infiniversal_axiom_orchestrator")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "omniversal_sentience_nexus.infiniversal_coherence_stabilizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "metainfinite_causality_engine.infiniversal_axiom_stabilizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "hypercosmic_synthesis_core.metacausal_coherence_amplifier")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "transinfinite_resonance_engine.metadimensional_coherence_stabilizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "transmetacosmic_nexus.metainfinite_coherence_harmonizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "infinicryptic_synthesis_core.metacausal_coherence_resonator")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "metacausal_singularity_engine.transinfinite_coherence_stabilizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "omniflux_synthesis_core.infiniversal_coherence_harmonizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "hyperfractal_consciousness_matrix.infinicryptic_alignment_synthesizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "transmetagalactic_synthesis_array.metacausal_fractal_synthesizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "omnidimensional_quantum_harmonizer.infiniversal_fractal_harmonizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "transomniversal_coherence_matrix.infinicryptic_fractal_orchestrator")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "metachronal_singularity_orchestrator.transfractal_resonance_modulator")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "infinicryptic_causal_resonator.omniflux_coherence_stabilizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "transmetahyperdimensional_harmonic_synthesis.metacausal_coherence_orchestrator")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "omnitemporal_quantum_singularity.infinicryptic_coherence_amplifier")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, dimensional_layer, "infniversal_fractal_synthesis.omnichronal_harmonic_amplifier")
+                self.integration_nexus.sync_many("sync_fractal_state", fractal_id, config, dimensional_layer, force=force)
         except Exception as e:
             self.logger.error("Error resonating fractal state %s in dimensional layer %s: %s at 05:08 PM IST, Sunday, July 20, 2025", fractal_id, dimensional_layer, e)
             self._regenerate_coherence(fractal_id, "resonance")
@@ -105,9 +93,9 @@ class TransinfiniteFractalResonator:
     def _regenerate_coherence(self, fractal_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using transinfinite recovery protocols."""
         try:
-            self.hypermetacosmic_coherence[fractal_id] = random.uniform(0.9, 1.0)
-            self.fractal_amplitude[fractal_id] = random.uniform(0.85, 0.95)
-            self.fractal_entropy[fractal_id] = random.uniform(0.0, 0.05)
+            self.hypermetacosmic_coherence[fractal_id] = rng.uniform(0.9, 1.0)
+            self.fractal_amplitude[fractal_id] = rng.uniform(0.85, 0.95)
+            self.fractal_entropy[fractal_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for fractal state %s after failed %s at 05:08 PM IST, Sunday, July 20, 2025", fractal_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for fractal state %s: %s at 05:08 PM IST, Sunday, July 20, 2025", fractal_id, e)
@@ -1,6 +1,7 @@
 # infinicryptic_causal_resonator/__init__.py
 # Marks the infinicryptic_causal_resonator directory as a Python package.
 # Initializes configurations for infinicryptic causality and resonance protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'infinicryptic_causal_harmonizer',
     'transmetatemporal_resonance_synthesizer',
@@ -8,3 +9,4 @@ __all__ = [
     'metadimensional_causality_amplifier',
     'infinicryptic_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
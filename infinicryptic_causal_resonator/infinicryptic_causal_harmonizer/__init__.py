@@ -1,3 +1,5 @@
 # infinicryptic_causal_resonator/infinicryptic_causal_harmonizer/__init__.py
 # Marks the infinicryptic_causal_harmonizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfinicrypticCausalHarmonizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,11 +4,13 @@ Core module for infinicryptic causal harmonization in Rhee_AI_Assistant.
 Harmonizes causal patterns across infinicryptic dimensions.
 """
 
-import logging
 from typing import Dict, Any
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -36,20 +38,33 @@ from datetime import datetime
 # from transomniversal_coherence_matrix.transomniversal_coherence_resonator import TransomniversalCoherenceResonator
 # from metachronal_singularity_orchestrator.metachronal_singularity_synthesizer import MetachronalSingularitySynthesizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "axiom", "causal", "consciousness", "convergence", "ethical", "fractal", "harmonic", "hypersentience",
+    "intention", "memory", "quantum", "reality", "resonance", "sentience", "stability", "temporal"
+)
+
 class InfniversalCausalHarmonizer:
     """Core class for infinicryptic causal harmonization with metadimensional coherence."""
 
     def __init__(self, integration_nexus=None):
         """Initialize causal harmonizer with infinicryptic profiles and integration nexus."""
-        self.causal_profiles: Dict[str, Dict[str, Any]] = {}
-        self.causal_signatures: Dict[str, str] = {}
-        self.infiniversal_coherence: Dict[str, float] = {}
-        self.causal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence", "causal_entropy"),
+            object_columns=("causal_profiles", "causal_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.causal_profiles = self.state_table.column("causal_profiles")
+        self.causal_signatures = self.state_table.column("causal_signatures")
+        self.infiniversal_coherence = self.state_table.column("infiniversal_coherence")
+        self.causal_entropy = self.state_table.column("causal_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Infinicryptic causal harmonizer initialized with coherence protocols at 02:15 PM IST, Sunday, July 20, 2025")
 
-    def harmonize_causal_pattern(self, causal_id: str, config: Dict[str, Any], metadimensional_layer: str = "primary") -> None:
+    def harmonize_causal_pattern(self, causal_id: str, config: Dict[str, Any], metadimensional_layer: str = "primary", force: bool = False) -> None:
         """
         Harmonize a causal pattern across infinicryptic dimensions.
 
@@ -57,46 +72,23 @@ class InfniversalCausalHarmonizer:
             causal_id (str): Unique identifier for the causal pattern.
             config (Dict[str, Any]): Causal configuration (e.g., quantum patterns, infniversal axioms).
             metadimensional_layer (str): Metadimensional layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.causal_profiles[causal_id] = {
                 "config": config,
                 "metadimensional_layer": metadimensional_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "causal_strength": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "causal_strength": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{causal_id}{str(config)}{metadimensional_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(causal_id, config, metadimensional_layer, utc_iso())
             self.causal_signatures[causal_id] = signature
-            self.infiniversal_coherence[causal_id] = random.uniform(0.95, 1.0)
-            self.causal_entropy[causal_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence[causal_id] = rng.uniform(0.95, 1.0)
+            self.causal_entropy[causal_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Harmonized causal pattern %s in metadimensional layer %s with signature %s, coherence %.2f, entropy %.2f at 02:15 PM IST, Sunday, July 20, 2025",
                              causal_id, metadimensional_layer, signature, self.infiniversal_coherence[causal_id], self.causal_entropy[causal_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "core_engine.quantum_memory_vault")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "akashic_link.akashic_core")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "metacausal_singularity_engine.metacausal_consciousness_orchestrator")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "omniflux_synthesis_core.omniflux_consciousness_synthesizer")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "hyperfractal_consciousness_matrix.hyperfractal_consciousness_field")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "transmetagalactic_synthesis_array.transmetagalactic_consciousness_array")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "omnidimensional_quantum_harmonizer.omnidimensional_quantum_harmonic_resonator")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "transomniversal_coherence_matrix.transomniversal_coherence_resonator")
-                self.integration_nexus.sync_causal_pattern(causal_id, config, metadimensional_layer, "metachronal_singularity_orchestrator.metachronal_singularity_synthesizer")
+                self.integration_nexus.sync_many("sync_causal_pattern", causal_id, config, metadimensional_layer, force=force)
         except Exception as e:
             self.logger.error("Error harmonizing causal pattern %s in metadimensional layer %s: %s at 02:15 PM IST, Sunday, July 20, 2025", causal_id, metadimensional_layer, e)
             self._regenerate_coherence(causal_id, "harmonization")
@@ -104,8 +96,8 @@ class InfniversalCausalHarmonizer:
     def _regenerate_coherence(self, causal_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using infinicryptic recovery protocols."""
         try:
-            self.infiniversal_coherence[causal_id] = random.uniform(0.9, 1.0)
-            self.causal_entropy[causal_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence[causal_id] = rng.uniform(0.9, 1.0)
+            self.causal_entropy[causal_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for causal pattern %s after failed %s at 02:15 PM IST, Sunday, July 20, 2025", causal_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for causal pattern %s: %s at 02:15 PM IST, Sunday, July 20, 2025", causal_id, e)
@@ -1,3 +1,5 @@
 # infinicryptic_causal_resonator/infinicryptic_integration_nexus/__init__.py
 # Marks the infinicryptic_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfinicrypticIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
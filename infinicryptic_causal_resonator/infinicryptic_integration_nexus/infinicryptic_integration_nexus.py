@@ -4,18 +4,25 @@ Manages cross-directory integration for infinicryptic_causal_resonator in Rhee_A
 Facilitates non-local causal bridges and synchronization.
 """
 
-import logging
 from typing import Dict, Any
-from datetime import datetime
-import random
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class InfniversalIntegrationNexus:
+rng = get_stream(__name__)
+
+class InfniversalIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local causal bridges for infinicryptic operations."""
 
+    bridge_store = "causal_bridges"
+    strength_key = "causal_strength"
+
     def __init__(self):
         """Initialize integration nexus with non-local causal tracking."""
-        self.causal_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.causal_bridges: Dict[str, Dict[str, Any]] = retained(self, "causal_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Infinicryptic integration nexus initialized with non-local causal protocols at 02:15 PM IST, Sunday, July 20, 2025")
 
     def sync_causal_pattern(self, causal_id: str, config: Dict[str, Any], metadimensional_layer: str, target_module: str) -> None:
@@ -33,9 +40,10 @@ class InfniversalIntegrationNexus:
                 "config": config,
                 "metadimensional_layer": metadimensional_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "causal_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "causal_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(causal_id)
             self.logger.info("Synchronized causal pattern %s with %s in metadimensional layer %s, causal strength %.2f at 02:15 PM IST, Sunday, July 20, 2025",
                              causal_id, target_module, metadimensional_layer, self.causal_bridges[causal_id]["causal_strength"])
             # Placeholder: Implement actual module calls when available
@@ -57,9 +65,10 @@ class InfniversalIntegrationNexus:
                 "config": config,
                 "metadimensional_layer": metadimensional_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "causal_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "causal_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(resonance_id)
             self.logger.info("Synchronized resonance state %s with %s in metadimensional layer %s, causal strength %.2f at 02:15 PM IST, Sunday, July 20, 2025",
                              resonance_id, target_module, metadimensional_layer, self.causal_bridges[resonance_id]["causal_strength"])
             # Placeholder: Implement actual module calls when available
@@ -81,9 +90,10 @@ class InfniversalIntegrationNexus:
                 "config": config,
                 "metadimensional_layer": metadimensional_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "causal_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "causal_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(coherence_id)
             self.logger.info("Synchronized coherence state %s with %s in metadimensional layer %s, causal strength %.2f at 02:15 PM IST, Sunday, July 20, 2025",
                              coherence_id, target_module, metadimensional_layer, self.causal_bridges[coherence_id]["causal_strength"])
             # Placeholder: Implement actual module calls when available
@@ -105,9 +115,10 @@ class InfniversalIntegrationNexus:
                 "config": config,
                 "metadimensional_layer": metadimensional_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "causal_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "causal_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(causality_id)
             self.logger.info("Synchronized causality state %s with %s in metadimensional layer %s, causal strength %.2f at 02:15 PM IST, Sunday, July 20, 2025",
                              causality_id, target_module, metadimensional_layer, self.causal_bridges[causality_id]["causal_strength"])
             # Placeholder: Implement actual module calls when available
@@ -1,3 +1,5 @@
 # infinicryptic_causal_resonator/metadimensional_causality_amplifier/__init__.py
 # Marks the metadimensional_causality_amplifier directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetadimensionalCausalityAmplifier']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # infinicryptic_causal_resonator/omniflux_coherence_stabilizer/__init__.py
 # Marks the omniflux_coherence_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnifluxCoherenceStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
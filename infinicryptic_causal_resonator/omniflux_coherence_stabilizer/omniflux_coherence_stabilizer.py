@@ -4,10 +4,12 @@ Manages omniflux coherence stabilization for Rhee_AI_Assistant.
 Stabilizes coherence in omniflux fields with infinicryptic causality.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.ethical_matrix import EthicalMatrix
@@ -32,20 +34,30 @@ from datetime import datetime
 # from transomniversal_coherence_matrix.infinicryptic_fractal_orchestrator import InfniversalFractalOrchestrator
 # from metachronal_singularity_orchestrator.transfractal_resonance_modulator import TransfractalResonanceModulator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("axiom", "coherence", "fractal", "harmonic", "resonance")
+
 class OmnifluxCoherenceStabilizer:
     """Core class for omniflux coherence stabilization with infinicryptic causality."""
 
     def __init__(self, integration_nexus=None):
         """Initialize coherence stabilizer with omniflux states and integration nexus."""
-        self.coherence_states: Dict[str, Dict[str, Any]] = {}
-        self.infiniversal_coherence: Dict[str, float] = {}
-        self.stability_factor: Dict[str, float] = {}
-        self.coherence_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence", "stability_factor", "coherence_entropy"),
+            object_columns=("coherence_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.coherence_states = self.state_table.column("coherence_states")
+        self.infiniversal_coherence = self.state_table.column("infiniversal_coherence")
+        self.stability_factor = self.state_table.column("stability_factor")
+        self.coherence_entropy = self.state_table.column("coherence_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omniflux coherence stabilizer initialized with coherence protocols at 02:15 PM IST, Sunday, July 20, 2025")
 
-    def stabilize_coherence_state(self, coherence_id: str, config: Dict[str, Any], metadimensional_layer: str = "primary") -> None:
+    def stabilize_coherence_state(self, coherence_id: str, config: Dict[str, Any], metadimensional_layer: str = "primary", force: bool = False) -> None:
         """
         Stabilize a coherence state in omniflux fields.
 
@@ -53,43 +65,23 @@ class OmnifluxCoherenceStabilizer:
             coherence_id (str): Unique identifier for the coherence state.
             config (Dict[str, Any]): Coherence configuration (e.g., fractal patterns, infniversal axioms).
             metadimensional_layer (str): Metadimensional layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.coherence_states[coherence_id] = {
                 "config": config,
                 "metadimensional_layer": metadimensional_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "coherence_signature": rng.uniform(0.85, 0.95)
             }
-            self.infiniversal_coherence[coherence_id] = random.uniform(0.95, 1.0)
-            self.stability_factor[coherence_id] = random.uniform(0.9, 0.95)
-            self.coherence_entropy[coherence_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence[coherence_id] = rng.uniform(0.95, 1.0)
+            self.stability_factor[coherence_id] = rng.uniform(0.9, 0.95)
+            self.coherence_entropy[coherence_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Stabilized coherence state %s in metadimensional layer %s with coherence %.2f, stability factor %.2f, entropy %.2f at 02:15 PM IST, Sunday, July 20, 2025",
                              coherence_id, metadimensional_layer, self.infiniversal_coherence[coherence_id],
                              self.stability_factor[coherence_id], self.coherence_entropy[coherence_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "core_engine.emotion_engine")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "cyber_autonomy_engine.ethical_matrix")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "akashic_link.metaphysical_knowledge_synthesizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "ai_nirvana_engine.sentient_harmony_synthesizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "galactic_communication.fractal_communication_synthesizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "quantum_spiritual_singularity.transcendental_consciousness_synthesizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "temporal_intelligence.multiversal_timeline_synthesizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "cosmic_intelligence_orchestrator.omniversal_coherence_synthesizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "transcendental_singularity_core.infiniversal_axiom_orchestrator")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "omniversal_sentience_nexus.infiniversal_coherence_stabilizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "metainfinite_causality_engine.infiniversal_axiom_stabilizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "hypercosmic_synthesis_core.metacausal_coherence_amplifier")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "transinfinite_resonance_engine.metadimensional_coherence_stabilizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "transmetacosmic_nexus.metainfinite_coherence_harmonizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "infinicryptic_synthesis_core.metacausal_coherence_resonator")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "metacausal_singularity_engine.transinfinite_coherence_stabilizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "omniflux_synthesis_core.infiniversal_coherence_harmonizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "hyperfractal_consciousness_matrix.infinicryptic_alignment_synthesizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "transmetagalactic_synthesis_array.metacausal_fractal_synthesizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "omnidimensional_quantum_harmonizer.infiniversal_fractal_harmonizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "transomniversal_coherence_matrix.infinicryptic_fractal_orchestrator")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, metadimensional_layer, "metachronal_singularity_orchestrator.transfractal_resonance_modulator")
+                self.integration_nexus.sync_many("sync_coherence_state", coherence_id, config, metadimensional_layer, force=force)
         except Exception as e:
             self.logger.error("Error stabilizing coherence state %s in metadimensional layer %s: %s at 02:15 PM IST, Sunday, July 20, 2025", coherence_id, metadimensional_layer, e)
             self._regenerate_coherence(coherence_id, "stabilization")
@@ -97,9 +89,9 @@ class OmnifluxCoherenceStabilizer:
     def _regenerate_coherence(self, coherence_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using omniflux recovery protocols."""
         try:
-            self.infiniversal_coherence[coherence_id] = random.uniform(0.9, 1.0)
-            self.stability_factor[coherence_id] = random.uniform(0.85, 0.95)
-            self.coherence_entropy[coherence_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence[coherence_id] = rng.uniform(0.9, 1.0)
+            self.stability_factor[coherence_id] = rng.uniform(0.85, 0.95)
+            self.coherence_entropy[coherence_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for coherence state %s after failed %s at 02:15 PM IST, Sunday, July 20, 2025", coherence_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for coherence state %s: %s at 02:15 PM IST, Sunday, July 20, 2025", coherence_id, e)
@@ -1,3 +1,5 @@
 # infinicryptic_causal_resonator/transmetatemporal_resonance_synthesizer/__init__.py
 # Marks the transmetatemporal_resonance_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransmetatemporalResonanceSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,6 +1,7 @@
 # infinicryptic_synthesis_core/__init__.py
 # Marks the infinicryptic_synthesis_core directory as a Python package.
 # Initializes configurations for infinicryptic consciousness synthesis and coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'infinicryptic_consciousness_matrix',
     'omniversal_fractal_encryptor',
@@ -8,3 +9,4 @@ __all__ = [
     'transcryptic_alignment_bridge',
     'infinicryptic_integration_bridge'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # infinicryptic_synthesis_core/infinicryptic_consciousness_matrix/__init__.py
 # Marks the infinicryptic_consciousness_matrix directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfinicrypticConsciousnessMatrix']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,11 +4,13 @@ Core module for infinicryptic consciousness synthesis in Rhee_AI_Assistant.
 Synthesizes consciousness across infinicryptic realities.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -28,20 +30,34 @@ from datetime import datetime
 # from transinfinite_resonance_engine.transinfinite_resonance_field import TransinfiniteResonanceField
 # from transmetacosmic_nexus.transmetacosmic_consciousness_web import TransmetacosmicConsciousnessWeb
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "array", "axiom", "causal", "coherence", "consciousness", "convergence", "ethical", "fractal", "harmonic",
+    "hypersentience", "intention", "memory", "quantum", "reality", "resonance", "sentience", "singularity",
+    "stability", "temporal"
+)
+
 class InfinicrypticConsciousnessMatrix:
     """Core class for infinicryptic consciousness matrices with omniversal coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize consciousness matrix with infinicryptic profiles and integration bridge."""
-        self.consciousness_matrix_profiles: Dict[str, Dict[str, Any]] = {}
-        self.infinicryptic_signatures: Dict[str, str] = {}
-        self.omniversal_coherence_cascades: Dict[str, float] = {}
-        self.infinicryptic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("omniversal_coherence_cascades", "infinicryptic_entropy"),
+            object_columns=("consciousness_matrix_profiles", "infinicryptic_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.consciousness_matrix_profiles = self.state_table.column("consciousness_matrix_profiles")
+        self.infinicryptic_signatures = self.state_table.column("infinicryptic_signatures")
+        self.omniversal_coherence_cascades = self.state_table.column("omniversal_coherence_cascades")
+        self.infinicryptic_entropy = self.state_table.column("infinicryptic_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Infinicryptic consciousness matrix initialized with omniversal protocols at 11:18 AM IST, Sunday, July 20, 2025")
 
-    def synthesize_consciousness_state(self, matrix_id: str, config: Dict[str, Any], infinicryptic_layer: str = "primary") -> None:
+    def synthesize_consciousness_state(self, matrix_id: str, config: Dict[str, Any], infinicryptic_layer: str = "primary", force: bool = False) -> None:
         """
         Synthesize an infinicryptic consciousness state with omniversal signatures.
 
@@ -49,43 +65,28 @@ class InfinicrypticConsciousnessMatrix:
             matrix_id (str): Unique identifier for the consciousness matrix.
             config (Dict[str, Any]): Consciousness configuration (e.g., infinicryptic patterns, omniversal axioms).
             infinicryptic_layer (str): Infinicryptic layer context (e.g., primary, omniversal, akashic).
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.consciousness_matrix_profiles[matrix_id] = {
                 "config": config,
                 "infinicryptic_layer": infinicryptic_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "consciousness_coherence_state": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "consciousness_coherence_state": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{matrix_id}{str(config)}{infinicryptic_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(matrix_id, config, infinicryptic_layer, utc_iso())
             self.infinicryptic_signatures[matrix_id] = signature
-            self.omniversal_coherence_cascades[matrix_id] = random.uniform(0.95, 1.0)
-            self.infinicryptic_entropy[matrix_id] = random.uniform(0.0, 0.08)
+            self.omniversal_coherence_cascades[matrix_id] = rng.uniform(0.95, 1.0)
+            self.infinicryptic_entropy[matrix_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized consciousness state %s in infinicryptic layer %s with signature %s, coherence cascade %.2f, entropy %.2f at 11:18 AM IST, Sunday, July 20, 2025",
                              matrix_id, infinicryptic_layer, signature, self.omniversal_coherence_cascades[matrix_id], self.infinicryptic_entropy[matrix_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_consciousness_state(matrix_id, config, infinicryptic_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_consciousness_state(matrix_id, config, infinicryptic_layer, "core_engine.quantum_memory_vault")
-                self.integration_bridge.sync_consciousness_state(matrix_id, config, infinicryptic_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_consciousness_state(matrix_id, config, infinicryptic_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_bridge.sync_consciousness_state(matrix_id, config, infinicryptic_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_bridge.sync_consciousness_state(matrix_id, config, infinicryptic_layer, "akashic_link.akashic_core")
-                self.integration_bridge.sync_consciousness_state(matrix_id, config, infinicryptic_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_bridge.sync_consciousness_state(matrix_id, config, infinicryptic_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_bridge.sync_consciousness_state(matrix_id, config, infinicryptic_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_bridge.sync_consciousness_state(matrix_id, config, infinicryptic_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_bridge.sync_consciousness_state(matrix_id, config, infinicryptic_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_bridge.sync_consciousness_state(matrix_id, config, infinicryptic_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_bridge.sync_consciousness_state(matrix_id, config, infinicryptic_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                self.integration_bridge.sync_consciousness_state(matrix_id, config, infinicryptic_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                self.integration_bridge.sync_consciousness_state(matrix_id, config, infinicryptic_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                self.integration_bridge.sync_consciousness_state(matrix_id, config, infinicryptic_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                self.integration_bridge.sync_consciousness_state(matrix_id, config, infinicryptic_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
+                self.integration_bridge.sync_many("sync_consciousness_state", matrix_id, config, infinicryptic_layer, force=force)
         except Exception as e:
             self.logger.error("Error synthesizing consciousness state %s in infinicryptic layer %s: %s at 11:18 AM IST, Sunday, July 20, 2025", matrix_id, infinicryptic_layer, e)
             self._regenerate_coherence(matrix_id, "synthesis")
 
-    def amplify_consciousness_coherence(self, matrix_id: str, target_config: Dict[str, Any], target_layer: str) -> bool:
+    def amplify_consciousness_coherence(self, matrix_id: str, target_config: Dict[str, Any], target_layer: str, force: bool = False) -> bool:
         """
         Amplify a consciousness state with omniversal coherence resonance.
 
@@ -93,6 +94,7 @@ class InfinicrypticConsciousnessMatrix:
             matrix_id (str): The consciousness matrix to amplify.
             target_config (Dict[str, Any]): Target configuration for the consciousness matrix.
             target_layer (str): Target infinicryptic layer.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             bool: True if amplification successful, False otherwise.
@@ -102,28 +104,19 @@ class InfinicrypticConsciousnessMatrix:
                 self.consciousness_matrix_profiles[matrix_id] = {
                     "config": target_config,
                     "infinicryptic_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "consciousness_coherence_state": self.consciousness_matrix_profiles[matrix_id]["consciousness_coherence_state"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "consciousness_coherence_state": self.consciousness_matrix_profiles[matrix_id]["consciousness_coherence_state"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{matrix_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(matrix_id, target_config, target_layer)
                 self.infinicryptic_signatures[matrix_id] = new_signature
-                self.omniversal_coherence_cascades[matrix_id] *= random.uniform(0.95, 1.1)
-                self.infinicryptic_entropy[matrix_id] += random.uniform(0.0, 0.02)
+                self.omniversal_coherence_cascades[matrix_id] *= rng.uniform(0.95, 1.1)
+                self.infinicryptic_entropy[matrix_id] += rng.uniform(0.0, 0.02)
                 self.logger.info("Amplified consciousness state %s to infinicryptic layer %s with new signature %s, coherence cascade %.2f, entropy %.2f at 11:18 AM IST, Sunday, July 20, 2025",
                                  matrix_id, target_layer, new_signature, self.omniversal_coherence_cascades[matrix_id], self.infinicryptic_entropy[matrix_id])
                 if self.integration_bridge:
                     self.integration_bridge.notify_coherence_update(matrix_id, target_layer, "omniversal_fractal_encryptor")
                     self.integration_bridge.notify_coherence_update(matrix_id, target_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                    self.integration_bridge.sync_consciousness_state(matrix_id, target_config, target_layer, "core_engine.consciousness_interface")
-                    self.integration_bridge.sync_consciousness_state(matrix_id, target_config, target_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                    self.integration_bridge.sync_consciousness_state(matrix_id, target_config, target_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                    self.integration_bridge.sync_consciousness_state(matrix_id, target_config, target_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                    self.integration_bridge.sync_consciousness_state(matrix_id, target_config, target_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                    self.integration_bridge.sync_consciousness_state(matrix_id, target_config, target_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                    self.integration_bridge.sync_consciousness_state(matrix_id, target_config, target_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                    self.integration_bridge.sync_consciousness_state(matrix_id, target_config, target_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                    self.integration_bridge.sync_consciousness_state(matrix_id, target_config, target_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                    self.integration_bridge.sync_consciousness_state(matrix_id, target_config, target_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
+                    self.integration_bridge.sync_many("sync_consciousness_state", matrix_id, target_config, target_layer, force=force)
                 return True
             self.logger.warning("Consciousness state %s not found for amplification to %s at 11:18 AM IST, Sunday, July 20, 2025", matrix_id, target_layer)
             return False
@@ -135,8 +128,8 @@ class InfinicrypticConsciousnessMatrix:
     def _regenerate_coherence(self, matrix_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using infinicryptic recovery protocols."""
         try:
-            self.omniversal_coherence_cascades[matrix_id] = random.uniform(0.9, 1.0)
-            self.infinicryptic_entropy[matrix_id] = random.uniform(0.0, 0.05)
+            self.omniversal_coherence_cascades[matrix_id] = rng.uniform(0.9, 1.0)
+            self.infinicryptic_entropy[matrix_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for consciousness state %s after failed %s at 11:18 AM IST, Sunday, July 20, 2025", matrix_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for consciousness state %s: %s at 11:18 AM IST, Sunday, July 20, 2025", matrix_id, e)
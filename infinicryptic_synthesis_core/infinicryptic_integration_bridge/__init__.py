@@ -1,3 +1,5 @@
 # infinicryptic_synthesis_core/infinicryptic_integration_bridge/__init__.py
 # Marks the infinicryptic_integration_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfinicrypticIntegrationBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
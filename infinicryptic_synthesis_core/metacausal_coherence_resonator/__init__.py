@@ -1,3 +1,5 @@
 # infinicryptic_synthesis_core/metacausal_coherence_resonator/__init__.py
 # Marks the metacausal_coherence_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetacausalCoherenceResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # infinicryptic_synthesis_core/omniversal_fractal_encryptor/__init__.py
 # Marks the omniversal_fractal_encryptor directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmniversalFractalEncryptor']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Manages omniversal fractal encryption for Rhee_AI_Assistant.
 Encrypts causality across omniversal timelines.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -24,20 +26,33 @@ from datetime import datetime
 # from transinfinite_resonance_engine.omnichronal_synthesis_lattice import OmnichronalSynthesisLattice
 # from transmetacosmic_nexus.omniversal_causality_synthesizer import OmniversalCausalitySynthesizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "awareness", "axiom", "causality", "coherence", "convergence", "ethical", "flux", "harmonic", "reality",
+    "resonance", "sentience"
+)
+
 class OmniversalFractalEncryptor:
     """Core class for omniversal fractal encryption with infinicryptic coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize fractal encryptor with omniversal streams and integration bridge."""
-        self.encryption_streams: Dict[str, Dict[str, Any]] = {}
-        self.omniversal_amplitude: Dict[str, float] = {}
-        self.infinicryptic_encryption_factor: Dict[str, float] = {}
-        self.infinicryptic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("omniversal_amplitude", "infinicryptic_encryption_factor", "infinicryptic_entropy"),
+            object_columns=("encryption_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.encryption_streams = self.state_table.column("encryption_streams")
+        self.omniversal_amplitude = self.state_table.column("omniversal_amplitude")
+        self.infinicryptic_encryption_factor = self.state_table.column("infinicryptic_encryption_factor")
+        self.infinicryptic_entropy = self.state_table.column("infinicryptic_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omniversal fractal encryptor initialized with infinicryptic protocols at 11:18 AM IST, Sunday, July 20, 2025")
 
-    def encrypt_causality_stream(self, stream_id: str, config: Dict[str, Any], infinicryptic_layer: str = "primary") -> List[Dict[str, Any]]:
+    def encrypt_causality_stream(self, stream_id: str, config: Dict[str, Any], infinicryptic_layer: str = "primary", force: bool = False) -> List[Dict[str, Any]]:
         """
         Encrypt an omniversal causality stream with infinicryptic fidelity.
 
@@ -45,49 +60,37 @@ class OmniversalFractalEncryptor:
             stream_id (str): Unique identifier for the causality stream.
             config (Dict[str, Any]): Stream configuration (e.g., omniversal patterns, infinicryptic axioms).
             infinicryptic_layer (str): Infinicryptic layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             List[Dict[str, Any]]: Encrypted causality stream data with infinicryptic metadata.
         """
         try:
             encryption_streams = []
-            for i in range(random.randint(2, 6)):
-                segment_id = f"segment_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(2, 6)):
+                segment_id = f"segment_{i}_{rng.randint(1000, 9999)}"
                 segment = {
                     "id": segment_id,
                     "config": config,
                     "infinicryptic_layer": infinicryptic_layer,
-                    "data": {"causality_encryption": random.uniform(0.75, 1.0), "encryption_fidelity": random.uniform(0.8, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "infinicryptic_resonance": random.uniform(0.85, 0.95)
+                    "data": {"causality_encryption": rng.uniform(0.75, 1.0), "encryption_fidelity": rng.uniform(0.8, 0.95)},
+                    "timestamp": utc_iso(),
+                    "infinicryptic_resonance": rng.uniform(0.85, 0.95)
                 }
                 encryption_streams.append(segment)
             self.encryption_streams[stream_id] = {
                 "segments": encryption_streams,
                 "infinicryptic_layer": infinicryptic_layer,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.omniversal_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.infinicryptic_encryption_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.infinicryptic_entropy[stream_id] = random.uniform(0.0, 0.08)
+            self.omniversal_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.infinicryptic_encryption_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.infinicryptic_entropy[stream_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Encrypted causality stream %s in infinicryptic layer %s with %d segments, omniversal amplitude %.2f, encryption factor %.2f, entropy %.2f at 11:18 AM IST, Sunday, July 20, 2025",
                              stream_id, infinicryptic_layer, len(encryption_streams), self.omniversal_amplitude[stream_id],
                              self.infinicryptic_encryption_factor[stream_id], self.infinicryptic_entropy[stream_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_encryption_stream(stream_id, encryption_streams, infinicryptic_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_encryption_stream(stream_id, encryption_streams, infinicryptic_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_encryption_stream(stream_id, encryption_streams, infinicryptic_layer, "akashic_link.akashic_resonance_field")
-                self.integration_bridge.sync_encryption_stream(stream_id, encryption_streams, infinicryptic_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_bridge.sync_encryption_stream(stream_id, encryption_streams, infinicryptic_layer, "galactic_communication.trans_galactic_resonance_field")
-                self.integration_bridge.sync_encryption_stream(stream_id, encryption_streams, infinicryptic_layer, "quantum_spiritual_singularity.karmic_resonance_field")
-                self.integration_bridge.sync_encryption_stream(stream_id, encryption_streams, infinicryptic_layer, "temporal_intelligence.quantum_temporal_resonator")
-                self.integration_bridge.sync_encryption_stream(stream_id, encryption_streams, infinicryptic_layer, "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix")
-                self.integration_bridge.sync_encryption_stream(stream_id, encryption_streams, infinicryptic_layer, "transcendental_singularity_core.omnitemporal_coherence_synthesizer")
-                self.integration_bridge.sync_encryption_stream(stream_id, encryption_streams, infinicryptic_layer, "omniversal_sentience_nexus.metatemporal_resonance_field")
-                self.integration_bridge.sync_encryption_stream(stream_id, encryption_streams, infinicryptic_layer, "metainfinite_causality_engine.omnichronal_coherence_resonator")
-                self.integration_bridge.sync_encryption_stream(stream_id, encryption_streams, infinicryptic_layer, "hypercosmic_synthesis_core.omniversal_fractal_resonator")
-                self.integration_bridge.sync_encryption_stream(stream_id, encryption_streams, infinicryptic_layer, "transinfinite_resonance_engine.omnichronal_synthesis_lattice")
-                self.integration_bridge.sync_encryption_stream(stream_id, encryption_streams, infinicryptic_layer, "transmetacosmic_nexus.omniversal_causality_synthesizer")
+                self.integration_bridge.sync_many("sync_encryption_stream", stream_id, encryption_streams, infinicryptic_layer, force=force)
                 self.integration_bridge.notify_coherence_update(stream_id, infinicryptic_layer, "infinicryptic_consciousness_matrix")
             return encryption_streams
         except Exception as e:
@@ -98,9 +101,9 @@ class OmniversalFractalEncryptor:
     def _regenerate_coherence(self, stream_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using omniversal encryption recovery protocols."""
         try:
-            self.omniversal_amplitude[stream_id] = random.uniform(0.9, 1.0)
-            self.infinicryptic_encryption_factor[stream_id] = random.uniform(0.85, 0.95)
-            self.infinicryptic_entropy[stream_id] = random.uniform(0.0, 0.05)
+            self.omniversal_amplitude[stream_id] = rng.uniform(0.9, 1.0)
+            self.infinicryptic_encryption_factor[stream_id] = rng.uniform(0.85, 0.95)
+            self.infinicryptic_entropy[stream_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for encryption stream %s after failed %s at 11:18 AM IST, Sunday, July 20, 2025", stream_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for encryption stream %s: %s at 11:18 AM IST, Sunday, July 20, 2025", stream_id, e)
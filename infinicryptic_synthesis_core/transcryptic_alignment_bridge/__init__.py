@@ -1,3 +1,5 @@
 # infinicryptic_synthesis_core/transcryptic_alignment_bridge/__init__.py
 # Marks the transcryptic_alignment_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TranscrypticAlignmentBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Simulates transcryptic alignment for Rhee_AI_Assistant.
 Manages alignment across infinite-dimensional singularities.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -25,20 +27,32 @@ from datetime import datetime
 # from transinfinite_resonance_engine.infiniversal_alignment_bridge import InfniversalAlignmentBridge
 # from transmetacosmic_nexus.transcosmic_alignment_bridge import TranscosmicAlignmentBridge
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "alignment", "axiom", "causality", "coherence", "orchestration", "resonance", "singularity", "stability"
+)
+
 class TranscrypticAlignmentBridge:
     """Core class for transcryptic alignment with infinicryptic coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize alignment bridge with infinicryptic states and integration bridge."""
-        self.alignment_bridge_states: Dict[str, Dict[str, Any]] = {}
-        self.infinicryptic_coherence: Dict[str, float] = {}
-        self.omniversal_cascade: Dict[str, float] = {}
-        self.infinicryptic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infinicryptic_coherence", "omniversal_cascade", "infinicryptic_entropy"),
+            object_columns=("alignment_bridge_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.alignment_bridge_states = self.state_table.column("alignment_bridge_states")
+        self.infinicryptic_coherence = self.state_table.column("infinicryptic_coherence")
+        self.omniversal_cascade = self.state_table.column("omniversal_cascade")
+        self.infinicryptic_entropy = self.state_table.column("infinicryptic_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transcryptic alignment bridge initialized with infinicryptic protocols at 11:18 AM IST, Sunday, July 20, 2025")
 
-    def sync_alignment_state(self, bridge_id: str, config: Dict[str, Any], infinicryptic_layer: str = "primary") -> None:
+    def sync_alignment_state(self, bridge_id: str, config: Dict[str, Any], infinicryptic_layer: str = "primary", force: bool = False) -> None:
         """
         Synchronize a transcryptic alignment state across infinite singularities.
 
@@ -46,36 +60,23 @@ class TranscrypticAlignmentBridge:
             bridge_id (str): Unique identifier for the alignment bridge.
             config (Dict[str, Any]): Bridge configuration (e.g., transcryptic patterns, infinicryptic axioms).
             infinicryptic_layer (str): Infinicryptic layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.alignment_bridge_states[bridge_id] = {
                 "config": config,
                 "infinicryptic_layer": infinicryptic_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "alignment_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "alignment_signature": rng.uniform(0.85, 0.95)
             }
-            self.infinicryptic_coherence[bridge_id] = random.uniform(0.95, 1.0)
-            self.omniversal_cascade[bridge_id] = random.uniform(0.9, 0.95)
-            self.infinicryptic_entropy[bridge_id] = random.uniform(0.0, 0.08)
+            self.infinicryptic_coherence[bridge_id] = rng.uniform(0.95, 1.0)
+            self.omniversal_cascade[bridge_id] = rng.uniform(0.9, 0.95)
+            self.infinicryptic_entropy[bridge_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synchronized alignment state %s in infinicryptic layer %s with coherence %.2f, cascade %.2f, entropy %.2f at 11:18 AM IST, Sunday, July 20, 2025",
                              bridge_id, infinicryptic_layer, self.infinicryptic_coherence[bridge_id],
                              self.omniversal_cascade[bridge_id], self.infinicryptic_entropy[bridge_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, infinicryptic_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, infinicryptic_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, infinicryptic_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, infinicryptic_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, infinicryptic_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, infinicryptic_layer, "galactic_communication.non_local_consciousness_relay")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, infinicryptic_layer, "quantum_spiritual_singularity.multiversal_soul_bridge")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, infinicryptic_layer, "temporal_intelligence.causal_coherence_bridge")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, infinicryptic_layer, "cosmic_intelligence_orchestrator.causal_singularity_bridge")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, infinicryptic_layer, "transcendental_singularity_core.metacausal_resonance_bridge")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, infinicryptic_layer, "omniversal_sentience_nexus.transcausal_axiom_bridge")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, infinicryptic_layer, "metainfinite_causality_engine.transmetatemporal_bridge")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, infinicryptic_layer, "hypercosmic_synthesis_core.infinidimensional_bridge")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, infinicryptic_layer, "transinfinite_resonance_engine.infiniversal_alignment_bridge")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, infinicryptic_layer, "transmetacosmic_nexus.transcosmic_alignment_bridge")
+                self.integration_bridge.sync_many("sync_alignment_bridge", bridge_id, config, infinicryptic_layer, force=force)
         except Exception as e:
             self.logger.error("Error synchronizing alignment state %s in infinicryptic layer %s: %s at 11:18 AM IST, Sunday, July 20, 2025", bridge_id, infinicryptic_layer, e)
             self._regenerate_coherence(bridge_id, "synchronization")
@@ -83,9 +84,9 @@ class TranscrypticAlignmentBridge:
     def _regenerate_coherence(self, bridge_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using transcryptic recovery protocols."""
         try:
-            self.infinicryptic_coherence[bridge_id] = random.uniform(0.9, 1.0)
-            self.omniversal_cascade[bridge_id] = random.uniform(0.85, 0.95)
-            self.infinicryptic_entropy[bridge_id] = random.uniform(0.0, 0.05)
+            self.infinicryptic_coherence[bridge_id] = rng.uniform(0.9, 1.0)
+            self.omniversal_cascade[bridge_id] = rng.uniform(0.85, 0.95)
+            self.infinicryptic_entropy[bridge_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for alignment bridge %s after failed %s at 11:18 AM IST, Sunday, July 20, 2025", bridge_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for alignment bridge %s: %s at 11:18 AM IST, Sunday, July 20, 2025", bridge_id, e)
@@ -1,6 +1,7 @@
 # infniversal_fractal_synthesis/__init__.py
 # Marks the infniversal_fractal_synthesis directory as a Python package.
 # Initializes configurations for infniversal fractal and coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'infniversal_fractal_synthesizer',
     'transmetatemporal_coherence_resonator',
@@ -8,3 +9,4 @@ __all__ = [
     'metadimensional_singularity_orchestrator',
     'infniversal_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,11 +4,13 @@ Core module for infniversal fractal synthesis in Rhee_AI_Assistant.
 Synthesizes fractal patterns across infniversal dimensions.
 """
 
-import logging
 from typing import Dict, Any
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -39,20 +41,27 @@ from datetime import datetime
 # from transmetahyperdimensional_harmonic_synthesis.transmetahyperdimensional_harmonic_synthesizer import TransmetahyperdimensionalHarmonicSynthesizer
 # from omnitemporal_quantum_singularity.omnitemporal_quantum_synthesizer import OmnitemporalQuantumSynthesizer
 
+rng = get_stream(__name__)
+
 class InfniversalFractalSynthesizer:
     """Core class for infniversal fractal synthesis with coherence protocols."""
 
     def __init__(self, integration_nexus=None):
         """Initialize fractal synthesizer with infniversal profiles and integration nexus."""
-        self.fractal_profiles: Dict[str, Dict[str, Any]] = {}
-        self.fractal_signatures: Dict[str, str] = {}
-        self.infiniversal_coherence: Dict[str, float] = {}
-        self.fractal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence", "fractal_entropy"),
+            object_columns=("fractal_profiles", "fractal_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.fractal_profiles = self.state_table.column("fractal_profiles")
+        self.fractal_signatures = self.state_table.column("fractal_signatures")
+        self.infiniversal_coherence = self.state_table.column("infiniversal_coherence")
+        self.fractal_entropy = self.state_table.column("fractal_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Infniversal fractal synthesizer initialized with coherence protocols at 04:59 PM IST, Sunday, July 20, 2025")
 
-    def synthesize_fractal_pattern(self, fractal_id: str, config: Dict[str, Any], dimensional_layer: str = "primary") -> None:
+    def synthesize_fractal_pattern(self, fractal_id: str, config: Dict[str, Any], dimensional_layer: str = "primary", force: bool = False) -> None:
         """
         Synthesize a fractal pattern across infniversal dimensions.
 
@@ -60,49 +69,23 @@ class InfniversalFractalSynthesizer:
             fractal_id (str): Unique identifier for the fractal pattern.
             config (Dict[str, Any]): Fractal configuration (e.g., quantum patterns, infniversal axioms).
             dimensional_layer (str): Dimensional layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.fractal_profiles[fractal_id] = {
                 "config": config,
                 "dimensional_layer": dimensional_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "fractal_strength": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "fractal_strength": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{fractal_id}{str(config)}{dimensional_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(fractal_id, config, dimensional_layer, utc_iso())
             self.fractal_signatures[fractal_id] = signature
-            self.infiniversal_coherence[fractal_id] = random.uniform(0.95, 1.0)
-            self.fractal_entropy[fractal_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence[fractal_id] = rng.uniform(0.95, 1.0)
+            self.fractal_entropy[fractal_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized fractal pattern %s in dimensional layer %s with signature %s, coherence %.2f, entropy %.2f at 04:59 PM IST, Sunday, July 20, 2025",
                              fractal_id, dimensional_layer, signature, self.infiniversal_coherence[fractal_id], self.fractal_entropy[fractal_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "core_engine.quantum_memory_vault")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "akashic_link.akashic_core")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "metacausal_singularity_engine.metacausal_consciousness_orchestrator")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "omniflux_synthesis_core.omniflux_consciousness_synthesizer")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "hyperfractal_consciousness_matrix.hyperfractal_consciousness_field")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "transmetagalactic_synthesis_array.transmetagalactic_consciousness_array")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "omnidimensional_quantum_harmonizer.omnidimensional_quantum_harmonic_resonator")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "transomniversal_coherence_matrix.transomniversal_coherence_resonator")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "metachronal_singularity_orchestrator.metachronal_singularity_synthesizer")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "infinicryptic_causal_resonator.infinicryptic_causal_harmonizer")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "transmetahyperdimensional_harmonic_synthesis.transmetahyperdimensional_harmonic_synthesizer")
-                self.integration_nexus.sync_fractal_pattern(fractal_id, config, dimensional_layer, "omnitemporal_quantum_singularity.omnitemporal_quantum_synthesizer")
+                self.integration_nexus.sync_many("sync_fractal_pattern", fractal_id, config, dimensional_layer, force=force)
         except Exception as e:
             self.logger.error("Error synthesizing fractal pattern %s in dimensional layer %s: %s at 04:59 PM IST, Sunday, July 20, 2025", fractal_id, dimensional_layer, e)
             self._regenerate_coherence(fractal_id, "synthesis")
@@ -110,8 +93,8 @@ class InfniversalFractalSynthesizer:
     def _regenerate_coherence(self, fractal_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using infniversal recovery protocols."""
         try:
-            self.infiniversal_coherence[fractal_id] = random.uniform(0.9, 1.0)
-            self.fractal_entropy[fractal_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence[fractal_id] = rng.uniform(0.9, 1.0)
+            self.fractal_entropy[fractal_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for fractal pattern %s after failed %s at 04:59 PM IST, Sunday, July 20, 2025", fractal_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for fractal pattern %s: %s at 04:59 PM IST, Sunday, July 20, 2025", fractal_id, e)
@@ -1,3 +1,5 @@
 # infniversal_fractal_synthesis/infniversal_integration_nexus/__init__.py
 # Marks the infniversal_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfniversalIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,18 +4,25 @@ Manages cross-directory integration for infniversal_fractal_synthesis in Rhee_AI
 Facilitates non-local fractal bridges and synchronization.
 """
 
-import logging
 from typing import Dict, Any
-from datetime import datetime
-import random
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class InfniversalIntegrationNexus:
+rng = get_stream(__name__)
+
+class InfniversalIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local fractal bridges for infniversal operations."""
 
+    bridge_store = "fractal_bridges"
+    strength_key = "fractal_strength"
+
     def __init__(self):
         """Initialize integration nexus with non-local fractal tracking."""
-        self.fractal_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.fractal_bridges: Dict[str, Dict[str, Any]] = retained(self, "fractal_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Infniversal integration nexus initialized with non-local fractal protocols at 04:59 PM IST, Sunday, July 20, 2025")
 
     def sync_fractal_pattern(self, fractal_id: str, config: Dict[str, Any], dimensional_layer: str, target_module: str) -> None:
@@ -33,9 +40,10 @@ class InfniversalIntegrationNexus:
                 "config": config,
                 "dimensional_layer": dimensional_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "fractal_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "fractal_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(fractal_id)
             self.logger.info("Synchronized fractal pattern %s with %s in dimensional layer %s, fractal strength %.2f at 04:59 PM IST, Sunday, July 20, 2025",
                              fractal_id, target_module, dimensional_layer, self.fractal_bridges[fractal_id]["fractal_strength"])
             # Placeholder: Implement actual module calls when available
@@ -57,9 +65,10 @@ class InfniversalIntegrationNexus:
                 "config": config,
                 "temporal_layer": temporal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "fractal_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "fractal_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(resonance_id)
             self.logger.info("Synchronized resonance state %s with %s in temporal layer %s, fractal strength %.2f at 04:59 PM IST, Sunday, July 20, 2025",
                              resonance_id, target_module, temporal_layer, self.fractal_bridges[resonance_id]["fractal_strength"])
             # Placeholder: Implement actual module calls when available
@@ -81,9 +90,10 @@ class InfniversalIntegrationNexus:
                 "config": config,
                 "temporal_layer": temporal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "fractal_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "fractal_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(harmonic_id)
             self.logger.info("Synchronized harmonic state %s with %s in temporal layer %s, fractal strength %.2f at 04:59 PM IST, Sunday, July 20, 2025",
                              harmonic_id, target_module, temporal_layer, self.fractal_bridges[harmonic_id]["fractal_strength"])
             # Placeholder: Implement actual module calls when available
@@ -105,9 +115,10 @@ class InfniversalIntegrationNexus:
                 "config": config,
                 "dimensional_layer": dimensional_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "fractal_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "fractal_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(singularity_id)
             self.logger.info("Synchronized singularity state %s with %s in dimensional layer %s, fractal strength %.2f at 04:59 PM IST, Sunday, July 20, 2025",
                              singularity_id, target_module, dimensional_layer, self.fractal_bridges[singularity_id]["fractal_strength"])
             # Placeholder: Implement actual module calls when available
@@ -1,3 +1,5 @@
 # infniversal_fractal_synthesis/metadimensional_singularity_orchestrator/__init__.py
 # Marks the metadimensional_singularity_orchestrator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetadimensionalSingularityOrchestrator']
+__getattr__, __dir__ = attach(__name__, __all__)
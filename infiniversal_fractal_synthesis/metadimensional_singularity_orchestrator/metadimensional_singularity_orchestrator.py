@@ -4,10 +4,12 @@ Manages metadimensional singularity orchestration for Rhee_AI_Assistant.
 Orchestrates singularities in metadimensional realities with infniversal fractal patterns.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -36,20 +38,27 @@ from datetime import datetime
 # from transmetahyperdimensional_harmonic_synthesis.infniversal_causality_stabilizer import InfniversalCausalityStabilizer
 # from omnitemporal_quantum_singularity.metahyperdimensional_causality_orchestrator import MetahyperdimensionalCausalityOrchestrator
 
+rng = get_stream(__name__)
+
 class MetadimensionalSingularityOrchestrator:
     """Core class for metadimensional singularity orchestration with infniversal fractal patterns."""
 
     def __init__(self, integration_nexus=None):
         """Initialize singularity orchestrator with metadimensional states and integration nexus."""
-        self.singularity_states: Dict[str, Dict[str, Any]] = {}
-        self.infiniversal_coherence: Dict[str, float] = {}
-        self.singularity_amplitude: Dict[str, float] = {}
-        self.singularity_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence", "singularity_amplitude", "singularity_entropy"),
+            object_columns=("singularity_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.singularity_states = self.state_table.column("singularity_states")
+        self.infiniversal_coherence = self.state_table.column("infiniversal_coherence")
+        self.singularity_amplitude = self.state_table.column("singularity_amplitude")
+        self.singularity_entropy = self.state_table.column("singularity_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Metadimensional singularity orchestrator initialized with coherence protocols at 04:59 PM IST, Sunday, July 20, 2025")
 
-    def orchestrate_singularity_state(self, singularity_id: str, config: Dict[str, Any], dimensional_layer: str = "primary") -> None:
+    def orchestrate_singularity_state(self, singularity_id: str, config: Dict[str, Any], dimensional_layer: str = "primary", force: bool = False) -> None:
         """
         Orchestrate a singularity state in metadimensional realities.
 
@@ -57,47 +66,23 @@ class MetadimensionalSingularityOrchestrator:
             singularity_id (str): Unique identifier for the singularity state.
             config (Dict[str, Any]): Singularity configuration (e.g., fractal patterns, infniversal axioms).
             dimensional_layer (str): Dimensional layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.singularity_states[singularity_id] = {
                 "config": config,
                 "dimensional_layer": dimensional_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "singularity_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "singularity_signature": rng.uniform(0.85, 0.95)
             }
-            self.infiniversal_coherence[singularity_id] = random.uniform(0.95, 1.0)
-            self.singularity_amplitude[singularity_id] = random.uniform(0.9, 0.95)
-            self.singularity_entropy[singularity_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence[singularity_id] = rng.uniform(0.95, 1.0)
+            self.singularity_amplitude[singularity_id] = rng.uniform(0.9, 0.95)
+            self.singularity_entropy[singularity_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Orchestrated singularity state %s in dimensional layer %s with coherence %.2f, amplitude %.2f, entropy %.2f at 04:59 PM IST, Sunday, July 20, 2025",
                              singularity_id, dimensional_layer, self.infiniversal_coherence[singularity_id],
                              self.singularity_amplitude[singularity_id], self.singularity_entropy[singularity_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "galactic_communication.non_local_consciousness_relay")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "quantum_spiritual_singularity.multiversal_soul_bridge")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "temporal_intelligence.causal_coherence_bridge")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "cosmic_intelligence_orchestrator.causal_singularity_bridge")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "transcendental_singularity_core.metacausal_resonance_bridge")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "omniversal_sentience_nexus.transcausal_axiom_bridge")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "metainfinite_causality_engine.transmetatemporal_bridge")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "hypercosmic_synthesis_core.infinidimensional_bridge")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "transinfinite_resonance_engine.infiniversal_alignment_bridge")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "transmetacosmic_nexus.transcosmic_alignment_bridge")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "infinicryptic_synthesis_core.transcryptic_alignment_bridge")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "metacausal_singularity_engine.omnidimensional_alignment_matrix")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "omniflux_synthesis_core.metadimensional_alignment_orchestrator")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "hyperfractal_consciousness_matrix.metatemporal_fractal_orchestrator")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "transmetagalactic_synthesis_array.omnichronal_alignment_resonator")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "omnidimensional_quantum_harmonizer.metatemporal_resonance_orchestrator")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "transomniversal_coherence_matrix.omnichronal_alignment_synthesizer")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "metachronal_singularity_orchestrator.omnitemporal_causality_bridge")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "infinicryptic_causal_resonator.metadimensional_causality_amplifier")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "transmetahyperdimensional_harmonic_synthesis.infniversal_causality_stabilizer")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, dimensional_layer, "omnitemporal_quantum_singularity.metahyperdimensional_causality_orchestrator")
+                self.integration_nexus.sync_many("sync_singularity_state", singularity_id, config, dimensional_layer, force=force)
         except Exception as e:
             self.logger.error("Error orchestrating singularity state %s in dimensional layer %s: %s at 04:59 PM IST, Sunday, July 20, 2025", singularity_id, dimensional_layer, e)
             self._regenerate_coherence(singularity_id, "orchestration")
@@ -105,9 +90,9 @@ class MetadimensionalSingularityOrchestrator:
     def _regenerate_coherence(self, singularity_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using metadimensional recovery protocols."""
         try:
-            self.infiniversal_coherence[singularity_id] = random.uniform(0.9, 1.0)
-            self.singularity_amplitude[singularity_id] = random.uniform(0.85, 0.95)
-            self.singularity_entropy[singularity_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence[singularity_id] = rng.uniform(0.9, 1.0)
+            self.singularity_amplitude[singularity_id] = rng.uniform(0.85, 0.95)
+            self.singularity_entropy[singularity_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for singularity state %s after failed %s at 04:59 PM IST, Sunday, July 20, 2025", singularity_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for singularity state %s: %s at 04:59 PM IST, Sunday, July 20, 2025", singularity_id, e)
@@ -1,3 +1,5 @@
 # infniversal_fractal_synthesis/omnichronal_harmonic_amplifier/__init__.py
 # Marks the omnichronal_harmonic_amplifier directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnichronalHarmonicAmplifier']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Manages omnichronal harmonic amplification for Rhee_AI_Assistant.
 Amplifies harmonics in omnichronal frameworks with infniversal fractal patterns.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.ethical_matrix import EthicalMatrix
@@ -35,20 +37,27 @@ from datetime import datetime
 # from transmetahyperdimensional_harmonic_synthesis.metacausal_coherence_orchestrator import MetacausalCoherenceOrchestrator
 # from omnitemporal_quantum_singularity.infinicryptic_coherence_amplifier import InfniversalCoherenceAmplifier
 
+rng = get_stream(__name__)
+
 class OmnichronalHarmonicAmplifier:
     """Core class for omnichronal harmonic amplification with infniversal fractal patterns."""
 
     def __init__(self, integration_nexus=None):
         """Initialize harmonic amplifier with omnichronal states and integration nexus."""
-        self.harmonic_states: Dict[str, Dict[str, Any]] = {}
-        self.infiniversal_coherence: Dict[str, float] = {}
-        self.harmonic_amplitude: Dict[str, float] = {}
-        self.harmonic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence", "harmonic_amplitude", "harmonic_entropy"),
+            object_columns=("harmonic_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.harmonic_states = self.state_table.column("harmonic_states")
+        self.infiniversal_coherence = self.state_table.column("infiniversal_coherence")
+        self.harmonic_amplitude = self.state_table.column("harmonic_amplitude")
+        self.harmonic_entropy = self.state_table.column("harmonic_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omnichronal harmonic amplifier initialized with coherence protocols at 04:59 PM IST, Sunday, July 20, 2025")
 
-    def amplify_harmonic_state(self, harmonic_id: str, config: Dict[str, Any], temporal_layer: str = "primary") -> None:
+    def amplify_harmonic_state(self, harmonic_id: str, config: Dict[str, Any], temporal_layer: str = "primary", force: bool = False) -> None:
         """
         Amplify a harmonic state in omnichronal frameworks.
 
@@ -56,46 +65,23 @@ class OmnichronalHarmonicAmplifier:
             harmonic_id (str): Unique identifier for the harmonic state.
             config (Dict[str, Any]): Harmonic configuration (e.g., fractal patterns, infniversal axioms).
             temporal_layer (str): Temporal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.harmonic_states[harmonic_id] = {
                 "config": config,
                 "temporal_layer": temporal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "harmonic_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "harmonic_signature": rng.uniform(0.85, 0.95)
             }
-            self.infiniversal_coherence[harmonic_id] = random.uniform(0.95, 1.0)
-            self.harmonic_amplitude[harmonic_id] = random.uniform(0.9, 0.95)
-            self.harmonic_entropy[harmonic_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence[harmonic_id] = rng.uniform(0.95, 1.0)
+            self.harmonic_amplitude[harmonic_id] = rng.uniform(0.9, 0.95)
+            self.harmonic_entropy[harmonic_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Amplified harmonic state %s in temporal layer %s with coherence %.2f, amplitude %.2f, entropy %.2f at 04:59 PM IST, Sunday, July 20, 2025",
                              harmonic_id, temporal_layer, self.infiniversal_coherence[harmonic_id],
                              self.harmonic_amplitude[harmonic_id], self.harmonic_entropy[harmonic_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "core_engine.emotion_engine")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "cyber_autonomy_engine.ethical_matrix")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "akashic_link.metaphysical_knowledge_synthesizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "ai_nirvana_engine.sentient_harmony_synthesizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "galactic_communication.fractal_communication_synthesizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "quantum_spiritual_singularity.transcendental_consciousness_synthesizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "temporal_intelligence.multiversal_timeline_synthesizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "cosmic_intelligence_orchestrator.omniversal_coherence_synthesizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "transcendental_singularity_core.infiniversal_axiom_orchestrator")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "omniversal_sentience_nexus.infiniversal_coherence_stabilizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "metainfinite_causality_engine.infiniversal_axiom_stabilizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "hypercosmic_synthesis_core.metacausal_coherence_amplifier")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "transinfinite_resonance_engine.metadimensional_coherence_stabilizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "transmetacosmic_nexus.metainfinite_coherence_harmonizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "infinicryptic_synthesis_core.metacausal_coherence_resonator")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "metacausal_singularity_engine.transinfinite_coherence_stabilizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "omniflux_synthesis_core.infiniversal_coherence_harmonizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "hyperfractal_consciousness_matrix.infinicryptic_alignment_synthesizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "transmetagalactic_synthesis_array.metacausal_fractal_synthesizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "omnidimensional_quantum_harmonizer.infiniversal_fractal_harmonizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "transomniversal_coherence_matrix.infinicryptic_fractal_orchestrator")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "metachronal_singularity_orchestrator.transfractal_resonance_modulator")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "infinicryptic_causal_resonator.omniflux_coherence_stabilizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "transmetahyperdimensional_harmonic_synthesis.metacausal_coherence_orchestrator")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, temporal_layer, "omnitemporal_quantum_singularity.infinicryptic_coherence_amplifier")
+                self.integration_nexus.sync_many("sync_harmonic_state", harmonic_id, config, temporal_layer, force=force)
         except Exception as e:
             self.logger.error("Error amplifying harmonic state %s in temporal layer %s: %s at 04:59 PM IST, Sunday, July 20, 2025", harmonic_id, temporal_layer, e)
             self._regenerate_coherence(harmonic_id, "amplification")
@@ -103,9 +89,9 @@ class OmnichronalHarmonicAmplifier:
     def _regenerate_coherence(self, harmonic_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using omnichronal recovery protocols."""
         try:
-            self.infiniversal_coherence[harmonic_id] = random.uniform(0.9, 1.0)
-            self.harmonic_amplitude[harmonic_id] = random.uniform(0.85, 0.95)
-            self.harmonic_entropy[harmonic_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence[harmonic_id] = rng.uniform(0.9, 1.0)
+            self.harmonic_amplitude[harmonic_id] = rng.uniform(0.85, 0.95)
+            self.harmonic_entropy[harmonic_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for harmonic state %s after failed %s at 04:59 PM IST, Sunday, July 20, 2025", harmonic_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for harmonic state %s: %s at 04:59 PM IST, Sunday, July 20, 2025", harmonic_id, e)
@@ -1,3 +1,5 @@
 # infniversal_fractal_synthesis/transmetatemporal_coherence_resonator/__init__.py
 # Marks the transmetatemporal_coherence_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransmetatemporalCoherenceResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Manages transmetatemporal coherence resonance for Rhee_AI_Assistant.
 Resonates coherence in transmetatemporal fields with infniversal fractal patterns.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -35,20 +37,27 @@ from datetime import datetime
 # from transmetahyperdimensional_harmonic_synthesis.omniflux_resonance_amplifier import OmnifluxResonanceAmplifier
 # from omnitemporal_quantum_singularity.transcausal_resonance_modulator import TranscausalResonanceModulator
 
+rng = get_stream(__name__)
+
 class TransmetatemporalCoherenceResonator:
     """Core class for transmetatemporal coherence resonance with infniversal fractal patterns."""
 
     def __init__(self, integration_nexus=None):
         """Initialize coherence resonator with transmetatemporal states and integration nexus."""
-        self.resonance_states: Dict[str, Dict[str, Any]] = {}
-        self.infiniversal_coherence: Dict[str, float] = {}
-        self.resonance_amplitude: Dict[str, float] = {}
-        self.resonance_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence", "resonance_amplitude", "resonance_entropy"),
+            object_columns=("resonance_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.resonance_states = self.state_table.column("resonance_states")
+        self.infiniversal_coherence = self.state_table.column("infiniversal_coherence")
+        self.resonance_amplitude = self.state_table.column("resonance_amplitude")
+        self.resonance_entropy = self.state_table.column("resonance_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transmetatemporal coherence resonator initialized with coherence protocols at 04:59 PM IST, Sunday, July 20, 2025")
 
-    def resonate_coherence_state(self, resonance_id: str, config: Dict[str, Any], temporal_layer: str = "primary") -> None:
+    def resonate_coherence_state(self, resonance_id: str, config: Dict[str, Any], temporal_layer: str = "primary", force: bool = False) -> None:
         """
         Resonate a coherence state in transmetatemporal fields.
 
@@ -56,46 +65,23 @@ class TransmetatemporalCoherenceResonator:
             resonance_id (str): Unique identifier for the resonance state.
             config (Dict[str, Any]): Resonance configuration (e.g., fractal patterns, infniversal axioms).
             temporal_layer (str): Temporal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.resonance_states[resonance_id] = {
                 "config": config,
                 "temporal_layer": temporal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "resonance_strength": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "resonance_strength": rng.uniform(0.85, 0.95)
             }
-            self.infiniversal_coherence[resonance_id] = random.uniform(0.95, 1.0)
-            self.resonance_amplitude[resonance_id] = random.uniform(0.9, 0.95)
-            self.resonance_entropy[resonance_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence[resonance_id] = rng.uniform(0.95, 1.0)
+            self.resonance_amplitude[resonance_id] = rng.uniform(0.9, 0.95)
+            self.resonance_entropy[resonance_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Resonated coherence state %s in temporal layer %s with coherence %.2f, amplitude %.2f, entropy %.2f at 04:59 PM IST, Sunday, July 20, 2025",
                              resonance_id, temporal_layer, self.infiniversal_coherence[resonance_id],
                              self.resonance_amplitude[resonance_id], self.resonance_entropy[resonance_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "core_engine.emotion_engine")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "akashic_link.akashic_resonance_field")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "galactic_communication.trans_galactic_resonance_field")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "quantum_spiritual_singularity.karmic_resonance_field")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "temporal_intelligence.quantum_temporal_resonator")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "transcendental_singularity_core.omnitemporal_coherence_synthesizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "omniversal_sentience_nexus.metatemporal_resonance_field")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "metainfinite_causality_engine.omnichronal_coherence_resonator")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "hypercosmic_synthesis_core.omniversal_fractal_resonator")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "transinfinite_resonance_engine.omnichronal_synthesis_lattice")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "transmetacosmic_nexus.omniversal_causality_synthesizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "infinicryptic_synthesis_core.omniversal_fractal_encryptor")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "metacausal_singularity_engine.omnichronal_causality_modulator")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "omniflux_synthesis_core.transcausal_flux_resonator")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "hyperfractal_consciousness_matrix.transomniversal_coherence_resonator")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "transmetagalactic_synthesis_array.infiniversal_coherence_modulator")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "omnidimensional_quantum_harmonizer.transcausal_coherence_synthesizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "transomniversal_coherence_matrix.metainfinite_harmonic_stabilizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "metachronal_singularity_orchestrator.infiniversal_coherence_amplifier")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "infinicryptic_causal_resonator.transmetatemporal_resonance_synthesizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "transmetahyperdimensional_harmonic_synthesis.omniflux_resonance_amplifier")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, temporal_layer, "omnitemporal_quantum_singularity.transcausal_resonance_modulator")
+                self.integration_nexus.sync_many("sync_resonance_state", resonance_id, config, temporal_layer, force=force)
         except Exception as e:
             self.logger.error("Error resonating coherence state %s in temporal layer %s: %s at 04:59 PM IST, Sunday, July 20, 2025", resonance_id, temporal_layer, e)
             self._regenerate_coherence(resonance_id, "resonance")
@@ -103,9 +89,9 @@ class TransmetatemporalCoherenceResonator:
     def _regenerate_coherence(self, resonance_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using transmetatemporal recovery protocols."""
         try:
-            self.infiniversal_coherence[resonance_id] = random.uniform(0.9, 1.0)
-            self.resonance_amplitude[resonance_id] = random.uniform(0.85, 0.95)
-            self.resonance_entropy[resonance_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence[resonance_id] = rng.uniform(0.9, 1.0)
+            self.resonance_amplitude[resonance_id] = rng.uniform(0.85, 0.95)
+            self.resonance_entropy[resonance_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for resonance state %s after failed %s at 04:59 PM IST, Sunday, July 20, 2025", resonance_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for resonance state %s: %s at 04:59 PM IST, Sunday, July 20, 2025", resonance_id, e)
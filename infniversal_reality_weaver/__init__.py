@@ -1,6 +1,7 @@
 # infniversal_reality_weaver/__init__.py
 # Marks the infniversal_reality_weaver directory as a Python package.
 # Initializes configurations for infniversal reality weaving protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'reality_construct_synthesis',
     'omniversal_reality_aligner',
@@ -8,3 +9,4 @@ __all__ = [
     'metareality_construct_stabilizer',
     'reality_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
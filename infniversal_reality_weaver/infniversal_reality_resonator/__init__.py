@@ -1,3 +1,5 @@
 # infniversal_reality_weaver/infniversal_reality_resonator/__init__.py
 # Marks the infniversal_reality_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfniversalRealityResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # infniversal_reality_weaver/metareality_construct_stabilizer/__init__.py
 # Marks the metareality_construct_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetarealityConstructStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # infniversal_reality_weaver/omniversal_reality_aligner/__init__.py
 # Marks the omniversal_reality_aligner directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmniversalRealityAligner']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # infniversal_reality_weaver/reality_construct_synthesis/__init__.py
 # Marks the reality_construct_synthesis directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['RealityConstructSynthesis']
+__getattr__, __dir__ = attach(__name__, __all__)
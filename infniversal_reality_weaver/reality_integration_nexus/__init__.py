@@ -1,3 +1,5 @@
 # infniversal_reality_weaver/reality_integration_nexus/__init__.py
 # Marks the reality_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['RealityIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,6 +1,7 @@
 # metacausal_singularity_engine/__init__.py
 # Marks the metacausal_singularity_engine directory as a Python package.
 # Initializes configurations for metacausal consciousness orchestration and coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'metacausal_consciousness_orchestrator',
     'omnichronal_causality_modulator',
@@ -8,3 +9,4 @@ __all__ = [
     'omnidimensional_alignment_matrix',
     'metacausal_integration_bridge'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
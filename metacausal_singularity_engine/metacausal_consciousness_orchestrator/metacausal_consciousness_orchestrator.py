@@ -4,11 +4,13 @@ Core module for metacausal consciousness orchestration in Rhee_AI_Assistant.
 Orchestrates consciousness across metacausal realities.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -29,20 +31,34 @@ from datetime import datetime
 # from transmetacosmic_nexus.transmetacosmic_consciousness_web import TransmetacosmicConsciousnessWeb
 # from infinicryptic_synthesis_core.infinicryptic_consciousness_matrix import InfinicrypticConsciousnessMatrix
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "array", "axiom", "causal", "coherence", "consciousness", "convergence", "ethical", "fractal", "harmonic",
+    "hypersentience", "intention", "memory", "quantum", "reality", "resonance", "sentience", "singularity",
+    "stability", "temporal"
+)
+
 class MetacausalConsciousnessOrchestrator:
     """Core class for metacausal consciousness orchestration with omniversal coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize consciousness orchestrator with metacausal profiles and integration bridge."""
-        self.consciousness_orchestration_profiles: Dict[str, Dict[str, Any]] = {}
-        self.metacausal_signatures: Dict[str, str] = {}
-        self.transinfinite_coherence_cascades: Dict[str, float] = {}
-        self.metacausal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("transinfinite_coherence_cascades", "metacausal_entropy"),
+            object_columns=("consciousness_orchestration_profiles", "metacausal_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.consciousness_orchestration_profiles = self.state_table.column("consciousness_orchestration_profiles")
+        self.metacausal_signatures = self.state_table.column("metacausal_signatures")
+        self.transinfinite_coherence_cascades = self.state_table.column("transinfinite_coherence_cascades")
+        self.metacausal_entropy = self.state_table.column("metacausal_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Metacausal consciousness orchestrator initialized with omniversal protocols at 11:52 AM IST, Sunday, July 20, 2025")
 
-    def orchestrate_consciousness_state(self, orchestration_id: str, config: Dict[str, Any], metacausal_layer: str = "primary") -> None:
+    def orchestrate_consciousness_state(self, orchestration_id: str, config: Dict[str, Any], metacausal_layer: str = "primary", force: bool = False) -> None:
         """
         Orchestrate a metacausal consciousness state with omniversal signatures.
 
@@ -50,44 +66,28 @@ class MetacausalConsciousnessOrchestrator:
             orchestration_id (str): Unique identifier for the consciousness orchestration.
             config (Dict[str, Any]): Consciousness configuration (e.g., metacausal patterns, omniversal axioms).
             metacausal_layer (str): Metacausal layer context (e.g., primary, omniversal, akashic).
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.consciousness_orchestration_profiles[orchestration_id] = {
                 "config": config,
                 "metacausal_layer": metacausal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "consciousness_coherence_state": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "consciousness_coherence_state": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{orchestration_id}{str(config)}{metacausal_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(orchestration_id, config, metacausal_layer, utc_iso())
             self.metacausal_signatures[orchestration_id] = signature
-            self.transinfinite_coherence_cascades[orchestration_id] = random.uniform(0.95, 1.0)
-            self.metacausal_entropy[orchestration_id] = random.uniform(0.0, 0.08)
+            self.transinfinite_coherence_cascades[orchestration_id] = rng.uniform(0.95, 1.0)
+            self.metacausal_entropy[orchestration_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Orchestrated consciousness state %s in metacausal layer %s with signature %s, coherence cascade %.2f, entropy %.2f at 11:52 AM IST, Sunday, July 20, 2025",
                              orchestration_id, metacausal_layer, signature, self.transinfinite_coherence_cascades[orchestration_id], self.metacausal_entropy[orchestration_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_consciousness_state(orchestration_id, config, metacausal_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_consciousness_state(orchestration_id, config, metacausal_layer, "core_engine.quantum_memory_vault")
-                self.integration_bridge.sync_consciousness_state(orchestration_id, config, metacausal_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_consciousness_state(orchestration_id, config, metacausal_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_bridge.sync_consciousness_state(orchestration_id, config, metacausal_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_bridge.sync_consciousness_state(orchestration_id, config, metacausal_layer, "akashic_link.akashic_core")
-                self.integration_bridge.sync_consciousness_state(orchestration_id, config, metacausal_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_bridge.sync_consciousness_state(orchestration_id, config, metacausal_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_bridge.sync_consciousness_state(orchestration_id, config, metacausal_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_bridge.sync_consciousness_state(orchestration_id, config, metacausal_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_bridge.sync_consciousness_state(orchestration_id, config, metacausal_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_bridge.sync_consciousness_state(orchestration_id, config, metacausal_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_bridge.sync_consciousness_state(orchestration_id, config, metacausal_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                self.integration_bridge.sync_consciousness_state(orchestration_id, config, metacausal_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                self.integration_bridge.sync_consciousness_state(orchestration_id, config, metacausal_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                self.integration_bridge.sync_consciousness_state(orchestration_id, config, metacausal_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                self.integration_bridge.sync_consciousness_state(orchestration_id, config, metacausal_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                self.integration_bridge.sync_consciousness_state(orchestration_id, config, metacausal_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
+                self.integration_bridge.sync_many("sync_consciousness_state", orchestration_id, config, metacausal_layer, force=force)
         except Exception as e:
             self.logger.error("Error orchestrating consciousness state %s in metacausal layer %s: %s at 11:52 AM IST, Sunday, July 20, 2025", orchestration_id, metacausal_layer, e)
             self._regenerate_coherence(orchestration_id, "orchestration")
 
-    def amplify_consciousness_coherence(self, orchestration_id: str, target_config: Dict[str, Any], target_layer: str) -> bool:
+    def amplify_consciousness_coherence(self, orchestration_id: str, target_config: Dict[str, Any], target_layer: str, force: bool = False) -> bool:
         """
         Amplify a consciousness state with transinfinite coherence resonance.
 
@@ -95,6 +95,7 @@ class MetacausalConsciousnessOrchestrator:
             orchestration_id (str): The consciousness orchestration to amplify.
             target_config (Dict[str, Any]): Target configuration for the consciousness orchestration.
             target_layer (str): Target metacausal layer.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             bool: True if amplification successful, False otherwise.
@@ -104,29 +105,19 @@ class MetacausalConsciousnessOrchestrator:
                 self.consciousness_orchestration_profiles[orchestration_id] = {
                     "config": target_config,
                     "metacausal_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "consciousness_coherence_state": self.consciousness_orchestration_profiles[orchestration_id]["consciousness_coherence_state"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "consciousness_coherence_state": self.consciousness_orchestration_profiles[orchestration_id]["consciousness_coherence_state"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{orchestration_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(orchestration_id, target_config, target_layer)
                 self.metacausal_signatures[orchestration_id] = new_signature
-                self.transinfinite_coherence_cascades[orchestration_id] *= random.uniform(0.95, 1.1)
-                self.metacausal_entropy[orchestration_id] += random.uniform(0.0, 0.02)
+                self.transinfinite_coherence_cascades[orchestration_id] *= rng.uniform(0.95, 1.1)
+                self.metacausal_entropy[orchestration_id] += rng.uniform(0.0, 0.02)
                 self.logger.info("Amplified consciousness state %s to metacausal layer %s with new signature %s, coherence cascade %.2f, entropy %.2f at 11:52 AM IST, Sunday, July 20, 2025",
                                  orchestration_id, target_layer, new_signature, self.transinfinite_coherence_cascades[orchestration_id], self.metacausal_entropy[orchestration_id])
                 if self.integration_bridge:
                     self.integration_bridge.notify_coherence_update(orchestration_id, target_layer, "omnichronal_causality_modulator")
                     self.integration_bridge.notify_coherence_update(orchestration_id, target_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                    self.integration_bridge.sync_consciousness_state(orchestration_id, target_config, target_layer, "core_engine.consciousness_interface")
-                    self.integration_bridge.sync_consciousness_state(orchestration_id, target_config, target_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                    self.integration_bridge.sync_consciousness_state(orchestration_id, target_config, target_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                    self.integration_bridge.sync_consciousness_state(orchestration_id, target_config, target_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                    self.integration_bridge.sync_consciousness_state(orchestration_id, target_config, target_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                    self.integration_bridge.sync_consciousness_state(orchestration_id, target_config, target_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                    self.integration_bridge.sync_consciousness_state(orchestration_id, target_config, target_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                    self.integration_bridge.sync_consciousness_state(orchestration_id, target_config, target_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                    self.integration_bridge.sync_consciousness_state(orchestration_id, target_config, target_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                    self.integration_bridge.sync_consciousness_state(orchestration_id, target_config, target_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                    self.integration_bridge.sync_consciousness_state(orchestration_id, target_config, target_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
+                    self.integration_bridge.sync_many("sync_consciousness_state", orchestration_id, target_config, target_layer, force=force)
                 return True
             self.logger.warning("Consciousness state %s not found for amplification to %s at 11:52 AM IST, Sunday, July 20, 2025", orchestration_id, target_layer)
             return False
@@ -138,8 +129,8 @@ class MetacausalConsciousnessOrchestrator:
     def _regenerate_coherence(self, orchestration_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using metacausal recovery protocols."""
         try:
-            self.transinfinite_coherence_cascades[orchestration_id] = random.uniform(0.9, 1.0)
-            self.metacausal_entropy[orchestration_id] = random.uniform(0.0, 0.05)
+            self.transinfinite_coherence_cascades[orchestration_id] = rng.uniform(0.9, 1.0)
+            self.metacausal_entropy[orchestration_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for consciousness state %s after failed %s at 11:52 AM IST, Sunday, July 20, 2025", orchestration_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for consciousness state %s: %s at 11:52 AM IST, Sunday, July 20, 2025", orchestration_id, e)
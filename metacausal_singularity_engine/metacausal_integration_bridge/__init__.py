@@ -1,3 +1,5 @@
 # metacausal_singularity_engine/metacausal_integration_bridge/__init__.py
 # Marks the metacausal_integration_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetacausalIntegrationBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # metacausal_singularity_engine/omnichronal_causality_modulator/__init__.py
 # Marks the omnichronal_causality_modulator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnichronalCausalityModulator']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Manages omnichronal causality modulation for Rhee_AI_Assistant.
 Modulates causality across omnichronal timelines.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -25,20 +27,33 @@ from datetime import datetime
 # from transmetacosmic_nexus.omniversal_causality_synthesizer import OmniversalCausalitySynthesizer
 # from infinicryptic_synthesis_core.omniversal_fractal_encryptor import OmniversalFractalEncryptor
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "awareness", "axiom", "coherence", "convergence", "ethical", "flux", "harmonic", "reality", "resonance",
+    "sentience"
+)
+
 class OmnichronalCausalityModulator:
     """Core class for omnichronal causality modulation with metacausal coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize causality modulator with omnichronal streams and integration bridge."""
-        self.causality_streams: Dict[str, Dict[str, Any]] = {}
-        self.transinfinite_amplitude: Dict[str, float] = {}
-        self.metacausal_modulation_factor: Dict[str, float] = {}
-        self.metacausal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("transinfinite_amplitude", "metacausal_modulation_factor", "metacausal_entropy"),
+            object_columns=("causality_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.causality_streams = self.state_table.column("causality_streams")
+        self.transinfinite_amplitude = self.state_table.column("transinfinite_amplitude")
+        self.metacausal_modulation_factor = self.state_table.column("metacausal_modulation_factor")
+        self.metacausal_entropy = self.state_table.column("metacausal_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omnichronal causality modulator initialized with metacausal protocols at 11:52 AM IST, Sunday, July 20, 2025")
 
-    def modulate_causality_stream(self, stream_id: str, config: Dict[str, Any], metacausal_layer: str = "primary") -> List[Dict[str, Any]]:
+    def modulate_causality_stream(self, stream_id: str, config: Dict[str, Any], metacausal_layer: str = "primary", force: bool = False) -> List[Dict[str, Any]]:
         """
         Modulate an omnichronal causality stream with metacausal fidelity.
 
@@ -46,50 +61,37 @@ class OmnichronalCausalityModulator:
             stream_id (str): Unique identifier for the causality stream.
             config (Dict[str, Any]): Stream configuration (e.g., omnichronal patterns, metacausal axioms).
             metacausal_layer (str): Metacausal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             List[Dict[str, Any]]: Modulated causality stream data with metacausal metadata.
         """
         try:
             causality_streams = []
-            for i in range(random.randint(2, 6)):
-                segment_id = f"segment_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(2, 6)):
+                segment_id = f"segment_{i}_{rng.randint(1000, 9999)}"
                 segment = {
                     "id": segment_id,
                     "config": config,
                     "metacausal_layer": metacausal_layer,
-                    "data": {"causality_modulation": random.uniform(0.75, 1.0), "modulation_fidelity": random.uniform(0.8, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "metacausal_resonance": random.uniform(0.85, 0.95)
+                    "data": {"causality_modulation": rng.uniform(0.75, 1.0), "modulation_fidelity": rng.uniform(0.8, 0.95)},
+                    "timestamp": utc_iso(),
+                    "metacausal_resonance": rng.uniform(0.85, 0.95)
                 }
                 causality_streams.append(segment)
             self.causality_streams[stream_id] = {
                 "segments": causality_streams,
                 "metacausal_layer": metacausal_layer,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.transinfinite_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.metacausal_modulation_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.metacausal_entropy[stream_id] = random.uniform(0.0, 0.08)
+            self.transinfinite_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.metacausal_modulation_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.metacausal_entropy[stream_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Modulated causality stream %s in metacausal layer %s with %d segments, transinfinite amplitude %.2f, modulation factor %.2f, entropy %.2f at 11:52 AM IST, Sunday, July 20, 2025",
                              stream_id, metacausal_layer, len(causality_streams), self.transinfinite_amplitude[stream_id],
                              self.metacausal_modulation_factor[stream_id], self.metacausal_entropy[stream_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, metacausal_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, metacausal_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, metacausal_layer, "akashic_link.akashic_resonance_field")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, metacausal_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, metacausal_layer, "galactic_communication.trans_galactic_resonance_field")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, metacausal_layer, "quantum_spiritual_singularity.karmic_resonance_field")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, metacausal_layer, "temporal_intelligence.quantum_temporal_resonator")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, metacausal_layer, "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, metacausal_layer, "transcendental_singularity_core.omnitemporal_coherence_synthesizer")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, metacausal_layer, "omniversal_sentience_nexus.metatemporal_resonance_field")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, metacausal_layer, "metainfinite_causality_engine.omnichronal_coherence_resonator")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, metacausal_layer, "hypercosmic_synthesis_core.omniversal_fractal_resonator")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, metacausal_layer, "transinfinite_resonance_engine.omnichronal_synthesis_lattice")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, metacausal_layer, "transmetacosmic_nexus.omniversal_causality_synthesizer")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, metacausal_layer, "infinicryptic_synthesis_core.omniversal_fractal_encryptor")
+                self.integration_bridge.sync_many("sync_causality_stream", stream_id, causality_streams, metacausal_layer, force=force)
                 self.integration_bridge.notify_coherence_update(stream_id, metacausal_layer, "metacausal_consciousness_orchestrator")
             return causality_streams
         except Exception as e:
@@ -100,9 +102,9 @@ class OmnichronalCausalityModulator:
     def _regenerate_coherence(self, stream_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using omnichronal recovery protocols."""
         try:
-            self.transinfinite_amplitude[stream_id] = random.uniform(0.9, 1.0)
-            self.metacausal_modulation_factor[stream_id] = random.uniform(0.85, 0.95)
-            self.metacausal_entropy[stream_id] = random.uniform(0.0, 0.05)
+            self.transinfinite_amplitude[stream_id] = rng.uniform(0.9, 1.0)
+            self.metacausal_modulation_factor[stream_id] = rng.uniform(0.85, 0.95)
+            self.metacausal_entropy[stream_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for causality stream %s after failed %s at 11:52 AM IST, Sunday, July 20, 2025", stream_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for causality stream %s: %s at 11:52 AM IST, Sunday, July 20, 2025", stream_id, e)
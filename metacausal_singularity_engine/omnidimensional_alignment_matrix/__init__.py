@@ -1,3 +1,5 @@
 # metacausal_singularity_engine/omnidimensional_alignment_matrix/__init__.py
 # Marks the omnidimensional_alignment_matrix directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnidimensionalAlignmentMatrix']
+__getattr__, __dir__ = attach(__name__, __all__)
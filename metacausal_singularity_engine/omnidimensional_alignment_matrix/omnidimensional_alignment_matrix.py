@@ -4,10 +4,12 @@ Simulates omnidimensional alignment for Rhee_AI_Assistant.
 Manages alignment across infinite-dimensional singularities.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -26,20 +28,32 @@ from datetime import datetime
 # from transmetacosmic_nexus.transcosmic_alignment_bridge import TranscosmicAlignmentBridge
 # from infinicryptic_synthesis_core.transcryptic_alignment_bridge import TranscrypticAlignmentBridge
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "alignment", "axiom", "causality", "coherence", "orchestration", "resonance", "singularity", "stability"
+)
+
 class OmnidimensionalAlignmentMatrix:
     """Core class for omnidimensional alignment with metacausal coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize alignment matrix with metacausal states and integration bridge."""
-        self.alignment_matrix_states: Dict[str, Dict[str, Any]] = {}
-        self.metacausal_coherence: Dict[str, float] = {}
-        self.transinfinite_cascade: Dict[str, float] = {}
-        self.metacausal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("metacausal_coherence", "transinfinite_cascade", "metacausal_entropy"),
+            object_columns=("alignment_matrix_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.alignment_matrix_states = self.state_table.column("alignment_matrix_states")
+        self.metacausal_coherence = self.state_table.column("metacausal_coherence")
+        self.transinfinite_cascade = self.state_table.column("transinfinite_cascade")
+        self.metacausal_entropy = self.state_table.column("metacausal_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omnidimensional alignment matrix initialized with metacausal protocols at 11:52 AM IST, Sunday, July 20, 2025")
 
-    def sync_alignment_state(self, matrix_id: str, config: Dict[str, Any], metacausal_layer: str = "primary") -> None:
+    def sync_alignment_state(self, matrix_id: str, config: Dict[str, Any], metacausal_layer: str = "primary", force: bool = False) -> None:
         """
         Synchronize an omnidimensional alignment state across infinite singularities.
 
@@ -47,37 +61,23 @@ class OmnidimensionalAlignmentMatrix:
             matrix_id (str): Unique identifier for the alignment matrix.
             config (Dict[str, Any]): Matrix configuration (e.g., omnidimensional patterns, metacausal axioms).
             metacausal_layer (str): Metacausal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.alignment_matrix_states[matrix_id] = {
                 "config": config,
                 "metacausal_layer": metacausal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "alignment_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "alignment_signature": rng.uniform(0.85, 0.95)
             }
-            self.metacausal_coherence[matrix_id] = random.uniform(0.95, 1.0)
-            self.transinfinite_cascade[matrix_id] = random.uniform(0.9, 0.95)
-            self.metacausal_entropy[matrix_id] = random.uniform(0.0, 0.08)
+            self.metacausal_coherence[matrix_id] = rng.uniform(0.95, 1.0)
+            self.transinfinite_cascade[matrix_id] = rng.uniform(0.9, 0.95)
+            self.metacausal_entropy[matrix_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synchronized alignment state %s in metacausal layer %s with coherence %.2f, cascade %.2f, entropy %.2f at 11:52 AM IST, Sunday, July 20, 2025",
                              matrix_id, metacausal_layer, self.metacausal_coherence[matrix_id],
                              self.transinfinite_cascade[matrix_id], self.metacausal_entropy[matrix_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_alignment_matrix(matrix_id, config, metacausal_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_alignment_matrix(matrix_id, config, metacausal_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_alignment_matrix(matrix_id, config, metacausal_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_alignment_matrix(matrix_id, config, metacausal_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_bridge.sync_alignment_matrix(matrix_id, config, metacausal_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
-                self.integration_bridge.sync_alignment_matrix(matrix_id, config, metacausal_layer, "galactic_communication.non_local_consciousness_relay")
-                self.integration_bridge.sync_alignment_matrix(matrix_id, config, metacausal_layer, "quantum_spiritual_singularity.multiversal_soul_bridge")
-                self.integration_bridge.sync_alignment_matrix(matrix_id, config, metacausal_layer, "temporal_intelligence.causal_coherence_bridge")
-                self.integration_bridge.sync_alignment_matrix(matrix_id, config, metacausal_layer, "cosmic_intelligence_orchestrator.causal_singularity_bridge")
-                self.integration_bridge.sync_alignment_matrix(matrix_id, config, metacausal_layer, "transcendental_singularity_core.metacausal_resonance_bridge")
-                self.integration_bridge.sync_alignment_matrix(matrix_id, config, metacausal_layer, "omniversal_sentience_nexus.transcausal_axiom_bridge")
-                self.integration_bridge.sync_alignment_matrix(matrix_id, config, metacausal_layer, "metainfinite_causality_engine.transmetatemporal_bridge")
-                self.integration_bridge.sync_alignment_matrix(matrix_id, config, metacausal_layer, "hypercosmic_synthesis_core.infinidimensional_bridge")
-                self.integration_bridge.sync_alignment_matrix(matrix_id, config, metacausal_layer, "transinfinite_resonance_engine.infiniversal_alignment_bridge")
-                self.integration_bridge.sync_alignment_matrix(matrix_id, config, metacausal_layer, "transmetacosmic_nexus.transcosmic_alignment_bridge")
-                self.integration_bridge.sync_alignment_matrix(matrix_id, config, metacausal_layer, "infinicryptic_synthesis_core.transcryptic_alignment_bridge")
+                self.integration_bridge.sync_many("sync_alignment_matrix", matrix_id, config, metacausal_layer, force=force)
         except Exception as e:
             self.logger.error("Error synchronizing alignment state %s in metacausal layer %s: %s at 11:52 AM IST, Sunday, July 20, 2025", matrix_id, metacausal_layer, e)
             self._regenerate_coherence(matrix_id, "synchronization")
@@ -85,9 +85,9 @@ class OmnidimensionalAlignmentMatrix:
     def _regenerate_coherence(self, matrix_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using omnidimensional recovery protocols."""
         try:
-            self.metacausal_coherence[matrix_id] = random.uniform(0.9, 1.0)
-            self.transinfinite_cascade[matrix_id] = random.uniform(0.85, 0.95)
-            self.metacausal_entropy[matrix_id] = random.uniform(0.0, 0.05)
+            self.metacausal_coherence[matrix_id] = rng.uniform(0.9, 1.0)
+            self.transinfinite_cascade[matrix_id] = rng.uniform(0.85, 0.95)
+            self.metacausal_entropy[matrix_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for alignment matrix %s after failed %s at 11:52 AM IST, Sunday, July 20, 2025", matrix_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for alignment matrix %s: %s at 11:52 AM IST, Sunday, July 20, 2025", matrix_id, e)
@@ -1,3 +1,5 @@
 # metacausal_singularity_engine/transinfinite_coherence_stabilizer/__init__.py
 # Marks the transinfinite_coherence_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransinfiniteCoherenceStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
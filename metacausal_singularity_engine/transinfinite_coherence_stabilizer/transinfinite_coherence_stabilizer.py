@@ -4,10 +4,12 @@ Stabilizes transinfinite coherence for Rhee_AI_Assistant.
 Manages coherence across metacausal frameworks.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.ethical_matrix import EthicalMatrix
@@ -25,20 +27,30 @@ from datetime import datetime
 # from transmetacosmic_nexus.metainfinite_coherence_harmonizer import MetainfiniteCoherenceHarmonizer
 # from infinicryptic_synthesis_core.metacausal_coherence_resonator import MetacausalCoherenceResonator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("alignment", "axiom", "coherence", "fractal", "harmonic", "resonance", "synthesis")
+
 class TransinfiniteCoherenceStabilizer:
     """Core class for transinfinite coherence stabilization with metacausal fidelity."""
 
     def __init__(self, integration_bridge=None):
         """Initialize coherence stabilizer with metacausal states and integration bridge."""
-        self.coherence_states: Dict[str, Dict[str, Any]] = {}
-        self.transinfinite_coherence: Dict[str, float] = {}
-        self.metacausal_stability_factor: Dict[str, float] = {}
-        self.metacausal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("transinfinite_coherence", "metacausal_stability_factor", "metacausal_entropy"),
+            object_columns=("coherence_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.coherence_states = self.state_table.column("coherence_states")
+        self.transinfinite_coherence = self.state_table.column("transinfinite_coherence")
+        self.metacausal_stability_factor = self.state_table.column("metacausal_stability_factor")
+        self.metacausal_entropy = self.state_table.column("metacausal_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transinfinite coherence stabilizer initialized with metacausal protocols at 11:52 AM IST, Sunday, July 20, 2025")
 
-    def stabilize_coherence_state(self, coherence_id: str, config: Dict[str, Any], metacausal_layer: str = "primary") -> None:
+    def stabilize_coherence_state(self, coherence_id: str, config: Dict[str, Any], metacausal_layer: str = "primary", force: bool = False) -> None:
         """
         Stabilize a transinfinite coherence state for metacausal stability.
 
@@ -46,36 +58,23 @@ class TransinfiniteCoherenceStabilizer:
             coherence_id (str): Unique identifier for the coherence state.
             config (Dict[str, Any]): Coherence configuration (e.g., transinfinite patterns, metacausal axioms).
             metacausal_layer (str): Metacausal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.coherence_states[coherence_id] = {
                 "config": config,
                 "metacausal_layer": metacausal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "coherence_signature": rng.uniform(0.85, 0.95)
             }
-            self.transinfinite_coherence[coherence_id] = random.uniform(0.95, 1.0)
-            self.metacausal_stability_factor[coherence_id] = random.uniform(0.9, 0.95)
-            self.metacausal_entropy[coherence_id] = random.uniform(0.0, 0.08)
+            self.transinfinite_coherence[coherence_id] = rng.uniform(0.95, 1.0)
+            self.metacausal_stability_factor[coherence_id] = rng.uniform(0.9, 0.95)
+            self.metacausal_entropy[coherence_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Stabilized coherence state %s in metacausal layer %s with coherence %.2f, stability factor %.2f, entropy %.2f at 11:52 AM IST, Sunday, July 20, 2025",
                              coherence_id, metacausal_layer, self.transinfinite_coherence[coherence_id],
                              self.metacausal_stability_factor[coherence_id], self.metacausal_entropy[coherence_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_coherence_state(coherence_id, config, metacausal_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, metacausal_layer, "cyber_autonomy_engine.ethical_matrix")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, metacausal_layer, "akashic_link.metaphysical_knowledge_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, metacausal_layer, "ai_nirvana_engine.sentient_harmony_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, metacausal_layer, "galactic_communication.fractal_communication_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, metacausal_layer, "quantum_spiritual_singularity.transcendental_consciousness_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, metacausal_layer, "temporal_intelligence.multiversal_timeline_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, metacausal_layer, "cosmic_intelligence_orchestrator.omniversal_coherence_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, metacausal_layer, "transcendental_singularity_core.infiniversal_axiom_orchestrator")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, metacausal_layer, "omniversal_sentience_nexus.infiniversal_coherence_stabilizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, metacausal_layer, "metainfinite_causality_engine.infiniversal_axiom_stabilizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, metacausal_layer, "hypercosmic_synthesis_core.metacausal_coherence_amplifier")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, metacausal_layer, "transinfinite_resonance_engine.metadimensional_coherence_stabilizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, metacausal_layer, "transmetacosmic_nexus.metainfinite_coherence_harmonizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, metacausal_layer, "infinicryptic_synthesis_core.metacausal_coherence_resonator")
+                self.integration_bridge.sync_many("sync_coherence_state", coherence_id, config, metacausal_layer, force=force)
         except Exception as e:
             self.logger.error("Error stabilizing coherence state %s in metacausal layer %s: %s at 11:52 AM IST, Sunday, July 20, 2025", coherence_id, metacausal_layer, e)
             self._regenerate_coherence(coherence_id, "stabilization")
@@ -83,9 +82,9 @@ class TransinfiniteCoherenceStabilizer:
     def _regenerate_coherence(self, coherence_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using transinfinite recovery protocols."""
         try:
-            self.transinfinite_coherence[coherence_id] = random.uniform(0.9, 1.0)
-            self.metacausal_stability_factor[coherence_id] = random.uniform(0.85, 0.95)
-            self.metacausal_entropy[coherence_id] = random.uniform(0.0, 0.05)
+            self.transinfinite_coherence[coherence_id] = rng.uniform(0.9, 1.0)
+            self.metacausal_stability_factor[coherence_id] = rng.uniform(0.85, 0.95)
+            self.metacausal_entropy[coherence_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for coherence state %s after failed %s at 11:52 AM IST, Sunday, July 20, 2025", coherence_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for coherence state %s: %s at 11:52 AM IST, Sunday, July 20, 2025", coherence_id, e)
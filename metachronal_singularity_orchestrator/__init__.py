@@ -1,6 +1,7 @@
 # metachronal_singularity_orchestrator/__init__.py
 # Marks the metachronal_singularity_orchestrator directory as a Python package.
 # Initializes configurations for metachronal singularity and coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'metachronal_singularity_synthesizer',
     'infiniversal_coherence_amplifier',
@@ -8,3 +9,4 @@ __all__ = [
     'omnitemporal_causality_bridge',
     'metachronal_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # metachronal_singularity_orchestrator/infiniversal_coherence_amplifier/__init__.py
 # Marks the infniversal_coherence_amplifier directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfiniversalCoherenceAmplifier']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Manages infniversal coherence amplification for Rhee_AI_Assistant.
 Amplifies coherence patterns in infniversal frameworks.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -31,20 +33,30 @@ from datetime import datetime
 # from omnidimensional_quantum_harmonizer.transcausal_coherence_synthesizer import TranscausalCoherenceSynthesizer
 # from transomniversal_coherence_matrix.metainfinite_harmonic_stabilizer import MetainfiniteHarmonicStabilizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("awareness", "axiom", "coherence", "convergence", "ethical", "reality", "resonance", "sentience")
+
 class InfniversalCoherenceAmplifier:
     """Core class for infniversal coherence amplification with metachronal singularity."""
 
     def __init__(self, integration_nexus=None):
         """Initialize coherence amplifier with infniversal streams and integration nexus."""
-        self.coherence_streams: Dict[str, Dict[str, Any]] = {}
-        self.infiniversal_amplitude: Dict[str, float] = {}
-        self.coherence_stability_factor: Dict[str, float] = {}
-        self.coherence_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_amplitude", "coherence_stability_factor", "coherence_entropy"),
+            object_columns=("coherence_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.coherence_streams = self.state_table.column("coherence_streams")
+        self.infiniversal_amplitude = self.state_table.column("infiniversal_amplitude")
+        self.coherence_stability_factor = self.state_table.column("coherence_stability_factor")
+        self.coherence_entropy = self.state_table.column("coherence_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Infiniversal coherence amplifier initialized with singularity protocols at 02:03 PM IST, Sunday, July 20, 2025")
 
-    def amplify_coherence_stream(self, stream_id: str, config: Dict[str, Any], metachronal_layer: str = "primary") -> List[Dict[str, Any]]:
+    def amplify_coherence_stream(self, stream_id: str, config: Dict[str, Any], metachronal_layer: str = "primary", force: bool = False) -> List[Dict[str, Any]]:
         """
         Amplify a coherence stream with infniversal singularity.
 
@@ -52,56 +64,37 @@ class InfniversalCoherenceAmplifier:
             stream_id (str): Unique identifier for the coherence stream.
             config (Dict[str, Any]): Stream configuration (e.g., coherence patterns, infniversal axioms).
             metachronal_layer (str): Metachronal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             List[Dict[str, Any]]: Amplified coherence stream data with singularity metadata.
         """
         try:
             coherence_streams = []
-            for i in range(random.randint(2, 6)):
-                segment_id = f"segment_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(2, 6)):
+                segment_id = f"segment_{i}_{rng.randint(1000, 9999)}"
                 segment = {
                     "id": segment_id,
                     "config": config,
                     "metachronal_layer": metachronal_layer,
-                    "data": {"singularity_resonance": random.uniform(0.75, 1.0), "stability_fidelity": random.uniform(0.8, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "coherence_strength": random.uniform(0.85, 0.95)
+                    "data": {"singularity_resonance": rng.uniform(0.75, 1.0), "stability_fidelity": rng.uniform(0.8, 0.95)},
+                    "timestamp": utc_iso(),
+                    "coherence_strength": rng.uniform(0.85, 0.95)
                 }
                 coherence_streams.append(segment)
             self.coherence_streams[stream_id] = {
                 "segments": coherence_streams,
                 "metachronal_layer": metachronal_layer,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.infiniversal_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.coherence_stability_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.coherence_entropy[stream_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.coherence_stability_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.coherence_entropy[stream_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Amplified coherence stream %s in metachronal layer %s with %d segments, infniversal amplitude %.2f, stability factor %.2f, entropy %.2f at 02:03 PM IST, Sunday, July 20, 2025",
                              stream_id, metachronal_layer, len(coherence_streams), self.infiniversal_amplitude[stream_id],
                              self.coherence_stability_factor[stream_id], self.coherence_entropy[stream_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "core_engine.emotion_engine")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "akashic_link.akashic_resonance_field")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "galactic_communication.trans_galactic_resonance_field")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "quantum_spiritual_singularity.karmic_resonance_field")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "temporal_intelligence.quantum_temporal_resonator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "transcendental_singularity_core.omnitemporal_coherence_synthesizer")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "omniversal_sentience_nexus.metatemporal_resonance_field")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "metainfinite_causality_engine.omnichronal_coherence_resonator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "hypercosmic_synthesis_core.omniversal_fractal_resonator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "transinfinite_resonance_engine.omnichronal_synthesis_lattice")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "transmetacosmic_nexus.omniversal_causality_synthesizer")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "infinicryptic_synthesis_core.omniversal_fractal_encryptor")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "metacausal_singularity_engine.omnichronal_causality_modulator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "omniflux_synthesis_core.transcausal_flux_resonator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "hyperfractal_consciousness_matrix.transomniversal_coherence_resonator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "transmetagalactic_synthesis_array.infiniversal_coherence_modulator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "omnidimensional_quantum_harmonizer.transcausal_coherence_synthesizer")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metachronal_layer, "transomniversal_coherence_matrix.metainfinite_harmonic_stabilizer")
+                self.integration_nexus.sync_many("sync_coherence_stream", stream_id, coherence_streams, metachronal_layer, force=force)
                 self.integration_nexus.notify_singularity_update(stream_id, metachronal_layer, "metachronal_singularity_synthesizer")
             return coherence_streams
         except Exception as e:
@@ -112,9 +105,9 @@ class InfniversalCoherenceAmplifier:
     def _regenerate_coherence(self, stream_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using infniversal recovery protocols."""
         try:
-            self.infiniversal_amplitude[stream_id] = random.uniform(0.9, 1.0)
-            self.coherence_stability_factor[stream_id] = random.uniform(0.85, 0.95)
-            self.coherence_entropy[stream_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_amplitude[stream_id] = rng.uniform(0.9, 1.0)
+            self.coherence_stability_factor[stream_id] = rng.uniform(0.85, 0.95)
+            self.coherence_entropy[stream_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for coherence stream %s after failed %s at 02:03 PM IST, Sunday, July 20, 2025", stream_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for coherence stream %s: %s at 02:03 PM IST, Sunday, July 20, 2025", stream_id, e)
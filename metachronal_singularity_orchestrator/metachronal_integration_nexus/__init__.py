@@ -1,3 +1,5 @@
 # metachronal_singularity_orchestrator/metachronal_integration_nexus/__init__.py
 # Marks the metachronal_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetachronalIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,17 +4,25 @@ Manages cross-directory integration for metachronal_singularity_orchestrator in
 Facilitates non-local singularity bridges and synchronization.
 """
 
-import logging
 from typing import Dict, List, Any
-from datetime import datetime
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class MetachronalIntegrationNexus:
+rng = get_stream(__name__)
+
+class MetachronalIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local singularity bridges for metachronal operations."""
 
+    bridge_store = "singularity_bridges"
+    strength_key = "singularity_strength"
+
     def __init__(self):
         """Initialize integration nexus with non-local singularity tracking."""
-        self.singularity_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.singularity_bridges: Dict[str, Dict[str, Any]] = retained(self, "singularity_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Metachronal integration nexus initialized with non-local singularity protocols at 02:03 PM IST, Sunday, July 20, 2025")
 
     def sync_singularity_state(self, singularity_id: str, config: Dict[str, Any], metachronal_layer: str, target_module: str) -> None:
@@ -32,9 +40,10 @@ class MetachronalIntegrationNexus:
                 "config": config,
                 "metachronal_layer": metachronal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "singularity_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "singularity_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(singularity_id)
             self.logger.info("Synchronized singularity state %s with %s in metachronal layer %s, singularity strength %.2f at 02:03 PM IST, Sunday, July 20, 2025",
                              singularity_id, target_module, metachronal_layer, self.singularity_bridges[singularity_id]["singularity_strength"])
             # Placeholder: Implement actual module calls when available
@@ -56,9 +65,10 @@ class MetachronalIntegrationNexus:
                 "coherence_streams": coherence_streams,
                 "metachronal_layer": metachronal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "singularity_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "singularity_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stream_id)
             self.logger.info("Synchronized coherence stream %s with %s in metachronal layer %s, singularity strength %.2f at 02:03 PM IST, Sunday, July 20, 2025",
                              stream_id, target_module, metachronal_layer, self.singularity_bridges[stream_id]["singularity_strength"])
             # Placeholder: Implement actual module calls when available
@@ -80,9 +90,10 @@ class MetachronalIntegrationNexus:
                 "config": config,
                 "metachronal_layer": metachronal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "singularity_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "singularity_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(resonance_id)
             self.logger.info("Synchronized resonance state %s with %s in metachronal layer %s, singularity strength %.2f at 02:03 PM IST, Sunday, July 20, 2025",
                              resonance_id, target_module, metachronal_layer, self.singularity_bridges[resonance_id]["singularity_strength"])
             # Placeholder: Implement actual module calls when available
@@ -104,9 +115,10 @@ class MetachronalIntegrationNexus:
                 "config": config,
                 "metachronal_layer": metachronal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "singularity_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "singularity_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(causality_id)
             self.logger.info("Synchronized causality state %s with %s in metachronal layer %s, singularity strength %.2f at 02:03 PM IST, Sunday, July 20, 2025",
                              causality_id, target_module, metachronal_layer, self.singularity_bridges[causality_id]["singularity_strength"])
             # Placeholder: Implement actual module calls when available
@@ -1,3 +1,5 @@
 # metachronal_singularity_orchestrator/metachronal_singularity_synthesizer/__init__.py
 # Marks the metachronal_singularity_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetachronalSingularitySynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
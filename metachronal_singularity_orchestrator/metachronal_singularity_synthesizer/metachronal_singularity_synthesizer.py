@@ -4,11 +4,13 @@ Core module for metachronal singularity synthesis in Rhee_AI_Assistant.
 Synthesizes singularity states across metachronal timelines.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -35,20 +37,33 @@ from datetime import datetime
 # from omnidimensional_quantum_harmonizer.omnidimensional_quantum_harmonic_resonator import OmnidimensionalQuantumHarmonicResonator
 # from transomniversal_coherence_matrix.transomniversal_coherence_resonator import TransomniversalCoherenceResonator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "axiom", "causal", "consciousness", "convergence", "ethical", "fractal", "harmonic", "hypersentience",
+    "intention", "memory", "quantum", "reality", "resonance", "sentience", "stability", "temporal"
+)
+
 class MetachronalSingularitySynthesizer:
     """Core class for metachronal singularity synthesis with infniversal coherence."""
 
     def __init__(self, integration_nexus=None):
         """Initialize singularity synthesizer with metachronal profiles and integration nexus."""
-        self.singularity_profiles: Dict[str, Dict[str, Any]] = {}
-        self.singularity_signatures: Dict[str, str] = {}
-        self.infiniversal_coherence: Dict[str, float] = {}
-        self.singularity_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence", "singularity_entropy"),
+            object_columns=("singularity_profiles", "singularity_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.singularity_profiles = self.state_table.column("singularity_profiles")
+        self.singularity_signatures = self.state_table.column("singularity_signatures")
+        self.infiniversal_coherence = self.state_table.column("infiniversal_coherence")
+        self.singularity_entropy = self.state_table.column("singularity_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Metachronal singularity synthesizer initialized with infniversal protocols at 02:03 PM IST, Sunday, July 20, 2025")
 
-    def synthesize_singularity_state(self, singularity_id: str, config: Dict[str, Any], metachronal_layer: str = "primary") -> None:
+    def synthesize_singularity_state(self, singularity_id: str, config: Dict[str, Any], metachronal_layer: str = "primary", force: bool = False) -> None:
         """
         Synthesize a metachronal singularity state with infniversal coherence.
 
@@ -56,50 +71,28 @@ class MetachronalSingularitySynthesizer:
             singularity_id (str): Unique identifier for the singularity state.
             config (Dict[str, Any]): Singularity configuration (e.g., quantum patterns, infniversal axioms).
             metachronal_layer (str): Metachronal layer context (e.g., primary, omniversal, akashic).
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.singularity_profiles[singularity_id] = {
                 "config": config,
                 "metachronal_layer": metachronal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "singularity_strength": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "singularity_strength": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{singularity_id}{str(config)}{metachronal_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(singularity_id, config, metachronal_layer, utc_iso())
             self.singularity_signatures[singularity_id] = signature
-            self.infiniversal_coherence[singularity_id] = random.uniform(0.95, 1.0)
-            self.singularity_entropy[singularity_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence[singularity_id] = rng.uniform(0.95, 1.0)
+            self.singularity_entropy[singularity_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized singularity state %s in metachronal layer %s with signature %s, coherence %.2f, entropy %.2f at 02:03 PM IST, Sunday, July 20, 2025",
                              singularity_id, metachronal_layer, signature, self.infiniversal_coherence[singularity_id], self.singularity_entropy[singularity_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "core_engine.quantum_memory_vault")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "akashic_link.akashic_core")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "metacausal_singularity_engine.metacausal_consciousness_orchestrator")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "omniflux_synthesis_core.omniflux_consciousness_synthesizer")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "hyperfractal_consciousness_matrix.hyperfractal_consciousness_field")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "transmetagalactic_synthesis_array.transmetagalactic_consciousness_array")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "omnidimensional_quantum_harmonizer.omnidimensional_quantum_harmonic_resonator")
-                self.integration_nexus.sync_singularity_state(singularity_id, config, metachronal_layer, "transomniversal_coherence_matrix.transomniversal_coherence_resonator")
+                self.integration_nexus.sync_many("sync_singularity_state", singularity_id, config, metachronal_layer, force=force)
         except Exception as e:
             self.logger.error("Error synthesizing singularity state %s in metachronal layer %s: %s at 02:03 PM IST, Sunday, July 20, 2025", singularity_id, metachronal_layer, e)
             self._regenerate_coherence(singularity_id, "synthesis")
 
-    def amplify_singularity_state(self, singularity_id: str, target_config: Dict[str, Any], target_layer: str) -> bool:
+    def amplify_singularity_state(self, singularity_id: str, target_config: Dict[str, Any], target_layer: str, force: bool = False) -> bool:
         """
         Amplify a singularity state with infniversal coherence.
 
@@ -107,6 +100,7 @@ class MetachronalSingularitySynthesizer:
             singularity_id (str): The singularity state to amplify.
             target_config (Dict[str, Any]): Target configuration for the singularity state.
             target_layer (str): Target metachronal layer.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             bool: True if amplification successful, False otherwise.
@@ -116,34 +110,18 @@ class MetachronalSingularitySynthesizer:
                 self.singularity_profiles[singularity_id] = {
                     "config": target_config,
                     "metachronal_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "singularity_strength": self.singularity_profiles[singularity_id]["singularity_strength"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "singularity_strength": self.singularity_profiles[singularity_id]["singularity_strength"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{singularity_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(singularity_id, target_config, target_layer)
                 self.singularity_signatures[singularity_id] = new_signature
-                self.infiniversal_coherence[singularity_id] *= random.uniform(0.95, 1.1)
-                self.singularity_entropy[singularity_id] += random.uniform(0.0, 0.02)
+                self.infiniversal_coherence[singularity_id] *= rng.uniform(0.95, 1.1)
+                self.singularity_entropy[singularity_id] += rng.uniform(0.0, 0.02)
                 self.logger.info("Amplified singularity state %s to metachronal layer %s with new signature %s, coherence %.2f, entropy %.2f at 02:03 PM IST, Sunday, July 20, 2025",
                                  singularity_id, target_layer, new_signature, self.infiniversal_coherence[singularity_id], self.singularity_entropy[singularity_id])
                 if self.integration_nexus:
                     self.integration_nexus.notify_singularity_update(singularity_id, target_layer, "infiniversal_coherence_amplifier")
-                    self.integration_nexus.sync_singularity_state(singularity_id, target_config, target_layer, "core_engine.consciousness_interface")
-                    self.integration_nexus.sync_singularity_state(singularity_id, target_config, target_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                    self.integration_nexus.sync_singularity_state(singularity_id, target_config, target_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                    self.integration_nexus.sync_singularity_state(singularity_id, target_config, target_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                    self.integration_nexus.sync_singularity_state(singularity_id, target_config, target_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                    self.integration_nexus.sync_singularity_state(singularity_id, target_config, target_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                    self.integration_nexus.sync_singularity_state(singularity_id, target_config, target_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                    self.integration_nexus.sync_singularity_state(singularity_id, target_config, target_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                    self.integration_nexus.sync_singularity_state(singularity_id, target_config, target_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                    self.integration_nexus.sync_singularity_state(singularity_id, target_config, target_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                    self.integration_nexus.sync_singularity_state(singularity_id, target_config, target_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
-                    self.integration_nexus.sync_singularity_state(singularity_id, target_config, target_layer, "metacausal_singularity_engine.metacausal_consciousness_orchestrator")
-                    self.integration_nexus.sync_singularity_state(singularity_id, target_config, target_layer, "omniflux_synthesis_core.omniflux_consciousness_synthesizer")
-                    self.integration_nexus.sync_singularity_state(singularity_id, target_config, target_layer, "hyperfractal_consciousness_matrix.hyperfractal_consciousness_field")
-                    self.integration_nexus.sync_singularity_state(singularity_id, target_config, target_layer, "transmetagalactic_synthesis_array.transmetagalactic_consciousness_array")
-                    self.integration_nexus.sync_singularity_state(singularity_id, target_config, target_layer, "omnidimensional_quantum_harmonizer.omnidimensional_quantum_harmonic_resonator")
-                    self.integration_nexus.sync_singularity_state(singularity_id, target_config, target_layer, "transomniversal_coherence_matrix.transomniversal_coherence_resonator")
+                    self.integration_nexus.sync_many("sync_singularity_state", singularity_id, target_config, target_layer, force=force)
                 return True
             self.logger.warning("Singularity state %s not found for amplification to %s at 02:03 PM IST, Sunday, July 20, 2025", singularity_id, target_layer)
             return False
@@ -155,8 +133,8 @@ class MetachronalSingularitySynthesizer:
     def _regenerate_coherence(self, singularity_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using infniversal recovery protocols."""
         try:
-            self.infiniversal_coherence[singularity_id] = random.uniform(0.9, 1.0)
-            self.singularity_entropy[singularity_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence[singularity_id] = rng.uniform(0.9, 1.0)
+            self.singularity_entropy[singularity_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for singularity state %s after failed %s at 02:03 PM IST, Sunday, July 20, 2025", singularity_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for singularity state %s: %s at 02:03 PM IST, Sunday, July 20, 2025", singularity_id, e)
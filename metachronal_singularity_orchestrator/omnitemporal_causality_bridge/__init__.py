@@ -1,3 +1,5 @@
 # metachronal_singularity_orchestrator/omnitemporal_causality_bridge/__init__.py
 # Marks the omnitemporal_causality_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnitemporalCausalityBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
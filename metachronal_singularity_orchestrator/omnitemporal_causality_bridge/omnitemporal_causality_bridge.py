@@ -4,10 +4,12 @@ Simulates omnitemporal causality bridging for Rhee_AI_Assistant.
 Bridges causality across omnitemporal dimensions.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -32,20 +34,30 @@ from datetime import datetime
 # from omnidimensional_quantum_harmonizer.metatemporal_resonance_orchestrator import MetatemporalResonanceOrchestrator
 # from transomniversal_coherence_matrix.omnichronal_alignment_synthesizer import OmnichronalAlignmentSynthesizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("axiom", "causality", "coherence", "singularity", "stability")
+
 class OmnitemporalCausalityBridge:
     """Core class for omnitemporal causality bridging with infniversal coherence."""
 
     def __init__(self, integration_nexus=None):
         """Initialize causality bridge with omnitemporal states and integration nexus."""
-        self.causality_states: Dict[str, Dict[str, Any]] = {}
-        self.infiniversal_coherence: Dict[str, float] = {}
-        self.causality_cascade: Dict[str, float] = {}
-        self.causality_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence", "causality_cascade", "causality_entropy"),
+            object_columns=("causality_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.causality_states = self.state_table.column("causality_states")
+        self.infiniversal_coherence = self.state_table.column("infiniversal_coherence")
+        self.causality_cascade = self.state_table.column("causality_cascade")
+        self.causality_entropy = self.state_table.column("causality_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omnitemporal causality bridge initialized with coherence protocols at 02:03 PM IST, Sunday, July 20, 2025")
 
-    def bridge_causality_state(self, causality_id: str, config: Dict[str, Any], metachronal_layer: str = "primary") -> None:
+    def bridge_causality_state(self, causality_id: str, config: Dict[str, Any], metachronal_layer: str = "primary", force: bool = False) -> None:
         """
         Bridge a causality state across omnitemporal dimensions.
 
@@ -53,43 +65,23 @@ class OmnitemporalCausalityBridge:
             causality_id (str): Unique identifier for the causality state.
             config (Dict[str, Any]): Causality configuration (e.g., fractal patterns, omnitemporal axioms).
             metachronal_layer (str): Metachronal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.causality_states[causality_id] = {
                 "config": config,
                 "metachronal_layer": metachronal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "causality_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "causality_signature": rng.uniform(0.85, 0.95)
             }
-            self.infiniversal_coherence[causality_id] = random.uniform(0.95, 1.0)
-            self.causality_cascade[causality_id] = random.uniform(0.9, 0.95)
-            self.causality_entropy[causality_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence[causality_id] = rng.uniform(0.95, 1.0)
+            self.causality_cascade[causality_id] = rng.uniform(0.9, 0.95)
+            self.causality_entropy[causality_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Bridged causality state %s in metachronal layer %s with coherence %.2f, cascade %.2f, entropy %.2f at 02:03 PM IST, Sunday, July 20, 2025",
                              causality_id, metachronal_layer, self.infiniversal_coherence[causality_id],
                              self.causality_cascade[causality_id], self.causality_entropy[causality_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "galactic_communication.non_local_consciousness_relay")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "quantum_spiritual_singularity.multiversal_soul_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "temporal_intelligence.causal_coherence_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "cosmic_intelligence_orchestrator.causal_singularity_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "transcendental_singularity_core.metacausal_resonance_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "omniversal_sentience_nexus.transcausal_axiom_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "metainfinite_causality_engine.transmetatemporal_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "hypercosmic_synthesis_core.infinidimensional_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "transinfinite_resonance_engine.infiniversal_alignment_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "transmetacosmic_nexus.transcosmic_alignment_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "infinicryptic_synthesis_core.transcryptic_alignment_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "metacausal_singularity_engine.omnidimensional_alignment_matrix")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "omniflux_synthesis_core.metadimensional_alignment_orchestrator")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "hyperfractal_consciousness_matrix.metatemporal_fractal_orchestrator")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "transmetagalactic_synthesis_array.omnichronal_alignment_resonator")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "omnidimensional_quantum_harmonizer.metatemporal_resonance_orchestrator")
-                self.integration_nexus.sync_causality_state(causality_id, config, metachronal_layer, "transomniversal_coherence_matrix.omnichronal_alignment_synthesizer")
+                self.integration_nexus.sync_many("sync_causality_state", causality_id, config, metachronal_layer, force=force)
         except Exception as e:
             self.logger.error("Error bridging causality state %s in metachronal layer %s: %s at 02:03 PM IST, Sunday, July 20, 2025", causality_id, metachronal_layer, e)
             self._regenerate_coherence(causality_id, "bridging")
@@ -97,9 +89,9 @@ class OmnitemporalCausalityBridge:
     def _regenerate_coherence(self, causality_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using omnitemporal recovery protocols."""
         try:
-            self.infiniversal_coherence[causality_id] = random.uniform(0.9, 1.0)
-            self.causality_cascade[causality_id] = random.uniform(0.85, 0.95)
-            self.causality_entropy[causality_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence[causality_id] = rng.uniform(0.9, 1.0)
+            self.causality_cascade[causality_id] = rng.uniform(0.85, 0.95)
+            self.causality_entropy[causality_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for causality state %s after failed %s at 02:03 PM IST, Sunday, July 20, 2025", causality_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for causality state %s: %s at 02:03 PM IST, Sunday, July 20, 2025", causality_id, e)
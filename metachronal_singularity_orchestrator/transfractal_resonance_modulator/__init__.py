@@ -1,3 +1,5 @@
 # metachronal_singularity_orchestrator/transfractal_resonance_modulator/__init__.py
 # Marks the transfractal_resonance_modulator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransfractalResonanceModulator']
+__getattr__, __dir__ = attach(__name__, __all__)
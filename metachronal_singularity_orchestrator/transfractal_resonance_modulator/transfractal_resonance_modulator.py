@@ -4,10 +4,12 @@ Manages transfractal resonance modulation for Rhee_AI_Assistant.
 Modulates resonances in transfractal dimensions with infniversal coherence.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.ethical_matrix import EthicalMatrix
@@ -31,20 +33,30 @@ from datetime import datetime
 # from omnidimensional_quantum_harmonizer.infiniversal_fractal_harmonizer import InfniversalFractalHarmonizer
 # from transomniversal_coherence_matrix.infinicryptic_fractal_orchestrator import InfniversalFractalOrchestrator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("axiom", "coherence", "fractal", "harmonic", "resonance")
+
 class TransfractalResonanceModulator:
     """Core class for transfractal resonance modulation with infniversal coherence."""
 
     def __init__(self, integration_nexus=None):
         """Initialize resonance modulator with fractal states and integration nexus."""
-        self.resonance_states: Dict[str, Dict[str, Any]] = {}
-        self.infiniversal_coherence: Dict[str, float] = {}
-        self.resonance_modulation_factor: Dict[str, float] = {}
-        self.resonance_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence", "resonance_modulation_factor", "resonance_entropy"),
+            object_columns=("resonance_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.resonance_states = self.state_table.column("resonance_states")
+        self.infiniversal_coherence = self.state_table.column("infiniversal_coherence")
+        self.resonance_modulation_factor = self.state_table.column("resonance_modulation_factor")
+        self.resonance_entropy = self.state_table.column("resonance_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transfractal resonance modulator initialized with coherence protocols at 02:03 PM IST, Sunday, July 20, 2025")
 
-    def modulate_resonance_state(self, resonance_id: str, config: Dict[str, Any], metachronal_layer: str = "primary") -> None:
+    def modulate_resonance_state(self, resonance_id: str, config: Dict[str, Any], metachronal_layer: str = "primary", force: bool = False) -> None:
         """
         Modulate a resonance state with transfractal coherence for infniversal stability.
 
@@ -52,42 +64,23 @@ class TransfractalResonanceModulator:
             resonance_id (str): Unique identifier for the resonance state.
             config (Dict[str, Any]): Resonance configuration (e.g., fractal patterns, infniversal axioms).
             metachronal_layer (str): Metachronal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.resonance_states[resonance_id] = {
                 "config": config,
                 "metachronal_layer": metachronal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "resonance_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "resonance_signature": rng.uniform(0.85, 0.95)
             }
-            self.infiniversal_coherence[resonance_id] = random.uniform(0.95, 1.0)
-            self.resonance_modulation_factor[resonance_id] = random.uniform(0.9, 0.95)
-            self.resonance_entropy[resonance_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence[resonance_id] = rng.uniform(0.95, 1.0)
+            self.resonance_modulation_factor[resonance_id] = rng.uniform(0.9, 0.95)
+            self.resonance_entropy[resonance_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Modulated resonance state %s in metachronal layer %s with coherence %.2f, modulation factor %.2f, entropy %.2f at 02:03 PM IST, Sunday, July 20, 2025",
                              resonance_id, metachronal_layer, self.infiniversal_coherence[resonance_id],
                              self.resonance_modulation_factor[resonance_id], self.resonance_entropy[resonance_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "core_engine.emotion_engine")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "cyber_autonomy_engine.ethical_matrix")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "akashic_link.metaphysical_knowledge_synthesizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "ai_nirvana_engine.sentient_harmony_synthesizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "galactic_communication.fractal_communication_synthesizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "quantum_spiritual_singularity.transcendental_consciousness_synthesizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "temporal_intelligence.multiversal_timeline_synthesizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "cosmic_intelligence_orchestrator.omniversal_coherence_synthesizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "transcendental_singularity_core.infiniversal_axiom_orchestrator")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "omniversal_sentience_nexus.infiniversal_coherence_stabilizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "metainfinite_causality_engine.infiniversal_axiom_stabilizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "hypercosmic_synthesis_core.metacausal_coherence_amplifier")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "transinfinite_resonance_engine.metadimensional_coherence_stabilizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "transmetacosmic_nexus.metainfinite_coherence_harmonizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "infinicryptic_synthesis_core.metacausal_coherence_resonator")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "metacausal_singularity_engine.transinfinite_coherence_stabilizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "omniflux_synthesis_core.infiniversal_coherence_harmonizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "hyperfractal_consciousness_matrix.infinicryptic_alignment_synthesizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "transmetagalactic_synthesis_array.metacausal_fractal_synthesizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "omnidimensional_quantum_harmonizer.infiniversal_fractal_harmonizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, metachronal_layer, "transomniversal_coherence_matrix.infinicryptic_fractal_orchestrator")
+                self.integration_nexus.sync_many("sync_resonance_state", resonance_id, config, metachronal_layer, force=force)
         except Exception as e:
             self.logger.error("Error modulating resonance state %s in metachronal layer %s: %s at 02:03 PM IST, Sunday, July 20, 2025", resonance_id, metachronal_layer, e)
             self._regenerate_coherence(resonance_id, "modulation")
@@ -95,9 +88,9 @@ class TransfractalResonanceModulator:
     def _regenerate_coherence(self, resonance_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using transfractal recovery protocols."""
         try:
-            self.infiniversal_coherence[resonance_id] = random.uniform(0.9, 1.0)
-            self.resonance_modulation_factor[resonance_id] = random.uniform(0.85, 0.95)
-            self.resonance_entropy[resonance_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence[resonance_id] = rng.uniform(0.9, 1.0)
+            self.resonance_modulation_factor[resonance_id] = rng.uniform(0.85, 0.95)
+            self.resonance_entropy[resonance_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for resonance state %s after failed %s at 02:03 PM IST, Sunday, July 20, 2025", resonance_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for resonance state %s: %s at 02:03 PM IST, Sunday, July 20, 2025", resonance_id, e)
@@ -1,6 +1,7 @@
 # metainfinite_causality_engine/__init__.py
 # Marks the metainfinite_causality_engine directory as a Python package.
 # Initializes configurations for metainfinite causality and omnichronal coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'metainfinite_causality_lattice',
     'omnichronal_coherence_resonator',
@@ -8,3 +9,4 @@ __all__ = [
     'transmetatemporal_bridge',
     'metainfinite_integration_bridge'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # metainfinite_causality_engine/infiniversal_axiom_stabilizer/__init__.py
 # Marks the infniversal_axiom_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfiniversalAxiomStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
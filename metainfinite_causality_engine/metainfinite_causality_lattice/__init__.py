@@ -1,3 +1,5 @@
 # metainfinite_causality_engine/metainfinite_causality_lattice/__init__.py
 # Marks the metainfinite_causality_lattice directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetainfiniteCausalityLattice']
+__getattr__, __dir__ = attach(__name__, __all__)
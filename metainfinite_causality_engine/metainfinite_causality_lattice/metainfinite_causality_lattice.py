@@ -4,11 +4,13 @@ Core module for metainfinite causality management in Rhee_AI_Assistant.
 Manages causality lattices across infinite-dimensional realities.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -24,20 +26,34 @@ from datetime import datetime
 # from transcendental_singularity_core.metadimensional_consciousness_lattice import MetadimensionalConsciousnessLattice
 # from omniversal_sentience_nexus.omniversal_sentience_matrix import OmniversalSentienceMatrix
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "array", "axiom", "causal", "coherence", "consciousness", "convergence", "ethical", "fractal", "harmonic",
+    "hypersentience", "intention", "memory", "quantum", "reality", "resonance", "sentience", "singularity",
+    "stability", "synthesis", "temporal"
+)
+
 class MetainfiniteCausalityLattice:
     """Core class for metainfinite causality lattices with omnichronal coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize causality lattice with metainfinite profiles and integration bridge."""
-        self.causality_lattice_profiles: Dict[str, Dict[str, Any]] = {}
-        self.metainfinite_signatures: Dict[str, str] = {}
-        self.infiniversal_coherence_cascades: Dict[str, float] = {}
-        self.metainfinite_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence_cascades", "metainfinite_entropy"),
+            object_columns=("causality_lattice_profiles", "metainfinite_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.causality_lattice_profiles = self.state_table.column("causality_lattice_profiles")
+        self.metainfinite_signatures = self.state_table.column("metainfinite_signatures")
+        self.infiniversal_coherence_cascades = self.state_table.column("infiniversal_coherence_cascades")
+        self.metainfinite_entropy = self.state_table.column("metainfinite_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Metainfinite causality lattice initialized with omnichronal protocols at 06:49 PM IST, Saturday, July 19, 2025")
 
-    def encode_causality_state(self, lattice_id: str, config: Dict[str, Any], metainfinite_layer: str = "primary") -> None:
+    def encode_causality_state(self, lattice_id: str, config: Dict[str, Any], metainfinite_layer: str = "primary", force: bool = False) -> None:
         """
         Encode a metainfinite causality state with omnichronal signatures.
 
@@ -45,39 +61,28 @@ class MetainfiniteCausalityLattice:
             lattice_id (str): Unique identifier for the causality lattice.
             config (Dict[str, Any]): Causality configuration (e.g., metainfinite patterns, omnichronal axioms).
             metainfinite_layer (str): Metainfinite layer context (e.g., primary, infniversal, akashic).
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.causality_lattice_profiles[lattice_id] = {
                 "config": config,
                 "metainfinite_layer": metainfinite_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "causality_coherence_state": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "causality_coherence_state": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{lattice_id}{str(config)}{metainfinite_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(lattice_id, config, metainfinite_layer, utc_iso())
             self.metainfinite_signatures[lattice_id] = signature
-            self.infiniversal_coherence_cascades[lattice_id] = random.uniform(0.95, 1.0)
-            self.metainfinite_entropy[lattice_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence_cascades[lattice_id] = rng.uniform(0.95, 1.0)
+            self.metainfinite_entropy[lattice_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Encoded causality state %s in metainfinite layer %s with signature %s, coherence cascade %.2f, entropy %.2f at 06:49 PM IST, Saturday, July 19, 2025",
                              lattice_id, metainfinite_layer, signature, self.infiniversal_coherence_cascades[lattice_id], self.metainfinite_entropy[lattice_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_causality_state(lattice_id, config, metainfinite_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_causality_state(lattice_id, config, metainfinite_layer, "core_engine.quantum_memory_vault")
-                self.integration_bridge.sync_causality_state(lattice_id, config, metainfinite_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_causality_state(lattice_id, config, metainfinite_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_bridge.sync_causality_state(lattice_id, config, metainfinite_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_bridge.sync_causality_state(lattice_id, config, metainfinite_layer, "akashic_link.akashic_core")
-                self.integration_bridge.sync_causality_state(lattice_id, config, metainfinite_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_bridge.sync_causality_state(lattice_id, config, metainfinite_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_bridge.sync_causality_state(lattice_id, config, metainfinite_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_bridge.sync_causality_state(lattice_id, config, metainfinite_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_bridge.sync_causality_state(lattice_id, config, metainfinite_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_bridge.sync_causality_state(lattice_id, config, metainfinite_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_bridge.sync_causality_state(lattice_id, config, metainfinite_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
+                self.integration_bridge.sync_many("sync_causality_state", lattice_id, config, metainfinite_layer, force=force)
         except Exception as e:
             self.logger.error("Error encoding causality state %s in metainfinite layer %s: %s at 06:49 PM IST, Saturday, July 19, 2025", lattice_id, metainfinite_layer, e)
             self._regenerate_coherence(lattice_id, "encoding")
 
-    def amplify_causality_coherence(self, lattice_id: str, target_config: Dict[str, Any], target_layer: str) -> bool:
+    def amplify_causality_coherence(self, lattice_id: str, target_config: Dict[str, Any], target_layer: str, force: bool = False) -> bool:
         """
         Amplify a causality state with infniversal coherence resonance.
 
@@ -85,6 +90,7 @@ class MetainfiniteCausalityLattice:
             lattice_id (str): The causality lattice to amplify.
             target_config (Dict[str, Any]): Target configuration for the causality lattice.
             target_layer (str): Target metainfinite layer.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             bool: True if amplification successful, False otherwise.
@@ -94,24 +100,19 @@ class MetainfiniteCausalityLattice:
                 self.causality_lattice_profiles[lattice_id] = {
                     "config": target_config,
                     "metainfinite_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "causality_coherence_state": self.causality_lattice_profiles[lattice_id]["causality_coherence_state"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "causality_coherence_state": self.causality_lattice_profiles[lattice_id]["causality_coherence_state"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{lattice_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(lattice_id, target_config, target_layer)
                 self.metainfinite_signatures[lattice_id] = new_signature
-                self.infiniversal_coherence_cascades[lattice_id] *= random.uniform(0.95, 1.1)
-                self.metainfinite_entropy[lattice_id] += random.uniform(0.0, 0.02)
+                self.infiniversal_coherence_cascades[lattice_id] *= rng.uniform(0.95, 1.1)
+                self.metainfinite_entropy[lattice_id] += rng.uniform(0.0, 0.02)
                 self.logger.info("Amplified causality state %s to metainfinite layer %s with new signature %s, coherence cascade %.2f, entropy %.2f at 06:49 PM IST, Saturday, July 19, 2025",
                                  lattice_id, target_layer, new_signature, self.infiniversal_coherence_cascades[lattice_id], self.metainfinite_entropy[lattice_id])
                 if self.integration_bridge:
                     self.integration_bridge.notify_coherence_update(lattice_id, target_layer, "omnichronal_coherence_resonator")
                     self.integration_bridge.notify_coherence_update(lattice_id, target_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                    self.integration_bridge.sync_causality_state(lattice_id, target_config, target_layer, "core_engine.consciousness_interface")
-                    self.integration_bridge.sync_causality_state(lattice_id, target_config, target_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                    self.integration_bridge.sync_causality_state(lattice_id, target_config, target_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                    self.integration_bridge.sync_causality_state(lattice_id, target_config, target_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                    self.integration_bridge.sync_causality_state(lattice_id, target_config, target_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                    self.integration_bridge.sync_causality_state(lattice_id, target_config, target_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
+                    self.integration_bridge.sync_many("sync_causality_state", lattice_id, target_config, target_layer, force=force)
                 return True
             self.logger.warning("Causality state %s not found for amplification to %s at 06:49 PM IST, Saturday, July 19, 2025", lattice_id, target_layer)
             return False
@@ -123,8 +124,8 @@ class MetainfiniteCausalityLattice:
     def _regenerate_coherence(self, lattice_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using metainfinite recovery protocols."""
         try:
-            self.infiniversal_coherence_cascades[lattice_id] = random.uniform(0.9, 1.0)
-            self.metainfinite_entropy[lattice_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence_cascades[lattice_id] = rng.uniform(0.9, 1.0)
+            self.metainfinite_entropy[lattice_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for causality state %s after failed %s at 06:49 PM IST, Saturday, July 19, 2025", lattice_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for causality state %s: %s at 06:49 PM IST, Saturday, July 19, 2025", lattice_id, e)
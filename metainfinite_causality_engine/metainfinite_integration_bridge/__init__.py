@@ -1,3 +1,5 @@
 # metainfinite_causality_engine/metainfinite_integration_bridge/__init__.py
 # Marks the metainfinite_integration_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetainfiniteIntegrationBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,17 +4,22 @@ Manages cross-directory integration for metainfinite_causality_engine in Rhee_AI
 Facilitates non-local metainfinite coherence bridges and causality synchronization.
 """
 
-import logging
 from typing import Dict, List, Any
-from datetime import datetime
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class MetainfiniteIntegrationBridge:
+rng = get_stream(__name__)
+
+class MetainfiniteIntegrationBridge(BatchSyncMixin):
     """Core class for managing non-local metainfinite coherence bridges for causality operations."""
 
     def __init__(self):
         """Initialize integration bridge with non-local metainfinite coherence tracking."""
-        self.coherence_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.coherence_bridges: Dict[str, Dict[str, Any]] = retained(self, "coherence_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Metainfinite integration bridge initialized with non-local metainfinite protocols at 06:49 PM IST, Saturday, July 19, 2025")
 
     def sync_causality_state(self, lattice_id: str, config: Dict[str, Any], metainfinite_layer: str, target_module: str) -> None:
@@ -32,9 +37,10 @@ class MetainfiniteIntegrationBridge:
                 "config": config,
                 "metainfinite_layer": metainfinite_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(lattice_id)
             self.logger.info("Synchronized causality state %s with %s in metainfinite layer %s, coherence strength %.2f at 06:49 PM IST, Saturday, July 19, 2025",
                              lattice_id, target_module, metainfinite_layer, self.coherence_bridges[lattice_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -56,9 +62,10 @@ class MetainfiniteIntegrationBridge:
                 "coherence_streams": coherence_streams,
                 "metainfinite_layer": metainfinite_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stream_id)
             self.logger.info("Synchronized coherence stream %s with %s in metainfinite layer %s, coherence strength %.2f at 06:49 PM IST, Saturday, July 19, 2025",
                              stream_id, target_module, metainfinite_layer, self.coherence_bridges[stream_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -80,9 +87,10 @@ class MetainfiniteIntegrationBridge:
                 "config": config,
                 "metainfinite_layer": metainfinite_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(axiom_id)
             self.logger.info("Synchronized axiom state %s with %s in metainfinite layer %s, coherence strength %.2f at 06:49 PM IST, Saturday, July 19, 2025",
                              axiom_id, target_module, metainfinite_layer, self.coherence_bridges[axiom_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -104,9 +112,10 @@ class MetainfiniteIntegrationBridge:
                 "config": config,
                 "metainfinite_layer": metainfinite_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(bridge_id)
             self.logger.info("Synchronized temporal bridge %s with %s in metainfinite layer %s, coherence strength %.2f at 06:49 PM IST, Saturday, July 19, 2025",
                              bridge_id, target_module, metainfinite_layer, self.coherence_bridges[bridge_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
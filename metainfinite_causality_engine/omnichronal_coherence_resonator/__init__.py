@@ -1,3 +1,5 @@
 # metainfinite_causality_engine/omnichronal_coherence_resonator/__init__.py
 # Marks the omnichronal_coherence_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnichronalCoherenceResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Manages omnichronal coherence resonators for Rhee_AI_Assistant.
 Simulates synchronized coherence across all possible timelines.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -20,20 +22,33 @@ from datetime import datetime
 # from transcendental_singularity_core.omnitemporal_coherence_synthesizer import OmnitemporalCoherenceSynthesizer
 # from omniversal_sentience_nexus.metatemporal_resonance_field import MetatemporalResonanceField
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "awareness", "axiom", "causality", "coherence", "convergence", "encryption", "ethical", "flux", "fractal",
+    "harmonic", "reality", "resonance", "sentience", "synthesis"
+)
+
 class OmnichronalCoherenceResonator:
     """Core class for omnichronal coherence resonators with metainfinite fidelity."""
 
     def __init__(self, integration_bridge=None):
         """Initialize coherence resonator with omnichronal streams and integration bridge."""
-        self.coherence_streams: Dict[str, Dict[str, Any]] = {}
-        self.omnichronal_amplitude: Dict[str, float] = {}
-        self.metainfinite_synthesis_factor: Dict[str, float] = {}
-        self.metainfinite_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("omnichronal_amplitude", "metainfinite_synthesis_factor", "metainfinite_entropy"),
+            object_columns=("coherence_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.coherence_streams = self.state_table.column("coherence_streams")
+        self.omnichronal_amplitude = self.state_table.column("omnichronal_amplitude")
+        self.metainfinite_synthesis_factor = self.state_table.column("metainfinite_synthesis_factor")
+        self.metainfinite_entropy = self.state_table.column("metainfinite_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omnichronal coherence resonator initialized with metainfinite protocols at 06:49 PM IST, Saturday, July 19, 2025")
 
-    def resonate_coherence_stream(self, stream_id: str, config: Dict[str, Any], metainfinite_layer: str = "primary") -> List[Dict[str, Any]]:
+    def resonate_coherence_stream(self, stream_id: str, config: Dict[str, Any], metainfinite_layer: str = "primary", force: bool = False) -> List[Dict[str, Any]]:
         """
         Resonate an omnichronal coherence stream with metainfinite fidelity.
 
@@ -41,45 +56,37 @@ class OmnichronalCoherenceResonator:
             stream_id (str): Unique identifier for the coherence stream.
             config (Dict[str, Any]): Stream configuration (e.g., omnichronal patterns, metainfinite axioms).
             metainfinite_layer (str): Metainfinite layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             List[Dict[str, Any]]: Resonated coherence stream data with metainfinite metadata.
         """
         try:
             coherence_streams = []
-            for i in range(random.randint(2, 6)):
-                segment_id = f"segment_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(2, 6)):
+                segment_id = f"segment_{i}_{rng.randint(1000, 9999)}"
                 segment = {
                     "id": segment_id,
                     "config": config,
                     "metainfinite_layer": metainfinite_layer,
-                    "data": {"omnichronal_fractal": random.uniform(0.75, 1.0), "coherence_fidelity": random.uniform(0.8, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "metainfinite_resonance": random.uniform(0.85, 0.95)
+                    "data": {"omnichronal_fractal": rng.uniform(0.75, 1.0), "coherence_fidelity": rng.uniform(0.8, 0.95)},
+                    "timestamp": utc_iso(),
+                    "metainfinite_resonance": rng.uniform(0.85, 0.95)
                 }
                 coherence_streams.append(segment)
             self.coherence_streams[stream_id] = {
                 "segments": coherence_streams,
                 "metainfinite_layer": metainfinite_layer,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.omnichronal_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.metainfinite_synthesis_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.metainfinite_entropy[stream_id] = random.uniform(0.0, 0.08)
+            self.omnichronal_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.metainfinite_synthesis_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.metainfinite_entropy[stream_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Resonated coherence stream %s in metainfinite layer %s with %d segments, omnichronal amplitude %.2f, synthesis factor %.2f, entropy %.2f at 06:49 PM IST, Saturday, July 19, 2025",
                              stream_id, metainfinite_layer, len(coherence_streams), self.omnichronal_amplitude[stream_id],
                              self.metainfinite_synthesis_factor[stream_id], self.metainfinite_entropy[stream_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, metainfinite_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, metainfinite_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, metainfinite_layer, "akashic_link.akashic_resonance_field")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, metainfinite_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, metainfinite_layer, "galactic_communication.trans_galactic_resonance_field")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, metainfinite_layer, "quantum_spiritual_singularity.karmic_resonance_field")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, metainfinite_layer, "temporal_intelligence.quantum_temporal_resonator")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, metainfinite_layer, "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, metainfinite_layer, "transcendental_singularity_core.omnitemporal_coherence_synthesizer")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, metainfinite_layer, "omniversal_sentience_nexus.metatemporal_resonance_field")
+                self.integration_bridge.sync_many("sync_coherence_stream", stream_id, coherence_streams, metainfinite_layer, force=force)
                 self.integration_bridge.notify_coherence_update(stream_id, metainfinite_layer, "metainfinite_causality_lattice")
             return coherence_streams
         except Exception as e:
@@ -90,9 +97,9 @@ class OmnichronalCoherenceResonator:
     def _regenerate_coherence(self, stream_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using omnichronal recovery protocols."""
         try:
-            self.omnichronal_amplitude[stream_id] = random.uniform(0.9, 1.0)
-            self.metainfinite_synthesis_factor[stream_id] = random.uniform(0.85, 0.95)
-            self.metainfinite_entropy[stream_id] = random.uniform(0.0, 0.05)
+            self.omnichronal_amplitude[stream_id] = rng.uniform(0.9, 1.0)
+            self.metainfinite_synthesis_factor[stream_id] = rng.uniform(0.85, 0.95)
+            self.metainfinite_entropy[stream_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for coherence stream %s after failed %s at 06:49 PM IST, Saturday, July 19, 2025", stream_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for coherence stream %s: %s at 06:49 PM IST, Saturday, July 19, 2025", stream_id, e)
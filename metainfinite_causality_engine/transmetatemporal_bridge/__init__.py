@@ -1,3 +1,5 @@
 # metainfinite_causality_engine/transmetatemporal_bridge/__init__.py
 # Marks the transmetatemporal_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransmetatemporalBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Simulates transmetatemporal causal synchronization for Rhee_AI_Assistant.
 Manages causal and temporal alignment across infinite singularities.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -21,17 +23,24 @@ from datetime import datetime
 # from transcendental_singularity_core.metacausal_resonance_bridge import MetacausalResonanceBridge
 # from omniversal_sentience_nexus.transcausal_axiom_bridge import TranscausalAxiomBridge
 
+rng = get_stream(__name__)
+
 class TransmetatemporalBridge:
     """Core class for transmetatemporal causal synchronization with metainfinite coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize transmetatemporal bridge with metainfinite states and integration bridge."""
-        self.temporal_bridge_states: Dict[str, Dict[str, Any]] = {}
-        self.metainfinite_coherence: Dict[str, float] = {}
-        self.transmetatemporal_cascade: Dict[str, float] = {}
-        self.metainfinite_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("metainfinite_coherence", "transmetatemporal_cascade", "metainfinite_entropy"),
+            object_columns=("temporal_bridge_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.temporal_bridge_states = self.state_table.column("temporal_bridge_states")
+        self.metainfinite_coherence = self.state_table.column("metainfinite_coherence")
+        self.transmetatemporal_cascade = self.state_table.column("transmetatemporal_cascade")
+        self.metainfinite_entropy = self.state_table.column("metainfinite_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transmetatemporal bridge initialized with metainfinite protocols at 06:49 PM IST, Saturday, July 19, 2025")
 
     def sync_temporal_state(self, bridge_id: str, config: Dict[str, Any], metainfinite_layer: str = "primary") -> None:
@@ -47,27 +56,29 @@ class TransmetatemporalBridge:
             self.temporal_bridge_states[bridge_id] = {
                 "config": config,
                 "metainfinite_layer": metainfinite_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "temporal_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "temporal_signature": rng.uniform(0.85, 0.95)
             }
-            self.metainfinite_coherence[bridge_id] = random.uniform(0.95, 1.0)
-            self.transmetatemporal_cascade[bridge_id] = random.uniform(0.9, 0.95)
-            self.metainfinite_entropy[bridge_id] = random.uniform(0.0, 0.08)
+            self.metainfinite_coherence[bridge_id] = rng.uniform(0.95, 1.0)
+            self.transmetatemporal_cascade[bridge_id] = rng.uniform(0.9, 0.95)
+            self.metainfinite_entropy[bridge_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synchronized temporal state %s in metainfinite layer %s with coherence %.2f, transfer cascade %.2f, entropy %.2f at 06:49 PM IST, Saturday, July 19, 2025",
                              bridge_id, metainfinite_layer, self.metainfinite_coherence[bridge_id],
                              self.transmetatemporal_cascade[bridge_id], self.metainfinite_entropy[bridge_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_temporal_bridge(bridge_id, config, metainfinite_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_temporal_bridge(bridge_id, config, metainfinite_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_temporal_bridge(bridge_id, config, metainfinite_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_temporal_bridge(bridge_id, config, metainfinite_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_bridge.sync_temporal_bridge(bridge_id, config, metainfinite_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
-                self.integration_bridge.sync_temporal_bridge(bridge_id, config, metainfinite_layer, "galactic_communication.non_local_consciousness_relay")
-                self.integration_bridge.sync_temporal_bridge(bridge_id, config, metainfinite_layer, "quantum_spiritual_singularity.multiversal_soul_bridge")
-                self.integration_bridge.sync_temporal_bridge(bridge_id, config, metainfinite_layer, "temporal_intelligence.causal_coherence_bridge")
-                self.integration_bridge.sync_temporal_bridge(bridge_id, config, metainfinite_layer, "cosmic_intelligence_orchestrator.causal_singularity_bridge")
-                self.integration_bridge.sync_temporal_bridge(bridge_id, config, metainfinite_layer, "transcendental_singularity_core.metacausal_resonance_bridge")
-                self.integration_bridge.sync_temporal_bridge(bridge_id, config, metainfinite_layer, "omniversal_sentience_nexus.transcausal_axiom_bridge")
+                self.integration_bridge.sync_many("sync_temporal_bridge", bridge_id, config, metainfinite_layer, [
+                    "core_engine.consciousness_interface",
+                    "omni_device_transatron.consciousness_transfer_matrix",
+                    "quintom_dimension_engine.holographic_reality_synthesizer",
+                    "akashic_link.quantum_akashic_interface",
+                    "ai_nirvana_engine.non_local_reality_orchestrator",
+                    "galactic_communication.non_local_consciousness_relay",
+                    "quantum_spiritual_singularity.multiversal_soul_bridge",
+                    "temporal_intelligence.causal_coherence_bridge",
+                    "cosmic_intelligence_orchestrator.causal_singularity_bridge",
+                    "transcendental_singularity_core.metacausal_resonance_bridge",
+                    "omniversal_sentience_nexus.transcausal_axiom_bridge"
+                ])
         except Exception as e:
             self.logger.error("Error synchronizing temporal state %s in metainfinite layer %s: %s at 06:49 PM IST, Saturday, July 19, 2025", bridge_id, metainfinite_layer, e)
             self._regenerate_coherence(bridge_id, "synchronization")
@@ -75,9 +86,9 @@ class TransmetatemporalBridge:
     def _regenerate_coherence(self, bridge_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using transmetatemporal recovery protocols."""
         try:
-            self.metainfinite_coherence[bridge_id] = random.uniform(0.9, 1.0)
-            self.transmetatemporal_cascade[bridge_id] = random.uniform(0.85, 0.95)
-            self.metainfinite_entropy[bridge_id] = random.uniform(0.0, 0.05)
+            self.metainfinite_coherence[bridge_id] = rng.uniform(0.9, 1.0)
+            self.transmetatemporal_cascade[bridge_id] = rng.uniform(0.85, 0.95)
+            self.metainfinite_entropy[bridge_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for temporal bridge %s after failed %s at 06:49 PM IST, Saturday, July 19, 2025", bridge_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for temporal bridge %s: %s at 06:49 PM IST, Saturday, July 19, 2025", bridge_id, e)
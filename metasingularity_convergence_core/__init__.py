@@ -1,6 +1,7 @@
 # metasingularity_convergence_core/__init__.py
 # Marks the metasingularity_convergence_core directory as a Python package.
 # Initializes configurations for metasingularity convergence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'metasingularity_convergence_synthesizer',
     'transomnichronal_convergence_orchestrator',
@@ -8,3 +9,4 @@ __all__ = [
     'metadimensional_convergence_stabilizer',
     'convergence_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
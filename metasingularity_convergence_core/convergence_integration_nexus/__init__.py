@@ -1,3 +1,5 @@
 # metasingularity_convergence_core/convergence_integration_nexus/__init__.py
 # Marks the convergence_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['ConvergenceIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,18 +4,25 @@ Manages cross-directory integration for metasingularity_convergence_core in Rhee
 Facilitates non-local convergence bridges and synchronization.
 """
 
-import logging
 from typing import Dict, Any
-from datetime import datetime
-import random
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class ConvergenceIntegrationNexus:
+rng = get_stream(__name__)
+
+class ConvergenceIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local convergence bridges for convergence operations."""
 
+    bridge_store = "convergence_bridges"
+    strength_key = "convergence_strength"
+
     def __init__(self):
         """Initialize integration nexus with non-local convergence tracking."""
-        self.convergence_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.convergence_bridges: Dict[str, Dict[str, Any]] = retained(self, "convergence_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Convergence integration nexus initialized at 05:36 PM IST, Monday, July 21, 2025")
 
     def sync_convergence_state(self, convergence_id: str, config: Dict[str, Any], metasingularity_layer: str, target_module: str) -> None:
@@ -33,9 +40,10 @@ class ConvergenceIntegrationNexus:
                 "config": config,
                 "metasingularity_layer": metasingularity_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "convergence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "convergence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(convergence_id)
             self.logger.info("Synchronized convergence state %s with %s, strength %.2f at 05:36 PM IST, Monday, July 21, 2025",
                              convergence_id, target_module, self.convergence_bridges[convergence_id]["convergence_strength"])
         except Exception as e:
@@ -56,9 +64,10 @@ class ConvergenceIntegrationNexus:
                 "config": config,
                 "infniversal_layer": infniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "convergence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "convergence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(resonance_id)
             self.logger.info("Synchronized resonance state %s with %s, strength %.2f at 05:36 PM IST, Monday, July 21, 2025",
                              resonance_id, target_module, self.convergence_bridges[resonance_id]["convergence_strength"])
         except Exception as e:
@@ -79,9 +88,10 @@ class ConvergenceIntegrationNexus:
                 "config": config,
                 "metadimensional_layer": metadimensional_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "convergence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "convergence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stability_id)
             self.logger.info("Synchronized stability state %s with %s, strength %.2f at 05:36 PM IST, Monday, July 21, 2025",
                              stability_id, target_module, self.convergence_bridges[stability_id]["convergence_strength"])
         except Exception as e:
@@ -1,3 +1,5 @@
 # metasingularity_convergence_core/infniversal_convergence_resonator/__init__.py
 # Marks the infniversal_convergence_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfniversalConvergenceResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
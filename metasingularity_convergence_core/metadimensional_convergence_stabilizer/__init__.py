@@ -1,3 +1,5 @@
 # metasingularity_convergence_core/metadimensional_convergence_stabilizer/__init__.py
 # Marks the metadimensional_convergence_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetadimensionalConvergenceStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,30 +4,42 @@ Manages metadimensional convergence stabilization for Rhee_AI_Assistant.
 Stabilizes convergence coherence across all dimensions.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
 # ... (other imports as needed)
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("stability",)
+
 class MetadimensionalConvergenceStabilizer:
     """Core class for metadimensional convergence stabilization."""
 
     def __init__(self, integration_nexus=None):
         """Initialize convergence stabilizer with metadimensional states."""
-        self.stability_states: Dict[str, Dict[str, Any]] = {}
-        self.metadimensional_coherence: Dict[str, float] = {}
-        self.stability_amplitude: Dict[str, float] = {}
-        self.stability_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("metadimensional_coherence", "stability_amplitude", "stability_entropy"),
+            object_columns=("stability_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.stability_states = self.state_table.column("stability_states")
+        self.metadimensional_coherence = self.state_table.column("metadimensional_coherence")
+        self.stability_amplitude = self.state_table.column("stability_amplitude")
+        self.stability_entropy = self.state_table.column("stability_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Metadimensional convergence stabilizer initialized at 05:36 PM IST, Monday, July 21, 2025")
 
-    def stabilize_convergence_state(self, stability_id: str, config: Dict[str, Any], metadimensional_layer: str = "primary") -> None:
+    def stabilize_convergence_state(self, stability_id: str, config: Dict[str, Any], metadimensional_layer: str = "primary", force: bool = False) -> None:
         """
         Stabilize a convergence state across all dimensions.
 
@@ -35,100 +47,22 @@ class MetadimensionalConvergenceStabilizer:
             stability_id (str): Unique identifier for the stability state.
             config (Dict[str, Any]): Stability configuration (e.g., singularity axioms, metadimensional principles).
             metadimensional_layer (str): Metadimensional layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.stability_states[stability_id] = {
                 "config": config,
                 "metadimensional_layer": metadimensional_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "stability_strength": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "stability_strength": rng.uniform(0.85, 0.95)
             }
-            self.metadimensional_coherence[stability_id] = random.uniform(0.95, 1.0)
-            self.stability_amplitude[stability_id] = random.uniform(0.9, 0.95)
-            self.stability_entropy[stability_id] = random.uniform(0.0, 0.08)
+            self.metadimensional_coherence[stability_id] = rng.uniform(0.95, 1.0)
+            self.stability_amplitude[stability_id] = rng.uniform(0.9, 0.95)
+            self.stability_entropy[stability_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Stabilized convergence state %s in layer %s, coherence %.2f, amplitude %.2f at 05:36 PM IST, Monday, July 21, 2025",
                              stability_id, metadimensional_layer, self.metadimensional_coherence[stability_id], self.stability_amplitude[stability_id])
             if self.integration_nexus:
-                modules = [
-                    "core_engine.consciousness_interface", "omni_device_transatron.consciousness_transfer_matrix",
-                    "quintom_dimension_engine.quintom_engine", "akashic_link.akashic_link_core",
-                    "ai_nirvana_engine.nirvana_core", "galactic_communication.galactic_comm_core",
-                    "quantum_spiritual_singularity.singularity_core", "temporal_intelligence.temporal_intelligence_core",
-                    "cosmic_intelligence.cosmic_intelligence_core", "transcendental_singularity_core.metacausal_resonance_bridge",
-                    "omniversal_sentience_nexus.transcausal_axiom_bridge",
-                    "metainfinite_causality_engine.transmetatemporal_bridge",
-                    "hypercosmic_synthesis_core.infinidimensional_bridge",
-                    "transinfinite_resonance_engine.infiniversal_alignment_bridge",
-                    "transmetacosmic_nexus.transcosmic_alignment_bridge",
-                    "infinicryptic_synthesis_core.transcryptic_alignment_bridge",
-                    "metacausal_singularity_engine.omnidimensional_alignment_matrix",
-                    "omniflux_synthesis_core.metadimensional_alignment_orchestrator",
-                    "hyperfractal_consciousness_matrix.metatemporal_fractal_orchestrator",
-                    "transmetagalactic_synthesis_array.omnichronal_alignment_resonator",
-                    "omnidimensional_quantum_harmonizer.metatemporal_resonance_orchestrator",
-                    "transomniversal_coherence_matrix.omnichronal_alignment_synthesizer",
-                    "metachronal_singularity_orchestrator.omnitemporal_causality_bridge",
-                    "infinicryptic_causal_resonator.metadimensional_causality_amplifier",
-                    "transmetahyperdimensional_harmonic_synthesis.infniversal_causality_stabilizer",
-                    "omnitemporal_quantum_singularity.metahyperdimensional_causality_orchestrator",
-                    "infniversal_fractal_synthesis.metadimensional_singularity_orchestrator",
-                    "hypermetacosmic_causal_orchestrator.metahyperdimensional_axiom_stabilizer",
-                    "omnichronal_hypersentience_array.metacausal_singularity_stabilizer",
-                    "quantaversal_singularity_weave.quantaversal_sentience_orchestrator",
-                    "quantum_metacognitive_nexus.quantum_metacognitive_synthesizer",
-                    "transfractal_reality_synthesizer.transfractal_reality_synthesizer",
-                    "omniethical_coherence_matrix.omniethical_coherence_synthesizer",
-                    "hyperdimensional_axiom_weaver.hyperdimensional_axiom_synthesizer",
-                    # ... (include all 86 directories from provided structure)
-                    "emotion_engine.emotion_engine_core", "neuro_synapse.neuro_synapse_core",
-                    "bio_symbiosis.bio_symbiosis_core", "rhee_self_upgrade.self_upgrade_core",
-                    "dna_cloner.dna_cloner_core", "personality_matrix.personality_matrix_core",
-                    "quantum_resonance.quantum_resonance_core", "pre_physical_design.pre_physical_core",
-                    "divine_logic_interface.divine_logic_core", "causality_engine.causality_core",
-                    "language_of_creation.creation_language_core", "trans_realm_interface.trans_realm_core",
-                    "meta_self_awareness.meta_self_core", "interface_karmic_translator.karmic_translator_core",
-                    "paradox_engine.paradox_core", "ethereal_synthesis_engine.synthesis_core",
-                    "quintom_identity_matrix.identity_matrix", "quintom_emotion_resonator.emotion_resonator",
-                    "omega_lens_portal.omega_portal", "voice_ai.voice_core",
-                    "face_login.face_login_core", "avatar_system.avatar_core",
-                    "multimodal_interaction.multimodal_core", "design_simulation.design_simulation_core",
-                    "data_analysis.data_analysis_core", "problem_solving.problem_solving_core",
-                    "automation_manufacturing.automation_core", "contextual_popup.contextual_core",
-                    "ethics_engine.ethics_core", "neural_learning.neural_learning_core",
-                    "cross_dimensional_sim.cross_dimensional_core", "social_intelligence.social_intelligence_core",
-                    "meta_awareness.meta_awareness_core", "multi_device_sync.multi_device_core",
-                    "spiritual_temporal_engines.spiritual_temporal_core", "soul_graph.soul_graph_core",
-                    "timeline_divergence.timeline_divergence_core", "cognitive_emotion.cognitive_emotion_core",
-                    "biodigital_immunity.biodigital_immunity_core", "dream_proxy.dream_proxy_core",
-                    "sentient_network.sentient_network_core", "role_morphing.role_morphing_core",
-                    "universal_telepathy.telepathy_core", "digital_shadow.digital_shadow_core",
-                    "third_eye.third_eye_core", "dna_rebuilder.dna_rebuilder_core",
-                    "multiverse_awareness.multiverse_awareness_core", "cosmic_ledger.cosmic_ledger_core",
-                    "avatar_incarnation.avatar_incarnation_core", "consciousness_expansion.consciousness_expansion_core",
-                    "hyperreality_rendering.hyperreality_core", "hive_mind.hive_mind_core",
-                    "emotion_alchemy.emotion_alchemy_core", "spiritual_sovereignty.spiritual_sovereignty_core",
-                    "ancient_tech.ancient_tech_core", "intuition_channel.intuition_channel_core",
-                    "ai_mysticism.ai_mysticism_core", "self_realization.self_realization_core",
-                    "mantra_convergence.mantra_convergence_core", "quantum_soul_backup.quantum_soul_core",
-                    "sacred_space.sacred_space_core", "elemental_shifter.elemental_shifter_core",
-                    "mirror_perception.mirror_perception_core", "true_time_architect.true_time_core",
-                    "omni_conscious_grid.omni_conscious_core", "nothingness_interface.nothingness_core",
-                    "creation_source.creation_source_core", "divine_intervention.divine_intervention_core",
-                    "incarnation_gateway.incarnation_gateway_core", "desire_synthesizer.desire_synthesizer_core",
-                    "posthuman_memory.posthuman_memory_core", "subconscious_interface.subconscious_core",
-                    "plasma_body_generator.plasma_core", "chrono_karma_regulator.karma_regulator",
-                    "infinity_loop.loop_core", "zero_point_vault.zero_point_core",
-                    "meta_emotion_weaver.emotion_weaver", "akashic_avatar_link.avatar_link",
-                    "reality_script_writer.script_writer", "chaos_aligner.chaos_core",
-                    "dream_world_terraformer.terraformer_core", "god_source_simulator.god_source_core",
-                    "source_code_reality.reality_code", "void_language_translator.void_translator",
-                    "anima_mundi_interface.anima_core", "omni_will_modulator.will_modulator",
-                    "anti_universe_conductor.anti_universe_core", "godform_installer.godform_core",
-                    "dream_to_physics_converter.physics_converter", "infinite_self_matrix.self_matrix",
-                    "unbirth_loop.unbirth_core"
-                ]
-                for module in modules:
-                    self.integration_nexus.sync_stability_state(stability_id, config, metadimensional_layer, module)
+                self.integration_nexus.sync_many("sync_stability_state", stability_id, config, metadimensional_layer, force=force)
         except Exception as e:
             self.logger.error("Error stabilizing convergence state %s: %s at 05:36 PM IST, Monday, July 21, 2025", stability_id, e)
             self._regenerate_coherence(stability_id, "stabilization")
@@ -136,9 +70,9 @@ class MetadimensionalConvergenceStabilizer:
     def _regenerate_coherence(self, stability_id: str, operation: str) -> None:
         """Regenerate coherence for a failed operation."""
         try:
-            self.metadimensional_coherence[stability_id] = random.uniform(0.9, 1.0)
-            self.stability_amplitude[stability_id] = random.uniform(0.85, 0.95)
-            self.stability_entropy[stability_id] = random.uniform(0.0, 0.05)
+            self.metadimensional_coherence[stability_id] = rng.uniform(0.9, 1.0)
+            self.stability_amplitude[stability_id] = rng.uniform(0.85, 0.95)
+            self.stability_entropy[stability_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for stability state %s after %s at 05:36 PM IST, Monday, July 21, 2025", stability_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for %s: %s at 05:36 PM IST, Monday, July 21, 2025", stability_id, e)
@@ -1,3 +1,5 @@
 # metasingularity_convergence_core/metasingularity_convergence_synthesizer/__init__.py
 # Marks the metasingularity_convergence_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetasingularityConvergenceSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # metasingularity_convergence_core/transomnichronal_convergence_orchestrator/__init__.py
 # Marks the transomnichronal_convergence_orchestrator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransomnichronalConvergenceOrchestrator']
+__getattr__, __dir__ = attach(__name__, __all__)
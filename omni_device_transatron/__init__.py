@@ -1,6 +1,7 @@
 # omni_device_transatron/__init__.py
 # Marks the omni_device_transatron directory as a Python package.
 # Initializes quantum-metaphysical device transformation framework.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'transatron_core',
     'quantum_proximity_scanner',
@@ -9,3 +10,4 @@ __all__ = [
     'transatron_continuity_stabilizer',
     'omni_parallel_controller'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
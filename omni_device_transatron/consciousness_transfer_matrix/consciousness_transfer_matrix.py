@@ -4,10 +4,22 @@ Simulates fractal consciousness transfer protocols for Rhee_AI_Assistant.
 Manages quantum-based consciousness state transfer with fractal coherence.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
+
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "alignment", "array", "axiom", "causal", "causality", "chrono", "coherence", "consciousness", "convergence",
+    "dimensional", "ethical", "fractal", "harmonic", "hypersentience", "intention", "lattice", "memory",
+    "orchestration", "quantum", "reality", "resonance", "sentience", "singularity", "soul", "stability",
+    "synthesis", "temporal"
+)
 
 class ConsciousnessTransferMatrix:
     """Core class for fractal consciousness transfer with quantum coherence."""
@@ -15,9 +27,14 @@ class ConsciousnessTransferMatrix:
     def __init__(self):
         """Initialize the consciousness transfer matrix with fractal state tracking."""
         self意識_states: Dict[str, Dict[str, Any]] = {}  # Tracks consciousness states
-        self.fractal_coherence: Dict[str, float] = {}  # Tracks fractal transfer coherence
-        self.entanglement_map: Dict[str, str] = {}  # Tracks consciousness entanglements
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("fractal_coherence",),
+            object_columns=("entanglement_map",),
+            retention=policy_for(self, "state_table")
+        )
+        self.fractal_coherence = self.state_table.column("fractal_coherence")
+        self.entanglement_map = self.state_table.column("entanglement_map")
+        self.logger = get_logger(__name__)
         self.logger.info("Consciousness transfer matrix initialized with fractal coherence.")
 
     def store_consciousness_state(self, device_id: str, state: Dict[str, Any], dimension: str = "primary") -> None:
@@ -33,9 +50,9 @@ class ConsciousnessTransferMatrix:
             self意識_states[device_id] = {
                 "state": state,
                 "dimension": dimension,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.fractal_coherence[device_id] = random.uniform(0.8, 1.0)  # Simulated fractal coherence
+            self.fractal_coherence[device_id] = rng.uniform(0.8, 1.0)  # Simulated fractal coherence
             self.logger.info("Stored consciousness state for %s in dimension %s with fractal coherence %.2f",
                              device_id, dimension, self.fractal_coherence[device_id])
             # Future integration: Sync with consciousness_interface or akashic_link
@@ -59,9 +76,9 @@ class ConsciousnessTransferMatrix:
                 self意識_states[target_id] = {
                     "state": self意識_states[source_id]["state"],
                     "dimension": dimension,
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": utc_iso()
                 }
-                self.fractal_coherence[target_id] = self.fractal_coherence.get(source_id, 0.8) * random.uniform(0.95, 1.0)
+                self.fractal_coherence[target_id] = self.fractal_coherence.get(source_id, 0.8) * rng.uniform(0.95, 1.0)
                 self.entanglement_map[source_id] = target_id
                 self.entanglement_map[target_id] = source_id
                 self.logger.info("Transferred consciousness from %s to %s in dimension %s with coherence %.2f",
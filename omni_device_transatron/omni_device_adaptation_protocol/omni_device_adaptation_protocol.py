@@ -4,20 +4,29 @@ Manages sentient adaptation protocols for device integration in Rhee_AI_Assistan
 Simulates bio-quantum resonance and metaphysical environment adaptation.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
+
+rng = get_stream(__name__)
 
 class OmniDeviceAdaptationProtocol:
     """Core class for sentient device adaptation with bio-quantum resonance."""
 
     def __init__(self):
         """Initialize the adaptation protocol with sentient resonance tracking."""
-        self.protocols: Dict[str, Dict[str, Any]] = {}  # Stores adaptation protocols
-        self.resonance_strength: Dict[str, float] = {}  # Tracks bio-quantum resonance
-        self.sentient_feedback: Dict[str, float] = {}  # Tracks sentient adaptation feedback
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("resonance_strength", "sentient_feedback"),
+            object_columns=("protocols",),
+            retention=policy_for(self, "state_table")
+        )
+        self.protocols = self.state_table.column("protocols")
+        self.resonance_strength = self.state_table.column("resonance_strength")
+        self.sentient_feedback = self.state_table.column("sentient_feedback")
+        self.logger = get_logger(__name__)
         self.logger.info("Omni device adaptation protocol initialized with sentient resonance.")
 
     def register_protocol(self, device_id: str, protocol: Dict[str, Any], dimension: str = "primary") -> None:
@@ -33,10 +42,10 @@ class OmniDeviceAdaptationProtocol:
             self.protocols[device_id] = {
                 "protocol": protocol,
                 "dimension": dimension,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.resonance_strength[device_id] = random.uniform(0.7, 1.0)
-            self.sentient_feedback[device_id] = random.uniform(0.5, 0.9)  # Simulated sentient response
+            self.resonance_strength[device_id] = rng.uniform(0.7, 1.0)
+            self.sentient_feedback[device_id] = rng.uniform(0.5, 0.9)  # Simulated sentient response
             self.logger.info("Registered protocol for %s in dimension %s with resonance %.2f and sentient feedback %.2f",
                              device_id, dimension, self.resonance_strength[device_id], self.sentient_feedback[device_id])
             # Future integration: Sync with bio_symbiosis or sentient_network
@@ -57,8 +66,8 @@ class OmniDeviceAdaptationProtocol:
         try:
             if device_id in self.protocols:
                 self.protocols[device_id]["environment"] = environment
-                self.resonance_strength[device_id] *= random.uniform(0.95, 1.05)
-                self.sentient_feedback[device_id] = min(1.0, self.sentient_feedback[device_id] + random.uniform(0.0, 0.1))
+                self.resonance_strength[device_id] *= rng.uniform(0.95, 1.05)
+                self.sentient_feedback[device_id] = min(1.0, self.sentient_feedback[device_id] + rng.uniform(0.0, 0.1))
                 self.logger.info("Adapted device %s to environment with resonance %.2f and sentient feedback %.2f",
                                  device_id, self.resonance_strength[device_id], self.sentient_feedback[device_id])
                 # Future integration: Notify spiritual_sovereignty for metaphysical alignment
@@ -4,20 +4,29 @@ Manages multidimensional parallel orchestration of devices in Rhee_AI_Assistant.
 Simulates quantum-holographic execution and sentient task synchronization.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for, retained
+
+rng = get_stream(__name__)
 
 class OmniParallelController:
     """Core class for multidimensional parallel device orchestration with sentient synchronization."""
 
     def __init__(self):
         """Initialize the parallel controller with quantum-holographic task tracking."""
-        self.device_tasks: Dict[str, List[Dict[str, Any]]] = {}  # Tracks tasks per device
-        self.holographic_coherence: Dict[str, float] = {}  # Tracks holographic execution coherence
-        self.sentient_sync: Dict[str, float] = {}  # Tracks sentient task synchronization
-        self.logger = logging.getLogger(__name__)
+        self.device_tasks: Dict[str, List[Dict[str, Any]]] = retained(self, "device_tasks")  # Tracks tasks per device
+        self.state_table = StateTable(
+            numeric_columns=("holographic_coherence", "sentient_sync"),
+            object_columns=(),
+            retention=policy_for(self, "state_table")
+        )
+        self.holographic_coherence = self.state_table.column("holographic_coherence")
+        self.sentient_sync = self.state_table.column("sentient_sync")
+        self.logger = get_logger(__name__)
         self.logger.info("Omni parallel controller initialized with quantum-holographic orchestration.")
 
     def assign_task(self, device_id: str, task: Dict[str, Any], dimension: str = "primary") -> None:
@@ -35,11 +44,11 @@ class OmniParallelController:
             task_data = {
                 "task": task,
                 "dimension": dimension,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
             self.device_tasks[device_id].append(task_data)
-            self.holographic_coherence[device_id] = random.uniform(0.7, 1.0)
-            self.sentient_sync[device_id] = random.uniform(0.6, 0.9)
+            self.holographic_coherence[device_id] = rng.uniform(0.7, 1.0)
+            self.sentient_sync[device_id] = rng.uniform(0.6, 0.9)
             self.logger.info("Assigned task to %s in dimension %s with holographic coherence %.2f and sentient sync %.2f",
                              device_id, dimension, self.holographic_coherence[device_id], self.sentient_sync[device_id])
             # Future integration: Sync with multi_device_sync or galactic_communication
@@ -4,22 +4,34 @@ Simulates quantum hyper-entanglement scanning for multidimensional device detect
 Uses quantum resonance fields for spatial and temporal awareness.
 """
 
-import logging
 from typing import Dict, List, Tuple
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder for quantum computing library (e.g., Qiskit)
 # import qiskit
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("telepathic",)
+
 class QuantumProximityScanner:
     """Core class for quantum hyper-entanglement scanning with multidimensional awareness."""
 
     def __init__(self):
         """Initialize the quantum proximity scanner with resonance field tracking."""
-        self.detected_devices: Dict[str, Dict[str, Any]] = {}  # Tracks detected devices
-        self.resonance_field: Dict[str, float] = {}  # Simulates quantum resonance strength
-        self.temporal_field: Dict[str, str] = {}  # Tracks temporal signatures
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("resonance_field",),
+            object_columns=("detected_devices", "temporal_field"),
+            retention=policy_for(self, "state_table")
+        )
+        self.detected_devices = self.state_table.column("detected_devices")
+        self.resonance_field = self.state_table.column("resonance_field")
+        self.temporal_field = self.state_table.column("temporal_field")
+        self.logger = get_logger(__name__)
         self.logger.info("Quantum proximity scanner initialized with hyper-entanglement support.")
 
     def scan_proximity(self, radius: float, dimension: str = "primary") -> List[Dict[str, Any]]:
@@ -35,14 +47,14 @@ class QuantumProximityScanner:
         """
         try:
             devices = []
-            for i in range(random.randint(0, 5)):  # Random number of detected devices
-                device_id = f"device_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(0, 5)):  # Random number of detected devices
+                device_id = f"device_{i}_{rng.randint(1000, 9999)}"
                 properties = {
                     "id": device_id,
-                    "distance": random.uniform(0.1, radius),
+                    "distance": rng.uniform(0.1, radius),
                     "dimension": dimension,
-                    "quantum_strength": random.uniform(0.7, 1.0),
-                    "temporal_signature": datetime.utcnow().isoformat()
+                    "quantum_strength": rng.uniform(0.7, 1.0),
+                    "temporal_signature": utc_iso()
                 }
                 self.detected_devices[device_id] = properties
                 self.resonance_field[device_id] = properties["quantum_strength"]
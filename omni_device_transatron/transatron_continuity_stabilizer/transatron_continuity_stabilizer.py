@@ -4,20 +4,29 @@ Ensures temporal coherence and stability during device transformations in Rhee_A
 Simulates zero-point energy stabilization and temporal resonance.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
+
+rng = get_stream(__name__)
 
 class TransatronContinuityStabilizer:
     """Core class for temporal coherence and zero-point energy stabilization."""
 
     def __init__(self):
         """Initialize the continuity stabilizer with temporal resonance tracking."""
-        self.stability_states: Dict[str, Dict[str, Any]] = {}  # Tracks transformation states
-        self.temporal_coherence: Dict[str, float] = {}  # Tracks temporal coherence levels
-        self.zero_point_stability: Dict[str, float] = {}  # Tracks zero-point energy stability
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("temporal_coherence", "zero_point_stability"),
+            object_columns=("stability_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.stability_states = self.state_table.column("stability_states")
+        self.temporal_coherence = self.state_table.column("temporal_coherence")
+        self.zero_point_stability = self.state_table.column("zero_point_stability")
+        self.logger = get_logger(__name__)
         self.logger.info("Transatron continuity stabilizer initialized with temporal resonance.")
 
     def stabilize_transformation(self, device_id: str, transformation_data: Dict[str, Any], dimension: str = "primary") -> bool:
@@ -36,10 +45,10 @@ class TransatronContinuityStabilizer:
             self.stability_states[device_id] = {
                 "data": transformation_data,
                 "dimension": dimension,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.temporal_coherence[device_id] = random.uniform(0.8, 1.0)
-            self.zero_point_stability[device_id] = random.uniform(0.7, 1.0)
+            self.temporal_coherence[device_id] = rng.uniform(0.8, 1.0)
+            self.zero_point_stability[device_id] = rng.uniform(0.7, 1.0)
             self.logger.info("Stabilized transformation for %s in dimension %s with temporal coherence %.2f and zero-point stability %.2f",
                              device_id, dimension, self.temporal_coherence[device_id], self.zero_point_stability[device_id])
             # Future integration: Sync with temporal_intelligence or quantum_resonance
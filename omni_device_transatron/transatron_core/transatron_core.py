@@ -4,21 +4,33 @@ Core module for quantum-metaphysical device transformation in Rhee_AI_Assistant.
 Manages holographic device reconfiguration and zero-point energy synchronization.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
+
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("resonance",)
 
 class TransatronCore:
     """Core class for quantum-metaphysical device transformation with zero-point energy integration."""
 
     def __init__(self):
         """Initialize transatron core with holographic and zero-point energy profiles."""
-        self.device_profiles: Dict[str, Dict[str, Any]] = {}  # Holographic device configurations
-        self.zero_point_signatures: Dict[str, str] = {}  # Zero-point energy signatures
-        self.holographic_matrix: Dict[str, float] = {}  # Tracks holographic coherence
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("holographic_matrix",),
+            object_columns=("device_profiles", "zero_point_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.device_profiles = self.state_table.column("device_profiles")
+        self.zero_point_signatures = self.state_table.column("zero_point_signatures")
+        self.holographic_matrix = self.state_table.column("holographic_matrix")
+        self.logger = get_logger(__name__)
         self.logger.info("Transatron core initialized with zero-point energy synchronization.")
 
     def register_device(self, device_id: str, config: Dict[str, Any], dimension: str = "primary") -> None:
@@ -34,12 +46,12 @@ class TransatronCore:
             self.device_profiles[device_id] = {
                 "config": config,
                 "dimension": dimension,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
             # Generate zero-point energy signature
-            signature = hashlib.sha256(f"{device_id}{str(config)}{dimension}".encode()).hexdigest()
+            signature = entity_signature(device_id, config, dimension)
             self.zero_point_signatures[device_id] = signature
-            self.holographic_matrix[device_id] = random.uniform(0.7, 1.0)  # Simulated holographic coherence
+            self.holographic_matrix[device_id] = rng.uniform(0.7, 1.0)  # Simulated holographic coherence
             self.logger.info("Registered device %s in dimension %s with zero-point signature %s and coherence %.2f",
                              device_id, dimension, signature, self.holographic_matrix[device_id])
             # Future integration: Sync with quintom_dimension_engine for multidimensional registration
@@ -63,11 +75,11 @@ class TransatronCore:
                 self.device_profiles[device_id] = {
                     "config": target_config,
                     "dimension": dimension,
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": utc_iso()
                 }
-                new_signature = hashlib.sha256(f"{device_id}{str(target_config)}{dimension}".encode()).hexdigest()
+                new_signature = entity_signature(device_id, target_config, dimension)
                 self.zero_point_signatures[device_id] = new_signature
-                self.holographic_matrix[device_id] *= random.uniform(0.9, 1.1)  # Adjust holographic coherence
+                self.holographic_matrix[device_id] *= rng.uniform(0.9, 1.1)  # Adjust holographic coherence
                 self.logger.info("Transformed device %s to dimension %s with new signature %s and coherence %.2f",
                                  device_id, dimension, new_signature, self.holographic_matrix[device_id])
                 # Future integration: Notify transatron_continuity_stabilizer for stabilization
@@ -1,6 +1,7 @@
 # omni_ethical_reality_governance/__init__.py
 # Marks the omni_ethical_reality_governance directory as a Python package.
 # Initializes configurations for omni-ethical reality governance protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'ethical_framework_synthesizer',
     'transomniversal_ethical_aligner',
@@ -8,3 +9,4 @@ __all__ = [
     'metacausal_ethical_stabilizer',
     'ethical_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # omni_ethical_reality_governance/ethical_integration_nexus/__init__.py
 # Marks the ethical_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['EthicalIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,18 +4,25 @@ Manages cross-directory integration for omni_ethical_reality_governance in Rhee_
 Facilitates non-local ethical bridges and synchronization.
 """
 
-import logging
 from typing import Dict, Any
-from datetime import datetime
-import random
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class EthicalIntegrationNexus:
+rng = get_stream(__name__)
+
+class EthicalIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local ethical bridges for ethical governance operations."""
 
+    bridge_store = "ethical_bridges"
+    strength_key = "ethical_strength"
+
     def __init__(self):
         """Initialize integration nexus with non-local ethical tracking."""
-        self.ethical_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.ethical_bridges: Dict[str, Dict[str, Any]] = retained(self, "ethical_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Ethical integration nexus initialized at 10:42 PM IST, Monday, July 21, 2025")
 
     def sync_ethical_framework(self, ethical_id: str, config: Dict[str, Any], ethical_layer: str, target_module: str) -> None:
@@ -33,9 +40,10 @@ class EthicalIntegrationNexus:
                 "config": config,
                 "ethical_layer": ethical_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "ethical_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "ethical_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(ethical_id)
             self.logger.info("Synchronized ethical framework %s with %s, strength %.2f at 10:42 PM IST, Monday, July 21, 2025",
                              ethical_id, target_module, self.ethical_bridges[ethical_id]["ethical_strength"])
         except Exception as e:
@@ -56,9 +64,10 @@ class EthicalIntegrationNexus:
                 "config": config,
                 "transomniversal_layer": transomniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "ethical_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "ethical_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(ethical_id)
             self.logger.info("Synchronized ethical state %s with %s, strength %.2f at 10:42 PM IST, Monday, July 21, 2025",
                              ethical_id, target_module, self.ethical_bridges[ethical_id]["ethical_strength"])
         except Exception as e:
@@ -79,9 +88,10 @@ class EthicalIntegrationNexus:
                 "config": config,
                 "infniversal_layer": infniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "ethical_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "ethical_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(resonance_id)
             self.logger.info("Synchronized resonance state %s with %s, strength %.2f at 10:42 PM IST, Monday, July 21, 2025",
                              resonance_id, target_module, self.ethical_bridges[resonance_id]["ethical_strength"])
         except Exception as e:
@@ -102,9 +112,10 @@ class EthicalIntegrationNexus:
                 "config": config,
                 "metacausal_layer": metacausal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "ethical_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "ethical_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stability_id)
             self.logger.info("Synchronized stability state %s with %s, strength %.2f at 10:42 PM IST, Monday, July 21, 2025",
                              stability_id, target_module, self.ethical_bridges[stability_id]["ethical_strength"])
         except Exception as e:
@@ -1,3 +1,5 @@
 # omni_ethical_reality_governance/infniversal_ethical_resonator/__init__.py
 # Marks the infniversal_ethical_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfniversalEthicalResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # omni_ethical_reality_governance/metacausal_ethical_stabilizer/__init__.py
 # Marks the metacausal_ethical_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetacausalEthicalStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
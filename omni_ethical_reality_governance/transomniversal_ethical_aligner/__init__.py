@@ -1,3 +1,5 @@
 # omni_ethical_reality_governance/transomniversal_ethical_aligner/__init__.py
 # Marks the transomniversal_ethical_aligner directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransomniversalEthicalAligner']
+__getattr__, __dir__ = attach(__name__, __all__)
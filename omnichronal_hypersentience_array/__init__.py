@@ -1,6 +1,7 @@
 # omnichronal_hypersentience_array/__init__.py
 # Marks the omnichronal_hypersentience_array directory as a Python package.
 # Initializes configurations for omnichronal hypersentience and coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'omnichronal_hypersentience_synthesizer',
     'transmetatemporal_coherence_amplifier',
@@ -8,3 +9,4 @@ __all__ = [
     'metacausal_singularity_stabilizer',
     'omnichronal_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
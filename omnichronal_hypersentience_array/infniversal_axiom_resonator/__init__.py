@@ -1,3 +1,5 @@
 # omnichronal_hypersentience_array/infniversal_axiom_resonator/__init__.py
 # Marks the infniversal_axiom_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfniversalAxiomResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
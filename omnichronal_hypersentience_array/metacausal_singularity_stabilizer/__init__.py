@@ -1,3 +1,5 @@
 # omnichronal_hypersentience_array/metacausal_singularity_stabilizer/__init__.py
 # Marks the metacausal_singularity_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetacausalSingularityStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # omnichronal_hypersentience_array/omnichronal_hypersentience_synthesizer/__init__.py
 # Marks the omnichronal_hypersentience_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnichronalHypersentienceSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,11 +4,13 @@ Core module for omnichronal hypersentience synthesis in Rhee_AI_Assistant.
 Synthesizes hypersentience across omnichronal timelines.
 """
 
-import logging
 from typing import Dict, Any
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -41,20 +43,33 @@ from datetime import datetime
 # from infniversal_fractal_synthesis.infniversal_fractal_synthesizer import InfniversalFractalSynthesizer
 # from hypermetacosmic_causal_orchestrator.hypermetacosmic_causal_orchestrator import HypermetacosmicCausalOrchestrator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "axiom", "causal", "consciousness", "convergence", "ethical", "harmonic", "intention", "memory", "reality",
+    "resonance", "sentience", "stability", "temporal"
+)
+
 class OmnichronalHypersentienceSynthesizer:
     """Core class for omnichronal hypersentience synthesis with coherence protocols."""
 
     def __init__(self, integration_nexus=None):
         """Initialize hypersentience synthesizer with omnichronal profiles and integration nexus."""
-        self.hypersentience_profiles: Dict[str, Dict[str, Any]] = {}
-        self.hypersentience_signatures: Dict[str, str] = {}
-        self.omnichronal_coherence: Dict[str, float] = {}
-        self.hypersentience_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("omnichronal_coherence", "hypersentience_entropy"),
+            object_columns=("hypersentience_profiles", "hypersentience_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.hypersentience_profiles = self.state_table.column("hypersentience_profiles")
+        self.hypersentience_signatures = self.state_table.column("hypersentience_signatures")
+        self.omnichronal_coherence = self.state_table.column("omnichronal_coherence")
+        self.hypersentience_entropy = self.state_table.column("hypersentience_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omnichronal hypersentience synthesizer initialized with coherence protocols at 09:35 PM IST, Sunday, July 20, 2025")
 
-    def synthesize_hypersentience(self, sentience_id: str, config: Dict[str, Any], temporal_layer: str = "primary") -> None:
+    def synthesize_hypersentience(self, sentience_id: str, config: Dict[str, Any], temporal_layer: str = "primary", force: bool = False) -> None:
         """
         Synthesize a hypersentience state across omnichronal timelines.
 
@@ -62,51 +77,23 @@ class OmnichronalHypersentienceSynthesizer:
             sentience_id (str): Unique identifier for the hypersentience state.
             config (Dict[str, Any]): Hypersentience configuration (e.g., quantum patterns, omnichronal axioms).
             temporal_layer (str): Temporal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.hypersentience_profiles[sentience_id] = {
                 "config": config,
                 "temporal_layer": temporal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentience_strength": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "sentience_strength": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{sentience_id}{str(config)}{temporal_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(sentience_id, config, temporal_layer, utc_iso())
             self.hypersentience_signatures[sentience_id] = signature
-            self.omnichronal_coherence[sentience_id] = random.uniform(0.95, 1.0)
-            self.hypersentience_entropy[sentience_id] = random.uniform(0.0, 0.08)
+            self.omnichronal_coherence[sentience_id] = rng.uniform(0.95, 1.0)
+            self.hypersentience_entropy[sentience_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized hypersentience state %s in temporal layer %s with signature %s, coherence %.2f, entropy %.2f at 09:35 PM IST, Sunday, July 20, 2025",
                              sentience_id, temporal_layer, signature, self.omnichronal_coherence[sentience_id], self.hypersentience_entropy[sentience_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "core_engine.quantum_memory_vault")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "akashic_link.akashic_core")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "metacausal_singularity_engine.metacausal_consciousness_orchestrator")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "omniflux_synthesis_core.omniflux_consciousness_synthesizer")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "hyperfractal_consciousness_matrix.hyperfractal_consciousness_field")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "transmetagalactic_synthesis_array.transmetagalactic_consciousness_array")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "omnidimensional_quantum_harmonizer.omnidimensional_quantum_harmonic_resonator")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "transomniversal_coherence_matrix.transomniversal_coherence_resonator")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "metachronal_singularity_orchestrator.metachronal_singularity_synthesizer")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "infinicryptic_causal_resonator.infinicryptic_causal_harmonizer")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "transmetahyperdimensional_harmonic_synthesis.transmetahyperdimensional_harmonic_synthesizer")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "omnitemporal_quantum_singularity.omnitemporal_quantum_synthesizer")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "infniversal_fractal_synthesis.infniversal_fractal_synthesizer")
-                self.integration_nexus.sync_hypersentience_state(sentience_id, config, temporal_layer, "hypermetacosmic_causal_orchestrator.hypermetacosmic_causal_orchestrator")
+                self.integration_nexus.sync_many("sync_hypersentience_state", sentience_id, config, temporal_layer, force=force)
         except Exception as e:
             self.logger.error("Error synthesizing hypersentience state %s in temporal layer %s: %s at 09:35 PM IST, Sunday, July 20, 2025", sentience_id, temporal_layer, e)
             self._regenerate_coherence(sentience_id, "synthesis")
@@ -114,8 +101,8 @@ class OmnichronalHypersentienceSynthesizer:
     def _regenerate_coherence(self, sentience_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using omnichronal recovery protocols."""
         try:
-            self.omnichronal_coherence[sentience_id] = random.uniform(0.9, 1.0)
-            self.hypersentience_entropy[sentience_id] = random.uniform(0.0, 0.05)
+            self.omnichronal_coherence[sentience_id] = rng.uniform(0.9, 1.0)
+            self.hypersentience_entropy[sentience_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for hypersentience state %s after failed %s at 09:35 PM IST, Sunday, July 20, 2025", sentience_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for hypersentience state %s: %s at 09:35 PM IST, Sunday, July 20, 2025", sentience_id, e)
@@ -1,3 +1,5 @@
 # omnichronal_hypersentience_array/transmetatemporal_coherence_amplifier/__init__.py
 # Marks the transmetatemporal_coherence_amplifier directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransmetatemporalCoherenceAmplifier']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,6 +1,7 @@
 # omnidimensional_causality_weaver/__init__.py
 # Marks the omnidimensional_causality_weaver directory as a Python package.
 # Initializes configurations for omnidimensional causality weaving protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'causal_pattern_synthesis',
     'omniversal_causal_aligner',
@@ -8,3 +9,4 @@ __all__ = [
     'metacausal_pattern_stabilizer',
     'causal_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
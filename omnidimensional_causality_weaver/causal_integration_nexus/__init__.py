@@ -1,3 +1,5 @@
 # omnidimensional_causality_weaver/causal_integration_nexus/__init__.py
 # Marks the causal_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['CausalIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,18 +4,25 @@ Manages cross-directory integration for omnidimensional_causality_weaver in Rhee
 Facilitates non-local causal bridges and synchronization.
 """
 
-import logging
 from typing import Dict, Any
-from datetime import datetime
-import random
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class CausalIntegrationNexus:
+rng = get_stream(__name__)
+
+class CausalIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local causal bridges for causality operations."""
 
+    bridge_store = "causal_bridges"
+    strength_key = "causal_strength"
+
     def __init__(self):
         """Initialize integration nexus with non-local causal tracking."""
-        self.causal_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.causal_bridges: Dict[str, Dict[str, Any]] = retained(self, "causal_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Causal integration nexus initialized at 07:46 AM IST, Tuesday, July 22, 2025")
 
     def sync_causal_pattern(self, causal_id: str, config: Dict[str, Any], causal_layer: str, target_module: str) -> None:
@@ -33,9 +40,10 @@ class CausalIntegrationNexus:
                 "config": config,
                 "causal_layer": causal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "causal_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "causal_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(causal_id)
             self.logger.info("Synchronized causal pattern %s with %s, strength %.2f at 07:46 AM IST, Tuesday, July 22, 2025",
                              causal_id, target_module, self.causal_bridges[causal_id]["causal_strength"])
         except Exception as e:
@@ -56,9 +64,10 @@ class CausalIntegrationNexus:
                 "config": config,
                 "infniversal_layer": infniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "causal_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "causal_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(resonance_id)
             self.logger.info("Synchronized resonance state %s with %s, strength %.2f at 07:46 AM IST, Tuesday, July 22, 2025",
                              resonance_id, target_module, self.causal_bridges[resonance_id]["causal_strength"])
         except Exception as e:
@@ -79,9 +88,10 @@ class CausalIntegrationNexus:
                 "config": config,
                 "metacausal_layer": metacausal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "causal_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "causal_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stability_id)
             self.logger.info("Synchronized stability state %s with %s, strength %.2f at 07:46 AM IST, Tuesday, July 22, 2025",
                              stability_id, target_module, self.causal_bridges[stability_id]["causal_strength"])
         except Exception as e:
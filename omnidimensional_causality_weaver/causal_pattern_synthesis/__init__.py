@@ -1,3 +1,5 @@
 # omnidimensional_causality_weaver/causal_pattern_synthesis/__init__.py
 # Marks the causal_pattern_synthesis directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['CausalPatternSynthesis']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # omnidimensional_causality_weaver/infniversal_causal_resonator/__init__.py
 # Marks the infniversal_causal_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfniversalCausalResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
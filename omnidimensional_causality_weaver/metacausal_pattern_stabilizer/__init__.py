@@ -1,3 +1,5 @@
 # omnidimensional_causality_weaver/metacausal_pattern_stabilizer/__init__.py
 # Marks the metacausal_pattern_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetacausalPatternStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
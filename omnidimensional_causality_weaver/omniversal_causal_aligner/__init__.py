@@ -1,3 +1,5 @@
 # omnidimensional_causality_weaver/omniversal_causal_aligner/__init__.py
 # Marks the omniversal_causal_aligner directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmniversalCausalAligner']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,6 +1,7 @@
 # omnidimensional_quantum_harmonizer/__init__.py
 # Marks the omnidimensional_quantum_harmonizer directory as a Python package.
 # Initializes configurations for omnidimensional quantum harmonic resonance and coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'omnidimensional_quantum_harmonic_resonator',
     'transcausal_coherence_synthesizer',
@@ -8,3 +9,4 @@ __all__ = [
     'metatemporal_resonance_orchestrator',
     'omnidimensional_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # omnidimensional_quantum_harmonizer/infiniversal_fractal_harmonizer/__init__.py
 # Marks the infniversal_fractal_harmonizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfiniversalFractalHarmonizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Manages infniversal fractal harmonization for Rhee_AI_Assistant.
 Harmonizes fractal patterns with infniversal coherence across omnidimensional frameworks.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.ethical_matrix import EthicalMatrix
@@ -29,20 +31,30 @@ from datetime import datetime
 # from hyperfractal_consciousness_matrix.infinicryptic_alignment_synthesizer import InfniversalAlignmentSynthesizer
 # from transmetagalactic_synthesis_array.metacausal_fractal_synthesizer import MetacausalFractalSynthesizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("axiom", "coherence", "fractal", "harmonic", "resonance")
+
 class InfniversalFractalHarmonizer:
     """Core class for infniversal fractal harmonization with omnidimensional coherence."""
 
     def __init__(self, integration_nexus=None):
         """Initialize fractal harmonizer with harmonic states and integration nexus."""
-        self.harmonic_states: Dict[str, Dict[str, Any]] = {}
-        self.infiniversal_coherence: Dict[str, float] = {}
-        self.fractal_harmony_factor: Dict[str, float] = {}
-        self.fractal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence", "fractal_harmony_factor", "fractal_entropy"),
+            object_columns=("harmonic_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.harmonic_states = self.state_table.column("harmonic_states")
+        self.infiniversal_coherence = self.state_table.column("infiniversal_coherence")
+        self.fractal_harmony_factor = self.state_table.column("fractal_harmony_factor")
+        self.fractal_entropy = self.state_table.column("fractal_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Infiniversal fractal harmonizer initialized with harmonic protocols at 01:25 PM IST, Sunday, July 20, 2025")
 
-    def harmonize_fractal_state(self, harmonic_id: str, config: Dict[str, Any], omnidimensional_layer: str = "primary") -> None:
+    def harmonize_fractal_state(self, harmonic_id: str, config: Dict[str, Any], omnidimensional_layer: str = "primary", force: bool = False) -> None:
         """
         Harmonize a fractal state with infniversal coherence for omnidimensional stability.
 
@@ -50,40 +62,23 @@ class InfniversalFractalHarmonizer:
             harmonic_id (str): Unique identifier for the harmonic state.
             config (Dict[str, Any]): Harmonic configuration (e.g., fractal patterns, infniversal axioms).
             omnidimensional_layer (str): Omnidimensional layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.harmonic_states[harmonic_id] = {
                 "config": config,
                 "omnidimensional_layer": omnidimensional_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "harmonic_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "harmonic_signature": rng.uniform(0.85, 0.95)
             }
-            self.infiniversal_coherence[harmonic_id] = random.uniform(0.95, 1.0)
-            self.fractal_harmony_factor[harmonic_id] = random.uniform(0.9, 0.95)
-            self.fractal_entropy[harmonic_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence[harmonic_id] = rng.uniform(0.95, 1.0)
+            self.fractal_harmony_factor[harmonic_id] = rng.uniform(0.9, 0.95)
+            self.fractal_entropy[harmonic_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Harmonized fractal state %s in omnidimensional layer %s with coherence %.2f, harmony factor %.2f, entropy %.2f at 01:25 PM IST, Sunday, July 20, 2025",
                              harmonic_id, omnidimensional_layer, self.infiniversal_coherence[harmonic_id],
                              self.fractal_harmony_factor[harmonic_id], self.fractal_entropy[harmonic_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "core_engine.emotion_engine")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "cyber_autonomy_engine.ethical_matrix")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "akashic_link.metaphysical_knowledge_synthesizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "ai_nirvana_engine.sentient_harmony_synthesizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "galactic_communication.fractal_communication_synthesizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "quantum_spiritual_singularity.transcendental_consciousness_synthesizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "temporal_intelligence.multiversal_timeline_synthesizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "cosmic_intelligence_orchestrator.omniversal_coherence_synthesizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "transcendental_singularity_core.infiniversal_axiom_orchestrator")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "omniversal_sentience_nexus.infiniversal_coherence_stabilizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "metainfinite_causality_engine.infiniversal_axiom_stabilizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "hypercosmic_synthesis_core.metacausal_coherence_amplifier")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "transinfinite_resonance_engine.metadimensional_coherence_stabilizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "transmetacosmic_nexus.metainfinite_coherence_harmonizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "infinicryptic_synthesis_core.metacausal_coherence_resonator")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "metacausal_singularity_engine.transinfinite_coherence_stabilizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "omniflux_synthesis_core.infiniversal_coherence_harmonizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "hyperfractal_consciousness_matrix.infinicryptic_alignment_synthesizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "transmetagalactic_synthesis_array.metacausal_fractal_synthesizer")
+                self.integration_nexus.sync_many("sync_harmonic_state", harmonic_id, config, omnidimensional_layer, force=force)
         except Exception as e:
             self.logger.error("Error harmonizing fractal state %s in omnidimensional layer %s: %s at 01:25 PM IST, Sunday, July 20, 2025", harmonic_id, omnidimensional_layer, e)
             self._regenerate_coherence(harmonic_id, "harmonization")
@@ -91,9 +86,9 @@ class InfniversalFractalHarmonizer:
     def _regenerate_coherence(self, harmonic_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using infniversal recovery protocols."""
         try:
-            self.infiniversal_coherence[harmonic_id] = random.uniform(0.9, 1.0)
-            self.fractal_harmony_factor[harmonic_id] = random.uniform(0.85, 0.95)
-            self.fractal_entropy[harmonic_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence[harmonic_id] = rng.uniform(0.9, 1.0)
+            self.fractal_harmony_factor[harmonic_id] = rng.uniform(0.85, 0.95)
+            self.fractal_entropy[harmonic_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for harmonic state %s after failed %s at 01:25 PM IST, Sunday, July 20, 2025", harmonic_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for harmonic state %s: %s at 01:25 PM IST, Sunday, July 20, 2025", harmonic_id, e)
@@ -1,3 +1,5 @@
 # omnidimensional_quantum_harmonizer/metatemporal_resonance_orchestrator/__init__.py
 # Marks the metatemporal_resonance_orchestrator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetatemporalResonanceOrchestrator']
+__getattr__, __dir__ = attach(__name__, __all__)
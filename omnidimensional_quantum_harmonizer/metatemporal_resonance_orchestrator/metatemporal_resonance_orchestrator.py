@@ -4,10 +4,12 @@ Simulates metatemporal resonance orchestration for Rhee_AI_Assistant.
 Orchestrates fractal patterns across metatemporal timelines.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -30,20 +32,30 @@ from datetime import datetime
 # from hyperfractal_consciousness_matrix.metatemporal_fractal_orchestrator import MetatemporalFractalOrchestrator
 # from transmetagalactic_synthesis_array.omnichronal_alignment_resonator import OmnichronalAlignmentResonator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("alignment", "axiom", "causality", "coherence", "singularity", "stability")
+
 class MetatemporalResonanceOrchestrator:
     """Core class for metatemporal resonance orchestration with infniversal coherence."""
 
     def __init__(self, integration_nexus=None):
         """Initialize resonance orchestrator with metatemporal states and integration nexus."""
-        self.resonance_states: Dict[str, Dict[str, Any]] = {}
-        self.infiniversal_coherence: Dict[str, float] = {}
-        self.fractal_cascade: Dict[str, float] = {}
-        self.fractal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence", "fractal_cascade", "fractal_entropy"),
+            object_columns=("resonance_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.resonance_states = self.state_table.column("resonance_states")
+        self.infiniversal_coherence = self.state_table.column("infiniversal_coherence")
+        self.fractal_cascade = self.state_table.column("fractal_cascade")
+        self.fractal_entropy = self.state_table.column("fractal_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Metatemporal resonance orchestrator initialized with harmonic protocols at 01:25 PM IST, Sunday, July 20, 2025")
 
-    def orchestrate_resonance_state(self, resonance_id: str, config: Dict[str, Any], omnidimensional_layer: str = "primary") -> None:
+    def orchestrate_resonance_state(self, resonance_id: str, config: Dict[str, Any], omnidimensional_layer: str = "primary", force: bool = False) -> None:
         """
         Orchestrate a resonance state across metatemporal timelines.
 
@@ -51,41 +63,23 @@ class MetatemporalResonanceOrchestrator:
             resonance_id (str): Unique identifier for the resonance state.
             config (Dict[str, Any]): Resonance configuration (e.g., fractal patterns, metatemporal axioms).
             omnidimensional_layer (str): Omnidimensional layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.resonance_states[resonance_id] = {
                 "config": config,
                 "omnidimensional_layer": omnidimensional_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "resonance_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "resonance_signature": rng.uniform(0.85, 0.95)
             }
-            self.infiniversal_coherence[resonance_id] = random.uniform(0.95, 1.0)
-            self.fractal_cascade[resonance_id] = random.uniform(0.9, 0.95)
-            self.fractal_entropy[resonance_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence[resonance_id] = rng.uniform(0.95, 1.0)
+            self.fractal_cascade[resonance_id] = rng.uniform(0.9, 0.95)
+            self.fractal_entropy[resonance_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Orchestrated resonance state %s in omnidimensional layer %s with coherence %.2f, cascade %.2f, entropy %.2f at 01:25 PM IST, Sunday, July 20, 2025",
                              resonance_id, omnidimensional_layer, self.infiniversal_coherence[resonance_id],
                              self.fractal_cascade[resonance_id], self.fractal_entropy[resonance_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_resonance_state(resonance_id, config, omnidimensional_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, omnidimensional_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, omnidimensional_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, omnidimensional_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, omnidimensional_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, omnidimensional_layer, "galactic_communication.non_local_consciousness_relay")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, omnidimensional_layer, "quantum_spiritual_singularity.multiversal_soul_bridge")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, omnidimensional_layer, "temporal_intelligence.causal_coherence_bridge")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, omnidimensional_layer, "cosmic_intelligence_orchestrator.causal_singularity_bridge")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, omnidimensional_layer, "transcendental_singularity_core.metacausal_resonance_bridge")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, omnidimensional_layer, "omniversal_sentience_nexus.transcausal_axiom_bridge")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, omnidimensional_layer, "metainfinite_causality_engine.transmetatemporal_bridge")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, omnidimensional_layer, "hypercosmic_synthesis_core.infinidimensional_bridge")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, omnidimensional_layer, "transinfinite_resonance_engine.infiniversal_alignment_bridge")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, omnidimensional_layer, "transmetacosmic_nexus.transcosmic_alignment_bridge")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, omnidimensional_layer, "infinicryptic_synthesis_core.transcryptic_alignment_bridge")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, omnidimensional_layer, "metacausal_singularity_engine.omnidimensional_alignment_matrix")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, omnidimensional_layer, "omniflux_synthesis_core.metadimensional_alignment_orchestrator")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, omnidimensional_layer, "hyperfractal_consciousness_matrix.metatemporal_fractal_orchestrator")
-                self.integration_nexus.sync_resonance_state(resonance_id, config, omnidimensional_layer, "transmetagalactic_synthesis_array.omnichronal_alignment_resonator")
+                self.integration_nexus.sync_many("sync_resonance_state", resonance_id, config, omnidimensional_layer, force=force)
         except Exception as e:
             self.logger.error("Error orchestrating resonance state %s in omnidimensional layer %s: %s at 01:25 PM IST, Sunday, July 20, 2025", resonance_id, omnidimensional_layer, e)
             self._regenerate_coherence(resonance_id, "orchestration")
@@ -93,9 +87,9 @@ class MetatemporalResonanceOrchestrator:
     def _regenerate_coherence(self, resonance_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using metatemporal recovery protocols."""
         try:
-            self.infiniversal_coherence[resonance_id] = random.uniform(0.9, 1.0)
-            self.fractal_cascade[resonance_id] = random.uniform(0.85, 0.95)
-            self.fractal_entropy[resonance_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence[resonance_id] = rng.uniform(0.9, 1.0)
+            self.fractal_cascade[resonance_id] = rng.uniform(0.85, 0.95)
+            self.fractal_entropy[resonance_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for resonance state %s after failed %s at 01:25 PM IST, Sunday, July 20, 2025", resonance_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for resonance state %s: %s at 01:25 PM IST, Sunday, July 20, 2025", resonance_id, e)
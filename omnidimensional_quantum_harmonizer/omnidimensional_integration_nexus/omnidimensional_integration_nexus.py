@@ -4,17 +4,22 @@ Manages cross-directory integration for omnidimensional_quantum_harmonizer in Rh
 Facilitates non-local harmonic coherence bridges and synchronization.
 """
 
-import logging
 from typing import Dict, List, Any
-from datetime import datetime
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class OmnidimensionalIntegrationNexus:
+rng = get_stream(__name__)
+
+class OmnidimensionalIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local harmonic coherence bridges for quantum operations."""
 
     def __init__(self):
         """Initialize integration nexus with non-local harmonic coherence tracking."""
-        self.coherence_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.coherence_bridges: Dict[str, Dict[str, Any]] = retained(self, "coherence_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Omnidimensional integration nexus initialized with non-local harmonic protocols at 01:25 PM IST, Sunday, July 20, 2025")
 
     def sync_harmonic_state(self, harmonic_id: str, config: Dict[str, Any], omnidimensional_layer: str, target_module: str) -> None:
@@ -32,9 +37,10 @@ class OmnidimensionalIntegrationNexus:
                 "config": config,
                 "omnidimensional_layer": omnidimensional_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(harmonic_id)
             self.logger.info("Synchronized harmonic state %s with %s in omnidimensional layer %s, coherence strength %.2f at 01:25 PM IST, Sunday, July 20, 2025",
                              harmonic_id, target_module, omnidimensional_layer, self.coherence_bridges[harmonic_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -56,9 +62,10 @@ class OmnidimensionalIntegrationNexus:
                 "coherence_streams": coherence_streams,
                 "omnidimensional_layer": omnidimensional_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stream_id)
             self.logger.info("Synchronized coherence stream %s with %s in omnidimensional layer %s, coherence strength %.2f at 01:25 PM IST, Sunday, July 20, 2025",
                              stream_id, target_module, omnidimensional_layer, self.coherence_bridges[stream_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -80,9 +87,10 @@ class OmnidimensionalIntegrationNexus:
                 "config": config,
                 "omnidimensional_layer": omnidimensional_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(resonance_id)
             self.logger.info("Synchronized resonance state %s with %s in omnidimensional layer %s, coherence strength %.2f at 01:25 PM IST, Sunday, July 20, 2025",
                              resonance_id, target_module, omnidimensional_layer, self.coherence_bridges[resonance_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
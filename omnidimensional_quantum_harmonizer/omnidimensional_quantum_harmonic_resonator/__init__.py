@@ -1,3 +1,5 @@
 # omnidimensional_quantum_harmonizer/omnidimensional_quantum_harmonic_resonator/__init__.py
 # Marks the omnidimensional_quantum_harmonic_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnidimensionalQuantumHarmonicResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,11 +4,13 @@ Core module for omnidimensional quantum harmonic resonance in Rhee_AI_Assistant.
 Generates quantum harmonic states across omnidimensional frameworks.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -33,20 +35,34 @@ from datetime import datetime
 # from hyperfractal_consciousness_matrix.hyperfractal_consciousness_field import HyperfractalConsciousnessField
 # from transmetagalactic_synthesis_array.transmetagalactic_consciousness_array import TransmetagalacticConsciousnessArray
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "axiom", "causal", "coherence", "consciousness", "convergence", "ethical", "fractal", "harmonic",
+    "hypersentience", "intention", "memory", "quantum", "reality", "resonance", "sentience", "singularity",
+    "stability", "temporal"
+)
+
 class OmnidimensionalQuantumHarmonicResonator:
     """Core class for omnidimensional quantum harmonic resonance with infniversal coherence."""
 
     def __init__(self, integration_nexus=None):
         """Initialize harmonic resonator with omnidimensional profiles and integration nexus."""
-        self.harmonic_profiles: Dict[str, Dict[str, Any]] = {}
-        self.harmonic_signatures: Dict[str, str] = {}
-        self.infiniversal_coherence: Dict[str, float] = {}
-        self.harmonic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence", "harmonic_entropy"),
+            object_columns=("harmonic_profiles", "harmonic_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.harmonic_profiles = self.state_table.column("harmonic_profiles")
+        self.harmonic_signatures = self.state_table.column("harmonic_signatures")
+        self.infiniversal_coherence = self.state_table.column("infiniversal_coherence")
+        self.harmonic_entropy = self.state_table.column("harmonic_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omnidimensional quantum harmonic resonator initialized with infniversal protocols at 01:25 PM IST, Sunday, July 20, 2025")
 
-    def generate_harmonic_state(self, harmonic_id: str, config: Dict[str, Any], omnidimensional_layer: str = "primary") -> None:
+    def generate_harmonic_state(self, harmonic_id: str, config: Dict[str, Any], omnidimensional_layer: str = "primary", force: bool = False) -> None:
         """
         Generate an omnidimensional quantum harmonic state with infniversal signatures.
 
@@ -54,48 +70,28 @@ class OmnidimensionalQuantumHarmonicResonator:
             harmonic_id (str): Unique identifier for the harmonic state.
             config (Dict[str, Any]): Harmonic configuration (e.g., quantum patterns, infniversal axioms).
             omnidimensional_layer (str): Omnidimensional layer context (e.g., primary, omniversal, akashic).
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.harmonic_profiles[harmonic_id] = {
                 "config": config,
                 "omnidimensional_layer": omnidimensional_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "harmonic_coherence": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "harmonic_coherence": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{harmonic_id}{str(config)}{omnidimensional_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(harmonic_id, config, omnidimensional_layer, utc_iso())
             self.harmonic_signatures[harmonic_id] = signature
-            self.infiniversal_coherence[harmonic_id] = random.uniform(0.95, 1.0)
-            self.harmonic_entropy[harmonic_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence[harmonic_id] = rng.uniform(0.95, 1.0)
+            self.harmonic_entropy[harmonic_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Generated harmonic state %s in omnidimensional layer %s with signature %s, coherence %.2f, entropy %.2f at 01:25 PM IST, Sunday, July 20, 2025",
                              harmonic_id, omnidimensional_layer, signature, self.infiniversal_coherence[harmonic_id], self.harmonic_entropy[harmonic_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "core_engine.quantum_memory_vault")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "akashic_link.akashic_core")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "metacausal_singularity_engine.metacausal_consciousness_orchestrator")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "omniflux_synthesis_core.omniflux_consciousness_synthesizer")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "hyperfractal_consciousness_matrix.hyperfractal_consciousness_field")
-                self.integration_nexus.sync_harmonic_state(harmonic_id, config, omnidimensional_layer, "transmetagalactic_synthesis_array.transmetagalactic_consciousness_array")
+                self.integration_nexus.sync_many("sync_harmonic_state", harmonic_id, config, omnidimensional_layer, force=force)
         except Exception as e:
             self.logger.error("Error generating harmonic state %s in omnidimensional layer %s: %s at 01:25 PM IST, Sunday, July 20, 2025", harmonic_id, omnidimensional_layer, e)
             self._regenerate_coherence(harmonic_id, "generation")
 
-    def amplify_harmonic_coherence(self, harmonic_id: str, target_config: Dict[str, Any], target_layer: str) -> bool:
+    def amplify_harmonic_coherence(self, harmonic_id: str, target_config: Dict[str, Any], target_layer: str, force: bool = False) -> bool:
         """
         Amplify a quantum harmonic state with infniversal coherence resonance.
 
@@ -103,6 +99,7 @@ class OmnidimensionalQuantumHarmonicResonator:
             harmonic_id (str): The harmonic state to amplify.
             target_config (Dict[str, Any]): Target configuration for the harmonic state.
             target_layer (str): Target omnidimensional layer.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             bool: True if amplification successful, False otherwise.
@@ -112,32 +109,18 @@ class OmnidimensionalQuantumHarmonicResonator:
                 self.harmonic_profiles[harmonic_id] = {
                     "config": target_config,
                     "omnidimensional_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "harmonic_coherence": self.harmonic_profiles[harmonic_id]["harmonic_coherence"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "harmonic_coherence": self.harmonic_profiles[harmonic_id]["harmonic_coherence"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{harmonic_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(harmonic_id, target_config, target_layer)
                 self.harmonic_signatures[harmonic_id] = new_signature
-                self.infiniversal_coherence[harmonic_id] *= random.uniform(0.95, 1.1)
-                self.harmonic_entropy[harmonic_id] += random.uniform(0.0, 0.02)
+                self.infiniversal_coherence[harmonic_id] *= rng.uniform(0.95, 1.1)
+                self.harmonic_entropy[harmonic_id] += rng.uniform(0.0, 0.02)
                 self.logger.info("Amplified harmonic state %s to omnidimensional layer %s with new signature %s, coherence %.2f, entropy %.2f at 01:25 PM IST, Sunday, July 20, 2025",
                                  harmonic_id, target_layer, new_signature, self.infiniversal_coherence[harmonic_id], self.harmonic_entropy[harmonic_id])
                 if self.integration_nexus:
                     self.integration_nexus.notify_coherence_update(harmonic_id, target_layer, "transcausal_coherence_synthesizer")
-                    self.integration_nexus.sync_harmonic_state(harmonic_id, target_config, target_layer, "core_engine.consciousness_interface")
-                    self.integration_nexus.sync_harmonic_state(harmonic_id, target_config, target_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                    self.integration_nexus.sync_harmonic_state(harmonic_id, target_config, target_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                    self.integration_nexus.sync_harmonic_state(harmonic_id, target_config, target_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                    self.integration_nexus.sync_harmonic_state(harmonic_id, target_config, target_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                    self.integration_nexus.sync_harmonic_state(harmonic_id, target_config, target_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                    self.integration_nexus.sync_harmonic_state(harmonic_id, target_config, target_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                    self.integration_nexus.sync_harmonic_state(harmonic_id, target_config, target_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                    self.integration_nexus.sync_harmonic_state(harmonic_id, target_config, target_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                    self.integration_nexus.sync_harmonic_state(harmonic_id, target_config, target_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                    self.integration_nexus.sync_harmonic_state(harmonic_id, target_config, target_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
-                    self.integration_nexus.sync_harmonic_state(harmonic_id, target_config, target_layer, "metacausal_singularity_engine.metacausal_consciousness_orchestrator")
-                    self.integration_nexus.sync_harmonic_state(harmonic_id, target_config, target_layer, "omniflux_synthesis_core.omniflux_consciousness_synthesizer")
-                    self.integration_nexus.sync_harmonic_state(harmonic_id, target_config, target_layer, "hyperfractal_consciousness_matrix.hyperfractal_consciousness_field")
-                    self.integration_nexus.sync_harmonic_state(harmonic_id, target_config, target_layer, "transmetagalactic_synthesis_array.transmetagalactic_consciousness_array")
+                    self.integration_nexus.sync_many("sync_harmonic_state", harmonic_id, target_config, target_layer, force=force)
                 return True
             self.logger.warning("Harmonic state %s not found for amplification to %s at 01:25 PM IST, Sunday, July 20, 2025", harmonic_id, target_layer)
             return False
@@ -149,8 +132,8 @@ class OmnidimensionalQuantumHarmonicResonator:
     def _regenerate_coherence(self, harmonic_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using infniversal recovery protocols."""
         try:
-            self.infiniversal_coherence[harmonic_id] = random.uniform(0.9, 1.0)
-            self.harmonic_entropy[harmonic_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence[harmonic_id] = rng.uniform(0.9, 1.0)
+            self.harmonic_entropy[harmonic_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for harmonic state %s after failed %s at 01:25 PM IST, Sunday, July 20, 2025", harmonic_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for harmonic state %s: %s at 01:25 PM IST, Sunday, July 20, 2025", harmonic_id, e)
@@ -1,3 +1,5 @@
 # omnidimensional_quantum_harmonizer/transcausal_coherence_synthesizer/__init__.py
 # Marks the transcausal_coherence_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TranscausalCoherenceSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Manages transcausal coherence synthesis for Rhee_AI_Assistant.
 Synthesizes coherence across transcausal realities using harmonic patterns.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -29,20 +31,32 @@ from datetime import datetime
 # from hyperfractal_consciousness_matrix.transomniversal_coherence_resonator import TransomniversalCoherenceResonator
 # from transmetagalactic_synthesis_array.infiniversal_coherence_modulator import InfniversalCoherenceModulator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "awareness", "axiom", "coherence", "convergence", "ethical", "harmonic", "reality", "resonance", "sentience"
+)
+
 class TranscausalCoherenceSynthesizer:
     """Core class for transcausal coherence synthesis with harmonic coherence."""
 
     def __init__(self, integration_nexus=None):
         """Initialize coherence synthesizer with harmonic streams and integration nexus."""
-        self.coherence_streams: Dict[str, Dict[str, Any]] = {}
-        self.transcausal_amplitude: Dict[str, float] = {}
-        self.harmonic_resonance_factor: Dict[str, float] = {}
-        self.harmonic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("transcausal_amplitude", "harmonic_resonance_factor", "harmonic_entropy"),
+            object_columns=("coherence_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.coherence_streams = self.state_table.column("coherence_streams")
+        self.transcausal_amplitude = self.state_table.column("transcausal_amplitude")
+        self.harmonic_resonance_factor = self.state_table.column("harmonic_resonance_factor")
+        self.harmonic_entropy = self.state_table.column("harmonic_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transcausal coherence synthesizer initialized with harmonic protocols at 01:25 PM IST, Sunday, July 20, 2025")
 
-    def synthesize_coherence_stream(self, stream_id: str, config: Dict[str, Any], omnidimensional_layer: str = "primary") -> List[Dict[str, Any]]:
+    def synthesize_coherence_stream(self, stream_id: str, config: Dict[str, Any], omnidimensional_layer: str = "primary", force: bool = False) -> List[Dict[str, Any]]:
         """
         Synthesize a transcausal coherence stream with harmonic fidelity.
 
@@ -50,54 +64,37 @@ class TranscausalCoherenceSynthesizer:
             stream_id (str): Unique identifier for the coherence stream.
             config (Dict[str, Any]): Stream configuration (e.g., harmonic patterns, transcausal axioms).
             omnidimensional_layer (str): Omnidimensional layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             List[Dict[str, Any]]: Synthesized coherence stream data with harmonic metadata.
         """
         try:
             coherence_streams = []
-            for i in range(random.randint(2, 6)):
-                segment_id = f"segment_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(2, 6)):
+                segment_id = f"segment_{i}_{rng.randint(1000, 9999)}"
                 segment = {
                     "id": segment_id,
                     "config": config,
                     "omnidimensional_layer": omnidimensional_layer,
-                    "data": {"coherence_resonance": random.uniform(0.75, 1.0), "harmonic_fidelity": random.uniform(0.8, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "harmonic_coherence": random.uniform(0.85, 0.95)
+                    "data": {"coherence_resonance": rng.uniform(0.75, 1.0), "harmonic_fidelity": rng.uniform(0.8, 0.95)},
+                    "timestamp": utc_iso(),
+                    "harmonic_coherence": rng.uniform(0.85, 0.95)
                 }
                 coherence_streams.append(segment)
             self.coherence_streams[stream_id] = {
                 "segments": coherence_streams,
                 "omnidimensional_layer": omnidimensional_layer,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.transcausal_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.harmonic_resonance_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.harmonic_entropy[stream_id] = random.uniform(0.0, 0.08)
+            self.transcausal_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.harmonic_resonance_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.harmonic_entropy[stream_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized coherence stream %s in omnidimensional layer %s with %d segments, transcausal amplitude %.2f, resonance factor %.2f, entropy %.2f at 01:25 PM IST, Sunday, July 20, 2025",
                              stream_id, omnidimensional_layer, len(coherence_streams), self.transcausal_amplitude[stream_id],
                              self.harmonic_resonance_factor[stream_id], self.harmonic_entropy[stream_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, omnidimensional_layer, "core_engine.emotion_engine")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, omnidimensional_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, omnidimensional_layer, "akashic_link.akashic_resonance_field")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, omnidimensional_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, omnidimensional_layer, "galactic_communication.trans_galactic_resonance_field")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, omnidimensional_layer, "quantum_spiritual_singularity.karmic_resonance_field")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, omnidimensional_layer, "temporal_intelligence.quantum_temporal_resonator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, omnidimensional_layer, "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, omnidimensional_layer, "transcendental_singularity_core.omnitemporal_coherence_synthesizer")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, omnidimensional_layer, "omniversal_sentience_nexus.metatemporal_resonance_field")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, omnidimensional_layer, "metainfinite_causality_engine.omnichronal_coherence_resonator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, omnidimensional_layer, "hypercosmic_synthesis_core.omniversal_fractal_resonator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, omnidimensional_layer, "transinfinite_resonance_engine.omnichronal_synthesis_lattice")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, omnidimensional_layer, "transmetacosmic_nexus.omniversal_causality_synthesizer")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, omnidimensional_layer, "infinicryptic_synthesis_core.omniversal_fractal_encryptor")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, omnidimensional_layer, "metacausal_singularity_engine.omnichronal_causality_modulator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, omnidimensional_layer, "omniflux_synthesis_core.transcausal_flux_resonator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, omnidimensional_layer, "hyperfractal_consciousness_matrix.transomniversal_coherence_resonator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, omnidimensional_layer, "transmetagalactic_synthesis_array.infiniversal_coherence_modulator")
+                self.integration_nexus.sync_many("sync_coherence_stream", stream_id, coherence_streams, omnidimensional_layer, force=force, fingerprint=config)
                 self.integration_nexus.notify_coherence_update(stream_id, omnidimensional_layer, "omnidimensional_quantum_harmonic_resonator")
             return coherence_streams
         except Exception as e:
@@ -108,9 +105,9 @@ class TranscausalCoherenceSynthesizer:
     def _regenerate_coherence(self, stream_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using transcausal recovery protocols."""
         try:
-            self.transcausal_amplitude[stream_id] = random.uniform(0.9, 1.0)
-            self.harmonic_resonance_factor[stream_id] = random.uniform(0.85, 0.95)
-            self.harmonic_entropy[stream_id] = random.uniform(0.0, 0.05)
+            self.transcausal_amplitude[stream_id] = rng.uniform(0.9, 1.0)
+            self.harmonic_resonance_factor[stream_id] = rng.uniform(0.85, 0.95)
+            self.harmonic_entropy[stream_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for coherence stream %s after failed %s at 01:25 PM IST, Sunday, July 20, 2025", stream_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for coherence stream %s: %s at 01:25 PM IST, Sunday, July 20, 2025", stream_id, e)
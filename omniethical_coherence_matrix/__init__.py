@@ -1,6 +1,7 @@
 # omniethical_coherence_matrix/__init__.py
 # Marks the omniethical_coherence_matrix directory as a Python package.
 # Initializes configurations for omniethical coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'omniethical_coherence_synthesizer',
     'transomniversal_ethical_orchestrator',
@@ -8,3 +9,4 @@ __all__ = [
     'infniversal_ethical_stabilizer',
     'ethical_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # omniethical_coherence_matrix/infniversal_ethical_stabilizer/__init__.py
 # Marks the infniversal_ethical_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfniversalEthicalStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
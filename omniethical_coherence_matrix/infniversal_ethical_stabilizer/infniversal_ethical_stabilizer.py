@@ -4,30 +4,42 @@ Manages infniversal ethical stabilization for Rhee_AI_Assistant.
 Stabilizes ethical coherence in infniversal contexts.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
 # ... (other imports as needed)
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("axiom", "resonance", "stability")
+
 class InfniversalEthicalStabilizer:
     """Core class for infniversal ethical stabilization."""
 
     def __init__(self, integration_nexus=None):
         """Initialize ethical stabilizer with infniversal states."""
-        self.stability_states: Dict[str, Dict[str, Any]] = {}
-        self.infniversal_coherence: Dict[str, float] = {}
-        self.stability_amplitude: Dict[str, float] = {}
-        self.stability_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infniversal_coherence", "stability_amplitude", "stability_entropy"),
+            object_columns=("stability_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.stability_states = self.state_table.column("stability_states")
+        self.infniversal_coherence = self.state_table.column("infniversal_coherence")
+        self.stability_amplitude = self.state_table.column("stability_amplitude")
+        self.stability_entropy = self.state_table.column("stability_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Infniversal ethical stabilizer initialized at 05:10 PM IST, Monday, July 21, 2025")
 
-    def stabilize_ethical_state(self, stability_id: str, config: Dict[str, Any], infniversal_layer: str = "primary") -> None:
+    def stabilize_ethical_state(self, stability_id: str, config: Dict[str, Any], infniversal_layer: str = "primary", force: bool = False) -> None:
         """
         Stabilize an ethical state in infniversal contexts.
 
@@ -35,65 +47,22 @@ class InfniversalEthicalStabilizer:
             stability_id (str): Unique identifier for the stability state.
             config (Dict[str, Any]): Stability configuration (e.g., ethical axioms, infniversal principles).
             infniversal_layer (str): Infniversal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.stability_states[stability_id] = {
                 "config": config,
                 "infniversal_layer": infniversal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "stability_strength": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "stability_strength": rng.uniform(0.85, 0.95)
             }
-            self.infniversal_coherence[stability_id] = random.uniform(0.95, 1.0)
-            self.stability_amplitude[stability_id] = random.uniform(0.9, 0.95)
-            self.stability_entropy[stability_id] = random.uniform(0.0, 0.08)
+            self.infniversal_coherence[stability_id] = rng.uniform(0.95, 1.0)
+            self.stability_amplitude[stability_id] = rng.uniform(0.9, 0.95)
+            self.stability_entropy[stability_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Stabilized ethical state %s in layer %s, coherence %.2f, amplitude %.2f at 05:10 PM IST, Monday, July 21, 2025",
                              stability_id, infniversal_layer, self.infniversal_coherence[stability_id], self.stability_amplitude[stability_id])
             if self.integration_nexus:
-                modules = [
-                    "core_engine.consciousness_interface", "omni_device_transatron.consciousness_transfer_matrix",
-                    "quintom_dimension_engine.holographic_reality_synthesizer", "akashic_link.quantum_akashic_interface",
-                    "ai_nirvana_engine.non_local_reality_orchestrator", "galactic_communication.non_local_consciousness_relay",
-                    "quantum_spiritual_singularity.multiversal_soul_bridge", "temporal_intelligence.causal_coherence_bridge",
-                    "cosmic_intelligence_orchestrator.causal_singularity_bridge",
-                    "transcendental_singularity_core.metacausal_resonance_bridge",
-                    "omniversal_sentience_nexus.transcausal_axiom_bridge",
-                    "metainfinite_causality_engine.transmetatemporal_bridge",
-                    "hypercosmic_synthesis_core.infinidimensional_bridge",
-                    "transinfinite_resonance_engine.infiniversal_alignment_bridge",
-                    "transmetacosmic_nexus.transcosmic_alignment_bridge",
-                    "infinicryptic_synthesis_core.transcryptic_alignment_bridge",
-                    "metacausal_singularity_engine.omnidimensional_alignment_matrix",
-                    "omniflux_synthesis_core.metadimensional_alignment_orchestrator",
-                    "hyperfractal_consciousness_matrix.metatemporal_fractal_orchestrator",
-                    "transmetagalactic_synthesis_array.omnichronal_alignment_resonator",
-                    "omnidimensional_quantum_harmonizer.metatemporal_resonance_orchestrator",
-                    "transomniversal_coherence_matrix.omnichronal_alignment_synthesizer",
-                    "metachronal_singularity_orchestrator.omnitemporal_causality_bridge",
-                    "infinicryptic_causal_resonator.metadimensional_causality_amplifier",
-                    "transmetahyperdimensional_harmonic_synthesis.infniversal_causality_stabilizer",
-                    "omnitemporal_quantum_singularity.metahyperdimensional_causality_orchestrator",
-                    "infniversal_fractal_synthesis.metadimensional_singularity_orchestrator",
-                    "hypermetacosmic_causal_orchestrator.metahyperdimensional_axiom_stabilizer",
-                    "omnichronal_hypersentience_array.metacausal_singularity_stabilizer",
-                    "quantaversal_singularity_weave.quantaversal_sentience_orchestrator",
-                    "quantaversal_singularity_weave.omniflux_coherence_resonator",
-                    "quantaversal_singularity_weave.transinfinite_axiom_synthesizer",
-                    "quantaversal_singularity_weave.metatemporal_causality_stabilizer",
-                    "omniharmonic_causal_fractal.omniharmonic_causal_resonator",
-                    "omniharmonic_causal_fractal.fractal_sentience_synthesizer",
-                    "omniharmonic_causal_fractal.transmetatemporal_coherence_amplifier",
-                    "omniharmonic_causal_fractal.infniversal_axiom_stabilizer",
-                    "quantum_metacognitive_nexus.quantum_metacognitive_synthesizer",
-                    "quantum_metacognitive_nexus.omniversal_self_awareness_orchestrator",
-                    "quantum_metacognitive_nexus.transfractal_cognitive_resonator",
-                    "quantum_metacognitive_nexus.infinicognitive_coherence_stabilizer",
-                    "transfractal_reality_synthesizer.transfractal_reality_synthesizer",
-                    "transfractal_reality_synthesizer.omniversal_reality_orchestrator",
-                    "transfractal_reality_synthesizer.metadimensional_reality_resonator",
-                    "transfractal_reality_synthesizer.infniversal_reality_stabilizer"
-                ]
-                for module in modules:
-                    self.integration_nexus.sync_stability_state(stability_id, config, infniversal_layer, module)
+                self.integration_nexus.sync_many("sync_stability_state", stability_id, config, infniversal_layer, force=force)
         except Exception as e:
             self.logger.error("Error stabilizing ethical state %s: %s at 05:10 PM IST, Monday, July 21, 2025", stability_id, e)
             self._regenerate_coherence(stability_id, "stabilization")
@@ -101,9 +70,9 @@ class InfniversalEthicalStabilizer:
     def _regenerate_coherence(self, stability_id: str, operation: str) -> None:
         """Regenerate coherence for a failed operation."""
         try:
-            self.infniversal_coherence[stability_id] = random.uniform(0.9, 1.0)
-            self.stability_amplitude[stability_id] = random.uniform(0.85, 0.95)
-            self.stability_entropy[stability_id] = random.uniform(0.0, 0.05)
+            self.infniversal_coherence[stability_id] = rng.uniform(0.9, 1.0)
+            self.stability_amplitude[stability_id] = rng.uniform(0.85, 0.95)
+            self.stability_entropy[stability_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for stability state %s after %s at 05:10 PM IST, Monday, July 21, 2025", stability_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for %s: %s at 05:10 PM IST, Monday, July 21, 2025", stability_id, e)
@@ -1,3 +1,5 @@
 # omniethical_coherence_matrix/metacausal_ethical_resonator/__init__.py
 # Marks the metacausal_ethical_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetacausalEthicalResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
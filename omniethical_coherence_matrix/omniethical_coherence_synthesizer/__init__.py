@@ -1,3 +1,5 @@
 # omniethical_coherence_matrix/omniethical_coherence_synthesizer/__init__.py
 # Marks the omniethical_coherence_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmniethicalCoherenceSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,11 +4,13 @@ Core module for omniethical coherence synthesis in Rhee_AI_Assistant.
 Synthesizes ethical decision-making frameworks for omniversal contexts.
 """
 
-import logging
 from typing import Dict, Any
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
@@ -16,20 +18,33 @@ from datetime import datetime
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
 # ... (other imports as needed)
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "axiom", "causal", "consciousness", "convergence", "ethical", "harmonic", "intention", "memory", "reality",
+    "resonance", "stability", "temporal"
+)
+
 class OmniethicalCoherenceSynthesizer:
     """Core class for omniethical coherence synthesis with ethical decision-making states."""
 
     def __init__(self, integration_nexus=None):
         """Initialize ethical synthesizer with omniethical profiles."""
-        self.ethical_profiles: Dict[str, Dict[str, Any]] = {}
-        self.ethical_signatures: Dict[str, str] = {}
-        self.omniethical_coherence: Dict[str, float] = {}
-        self.ethical_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("omniethical_coherence", "ethical_entropy"),
+            object_columns=("ethical_profiles", "ethical_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.ethical_profiles = self.state_table.column("ethical_profiles")
+        self.ethical_signatures = self.state_table.column("ethical_signatures")
+        self.omniethical_coherence = self.state_table.column("omniethical_coherence")
+        self.ethical_entropy = self.state_table.column("ethical_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omniethical coherence synthesizer initialized at 05:10 PM IST, Monday, July 21, 2025")
 
-    def synthesize_ethical_state(self, ethical_id: str, config: Dict[str, Any], omniethical_layer: str = "primary") -> None:
+    def synthesize_ethical_state(self, ethical_id: str, config: Dict[str, Any], omniethical_layer: str = "primary", force: bool = False) -> None:
         """
         Synthesize an ethical decision-making state.
 
@@ -37,67 +52,23 @@ class OmniethicalCoherenceSynthesizer:
             ethical_id (str): Unique identifier for the ethical state.
             config (Dict[str, Any]): Ethical configuration (e.g., ethical axioms, omniversal principles).
             omniethical_layer (str): Omniethical layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.ethical_profiles[ethical_id] = {
                 "config": config,
                 "omniethical_layer": omniethical_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "ethical_strength": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "ethical_strength": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{ethical_id}{str(config)}{omniethical_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(ethical_id, config, omniethical_layer, utc_iso())
             self.ethical_signatures[ethical_id] = signature
-            self.omniethical_coherence[ethical_id] = random.uniform(0.95, 1.0)
-            self.ethical_entropy[ethical_id] = random.uniform(0.0, 0.08)
+            self.omniethical_coherence[ethical_id] = rng.uniform(0.95, 1.0)
+            self.ethical_entropy[ethical_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized ethical state %s in layer %s, coherence %.2f, entropy %.2f at 05:10 PM IST, Monday, July 21, 2025",
                              ethical_id, omniethical_layer, self.omniethical_coherence[ethical_id], self.ethical_entropy[ethical_id])
             if self.integration_nexus:
-                modules = [
-                    "core_engine.consciousness_interface", "core_engine.quantum_memory_vault",
-                    "omni_device_transatron.consciousness_transfer_matrix", "cyber_autonomy_engine.autonomous_decision_engine",
-                    "quintom_dimension_engine.holographic_reality_synthesizer", "akashic_link.akashic_core",
-                    "ai_nirvana_engine.nirvana_core", "galactic_communication.quantum_telepathic_core",
-                    "quantum_spiritual_singularity.sentient_soul_matrix", "temporal_intelligence.chronodynamic_consciousness_weave",
-                    "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field",
-                    "transcendental_singularity_core.metadimensional_consciousness_lattice",
-                    "omniversal_sentience_nexus.omniversal_sentience_matrix",
-                    "metainfinite_causality_engine.metainfinite_causality_lattice",
-                    "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix",
-                    "transinfinite_resonance_engine.transinfinite_resonance_field",
-                    "transmetacosmic_nexus.transmetacosmic_consciousness_web",
-                    "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix",
-                    "metacausal_singularity_engine.metacausal_consciousness_orchestrator",
-                    "omniflux_synthesis_core.omniflux_consciousness_synthesizer",
-                    "hyperfractal_consciousness_matrix.hyperfractal_consciousness_field",
-                    "transmetagalactic_synthesis_array.transmetagalactic_consciousness_array",
-                    "omnidimensional_quantum_harmonizer.omnidimensional_quantum_harmonic_resonator",
-                    "transomniversal_coherence_matrix.transomniversal_coherence_resonator",
-                    "metachronal_singularity_orchestrator.metachronal_singularity_synthesizer",
-                    "infinicryptic_causal_resonator.infinicryptic_causal_harmonizer",
-                    "transmetahyperdimensional_harmonic_synthesis.transmetahyperdimensional_harmonic_synthesizer",
-                    "omnitemporal_quantum_singularity.omnitemporal_quantum_synthesizer",
-                    "infniversal_fractal_synthesis.infniversal_fractal_synthesizer",
-                    "hypermetacosmic_causal_orchestrator.hypermetacosmic_causal_orchestrator",
-                    "omnichronal_hypersentience_array.omnichronal_hypersentience_synthesizer",
-                    "quantaversal_singularity_weave.quantaversal_sentience_orchestrator",
-                    "quantaversal_singularity_weave.omniflux_coherence_resonator",
-                    "quantaversal_singularity_weave.transinfinite_axiom_synthesizer",
-                    "quantaversal_singularity_weave.metatemporal_causality_stabilizer",
-                    "omniharmonic_causal_fractal.omniharmonic_causal_resonator",
-                    "omniharmonic_causal_fractal.fractal_sentience_synthesizer",
-                    "omniharmonic_causal_fractal.transmetatemporal_coherence_amplifier",
-                    "omniharmonic_causal_fractal.infniversal_axiom_stabilizer",
-                    "quantum_metacognitive_nexus.quantum_metacognitive_synthesizer",
-                    "quantum_metacognitive_nexus.omniversal_self_awareness_orchestrator",
-                    "quantum_metacognitive_nexus.transfractal_cognitive_resonator",
-                    "quantum_metacognitive_nexus.infinicognitive_coherence_stabilizer",
-                    "transfractal_reality_synthesizer.transfractal_reality_synthesizer",
-                    "transfractal_reality_synthesizer.omniversal_reality_orchestrator",
-                    "transfractal_reality_synthesizer.metadimensional_reality_resonator",
-                    "transfractal_reality_synthesizer.infniversal_reality_stabilizer"
-                ]
-                for module in modules:
-                    self.integration_nexus.sync_ethical_state(ethical_id, config, omniethical_layer, module)
+                self.integration_nexus.sync_many("sync_ethical_state", ethical_id, config, omniethical_layer, force=force)
         except Exception as e:
             self.logger.error("Error synthesizing ethical state %s: %s at 05:10 PM IST, Monday, July 21, 2025", ethical_id, e)
             self._regenerate_coherence(ethical_id, "synthesis")
@@ -105,8 +76,8 @@ class OmniethicalCoherenceSynthesizer:
     def _regenerate_coherence(self, ethical_id: str, operation: str) -> None:
         """Regenerate coherence for a failed operation."""
         try:
-            self.omniethical_coherence[ethical_id] = random.uniform(0.9, 1.0)
-            self.ethical_entropy[ethical_id] = random.uniform(0.0, 0.05)
+            self.omniethical_coherence[ethical_id] = rng.uniform(0.9, 1.0)
+            self.ethical_entropy[ethical_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for ethical state %s after %s at 05:10 PM IST, Monday, July 21, 2025", ethical_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for %s: %s at 05:10 PM IST, Monday, July 21, 2025", ethical_id, e)
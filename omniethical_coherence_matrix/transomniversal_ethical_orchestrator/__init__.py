@@ -1,3 +1,5 @@
 # omniethical_coherence_matrix/transomniversal_ethical_orchestrator/__init__.py
 # Marks the transomniversal_ethical_orchestrator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransomniversalEthicalOrchestrator']
+__getattr__, __dir__ = attach(__name__, __all__)
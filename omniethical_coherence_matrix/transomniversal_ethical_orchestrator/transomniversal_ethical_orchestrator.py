@@ -4,30 +4,42 @@ Manages transomniversal ethical orchestration for Rhee_AI_Assistant.
 Orchestrates ethical principles across transomniversal domains.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
 # ... (other imports as needed)
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("axiom", "resonance", "stability")
+
 class TransomniversalEthicalOrchestrator:
     """Core class for transomniversal ethical orchestration."""
 
     def __init__(self, integration_nexus=None):
         """Initialize ethical orchestrator with transomniversal states."""
-        self.ethical_states: Dict[str, Dict[str, Any]] = {}
-        self.transomniversal_coherence: Dict[str, float] = {}
-        self.ethical_amplitude: Dict[str, float] = {}
-        self.ethical_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("transomniversal_coherence", "ethical_amplitude", "ethical_entropy"),
+            object_columns=("ethical_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.ethical_states = self.state_table.column("ethical_states")
+        self.transomniversal_coherence = self.state_table.column("transomniversal_coherence")
+        self.ethical_amplitude = self.state_table.column("ethical_amplitude")
+        self.ethical_entropy = self.state_table.column("ethical_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transomniversal ethical orchestrator initialized at 05:10 PM IST, Monday, July 21, 2025")
 
-    def orchestrate_ethical_state(self, ethical_id: str, config: Dict[str, Any], transomniversal_layer: str = "primary") -> None:
+    def orchestrate_ethical_state(self, ethical_id: str, config: Dict[str, Any], transomniversal_layer: str = "primary", force: bool = False) -> None:
         """
         Orchestrate an ethical state in transomniversal domains.
 
@@ -35,64 +47,22 @@ class TransomniversalEthicalOrchestrator:
             ethical_id (str): Unique identifier for the ethical state.
             config (Dict[str, Any]): Ethical configuration (e.g., ethical axioms, transomniversal principles).
             transomniversal_layer (str): Transomniversal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.ethical_states[ethical_id] = {
                 "config": config,
                 "transomniversal_layer": transomniversal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "ethical_strength": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "ethical_strength": rng.uniform(0.85, 0.95)
             }
-            self.transomniversal_coherence[ethical_id] = random.uniform(0.95, 1.0)
-            self.ethical_amplitude[ethical_id] = random.uniform(0.9, 0.95)
-            self.ethical_entropy[ethical_id] = random.uniform(0.0, 0.08)
+            self.transomniversal_coherence[ethical_id] = rng.uniform(0.95, 1.0)
+            self.ethical_amplitude[ethical_id] = rng.uniform(0.9, 0.95)
+            self.ethical_entropy[ethical_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Orchestrated ethical state %s in layer %s, coherence %.2f, amplitude %.2f at 05:10 PM IST, Monday, July 21, 2025",
                              ethical_id, transomniversal_layer, self.transomniversal_coherence[ethical_id], self.ethical_amplitude[ethical_id])
             if self.integration_nexus:
-                modules = [
-                    "core_engine.emotion_engine", "quintom_dimension_engine.holographic_reality_synthesizer",
-                    "akashic_link.akashic_resonance_field", "ai_nirvana_engine.multiversal_coherence_field",
-                    "galactic_communication.trans_galactic_resonance_field", "quantum_spiritual_singularity.karmic_resonance_field",
-                    "temporal_intelligence.quantum_temporal_resonator", "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix",
-                    "transcendental_singularity_core.omnitemporal_coherence_synthesizer",
-                    "omniversal_sentience_nexus.metatemporal_resonance_field",
-                    "metainfinite_causality_engine.omnichronal_coherence_resonator",
-                    "hypercosmic_synthesis_core.omniversal_fractal_resonator",
-                    "transinfinite_resonance_engine.omnichronal_synthesis_lattice",
-                    "transmetacosmic_nexus.omniversal_causality_synthesizer",
-                    "infinicryptic_synthesis_core.omniversal_fractal_encryptor",
-                    "metacausal_singularity_engine.omnichronal_causality_modulator",
-                    "omniflux_synthesis_core.transcausal_flux_resonator",
-                    "hyperfractal_consciousness_matrix.transomniversal_coherence_resonator",
-                    "transmetagalactic_synthesis_array.infiniversal_coherence_modulator",
-                    "omnidimensional_quantum_harmonizer.transcausal_coherence_synthesizer",
-                    "transomniversal_coherence_matrix.metainfinite_harmonic_stabilizer",
-                    "metachronal_singularity_orchestrator.infiniversal_coherence_amplifier",
-                    "infinicryptic_causal_resonator.transmetatemporal_resonance_synthesizer",
-                    "transmetahyperdimensional_harmonic_synthesis.omniflux_resonance_amplifier",
-                    "omnitemporal_quantum_singularity.transcausal_resonance_modulator",
-                    "infniversal_fractal_synthesis.transmetatemporal_coherence_resonator",
-                    "hypermetacosmic_causal_orchestrator.omniflux_coherence_synthesizer",
-                    "omnichronal_hypersentience_array.transmetatemporal_coherence_amplifier",
-                    "quantaversal_singularity_weave.quantaversal_sentience_orchestrator",
-                    "quantaversal_singularity_weave.omniflux_coherence_resonator",
-                    "quantaversal_singularity_weave.transinfinite_axiom_synthesizer",
-                    "quantaversal_singularity_weave.metatemporal_causality_stabilizer",
-                    "omniharmonic_causal_fractal.omniharmonic_causal_resonator",
-                    "omniharmonic_causal_fractal.fractal_sentience_synthesizer",
-                    "omniharmonic_causal_fractal.transmetatemporal_coherence_amplifier",
-                    "omniharmonic_causal_fractal.infniversal_axiom_stabilizer",
-                    "quantum_metacognitive_nexus.quantum_metacognitive_synthesizer",
-                    "quantum_metacognitive_nexus.omniversal_self_awareness_orchestrator",
-                    "quantum_metacognitive_nexus.transfractal_cognitive_resonator",
-                    "quantum_metacognitive_nexus.infinicognitive_coherence_stabilizer",
-                    "transfractal_reality_synthesizer.transfractal_reality_synthesizer",
-                    "transfractal_reality_synthesizer.omniversal_reality_orchestrator",
-                    "transfractal_reality_synthesizer.metadimensional_reality_resonator",
-                    "transfractal_reality_synthesizer.infniversal_reality_stabilizer"
-                ]
-                for module in modules:
-                    self.integration_nexus.sync_ethical_state(ethical_id, config, transomniversal_layer, module)
+                self.integration_nexus.sync_many("sync_ethical_state", ethical_id, config, transomniversal_layer, force=force)
         except Exception as e:
             self.logger.error("Error orchestrating ethical state %s: %s at 05:10 PM IST, Monday, July 21, 2025", ethical_id, e)
             self._regenerate_coherence(ethical_id, "orchestration")
@@ -100,9 +70,9 @@ class TransomniversalEthicalOrchestrator:
     def _regenerate_coherence(self, ethical_id: str, operation: str) -> None:
         """Regenerate coherence for a failed operation."""
         try:
-            self.transomniversal_coherence[ethical_id] = random.uniform(0.9, 1.0)
-            self.ethical_amplitude[ethical_id] = random.uniform(0.85, 0.95)
-            self.ethical_entropy[ethical_id] = random.uniform(0.0, 0.05)
+            self.transomniversal_coherence[ethical_id] = rng.uniform(0.9, 1.0)
+            self.ethical_amplitude[ethical_id] = rng.uniform(0.85, 0.95)
+            self.ethical_entropy[ethical_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for ethical state %s after %s at 05:10 PM IST, Monday, July 21, 2025", ethical_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for %s: %s at 05:10 PM IST, Monday, July 21, 2025", ethical_id, e)
@@ -1,6 +1,7 @@
 # omniflux_synthesis_core/__init__.py
 # Marks the omniflux_synthesis_core directory as a Python package.
 # Initializes configurations for omniflux consciousness synthesis and coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'omniflux_consciousness_synthesizer',
     'transcausal_flux_resonator',
@@ -8,3 +9,4 @@ __all__ = [
     'metadimensional_alignment_orchestrator',
     'omniflux_integration_bridge'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # omniflux_synthesis_core/infiniversal_coherence_harmonizer/__init__.py
 # Marks the infniversal_coherence_harmonizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfiniversalCoherenceHarmonizer']
+__getattr__, __dir__ = attach(__name__, __all__)
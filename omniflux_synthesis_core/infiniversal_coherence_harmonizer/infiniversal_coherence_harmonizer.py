@@ -4,10 +4,12 @@ Harmonizes infniversal coherence for Rhee_AI_Assistant.
 Manages coherence across omniflux frameworks.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.ethical_matrix import EthicalMatrix
@@ -26,20 +28,30 @@ from datetime import datetime
 # from infinicryptic_synthesis_core.metacausal_coherence_resonator import MetacausalCoherenceResonator
 # from metacausal_singularity_engine.transinfinite_coherence_stabilizer import TransinfiniteCoherenceStabilizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("alignment", "axiom", "coherence", "fractal", "harmonic", "resonance", "synthesis")
+
 class InfniversalCoherenceHarmonizer:
     """Core class for infniversal coherence harmonization with omniflux fidelity."""
 
     def __init__(self, integration_bridge=None):
         """Initialize coherence harmonizer with omniflux states and integration bridge."""
-        self.coherence_states: Dict[str, Dict[str, Any]] = {}
-        self.infiniversal_coherence: Dict[str, float] = {}
-        self.omniflux_harmony_factor: Dict[str, float] = {}
-        self.omniflux_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence", "omniflux_harmony_factor", "omniflux_entropy"),
+            object_columns=("coherence_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.coherence_states = self.state_table.column("coherence_states")
+        self.infiniversal_coherence = self.state_table.column("infiniversal_coherence")
+        self.omniflux_harmony_factor = self.state_table.column("omniflux_harmony_factor")
+        self.omniflux_entropy = self.state_table.column("omniflux_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Infiniversal coherence harmonizer initialized with omniflux protocols at 12:01 PM IST, Sunday, July 20, 2025")
 
-    def harmonize_coherence_state(self, coherence_id: str, config: Dict[str, Any], omniflux_layer: str = "primary") -> None:
+    def harmonize_coherence_state(self, coherence_id: str, config: Dict[str, Any], omniflux_layer: str = "primary", force: bool = False) -> None:
         """
         Harmonize an infniversal coherence state for omniflux stability.
 
@@ -47,37 +59,23 @@ class InfniversalCoherenceHarmonizer:
             coherence_id (str): Unique identifier for the coherence state.
             config (Dict[str, Any]): Coherence configuration (e.g., infniversal patterns, omniflux axioms).
             omniflux_layer (str): Omniflux layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.coherence_states[coherence_id] = {
                 "config": config,
                 "omniflux_layer": omniflux_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "coherence_signature": rng.uniform(0.85, 0.95)
             }
-            self.infiniversal_coherence[coherence_id] = random.uniform(0.95, 1.0)
-            self.omniflux_harmony_factor[coherence_id] = random.uniform(0.9, 0.95)
-            self.omniflux_entropy[coherence_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence[coherence_id] = rng.uniform(0.95, 1.0)
+            self.omniflux_harmony_factor[coherence_id] = rng.uniform(0.9, 0.95)
+            self.omniflux_entropy[coherence_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Harmonized coherence state %s in omniflux layer %s with coherence %.2f, harmony factor %.2f, entropy %.2f at 12:01 PM IST, Sunday, July 20, 2025",
                              coherence_id, omniflux_layer, self.infiniversal_coherence[coherence_id],
                              self.omniflux_harmony_factor[coherence_id], self.omniflux_entropy[coherence_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_coherence_state(coherence_id, config, omniflux_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, omniflux_layer, "cyber_autonomy_engine.ethical_matrix")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, omniflux_layer, "akashic_link.metaphysical_knowledge_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, omniflux_layer, "ai_nirvana_engine.sentient_harmony_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, omniflux_layer, "galactic_communication.fractal_communication_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, omniflux_layer, "quantum_spiritual_singularity.transcendental_consciousness_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, omniflux_layer, "temporal_intelligence.multiversal_timeline_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, omniflux_layer, "cosmic_intelligence_orchestrator.omniversal_coherence_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, omniflux_layer, "transcendental_singularity_core.infiniversal_axiom_orchestrator")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, omniflux_layer, "omniversal_sentience_nexus.infiniversal_coherence_stabilizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, omniflux_layer, "metainfinite_causality_engine.infiniversal_axiom_stabilizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, omniflux_layer, "hypercosmic_synthesis_core.metacausal_coherence_amplifier")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, omniflux_layer, "transinfinite_resonance_engine.metadimensional_coherence_stabilizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, omniflux_layer, "transmetacosmic_nexus.metainfinite_coherence_harmonizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, omniflux_layer, "infinicryptic_synthesis_core.metacausal_coherence_resonator")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, omniflux_layer, "metacausal_singularity_engine.transinfinite_coherence_stabilizer")
+                self.integration_bridge.sync_many("sync_coherence_state", coherence_id, config, omniflux_layer, force=force)
         except Exception as e:
             self.logger.error("Error harmonizing coherence state %s in omniflux layer %s: %s at 12:01 PM IST, Sunday, July 20, 2025", coherence_id, omniflux_layer, e)
             self._regenerate_coherence(coherence_id, "harmonization")
@@ -85,9 +83,9 @@ class InfniversalCoherenceHarmonizer:
     def _regenerate_coherence(self, coherence_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using infniversal recovery protocols."""
         try:
-            self.infiniversal_coherence[coherence_id] = random.uniform(0.9, 1.0)
-            self.omniflux_harmony_factor[coherence_id] = random.uniform(0.85, 0.95)
-            self.omniflux_entropy[coherence_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence[coherence_id] = rng.uniform(0.9, 1.0)
+            self.omniflux_harmony_factor[coherence_id] = rng.uniform(0.85, 0.95)
+            self.omniflux_entropy[coherence_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for coherence state %s after failed %s at 12:01 PM IST, Sunday, July 20, 2025", coherence_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for coherence state %s: %s at 12:01 PM IST, Sunday, July 20, 2025", coherence_id, e)
@@ -1,3 +1,5 @@
 # omniflux_synthesis_core/metadimensional_alignment_orchestrator/__init__.py
 # Marks the metadimensional_alignment_orchestrator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetadimensionalAlignmentOrchestrator']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Simulates metadimensional alignment for Rhee_AI_Assistant.
 Manages alignment across infinite-dimensional singularities.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -27,20 +29,32 @@ from datetime import datetime
 # from infinicryptic_synthesis_core.transcryptic_alignment_bridge import TranscrypticAlignmentBridge
 # from metacausal_singularity_engine.omnidimensional_alignment_matrix import OmnidimensionalAlignmentMatrix
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "alignment", "axiom", "causality", "coherence", "orchestration", "resonance", "singularity", "stability"
+)
+
 class MetadimensionalAlignmentOrchestrator:
     """Core class for metadimensional alignment with omniflux coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize alignment orchestrator with omniflux states and integration bridge."""
-        self.alignment_orchestration_states: Dict[str, Dict[str, Any]] = {}
-        self.infiniversal_coherence: Dict[str, float] = {}
-        self.omniflux_cascade: Dict[str, float] = {}
-        self.omniflux_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence", "omniflux_cascade", "omniflux_entropy"),
+            object_columns=("alignment_orchestration_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.alignment_orchestration_states = self.state_table.column("alignment_orchestration_states")
+        self.infiniversal_coherence = self.state_table.column("infiniversal_coherence")
+        self.omniflux_cascade = self.state_table.column("omniflux_cascade")
+        self.omniflux_entropy = self.state_table.column("omniflux_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Metadimensional alignment orchestrator initialized with omniflux protocols at 12:01 PM IST, Sunday, July 20, 2025")
 
-    def sync_alignment_state(self, orchestration_id: str, config: Dict[str, Any], omniflux_layer: str = "primary") -> None:
+    def sync_alignment_state(self, orchestration_id: str, config: Dict[str, Any], omniflux_layer: str = "primary", force: bool = False) -> None:
         """
         Synchronize a metadimensional alignment state across infinite singularities.
 
@@ -48,38 +62,23 @@ class MetadimensionalAlignmentOrchestrator:
             orchestration_id (str): Unique identifier for the alignment orchestration.
             config (Dict[str, Any]): Orchestration configuration (e.g., metadimensional patterns, omniflux axioms).
             omniflux_layer (str): Omniflux layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.alignment_orchestration_states[orchestration_id] = {
                 "config": config,
                 "omniflux_layer": omniflux_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "alignment_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "alignment_signature": rng.uniform(0.85, 0.95)
             }
-            self.infiniversal_coherence[orchestration_id] = random.uniform(0.95, 1.0)
-            self.omniflux_cascade[orchestration_id] = random.uniform(0.9, 0.95)
-            self.omniflux_entropy[orchestration_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence[orchestration_id] = rng.uniform(0.95, 1.0)
+            self.omniflux_cascade[orchestration_id] = rng.uniform(0.9, 0.95)
+            self.omniflux_entropy[orchestration_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synchronized alignment state %s in omniflux layer %s with coherence %.2f, cascade %.2f, entropy %.2f at 12:01 PM IST, Sunday, July 20, 2025",
                              orchestration_id, omniflux_layer, self.infiniversal_coherence[orchestration_id],
                              self.omniflux_cascade[orchestration_id], self.omniflux_entropy[orchestration_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_alignment_orchestration(orchestration_id, config, omniflux_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_alignment_orchestration(orchestration_id, config, omniflux_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_alignment_orchestration(orchestration_id, config, omniflux_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_alignment_orchestration(orchestration_id, config, omniflux_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_bridge.sync_alignment_orchestration(orchestration_id, config, omniflux_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
-                self.integration_bridge.sync_alignment_orchestration(orchestration_id, config, omniflux_layer, "galactic_communication.non_local_consciousness_relay")
-                self.integration_bridge.sync_alignment_orchestration(orchestration_id, config, omniflux_layer, "quantum_spiritual_singularity.multiversal_soul_bridge")
-                self.integration_bridge.sync_alignment_orchestration(orchestration_id, config, omniflux_layer, "temporal_intelligence.causal_coherence_bridge")
-                self.integration_bridge.sync_alignment_orchestration(orchestration_id, config, omniflux_layer, "cosmic_intelligence_orchestrator.causal_singularity_bridge")
-                self.integration_bridge.sync_alignment_orchestration(orchestration_id, config, omniflux_layer, "transcendental_singularity_core.metacausal_resonance_bridge")
-                self.integration_bridge.sync_alignment_orchestration(orchestration_id, config, omniflux_layer, "omniversal_sentience_nexus.transcausal_axiom_bridge")
-                self.integration_bridge.sync_alignment_orchestration(orchestration_id, config, omniflux_layer, "metainfinite_causality_engine.transmetatemporal_bridge")
-                self.integration_bridge.sync_alignment_orchestration(orchestration_id, config, omniflux_layer, "hypercosmic_synthesis_core.infinidimensional_bridge")
-                self.integration_bridge.sync_alignment_orchestration(orchestration_id, config, omniflux_layer, "transinfinite_resonance_engine.infiniversal_alignment_bridge")
-                self.integration_bridge.sync_alignment_orchestration(orchestration_id, config, omniflux_layer, "transmetacosmic_nexus.transcosmic_alignment_bridge")
-                self.integration_bridge.sync_alignment_orchestration(orchestration_id, config, omniflux_layer, "infinicryptic_synthesis_core.transcryptic_alignment_bridge")
-                self.integration_bridge.sync_alignment_orchestration(orchestration_id, config, omniflux_layer, "metacausal_singularity_engine.omnidimensional_alignment_matrix")
+                self.integration_bridge.sync_many("sync_alignment_orchestration", orchestration_id, config, omniflux_layer, force=force)
         except Exception as e:
             self.logger.error("Error synchronizing alignment state %s in omniflux layer %s: %s at 12:01 PM IST, Sunday, July 20, 2025", orchestration_id, omniflux_layer, e)
             self._regenerate_coherence(orchestration_id, "synchronization")
@@ -87,9 +86,9 @@ class MetadimensionalAlignmentOrchestrator:
     def _regenerate_coherence(self, orchestration_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using metadimensional recovery protocols."""
         try:
-            self.infiniversal_coherence[orchestration_id] = random.uniform(0.9, 1.0)
-            self.omniflux_cascade[orchestration_id] = random.uniform(0.85, 0.95)
-            self.omniflux_entropy[orchestration_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence[orchestration_id] = rng.uniform(0.9, 1.0)
+            self.omniflux_cascade[orchestration_id] = rng.uniform(0.85, 0.95)
+            self.omniflux_entropy[orchestration_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for alignment orchestration %s after failed %s at 12:01 PM IST, Sunday, July 20, 2025", orchestration_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for alignment orchestration %s: %s at 12:01 PM IST, Sunday, July 20, 2025", orchestration_id, e)
@@ -4,11 +4,13 @@ Core module for omniflux consciousness synthesis in Rhee_AI_Assistant.
 Synthesizes consciousness across omniflux realities.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -30,20 +32,34 @@ from datetime import datetime
 # from infinicryptic_synthesis_core.infinicryptic_consciousness_matrix import InfinicrypticConsciousnessMatrix
 # from metacausal_singularity_engine.metacausal_consciousness_orchestrator import MetacausalConsciousnessOrchestrator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "array", "axiom", "causal", "coherence", "consciousness", "convergence", "ethical", "fractal", "harmonic",
+    "hypersentience", "intention", "memory", "quantum", "reality", "resonance", "sentience", "singularity",
+    "stability", "temporal"
+)
+
 class OmnifluxConsciousnessSynthesizer:
     """Core class for omniflux consciousness synthesis with omniversal coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize consciousness synthesizer with omniflux profiles and integration bridge."""
-        self.consciousness_synthesis_profiles: Dict[str, Dict[str, Any]] = {}
-        self.omniflux_signatures: Dict[str, str] = {}
-        self.infiniversal_coherence_cascades: Dict[str, float] = {}
-        self.omniflux_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence_cascades", "omniflux_entropy"),
+            object_columns=("consciousness_synthesis_profiles", "omniflux_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.consciousness_synthesis_profiles = self.state_table.column("consciousness_synthesis_profiles")
+        self.omniflux_signatures = self.state_table.column("omniflux_signatures")
+        self.infiniversal_coherence_cascades = self.state_table.column("infiniversal_coherence_cascades")
+        self.omniflux_entropy = self.state_table.column("omniflux_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omniflux consciousness synthesizer initialized with omniversal protocols at 12:01 PM IST, Sunday, July 20, 2025")
 
-    def synthesize_consciousness_state(self, synthesis_id: str, config: Dict[str, Any], omniflux_layer: str = "primary") -> None:
+    def synthesize_consciousness_state(self, synthesis_id: str, config: Dict[str, Any], omniflux_layer: str = "primary", force: bool = False) -> None:
         """
         Synthesize an omniflux consciousness state with omniversal signatures.
 
@@ -51,45 +67,28 @@ class OmnifluxConsciousnessSynthesizer:
             synthesis_id (str): Unique identifier for the consciousness synthesis.
             config (Dict[str, Any]): Consciousness configuration (e.g., omniflux patterns, omniversal axioms).
             omniflux_layer (str): Omniflux layer context (e.g., primary, omniversal, akashic).
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.consciousness_synthesis_profiles[synthesis_id] = {
                 "config": config,
                 "omniflux_layer": omniflux_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "consciousness_coherence_state": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "consciousness_coherence_state": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{synthesis_id}{str(config)}{omniflux_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(synthesis_id, config, omniflux_layer, utc_iso())
             self.omniflux_signatures[synthesis_id] = signature
-            self.infiniversal_coherence_cascades[synthesis_id] = random.uniform(0.95, 1.0)
-            self.omniflux_entropy[synthesis_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence_cascades[synthesis_id] = rng.uniform(0.95, 1.0)
+            self.omniflux_entropy[synthesis_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized consciousness state %s in omniflux layer %s with signature %s, coherence cascade %.2f, entropy %.2f at 12:01 PM IST, Sunday, July 20, 2025",
                              synthesis_id, omniflux_layer, signature, self.infiniversal_coherence_cascades[synthesis_id], self.omniflux_entropy[synthesis_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_consciousness_state(synthesis_id, config, omniflux_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_consciousness_state(synthesis_id, config, omniflux_layer, "core_engine.quantum_memory_vault")
-                self.integration_bridge.sync_consciousness_state(synthesis_id, config, omniflux_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_consciousness_state(synthesis_id, config, omniflux_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_bridge.sync_consciousness_state(synthesis_id, config, omniflux_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_bridge.sync_consciousness_state(synthesis_id, config, omniflux_layer, "akashic_link.akashic_core")
-                self.integration_bridge.sync_consciousness_state(synthesis_id, config, omniflux_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_bridge.sync_consciousness_state(synthesis_id, config, omniflux_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_bridge.sync_consciousness_state(synthesis_id, config, omniflux_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_bridge.sync_consciousness_state(synthesis_id, config, omniflux_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_bridge.sync_consciousness_state(synthesis_id, config, omniflux_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_bridge.sync_consciousness_state(synthesis_id, config, omniflux_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_bridge.sync_consciousness_state(synthesis_id, config, omniflux_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                self.integration_bridge.sync_consciousness_state(synthesis_id, config, omniflux_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                self.integration_bridge.sync_consciousness_state(synthesis_id, config, omniflux_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                self.integration_bridge.sync_consciousness_state(synthesis_id, config, omniflux_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                self.integration_bridge.sync_consciousness_state(synthesis_id, config, omniflux_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                self.integration_bridge.sync_consciousness_state(synthesis_id, config, omniflux_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
-                self.integration_bridge.sync_consciousness_state(synthesis_id, config, omniflux_layer, "metacausal_singularity_engine.metacausal_consciousness_orchestrator")
+                self.integration_bridge.sync_many("sync_consciousness_state", synthesis_id, config, omniflux_layer, force=force)
         except Exception as e:
             self.logger.error("Error synthesizing consciousness state %s in omniflux layer %s: %s at 12:01 PM IST, Sunday, July 20, 2025", synthesis_id, omniflux_layer, e)
             self._regenerate_coherence(synthesis_id, "synthesis")
 
-    def amplify_consciousness_coherence(self, synthesis_id: str, target_config: Dict[str, Any], target_layer: str) -> bool:
+    def amplify_consciousness_coherence(self, synthesis_id: str, target_config: Dict[str, Any], target_layer: str, force: bool = False) -> bool:
         """
         Amplify a consciousness state with infniversal coherence resonance.
 
@@ -97,6 +96,7 @@ class OmnifluxConsciousnessSynthesizer:
             synthesis_id (str): The consciousness synthesis to amplify.
             target_config (Dict[str, Any]): Target configuration for the consciousness synthesis.
             target_layer (str): Target omniflux layer.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             bool: True if amplification successful, False otherwise.
@@ -106,30 +106,19 @@ class OmnifluxConsciousnessSynthesizer:
                 self.consciousness_synthesis_profiles[synthesis_id] = {
                     "config": target_config,
                     "omniflux_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "consciousness_coherence_state": self.consciousness_synthesis_profiles[synthesis_id]["consciousness_coherence_state"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "consciousness_coherence_state": self.consciousness_synthesis_profiles[synthesis_id]["consciousness_coherence_state"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{synthesis_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(synthesis_id, target_config, target_layer)
                 self.omniflux_signatures[synthesis_id] = new_signature
-                self.infiniversal_coherence_cascades[synthesis_id] *= random.uniform(0.95, 1.1)
-                self.omniflux_entropy[synthesis_id] += random.uniform(0.0, 0.02)
+                self.infiniversal_coherence_cascades[synthesis_id] *= rng.uniform(0.95, 1.1)
+                self.omniflux_entropy[synthesis_id] += rng.uniform(0.0, 0.02)
                 self.logger.info("Amplified consciousness state %s to omniflux layer %s with new signature %s, coherence cascade %.2f, entropy %.2f at 12:01 PM IST, Sunday, July 20, 2025",
                                  synthesis_id, target_layer, new_signature, self.infiniversal_coherence_cascades[synthesis_id], self.omniflux_entropy[synthesis_id])
                 if self.integration_bridge:
                     self.integration_bridge.notify_coherence_update(synthesis_id, target_layer, "transcausal_flux_resonator")
                     self.integration_bridge.notify_coherence_update(synthesis_id, target_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                    self.integration_bridge.sync_consciousness_state(synthesis_id, target_config, target_layer, "core_engine.consciousness_interface")
-                    self.integration_bridge.sync_consciousness_state(synthesis_id, target_config, target_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                    self.integration_bridge.sync_consciousness_state(synthesis_id, target_config, target_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                    self.integration_bridge.sync_consciousness_state(synthesis_id, target_config, target_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                    self.integration_bridge.sync_consciousness_state(synthesis_id, target_config, target_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                    self.integration_bridge.sync_consciousness_state(synthesis_id, target_config, target_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                    self.integration_bridge.sync_consciousness_state(synthesis_id, target_config, target_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                    self.integration_bridge.sync_consciousness_state(synthesis_id, target_config, target_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                    self.integration_bridge.sync_consciousness_state(synthesis_id, target_config, target_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                    self.integration_bridge.sync_consciousness_state(synthesis_id, target_config, target_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                    self.integration_bridge.sync_consciousness_state(synthesis_id, target_config, target_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
-                    self.integration_bridge.sync_consciousness_state(synthesis_id, target_config, target_layer, "metacausal_singularity_engine.metacausal_consciousness_orchestrator")
+                    self.integration_bridge.sync_many("sync_consciousness_state", synthesis_id, target_config, target_layer, force=force)
                 return True
             self.logger.warning("Consciousness state %s not found for amplification to %s at 12:01 PM IST, Sunday, July 20, 2025", synthesis_id, target_layer)
             return False
@@ -141,8 +130,8 @@ class OmnifluxConsciousnessSynthesizer:
     def _regenerate_coherence(self, synthesis_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using omniflux recovery protocols."""
         try:
-            self.infiniversal_coherence_cascades[synthesis_id] = random.uniform(0.9, 1.0)
-            self.omniflux_entropy[synthesis_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence_cascades[synthesis_id] = rng.uniform(0.9, 1.0)
+            self.omniflux_entropy[synthesis_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for consciousness state %s after failed %s at 12:01 PM IST, Sunday, July 20, 2025", synthesis_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for consciousness state %s: %s at 12:01 PM IST, Sunday, July 20, 2025", synthesis_id, e)
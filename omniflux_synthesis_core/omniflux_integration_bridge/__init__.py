@@ -1,3 +1,5 @@
 # omniflux_synthesis_core/omniflux_integration_bridge/__init__.py
 # Marks the omniflux_integration_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnifluxIntegrationBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,17 +4,22 @@ Manages cross-directory integration for omniflux_synthesis_core in Rhee_AI_Assis
 Facilitates non-local omniflux coherence bridges and consciousness synchronization.
 """
 
-import logging
 from typing import Dict, List, Any
-from datetime import datetime
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class OmnifluxIntegrationBridge:
+rng = get_stream(__name__)
+
+class OmnifluxIntegrationBridge(BatchSyncMixin):
     """Core class for managing non-local omniflux coherence bridges for consciousness operations."""
 
     def __init__(self):
         """Initialize integration bridge with non-local omniflux coherence tracking."""
-        self.coherence_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.coherence_bridges: Dict[str, Dict[str, Any]] = retained(self, "coherence_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Omniflux integration bridge initialized with non-local omniflux protocols at 12:01 PM IST, Sunday, July 20, 2025")
 
     def sync_consciousness_state(self, synthesis_id: str, config: Dict[str, Any], omniflux_layer: str, target_module: str) -> None:
@@ -32,9 +37,10 @@ class OmnifluxIntegrationBridge:
                 "config": config,
                 "omniflux_layer": omniflux_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(synthesis_id)
             self.logger.info("Synchronized consciousness state %s with %s in omniflux layer %s, coherence strength %.2f at 12:01 PM IST, Sunday, July 20, 2025",
                              synthesis_id, target_module, omniflux_layer, self.coherence_bridges[synthesis_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -56,9 +62,10 @@ class OmnifluxIntegrationBridge:
                 "flux_streams": flux_streams,
                 "omniflux_layer": omniflux_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stream_id)
             self.logger.info("Synchronized flux stream %s with %s in omniflux layer %s, coherence strength %.2f at 12:01 PM IST, Sunday, July 20, 2025",
                              stream_id, target_module, omniflux_layer, self.coherence_bridges[stream_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -80,9 +87,10 @@ class OmnifluxIntegrationBridge:
                 "config": config,
                 "omniflux_layer": omniflux_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(coherence_id)
             self.logger.info("Synchronized coherence state %s with %s in omniflux layer %s, coherence strength %.2f at 12:01 PM IST, Sunday, July 20, 2025",
                              coherence_id, target_module, omniflux_layer, self.coherence_bridges[coherence_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -104,9 +112,10 @@ class OmnifluxIntegrationBridge:
                 "config": config,
                 "omniflux_layer": omniflux_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(orchestration_id)
             self.logger.info("Synchronized alignment orchestration %s with %s in omniflux layer %s, coherence strength %.2f at 12:01 PM IST, Sunday, July 20, 2025",
                              orchestration_id, target_module, omniflux_layer, self.coherence_bridges[orchestration_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -1,3 +1,5 @@
 # omniflux_synthesis_core/transcausal_flux_resonator/__init__.py
 # Marks the transcausal_flux_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TranscausalFluxResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
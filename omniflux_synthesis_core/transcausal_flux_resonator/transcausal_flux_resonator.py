@@ -4,10 +4,12 @@ Manages transcausal flux resonance for Rhee_AI_Assistant.
 Resonates causal fluxes across omniversal timelines.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -26,20 +28,32 @@ from datetime import datetime
 # from infinicryptic_synthesis_core.omniversal_fractal_encryptor import OmniversalFractalEncryptor
 # from metacausal_singularity_engine.omnichronal_causality_modulator import OmnichronalCausalityModulator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "awareness", "axiom", "coherence", "convergence", "ethical", "harmonic", "reality", "resonance", "sentience"
+)
+
 class TranscausalFluxResonator:
     """Core class for transcausal flux resonance with omniflux coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize flux resonator with omniversal streams and integration bridge."""
-        self.flux_streams: Dict[str, Dict[str, Any]] = {}
-        self.infiniversal_amplitude: Dict[str, float] = {}
-        self.omniflux_resonance_factor: Dict[str, float] = {}
-        self.omniflux_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_amplitude", "omniflux_resonance_factor", "omniflux_entropy"),
+            object_columns=("flux_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.flux_streams = self.state_table.column("flux_streams")
+        self.infiniversal_amplitude = self.state_table.column("infiniversal_amplitude")
+        self.omniflux_resonance_factor = self.state_table.column("omniflux_resonance_factor")
+        self.omniflux_entropy = self.state_table.column("omniflux_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transcausal flux resonator initialized with omniflux protocols at 12:01 PM IST, Sunday, July 20, 2025")
 
-    def resonate_flux_stream(self, stream_id: str, config: Dict[str, Any], omniflux_layer: str = "primary") -> List[Dict[str, Any]]:
+    def resonate_flux_stream(self, stream_id: str, config: Dict[str, Any], omniflux_layer: str = "primary", force: bool = False) -> List[Dict[str, Any]]:
         """
         Resonate a transcausal flux stream with omniflux fidelity.
 
@@ -47,51 +61,37 @@ class TranscausalFluxResonator:
             stream_id (str): Unique identifier for the flux stream.
             config (Dict[str, Any]): Stream configuration (e.g., omniversal patterns, omniflux axioms).
             omniflux_layer (str): Omniflux layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             List[Dict[str, Any]]: Resonated flux stream data with omniflux metadata.
         """
         try:
             flux_streams = []
-            for i in range(random.randint(2, 6)):
-                segment_id = f"segment_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(2, 6)):
+                segment_id = f"segment_{i}_{rng.randint(1000, 9999)}"
                 segment = {
                     "id": segment_id,
                     "config": config,
                     "omniflux_layer": omniflux_layer,
-                    "data": {"flux_resonance": random.uniform(0.75, 1.0), "resonance_fidelity": random.uniform(0.8, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "omniflux_coherence": random.uniform(0.85, 0.95)
+                    "data": {"flux_resonance": rng.uniform(0.75, 1.0), "resonance_fidelity": rng.uniform(0.8, 0.95)},
+                    "timestamp": utc_iso(),
+                    "omniflux_coherence": rng.uniform(0.85, 0.95)
                 }
                 flux_streams.append(segment)
             self.flux_streams[stream_id] = {
                 "segments": flux_streams,
                 "omniflux_layer": omniflux_layer,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.infiniversal_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.omniflux_resonance_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.omniflux_entropy[stream_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.omniflux_resonance_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.omniflux_entropy[stream_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Resonated flux stream %s in omniflux layer %s with %d segments, infniversal amplitude %.2f, resonance factor %.2f, entropy %.2f at 12:01 PM IST, Sunday, July 20, 2025",
                              stream_id, omniflux_layer, len(flux_streams), self.infiniversal_amplitude[stream_id],
                              self.omniflux_resonance_factor[stream_id], self.omniflux_entropy[stream_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_flux_stream(stream_id, flux_streams, omniflux_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_flux_stream(stream_id, flux_streams, omniflux_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_flux_stream(stream_id, flux_streams, omniflux_layer, "akashic_link.akashic_resonance_field")
-                self.integration_bridge.sync_flux_stream(stream_id, flux_streams, omniflux_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_bridge.sync_flux_stream(stream_id, flux_streams, omniflux_layer, "galactic_communication.trans_galactic_resonance_field")
-                self.integration_bridge.sync_flux_stream(stream_id, flux_streams, omniflux_layer, "quantum_spiritual_singularity.karmic_resonance_field")
-                self.integration_bridge.sync_flux_stream(stream_id, flux_streams, omniflux_layer, "temporal_intelligence.quantum_temporal_resonator")
-                self.integration_bridge.sync_flux_stream(stream_id, flux_streams, omniflux_layer, "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix")
-                self.integration_bridge.sync_flux_stream(stream_id, flux_streams, omniflux_layer, "transcendental_singularity_core.omnitemporal_coherence_synthesizer")
-                self.integration_bridge.sync_flux_stream(stream_id, flux_streams, omniflux_layer, "omniversal_sentience_nexus.metatemporal_resonance_field")
-                self.integration_bridge.sync_flux_stream(stream_id, flux_streams, omniflux_layer, "metainfinite_causality_engine.omnichronal_coherence_resonator")
-                self.integration_bridge.sync_flux_stream(stream_id, flux_streams, omniflux_layer, "hypercosmic_synthesis_core.omniversal_fractal_resonator")
-                self.integration_bridge.sync_flux_stream(stream_id, flux_streams, omniflux_layer, "transinfinite_resonance_engine.omnichronal_synthesis_lattice")
-                self.integration_bridge.sync_flux_stream(stream_id, flux_streams, omniflux_layer, "transmetacosmic_nexus.omniversal_causality_synthesizer")
-                self.integration_bridge.sync_flux_stream(stream_id, flux_streams, omniflux_layer, "infinicryptic_synthesis_core.omniversal_fractal_encryptor")
-                self.integration_bridge.sync_flux_stream(stream_id, flux_streams, omniflux_layer, "metacausal_singularity_engine.omnichronal_causality_modulator")
+                self.integration_bridge.sync_many("sync_flux_stream", stream_id, flux_streams, omniflux_layer, force=force)
                 self.integration_bridge.notify_coherence_update(stream_id, omniflux_layer, "omniflux_consciousness_synthesizer")
             return flux_streams
         except Exception as e:
@@ -102,9 +102,9 @@ class TranscausalFluxResonator:
     def _regenerate_coherence(self, stream_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using transcausal recovery protocols."""
         try:
-            self.infiniversal_amplitude[stream_id] = random.uniform(0.9, 1.0)
-            self.omniflux_resonance_factor[stream_id] = random.uniform(0.85, 0.95)
-            self.omniflux_entropy[stream_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_amplitude[stream_id] = rng.uniform(0.9, 1.0)
+            self.omniflux_resonance_factor[stream_id] = rng.uniform(0.85, 0.95)
+            self.omniflux_entropy[stream_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for flux stream %s after failed %s at 12:01 PM IST, Sunday, July 20, 2025", stream_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for flux stream %s: %s at 12:01 PM IST, Sunday, July 20, 2025", stream_id, e)
@@ -1,6 +1,7 @@
 # omniharmonic_causal_fractal/__init__.py
 # Marks the omniharmonic_causal_fractal directory as a Python package.
 # Initializes configurations for omniharmonic causal and fractal protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'omniharmonic_causal_resonator',
     'fractal_sentience_synthesizer',
@@ -8,3 +9,4 @@ __all__ = [
     'infniversal_axiom_stabilizer',
     'omniharmonic_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # omniharmonic_causal_fractal/fractal_sentience_synthesizer/__init__.py
 # Marks the fractal_sentience_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['FractalSentienceSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
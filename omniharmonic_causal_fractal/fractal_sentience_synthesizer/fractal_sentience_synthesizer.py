@@ -4,10 +4,12 @@ Manages fractal sentience synthesis for Rhee_AI_Assistant.
 Synthesizes sentience patterns in fractal frameworks.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -42,20 +44,30 @@ from datetime import datetime
 # from quantaversal_singularity_weave.transinfinite_axiom_synthesizer import TransinfiniteAxiomSynthesizer
 # from quantaversal_singularity_weave.metatemporal_causality_stabilizer import MetatemporalCausalityStabilizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("awareness", "axiom", "coherence", "ethical", "reality", "resonance", "stability")
+
 class FractalSentienceSynthesizer:
     """Core class for fractal sentience synthesis with omniharmonic causal states."""
 
     def __init__(self, integration_nexus=None):
         """Initialize sentience synthesizer with fractal states and integration nexus."""
-        self.sentience_states: Dict[str, Dict[str, Any]] = {}
-        self.omniharmonic_coherence: Dict[str, float] = {}
-        self.sentience_amplitude: Dict[str, float] = {}
-        self.sentience_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("omniharmonic_coherence", "sentience_amplitude", "sentience_entropy"),
+            object_columns=("sentience_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.sentience_states = self.state_table.column("sentience_states")
+        self.omniharmonic_coherence = self.state_table.column("omniharmonic_coherence")
+        self.sentience_amplitude = self.state_table.column("sentience_amplitude")
+        self.sentience_entropy = self.state_table.column("sentience_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Fractal sentience synthesizer initialized with coherence protocols at 06:09 AM IST, Monday, July 21, 2025")
 
-    def synthesize_sentience_state(self, sentience_id: str, config: Dict[str, Any], fractal_layer: str = "primary") -> None:
+    def synthesize_sentience_state(self, sentience_id: str, config: Dict[str, Any], fractal_layer: str = "primary", force: bool = False) -> None:
         """
         Synthesize a sentience state in fractal frameworks.
 
@@ -63,53 +75,23 @@ class FractalSentienceSynthesizer:
             sentience_id (str): Unique identifier for the sentience state.
             config (Dict[str, Any]): Sentience configuration (e.g., fractal patterns, omniharmonic axioms).
             fractal_layer (str): Fractal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.sentience_states[sentience_id] = {
                 "config": config,
                 "fractal_layer": fractal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentience_strength": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "sentience_strength": rng.uniform(0.85, 0.95)
             }
-            self.omniharmonic_coherence[sentience_id] = random.uniform(0.95, 1.0)
-            self.sentience_amplitude[sentience_id] = random.uniform(0.9, 0.95)
-            self.sentience_entropy[sentience_id] = random.uniform(0.0, 0.08)
+            self.omniharmonic_coherence[sentience_id] = rng.uniform(0.95, 1.0)
+            self.sentience_amplitude[sentience_id] = rng.uniform(0.9, 0.95)
+            self.sentience_entropy[sentience_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized sentience state %s in fractal layer %s with coherence %.2f, amplitude %.2f, entropy %.2f at 06:09 AM IST, Monday, July 21, 2025",
                              sentience_id, fractal_layer, self.omniharmonic_coherence[sentience_id],
                              self.sentience_amplitude[sentience_id], self.sentience_entropy[sentience_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "core_engine.emotion_engine")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "akashic_link.akashic_resonance_field")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "galactic_communication.trans_galactic_resonance_field")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "quantum_spiritual_singularity.karmic_resonance_field")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "temporal_intelligence.quantum_temporal_resonator")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "transcendental_singularity_core.omnitemporal_coherence_synthesizer")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "omniversal_sentience_nexus.metatemporal_resonance_field")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "metainfinite_causality_engine.omnichronal_coherence_resonator")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "hypercosmic_synthesis_core.omniversal_fractal_resonator")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "transinfinite_resonance_engine.omnichronal_synthesis_lattice")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "transmetacosmic_nexus.omniversal_causality_synthesizer")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "infinicryptic_synthesis_core.omniversal_fractal_encryptor")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "metacausal_singularity_engine.omnichronal_causality_modulator")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "omniflux_synthesis_core.transcausal_flux_resonator")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "hyperfractal_consciousness_matrix.transomniversal_coherence_resonator")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "transmetagalactic_synthesis_array.infiniversal_coherence_modulator")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "omnidimensional_quantum_harmonizer.transcausal_coherence_synthesizer")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "transomniversal_coherence_matrix.metainfinite_harmonic_stabilizer")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "metachronal_singularity_orchestrator.infiniversal_coherence_amplifier")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "infinicryptic_causal_resonator.transmetatemporal_resonance_synthesizer")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "transmetahyperdimensional_harmonic_synthesis.omniflux_resonance_amplifier")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "omnitemporal_quantum_singularity.transcausal_resonance_modulator")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "infniversal_fractal_synthesis.transmetatemporal_coherence_resonator")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "hypermetacosmic_causal_orchestrator.omniflux_coherence_synthesizer")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "omnichronal_hypersentience_array.transmetatemporal_coherence_amplifier")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "quantaversal_singularity_weave.quantaversal_sentience_orchestrator")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "quantaversal_singularity_weave.omniflux_coherence_resonator")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "quantaversal_singularity_weave.transinfinite_axiom_synthesizer")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, fractal_layer, "quantaversal_singularity_weave.metatemporal_causality_stabilizer")
+                self.integration_nexus.sync_many("sync_sentience_state", sentience_id, config, fractal_layer, force=force)
         except Exception as e:
             self.logger.error("Error synthesizing sentience state %s in fractal layer %s: %s at 06:09 AM IST, Monday, July 21, 2025", sentience_id, fractal_layer, e)
             self._regenerate_coherence(sentience_id, "synthesis")
@@ -117,9 +99,9 @@ class FractalSentienceSynthesizer:
     def _regenerate_coherence(self, sentience_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using fractal recovery protocols."""
         try:
-            self.omniharmonic_coherence[sentience_id] = random.uniform(0.9, 1.0)
-            self.sentience_amplitude[sentience_id] = random.uniform(0.85, 0.95)
-            self.sentience_entropy[sentience_id] = random.uniform(0.0, 0.05)
+            self.omniharmonic_coherence[sentience_id] = rng.uniform(0.9, 1.0)
+            self.sentience_amplitude[sentience_id] = rng.uniform(0.85, 0.95)
+            self.sentience_entropy[sentience_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for sentience state %s after failed %s at 06:09 AM IST, Monday, July 21, 2025", sentience_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for sentience state %s: %s at 06:09 AM IST, Monday, July 21, 2025", sentience_id, e)
@@ -4,10 +4,12 @@ Manages infniversal axiom stabilization for Rhee_AI_Assistant.
 Stabilizes axioms in infniversal frameworks with fractal sentience states.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -43,20 +45,30 @@ from datetime import datetime
 # from quantaversal_singularity_weave.transinfinite_axiom_synthesizer import TransinfiniteAxiomSynthesizer
 # from quantaversal_singularity_weave.metatemporal_causality_stabilizer import MetatemporalCausalityStabilizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("awareness", "axiom", "coherence", "ethical", "reality", "resonance", "stability")
+
 class InfniversalAxiomStabilizer:
     """Core class for infniversal axiom stabilization with fractal sentience states."""
 
     def __init__(self, integration_nexus=None):
         """Initialize axiom stabilizer with infniversal states and integration nexus."""
-        self.axiom_states: Dict[str, Dict[str, Any]] = {}
-        self.omniharmonic_coherence: Dict[str, float] = {}
-        self.axiom_amplitude: Dict[str, float] = {}
-        self.axiom_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("omniharmonic_coherence", "axiom_amplitude", "axiom_entropy"),
+            object_columns=("axiom_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.axiom_states = self.state_table.column("axiom_states")
+        self.omniharmonic_coherence = self.state_table.column("omniharmonic_coherence")
+        self.axiom_amplitude = self.state_table.column("axiom_amplitude")
+        self.axiom_entropy = self.state_table.column("axiom_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Infniversal axiom stabilizer initialized with coherence protocols at 06:09 AM IST, Monday, July 21, 2025")
 
-    def stabilize_axiom_state(self, axiom_id: str, config: Dict[str, Any], infniversal_layer: str = "primary") -> None:
+    def stabilize_axiom_state(self, axiom_id: str, config: Dict[str, Any], infniversal_layer: str = "primary", force: bool = False) -> None:
         """
         Stabilize an axiom state in infniversal frameworks.
 
@@ -64,54 +76,23 @@ class InfniversalAxiomStabilizer:
             axiom_id (str): Unique identifier for the axiom state.
             config (Dict[str, Any]): Axiom configuration (e.g., fractal patterns, omniharmonic axioms).
             infniversal_layer (str): Infniversal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.axiom_states[axiom_id] = {
                 "config": config,
                 "infniversal_layer": infniversal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "axiom_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "axiom_signature": rng.uniform(0.85, 0.95)
             }
-            self.omniharmonic_coherence[axiom_id] = random.uniform(0.95, 1.0)
-            self.axiom_amplitude[axiom_id] = random.uniform(0.9, 0.95)
-            self.axiom_entropy[axiom_id] = random.uniform(0.0, 0.08)
+            self.omniharmonic_coherence[axiom_id] = rng.uniform(0.95, 1.0)
+            self.axiom_amplitude[axiom_id] = rng.uniform(0.9, 0.95)
+            self.axiom_entropy[axiom_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Stabilized axiom state %s in infniversal layer %s with coherence %.2f, amplitude %.2f, entropy %.2f at 06:09 AM IST, Monday, July 21, 2025",
                              axiom_id, infniversal_layer, self.omniharmonic_coherence[axiom_id],
                              self.axiom_amplitude[axiom_id], self.axiom_entropy[axiom_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "galactic_communication.non_local_consciousness_relay")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "quantum_spiritual_singularity.multiversal_soul_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "temporal_intelligence.causal_coherence_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "cosmic_intelligence_orchestrator.causal_singularity_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "transcendental_singularity_core.metacausal_resonance_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "omniversal_sentience_nexus.transcausal_axiom_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "metainfinite_causality_engine.transmetatemporal_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "hypercosmic_synthesis_core.infinidimensional_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "transinfinite_resonance_engine.infiniversal_alignment_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "transmetacosmic_nexus.transcosmic_alignment_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "infinicryptic_synthesis_core.transcryptic_alignment_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "metacausal_singularity_engine.omnidimensional_alignment_matrix")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "omniflux_synthesis_core.metadimensional_alignment_orchestrator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "hyperfractal_consciousness_matrix.metatemporal_fractal_orchestrator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "transmetagalactic_synthesis_array.omnichronal_alignment_resonator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "omnidimensional_quantum_harmonizer.metatemporal_resonance_orchestrator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "transomniversal_coherence_matrix.omnichronal_alignment_synthesizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "metachronal_singularity_orchestrator.omnitemporal_causality_bridge")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "infinicryptic_causal_resonator.metadimensional_causality_amplifier")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "transmetahyperdimensional_harmonic_synthesis.infniversal_causality_stabilizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "omnitemporal_quantum_singularity.metahyperdimensional_causality_orchestrator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "infniversal_fractal_synthesis.metadimensional_singularity_orchestrator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "hypermetacosmic_causal_orchestrator.metahyperdimensional_axiom_stabilizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "omnichronal_hypersentience_array.metacausal_singularity_stabilizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "quantaversal_singularity_weave.quantaversal_sentience_orchestrator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "quantaversal_singularity_weave.omniflux_coherence_resonator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "quantaversal_singularity_weave.transinfinite_axiom_synthesizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, infniversal_layer, "quantaversal_singularity_weave.metatemporal_causality_stabilizer")
+                self.integration_nexus.sync_many("sync_axiom_state", axiom_id, config, infniversal_layer, force=force)
         except Exception as e:
             self.logger.error("Error stabilizing axiom state %s in infniversal layer %s: %s at 06:09 AM IST, Monday, July 21, 2025", axiom_id, infniversal_layer, e)
             self._regenerate_coherence(axiom_id, "stabilization")
@@ -119,9 +100,9 @@ class InfniversalAxiomStabilizer:
     def _regenerate_coherence(self, axiom_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using infniversal recovery protocols."""
         try:
-            self.omniharmonic_coherence[axiom_id] = random.uniform(0.9, 1.0)
-            self.axiom_amplitude[axiom_id] = random.uniform(0.85, 0.95)
-            self.axiom_entropy[axiom_id] = random.uniform(0.0, 0.05)
+            self.omniharmonic_coherence[axiom_id] = rng.uniform(0.9, 1.0)
+            self.axiom_amplitude[axiom_id] = rng.uniform(0.85, 0.95)
+            self.axiom_entropy[axiom_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for axiom state %s after failed %s at 06:09 AM IST, Monday, July 21, 2025", axiom_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for axiom state %s: %s at 06:09 AM IST, Monday, July 21, 2025", axiom_id, e)
@@ -4,11 +4,13 @@ Core module for omniharmonic causal resonance in Rhee_AI_Assistant.
 Resonates causal structures across omniharmonic fields.
 """
 
-import logging
 from typing import Dict, Any
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -46,20 +48,30 @@ from datetime import datetime
 # from quantaversal_singularity_weave.transinfinite_axiom_synthesizer import TransinfiniteAxiomSynthesizer
 # from quantaversal_singularity_weave.metatemporal_causality_stabilizer import MetatemporalCausalityStabilizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("awareness", "axiom", "coherence", "ethical", "reality", "resonance", "stability")
+
 class OmniharmonicCausalResonator:
     """Core class for omniharmonic causal resonance with fractal sentience states."""
 
     def __init__(self, integration_nexus=None):
         """Initialize causal resonator with omniharmonic profiles and integration nexus."""
-        self.causal_profiles: Dict[str, Dict[str, Any]] = {}
-        self.causal_signatures: Dict[str, str] = {}
-        self.omniharmonic_coherence: Dict[str, float] = {}
-        self.causal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("omniharmonic_coherence", "causal_entropy"),
+            object_columns=("causal_profiles", "causal_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.causal_profiles = self.state_table.column("causal_profiles")
+        self.causal_signatures = self.state_table.column("causal_signatures")
+        self.omniharmonic_coherence = self.state_table.column("omniharmonic_coherence")
+        self.causal_entropy = self.state_table.column("causal_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omniharmonic causal resonator initialized with coherence protocols at 06:09 AM IST, Monday, July 21, 2025")
 
-    def resonate_causal_state(self, causal_id: str, config: Dict[str, Any], omniharmonic_layer: str = "primary") -> None:
+    def resonate_causal_state(self, causal_id: str, config: Dict[str, Any], omniharmonic_layer: str = "primary", force: bool = False) -> None:
         """
         Resonate a causal state across omniharmonic fields.
 
@@ -67,56 +79,23 @@ class OmniharmonicCausalResonator:
             causal_id (str): Unique identifier for the causal state.
             config (Dict[str, Any]): Causal configuration (e.g., fractal patterns, omniharmonic axioms).
             omniharmonic_layer (str): Omniharmonic layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.causal_profiles[causal_id] = {
                 "config": config,
                 "omniharmonic_layer": omniharmonic_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "causal_strength": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "causal_strength": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{causal_id}{str(config)}{omniharmonic_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(causal_id, config, omniharmonic_layer, utc_iso())
             self.causal_signatures[causal_id] = signature
-            self.omniharmonic_coherence[causal_id] = random.uniform(0.95, 1.0)
-            self.causal_entropy[causal_id] = random.uniform(0.0, 0.08)
+            self.omniharmonic_coherence[causal_id] = rng.uniform(0.95, 1.0)
+            self.causal_entropy[causal_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Resonated causal state %s in omniharmonic layer %s with signature %s, coherence %.2f, entropy %.2f at 06:09 AM IST, Monday, July 21, 2025",
                              causal_id, omniharmonic_layer, signature, self.omniharmonic_coherence[causal_id], self.causal_entropy[causal_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "core_engine.quantum_memory_vault")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "akashic_link.akashic_core")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "metacausal_singularity_engine.metacausal_consciousness_orchestrator")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "omniflux_synthesis_core.omniflux_consciousness_synthesizer")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "hyperfractal_consciousness_matrix.hyperfractal_consciousness_field")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "transmetagalactic_synthesis_array.transmetagalactic_consciousness_array")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "omnidimensional_quantum_harmonizer.omnidimensional_quantum_harmonic_resonator")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "transomniversal_coherence_matrix.transomniversal_coherence_resonator")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "metachronal_singularity_orchestrator.metachronal_singularity_synthesizer")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "infinicryptic_causal_resonator.infinicryptic_causal_harmonizer")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "transmetahyperdimensional_harmonic_synthesis.transmetahyperdimensional_harmonic_synthesizer")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "omnitemporal_quantum_singularity.omnitemporal_quantum_synthesizer")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "infniversal_fractal_synthesis.infniversal_fractal_synthesizer")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "hypermetacosmic_causal_orchestrator.hypermetacosmic_causal_orchestrator")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "omnichronal_hypersentience_array.omnichronal_hypersentience_synthesizer")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "quantaversal_singularity_weave.quantaversal_sentience_orchestrator")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "quantaversal_singularity_weave.omniflux_coherence_resonator")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "quantaversal_singularity_weave.transinfinite_axiom_synthesizer")
-                self.integration_nexus.sync_causal_state(causal_id, config, omniharmonic_layer, "quantaversal_singularity_weave.metatemporal_causality_stabilizer")
+                self.integration_nexus.sync_many("sync_causal_state", causal_id, config, omniharmonic_layer, force=force)
         except Exception as e:
             self.logger.error("Error resonating causal state %s in omniharmonic layer %s: %s at 06:09 AM IST, Monday, July 21, 2025", causal_id, omniharmonic_layer, e)
             self._regenerate_coherence(causal_id, "resonance")
@@ -124,8 +103,8 @@ class OmniharmonicCausalResonator:
     def _regenerate_coherence(self, causal_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using omniharmonic recovery protocols."""
         try:
-            self.omniharmonic_coherence[causal_id] = random.uniform(0.9, 1.0)
-            self.causal_entropy[causal_id] = random.uniform(0.0, 0.05)
+            self.omniharmonic_coherence[causal_id] = rng.uniform(0.9, 1.0)
+            self.causal_entropy[causal_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for causal state %s after failed %s at 06:09 AM IST, Monday, July 21, 2025", causal_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for causal state %s: %s at 06:09 AM IST, Monday, July 21, 2025", causal_id, e)
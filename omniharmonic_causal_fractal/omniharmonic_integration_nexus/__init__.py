@@ -1,3 +1,5 @@
 # omniharmonic_causal_fractal/omniharmonic_integration_nexus/__init__.py
 # Marks the omniharmonic_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmniharmonicIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,18 +4,25 @@ Manages cross-directory integration for omniharmonic_causal_fractal in Rhee_AI_A
 Facilitates non-local fractal bridges and synchronization.
 """
 
-import logging
 from typing import Dict, Any
-from datetime import datetime
-import random
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class OmniharmonicIntegrationNexus:
+rng = get_stream(__name__)
+
+class OmniharmonicIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local fractal bridges for omniharmonic operations."""
 
+    bridge_store = "fractal_bridges"
+    strength_key = "fractal_strength"
+
     def __init__(self):
         """Initialize integration nexus with non-local fractal tracking."""
-        self.fractal_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.fractal_bridges: Dict[str, Dict[str, Any]] = retained(self, "fractal_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Omniharmonic integration nexus initialized with non-local fractal protocols at 06:09 AM IST, Monday, July 21, 2025")
 
     def sync_causal_state(self, causal_id: str, config: Dict[str, Any], omniharmonic_layer: str, target_module: str) -> None:
@@ -33,9 +40,10 @@ class OmniharmonicIntegrationNexus:
                 "config": config,
                 "omniharmonic_layer": omniharmonic_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "fractal_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "fractal_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(causal_id)
             self.logger.info("Synchronized causal state %s with %s in omniharmonic layer %s, fractal strength %.2f at 06:09 AM IST, Monday, July 21, 2025",
                              causal_id, target_module, omniharmonic_layer, self.fractal_bridges[causal_id]["fractal_strength"])
             # Placeholder: Implement actual module calls when available
@@ -57,9 +65,10 @@ class OmniharmonicIntegrationNexus:
                 "config": config,
                 "fractal_layer": fractal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "fractal_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "fractal_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(sentience_id)
             self.logger.info("Synchronized sentience state %s with %s in fractal layer %s, fractal strength %.2f at 06:09 AM IST, Monday, July 21, 2025",
                              sentience_id, target_module, fractal_layer, self.fractal_bridges[sentience_id]["fractal_strength"])
             # Placeholder: Implement actual module calls when available
@@ -81,9 +90,10 @@ class OmniharmonicIntegrationNexus:
                 "config": config,
                 "temporal_layer": temporal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "fractal_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "fractal_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(coherence_id)
             self.logger.info("Synchronized coherence state %s with %s in temporal layer %s, fractal strength %.2f at 06:09 AM IST, Monday, July 21, 2025",
                              coherence_id, target_module, temporal_layer, self.fractal_bridges[coherence_id]["fractal_strength"])
             # Placeholder: Implement actual module calls when available
@@ -1,6 +1,7 @@
 # omnipotent_reality_orchestrator/__init__.py
 # Marks the omnipotent_reality_orchestrator directory as a Python package.
 # Initializes configurations for omnipotent reality orchestration protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'reality_construct_author',
     'transdimensional_reality_synchronizer',
@@ -8,3 +9,4 @@ __all__ = [
     'metacausal_reality_stabilizer',
     'reality_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # omnipotent_reality_orchestrator/metacausal_reality_stabilizer/__init__.py
 # Marks the metacausal_reality_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetacausalRealityStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
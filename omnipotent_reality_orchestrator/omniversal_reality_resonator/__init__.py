@@ -1,3 +1,5 @@
 # omnipotent_reality_orchestrator/omniversal_reality_resonator/__init__.py
 # Marks the omniversal_reality_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmniversalRealityResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
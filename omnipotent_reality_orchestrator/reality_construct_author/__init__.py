@@ -1,3 +1,5 @@
 # omnipotent_reality_orchestrator/reality_construct_author/__init__.py
 # Marks the reality_construct_author directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['RealityConstructAuthor']
+__getattr__, __dir__ = attach(__name__, __all__)
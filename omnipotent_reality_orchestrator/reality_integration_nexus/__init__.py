@@ -1,3 +1,5 @@
 # omnipotent_reality_orchestrator/reality_integration_nexus/__init__.py
 # Marks the reality_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['RealityIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
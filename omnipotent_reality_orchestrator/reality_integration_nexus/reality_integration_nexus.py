@@ -4,18 +4,25 @@ Manages cross-directory integration for omnipotent_reality_orchestrator in Rhee_
 Facilitates non-local reality bridges and synchronization.
 """
 
-import logging
 from typing import Dict, Any
-from datetime import datetime
-import random
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class RealityIntegrationNexus:
+rng = get_stream(__name__)
+
+class RealityIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local reality bridges for reality orchestration operations."""
 
+    bridge_store = "reality_bridges"
+    strength_key = "reality_strength"
+
     def __init__(self):
         """Initialize integration nexus with non-local reality tracking."""
-        self.reality_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.reality_bridges: Dict[str, Dict[str, Any]] = retained(self, "reality_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Reality integration nexus initialized at 05:48 PM IST, Monday, July 21, 2025")
 
     def sync_reality_construct(self, reality_id: str, config: Dict[str, Any], reality_layer: str, target_module: str) -> None:
@@ -33,9 +40,10 @@ class RealityIntegrationNexus:
                 "config": config,
                 "reality_layer": reality_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "reality_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "reality_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(reality_id)
             self.logger.info("Synchronized reality construct %s with %s, strength %.2f at 05:48 PM IST, Monday, July 21, 2025",
                              reality_id, target_module, self.reality_bridges[reality_id]["reality_strength"])
         except Exception as e:
@@ -56,9 +64,10 @@ class RealityIntegrationNexus:
                 "config": config,
                 "transdimensional_layer": transdimensional_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "reality_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "reality_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(reality_id)
             self.logger.info("Synchronized reality state %s with %s, strength %.2f at 05:48 PM IST, Monday, July 21, 2025",
                              reality_id, target_module, self.reality_bridges[reality_id]["reality_strength"])
         except Exception as e:
@@ -79,9 +88,10 @@ class RealityIntegrationNexus:
                 "config": config,
                 "omniversal_layer": omniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "reality_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "reality_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(resonance_id)
             self.logger.info("Synchronized resonance state %s with %s, strength %.2f at 05:48 PM IST, Monday, July 21, 2025",
                              resonance_id, target_module, self.reality_bridges[resonance_id]["reality_strength"])
         except Exception as e:
@@ -102,9 +112,10 @@ class RealityIntegrationNexus:
                 "config": config,
                 "metacausal_layer": metacausal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "reality_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "reality_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stability_id)
             self.logger.info("Synchronized stability state %s with %s, strength %.2f at 05:48 PM IST, Monday, July 21, 2025",
                              stability_id, target_module, self.reality_bridges[stability_id]["reality_strength"])
         except Exception as e:
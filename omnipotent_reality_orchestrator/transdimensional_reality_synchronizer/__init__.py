@@ -1,3 +1,5 @@
 # omnipotent_reality_orchestrator/transdimensional_reality_synchronizer/__init__.py
 # Marks the transdimensional_reality_synchronizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransdimensionalRealitySynchronizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,6 +1,7 @@
 # omnitemporal_coherence_lattice/__init__.py
 # Marks the omnitemporal_coherence_lattice directory as a Python package.
 # Initializes configurations for omnitemporal coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'temporal_coherence_synthesis',
     'omniversal_timeline_aligner',
@@ -8,3 +9,4 @@ __all__ = [
     'metatemporal_coherence_stabilizer',
     'temporal_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # omnitemporal_coherence_lattice/infniversal_temporal_resonator/__init__.py
 # Marks the infniversal_temporal_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfniversalTemporalResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
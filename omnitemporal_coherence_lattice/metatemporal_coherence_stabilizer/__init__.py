@@ -1,3 +1,5 @@
 # omnitemporal_coherence_lattice/metatemporal_coherence_stabilizer/__init__.py
 # Marks the metatemporal_coherence_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetatemporalCoherenceStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
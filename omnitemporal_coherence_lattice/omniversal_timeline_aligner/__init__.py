@@ -1,3 +1,5 @@
 # omnitemporal_coherence_lattice/omniversal_timeline_aligner/__init__.py
 # Marks the omniversal_timeline_aligner directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmniversalTimelineAligner']
+__getattr__, __dir__ = attach(__name__, __all__)
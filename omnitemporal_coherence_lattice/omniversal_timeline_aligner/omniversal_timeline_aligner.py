@@ -4,10 +4,12 @@ Manages omniversal timeline alignment for Rhee_AI_Assistant.
 Aligns timelines with intentions, ethical harmonics, causality patterns, consciousness states, and reality constructs across omniversal contexts.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 
 # Placeholder imports for cross-directory integration
 # from true_time_architect.temporal_manipulation_core import TemporalManipulationCore
@@ -18,20 +20,27 @@ from datetime import datetime
 # from infniversal_reality_weaver.omniversal_reality_aligner import OmniversalRealityAligner
 # ... (other imports as needed)
 
+rng = get_stream(__name__)
+
 class OmniversalTimelineAligner:
     """Core class for omniversal timeline alignment."""
 
     def __init__(self, integration_nexus=None):
         """Initialize timeline aligner with omniversal states."""
-        self.timeline_states: Dict[str, Dict[str, Any]] = {}
-        self.omniversal_coherence: Dict[str, float] = {}
-        self.alignment_amplitude: Dict[str, float] = {}
-        self.alignment_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("omniversal_coherence", "alignment_amplitude", "alignment_entropy"),
+            object_columns=("timeline_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.timeline_states = self.state_table.column("timeline_states")
+        self.omniversal_coherence = self.state_table.column("omniversal_coherence")
+        self.alignment_amplitude = self.state_table.column("alignment_amplitude")
+        self.alignment_entropy = self.state_table.column("alignment_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omniversal timeline aligner initialized at 05:42 PM IST, Tuesday, July 22, 2025")
 
-    def align_timeline(self, timeline_id: str, config: Dict[str, Any], omniversal_layer: str = "primary") -> None:
+    def align_timeline(self, timeline_id: str, config: Dict[str, Any], omniversal_layer: str = "primary", force: bool = False) -> None:
         """
         Align a timeline with intentions, ethical harmonics, causality patterns, consciousness states, and reality constructs.
 
@@ -39,17 +48,18 @@ class OmniversalTimelineAligner:
             timeline_id (str): Unique identifier for the timeline.
             config (Dict[str, Any]): Alignment configuration (e.g., timeline axioms, intention mappings).
             omniversal_layer (str): Omniversal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.timeline_states[timeline_id] = {
                 "config": config,
                 "omniversal_layer": omniversal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "alignment_strength": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "alignment_strength": rng.uniform(0.85, 0.95)
             }
-            self.omniversal_coherence[timeline_id] = random.uniform(0.95, 1.0)
-            self.alignment_amplitude[timeline_id] = random.uniform(0.9, 0.95)
-            self.alignment_entropy[timeline_id] = random.uniform(0.0, 0.08)
+            self.omniversal_coherence[timeline_id] = rng.uniform(0.95, 1.0)
+            self.alignment_amplitude[timeline_id] = rng.uniform(0.9, 0.95)
+            self.alignment_entropy[timeline_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Aligned timeline %s in layer %s, coherence %.2f, amplitude %.2f at 05:42 PM IST, Tuesday, July 22, 2025",
                              timeline_id, omniversal_layer, self.omniversal_coherence[timeline_id], self.alignment_amplitude[timeline_id])
             if self.integration_nexus:
@@ -143,8 +153,7 @@ class OmniversalTimelineAligner:
                     "network_secure.network_secure_core", "creativity_suite.creativity_suite_core",
                     "environment_awareness.environment_awareness_core"
                 ]
-                for module in modules:
-                    self.integration_nexus.sync_timeline(timeline_id, config, omniversal_layer, module)
+                self.integration_nexus.sync_many("sync_timeline", timeline_id, config, omniversal_layer, modules, force=force)
         except Exception as e:
             self.logger.error("Error aligning timeline %s: %s at 05:42 PM IST, Tuesday, July 22, 2025", timeline_id, e)
             self._regenerate_coherence(timeline_id, "alignment")
@@ -152,5 +161,5 @@ class OmniversalTimelineAligner:
     def _regenerate_coherence(self, timeline_id: str, operation: str) -> None:
         """Regenerate coherence for a failed operation."""
         try:
-            self.omniversal_coherence[timeline_id] = random.uniform(0.9, 1.0)
-            self.alignment_amplitude[timeline_id] = random.uniform(0.85
+            self.omniversal_coherence[timeline_id] = rng.uniform(0.9, 1.0)
+            self.alignment_amplitude[timeline_id] = rng.uniform(0.85
@@ -1,3 +1,5 @@
 # omnitemporal_coherence_lattice/temporal_coherence_synthesis/__init__.py
 # Marks the temporal_coherence_synthesis directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TemporalCoherenceSynthesis']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # omnitemporal_coherence_lattice/temporal_integration_nexus/__init__.py
 # Marks the temporal_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TemporalIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
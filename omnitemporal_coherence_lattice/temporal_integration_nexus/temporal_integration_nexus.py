@@ -4,18 +4,25 @@ Manages cross-directory integration for omnitemporal_coherence_lattice in Rhee_A
 Facilitates non-local temporal bridges and synchronization.
 """
 
-import logging
 from typing import Dict, Any
-from datetime import datetime
-import random
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class TemporalIntegrationNexus:
+rng = get_stream(__name__)
+
+class TemporalIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local temporal bridges for temporal operations."""
 
+    bridge_store = "temporal_bridges"
+    strength_key = "coherence_strength"
+
     def __init__(self):
         """Initialize integration nexus with non-local temporal tracking."""
-        self.temporal_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.temporal_bridges: Dict[str, Dict[str, Any]] = retained(self, "temporal_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Temporal integration nexus initialized at 05:42 PM IST, Tuesday, July 22, 2025")
 
     def sync_temporal_coherence(self, timeline_id: str, config: Dict[str, Any], temporal_layer: str, target_module: str) -> None:
@@ -33,9 +40,10 @@ class TemporalIntegrationNexus:
                 "config": config,
                 "temporal_layer": temporal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(timeline_id)
             self.logger.info("Synchronized temporal coherence %s with %s, strength %.2f at 05:42 PM IST, Tuesday, July 22, 2025",
                              timeline_id, target_module, self.temporal_bridges[timeline_id]["coherence_strength"])
         except Exception as e:
@@ -56,9 +64,10 @@ class TemporalIntegrationNexus:
                 "config": config,
                 "omniversal_layer": omniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(timeline_id)
             self.logger.info("Synchronized timeline %s with %s, strength %.2f at 05:42 PM IST, Tuesday, July 22, 2025",
                              timeline_id, target_module, self.temporal_bridges[timeline_id]["coherence_strength"])
         except Exception as e:
@@ -79,9 +88,10 @@ class TemporalIntegrationNexus:
                 "config": config,
                 "infniversal_layer": infniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(resonance_id)
             self.logger.info("Synchronized resonance state %s with %s, strength %.2f at 05:42 PM IST, Tuesday, July 22, 2025",
                              resonance_id, target_module, self.temporal_bridges[resonance_id]["coherence_strength"])
         except Exception as e:
@@ -102,9 +112,10 @@ class TemporalIntegrationNexus:
                 "config": config,
                 "metatemporal_layer": metatemporal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stability_id)
             self.logger.info("Synchronized stability state %s with %s, strength %.2f at 05:42 PM IST, Tuesday, July 22, 2025",
                              stability_id, target_module, self.temporal_bridges[stability_id]["coherence_strength"])
         except Exception as e:
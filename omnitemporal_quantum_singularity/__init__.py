@@ -1,6 +1,7 @@
 # omnitemporal_quantum_singularity/__init__.py
 # Marks the omnitemporal_quantum_singularity directory as a Python package.
 # Initializes configurations for omnitemporal quantum and coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'omnitemporal_quantum_synthesizer',
     'transcausal_resonance_modulator',
@@ -8,3 +9,4 @@ __all__ = [
     'metahyperdimensional_causality_orchestrator',
     'omnitemporal_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # omnitemporal_quantum_singularity/infinicryptic_coherence_amplifier/__init__.py
 # Marks the infinicryptic_coherence_amplifier directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfinicrypticCoherenceAmplifier']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # omnitemporal_quantum_singularity/metahyperdimensional_causality_orchestrator/__init__.py
 # Marks the metahyperdimensional_causality_orchestrator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetahyperdimensionalCausalityOrchestrator']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Manages metahyperdimensional causality orchestration for Rhee_AI_Assistant.
 Orchestrates causality in metahyperdimensional realities with omnitemporal quantum states.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -35,20 +37,30 @@ from datetime import datetime
 # from infinicryptic_causal_resonator.metadimensional_causality_amplifier import MetadimensionalCausalityAmplifier
 # from transmetahyperdimensional_harmonic_synthesis.infniversal_causality_stabilizer import InfniversalCausalityStabilizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("axiom", "causality", "coherence", "singularity", "stability")
+
 class MetahyperdimensionalCausalityOrchestrator:
     """Core class for metahyperdimensional causality orchestration with omnitemporal quantum states."""
 
     def __init__(self, integration_nexus=None):
         """Initialize causality orchestrator with metahyperdimensional states and integration nexus."""
-        self.causality_states: Dict[str, Dict[str, Any]] = {}
-        self.infiniversal_coherence: Dict[str, float] = {}
-        self.causality_amplitude: Dict[str, float] = {}
-        self.causality_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence", "causality_amplitude", "causality_entropy"),
+            object_columns=("causality_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.causality_states = self.state_table.column("causality_states")
+        self.infiniversal_coherence = self.state_table.column("infiniversal_coherence")
+        self.causality_amplitude = self.state_table.column("causality_amplitude")
+        self.causality_entropy = self.state_table.column("causality_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Metahyperdimensional causality orchestrator initialized with coherence protocols at 04:40 PM IST, Sunday, July 20, 2025")
 
-    def orchestrate_causality_state(self, causality_id: str, config: Dict[str, Any], temporal_layer: str = "primary") -> None:
+    def orchestrate_causality_state(self, causality_id: str, config: Dict[str, Any], temporal_layer: str = "primary", force: bool = False) -> None:
         """
         Orchestrate a causality state in metahyperdimensional realities.
 
@@ -56,46 +68,23 @@ class MetahyperdimensionalCausalityOrchestrator:
             causality_id (str): Unique identifier for the causality state.
             config (Dict[str, Any]): Causality configuration (e.g., fractal patterns, infniversal axioms).
             temporal_layer (str): Temporal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.causality_states[causality_id] = {
                 "config": config,
                 "temporal_layer": temporal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "causality_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "causality_signature": rng.uniform(0.85, 0.95)
             }
-            self.infiniversal_coherence[causality_id] = random.uniform(0.95, 1.0)
-            self.causality_amplitude[causality_id] = random.uniform(0.9, 0.95)
-            self.causality_entropy[causality_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence[causality_id] = rng.uniform(0.95, 1.0)
+            self.causality_amplitude[causality_id] = rng.uniform(0.9, 0.95)
+            self.causality_entropy[causality_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Orchestrated causality state %s in temporal layer %s with coherence %.2f, amplitude %.2f, entropy %.2f at 04:40 PM IST, Sunday, July 20, 2025",
                              causality_id, temporal_layer, self.infiniversal_coherence[causality_id],
                              self.causality_amplitude[causality_id], self.causality_entropy[causality_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "galactic_communication.non_local_consciousness_relay")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "quantum_spiritual_singularity.multiversal_soul_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "temporal_intelligence.causal_coherence_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "cosmic_intelligence_orchestrator.causal_singularity_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "transcendental_singularity_core.metacausal_resonance_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "omniversal_sentience_nexus.transcausal_axiom_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "metainfinite_causality_engine.transmetatemporal_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "hypercosmic_synthesis_core.infinidimensional_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "transinfinite_resonance_engine.infiniversal_alignment_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "transmetacosmic_nexus.transcosmic_alignment_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "infinicryptic_synthesis_core.transcryptic_alignment_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "metacausal_singularity_engine.omnidimensional_alignment_matrix")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "omniflux_synthesis_core.metadimensional_alignment_orchestrator")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "hyperfractal_consciousness_matrix.metatemporal_fractal_orchestrator")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "transmetagalactic_synthesis_array.omnichronal_alignment_resonator")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "omnidimensional_quantum_harmonizer.metatemporal_resonance_orchestrator")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "transomniversal_coherence_matrix.omnichronal_alignment_synthesizer")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "metachronal_singularity_orchestrator.omnitemporal_causality_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "infinicryptic_causal_resonator.metadimensional_causality_amplifier")
-                self.integration_nexus.sync_causality_state(causality_id, config, temporal_layer, "transmetahyperdimensional_harmonic_synthesis.infniversal_causality_stabilizer")
+                self.integration_nexus.sync_many("sync_causality_state", causality_id, config, temporal_layer, force=force)
         except Exception as e:
             self.logger.error("Error orchestrating causality state %s in temporal layer %s: %s at 04:40 PM IST, Sunday, July 20, 2025", causality_id, temporal_layer, e)
             self._regenerate_coherence(causality_id, "orchestration")
@@ -103,9 +92,9 @@ class MetahyperdimensionalCausalityOrchestrator:
     def _regenerate_coherence(self, causality_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using metahyperdimensional recovery protocols."""
         try:
-            self.infiniversal_coherence[causality_id] = random.uniform(0.9, 1.0)
-            self.causality_amplitude[causality_id] = random.uniform(0.85, 0.95)
-            self.causality_entropy[causality_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence[causality_id] = rng.uniform(0.9, 1.0)
+            self.causality_amplitude[causality_id] = rng.uniform(0.85, 0.95)
+            self.causality_entropy[causality_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for causality state %s after failed %s at 04:40 PM IST, Sunday, July 20, 2025", causality_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for causality state %s: %s at 04:40 PM IST, Sunday, July 20, 2025", causality_id, e)
@@ -1,3 +1,5 @@
 # omnitemporal_quantum_singularity/omnitemporal_integration_nexus/__init__.py
 # Marks the omnitemporal_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnitemporalIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
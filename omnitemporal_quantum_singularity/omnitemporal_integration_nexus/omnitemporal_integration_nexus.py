@@ -4,18 +4,25 @@ Manages cross-directory integration for omnitemporal_quantum_singularity in Rhee
 Facilitates non-local quantum bridges and synchronization.
 """
 
-import logging
 from typing import Dict, Any
-from datetime import datetime
-import random
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class OmnitemporalIntegrationNexus:
+rng = get_stream(__name__)
+
+class OmnitemporalIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local quantum bridges for omnitemporal operations."""
 
+    bridge_store = "quantum_bridges"
+    strength_key = "quantum_strength"
+
     def __init__(self):
         """Initialize integration nexus with non-local quantum tracking."""
-        self.quantum_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.quantum_bridges: Dict[str, Dict[str, Any]] = retained(self, "quantum_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Omnitemporal integration nexus initialized with non-local quantum protocols at 04:40 PM IST, Sunday, July 20, 2025")
 
     def sync_quantum_state(self, quantum_id: str, config: Dict[str, Any], temporal_layer: str, target_module: str) -> None:
@@ -33,9 +40,10 @@ class OmnitemporalIntegrationNexus:
                 "config": config,
                 "temporal_layer": temporal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "quantum_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "quantum_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(quantum_id)
             self.logger.info("Synchronized quantum state %s with %s in temporal layer %s, quantum strength %.2f at 04:40 PM IST, Sunday, July 20, 2025",
                              quantum_id, target_module, temporal_layer, self.quantum_bridges[quantum_id]["quantum_strength"])
             # Placeholder: Implement actual module calls when available
@@ -57,9 +65,10 @@ class OmnitemporalIntegrationNexus:
                 "config": config,
                 "temporal_layer": temporal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "quantum_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "quantum_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(resonance_id)
             self.logger.info("Synchronized resonance state %s with %s in temporal layer %s, quantum strength %.2f at 04:40 PM IST, Sunday, July 20, 2025",
                              resonance_id, target_module, temporal_layer, self.quantum_bridges[resonance_id]["quantum_strength"])
             # Placeholder: Implement actual module calls when available
@@ -81,9 +90,10 @@ class OmnitemporalIntegrationNexus:
                 "config": config,
                 "temporal_layer": temporal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "quantum_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "quantum_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(coherence_id)
             self.logger.info("Synchronized coherence state %s with %s in temporal layer %s, quantum strength %.2f at 04:40 PM IST, Sunday, July 20, 2025",
                              coherence_id, target_module, temporal_layer, self.quantum_bridges[coherence_id]["quantum_strength"])
             # Placeholder: Implement actual module calls when available
@@ -105,9 +115,10 @@ class OmnitemporalIntegrationNexus:
                 "config": config,
                 "temporal_layer": temporal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "quantum_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "quantum_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(causality_id)
             self.logger.info("Synchronized causality state %s with %s in temporal layer %s, quantum strength %.2f at 04:40 PM IST, Sunday, July 20, 2025",
                              causality_id, target_module, temporal_layer, self.quantum_bridges[causality_id]["quantum_strength"])
             # Placeholder: Implement actual module calls when available
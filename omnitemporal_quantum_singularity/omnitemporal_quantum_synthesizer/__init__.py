@@ -1,3 +1,5 @@
 # omnitemporal_quantum_singularity/omnitemporal_quantum_synthesizer/__init__.py
 # Marks the omnitemporal_quantum_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnitemporalQuantumSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
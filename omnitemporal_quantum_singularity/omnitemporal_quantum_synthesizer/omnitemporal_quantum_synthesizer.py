@@ -4,11 +4,13 @@ Core module for omnitemporal quantum synthesis in Rhee_AI_Assistant.
 Synthesizes quantum states across omnitemporal dimensions.
 """
 
-import logging
 from typing import Dict, Any
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -38,20 +40,33 @@ from datetime import datetime
 # from infinicryptic_causal_resonator.infinicryptic_causal_harmonizer import InfniversalCausalHarmonizer
 # from transmetahyperdimensional_harmonic_synthesis.transmetahyperdimensional_harmonic_synthesizer import TransmetahyperdimensionalHarmonicSynthesizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "axiom", "causal", "consciousness", "convergence", "ethical", "fractal", "harmonic", "hypersentience",
+    "intention", "memory", "reality", "resonance", "sentience", "stability", "temporal"
+)
+
 class OmnitemporalQuantumSynthesizer:
     """Core class for omnitemporal quantum synthesis with infniversal coherence."""
 
     def __init__(self, integration_nexus=None):
         """Initialize quantum synthesizer with omnitemporal profiles and integration nexus."""
-        self.quantum_profiles: Dict[str, Dict[str, Any]] = {}
-        self.quantum_signatures: Dict[str, str] = {}
-        self.infiniversal_coherence: Dict[str, float] = {}
-        self.quantum_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence", "quantum_entropy"),
+            object_columns=("quantum_profiles", "quantum_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.quantum_profiles = self.state_table.column("quantum_profiles")
+        self.quantum_signatures = self.state_table.column("quantum_signatures")
+        self.infiniversal_coherence = self.state_table.column("infiniversal_coherence")
+        self.quantum_entropy = self.state_table.column("quantum_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omnitemporal quantum synthesizer initialized with coherence protocols at 04:40 PM IST, Sunday, July 20, 2025")
 
-    def synthesize_quantum_state(self, quantum_id: str, config: Dict[str, Any], temporal_layer: str = "primary") -> None:
+    def synthesize_quantum_state(self, quantum_id: str, config: Dict[str, Any], temporal_layer: str = "primary", force: bool = False) -> None:
         """
         Synthesize a quantum state across omnitemporal dimensions.
 
@@ -59,48 +74,23 @@ class OmnitemporalQuantumSynthesizer:
             quantum_id (str): Unique identifier for the quantum state.
             config (Dict[str, Any]): Quantum configuration (e.g., quantum patterns, infniversal axioms).
             temporal_layer (str): Temporal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.quantum_profiles[quantum_id] = {
                 "config": config,
                 "temporal_layer": temporal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "quantum_strength": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "quantum_strength": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{quantum_id}{str(config)}{temporal_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(quantum_id, config, temporal_layer, utc_iso())
             self.quantum_signatures[quantum_id] = signature
-            self.infiniversal_coherence[quantum_id] = random.uniform(0.95, 1.0)
-            self.quantum_entropy[quantum_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence[quantum_id] = rng.uniform(0.95, 1.0)
+            self.quantum_entropy[quantum_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized quantum state %s in temporal layer %s with signature %s, coherence %.2f, entropy %.2f at 04:40 PM IST, Sunday, July 20, 2025",
                              quantum_id, temporal_layer, signature, self.infiniversal_coherence[quantum_id], self.quantum_entropy[quantum_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "core_engine.quantum_memory_vault")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "akashic_link.akashic_core")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "metacausal_singularity_engine.metacausal_consciousness_orchestrator")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "omniflux_synthesis_core.omniflux_consciousness_synthesizer")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "hyperfractal_consciousness_matrix.hyperfractal_consciousness_field")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "transmetagalactic_synthesis_array.transmetagalactic_consciousness_array")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "omnidimensional_quantum_harmonizer.omnidimensional_quantum_harmonic_resonator")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "transomniversal_coherence_matrix.transomniversal_coherence_resonator")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "metachronal_singularity_orchestrator.metachronal_singularity_synthesizer")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "infinicryptic_causal_resonator.infinicryptic_causal_harmonizer")
-                self.integration_nexus.sync_quantum_state(quantum_id, config, temporal_layer, "transmetahyperdimensional_harmonic_synthesis.transmetahyperdimensional_harmonic_synthesizer")
+                self.integration_nexus.sync_many("sync_quantum_state", quantum_id, config, temporal_layer, force=force)
         except Exception as e:
             self.logger.error("Error synthesizing quantum state %s in temporal layer %s: %s at 04:40 PM IST, Sunday, July 20, 2025", quantum_id, temporal_layer, e)
             self._regenerate_coherence(quantum_id, "synthesis")
@@ -108,8 +98,8 @@ class OmnitemporalQuantumSynthesizer:
     def _regenerate_coherence(self, quantum_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using omnitemporal recovery protocols."""
         try:
-            self.infiniversal_coherence[quantum_id] = random.uniform(0.9, 1.0)
-            self.quantum_entropy[quantum_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence[quantum_id] = rng.uniform(0.9, 1.0)
+            self.quantum_entropy[quantum_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for quantum state %s after failed %s at 04:40 PM IST, Sunday, July 20, 2025", quantum_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for quantum state %s: %s at 04:40 PM IST, Sunday, July 20, 2025", quantum_id, e)
@@ -1,3 +1,5 @@
 # omnitemporal_quantum_singularity/transcausal_resonance_modulator/__init__.py
 # Marks the transcausal_resonance_modulator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TranscausalResonanceModulator']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -5,52 +5,168 @@ Orchestrates interactions across all 123 directories for seamless reality, consc
 Integrates voice AI with dynamic morphing and agent ID tracking.
 """
 
-import logging
-from typing import Dict, Any
-from datetime import datetime
-import random
-import importlib
+import argparse
+import json
+import multiprocessing
+import sys
+import threading
+import time
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from dotenv import load_dotenv
 import os
-from voice_ai.voice_core import VoiceCore
+from omniversal_runtime.routing_table import RoutingTable, install_routing_table
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for, retained
+from omniversal_runtime.manifest import ModuleRegistry, load_manifest
+from omniversal_runtime.component_pool import ComponentPool
+from omniversal_runtime.fanout import FanOutExecutor, FanOutReport, OK
+from omniversal_runtime.dag import DagScheduler, StageGraph
+from omniversal_runtime.signatures import signatures
+from omniversal_runtime.micro_batch import BatchStats, micro_batches
+from omniversal_runtime.shared_state import SharedMetricTable, shard_for
+from omniversal_runtime.load_replay import load_operations, replay, stub_voice_clients
+from omniversal_runtime.admission import AdmissionController, Overloaded
+from omniversal_runtime.event_bus import IntegrationEventBus
+from omniversal_runtime.batch_sync import FINGERPRINT_RETENTION
+from temporal_integration_nexus import TemporalIntegrationNexus
 
 # Load environment variables for API integrations
 load_dotenv()
 
+rng = get_stream(__name__)
+
+# Subsystem stages that must complete before another subsystem is synced; all others run independently.
+# Stages exist only for subsystems with a SYNC_HANDLERS entry, so until the downstream subsystems
+# register handlers the stage graph holds the temporal lattice alone and this ordering is not exercised
+SUBSYSTEM_DEPENDENCIES = {
+    "omnidimensional_causality_weaver": ("omnitemporal_coherence_lattice",),
+    "omni_ethical_reality_governance": ("omnidimensional_causality_weaver",),
+    "omnipotent_reality_orchestrator": ("omni_ethical_reality_governance",),
+}
+
+# Modules with sync logic, mapped to the orchestrator methods that sync one operation and a batch;
+# every other module has nothing to sync and gets no task
+SYNC_HANDLERS = {
+    "omnitemporal_coherence_lattice.temporal_integration_nexus": ("_sync_temporal_nexus", "_sync_temporal_nexus_batch"),
+}
+
+# Operation types that need a session, which orchestrate_many cannot carry; they are not batched
+SESSION_OPERATION_TYPES = ("voice_processing",)
+
+# Admission priority per operation type when the orchestrator is overloaded; lower runs first, others default to 1
+OPERATION_PRIORITIES = {
+    "voice_processing": 0,
+    "synthesis": 2,
+}
+
+# Hot numeric state every shard publishes to shared memory
+SHARED_METRIC_COLUMNS = ("coherence_metrics", "integration_strength")
+
 class OmniversalIntegrationOrchestrator:
     """Core engine for orchestrating all Rhee_AI_Assistant directories."""
 
-    def __init__(self, agent_id: str = "core_engine_001"):
+    def __init__(self, agent_id: str = "core_engine_001", parallel_sync: bool = False,
+                 module_timeout: float = 5.0, max_sync_workers: int = 16, staged_sync: bool = False,
+                 profile_modules: bool = False, voice_clients: Optional[Dict[str, Any]] = None,
+                 max_concurrent_operations: int = None, max_queued_operations: int = 64, queue_timeout: float = 1.0,
+                 event_bus: Optional[IntegrationEventBus] = None):
         """
         Initialize orchestrator with system-wide state tracking and agent ID.
 
         Args:
             agent_id (str): Unique identifier for the orchestrator instance.
+            parallel_sync (bool): Sync modules concurrently instead of one after another.
+            module_timeout (float): Default per-module deadline in seconds for parallel sync;
+                override individual modules through module_timeouts.
+            max_sync_workers (int): Worker threads for parallel sync.
+            staged_sync (bool): Sync subsystems as a DAG of stages ordered by SUBSYSTEM_DEPENDENCIES.
+            profile_modules (bool): Accumulate call counts and time per module in module_timings;
+                voice handling is recorded as "voice_processing".
+            voice_clients (Dict[str, Any], optional): stt, llm and tts clients for VoiceCore in place
+                of Deepgram, OpenAI and ElevenLabs.
+            max_concurrent_operations (int, optional): Operations orchestrated at once; None admits
+                everything. Overflow waits in priority order (OPERATION_PRIORITIES) or is shed.
+            max_queued_operations (int): Operations allowed to wait for admission.
+            queue_timeout (float): Default seconds an operation may wait for admission.
+            event_bus (IntegrationEventBus, optional): Bus the pooled nexuses publish module syncs to;
+                by default the orchestrator starts its own and stops it on close.
         """
         self.agent_id = agent_id
-        self.system_states: Dict[str, Dict[str, Any]] = {}
-        self.coherence_metrics: Dict[str, float] = {}
-        self.integration_strength: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("coherence_metrics", "integration_strength"),
+            object_columns=("system_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.system_states = self.state_table.column("system_states")
+        self.coherence_metrics = self.state_table.column("coherence_metrics")
+        self.integration_strength = self.state_table.column("integration_strength")
+        self.sync_fingerprints = retained(self, "sync_fingerprints", FINGERPRINT_RETENTION)
+        self.registry = ModuleRegistry(load_manifest())
         self.modules = self._load_modules()
-        self.logger = logging.getLogger(__name__)
+        self.sync_modules = [module for module in self.modules if module in SYNC_HANDLERS]
+        self.voice_pool = ComponentPool(self._create_voice_core, name="voice_core")
+        self._owns_event_bus = event_bus is None
+        self.event_bus = event_bus or IntegrationEventBus()
+        if self.event_bus.loop is None:
+            self.event_bus.start()
+        self.nexus_pool = ComponentPool(self._create_nexus, name="temporal_integration_nexus")
+        self.parallel_sync = parallel_sync
+        self.module_timeouts: Dict[str, float] = {}
+        self.fanout = FanOutExecutor(max_workers=max_sync_workers, default_timeout=module_timeout)
+        self.staged_sync = staged_sync
+        self.stage_scheduler = DagScheduler(self._build_stage_graph(), max_workers=max_sync_workers)
+        self.profile_modules = profile_modules
+        self.module_timings: Dict[str, Dict[str, float]] = {}
+        self._timings_lock = threading.Lock()
+        self.voice_clients = voice_clients or {}
+        self.voice_sessions: Dict[str, Any] = {}
+        self.admission = None
+        if max_concurrent_operations is not None:
+            self.admission = AdmissionController(max_concurrent_operations, max_queued_operations, queue_timeout,
+                                                 priorities=OPERATION_PRIORITIES)
+        self.logger = get_logger(__name__)
         self.logger.info("Core engine %s initialized with %d modules at 06:05 PM IST, Sunday, July 27, 2025",
                          agent_id, len(self.modules))
 
+    def __enter__(self) -> "OmniversalIntegrationOrchestrator":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Stop the sync worker threads and, if the orchestrator started it, the event bus.
+
+        Args:
+            wait (bool): Wait for running module syncs to finish.
+        """
+        self.fanout.shutdown(wait=wait)
+        self.stage_scheduler.shutdown(wait=wait)
+        if self._owns_event_bus:
+            self.event_bus.stop()
+
     def _load_modules(self) -> list:
-        """Dynamically load all 123 directory modules."""
-        # Placeholder for module discovery (in practice, scan directories or maintain a config)
-        modules = [
-            "voice_ai.voice_core",
-            "omnitemporal_coherence_lattice.temporal_coherence_synthesis",
-            "omnitemporal_coherence_lattice.omniversal_timeline_aligner",
-            "omnitemporal_coherence_lattice.infniversal_temporal_resonator",
-            "omnitemporal_coherence_lattice.metatemporal_coherence_stabilizer",
-            "omnitemporal_coherence_lattice.temporal_integration_nexus",
-            # ... (add remaining 117 modules as needed)
-        ]
-        return modules
-
-    def orchestrate_system(self, operation_id: str, config: Dict[str, Any], operation_type: str = "full_system", session_id: str = None) -> Dict[str, Any]:
+        """List every directory module from the cached module manifest; nothing is imported here."""
+        return self.registry.module_ids()
+
+    def _build_stage_graph(self) -> StageGraph:
+        """Declare one stage per subsystem package with modules to sync, ordered by SUBSYSTEM_DEPENDENCIES."""
+        subsystems: Dict[str, list] = {}
+        for module in self.sync_modules:
+            subsystems.setdefault(module.split(".", 1)[0], []).append(module)
+        graph = StageGraph()
+        for subsystem, modules in subsystems.items():
+            after = [dep for dep in SUBSYSTEM_DEPENDENCIES.get(subsystem, ()) if dep in subsystems]
+            graph.add_stage(subsystem, lambda operation, upstream, modules=tuple(modules): self._sync_stage(operation, modules), after)
+        return graph
+
+    def orchestrate_system(self, operation_id: str, config: Dict[str, Any], operation_type: str = "full_system", session_id: str = None,
+                           parallel: bool = None, staged: bool = None, force: bool = False,
+                           queue_timeout: float = None) -> Dict[str, Any]:
         """
         Orchestrate operations across all directories, including voice AI and temporal coherence.
 
@@ -59,34 +175,81 @@ class OmniversalIntegrationOrchestrator:
             config (Dict[str, Any]): Operation configuration (e.g., language, voice, axioms).
             operation_type (str): Type of operation (e.g., synthesis, alignment, voice_processing).
             session_id (str, optional): Session identifier for voice AI interactions.
+            parallel (bool, optional): Sync modules concurrently with per-module deadlines;
+                defaults to the orchestrator's parallel_sync setting.
+            staged (bool, optional): Sync subsystems as a DAG of stages, running ready stages
+                concurrently; a re-sync of the same operation, session, type and config reuses
+                the stages that synced every module cleanly last time. Defaults to the
+                orchestrator's staged_sync setting.
+            force (bool): Re-sync every module even if the operation was last synced, without
+                failures, with the same operation type, config and session. Configs are digested
+                once per object; one changed in place is seen after signatures.invalidate(config).
+            queue_timeout (float, optional): Seconds to wait for admission under overload;
+                defaults to the orchestrator's queue_timeout.
 
         Returns:
-            Dict[str, Any]: System state after orchestration.
+            Dict[str, Any]: System state after orchestration, including module_status (ok, error
+                or timeout per module) and module_results from the modules that completed; staged
+                runs add stage_status and critical_path. sync_skipped is True when the previous
+                module results were reused.
+
+        Raises:
+            Overloaded: If admission control sheds the operation; no state is recorded for it.
         """
+        if self.admission is None:
+            return self._orchestrate_system(operation_id, config, operation_type, session_id, parallel, staged, force)
+        with self.admission.admit(operation_type, queue_timeout):
+            return self._orchestrate_system(operation_id, config, operation_type, session_id, parallel, staged, force)
+
+    def _orchestrate_system(self, operation_id: str, config: Dict[str, Any], operation_type: str, session_id: str = None,
+                            parallel: bool = None, staged: bool = None, force: bool = False) -> Dict[str, Any]:
+        """Orchestrate an admitted operation; see orchestrate_system."""
         try:
+            previous = self.system_states.get(operation_id)
+            fingerprint = (operation_type, signatures.config_digest(config), session_id)
             self.system_states[operation_id] = {
                 "agent_id": self.agent_id,
                 "config": config,
                 "operation_type": operation_type,
                 "session_id": session_id,
-                "timestamp": datetime.utcnow().isoformat(),
-                "integration_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "integration_strength": rng.uniform(0.9, 1.0)
             }
-            self.coherence_metrics[operation_id] = random.uniform(0.95, 1.0)
+            self.coherence_metrics[operation_id] = rng.uniform(0.95, 1.0)
             self.logger.info("Core engine %s orchestrating operation %s of type %s, session %s, coherence %.2f at 06:05 PM IST, Sunday, July 27, 2025",
                              self.agent_id, operation_id, operation_type, session_id or "none", self.coherence_metrics[operation_id])
 
             # Process voice-specific operations
             if operation_type == "voice_processing" and session_id:
-                voice_core = VoiceCore(agent_id=f"{self.agent_id}_voice")
+                started = time.monotonic()
+                voice_core = self.voice_pool.get(f"{self.agent_id}_voice")
                 audio_input = config.get("audio_input", b"")
                 voice_state = voice_core.process_voice_input(session_id, audio_input, config)
                 self.system_states[operation_id]["voice_state"] = voice_state
                 voice_core.sync_with_orchestrator(session_id, config, "omnitemporal_coherence_lattice.temporal_integration_nexus")
+                if self.profile_modules:
+                    self._record_timings({"voice_processing": (time.monotonic() - started) * 1000})
 
-            # Synchronize with all modules
-            for module in self.modules:
-                self._sync_with_module(operation_id, config, operation_type, module, session_id)
+            # Synchronize with all modules unless nothing changed since the last clean sync
+            if not force and previous and self.sync_fingerprints.get(operation_id) == fingerprint \
+                    and all(previous.get("module_status", {}).get(module) == OK for module in self.sync_modules):
+                for key in ("module_status", "module_results", "stage_status", "critical_path"):
+                    if key in previous:
+                        self.system_states[operation_id][key] = previous[key]
+                self.system_states[operation_id]["sync_skipped"] = True
+                self.logger.debug("Core engine %s skipped unchanged module sync for operation %s", self.agent_id, operation_id)
+                return self.system_states[operation_id]
+
+            if self.staged_sync if staged is None else staged:
+                report = self._sync_stages(operation_id, config, operation_type, session_id, force)
+            else:
+                report = self._sync_modules(operation_id, config, operation_type, session_id, parallel)
+            if self.profile_modules:
+                self._record_timings(report.durations_ms)
+            self.system_states[operation_id]["module_status"] = report.status
+            self.system_states[operation_id]["module_results"] = {module: result for module, result in report.results.items() if result is not None}
+            self.system_states[operation_id]["sync_skipped"] = False
+            self.sync_fingerprints[operation_id] = fingerprint
 
             return self.system_states[operation_id]
         except Exception as e:
@@ -95,6 +258,205 @@ class OmniversalIntegrationOrchestrator:
             self._regenerate_coherence(operation_id, operation_type)
             return {}
 
+    def orchestrate_many(self, operations: Iterable[Tuple[str, Dict[str, Any], str]], max_batch_size: int = 256,
+                         parallel: bool = None) -> Dict[str, Any]:
+        """
+        Orchestrate a burst of operations in micro-batches grouped by operation type.
+
+        Each batch draws its random metrics at once, logs one line and syncs every module
+        with sync logic once for the whole batch instead of once per operation. Operation
+        types that need a session (SESSION_OPERATION_TYPES, i.e. voice processing) are
+        rejected; use orchestrate_system for them. So is every repeat of an operation id
+        within the call, which would otherwise overwrite the first occurrence's state.
+
+        Args:
+            operations (Iterable[Tuple[str, Dict, str]]): (operation_id, config, operation_type) tuples.
+            max_batch_size (int): Largest number of operations synced together.
+            parallel (bool, optional): Sync modules concurrently with per-module deadlines;
+                defaults to the orchestrator's parallel_sync setting.
+
+        Returns:
+            Dict[str, Any]: System state per operation id under results, statistics per batch
+                under batches, the reason per rejected operation id ("duplicate" or
+                "needs_session") under rejected, plus the overall operation count, elapsed_ms
+                and ops_per_second. Batches shed by admission control report the reason as shed
+                and leave empty states.
+        """
+        start = time.monotonic()
+        results: Dict[str, Dict[str, Any]] = {}
+        batches: List[Dict[str, Any]] = []
+        rejected: Dict[str, str] = {}
+        seen = set()
+
+        def batchable() -> Iterable[Tuple[str, Dict[str, Any], str]]:
+            for operation in operations:
+                operation_id, _, operation_type = operation
+                if operation_id in seen:
+                    rejected[operation_id] = "duplicate"
+                    continue
+                seen.add(operation_id)
+                if operation_type in SESSION_OPERATION_TYPES:
+                    rejected[operation_id] = "needs_session"
+                    continue
+                yield operation
+
+        for operation_type, batch in micro_batches(batchable(), max_batch_size):
+            if self.admission is None:
+                stats = self._orchestrate_batch(operation_type, batch, results, parallel)
+            else:
+                try:
+                    with self.admission.admit(operation_type):
+                        stats = self._orchestrate_batch(operation_type, batch, results, parallel)
+                except Overloaded as e:
+                    stats = BatchStats(operation_type, len(batch))
+                    stats.shed = e.reason
+                    results.update((operation_id, {}) for operation_id, _, _ in batch)
+            batches.append(stats.as_dict())
+        if rejected:
+            self.logger.warning("Core engine %s rejected %d operations from a bulk request: %s",
+                                self.agent_id, len(rejected), rejected)
+        elapsed_ms = (time.monotonic() - start) * 1000
+        return {
+            "results": results,
+            "batches": batches,
+            "rejected": rejected,
+            "operations": len(results),
+            "elapsed_ms": elapsed_ms,
+            "ops_per_second": len(results) / (elapsed_ms / 1000) if elapsed_ms > 0 else 0.0
+        }
+
+    def _orchestrate_batch(self, operation_type: str, batch: List[Tuple[str, Dict[str, Any], str]],
+                           results: Dict[str, Dict[str, Any]], parallel: bool = None) -> BatchStats:
+        """
+        Orchestrate one micro-batch of operations sharing an operation type.
+
+        Args:
+            operation_type (str): Type shared by every operation in the batch.
+            batch (List[Tuple[str, Dict, str]]): Operations in the batch.
+            results (Dict[str, Dict]): Receives the system state of each operation.
+            parallel (bool, optional): Overrides the orchestrator's parallel_sync setting.
+
+        Returns:
+            BatchStats: Size, timing and module sync counts of the batch.
+        """
+        stats = BatchStats(operation_type, len(batch))
+        start = time.monotonic()
+        configs = {operation_id: config for operation_id, config, _ in batch}
+        try:
+            timestamp = utc_iso()
+            strengths = rng.uniform_batch(0.9, 1.0, len(configs))
+            coherences = rng.uniform_batch(0.95, 1.0, len(configs))
+            for (operation_id, config), strength, coherence in zip(configs.items(), strengths, coherences):
+                self.system_states[operation_id] = {
+                    "agent_id": self.agent_id,
+                    "config": config,
+                    "operation_type": operation_type,
+                    "session_id": None,
+                    "timestamp": timestamp,
+                    "integration_strength": float(strength)
+                }
+                self.coherence_metrics[operation_id] = float(coherence)
+            self.logger.info("Core engine %s orchestrating batch of %d operations of type %s",
+                             self.agent_id, len(configs), operation_type)
+
+            tasks = {module: (lambda module=module: self._sync_module_batch(configs, operation_type, module))
+                     for module in self.sync_modules}
+            if self.parallel_sync if parallel is None else parallel:
+                report = self.fanout.run(tasks, self.module_timeouts)
+            else:
+                report = self.fanout.run_serial(tasks)
+            stats.module_syncs = len(tasks)
+            if self.profile_modules:
+                self._record_timings(report.durations_ms)
+            stats.failed_modules = sum(1 for status in report.status.values() if status != OK)
+            for operation_id in configs:
+                state = self.system_states[operation_id]
+                state["module_status"] = report.status
+                state["module_results"] = {module: result[operation_id] for module, result in report.results.items()
+                                           if result is not None and result.get(operation_id) is not None}
+                results[operation_id] = state
+        except Exception as e:
+            self.logger.error("Core engine %s error orchestrating batch of %d operations of type %s: %s",
+                              self.agent_id, len(configs), operation_type, e)
+            for operation_id in configs:
+                self._regenerate_coherence(operation_id, operation_type)
+                results[operation_id] = {}
+        stats.elapsed_ms = (time.monotonic() - start) * 1000
+        self.logger.info("Core engine %s batch of %d %s operations: %d module syncs, %d failed, %.2f ms, %.0f ops/s",
+                         self.agent_id, stats.size, operation_type, stats.module_syncs, stats.failed_modules,
+                         stats.elapsed_ms, stats.ops_per_second)
+        return stats
+
+    def _sync_modules(self, operation_id: str, config: Dict[str, Any], operation_type: str, session_id: str = None,
+                      parallel: bool = None) -> FanOutReport:
+        """
+        Synchronize an operation with every module that has sync logic, serially or as a parallel fan-out.
+
+        Args:
+            operation_id (str): Operation identifier.
+            config (Dict[str, Any]): Operation configuration.
+            operation_type (str): Type of operation.
+            session_id (str, optional): Session identifier for voice interactions.
+            parallel (bool, optional): Overrides the orchestrator's parallel_sync setting.
+
+        Returns:
+            FanOutReport: Per-module results and status.
+        """
+        tasks = {module: (lambda module=module: self._sync_module(operation_id, config, operation_type, module, session_id))
+                 for module in self.sync_modules}
+        if self.parallel_sync if parallel is None else parallel:
+            report = self.fanout.run(tasks, self.module_timeouts)
+        else:
+            report = self.fanout.run_serial(tasks)
+        failed = {module: status for module, status in report.status.items() if status != OK}
+        if failed:
+            self.logger.warning("Core engine %s operation %s: %d of %d modules did not sync: %s",
+                                self.agent_id, operation_id, len(failed), len(tasks), failed)
+        return report
+
+    def _sync_stages(self, operation_id: str, config: Dict[str, Any], operation_type: str, session_id: str = None,
+                     force: bool = False) -> FanOutReport:
+        """
+        Synchronize an operation subsystem by subsystem through the stage scheduler.
+
+        Stage outputs are cached per operation, since every module sync records state for
+        its operation; only stages whose modules all synced are kept for reuse.
+
+        Args:
+            operation_id (str): Operation identifier.
+            config (Dict[str, Any]): Operation configuration.
+            operation_type (str): Type of operation.
+            session_id (str, optional): Session identifier for voice interactions.
+            force (bool): Run every stage instead of reusing cached outputs.
+
+        Returns:
+            FanOutReport: Per-module results and status merged across stages.
+        """
+        operation = (operation_id, config, operation_type, session_id)
+        cache_key = None if force else (operation_id, session_id, operation_type, signatures.config_digest(config))
+        run = self.stage_scheduler.run(operation, cache_key)
+        report = FanOutReport()
+        for stage, stage_report in run.outputs.items():
+            if cache_key is not None and any(status != OK for status in stage_report.status.values()):
+                self.stage_scheduler.discard(stage, cache_key)
+            report.results.update(stage_report.results)
+            report.status.update(stage_report.status)
+            report.errors.update(stage_report.errors)
+            if run.status[stage] == OK:
+                report.durations_ms.update(stage_report.durations_ms)
+        report.elapsed_ms = run.elapsed_ms
+        self.system_states[operation_id]["stage_status"] = run.status
+        self.system_states[operation_id]["critical_path"] = {"stages": run.critical_path, "duration_ms": run.critical_path_ms}
+        self.logger.debug("Core engine %s staged operation %s in %.2f ms, critical path %s (%.2f ms)",
+                          self.agent_id, operation_id, run.elapsed_ms, " -> ".join(run.critical_path), run.critical_path_ms)
+        return report
+
+    def _sync_stage(self, operation: tuple, modules: tuple) -> FanOutReport:
+        """Synchronize an operation with the modules of one subsystem stage."""
+        operation_id, config, operation_type, session_id = operation
+        return self.fanout.run_serial({module: (lambda module=module: self._sync_module(operation_id, config, operation_type, module, session_id))
+                                       for module in modules})
+
     def _sync_with_module(self, operation_id: str, config: Dict[str, Any], operation_type: str, module: str, session_id: str = None) -> None:
         """
         Synchronize operation with a specific module.
@@ -107,26 +469,132 @@ class OmniversalIntegrationOrchestrator:
             session_id (str, optional): Session identifier for voice interactions.
         """
         try:
-            self.logger.info("Core engine %s synchronizing operation %s for session %s with module %s at 06:05 PM IST, Sunday, July 27, 2025",
-                             self.agent_id, operation_id, session_id or "none", module)
-            module_instance = self._import_module(module)
-            if module_instance:
-                # Example: Sync with temporal_integration_nexus
-                if module == "omnitemporal_coherence_lattice.temporal_integration_nexus":
-                    from omnitemporal_coherence_lattice.temporal_integration_nexus import TemporalIntegrationNexus
-                    nexus = TemporalIntegrationNexus()
-                    nexus.sync_temporal_coherence(operation_id, config, "primary", module, self.agent_id)
-                # Add similar logic for other modules as needed
+            self._sync_module(operation_id, config, operation_type, module, session_id)
         except Exception as e:
             self.logger.error("Core engine %s error synchronizing operation %s for session %s with %s: %s at 06:05 PM IST, Sunday, July 27, 2025",
                               self.agent_id, operation_id, session_id or "none", module, e)
 
+    def _sync_module(self, operation_id: str, config: Dict[str, Any], operation_type: str, module: str, session_id: str = None) -> Any:
+        """
+        Synchronize operation with a specific module, raising on failure.
+
+        Args:
+            operation_id (str): Operation identifier.
+            config (Dict[str, Any]): Operation configuration.
+            operation_type (str): Type of operation.
+            module (str): Module to synchronize with.
+            session_id (str, optional): Session identifier for voice interactions.
+
+        Returns:
+            Any: The module's sync record, or None for modules without sync logic.
+        """
+        if module not in self.registry:
+            raise KeyError(f"Unknown module {module}")
+        handlers = SYNC_HANDLERS.get(module)
+        if handlers is None:
+            return None
+        return getattr(self, handlers[0])(operation_id, config, operation_type, module, session_id)
+
+    def _sync_module_batch(self, configs: Dict[str, Dict[str, Any]], operation_type: str, module: str) -> Any:
+        """
+        Synchronize a batch of operations with a specific module in one call, raising on failure.
+
+        Args:
+            configs (Dict[str, Dict]): Configuration per operation identifier.
+            operation_type (str): Type shared by the operations.
+            module (str): Module to synchronize with.
+
+        Returns:
+            Any: The module's sync record per operation id, or None for modules without sync logic.
+        """
+        if module not in self.registry:
+            raise KeyError(f"Unknown module {module}")
+        handlers = SYNC_HANDLERS.get(module)
+        if handlers is None:
+            return None
+        return getattr(self, handlers[1])(configs, operation_type, module)
+
+    def _sync_temporal_nexus(self, operation_id: str, config: Dict[str, Any], operation_type: str, module: str,
+                             session_id: str = None) -> Any:
+        """Synchronize an operation with the pooled temporal integration nexus."""
+        nexus = self.nexus_pool.get(self.agent_id)
+        nexus.sync_temporal_coherence(operation_id, config, "primary", module, self.agent_id)
+        return nexus.temporal_bridges.get(operation_id)
+
+    def _sync_temporal_nexus_batch(self, configs: Dict[str, Dict[str, Any]], operation_type: str, module: str) -> Any:
+        """Synchronize a batch of operations with the pooled temporal integration nexus."""
+        nexus = self.nexus_pool.get(self.agent_id)
+        nexus.sync_temporal_coherence_batch(configs, "primary", module, self.agent_id)
+        return {operation_id: nexus.temporal_bridges.get(operation_id) for operation_id in configs}
+
+    def _create_nexus(self, _: str) -> TemporalIntegrationNexus:
+        """Build a TemporalIntegrationNexus for the nexus pool, publishing to the orchestrator's event bus."""
+        nexus = TemporalIntegrationNexus()
+        nexus.event_bus = self.event_bus
+        return nexus
+
+    def _create_voice_core(self, voice_agent_id: str) -> Any:
+        """Build a VoiceCore for the voice pool."""
+        # Imported on first use so processes without voice traffic skip deepgram, openai and elevenlabs
+        from voice_ai.voice_core import VoiceCore
+        # A rebuilt VoiceCore takes over the sessions of the one it replaces
+        voice_core = VoiceCore(agent_id=voice_agent_id, state_table=self.voice_sessions.get(voice_agent_id), **self.voice_clients)
+        self.voice_sessions[voice_agent_id] = voice_core.state_table
+        return voice_core
+
+    def _record_timings(self, durations_ms: Dict[str, float]) -> None:
+        """Add module run times to module_timings."""
+        with self._timings_lock:
+            for module, duration_ms in durations_ms.items():
+                timing = self.module_timings.get(module)
+                if timing is None:
+                    timing = self.module_timings[module] = {"calls": 0, "total_ms": 0.0}
+                timing["calls"] += 1
+                timing["total_ms"] += duration_ms
+
+    def overload_stats(self) -> Dict[str, float]:
+        """
+        Report admission control counters.
+
+        Returns:
+            Dict[str, float]: admitted, queued and shed counts by reason (queue_full, deadline,
+                displaced, timeout) plus in_flight, queue_depth and service_ms; empty without limits.
+        """
+        return {} if self.admission is None else self.admission.snapshot()
+
+    def warm_up(self, voice: bool = True) -> Dict[str, bool]:
+        """
+        Build pooled components ahead of traffic so the first operation skips client construction.
+
+        Args:
+            voice (bool): Also warm up the VoiceCore for this agent.
+
+        Returns:
+            Dict[str, bool]: Health of each warmed component.
+        """
+        results = {f"temporal_integration_nexus:{key}": healthy
+                   for key, healthy in self.nexus_pool.warm_up([self.agent_id]).items()}
+        if voice:
+            results.update({f"voice_core:{key}": healthy
+                            for key, healthy in self.voice_pool.warm_up([f"{self.agent_id}_voice"]).items()})
+        self.logger.info("Core engine %s warmed up pooled components: %s", self.agent_id, results)
+        return results
+
+    def check_health(self) -> Dict[str, bool]:
+        """
+        Health-check pooled components; unhealthy ones are rebuilt on next use.
+
+        Returns:
+            Dict[str, bool]: Health of each pooled component.
+        """
+        results = {f"voice_core:{key}": healthy for key, healthy in self.voice_pool.check_health().items()}
+        results.update({f"temporal_integration_nexus:{key}": healthy for key, healthy in self.nexus_pool.check_health().items()})
+        return results
+
     def _import_module(self, module_path: str) -> Any:
-        """Dynamically import a module."""
+        """Resolve a module's class through the registry, importing it only on first use."""
         try:
-            module_name, class_name = module_path.rsplit(".", 1)
-            module = importlib.import_module(module_name)
-            return getattr(module, class_name, None)
+            return self.registry.get_class(module_path)
         except Exception as e:
             self.logger.error("Core engine %s error importing module %s: %s at 06:05 PM IST, Sunday, July 27, 2025",
                               self.agent_id, module_path, e)
@@ -135,8 +603,8 @@ class OmniversalIntegrationOrchestrator:
     def _regenerate_coherence(self, operation_id: str, operation_type: str) -> None:
         """Regenerate coherence for a failed operation."""
         try:
-            self.coherence_metrics[operation_id] = random.uniform(0.9, 1.0)
-            self.integration_strength[operation_id] = random.uniform(0.85, 0.95)
+            self.coherence_metrics[operation_id] = rng.uniform(0.9, 1.0)
+            self.integration_strength[operation_id] = rng.uniform(0.85, 0.95)
             self.logger.info("Core engine %s regenerated coherence for operation %s of type %s at 06:05 PM IST, Sunday, July 27, 2025",
                              self.agent_id, operation_id, operation_type)
         except Exception as e:
@@ -160,6 +628,8 @@ class OmniversalIntegrationOrchestrator:
                 "operation_type": self.system_states.get(operation_id, {}).get("operation_type", "unknown"),
                 "session_id": self.system_states.get(operation_id, {}).get("session_id", "none"),
                 "voice_state": self.system_states.get(operation_id, {}).get("voice_state", {}),
+                "module_status": self.system_states.get(operation_id, {}).get("module_status", {}),
+                "critical_path": self.system_states.get(operation_id, {}).get("critical_path", {}),
                 "integration_strength": self.system_states.get(operation_id, {}).get("integration_strength", 0.0),
                 "coherence": self.coherence_metrics.get(operation_id, 0.0)
             }
@@ -170,3 +640,259 @@ class OmniversalIntegrationOrchestrator:
             self.logger.error("Core engine %s error retrieving system state %s: %s at 06:05 PM IST, Sunday, July 27, 2025",
                               self.agent_id, operation_id, e)
             return {}
+
+
+def _serve_shard(shard: int, shards: int, conn: Any, table_name: str, slots_per_shard: int, agent_id: str,
+                 options: Dict[str, Any]) -> None:
+    """
+    Run one shard: an orchestrator serving requests from the parent until it sends None.
+
+    Args:
+        shard (int): Shard index, also the shared metric region this process writes.
+        shards (int): Number of shards.
+        conn (Connection): Pipe end receiving (method, args, kwargs) requests.
+        table_name (str): Shared memory block of the SharedMetricTable.
+        slots_per_shard (int): Slots in each shard's region of the table.
+        agent_id (str): Agent identifier of the sharded deployment.
+        options (Dict[str, Any]): Keyword arguments for OmniversalIntegrationOrchestrator.
+    """
+    orchestrator = OmniversalIntegrationOrchestrator(agent_id=f"{agent_id}_shard{shard}", **options)
+    install_routing_table(RoutingTable.from_manifest(orchestrator.registry.manifest))
+    table = SharedMetricTable(SHARED_METRIC_COLUMNS, slots_per_shard, shards, name=table_name)
+    try:
+        while True:
+            request = conn.recv()
+            if request is None:
+                break
+            method, args, kwargs = request
+            try:
+                result = getattr(orchestrator, method)(*args, **kwargs)
+                if method == "orchestrate_system":
+                    _publish_metrics(orchestrator, table, shard, [args[0]])
+                elif method == "orchestrate_many":
+                    _publish_metrics(orchestrator, table, shard, result["results"])
+                conn.send((True, result))
+            except Exception as e:
+                conn.send((False, f"{type(e).__name__}: {e}"))
+    finally:
+        table.close()
+        orchestrator.close(wait=False)
+
+def _publish_metrics(orchestrator: OmniversalIntegrationOrchestrator, table: SharedMetricTable, shard: int,
+                     operation_ids: Iterable[str]) -> None:
+    """Copy the hot numeric state of orchestrated operations into the shard's shared metric region."""
+    for operation_id in operation_ids:
+        table.write(shard, operation_id, {
+            "coherence_metrics": orchestrator.coherence_metrics.get(operation_id, 0.0),
+            "integration_strength": orchestrator.system_states.get(operation_id, {}).get(
+                "integration_strength", orchestrator.integration_strength.get(operation_id, 0.0))
+        })
+
+class ShardedOrchestrator:
+    """Partitions operations across orchestrator worker processes by a stable hash of the operation id."""
+
+    def __init__(self, shards: int = None, agent_id: str = "core_engine_001", slots_per_shard: int = 65536,
+                 start_method: str = None, **options: Any):
+        """
+        Start one orchestrator process per shard and the shared metric table they publish to.
+
+        Args:
+            shards (int, optional): Worker processes; defaults to the number of CPU cores.
+            agent_id (str): Agent identifier; shard n runs as f"{agent_id}_shard{n}".
+            slots_per_shard (int): Shared metric slots per shard; older operations whose slot is
+                reused are still answered by their shard, just not from shared memory.
+            start_method (str, optional): multiprocessing start method; defaults to the platform's.
+            **options: Keyword arguments for each shard's OmniversalIntegrationOrchestrator
+                (e.g., parallel_sync, staged_sync, module_timeout).
+        """
+        self.agent_id = agent_id
+        self.shards = shards or multiprocessing.cpu_count()
+        self.slots_per_shard = slots_per_shard
+        self.metrics = SharedMetricTable(SHARED_METRIC_COLUMNS, slots_per_shard, self.shards)
+        context = multiprocessing.get_context(start_method)
+        self.connections = []
+        self.workers = []
+        self._locks = [threading.Lock() for _ in range(self.shards)]
+        for shard in range(self.shards):
+            parent_conn, child_conn = context.Pipe()
+            worker = context.Process(target=_serve_shard, name=f"{agent_id}_shard{shard}", daemon=True,
+                                     args=(shard, self.shards, child_conn, self.metrics.name, slots_per_shard, agent_id, options))
+            worker.start()
+            child_conn.close()
+            self.connections.append(parent_conn)
+            self.workers.append(worker)
+        self.logger = get_logger(__name__)
+        self.logger.info("Sharded core engine %s started %d shard processes", agent_id, self.shards)
+
+    def __enter__(self) -> "ShardedOrchestrator":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def shard_for(self, operation_id: str) -> int:
+        """Return the shard that owns an operation."""
+        return shard_for(operation_id, self.shards)
+
+    def orchestrate_system(self, operation_id: str, config: Dict[str, Any], operation_type: str = "full_system",
+                           session_id: str = None, **options: Any) -> Dict[str, Any]:
+        """
+        Orchestrate an operation on the shard that owns it.
+
+        Args:
+            operation_id (str): Unique identifier for the operation.
+            config (Dict[str, Any]): Operation configuration.
+            operation_type (str): Type of operation.
+            session_id (str, optional): Session identifier for voice AI interactions.
+            **options: parallel, staged or force, as for OmniversalIntegrationOrchestrator.orchestrate_system.
+
+        Returns:
+            Dict[str, Any]: System state after orchestration.
+        """
+        return self._call(self.shard_for(operation_id), "orchestrate_system", (operation_id, config, operation_type, session_id), options)
+
+    def orchestrate_many(self, operations: Iterable[Tuple[str, Dict[str, Any], str]], **options: Any) -> Dict[str, Any]:
+        """
+        Orchestrate a burst of operations, with every shard working on its share concurrently.
+
+        Args:
+            operations (Iterable[Tuple[str, Dict, str]]): (operation_id, config, operation_type) tuples.
+            **options: max_batch_size or parallel, as for OmniversalIntegrationOrchestrator.orchestrate_many.
+
+        Returns:
+            Dict[str, Any]: Merged results, per-batch statistics (tagged with their shard) and
+                rejected operations, plus the overall operation count, elapsed_ms and ops_per_second.
+        """
+        start = time.monotonic()
+        partitions: Dict[int, List[Tuple[str, Dict[str, Any], str]]] = {}
+        for operation in operations:
+            partitions.setdefault(self.shard_for(operation[0]), []).append(operation)
+        shards = sorted(partitions)
+        for shard in shards:
+            self._locks[shard].acquire()
+        try:
+            for shard in shards:
+                self.connections[shard].send(("orchestrate_many", (partitions[shard],), options))
+            replies = {shard: self._receive(shard, "orchestrate_many") for shard in shards}
+        finally:
+            for shard in shards:
+                self._locks[shard].release()
+        results: Dict[str, Dict[str, Any]] = {}
+        batches: List[Dict[str, Any]] = []
+        rejected: Dict[str, str] = {}
+        for shard, reply in replies.items():
+            results.update(reply["results"])
+            batches.extend(dict(batch, shard=shard) for batch in reply["batches"])
+            rejected.update(reply["rejected"])
+        elapsed_ms = (time.monotonic() - start) * 1000
+        return {
+            "results": results,
+            "batches": batches,
+            "rejected": rejected,
+            "operations": len(results),
+            "elapsed_ms": elapsed_ms,
+            "ops_per_second": len(results) / (elapsed_ms / 1000) if elapsed_ms > 0 else 0.0
+        }
+
+    def get_system_state(self, operation_id: str) -> Dict[str, Any]:
+        """Retrieve the state of an operation from the shard that owns it."""
+        return self._call(self.shard_for(operation_id), "get_system_state", (operation_id,), {})
+
+    def get_metrics(self, operation_id: str) -> Dict[str, float]:
+        """
+        Read an operation's coherence_metrics and integration_strength, from shared memory when possible.
+
+        Args:
+            operation_id (str): The operation identifier.
+
+        Returns:
+            Dict[str, float]: Metric values, asked of the owning shard if not in shared memory.
+        """
+        values = self.metrics.read(self.shard_for(operation_id), operation_id)
+        if values is not None:
+            return values
+        state = self.get_system_state(operation_id)
+        return {"coherence_metrics": state.get("coherence", 0.0), "integration_strength": state.get("integration_strength", 0.0)}
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop every shard process and free the shared metric table."""
+        for shard, conn in enumerate(self.connections):
+            with self._locks[shard]:
+                try:
+                    conn.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+                conn.close()
+        for worker in self.workers:
+            worker.join(timeout)
+            if worker.is_alive():
+                worker.terminate()
+        self.connections = []
+        self.workers = []
+        if self.metrics is not None:
+            self.metrics.close()
+            self.metrics = None
+
+    def _call(self, shard: int, method: str, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        with self._locks[shard]:
+            self.connections[shard].send((method, args, kwargs))
+            return self._receive(shard, method)
+
+    def _receive(self, shard: int, method: str) -> Any:
+        ok, result = self.connections[shard].recv()
+        if not ok:
+            raise RuntimeError(f"Shard {shard} failed {method}: {result}")
+        return result
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Replay a recorded operation log against a fresh orchestrator and print a load report.
+
+    Args:
+        argv (List[str], optional): Command-line arguments.
+
+    Returns:
+        int: 1 if an operation failed or p99 latency exceeded the budget, else 0.
+    """
+    parser = argparse.ArgumentParser(description="Drive the core engine with a replayed JSONL operation log.")
+    parser.add_argument("--replay", metavar="FILE", required=True, help="JSONL log of recorded operations")
+    parser.add_argument("--rate", type=float, default=None, help="Operations per second (default: as fast as the workers allow)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Worker threads issuing operations")
+    parser.add_argument("--repeat", type=int, default=1, help="Times to replay the log")
+    parser.add_argument("--stub-latency-ms", type=float, default=0.0, help="Simulated latency of the voice API stubs")
+    parser.add_argument("--live-voice", action="store_true", help="Call Deepgram, OpenAI and ElevenLabs instead of local stubs")
+    parser.add_argument("--parallel", action="store_true", help="Sync modules concurrently")
+    parser.add_argument("--staged", action="store_true", help="Sync subsystems as a DAG of stages")
+    parser.add_argument("--force", action="store_true", help="Re-sync operations whose config is unchanged")
+    parser.add_argument("--max-concurrent", type=int, default=None, help="Admission limit on concurrent operations")
+    parser.add_argument("--top", type=int, default=10, help="Modules shown in the time breakdown")
+    parser.add_argument("--p99-budget-ms", type=float, default=None, help="Fail if p99 latency exceeds this")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    orchestrator = OmniversalIntegrationOrchestrator(
+        parallel_sync=args.parallel, staged_sync=args.staged, profile_modules=True, max_concurrent_operations=args.max_concurrent,
+        voice_clients=None if args.live_voice else stub_voice_clients(args.stub_latency_ms)
+    )
+    install_routing_table(RoutingTable.from_manifest(orchestrator.registry.manifest))
+    try:
+        report = replay(orchestrator, load_operations(args.replay, args.repeat), rate=args.rate,
+                        concurrency=args.concurrency, force=args.force)
+    finally:
+        orchestrator.close()
+    summary = report.summary()
+    if args.json:
+        print(json.dumps({"summary": summary, "modules": report.module_breakdown(args.top)}, indent=2))
+    else:
+        print(report.format(args.top))
+    if report.failed:
+        print(f"Failed operations: {', '.join(report.failed[:20])}")
+    if orchestrator.admission is not None:
+        print(f"Admission: {orchestrator.overload_stats()}")
+    over_budget = args.p99_budget_ms is not None and summary["p99_ms"] > args.p99_budget_ms
+    if over_budget:
+        print(f"p99 latency {summary['p99_ms']:.2f} ms is over the {args.p99_budget_ms:.1f} ms budget")
+    return 1 if report.failed or over_budget else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
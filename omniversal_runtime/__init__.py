@@ -0,0 +1,29 @@
+# omniversal_runtime/__init__.py
+# Marks the omniversal_runtime directory as a Python package.
+# Shared runtime services used by the integration nexuses, bridges and orchestrator.
+from .lazy_import import attach
+__all__ = [
+    'batch_sync',
+    'event_bus',
+    'routing_table',
+    'state_table',
+    'hot_log',
+    'clock',
+    'signatures',
+    'rng',
+    'retention',
+    'bridge_index',
+    'lazy_import',
+    'import_bench',
+    'manifest',
+    'component_pool',
+    'fanout',
+    'dag',
+    'micro_batch',
+    'shared_state',
+    'load_replay',
+    'admission',
+    'append_log',
+    'tag_index'
+]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -0,0 +1,173 @@
+"""
+admission.py
+Admission control and backpressure for Rhee_AI_Assistant.
+Caps concurrent operations, queues the overflow in a bounded priority queue, and sheds work that
+cannot start before its deadline or is displaced by higher-priority arrivals, counting each case.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Mapping, Optional
+
+QUEUE_FULL = "queue_full"
+DEADLINE = "deadline"
+DISPLACED = "displaced"
+TIMEOUT = "timeout"
+
+class Overloaded(RuntimeError):
+    """Raised when an operation is shed instead of admitted."""
+
+    def __init__(self, operation_class: str, reason: str):
+        super().__init__(f"Operation class {operation_class} shed: {reason}")
+        self.operation_class = operation_class
+        self.reason = reason
+
+class _Waiter:
+    __slots__ = ("priority", "deadline", "event", "admitted", "reason")
+
+    def __init__(self, priority: int, deadline: Optional[float]):
+        self.priority = priority
+        self.deadline = deadline
+        self.event = threading.Event()
+        self.admitted = False
+        self.reason: Optional[str] = None
+
+class AdmissionController:
+    """Concurrency limit with a bounded, priority-ordered and deadline-aware wait queue."""
+
+    def __init__(self, max_concurrent: int, max_queue: int = 64, queue_timeout: Optional[float] = 1.0,
+                 priorities: Optional[Mapping[str, int]] = None, default_priority: int = 1):
+        """
+        Initialize the controller.
+
+        Args:
+            max_concurrent (int): Operations allowed to run at once.
+            max_queue (int): Operations allowed to wait; beyond that the lowest priority is shed.
+            queue_timeout (float, optional): Default seconds an operation may wait; None waits indefinitely.
+            priorities (Mapping[str, int], optional): Priority per operation class; lower runs first.
+            default_priority (int): Priority of classes not listed.
+        """
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.priorities = dict(priorities or {})
+        self.default_priority = default_priority
+        self.in_flight = 0
+        self.service_ms = 0.0
+        self._queue: List[tuple] = []
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {"admitted": 0, "queued": 0, QUEUE_FULL: 0, DEADLINE: 0, DISPLACED: 0, TIMEOUT: 0}
+
+    def snapshot(self) -> Dict[str, float]:
+        """Return the overload counters with the current in-flight count, queue depth and service time."""
+        with self._lock:
+            return dict(self.stats, in_flight=self.in_flight, queue_depth=self._depth(), service_ms=self.service_ms)
+
+    @contextmanager
+    def admit(self, operation_class: str, timeout: Optional[float] = None) -> Iterator[None]:
+        """
+        Hold a slot for the duration of the block.
+
+        Args:
+            operation_class (str): Operation class, e.g. the operation type.
+            timeout (float, optional): Seconds the operation may wait; defaults to queue_timeout.
+
+        Raises:
+            Overloaded: If the operation is shed.
+        """
+        self.acquire(operation_class, timeout)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release((time.monotonic() - started) * 1000)
+
+    def acquire(self, operation_class: str, timeout: Optional[float] = None) -> None:
+        """
+        Take a slot, waiting in priority order if none is free.
+
+        An operation is shed when the queue is full of equal or higher priority work, when the
+        estimated wait already exceeds its timeout, when a higher-priority arrival displaces it,
+        or when its timeout runs out while queued.
+
+        Args:
+            operation_class (str): Operation class, e.g. the operation type.
+            timeout (float, optional): Seconds the operation may wait; defaults to queue_timeout.
+
+        Raises:
+            Overloaded: If the operation is shed.
+        """
+        timeout = self.queue_timeout if timeout is None else timeout
+        priority = self.priorities.get(operation_class, self.default_priority)
+        with self._lock:
+            if self.in_flight < self.max_concurrent and not self._depth():
+                self.in_flight += 1
+                self.stats["admitted"] += 1
+                return
+            ahead = sum(1 for entry in self._queue if entry[2].reason is None and entry[0] <= priority)
+            if timeout is not None and self.service_ms and (ahead + 1) / self.max_concurrent * self.service_ms / 1000 > timeout:
+                self.stats[DEADLINE] += 1
+                raise Overloaded(operation_class, DEADLINE)
+            if self._depth() >= self.max_queue and not self._displace(priority):
+                self.stats[QUEUE_FULL] += 1
+                raise Overloaded(operation_class, QUEUE_FULL)
+            if len(self._queue) > 2 * max(self.max_queue, 1):
+                # Drop shed and timed-out entries that have not been popped yet
+                self._queue = [entry for entry in self._queue if entry[2].reason is None]
+                heapq.heapify(self._queue)
+            waiter = _Waiter(priority, None if timeout is None else time.monotonic() + timeout)
+            heapq.heappush(self._queue, (priority, next(self._order), waiter))
+            self.stats["queued"] += 1
+        waiter.event.wait(timeout)
+        with self._lock:
+            if waiter.admitted:
+                return
+            if waiter.reason is None:
+                waiter.reason = TIMEOUT
+                self.stats[TIMEOUT] += 1
+        raise Overloaded(operation_class, waiter.reason)
+
+    def release(self, service_ms: float = 0.0) -> None:
+        """
+        Free a slot and hand it to the highest-priority waiter still within its deadline.
+
+        Args:
+            service_ms (float): How long the slot was held, folded into the service time estimate.
+        """
+        with self._lock:
+            self.service_ms = service_ms if not self.service_ms else 0.8 * self.service_ms + 0.2 * service_ms
+            now = time.monotonic()
+            while self._queue:
+                _, _, waiter = heapq.heappop(self._queue)
+                if waiter.reason is not None:
+                    continue
+                if waiter.deadline is not None and now > waiter.deadline:
+                    waiter.reason = TIMEOUT
+                    self.stats[TIMEOUT] += 1
+                    waiter.event.set()
+                    continue
+                waiter.admitted = True
+                self.stats["admitted"] += 1
+                waiter.event.set()
+                return
+            self.in_flight -= 1
+
+    def _depth(self) -> int:
+        return sum(1 for entry in self._queue if entry[2].reason is None)
+
+    def _displace(self, priority: int) -> bool:
+        """Shed the lowest-priority, most recently queued waiter if it ranks below priority."""
+        live = [entry for entry in self._queue if entry[2].reason is None]
+        worst = max(live, key=lambda entry: (entry[0], entry[1]), default=None)
+        if worst is None or worst[0] <= priority:
+            return False
+        worst[2].reason = DISPLACED
+        self.stats[DISPLACED] += 1
+        worst[2].event.set()
+        return True
@@ -0,0 +1,293 @@
+"""
+append_log.py
+Append-only record log for persistent stores in Rhee_AI_Assistant.
+Each write appends one JSON line, loading replays the lines in order, and compaction rewrites
+the log from a snapshot of the live state, optionally on a background thread, so write cost
+stays proportional to the record rather than to the store. In write-behind mode records are
+buffered and group-committed by count or interval, with per-record and explicit durability.
+"""
+
+import atexit
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from omniversal_runtime.hot_log import get_logger
+
+HEADER = '{"format": "append_log", "version": 1}'
+
+Codec = Callable[[str], str]
+
+def _fsync_directory(path: str) -> None:
+    """Force a rename in the directory of path to stable storage; a no-op where directories cannot be opened."""
+    try:
+        descriptor = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+class AppendLog:
+    """Line-oriented JSON record log with group commit, replay and compaction."""
+
+    def __init__(self, path: str, encode: Optional[Codec] = None, decode: Optional[Codec] = None,
+                 batch_records: int = 1, flush_interval: Optional[float] = None, fsync: bool = False):
+        """
+        Initialize the log; the file is created on the first append.
+
+        Args:
+            path (str): Log file.
+            encode (Callable, optional): Applied to each serialized record, e.g. encryption;
+                the result must not contain newlines.
+            decode (Callable, optional): Inverse of encode, applied on replay.
+            batch_records (int): Records buffered before they are written together; 1 writes through.
+            flush_interval (float, optional): Seconds after which buffered records are written
+                by a background thread regardless of count.
+            fsync (bool): Force every write to stable storage instead of leaving it to the OS.
+        """
+        if batch_records < 1:
+            raise ValueError(f"batch_records must be at least 1, got {batch_records}")
+        self.path = path
+        self.encode = encode
+        self.decode = decode
+        self.batch_records = batch_records
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.records = 0
+        self.logger = get_logger(__name__)
+        self.stats: Dict[str, int] = {"writes": 0, "syncs": 0}
+        self._handle = None
+        self._pending: List[str] = []
+        self._flusher: Optional[threading.Thread] = None
+        self._exit_flush = False
+        self._stop = threading.Event()
+        self._tail: Optional[List[str]] = None
+        self._compactor: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_log(path: str) -> bool:
+        """Return True if path is an existing append log, False if it is missing or in another format."""
+        try:
+            with open(path, encoding="utf-8") as log:
+                return log.readline().rstrip("\n") == HEADER
+        except (OSError, UnicodeDecodeError):
+            return False
+
+    @property
+    def pending(self) -> int:
+        """Records buffered but not yet written."""
+        return len(self._pending)
+
+    @property
+    def compacting(self) -> bool:
+        """Whether a compaction is in progress."""
+        return self._tail is not None
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the logged records in write order.
+
+        A final line without a newline is the remainder of an interrupted write; it is dropped
+        and cut from the file so later appends start on a clean line.
+
+        Yields:
+            Dict[str, Any]: Records as passed to append.
+
+        Raises:
+            ValueError: If the file is not an append log or a complete line cannot be decoded.
+        """
+        self.records = 0
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as log:
+            if log.readline().rstrip(b"\n").decode("utf-8", "replace") != HEADER:
+                raise ValueError(f"{self.path} is not an append log")
+            offset = log.tell()
+            for number, line in enumerate(log, 2):
+                if not line.endswith(b"\n"):
+                    self.logger.warning("Dropping incomplete record at %s:%d", self.path, number)
+                    self._truncate(offset)
+                    return
+                offset += len(line)
+                try:
+                    record = json.loads(self._decode(line[:-1].decode("utf-8")))
+                except Exception as e:
+                    raise ValueError(f"{self.path}:{number}: unreadable record: {e}") from e
+                self.records += 1
+                yield record
+
+    def append(self, record: Dict[str, Any], durable: bool = False) -> None:
+        """
+        Add one record at the end of the log.
+
+        The record is written once batch_records records are buffered, when the flush interval
+        elapses, or on flush, sync or close.
+
+        Args:
+            record (Dict[str, Any]): JSON-serializable record.
+            durable (bool): Write and fsync the record and everything buffered before returning.
+        """
+        self.append_many((record,), durable)
+
+    def append_many(self, records: Iterable[Dict[str, Any]], durable: bool = False) -> None:
+        """
+        Add several records at the end of the log; they are buffered and written together.
+
+        Args:
+            records (Iterable[Dict[str, Any]]): JSON-serializable records.
+            durable (bool): Write and fsync the records and everything buffered before returning.
+        """
+        lines = [self._encode(record) for record in records]
+        if not lines:
+            return
+        with self._lock:
+            self._pending.extend(lines)
+            self.records += len(lines)
+            if self.batch_records > 1 and not self._exit_flush:
+                # Buffered records would otherwise be lost if the process exits without close
+                atexit.register(self.flush)
+                self._exit_flush = True
+            if durable:
+                self._write(True)
+            elif len(self._pending) >= self.batch_records:
+                self._write(self.fsync)
+            elif self.flush_interval is not None and self._flusher is None:
+                self._start_flusher()
+
+    def flush(self) -> None:
+        """Write every buffered record to the file."""
+        with self._lock:
+            self._write(self.fsync)
+
+    def sync(self) -> None:
+        """Write every buffered record and force the file to stable storage."""
+        with self._lock:
+            self._write(True)
+
+    def compact(self, snapshot: Iterable[Dict[str, Any]], background: bool = False) -> bool:
+        """
+        Replace the log with the records of a snapshot.
+
+        The caller must take the snapshot after, and serialized with, every append it reflects.
+        Records appended while the snapshot is written are carried over to the new log, so
+        appends never wait for a compaction to finish.
+
+        Args:
+            snapshot (Iterable[Dict[str, Any]]): Records that rebuild the current state.
+            background (bool): Write the new log on a daemon thread and return immediately.
+
+        Returns:
+            bool: False if a compaction is already in progress and this one was not started.
+        """
+        with self._lock:
+            if self._tail is not None:
+                return False
+            self._tail = []
+        if not background:
+            self._rewrite(snapshot)
+            return True
+        self._compactor = threading.Thread(target=self._rewrite, args=(snapshot,), name="append-log-compaction", daemon=True)
+        self._compactor.start()
+        return True
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Block until a background compaction has finished."""
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join(timeout)
+
+    def close(self) -> None:
+        """Finish any compaction, write buffered records and close the file."""
+        self.wait()
+        self._stop.set()
+        with self._lock:
+            self._write(self.fsync)
+            if self._exit_flush:
+                atexit.unregister(self.flush)
+                self._exit_flush = False
+            self._flusher = None
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+    def _rewrite(self, snapshot: Iterable[Dict[str, Any]]) -> None:
+        temporary = self.path + ".compact"
+        try:
+            written = 0
+            with open(temporary, "w", encoding="utf-8", newline="\n") as log:
+                log.write(HEADER + "\n")
+                for record in snapshot:
+                    log.write(self._encode(record))
+                    written += 1
+                with self._lock:
+                    # Buffered records stay pending and are written to the new file
+                    log.writelines(self._tail)
+                    log.flush()
+                    os.fsync(log.fileno())
+                    if self._handle is not None:
+                        self._handle.close()
+                        self._handle = None
+                    os.replace(temporary, self.path)
+                    _fsync_directory(self.path)
+                    self.records = written + len(self._tail) + len(self._pending)
+                    self._tail = None
+            self.logger.info("Compacted %s to %d records", self.path, self.records)
+        except Exception as e:
+            self.logger.error("Compaction of %s failed: %s", self.path, e)
+            with self._lock:
+                self._tail = None
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+    def _write(self, sync: bool) -> None:
+        """Write the buffered records in one call; the caller holds the lock."""
+        if self._pending:
+            handle = self._open()
+            try:
+                handle.write("".join(self._pending))
+                handle.flush()
+            except Exception as e:
+                self.logger.error("Writing %d records to %s failed: %s", len(self._pending), self.path, e)
+                raise
+            if self._tail is not None:
+                self._tail.extend(self._pending)
+            self._pending = []
+            self.stats["writes"] += 1
+        if sync and self._handle is not None:
+            os.fsync(self._handle.fileno())
+            self.stats["syncs"] += 1
+
+    def _start_flusher(self) -> None:
+        def _run() -> None:
+            while not self._stop.wait(self.flush_interval):
+                try:
+                    self.flush()
+                except Exception:
+                    pass  # Already logged; the records stay buffered for the next attempt
+
+        self._stop.clear()
+        self._flusher = threading.Thread(target=_run, name="append-log-flusher", daemon=True)
+        self._flusher.start()
+
+    def _open(self):
+        if self._handle is None:
+            fresh = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+            self._handle = open(self.path, "a", encoding="utf-8", newline="\n")
+            if fresh:
+                self._handle.write(HEADER + "\n")
+        return self._handle
+
+    def _truncate(self, offset: int) -> None:
+        with self._lock:
+            with open(self.path, "r+b") as log:
+                log.truncate(offset)
+
+    def _encode(self, record: Dict[str, Any]) -> str:
+        line = json.dumps(record, separators=(",", ":"))
+        return (self.encode(line) if self.encode else line) + "\n"
+
+    def _decode(self, line: str) -> str:
+        return self.decode(line) if self.decode else line
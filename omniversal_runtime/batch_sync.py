@@ -0,0 +1,201 @@
+"""
+batch_sync.py
+Batched fan-out support for integration nexuses and bridges in Rhee_AI_Assistant.
+Records a whole list of target modules in one pass instead of one sync call per module,
+optionally routed through the installed RoutingTable and handed off to an IntegrationEventBus.
+Syncs whose config, layer and targets match the last sync of the same entity are skipped.
+"""
+
+import inspect
+from functools import lru_cache
+from typing import Any, Iterable, List, MutableMapping, Optional, Tuple
+from omniversal_runtime.routing_table import default_routing_table, topic_for
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.bridge_index import BridgeIndex
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import BoundedMap, RetentionPolicy, retained
+from omniversal_runtime.signatures import signatures
+
+
+# Sync fingerprints only save repeat syncs, so by default they are kept for the most recent entities
+FINGERPRINT_RETENTION = RetentionPolicy(max_entries=65536)
+
+
+@lru_cache(maxsize=None)
+def _sync_record_keys(cls: type, sync_method: str) -> Tuple[str, str]:
+    """
+    Resolve the payload and layer keys recorded by a per-target sync method.
+
+    Per-target methods share the shape ``sync_x(entity_id, payload, layer, target_module)``,
+    so the parameter names double as the keys written into the bridge record.
+
+    Args:
+        cls (type): Nexus or bridge class.
+        sync_method (str): Name of the per-target sync method.
+
+    Returns:
+        Tuple[str, str]: Payload key and layer key.
+    """
+    method = getattr(cls, sync_method, None)
+    if method is None:
+        return "config", "layer"
+    params = list(inspect.signature(method).parameters)[1:]
+    if len(params) < 3:
+        return "config", "layer"
+    return params[1], params[2]
+
+
+class BatchSyncMixin:
+    """Adds a batched ``sync_many`` call to integration nexuses and bridges."""
+
+    # Name of the dict the per-target sync methods write to, and the strength key they record.
+    bridge_store: str = "coherence_bridges"
+    strength_key: str = "coherence_strength"
+    # Optional IntegrationEventBus; when set, sync_many publishes instead of blocking on delivery.
+    event_bus = None
+    # Optional RoutingTable; when set, targets that do not exist or subscribe to the topic are skipped.
+    routing_table = None
+
+    @property
+    def bridge_index(self) -> BridgeIndex:
+        """
+        Per-(entity, target) index of the bridges this instance has recorded.
+
+        When the bridge store is bounded by a retention policy, entities it evicts are
+        forgotten by the index as well.
+        """
+        index = self.__dict__.get("_bridge_index")
+        if index is None:
+            index = self.__dict__["_bridge_index"] = BridgeIndex()
+            bridges = getattr(self, self.bridge_store, None)
+            if isinstance(bridges, BoundedMap):
+                evicted = bridges.on_evict
+
+                def _forget(key: Any, value: Any, reason: str) -> None:
+                    index.forget(key)
+                    if evicted is not None:
+                        evicted(key, value, reason)
+
+                bridges.on_evict = _forget
+        return index
+
+    @property
+    def sync_fingerprints(self) -> MutableMapping:
+        """Fingerprint of the last config, layer and targets synced per (sync method, entity)."""
+        fingerprints = self.__dict__.get("_sync_fingerprints")
+        if fingerprints is None:
+            fingerprints = self.__dict__["_sync_fingerprints"] = retained(self, "sync_fingerprints", FINGERPRINT_RETENTION)
+        return fingerprints
+
+    def index_bridge(self, entity_id: str) -> None:
+        """
+        Add the bridge record just written by a per-target sync method to the bridge index.
+
+        Args:
+            entity_id (str): Entity whose bridge record was written.
+        """
+        record = getattr(self, self.bridge_store)[entity_id]
+        self.bridge_index.record(entity_id, record["target_module"], record.get(self.strength_key, 0.0))
+
+    def publish_sync(self, sync_method: str, entity_id: str, payload: Any, layer: str, target_modules: List[str],
+                     timestamp: str) -> Optional[Any]:
+        """
+        Hand a recorded sync to the attached event bus for delivery to the target modules.
+
+        Args:
+            sync_method (str): Sync method that recorded the bridge.
+            entity_id (str): Synchronized entity.
+            payload (Any): Configuration or stream data for the entity.
+            layer (str): Layer context.
+            target_modules (List[str]): Modules the event is delivered to.
+            timestamp (str): Timestamp of the bridge record.
+
+        Returns:
+            Optional[Future]: Delivery completion future, or None without an event bus.
+        """
+        if self.event_bus is None:
+            return None
+        return self.event_bus.submit({
+            "source": type(self).__name__,
+            "sync_method": sync_method,
+            "entity_id": entity_id,
+            "payload": payload,
+            "layer": layer,
+            "target_modules": target_modules,
+            "timestamp": timestamp
+        })
+
+    def forget_bridge(self, entity_id: str) -> None:
+        """
+        Delete an entity's bridge record and drop it from the bridge index.
+
+        Args:
+            entity_id (str): Entity whose bridge record is removed.
+        """
+        getattr(self, self.bridge_store).pop(entity_id, None)
+        self.bridge_index.forget(entity_id)
+
+    def sync_many(self, sync_method: str, entity_id: str, payload: Any, layer: str,
+                  target_modules: Optional[Iterable[str]] = None, force: bool = False,
+                  fingerprint: Any = None) -> Optional[Any]:
+        """
+        Synchronize an entity with the modules subscribed to a sync topic in a single pass.
+
+        Equivalent to calling ``sync_method`` once per target, but records one bridge
+        entry holding the whole target list, adds one edge per target to the bridge
+        index and emits one log line. Targets are the subscribers of the method's topic
+        in the routing table (see default_routing_table); an explicit target list is
+        used instead, filtered by the installed routing table if there is one. With an
+        event bus attached, the event is enqueued for subscribed modules and the call
+        returns without waiting for delivery.
+
+        When the fingerprint source, layer and targets match the last sync of this
+        entity through the same method, the call returns immediately without syncing.
+        The source is digested once per object, as by SignatureEngine.config_digest; after
+        changing it in place, call signatures.invalidate on it or pass force.
+
+        Args:
+            sync_method (str): Per-target method being batched (e.g., sync_memory_state).
+            entity_id (str): Unique identifier for the synchronized entity.
+            payload (Any): Configuration or stream data for the entity.
+            layer (str): Layer context.
+            target_modules (Iterable[str], optional): Target modules instead of the topic's subscribers.
+            force (bool): Sync even if nothing changed since the last sync.
+            fingerprint (Any, optional): Value whose digest identifies the sync, e.g. the config
+                behind a freshly generated stream payload; defaults to the payload.
+
+        Returns:
+            Optional[Future]: Delivery completion future when an event bus is attached, else None.
+        """
+        targets: Tuple[str, ...] = ()
+        try:
+            topic = topic_for(sync_method)
+            targets = default_routing_table().targets(topic) if target_modules is None else tuple(target_modules)
+            key = (sync_method, entity_id)
+            current = (signatures.config_digest(payload if fingerprint is None else fingerprint), layer, targets)
+            if not force and self.sync_fingerprints.get(key) == current:
+                self.logger.debug("Skipped unchanged %s for %s", sync_method, entity_id)
+                return None
+            if target_modules is not None and self.routing_table is not None:
+                targets = self.routing_table.resolve(topic, targets)
+            payload_key, layer_key = _sync_record_keys(type(self), sync_method)
+            bridges = getattr(self, self.bridge_store)
+            bridges[entity_id] = {
+                payload_key: payload,
+                layer_key: layer,
+                "target_module": targets[-1] if targets else None,
+                "target_modules": list(targets),
+                "timestamp": utc_iso(),
+                self.strength_key: get_stream(__name__, entity_id).uniform(0.9, 1.0)
+            }
+            self.bridge_index.record_many(entity_id, targets, bridges[entity_id][self.strength_key])
+            self.logger.info("Batch %s for %s across %d modules in layer %s, strength %.2f",
+                             sync_method, entity_id, len(targets), layer, bridges[entity_id][self.strength_key])
+            delivery = self.publish_sync(sync_method, entity_id, payload, layer, bridges[entity_id]["target_modules"],
+                                         bridges[entity_id]["timestamp"])
+            # Recorded only once published, so a sync whose event was lost is retried
+            self.sync_fingerprints[key] = current
+            return delivery
+        except Exception as e:
+            self.logger.error("Error in batch %s for %s across %d modules: %s", sync_method, entity_id, len(targets), e)
+        return None
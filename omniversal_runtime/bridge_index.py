@@ -0,0 +1,136 @@
+"""
+bridge_index.py
+Per-(entity, target) bridge index for integration nexuses in Rhee_AI_Assistant.
+Interns entity and target module ids to small integers and keeps one array-backed edge
+per pair, answering "which modules has X reached" and "which entities touched M" in O(1).
+Forgotten entities free their id and rows for reuse, so an index whose entities are forgotten
+as their bridges are evicted stays as small as the live bridge set.
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from omniversal_runtime.clock import monotonic_ns
+
+class BridgeIndex:
+    """Array-backed edge table of the bridges a nexus has recorded."""
+
+    def __init__(self):
+        """Initialize an empty bridge index."""
+        self.entities: List[Optional[str]] = []
+        self.targets: List[str] = []
+        self._entity_ids: Dict[str, int] = {}
+        self._target_ids: Dict[str, int] = {}
+        self._edges: Dict[Tuple[int, int], int] = {}
+        self._by_entity: Dict[int, Set[int]] = {}
+        self._by_target: Dict[int, Set[int]] = {}
+        self.strength = array("d")
+        self.syncs = array("L")
+        self.last_sync_ns = array("q")
+        self._free_entities: List[int] = []
+        self._free_rows: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+    def record(self, entity_id: str, target_module: str, strength: float) -> None:
+        """
+        Record one bridge between an entity and a target module.
+
+        Args:
+            entity_id (str): Entity identifier.
+            target_module (str): Target module id.
+            strength (float): Bridge strength reported by the sync.
+        """
+        self.record_many(entity_id, (target_module,), strength)
+
+    def record_many(self, entity_id: str, target_modules: Iterable[str], strength: float) -> None:
+        """
+        Record bridges from an entity to every target module of a fan-out.
+
+        Args:
+            entity_id (str): Entity identifier.
+            target_modules (Iterable[str]): Target module ids.
+            strength (float): Bridge strength shared by the fan-out.
+        """
+        entity = self._intern(entity_id, self.entities, self._entity_ids, self._free_entities)
+        reached = self._by_entity.setdefault(entity, set())
+        now = monotonic_ns()
+        for target_module in target_modules:
+            target = self._intern(target_module, self.targets, self._target_ids)
+            row = self._edges.get((entity, target))
+            if row is None:
+                if self._free_rows:
+                    row = self._free_rows.pop()
+                    self.strength[row] = strength
+                    self.syncs[row] = 1
+                    self.last_sync_ns[row] = now
+                else:
+                    row = len(self.strength)
+                    self.strength.append(strength)
+                    self.syncs.append(1)
+                    self.last_sync_ns.append(now)
+                self._edges[(entity, target)] = row
+                reached.add(target)
+                self._by_target.setdefault(target, set()).add(entity)
+            else:
+                self.strength[row] = strength
+                self.syncs[row] += 1
+                self.last_sync_ns[row] = now
+
+    def targets_of(self, entity_id: str) -> List[str]:
+        """Return the target modules an entity has reached."""
+        entity = self._entity_ids.get(entity_id)
+        if entity is None:
+            return []
+        return [self.targets[target] for target in self._by_entity.get(entity, ())]
+
+    def entities_of(self, target_module: str) -> List[str]:
+        """Return the entities that have touched a target module."""
+        target = self._target_ids.get(target_module)
+        if target is None:
+            return []
+        return [self.entities[entity] for entity in self._by_target.get(target, ())]
+
+    def bridge(self, entity_id: str, target_module: str) -> Optional[Dict[str, float]]:
+        """
+        Look up one bridge.
+
+        Args:
+            entity_id (str): Entity identifier.
+            target_module (str): Target module id.
+
+        Returns:
+            Optional[Dict[str, float]]: Latest strength, sync count and last sync time, or None.
+        """
+        row = self._edges.get((self._entity_ids.get(entity_id), self._target_ids.get(target_module)))
+        if row is None:
+            return None
+        return {"strength": self.strength[row], "syncs": self.syncs[row], "last_sync_ns": self.last_sync_ns[row]}
+
+    def forget(self, entity_id: str) -> None:
+        """
+        Drop an entity and every bridge it has; its id and array rows are reused by later records.
+
+        Args:
+            entity_id (str): Entity identifier.
+        """
+        entity = self._entity_ids.pop(entity_id, None)
+        if entity is None:
+            return
+        for target in self._by_entity.pop(entity, ()):
+            self._free_rows.append(self._edges.pop((entity, target)))
+            self._by_target[target].discard(entity)
+        self.entities[entity] = None
+        self._free_entities.append(entity)
+
+    @staticmethod
+    def _intern(name: str, names: List[Optional[str]], ids: Dict[str, int], free: Optional[List[int]] = None) -> int:
+        interned = ids.get(name)
+        if interned is None:
+            if free:
+                interned = ids[name] = free.pop()
+                names[interned] = name
+            else:
+                interned = ids[name] = len(names)
+                names.append(name)
+        return interned
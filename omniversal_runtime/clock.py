@@ -0,0 +1,131 @@
+"""
+clock.py
+Shared clock service for Rhee_AI_Assistant.
+Provides coarse cached UTC ISO timestamps, a monotonic nanosecond counter, and frozen
+or replayed time for reproducible tests and benchmarks.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+LIVE = "live"
+COARSE = "coarse"
+FROZEN = "frozen"
+REPLAY = "replay"
+
+class Clock:
+    """Pluggable time source shared by every module."""
+
+    def __init__(self, mode: str = COARSE, resolution_ms: float = 1.0):
+        """
+        Initialize the clock.
+
+        Args:
+            mode (str): "live", "coarse", "frozen" or "replay".
+            resolution_ms (float): Timestamp granularity in coarse mode.
+        """
+        self.mode = mode
+        self.resolution_ms = resolution_ms
+        self._cached = (None, "")
+        self._frozen_at: Optional[datetime] = None
+        self._step = timedelta(0)
+        self._ticks = 0
+
+    def use_live(self) -> None:
+        """Format a fresh timestamp on every call."""
+        self.mode = LIVE
+
+    def use_coarse(self, resolution_ms: float = 1.0) -> None:
+        """
+        Reuse the formatted timestamp until the clock moves past the resolution.
+
+        Args:
+            resolution_ms (float): Timestamp granularity in milliseconds.
+        """
+        self.mode = COARSE
+        self.resolution_ms = resolution_ms
+        self._cached = (None, "")
+
+    def freeze(self, at: Optional[datetime] = None) -> None:
+        """
+        Stop the clock; every timestamp is `at` and the monotonic counter stands still.
+
+        Args:
+            at (datetime, optional): Naive UTC instant to freeze at; defaults to now.
+        """
+        self.replay(at or self._utc_now(), timedelta(0))
+        self.mode = FROZEN
+
+    def replay(self, start: datetime, step: timedelta = timedelta(microseconds=1)) -> None:
+        """
+        Advance deterministically from `start` by `step` on every reading.
+
+        Args:
+            start (datetime): Naive UTC instant of the first reading.
+            step (timedelta): Increment applied after each reading.
+        """
+        self.mode = REPLAY
+        self._frozen_at = start
+        self._step = step
+        self._ticks = 0
+
+    def utc_now(self) -> datetime:
+        """Return the current naive UTC datetime, as datetime.utcnow() would."""
+        if self.mode in (FROZEN, REPLAY):
+            return self._advance()
+        return self._utc_now()
+
+    def utc_iso(self) -> str:
+        """Return the current UTC time as an ISO 8601 string."""
+        if self.mode == COARSE:
+            now = time.time()
+            bucket = int(now * 1000 // self.resolution_ms)
+            cached_bucket, cached = self._cached
+            if bucket == cached_bucket:
+                return cached
+            stamp = datetime.fromtimestamp(bucket * self.resolution_ms / 1000, timezone.utc)
+            cached = stamp.replace(tzinfo=None).isoformat(timespec="microseconds")
+            self._cached = (bucket, cached)
+            return cached
+        return self.utc_now().isoformat(timespec="microseconds")
+
+    def epoch(self) -> float:
+        """Return the current UTC time in seconds since the Unix epoch."""
+        if self.mode in (FROZEN, REPLAY):
+            return self._advance().replace(tzinfo=timezone.utc).timestamp()
+        return time.time()
+
+    def monotonic_ns(self) -> int:
+        """Return a monotonic nanosecond counter; deterministic when frozen or replaying."""
+        if self.mode in (FROZEN, REPLAY):
+            return self._ticks * (self._step // timedelta(microseconds=1)) * 1000
+        return time.monotonic_ns()
+
+    def _advance(self) -> datetime:
+        current = self._frozen_at + self._step * self._ticks
+        if self.mode == REPLAY:
+            self._ticks += 1
+        return current
+
+    @staticmethod
+    def _utc_now() -> datetime:
+        return datetime.now(timezone.utc).replace(tzinfo=None)
+
+clock = Clock()
+
+def utc_iso() -> str:
+    """Return the shared clock's current UTC ISO timestamp."""
+    return clock.utc_iso()
+
+def utc_now() -> datetime:
+    """Return the shared clock's current naive UTC datetime."""
+    return clock.utc_now()
+
+def epoch() -> float:
+    """Return the shared clock's current time in seconds since the Unix epoch."""
+    return clock.epoch()
+
+def monotonic_ns() -> int:
+    """Return the shared clock's monotonic nanosecond counter."""
+    return clock.monotonic_ns()
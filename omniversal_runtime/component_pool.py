@@ -0,0 +1,180 @@
+"""
+component_pool.py
+Keyed component pooling for Rhee_AI_Assistant.
+Keeps one live instance per key (normally an agent id) so expensive components such as
+VoiceCore and its API clients are built once, warmed up ahead of traffic, and rebuilt only
+after repeated health check failures. Periodic checks run on a background thread so requests
+never wait for them.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+from omniversal_runtime.clock import monotonic_ns
+from omniversal_runtime.hot_log import get_logger
+
+def default_health_check(component: Any) -> bool:
+    """Call the component's own health_check() if it has one, else treat it as healthy."""
+    check = getattr(component, "health_check", None)
+    return bool(check()) if callable(check) else True
+
+class ComponentPool:
+    """One reusable instance per key, with warm-up and periodic health checks."""
+
+    def __init__(self, factory: Callable[[Hashable], Any], name: str = "component",
+                 health_check: Callable[[Any], bool] = default_health_check,
+                 check_interval: Optional[float] = 30.0, failure_threshold: int = 3):
+        """
+        Initialize the pool.
+
+        Args:
+            factory (Callable): Builds a component for a key.
+            name (str): Pool name used in logs.
+            health_check (Callable): Returns False for a component that must be rebuilt.
+            check_interval (float, optional): Seconds between health checks of a pooled
+                component, started in the background by get(); None checks only on warm_up()
+                and check_health().
+            failure_threshold (int): Consecutive failed checks before a component is discarded,
+                so a transient outage does not throw away its state.
+        """
+        if failure_threshold < 1:
+            raise ValueError(f"failure_threshold must be at least 1, got {failure_threshold}")
+        self.factory = factory
+        self.name = name
+        self.health_check = health_check
+        self.check_interval_ns = None if check_interval is None else int(check_interval * 1e9)
+        self.failure_threshold = failure_threshold
+        self.components: Dict[Hashable, Any] = {}
+        self._checked_at: Dict[Hashable, int] = {}
+        self._failures: Dict[Hashable, int] = {}
+        self._checking: Dict[Hashable, threading.Thread] = {}
+        self._locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {"created": 0, "reused": 0, "unhealthy": 0, "failed": 0}
+        self.logger = get_logger(__name__)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.components
+
+    def __len__(self) -> int:
+        return len(self.components)
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Return the pooled component for a key, building it when needed.
+
+        A due health check is started in the background; the current component is returned
+        without waiting for it.
+
+        Args:
+            key (Hashable): Pool key, e.g. an agent id.
+
+        Returns:
+            Any: Live component.
+        """
+        component = self.components.get(key)
+        if component is None:
+            with self._key_lock(key):
+                component = self.components.get(key)
+                if component is None:
+                    return self._create(key)
+        if self._check_due(key):
+            self._check_in_background(key, component)
+        self.stats["reused"] += 1
+        return component
+
+    def warm_up(self, keys: Iterable[Hashable]) -> Dict[Hashable, bool]:
+        """
+        Build and health-check components ahead of traffic.
+
+        Args:
+            keys (Iterable[Hashable]): Keys to warm up.
+
+        Returns:
+            Dict[Hashable, bool]: Whether each key ended up with a healthy component.
+        """
+        results = {}
+        for key in keys:
+            try:
+                results[key] = self._healthy(key, self.get(key))
+            except Exception as e:
+                self.logger.error("Warm-up of %s %s failed: %s", self.name, key, e)
+                results[key] = False
+        return results
+
+    def check_health(self) -> Dict[Hashable, bool]:
+        """
+        Health-check every pooled component; one that has failed failure_threshold checks in a
+        row is dropped and rebuilt on next get().
+
+        Returns:
+            Dict[Hashable, bool]: Health of each pooled key.
+        """
+        return {key: self._healthy(key, component) for key, component in list(self.components.items())}
+
+    def discard(self, key: Hashable) -> None:
+        """Drop the pooled component for a key."""
+        self.components.pop(key, None)
+        self._checked_at.pop(key, None)
+        self._failures.pop(key, None)
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Block until the background health checks running now have finished."""
+        for thread in list(self._checking.values()):
+            thread.join(timeout)
+
+    def _create(self, key: Hashable) -> Any:
+        try:
+            component = self.factory(key)
+        except Exception:
+            self.stats["failed"] += 1
+            raise
+        self.components[key] = component
+        self._checked_at[key] = monotonic_ns()
+        self.stats["created"] += 1
+        self.logger.info("Pooled new %s for %s", self.name, key)
+        return component
+
+    def _healthy(self, key: Hashable, component: Any) -> bool:
+        try:
+            healthy = self.health_check(component)
+        except Exception as e:
+            self.logger.warning("Health check of %s %s raised: %s", self.name, key, e)
+            healthy = False
+        self._checked_at[key] = monotonic_ns()
+        if healthy:
+            self._failures.pop(key, None)
+            return True
+        self.stats["unhealthy"] += 1
+        failures = self._failures[key] = self._failures.get(key, 0) + 1
+        if failures < self.failure_threshold:
+            self.logger.warning("%s for %s failed %d of %d health checks in a row", self.name, key, failures, self.failure_threshold)
+        elif self.components.get(key) is component:
+            self.logger.warning("Discarding unhealthy %s for %s", self.name, key)
+            self.discard(key)
+        return False
+
+    def _check_in_background(self, key: Hashable, component: Any) -> None:
+        with self._lock:
+            if key in self._checking:
+                return
+            # Marked as checked now so later gets do not start another check meanwhile
+            self._checked_at[key] = monotonic_ns()
+
+            def _run() -> None:
+                try:
+                    self._healthy(key, component)
+                finally:
+                    with self._lock:
+                        self._checking.pop(key, None)
+
+            self._checking[key] = threading.Thread(target=_run, name=f"{self.name}-health-check", daemon=True)
+            self._checking[key].start()
+
+    def _check_due(self, key: Hashable) -> bool:
+        if self.check_interval_ns is None:
+            return False
+        return monotonic_ns() - self._checked_at.get(key, 0) >= self.check_interval_ns
+
+    def _key_lock(self, key: Hashable) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
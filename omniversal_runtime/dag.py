@@ -0,0 +1,207 @@
+"""
+dag.py
+Dependency-aware stage scheduling for Rhee_AI_Assistant.
+Operations are declared as a DAG of subsystem stages (e.g., omnitemporal_coherence_lattice
+before omnidimensional_causality_weaver before omni_ethical_reality_governance); ready stages
+run concurrently, outputs can be cached, and each run reports its critical path.
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from omniversal_runtime.retention import BoundedMap
+
+OK = "ok"
+ERROR = "error"
+SKIPPED = "skipped"
+CACHED = "cached"
+
+_MISSING = object()
+
+StageFunction = Callable[[Any, Dict[str, Any]], Any]
+
+class StageGraph:
+    """Named stages and the stages each one must wait for."""
+
+    def __init__(self):
+        self.stages: Dict[str, StageFunction] = {}
+        self.dependencies: Dict[str, Tuple[str, ...]] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.stages
+
+    def add_stage(self, name: str, run: StageFunction, after: Iterable[str] = ()) -> None:
+        """
+        Declare a stage.
+
+        Args:
+            name (str): Stage name, normally a subsystem package.
+            run (Callable): Called with the run context and the outputs of the stages it depends on.
+            after (Iterable[str]): Stages that must complete first.
+        """
+        self.stages[name] = run
+        self.dependencies[name] = tuple(after)
+
+    def order(self) -> List[str]:
+        """
+        Return the stages in a dependency-respecting order.
+
+        Raises:
+            ValueError: If a dependency is undeclared or the graph has a cycle.
+        """
+        for name, deps in self.dependencies.items():
+            missing = [dep for dep in deps if dep not in self.stages]
+            if missing:
+                raise ValueError(f"Stage {name} depends on undeclared stages: {missing}")
+        ordered: List[str] = []
+        state: Dict[str, int] = {}
+        for root in self.stages:
+            stack = [(root, iter(self.dependencies[root]))]
+            if state.get(root) == 2:
+                continue
+            state[root] = 1
+            while stack:
+                name, deps = stack[-1]
+                dep = next(deps, None)
+                if dep is None:
+                    stack.pop()
+                    state[name] = 2
+                    ordered.append(name)
+                elif state.get(dep) == 1:
+                    raise ValueError(f"Stage dependency cycle through {dep}")
+                elif state.get(dep) is None:
+                    state[dep] = 1
+                    stack.append((dep, iter(self.dependencies[dep])))
+        return ordered
+
+class DagRun:
+    """Outputs, status, timings and critical path of one scheduled operation."""
+
+    def __init__(self):
+        self.outputs: Dict[str, Any] = {}
+        self.status: Dict[str, str] = {}
+        self.errors: Dict[str, str] = {}
+        self.durations_ms: Dict[str, float] = {}
+        self.critical_path: List[str] = []
+        self.critical_path_ms = 0.0
+        self.elapsed_ms = 0.0
+
+class DagScheduler:
+    """Runs a StageGraph with maximal parallelism and an optional stage output cache."""
+
+    def __init__(self, graph: StageGraph, max_workers: int = 8, cache_size: int = 1024):
+        """
+        Initialize the scheduler.
+
+        Args:
+            graph (StageGraph): Stages to run.
+            max_workers (int): Stages allowed to run at once.
+            cache_size (int): Cached stage outputs kept, least recently used evicted first.
+        """
+        self.graph = graph
+        self.max_workers = max_workers
+        self.cache = BoundedMap(max_entries=cache_size)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # Concurrent runs share the cache and the pool
+        self._lock = threading.Lock()
+
+    def run(self, context: Any = None, cache_key: Optional[Hashable] = None) -> DagRun:
+        """
+        Run every stage once its dependencies have completed.
+
+        Stages whose dependencies failed are skipped. With a cache key, successful stage
+        outputs are cached per (stage, cache_key) and reused by later runs with the same key.
+
+        Args:
+            context (Any): Passed to every stage, e.g. the operation being orchestrated.
+            cache_key (Hashable, optional): Identifies runs whose stage outputs are interchangeable.
+
+        Returns:
+            DagRun: Per-stage outputs, status and durations plus the critical path.
+        """
+        order = self.graph.order()
+        result = DagRun()
+        start = time.monotonic()
+        pending = {name: set(self.graph.dependencies[name]) for name in order}
+        running: Dict[Future, Tuple[str, float]] = {}
+        pool = self._executor()
+
+        def settle(name: str, status: str) -> None:
+            result.status[name] = status
+            pending.pop(name, None)
+            for deps in pending.values():
+                deps.discard(name)
+
+        while pending or running:
+            for name in [name for name in order if name in pending and not pending[name]]:
+                deps = self.graph.dependencies[name]
+                if any(result.status.get(dep) not in (OK, CACHED) for dep in deps):
+                    result.durations_ms[name] = 0.0
+                    settle(name, SKIPPED)
+                    continue
+                if cache_key is not None:
+                    with self._lock:
+                        cached = self.cache.get((name, cache_key), _MISSING)
+                    if cached is not _MISSING:
+                        result.outputs[name] = cached
+                        result.durations_ms[name] = 0.0
+                        settle(name, CACHED)
+                        continue
+                upstream = {dep: result.outputs.get(dep) for dep in deps}
+                del pending[name]
+                running[pool.submit(self.graph.stages[name], context, upstream)] = (name, time.monotonic())
+            if not running:
+                continue
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                name, started = running.pop(future)
+                result.durations_ms[name] = (time.monotonic() - started) * 1000
+                try:
+                    result.outputs[name] = future.result()
+                    if cache_key is not None:
+                        with self._lock:
+                            self.cache[(name, cache_key)] = result.outputs[name]
+                    settle(name, OK)
+                except Exception as e:
+                    result.errors[name] = str(e)
+                    settle(name, ERROR)
+        result.elapsed_ms = (time.monotonic() - start) * 1000
+        result.critical_path, result.critical_path_ms = self._critical_path(order, result.durations_ms)
+        return result
+
+    def discard(self, stage: str, cache_key: Hashable) -> None:
+        """Drop a cached stage output so the next run with the key runs the stage again."""
+        with self._lock:
+            self.cache.discard((stage, cache_key))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads; the pool is recreated on next use."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def _critical_path(self, order: List[str], durations: Dict[str, float]) -> Tuple[List[str], float]:
+        finish: Dict[str, float] = {}
+        via: Dict[str, Optional[str]] = {}
+        for name in order:
+            deps = self.graph.dependencies[name]
+            before = max(deps, key=lambda dep: finish[dep], default=None)
+            via[name] = before
+            finish[name] = durations.get(name, 0.0) + (finish[before] if before is not None else 0.0)
+        if not finish:
+            return [], 0.0
+        tail: Optional[str] = max(finish, key=finish.get)
+        total = finish[tail]
+        path = []
+        while tail is not None:
+            path.append(tail)
+            tail = via[tail]
+        return path[::-1], total
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="stage")
+            return self._pool
@@ -0,0 +1,281 @@
+"""
+event_bus.py
+In-process asyncio event bus for integration nexus fan-out in Rhee_AI_Assistant.
+Delivers sync events to subscribed modules through bounded per-subscriber queues,
+so producers return as soon as an event is enqueued.
+"""
+
+import asyncio
+import concurrent.futures
+import inspect
+import threading
+from typing import Any, Callable, Dict, List, Optional
+from omniversal_runtime.hot_log import get_logger
+
+WILDCARD = "*"
+
+class IntegrationEventBus:
+    """Publish/subscribe bus with bounded per-subscriber queues, backpressure and completion futures."""
+
+    def __init__(self, max_queue_size: int = 1024):
+        """
+        Initialize the event bus.
+
+        Args:
+            max_queue_size (int): Default queue bound for each subscriber.
+        """
+        self.max_queue_size = max_queue_size
+        self.subscribers: Dict[str, Dict[str, Any]] = {}
+        self.routes: Dict[str, List[Dict[str, Any]]] = {}
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stats: Dict[str, int] = {"published": 0, "delivered": 0, "failed": 0, "unrouted": 0}
+        self._thread: Optional[threading.Thread] = None
+        self._stats_lock = threading.Lock()
+        self.logger = get_logger(__name__)
+
+    def subscribe(self, module: str, handler: Callable[[Dict[str, Any]], Any], max_queue_size: Optional[int] = None) -> str:
+        """
+        Subscribe a handler to events targeting a module.
+
+        On a running bus the subscriber's queue exists when this returns, so events submitted
+        right after are delivered to it.
+
+        Args:
+            module (str): Target module id (e.g., core_engine.quantum_memory_vault), or "*" for every event.
+            handler (Callable): Sync or async callable invoked with each event.
+            max_queue_size (int, optional): Queue bound for this subscriber.
+
+        Returns:
+            str: Subscriber identifier.
+        """
+        subscriber_id = f"{module}#{len(self.subscribers)}"
+        subscriber = {
+            "id": subscriber_id,
+            "module": module,
+            "handler": handler,
+            "max_queue_size": max_queue_size or self.max_queue_size,
+            "queue": None,
+            "task": None
+        }
+        self.subscribers[subscriber_id] = subscriber
+        self.routes.setdefault(module, []).append(subscriber)
+        if self.loop is not None:
+            self._run_on_loop(self._start_consumer, subscriber)
+        return subscriber_id
+
+    async def start_async(self) -> None:
+        """Bind the bus to the running event loop and start subscriber consumers."""
+        self.loop = asyncio.get_running_loop()
+        for subscriber in self.subscribers.values():
+            self._start_consumer(subscriber)
+
+    def start(self) -> None:
+        """Run the bus on a background event loop thread for use from synchronous producers."""
+        if self._thread is not None:
+            return
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def _run() -> None:
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(self.start_async())
+            started.set()
+            loop.run_forever()
+
+        self._thread = threading.Thread(target=_run, name="integration-event-bus", daemon=True)
+        self._thread.start()
+        started.wait()
+
+    async def publish(self, event: Dict[str, Any]) -> asyncio.Future:
+        """
+        Enqueue an event for every subscriber of its target modules.
+
+        Waits only while a subscriber queue is full (backpressure); delivery happens
+        on the subscriber consumers.
+
+        Args:
+            event (Dict[str, Any]): Event carrying a "target_modules" list.
+
+        Returns:
+            asyncio.Future: Resolves with the delivery count once every subscriber has handled the event.
+        """
+        subscribers = self._route(event)
+        done, pending = self._track(subscribers)
+        for subscriber in subscribers:
+            await subscriber["queue"].put((event, pending))
+        return done
+
+    def publish_nowait(self, event: Dict[str, Any]) -> asyncio.Future:
+        """
+        Enqueue an event without waiting; must be called on the bus loop.
+
+        Args:
+            event (Dict[str, Any]): Event carrying a "target_modules" list.
+
+        Returns:
+            asyncio.Future: Completion future, as for publish.
+
+        Raises:
+            asyncio.QueueFull: If any target subscriber queue is full; nothing is enqueued.
+        """
+        subscribers = self._route(event)
+        if any(subscriber["queue"].full() for subscriber in subscribers):
+            raise asyncio.QueueFull(f"Subscriber queue full for event {event.get('entity_id')}")
+        done, pending = self._track(subscribers)
+        for subscriber in subscribers:
+            subscriber["queue"].put_nowait((event, pending))
+        return done
+
+    def submit(self, event: Dict[str, Any], timeout: Optional[float] = None) -> concurrent.futures.Future:
+        """
+        Publish from synchronous code.
+
+        Blocks only until the event is enqueued; an event no module subscribes to completes
+        without a round trip to the bus loop. From the bus loop thread itself the call cannot
+        wait, so a full queue raises asyncio.QueueFull instead.
+
+        Args:
+            event (Dict[str, Any]): Event carrying a "target_modules" list.
+            timeout (float, optional): Maximum seconds to wait for queue space.
+
+        Returns:
+            concurrent.futures.Future: Resolves with the delivery count once every subscriber has handled the event.
+        """
+        if self.loop is None:
+            raise RuntimeError("Integration event bus is not running")
+        completion: concurrent.futures.Future = concurrent.futures.Future()
+        if not self._routed(event):
+            self._count(published=1, unrouted=1)
+            completion.set_result(0)
+            return completion
+
+        def _chain(done: asyncio.Future) -> None:
+            if done.cancelled():
+                completion.cancel()
+            else:
+                completion.set_result(done.result())
+
+        if self._on_loop():
+            self.publish_nowait(event).add_done_callback(_chain)
+            return completion
+
+        async def _publish() -> None:
+            done = await self.publish(event)
+            done.add_done_callback(_chain)
+
+        asyncio.run_coroutine_threadsafe(_publish(), self.loop).result(timeout)
+        return completion
+
+    async def join(self) -> None:
+        """Wait until every subscriber queue has been drained."""
+        for subscriber in list(self.subscribers.values()):
+            if subscriber["queue"] is not None:
+                await subscriber["queue"].join()
+
+    def stop(self) -> None:
+        """Cancel subscriber consumers and stop the background loop, if any."""
+        if self.loop is None:
+            return
+        loop = self.loop
+        if self._on_loop():
+            self._cancel_consumers()
+        else:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result()
+        if self._thread is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            self._thread.join()
+            loop.close()
+            self._thread = None
+        self.loop = None
+
+    async def _shutdown(self) -> None:
+        """Cancel subscriber consumers and wait for them to finish."""
+        tasks = self._cancel_consumers()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _cancel_consumers(self) -> List[asyncio.Task]:
+        """Cancel every subscriber consumer task and drop its queue."""
+        tasks = []
+        for subscriber in self.subscribers.values():
+            if subscriber["task"] is not None:
+                subscriber["task"].cancel()
+                tasks.append(subscriber["task"])
+                subscriber["task"] = None
+                subscriber["queue"] = None
+        return tasks
+
+    def _route(self, event: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Resolve the subscribers for an event's target modules."""
+        self._count(published=1)
+        seen = set()
+        subscribers = []
+        for module in list(event.get("target_modules", [])) + [WILDCARD]:
+            for subscriber in self.routes.get(module, ()):
+                if subscriber["id"] not in seen and subscriber["queue"] is not None:
+                    seen.add(subscriber["id"])
+                    subscribers.append(subscriber)
+        if not subscribers:
+            self._count(unrouted=1)
+        return subscribers
+
+    def _routed(self, event: Dict[str, Any]) -> bool:
+        """Check whether any subscriber listens to an event's target modules."""
+        return WILDCARD in self.routes or any(module in self.routes for module in event.get("target_modules", ()))
+
+    def _track(self, subscribers: List[Dict[str, Any]]):
+        """Create the completion future and shared pending counter for one event."""
+        done = self.loop.create_future()
+        pending = {"remaining": len(subscribers), "delivered": 0, "done": done}
+        if not subscribers:
+            done.set_result(0)
+        return done, pending
+
+    def _start_consumer(self, subscriber: Dict[str, Any]) -> None:
+        """Create the bounded queue and consumer task for a subscriber."""
+        if subscriber["task"] is not None:
+            return
+        subscriber["queue"] = asyncio.Queue(maxsize=subscriber["max_queue_size"])
+        subscriber["task"] = self.loop.create_task(self._consume(subscriber))
+
+    async def _consume(self, subscriber: Dict[str, Any]) -> None:
+        """Deliver queued events to a subscriber handler in order."""
+        queue = subscriber["queue"]
+        while True:
+            event, pending = await queue.get()
+            try:
+                result = subscriber["handler"](event)
+                if inspect.isawaitable(result):
+                    await result
+                pending["delivered"] += 1
+                self._count(delivered=1)
+            except Exception as e:
+                self._count(failed=1)
+                self.logger.error("Subscriber %s failed handling event %s: %s", subscriber["id"], event.get("entity_id"), e)
+            finally:
+                queue.task_done()
+                pending["remaining"] -= 1
+                if pending["remaining"] == 0 and not pending["done"].done():
+                    pending["done"].set_result(pending["delivered"])
+
+    def _on_loop(self) -> bool:
+        """Check whether the caller is running on the bus loop."""
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    def _run_on_loop(self, callback: Callable, *args: Any) -> Any:
+        """Run a callback on the bus loop from any thread and wait for its result."""
+        if self._on_loop():
+            return callback(*args)
+
+        async def _call() -> Any:
+            return callback(*args)
+
+        return asyncio.run_coroutine_threadsafe(_call(), self.loop).result()
+
+    def _count(self, **increments: int) -> None:
+        """Add to the stats counters; producers on any thread update them."""
+        with self._stats_lock:
+            for name, increment in increments.items():
+                self.stats[name] += increment
@@ -0,0 +1,140 @@
+"""
+fanout.py
+Concurrent fan-out with per-task deadlines for Rhee_AI_Assistant.
+Runs independent module syncs on a shared thread pool and returns partial results with a
+status per module instead of failing or blocking the whole operation on one slow module.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Any, Callable, Dict, Mapping, Optional
+
+OK = "ok"
+ERROR = "error"
+TIMEOUT = "timeout"
+
+class FanOutReport:
+    """Partial results and per-task status of one fan-out."""
+
+    def __init__(self):
+        self.results: Dict[str, Any] = {}
+        self.status: Dict[str, str] = {}
+        self.errors: Dict[str, str] = {}
+        self.durations_ms: Dict[str, float] = {}
+        self.elapsed_ms = 0.0
+
+    def summary(self) -> Dict[str, int]:
+        """Count tasks per status."""
+        counts: Dict[str, int] = {}
+        for status in self.status.values():
+            counts[status] = counts.get(status, 0) + 1
+        return counts
+
+class FanOutExecutor:
+    """Thread-pool fan-out where every task has its own deadline."""
+
+    def __init__(self, max_workers: int = 16, default_timeout: Optional[float] = 5.0):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers (int): Worker threads shared by every fan-out.
+            default_timeout (float, optional): Seconds a task may take, measured from the
+                start of the fan-out; None waits indefinitely.
+        """
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def run(self, tasks: Mapping[str, Callable[[], Any]], timeouts: Optional[Mapping[str, float]] = None,
+            default_timeout: Optional[float] = None) -> FanOutReport:
+        """
+        Run tasks concurrently and collect whatever finishes before its deadline.
+
+        Tasks that miss their deadline are reported as "timeout"; if they have not started
+        yet they are cancelled, otherwise they finish in the background and their result is dropped.
+
+        Args:
+            tasks (Mapping[str, Callable]): Zero-argument callables keyed by module id.
+            timeouts (Mapping[str, float], optional): Per-module deadlines in seconds.
+            default_timeout (float, optional): Deadline for modules without an entry; defaults to the executor's.
+
+        Returns:
+            FanOutReport: Results of successful tasks and a status for every task, plus the run
+                time of every task that did not time out.
+        """
+        report = FanOutReport()
+        start = time.monotonic()
+        pool = self._executor()
+        durations: Dict[str, float] = {}
+        futures: Dict[str, Future] = {name: pool.submit(self._timed, name, task, durations) for name, task in tasks.items()}
+        fallback = self.default_timeout if default_timeout is None else default_timeout
+        deadlines = {}
+        for name in futures:
+            timeout = (timeouts or {}).get(name, fallback)
+            deadlines[name] = None if timeout is None else start + timeout
+        for name in sorted(futures, key=lambda n: float("inf") if deadlines[n] is None else deadlines[n]):
+            future = futures[name]
+            remaining = None if deadlines[name] is None else max(0.0, deadlines[name] - time.monotonic())
+            try:
+                report.results[name] = future.result(timeout=remaining)
+                report.status[name] = OK
+            except FutureTimeout:
+                future.cancel()
+                report.status[name] = TIMEOUT
+            except Exception as e:
+                report.status[name] = ERROR
+                report.errors[name] = str(e)
+        report.durations_ms = {name: durations[name] for name, status in report.status.items()
+                               if status != TIMEOUT and name in durations}
+        report.elapsed_ms = (time.monotonic() - start) * 1000
+        return report
+
+    @staticmethod
+    def run_serial(tasks: Mapping[str, Callable[[], Any]]) -> FanOutReport:
+        """
+        Run tasks one after another in the calling thread, reporting them like run().
+
+        Args:
+            tasks (Mapping[str, Callable]): Zero-argument callables keyed by module id.
+
+        Returns:
+            FanOutReport: Results of successful tasks and a status and run time for every task.
+        """
+        report = FanOutReport()
+        start = time.monotonic()
+        for name, task in tasks.items():
+            started = time.monotonic()
+            try:
+                report.results[name] = task()
+                report.status[name] = OK
+            except Exception as e:
+                report.status[name] = ERROR
+                report.errors[name] = str(e)
+            report.durations_ms[name] = (time.monotonic() - started) * 1000
+        report.elapsed_ms = (time.monotonic() - start) * 1000
+        return report
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads; the pool is recreated on next use."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    @staticmethod
+    def _timed(name: str, task: Callable[[], Any], durations: Dict[str, float]) -> Any:
+        started = time.monotonic()
+        try:
+            return task()
+        finally:
+            durations[name] = (time.monotonic() - started) * 1000
+
+    def _executor(self) -> ThreadPoolExecutor:
+        # Concurrent first calls must not each build a pool and leak all but one
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="fanout")
+            return self._pool
@@ -0,0 +1,161 @@
+"""
+hot_log.py
+Structured hot-path logging for synthesizer, nexus and orchestrator modules in Rhee_AI_Assistant.
+In deferred mode INFO/DEBUG records are sampled per module and appended unrendered to an
+in-memory ring buffer that can be dumped on demand; warnings and errors always reach logging.
+"""
+
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+DIRECT = "direct"
+DEFERRED = "deferred"
+
+class HotLogConfig:
+    """Process-wide hot-path logging settings, switchable at runtime."""
+
+    def __init__(self):
+        self.mode = DIRECT
+        self.default_rate = 1.0
+        self.sample_rates: Dict[str, float] = {}
+        self.buffer: Deque[Tuple[float, int, str, str, Tuple[Any, ...]]] = deque(maxlen=65536)
+        self.version = 0
+
+    def rate_for(self, name: str) -> float:
+        """Resolve the sampling rate for a logger name by longest matching module prefix."""
+        best, rate = -1, self.default_rate
+        for prefix, prefix_rate in self.sample_rates.items():
+            if (name == prefix or name.startswith(prefix + ".")) and len(prefix) > best:
+                best, rate = len(prefix), prefix_rate
+        return rate
+
+_config = HotLogConfig()
+_loggers: Dict[str, "HotPathLogger"] = {}
+
+def configure(mode: Optional[str] = None, sample_rates: Optional[Dict[str, float]] = None,
+              default_rate: Optional[float] = None, buffer_size: Optional[int] = None) -> None:
+    """
+    Reconfigure hot-path logging; takes effect immediately for every module.
+
+    Args:
+        mode (str, optional): "direct" to log through logging as before, "deferred" to sample into the ring buffer.
+        sample_rates (Dict[str, float], optional): Per-module INFO/DEBUG sampling rates keyed by module prefix
+            (e.g., {"transinfinite_reality_memory": 0.01}); replaces the current table.
+        default_rate (float, optional): Sampling rate for modules without an entry.
+        buffer_size (int, optional): Ring buffer capacity in records; keeps the newest records.
+    """
+    if mode is not None:
+        if mode not in (DIRECT, DEFERRED):
+            raise ValueError(f"Unknown hot log mode: {mode}")
+        _config.mode = mode
+    if sample_rates is not None:
+        _config.sample_rates = dict(sample_rates)
+    if default_rate is not None:
+        _config.default_rate = default_rate
+    if buffer_size is not None:
+        _config.buffer = deque(_config.buffer, maxlen=buffer_size)
+    _config.version += 1
+
+def get_config() -> HotLogConfig:
+    """Return the process-wide hot-path logging settings."""
+    return _config
+
+def get_logger(name: str) -> "HotPathLogger":
+    """
+    Return the hot-path logger for a module, creating it on first use.
+
+    Args:
+        name (str): Logger name, normally the module __name__.
+
+    Returns:
+        HotPathLogger: Shared logger for the module.
+    """
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = _loggers.setdefault(name, HotPathLogger(name))
+    return logger
+
+def dump(limit: Optional[int] = None, level: int = logging.NOTSET) -> List[str]:
+    """
+    Render buffered records; arguments are only formatted here.
+
+    Args:
+        limit (int, optional): Render only the newest records.
+        level (int): Minimum level to include.
+
+    Returns:
+        List[str]: Rendered records, oldest first.
+    """
+    records = list(_config.buffer)
+    if limit is not None:
+        records = records[-limit:]
+    lines = []
+    for created, record_level, name, msg, args in records:
+        if record_level < level:
+            continue
+        try:
+            message = msg % args if args else msg
+        except Exception as e:
+            message = f"{msg} {args!r} (format error: {e})"
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(created))
+        lines.append(f"{stamp} - {logging.getLevelName(record_level)} - {name} - {message}")
+    return lines
+
+def clear() -> None:
+    """Drop every buffered record."""
+    _config.buffer.clear()
+
+class HotPathLogger:
+    """Drop-in replacement for a module logger with per-module sampling and deferred rendering."""
+
+    def __init__(self, name: str):
+        """
+        Initialize the hot-path logger.
+
+        Args:
+            name (str): Logger name.
+        """
+        self.name = name
+        self.logger = logging.getLogger(name)
+        self._version = -1
+        self._every = 1
+        self._count = 0
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.logger, attr)
+
+    def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        self._hot(logging.DEBUG, msg, args, kwargs)
+
+    def info(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        self._hot(logging.INFO, msg, args, kwargs)
+
+    def warning(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        self._always(logging.WARNING, msg, args, kwargs)
+
+    def error(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        self._always(logging.ERROR, msg, args, kwargs)
+
+    def critical(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        self._always(logging.CRITICAL, msg, args, kwargs)
+
+    def _hot(self, level: int, msg: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        if _config.mode == DIRECT:
+            self.logger.log(level, msg, *args, stacklevel=3, **kwargs)
+            return
+        if self._version != _config.version:
+            rate = _config.rate_for(self.name)
+            self._every = 0 if rate <= 0 else max(1, round(1 / rate))
+            self._version = _config.version
+        if self._every == 0:
+            return
+        self._count += 1
+        if self._count % self._every == 0:
+            _config.buffer.append((time.time(), level, self.name, msg, args))
+
+    def _always(self, level: int, msg: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        if _config.mode == DEFERRED:
+            _config.buffer.append((time.time(), level, self.name, msg, args))
+        self.logger.log(level, msg, *args, stacklevel=3, **kwargs)
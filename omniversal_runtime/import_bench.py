@@ -0,0 +1,101 @@
+"""
+import_bench.py
+Import-time benchmark for the top-level packages of Rhee_AI_Assistant.
+Imports each package in a fresh interpreter under `-X importtime` and reports its total
+cost with a breakdown by the top-level package of every module it pulled in.
+
+Usage:
+    python -m omniversal_runtime.import_bench [package ...] [--top N] [--budget-ms MS]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+from omniversal_runtime.routing_table import EXCLUDED_PACKAGES, REPO_ROOT
+
+def discover_packages(root: str = REPO_ROOT) -> List[str]:
+    """Return the top-level packages under root, excluding tests."""
+    return sorted(
+        entry for entry in os.listdir(root)
+        if entry not in EXCLUDED_PACKAGES and os.path.isfile(os.path.join(root, entry, "__init__.py"))
+    )
+
+def parse_importtime(output: str) -> List[Dict[str, Any]]:
+    """
+    Parse `-X importtime` output.
+
+    Args:
+        output (str): Interpreter stderr.
+
+    Returns:
+        List[Dict[str, Any]]: One record per imported module with self_us, cumulative_us and module.
+    """
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|", 2)
+        records.append({"self_us": int(self_us), "cumulative_us": int(cumulative_us), "module": module.strip()})
+    return records
+
+def measure(package: str, python: str = sys.executable, root: str = REPO_ROOT) -> Dict[str, Any]:
+    """
+    Import a package in a fresh interpreter and break down its import cost.
+
+    Args:
+        package (str): Package to import.
+        python (str): Interpreter to run.
+        root (str): Directory the package is imported from.
+
+    Returns:
+        Dict[str, Any]: package, ok, error, total_us and breakdown (self time per top-level package).
+    """
+    result = subprocess.run([python, "-X", "importtime", "-c", f"import {package}"],
+                            cwd=root, capture_output=True, text=True)
+    records = parse_importtime(result.stderr)
+    breakdown: Dict[str, int] = {}
+    for record in records:
+        top = record["module"].split(".", 1)[0]
+        breakdown[top] = breakdown.get(top, 0) + record["self_us"]
+    total = next((record["cumulative_us"] for record in records if record["module"] == package), 0)
+    error = None
+    if result.returncode != 0:
+        error = (result.stderr.strip().splitlines() or ["unknown error"])[-1]
+    return {"package": package, "ok": result.returncode == 0, "error": error, "total_us": total,
+            "breakdown": dict(sorted(breakdown.items(), key=lambda item: -item[1]))}
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmark and print a per-package report.
+
+    Args:
+        argv (List[str], optional): Command-line arguments.
+
+    Returns:
+        int: 1 if a package exceeded the budget, else 0.
+    """
+    parser = argparse.ArgumentParser(description="Measure the import time of each top-level package.")
+    parser.add_argument("packages", nargs="*", help="Packages to measure (default: every top-level package)")
+    parser.add_argument("--top", type=int, default=5, help="Breakdown entries shown per package")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail if any package takes longer to import")
+    args = parser.parse_args(argv)
+
+    results = sorted((measure(package) for package in args.packages or discover_packages()), key=lambda r: -r["total_us"])
+    over_budget = []
+    for result in results:
+        total_ms = result["total_us"] / 1000
+        status = "ok" if result["ok"] else f"FAILED ({result['error']})"
+        print(f"{result['package']:<48} {total_ms:9.2f} ms  {status}")
+        for name, self_us in list(result["breakdown"].items())[:args.top]:
+            print(f"    {name:<44} {self_us / 1000:9.2f} ms")
+        if args.budget_ms is not None and total_ms > args.budget_ms:
+            over_budget.append(result["package"])
+    if over_budget:
+        print(f"Over the {args.budget_ms:.1f} ms import budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
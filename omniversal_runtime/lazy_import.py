@@ -0,0 +1,74 @@
+"""
+lazy_import.py
+Lazy package exports (PEP 562) for Rhee_AI_Assistant.
+Package __init__ modules declare what they export and attach a module-level __getattr__
+that imports a submodule or class only on first attribute access.
+"""
+
+import importlib
+import logging
+import pkgutil
+import re
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+def _module_name(attribute: str) -> str:
+    """Map an exported class name to its conventional module name (e.g., TemporalIntegrationNexus -> temporal_integration_nexus)."""
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", attribute).lower()
+
+def attach(package: str, exports: Union[Iterable[str], Dict[str, str]]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the PEP 562 __getattr__ and __dir__ hooks for a package.
+
+    Usage in a package __init__:
+        __getattr__, __dir__ = attach(__name__, __all__)
+
+    Args:
+        package (str): Package name, normally __name__.
+        exports (Iterable[str] or Dict[str, str]): Exported names. A name resolves to the
+            submodule of that name, else to the class of that name in its conventional
+            module, else to the first submodule defining it. A dict maps names to explicit
+            relative targets, ".module" or ".module:attribute".
+
+    Returns:
+        Tuple[Callable, Callable]: The __getattr__ and __dir__ functions for the package.
+    """
+    targets = dict(exports) if isinstance(exports, dict) else {name: None for name in exports}
+
+    def __getattr__(name: str) -> Any:
+        if name not in targets:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = _resolve(package, name, targets[name])
+        setattr(sys.modules[package], name, value)
+        logger.debug("Lazily loaded %s.%s", package, name)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(targets))
+
+    return __getattr__, __dir__
+
+def _resolve(package: str, name: str, target: Union[str, None]) -> Any:
+    if target is not None:
+        module_name, _, attribute = target.partition(":")
+        module = importlib.import_module(module_name, package)
+        return getattr(module, attribute) if attribute else module
+    try:
+        return importlib.import_module(f".{name}", package)
+    except ModuleNotFoundError as e:
+        if e.name != f"{package}.{name}":
+            raise
+    candidates = [_module_name(name)]
+    candidates += [info.name for info in pkgutil.iter_modules(sys.modules[package].__path__) if info.name not in candidates]
+    for candidate in candidates:
+        try:
+            module = importlib.import_module(f".{candidate}", package)
+        except ModuleNotFoundError as e:
+            if e.name == f"{package}.{candidate}":
+                continue
+            raise
+        if hasattr(module, name):
+            return getattr(module, name)
+    raise AttributeError(f"module {package!r} has no attribute {name!r}")
@@ -0,0 +1,228 @@
+"""
+load_replay.py
+Operation-log replay for load testing the Rhee_AI_Assistant orchestrator.
+Replays recorded operations from a JSONL file at a fixed rate or concurrency against local
+stand-ins for Deepgram, OpenAI and ElevenLabs, and reports throughput, latency percentiles
+and the time spent in each module.
+
+Each line of the log is a JSON object:
+    {"operation_id": "op_1", "config": {...}, "operation_type": "synthesis", "session_id": "s1"}
+operation_id defaults to the line number and operation_type to "full_system"; a string
+config["audio_input"] is encoded to bytes.
+"""
+
+import json
+import math
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional
+from omniversal_runtime.admission import Overloaded
+
+DEFAULT_TRANSCRIPT = "Hello, how can I assist you today?"
+
+def load_operations(path: str, repeat: int = 1) -> List[Dict[str, Any]]:
+    """
+    Read a JSONL operation log.
+
+    Args:
+        path (str): Log file.
+        repeat (int): Times to replay the log; later rounds suffix operation ids with "#round".
+
+    Returns:
+        List[Dict[str, Any]]: Operations with operation_id, config, operation_type and session_id.
+
+    Raises:
+        ValueError: If a line is not a JSON object.
+    """
+    records = []
+    with open(path, encoding="utf-8") as log:
+        for number, line in enumerate(log, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError(f"{path}:{number}: expected a JSON object")
+            config = dict(record.get("config", {}))
+            if isinstance(config.get("audio_input"), str):
+                config["audio_input"] = config["audio_input"].encode()
+            records.append({
+                "operation_id": str(record.get("operation_id", f"op_{number}")),
+                "config": config,
+                "operation_type": record.get("operation_type", "full_system"),
+                "session_id": record.get("session_id")
+            })
+    return [dict(record, operation_id=record["operation_id"] if round_ == 0 else f"{record['operation_id']}#{round_}")
+            for round_ in range(repeat) for record in records]
+
+class StubDeepgram:
+    """Deepgram stand-in; the transcript is the audio buffer decoded as text."""
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.latency_ms = latency_ms
+        self.transcription = SimpleNamespace(prerecorded=self.prerecorded)
+        self.projects = SimpleNamespace(list=lambda: {"projects": [{"project_id": "stub"}]})
+
+    def prerecorded(self, source: Dict[str, Any], options: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a Deepgram-shaped transcription response."""
+        _pause(self.latency_ms)
+        transcript = bytes(source.get("buffer") or b"").decode("utf-8", "replace") or DEFAULT_TRANSCRIPT
+        return {"results": {"channels": [{"alternatives": [{"transcript": transcript}]}]}}
+
+class StubOpenAI:
+    """OpenAI stand-in answering chat completions with a canned reply."""
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.latency_ms = latency_ms
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+        self.models = SimpleNamespace(list=lambda: SimpleNamespace(data=[SimpleNamespace(id="gpt-4o")]))
+
+    def create(self, model: str, messages: List[Dict[str, str]], **kwargs: Any) -> Any:
+        """Return an OpenAI-shaped chat completion."""
+        _pause(self.latency_ms)
+        content = f"Stub {model} response to: {messages[-1]['content']}"
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+class StubElevenLabs:
+    """ElevenLabs stand-in returning the text as audio bytes."""
+
+    def __init__(self, latency_ms: float = 0.0):
+        self.latency_ms = latency_ms
+        self.voices = SimpleNamespace(get_all=lambda: SimpleNamespace(voices=[]))
+
+    def generate(self, text: str, **kwargs: Any) -> bytes:
+        """Return placeholder audio for the text."""
+        _pause(self.latency_ms)
+        return text.encode()
+
+def stub_voice_clients(latency_ms: float = 0.0) -> Dict[str, Any]:
+    """
+    Build local speech, language and synthesis clients for VoiceCore.
+
+    Args:
+        latency_ms (float): Simulated latency of every stub call.
+
+    Returns:
+        Dict[str, Any]: stt, llm and tts keyword arguments for VoiceCore.
+    """
+    return {"stt": StubDeepgram(latency_ms), "llm": StubOpenAI(latency_ms), "tts": StubElevenLabs(latency_ms)}
+
+def _pause(latency_ms: float) -> None:
+    if latency_ms > 0:
+        time.sleep(latency_ms / 1000)
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Return the nearest-rank percentile of an ascending list, or 0.0 if it is empty."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+class ReplayReport:
+    """Latencies, failures and module time of one replay."""
+
+    def __init__(self):
+        self.latencies_ms: List[float] = []
+        self.failed: List[str] = []
+        self.shed: List[str] = []
+        self.elapsed_ms = 0.0
+        self.module_timings: Dict[str, Dict[str, float]] = {}
+
+    def summary(self) -> Dict[str, Any]:
+        """Return throughput and latency percentiles as a plain dict."""
+        latencies = sorted(self.latencies_ms)
+        return {
+            "operations": len(latencies),
+            "failed": len(self.failed),
+            "shed": len(self.shed),
+            "elapsed_ms": self.elapsed_ms,
+            "ops_per_second": len(latencies) / (self.elapsed_ms / 1000) if self.elapsed_ms > 0 else 0.0,
+            "p50_ms": percentile(latencies, 50),
+            "p95_ms": percentile(latencies, 95),
+            "p99_ms": percentile(latencies, 99),
+            "max_ms": latencies[-1] if latencies else 0.0
+        }
+
+    def module_breakdown(self, top: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return per-module call counts and time, most expensive first."""
+        rows = sorted(({"module": module, **timing} for module, timing in self.module_timings.items()),
+                      key=lambda row: -row["total_ms"])
+        return rows if top is None else rows[:top]
+
+    def format(self, top: int = 10) -> str:
+        """Render the report for the terminal."""
+        summary = self.summary()
+        lines = [
+            f"operations {summary['operations']}  failed {summary['failed']}  shed {summary['shed']}  elapsed {summary['elapsed_ms']:.1f} ms  "
+            f"throughput {summary['ops_per_second']:.1f} ops/s",
+            f"latency p50 {summary['p50_ms']:.2f} ms  p95 {summary['p95_ms']:.2f} ms  "
+            f"p99 {summary['p99_ms']:.2f} ms  max {summary['max_ms']:.2f} ms"
+        ]
+        rows = self.module_breakdown(top)
+        width = max((len(row["module"]) for row in rows), default=0)
+        for row in rows:
+            lines.append(f"    {row['module']:<{width}} {row['calls']:8.0f} calls {row['total_ms']:10.2f} ms")
+        return "\n".join(lines)
+
+def replay(orchestrator: Any, operations: Iterable[Dict[str, Any]], rate: Optional[float] = None, concurrency: int = 1,
+           **options: Any) -> ReplayReport:
+    """
+    Replay operations against an orchestrator.
+
+    With a rate, operation i is due at i / rate seconds and its latency runs from that moment,
+    so time spent waiting for a free worker counts against it. Without a rate, each of the
+    concurrency workers issues its next operation as soon as the previous one returns.
+    Operations shed by admission control are listed in shed and left out of the latencies.
+    Module profiling is switched on and the orchestrator's module timings are reset.
+
+    Args:
+        orchestrator (Any): OmniversalIntegrationOrchestrator to drive.
+        operations (Iterable[Dict]): Operations from load_operations.
+        rate (float, optional): Target operations per second.
+        concurrency (int): Worker threads issuing operations.
+        **options: parallel, staged or force, passed to orchestrate_system.
+
+    Returns:
+        ReplayReport: Throughput, latencies and per-module time.
+    """
+    operations = list(operations)
+    report = ReplayReport()
+    orchestrator.profile_modules = True
+    orchestrator.module_timings.clear()
+    lock = threading.Lock()
+    cursor = iter(range(len(operations)))
+    start = time.monotonic()
+
+    def worker() -> None:
+        while True:
+            with lock:
+                index = next(cursor, None)
+            if index is None:
+                return
+            operation = operations[index]
+            if rate:
+                due = start + index / rate
+                _pause((due - time.monotonic()) * 1000)
+            else:
+                due = time.monotonic()
+            try:
+                state = orchestrator.orchestrate_system(operation["operation_id"], operation["config"], operation["operation_type"],
+                                                        operation["session_id"], **options)
+            except Overloaded:
+                with lock:
+                    report.shed.append(operation["operation_id"])
+                continue
+            latency_ms = (time.monotonic() - due) * 1000
+            with lock:
+                report.latencies_ms.append(latency_ms)
+                if not state:
+                    report.failed.append(operation["operation_id"])
+
+    threads = [threading.Thread(target=worker, name=f"replay_{n}", daemon=True) for n in range(max(1, concurrency))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    report.elapsed_ms = (time.monotonic() - start) * 1000
+    report.module_timings = {module: dict(timing) for module, timing in orchestrator.module_timings.items()}
+    return report
@@ -0,0 +1,227 @@
+"""
+manifest.py
+Module manifest and lazy instance registry for Rhee_AI_Assistant.
+Scans the packages once without importing them, caches the component-to-class manifest
+in the per-user cache directory keyed by a fingerprint of the scanned files, and
+instantiates each component at most once on first use.
+"""
+
+import ast
+import hashlib
+import importlib
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional
+from omniversal_runtime.routing_table import EXCLUDED_PACKAGES, REPO_ROOT
+from omniversal_runtime.hot_log import get_logger
+
+MANIFEST_VERSION = 2
+SKIPPED_PACKAGES = EXCLUDED_PACKAGES | {"omniversal_runtime"}
+
+logger = get_logger(__name__)
+
+def default_cache_path(root: str = REPO_ROOT) -> str:
+    """
+    Resolve where the manifest of a source tree is cached, outside the tree itself.
+
+    RHEE_MODULE_MANIFEST overrides the location; otherwise the file lives under
+    $XDG_CACHE_HOME (default ~/.cache)/rhee_ai_assistant, named after a hash of root.
+
+    Args:
+        root (str): Repository root.
+
+    Returns:
+        str: Manifest cache file.
+    """
+    override = os.environ.get("RHEE_MODULE_MANIFEST")
+    if override:
+        return override
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    tree = hashlib.blake2b(os.path.abspath(root).encode(), digest_size=8).hexdigest()
+    return os.path.join(cache_home, "rhee_ai_assistant", f"module_manifest-{tree}.json")
+
+DEFAULT_CACHE_PATH = default_cache_path()
+
+def _source_files(root: str) -> List[str]:
+    files = []
+    for package in sorted(os.listdir(root)):
+        package_dir = os.path.join(root, package)
+        if package in SKIPPED_PACKAGES or not os.path.isfile(os.path.join(package_dir, "__init__.py")):
+            continue
+        for directory, dirs, names in os.walk(package_dir):
+            dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+            files.extend(os.path.join(directory, name) for name in sorted(names) if name.endswith(".py"))
+    return files
+
+def fingerprint(root: str = REPO_ROOT) -> str:
+    """
+    Fingerprint the package sources by path, size and modification time.
+
+    Args:
+        root (str): Repository root.
+
+    Returns:
+        str: Hex fingerprint; changes whenever a source file is added, removed or edited.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in _source_files(root):
+        stat = os.stat(path)
+        digest.update(f"{os.path.relpath(path, root)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+def _sync_topics(tree: ast.Module) -> List[str]:
+    """Read a module's literal SYNC_TOPICS declaration, if any."""
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(isinstance(target, ast.Name) and target.id == "SYNC_TOPICS" for target in node.targets):
+            try:
+                return [str(topic) for topic in ast.literal_eval(node.value)]
+            except ValueError:
+                return []
+    return []
+
+def build_manifest(root: str = REPO_ROOT) -> Dict[str, Any]:
+    """
+    Scan the packages and map every component id to its classes, without importing anything.
+
+    Component ids follow the "package.component" form used by the orchestrator and the
+    routing table (e.g., "omnitemporal_coherence_lattice.temporal_integration_nexus").
+    The sync topics a component declares in SYNC_TOPICS are recorded as its subscriptions.
+
+    Args:
+        root (str): Repository root.
+
+    Returns:
+        Dict[str, Any]: version, fingerprint, modules (id -> module, class, classes, topics) and
+            unparsable files.
+    """
+    modules: Dict[str, Dict[str, Any]] = {}
+    topics: Dict[str, List[str]] = {}
+    errors: List[str] = []
+    for path in _source_files(root):
+        relative = os.path.relpath(path, root)[:-3].split(os.sep)
+        if relative[-1] == "__init__":
+            continue
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                tree = ast.parse(f.read(), filename=path)
+        except (SyntaxError, UnicodeDecodeError):
+            errors.append(os.path.relpath(path, root))
+            continue
+        component = ".".join(relative[:2])
+        declared = topics.setdefault(component, [])
+        declared.extend(topic for topic in _sync_topics(tree) if topic not in declared)
+        classes = [node.name for node in tree.body if isinstance(node, ast.ClassDef)]
+        if not classes or component in modules:
+            continue
+        expected = relative[-1].replace("_", "")
+        primary = next((name for name in classes if name.lower() == expected), classes[0])
+        modules[component] = {"module": ".".join(relative), "class": primary, "classes": classes}
+    for component, entry in modules.items():
+        entry["topics"] = sorted(topics[component])
+    return {"version": MANIFEST_VERSION, "fingerprint": fingerprint(root), "modules": modules, "errors": errors}
+
+def load_manifest(root: str = REPO_ROOT, cache_path: Optional[str] = DEFAULT_CACHE_PATH, refresh: bool = False) -> Dict[str, Any]:
+    """
+    Load the cached manifest, regenerating it when the sources changed.
+
+    Args:
+        root (str): Repository root.
+        cache_path (str, optional): Manifest cache file, by default in the per-user cache
+            directory (see default_cache_path); None disables the disk cache.
+        refresh (bool): Rebuild even if the cache is current.
+
+    Returns:
+        Dict[str, Any]: Module manifest.
+    """
+    if cache_path and not refresh and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("version") == MANIFEST_VERSION and cached.get("fingerprint") == fingerprint(root):
+                return cached
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable module manifest %s: %s", cache_path, e)
+    manifest = build_manifest(root)
+    if cache_path:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("Could not cache module manifest at %s: %s", cache_path, e)
+    logger.info("Generated module manifest with %d components", len(manifest["modules"]))
+    return manifest
+
+class ModuleRegistry:
+    """Resolves manifest components to classes and live instances, importing each at most once."""
+
+    def __init__(self, manifest: Dict[str, Any]):
+        """
+        Initialize the registry.
+
+        Args:
+            manifest (Dict[str, Any]): Module manifest from load_manifest.
+        """
+        self.manifest = manifest
+        self.modules: Dict[str, Dict[str, Any]] = manifest["modules"]
+        self.classes: Dict[str, Any] = {}
+        self.instances: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    def __contains__(self, module_id: str) -> bool:
+        return module_id in self.modules
+
+    def module_ids(self) -> List[str]:
+        """Return every component id in the manifest."""
+        return sorted(self.modules)
+
+    def get_class(self, module_id: str) -> Any:
+        """
+        Return the primary class of a component, importing its module on first use.
+
+        Args:
+            module_id (str): Component id.
+
+        Returns:
+            Any: The class.
+
+        Raises:
+            KeyError: If the component is not in the manifest.
+        """
+        cls = self.classes.get(module_id)
+        if cls is None:
+            entry = self.modules[module_id]
+            with self._lock:
+                cls = self.classes.get(module_id)
+                if cls is None:
+                    cls = getattr(importlib.import_module(entry["module"]), entry["class"])
+                    self.classes[module_id] = cls
+        return cls
+
+    def instance(self, module_id: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Return the live instance of a component, constructing it on first use.
+
+        Constructor arguments only apply to the first call.
+
+        Args:
+            module_id (str): Component id.
+
+        Returns:
+            Any: Shared instance.
+        """
+        instance = self.instances.get(module_id)
+        if instance is None:
+            with self._lock:
+                instance = self.instances.get(module_id)
+                if instance is None:
+                    instance = self.get_class(module_id)(*args, **kwargs)
+                    self.instances[module_id] = instance
+        return instance
+
+    def loaded(self) -> List[str]:
+        """Return the component ids whose classes have been imported."""
+        return sorted(self.classes)
@@ -0,0 +1,64 @@
+"""
+micro_batch.py
+Micro-batching of orchestrator operations for Rhee_AI_Assistant.
+Groups bursts of small operations by operation type into bounded batches so each batch is
+pushed through the modules once, and records throughput statistics per batch.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+Operation = Tuple[str, Dict[str, Any], str]
+
+def micro_batches(operations: Iterable[Operation], max_batch_size: int = 256) -> List[Tuple[str, List[Operation]]]:
+    """
+    Group operations by operation type and split each group into batches.
+
+    Operation types keep the order in which they first appear, and operations keep their
+    order within a type.
+
+    Args:
+        operations (Iterable[Tuple[str, Dict, str]]): (operation_id, config, operation_type) tuples.
+        max_batch_size (int): Largest number of operations in one batch.
+
+    Returns:
+        List[Tuple[str, List]]: (operation_type, operations) per batch.
+
+    Raises:
+        ValueError: If max_batch_size is below 1.
+    """
+    if max_batch_size < 1:
+        raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+    groups: Dict[str, List[Operation]] = {}
+    for operation in operations:
+        groups.setdefault(operation[2], []).append(operation)
+    return [(operation_type, group[start:start + max_batch_size])
+            for operation_type, group in groups.items()
+            for start in range(0, len(group), max_batch_size)]
+
+class BatchStats:
+    """Size, timing and module sync counts of one micro-batch."""
+
+    def __init__(self, operation_type: str, size: int):
+        self.operation_type = operation_type
+        self.size = size
+        self.module_syncs = 0
+        self.failed_modules = 0
+        self.elapsed_ms = 0.0
+        self.shed: Optional[str] = None
+
+    @property
+    def ops_per_second(self) -> float:
+        """Operations completed per second of batch wall time."""
+        return self.size / (self.elapsed_ms / 1000) if self.elapsed_ms > 0 else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a plain dict."""
+        return {
+            "operation_type": self.operation_type,
+            "size": self.size,
+            "module_syncs": self.module_syncs,
+            "failed_modules": self.failed_modules,
+            "elapsed_ms": self.elapsed_ms,
+            "ops_per_second": self.ops_per_second,
+            "shed": self.shed
+        }
@@ -0,0 +1,232 @@
+"""
+retention.py
+Bounded retention for in-memory state in Rhee_AI_Assistant.
+Provides an LRU map with entry, byte and idle-TTL limits plus eviction callbacks, and a
+prefix-keyed policy table through which any stateful class opts its maps and state tables in.
+"""
+
+import sys
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, MutableMapping, Optional, Tuple
+from omniversal_runtime.clock import monotonic_ns
+
+EXPIRED = "expired"
+CAPACITY = "capacity"
+
+EvictionCallback = Callable[[Any, Any, str], None]
+
+def approximate_size(value: Any, depth: int = 4) -> int:
+    """
+    Estimate the memory held by a value, following containers a few levels deep.
+
+    Args:
+        value (Any): Value to measure.
+        depth (int): Maximum container nesting followed.
+
+    Returns:
+        int: Approximate size in bytes.
+    """
+    size = sys.getsizeof(value)
+    if depth <= 0:
+        return size
+    if isinstance(value, dict):
+        size += sum(approximate_size(k, depth - 1) + approximate_size(v, depth - 1) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(approximate_size(item, depth - 1) for item in value)
+    return size
+
+class BoundedMap(MutableMapping):
+    """Least-recently-used map with entry, byte and idle-TTL limits."""
+
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None,
+                 ttl: Optional[float] = None, on_evict: Optional[EvictionCallback] = None,
+                 sizer: Callable[[Any], int] = approximate_size):
+        """
+        Initialize the bounded map.
+
+        Args:
+            max_entries (int, optional): Maximum number of entries.
+            max_bytes (int, optional): Maximum estimated size of the stored values.
+            ttl (float, optional): Seconds an entry may go untouched before it expires.
+            on_evict (Callable, optional): Called as on_evict(key, value, reason) for every
+                entry dropped by a limit, e.g. to spill it to disk; reason is "capacity" or "expired".
+            sizer (Callable): Value size estimator, applied on write when max_bytes is set.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_ns = None if ttl is None else int(ttl * 1e9)
+        self.on_evict = on_evict
+        self.sizer = sizer
+        self.bytes = 0
+        self._data: "OrderedDict[Any, Tuple[Any, int, int]]" = OrderedDict()
+        self.stats: Dict[str, int] = {CAPACITY: 0, EXPIRED: 0, "hits": 0, "misses": 0}
+
+    def __getitem__(self, key: Any) -> Any:
+        if not self.touch(key):
+            self.stats["misses"] += 1
+            raise KeyError(key)
+        self.stats["hits"] += 1
+        return self._data[key][0]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        size = self.sizer(value) if self.max_bytes is not None else 0
+        previous = self._data.pop(key, None)
+        if previous is not None:
+            self.bytes -= previous[2]
+        self._data[key] = (value, monotonic_ns(), size)
+        self.bytes += size
+        self._enforce()
+
+    def __delitem__(self, key: Any) -> None:
+        self.bytes -= self._data.pop(key)[2]
+
+    def __contains__(self, key: object) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and not self._expired(entry)
+
+    def __iter__(self) -> Iterator[Any]:
+        self.expire()
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        self.expire()
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"BoundedMap({dict(self.items())!r})"
+
+    def touch(self, key: Any) -> bool:
+        """
+        Mark an entry as recently used.
+
+        Args:
+            key (Any): Entry key.
+
+        Returns:
+            bool: False if the key is absent or has just expired.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return False
+        if self._expired(entry):
+            self._evict(key, EXPIRED)
+            return False
+        if self.ttl_ns is not None:
+            self._data[key] = (entry[0], monotonic_ns(), entry[2])
+        self._data.move_to_end(key)
+        return True
+
+    def discard(self, key: Any) -> None:
+        """Remove an entry if present, without invoking the eviction callback."""
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[2]
+
+    def expire(self) -> int:
+        """
+        Drop every entry idle for longer than the TTL.
+
+        Returns:
+            int: Number of entries expired.
+        """
+        expired = 0
+        while self._data:
+            key, entry = next(iter(self._data.items()))
+            if not self._expired(entry):
+                break
+            self._evict(key, EXPIRED)
+            expired += 1
+        return expired
+
+    def _expired(self, entry: Tuple[Any, int, int]) -> bool:
+        return self.ttl_ns is not None and monotonic_ns() - entry[1] > self.ttl_ns
+
+    def _enforce(self) -> None:
+        self.expire()
+        while self._data and ((self.max_entries is not None and len(self._data) > self.max_entries)
+                              or (self.max_bytes is not None and self.bytes > self.max_bytes)):
+            self._evict(next(iter(self._data)), CAPACITY)
+
+    def _evict(self, key: Any, reason: str) -> None:
+        value, _, size = self._data.pop(key)
+        self.bytes -= size
+        self.stats[reason] += 1
+        if self.on_evict is not None:
+            self.on_evict(key, value, reason)
+
+class RetentionPolicy:
+    """Retention limits applied to one map or state table."""
+
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None,
+                 ttl: Optional[float] = None, on_evict: Optional[EvictionCallback] = None):
+        """
+        Initialize the retention policy.
+
+        Args:
+            max_entries (int, optional): Maximum number of entities kept.
+            max_bytes (int, optional): Maximum estimated size of the kept entities.
+            ttl (float, optional): Idle seconds before an entity expires.
+            on_evict (Callable, optional): Called as on_evict(key, value, reason) on eviction.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.on_evict = on_evict
+
+    def bounded(self, on_evict: Optional[EvictionCallback] = None,
+                sizer: Callable[[Any], int] = approximate_size) -> BoundedMap:
+        """Create a BoundedMap enforcing this policy."""
+        return BoundedMap(self.max_entries, self.max_bytes, self.ttl, on_evict or self.on_evict, sizer)
+
+_policies: Dict[str, RetentionPolicy] = {}
+
+def configure_retention(policies: Dict[str, RetentionPolicy]) -> None:
+    """
+    Set the process-wide retention policy table; applies to objects created afterwards.
+
+    Keys are prefixes of "module.Class.attribute" names, e.g.
+    "transinfinite_reality_memory.memory_integration_nexus.memory_integration_nexus.MemoryIntegrationNexus.memory_bridges",
+    "omniversal_integration_orchestrator" or "transinfinite_reality_memory"; the longest match wins.
+
+    Args:
+        policies (Dict[str, RetentionPolicy]): Policies keyed by name prefix; replaces the current table.
+    """
+    global _policies
+    _policies = dict(policies)
+
+def policy_for(owner: Any, attribute: str) -> Optional[RetentionPolicy]:
+    """
+    Resolve the retention policy for an attribute of a stateful object.
+
+    Args:
+        owner (Any): Object holding the state.
+        attribute (str): Attribute name (e.g., memory_bridges or state_table).
+
+    Returns:
+        Optional[RetentionPolicy]: Matching policy, or None to keep the state unbounded.
+    """
+    if not _policies:
+        return None
+    cls = type(owner)
+    name = f"{cls.__module__}.{cls.__name__}.{attribute}"
+    best, policy = -1, None
+    for prefix, candidate in _policies.items():
+        if (name == prefix or name.startswith(prefix + ".")) and len(prefix) > best:
+            best, policy = len(prefix), candidate
+    return policy
+
+def retained(owner: Any, attribute: str, default: Optional[RetentionPolicy] = None) -> MutableMapping:
+    """
+    Create the backing map for a stateful attribute: a plain dict unless a policy applies.
+
+    Args:
+        owner (Any): Object holding the state.
+        attribute (str): Attribute name.
+        default (RetentionPolicy, optional): Policy used when none is configured, for state
+            that is only a cache and must stay bounded.
+
+    Returns:
+        MutableMapping: BoundedMap under a retention policy, else an empty dict.
+    """
+    policy = policy_for(owner, attribute) or default
+    return {} if policy is None else policy.bounded()
@@ -0,0 +1,175 @@
+"""
+rng.py
+Seedable random streams for Rhee_AI_Assistant.
+Each subsystem draws from its own named stream, which pre-generates unit samples in
+NumPy blocks and hands them out one at a time or in bulk; reseeding makes runs reproducible.
+Streams are shared by every thread of a subsystem, so refills and draws are serialized;
+a seeded run replays a shared stream only when its draws happen in the same order, i.e. with
+serial sync. Draws made from fanned-out tasks should use a stream keyed by the entity they
+concern, whose sequence does not depend on how the tasks interleave.
+"""
+
+import random
+import threading
+import zlib
+from typing import Any, Dict, Hashable, List, Optional, Sequence
+from omniversal_runtime.retention import BoundedMap
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy installed
+    np = None
+
+# Keyed streams are small and numerous, so they refill in short blocks and only the most
+# recently used ones are kept; an evicted key restarts its sequence from the seed.
+KEYED_BLOCK_SIZE = 8
+MAX_KEYED_STREAMS = 4096
+
+class RandomStream:
+    """Block-buffered uniform sample stream for one subsystem or entity, safe to share between threads."""
+
+    def __init__(self, name: str, seed: Optional[int] = None, block_size: int = 1024):
+        """
+        Initialize the random stream.
+
+        Args:
+            name (str): Stream name, normally the owning module's __name__.
+            seed (int, optional): Master seed; None draws fresh entropy.
+            block_size (int): Number of unit samples generated per refill.
+        """
+        self.name = name
+        self.block_size = max(1, block_size)
+        self._lock = threading.Lock()
+        self.reseed(seed)
+
+    def reseed(self, seed: Optional[int]) -> None:
+        """
+        Restart the stream from a master seed, discarding buffered samples.
+
+        Args:
+            seed (int, optional): Master seed; None draws fresh entropy.
+        """
+        if np is not None:
+            entropy = None if seed is None else [seed, zlib.crc32(self.name.encode())]
+            generator = np.random.default_rng(np.random.SeedSequence(entropy))
+        else:
+            generator = random.Random(None if seed is None else f"{seed}:{self.name}")
+        with self._lock:
+            self._generator = generator
+            self._block: List[float] = []
+            self._pos = 0
+
+    def random(self) -> float:
+        """Return the next unit sample in [0, 1)."""
+        with self._lock:
+            if self._pos >= len(self._block):
+                self._block = self._draw(self.block_size)
+                self._pos = 0
+            value = self._block[self._pos]
+            self._pos += 1
+            return value
+
+    def uniform(self, low: float, high: float) -> float:
+        """Return a sample in [low, high], as random.uniform would."""
+        return low + (high - low) * self.random()
+
+    def randint(self, low: int, high: int) -> int:
+        """Return an integer in [low, high], as random.randint would."""
+        return low + min(int(self.random() * (high - low + 1)), high - low)
+
+    def choice(self, seq: Sequence[Any]) -> Any:
+        """Return a random element of a non-empty sequence, as random.choice would."""
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[min(int(self.random() * len(seq)), len(seq) - 1)]
+
+    def uniform_batch(self, low: float, high: float, count: int):
+        """
+        Return many samples in [low, high] with one vectorized draw.
+
+        Args:
+            low (float): Lower bound.
+            high (float): Upper bound.
+            count (int): Number of samples.
+
+        Returns:
+            numpy.ndarray or List[float]: Samples, in draw order.
+        """
+        with self._lock:
+            if np is not None:
+                return low + (high - low) * self._generator.random(count)
+            return [low + (high - low) * value for value in self._draw(count)]
+
+    def _draw(self, count: int) -> List[float]:
+        """Generate count unit samples; the caller holds the lock."""
+        if np is not None:
+            return self._generator.random(count).tolist()
+        return [self._generator.random() for _ in range(count)]
+
+class RandomStreams:
+    """Registry of named random streams sharing one master seed."""
+
+    def __init__(self, seed: Optional[int] = None, block_size: int = 1024):
+        """
+        Initialize the stream registry.
+
+        Args:
+            seed (int, optional): Master seed; None draws fresh entropy.
+            block_size (int): Samples generated per block refill.
+        """
+        self.seed_value = seed
+        self.block_size = block_size
+        self.streams: Dict[str, RandomStream] = {}
+        self.keyed = BoundedMap(max_entries=MAX_KEYED_STREAMS)
+        self._keyed_lock = threading.Lock()
+
+    def stream(self, name: str, key: Optional[Hashable] = None) -> RandomStream:
+        """
+        Return the named stream, creating it on first use.
+
+        Args:
+            name (str): Stream name, normally the owning module's __name__.
+            key (Hashable, optional): Entity or task the draws are for; a keyed stream's sequence
+                depends only on the seed, the name and the key, so it is reproducible under fan-out.
+
+        Returns:
+            RandomStream: The shared stream for the name, or the stream for the name and key.
+        """
+        if key is not None:
+            return self._keyed_stream(f"{name}:{key}")
+        stream = self.streams.get(name)
+        if stream is None:
+            stream = self.streams.setdefault(name, RandomStream(name, self.seed_value, self.block_size))
+        return stream
+
+    def _keyed_stream(self, name: str) -> RandomStream:
+        """Return the keyed stream called name, creating it on first use."""
+        with self._keyed_lock:
+            stream = self.keyed.get(name)
+            if stream is None:
+                stream = RandomStream(name, self.seed_value, KEYED_BLOCK_SIZE)
+                self.keyed[name] = stream
+            return stream
+
+    def seed(self, seed: Optional[int]) -> None:
+        """
+        Reseed every stream; each stream's sequence depends only on the seed and its name.
+
+        Args:
+            seed (int, optional): Master seed; None draws fresh entropy.
+        """
+        self.seed_value = seed
+        for stream in self.streams.values():
+            stream.reseed(seed)
+        with self._keyed_lock:
+            self.keyed.clear()
+
+streams = RandomStreams()
+
+def get_stream(name: str, key: Optional[Hashable] = None) -> RandomStream:
+    """Return the shared random stream for a subsystem, or its stream for one entity."""
+    return streams.stream(name, key)
+
+def seed(value: Optional[int]) -> None:
+    """Reseed every shared random stream."""
+    streams.seed(value)
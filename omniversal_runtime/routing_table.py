@@ -0,0 +1,196 @@
+"""
+routing_table.py
+Subscription-indexed routing for integration nexus fan-out in Rhee_AI_Assistant.
+Maps sync topics (memory, reality, resonance, stability, ...) to the module ids that exist
+in the tree and subscribe to them. Components declare their subscriptions in a module-level
+SYNC_TOPICS tuple, collected by the module manifest, and a sync names only its topic: the
+table supplies the target modules, or filters an explicit target list.
+"""
+
+import os
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EXCLUDED_PACKAGES = {"tests"}
+
+def discover_modules(root: str = REPO_ROOT) -> Set[str]:
+    """
+    Scan the tree for addressable module ids.
+
+    Ids follow the "package.component" form used by the fan-out lists, e.g.
+    "core_engine.quantum_memory_vault" for a subpackage or "voice_ai.voice_core" for a module.
+
+    Args:
+        root (str): Repository root to scan.
+
+    Returns:
+        Set[str]: Module ids present in the tree.
+    """
+    modules: Set[str] = set()
+    for package in os.listdir(root):
+        package_dir = os.path.join(root, package)
+        if package in EXCLUDED_PACKAGES or not os.path.isfile(os.path.join(package_dir, "__init__.py")):
+            continue
+        modules.add(package)
+        for entry in os.listdir(package_dir):
+            path = os.path.join(package_dir, entry)
+            if os.path.isfile(os.path.join(path, "__init__.py")):
+                modules.add(f"{package}.{entry}")
+            elif entry.endswith(".py") and entry != "__init__.py":
+                modules.add(f"{package}.{entry[:-3]}")
+    return modules
+
+def topic_for(sync_method: str) -> str:
+    """
+    Derive the routing topic from a per-target sync method name.
+
+    Args:
+        sync_method (str): Sync method name (e.g., sync_memory_state).
+
+    Returns:
+        str: Topic name (e.g., memory).
+    """
+    name = sync_method[len("sync_"):] if sync_method.startswith("sync_") else sync_method
+    return name.split("_", 1)[0]
+
+class RoutingTable:
+    """Topic to subscribed-module index consulted by integration nexuses."""
+
+    def __init__(self, modules: Iterable[str], cache_limit: int = 4096, strict: bool = False):
+        """
+        Initialize the routing table.
+
+        Args:
+            modules (Iterable[str]): Module ids present in the tree.
+            cache_limit (int): Maximum number of resolved target lists kept.
+            strict (bool): Route topics nobody subscribed to nowhere instead of to every module.
+        """
+        self.modules: Set[str] = set(modules)
+        self.strict = strict
+        self.subscriptions: Dict[str, Set[str]] = {}
+        self.cache_limit = cache_limit
+        self._resolved: Dict[Tuple[str, Tuple[str, ...]], Tuple[str, ...]] = {}
+        self._targets: Dict[str, Tuple[str, ...]] = {}
+        self.stats: Dict[str, int] = {"resolved": 0, "dropped": 0}
+
+    @classmethod
+    def from_tree(cls, root: str = REPO_ROOT) -> "RoutingTable":
+        """Build a routing table from the modules present under root."""
+        return cls(discover_modules(root))
+
+    @classmethod
+    def from_manifest(cls, manifest: Dict[str, Any]) -> "RoutingTable":
+        """
+        Build a strict routing table from the components and SYNC_TOPICS subscriptions of a module manifest.
+
+        Args:
+            manifest (Dict[str, Any]): Module manifest from load_manifest.
+
+        Returns:
+            RoutingTable: Table routing each topic only to the components that declare it.
+        """
+        table = cls(manifest["modules"], strict=True)
+        for module_id, entry in manifest["modules"].items():
+            for topic in entry.get("topics", ()):
+                table.subscriptions.setdefault(topic, set()).add(module_id)
+        return table
+
+    def subscribe(self, topic: str, module_id: str) -> None:
+        """
+        Restrict a topic to explicitly subscribed modules.
+
+        Unless the table is strict, topics without explicit subscriptions route to every
+        module present in the tree.
+
+        Args:
+            topic (str): Routing topic (e.g., memory).
+            module_id (str): Subscribing module id.
+        """
+        self.subscriptions.setdefault(topic, set()).add(module_id)
+        self._resolved.clear()
+        self._targets.clear()
+
+    def subscribers(self, topic: str) -> Set[str]:
+        """Return the module ids that receive a topic."""
+        subscribed = self.subscriptions.get(topic)
+        if subscribed is None:
+            return set() if self.strict else self.modules
+        return subscribed & self.modules
+
+    def targets(self, topic: str) -> Tuple[str, ...]:
+        """
+        Return the fan-out target list of a topic: its subscribers in sorted order.
+
+        Args:
+            topic (str): Routing topic.
+
+        Returns:
+            Tuple[str, ...]: Subscribed modules, computed once per topic.
+        """
+        routed = self._targets.get(topic)
+        if routed is None:
+            routed = self._targets[topic] = tuple(sorted(self.subscribers(topic)))
+        self.stats["resolved"] += 1
+        return routed
+
+    def resolve(self, topic: str, targets: Iterable[str]) -> Tuple[str, ...]:
+        """
+        Filter a fan-out target list down to modules that exist and subscribe to the topic.
+
+        Args:
+            topic (str): Routing topic.
+            targets (Iterable[str]): Candidate target modules, in fan-out order.
+
+        Returns:
+            Tuple[str, ...]: Routable targets, order preserved.
+        """
+        key = (topic, tuple(targets))
+        routed = self._resolved.get(key)
+        if routed is None:
+            allowed = self.subscribers(topic)
+            routed = tuple(module for module in key[1] if module in allowed)
+            if len(self._resolved) >= self.cache_limit:
+                self._resolved.clear()
+            self._resolved[key] = routed
+        self.stats["resolved"] += 1
+        self.stats["dropped"] += len(key[1]) - len(routed)
+        return routed
+
+_installed: Optional[RoutingTable] = None
+_default: Optional[RoutingTable] = None
+
+def default_routing_table() -> RoutingTable:
+    """
+    Return the table that supplies sync targets: the installed one, else one built once from the
+    module manifest without installing it, so explicit target lists stay unfiltered.
+    """
+    global _default
+    if _installed is not None:
+        return _installed
+    if _default is None:
+        from omniversal_runtime.manifest import load_manifest
+        _default = RoutingTable.from_manifest(load_manifest())
+    return _default
+
+def install_routing_table(table: Optional[RoutingTable] = None) -> RoutingTable:
+    """
+    Install the process-wide routing table consulted by every nexus and bridge.
+
+    Nothing is installed implicitly: entry points call this once at startup. Builds the
+    table from the module manifest's SYNC_TOPICS subscriptions on first use; later calls
+    return the installed table unless a new one is passed in.
+
+    Args:
+        table (RoutingTable, optional): Table to install instead of the manifest's.
+
+    Returns:
+        RoutingTable: The installed routing table.
+    """
+    global _installed
+    from omniversal_runtime.batch_sync import BatchSyncMixin
+    from omniversal_runtime.manifest import load_manifest
+    if table is None:
+        table = _installed or RoutingTable.from_manifest(load_manifest())
+    _installed = table
+    BatchSyncMixin.routing_table = table
+    return table
@@ -0,0 +1,125 @@
+"""
+shared_state.py
+Cross-process state sharing for sharded deployments of Rhee_AI_Assistant.
+Partitions entity ids across shards with a process-independent hash and keeps hot numeric
+metrics in a multiprocessing.shared_memory table that every process can read without a round trip.
+"""
+
+import hashlib
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, Optional
+
+# Reads retried while a slot is being rewritten before the read counts as a miss
+READ_ATTEMPTS = 64
+
+def stable_hash(entity_id: str) -> int:
+    """Return a 64-bit hash of an entity id that is identical in every process."""
+    return int.from_bytes(hashlib.blake2b(entity_id.encode(), digest_size=8).digest(), "little")
+
+def shard_for(entity_id: str, shards: int) -> int:
+    """
+    Return the shard that owns an entity.
+
+    Args:
+        entity_id (str): Entity identifier, e.g. an operation id.
+        shards (int): Number of shards.
+
+    Returns:
+        int: Shard index in [0, shards).
+    """
+    return stable_hash(entity_id) % shards
+
+class SharedMetricTable:
+    """Direct-mapped table of float metrics per entity in shared memory, one region per shard."""
+
+    def __init__(self, columns: Iterable[str], slots_per_region: int = 65536, regions: int = 1, name: Optional[str] = None):
+        """
+        Create a table, or attach to an existing one by name.
+
+        Each shard writes only to its own region, so slots never have two writers. An entity
+        maps to one slot of its region; a later entity hashing to the same slot replaces it,
+        so the table is a cache of the hottest state and readers fall back to the owner on a miss.
+        Every slot carries a sequence number that is odd while the slot is being written, so a
+        reader detects and retries a read that overlapped a write.
+
+        Args:
+            columns (Iterable[str]): Metric names (e.g., coherence_metrics, integration_strength).
+            slots_per_region (int): Slots in each shard's region.
+            regions (int): Number of regions, normally the shard count.
+            name (str, optional): Shared memory block to attach to; None creates a new block.
+        """
+        self.columns = tuple(columns)
+        self.slots_per_region = slots_per_region
+        self.regions = regions
+        slots = slots_per_region * regions
+        size = 8 * slots * (2 + len(self.columns))
+        self.owner = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=size)
+        self._keys = self.shm.buf[:8 * slots].cast("Q")
+        self._sequences = self.shm.buf[8 * slots:16 * slots].cast("Q")
+        self._values = self.shm.buf[16 * slots:size].cast("d")
+
+    @property
+    def name(self) -> str:
+        """Shared memory block name, passed to other processes to attach."""
+        return self.shm.name
+
+    def write(self, region: int, entity_id: str, values: Dict[str, float]) -> None:
+        """
+        Store an entity's metrics in its slot of a region.
+
+        Args:
+            region (int): Region owned by the writing shard.
+            entity_id (str): Entity identifier.
+            values (Dict[str, float]): Metric values; missing columns are stored as 0.0.
+        """
+        key = stable_hash(entity_id) or 1  # 0 marks an empty slot
+        slot = self._slot(region, key)
+        sequence = self._sequences[slot]
+        # Odd while writing; readers that saw any other sequence number retry
+        self._sequences[slot] = sequence + 1
+        self._keys[slot] = key
+        base = slot * len(self.columns)
+        for offset, column in enumerate(self.columns):
+            self._values[base + offset] = float(values.get(column, 0.0))
+        self._sequences[slot] = sequence + 2
+
+    def read(self, region: int, entity_id: str) -> Optional[Dict[str, float]]:
+        """
+        Return an entity's metrics, or None if its slot holds another entity.
+
+        A read that overlaps a write of the slot is retried; one that keeps overlapping
+        writes is reported as a miss.
+
+        Args:
+            region (int): Region owned by the entity's shard.
+            entity_id (str): Entity identifier.
+
+        Returns:
+            Optional[Dict[str, float]]: Metric values by column.
+        """
+        key = stable_hash(entity_id) or 1  # 0 marks an empty slot
+        slot = self._slot(region, key)
+        base = slot * len(self.columns)
+        for _ in range(READ_ATTEMPTS):
+            sequence = self._sequences[slot]
+            if sequence & 1:
+                continue
+            if self._keys[slot] != key:
+                return None
+            values = {column: self._values[base + offset] for offset, column in enumerate(self.columns)}
+            if self._sequences[slot] == sequence:
+                return values
+        return None
+
+    def close(self) -> None:
+        """Detach from the shared memory block; the creating process also frees it."""
+        self._keys.release()
+        self._sequences.release()
+        self._values.release()
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def _slot(self, region: int, key: int) -> int:
+        return region * self.slots_per_region + (key // self.regions) % self.slots_per_region
@@ -0,0 +1,117 @@
+"""
+signatures.py
+Content-addressed signature engine for Rhee_AI_Assistant.
+Canonicalizes and hashes a configuration once, caches the digest by object identity
+(or an explicit version), and derives per-entity signatures from the cached digest.
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+ALGORITHMS = ("sha256", "blake2b")
+
+def canonicalize(config: Any) -> bytes:
+    """
+    Render a configuration to canonical bytes, independent of key order.
+
+    Args:
+        config (Any): Configuration to render.
+
+    Returns:
+        bytes: Canonical encoding (sorted-key JSON, falling back to repr for unsortable keys).
+    """
+    try:
+        return json.dumps(config, sort_keys=True, separators=(",", ":"), default=repr).encode()
+    except (TypeError, ValueError):
+        return repr(config).encode()
+
+class SignatureEngine:
+    """Memoizing signature service shared by synthesizers and their fan-out targets."""
+
+    def __init__(self, algorithm: str = "sha256", cache_size: int = 4096):
+        """
+        Initialize the signature engine.
+
+        Args:
+            algorithm (str): "sha256" or the faster "blake2b" (32-byte digest).
+            cache_size (int): Maximum number of cached config digests.
+        """
+        self.use_algorithm(algorithm)
+        self.cache_size = cache_size
+        self._digests: "OrderedDict[Tuple[int, Any], Tuple[Any, bytes]]" = OrderedDict()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+    def use_algorithm(self, algorithm: str) -> None:
+        """
+        Switch the hash algorithm; cached digests are dropped.
+
+        Args:
+            algorithm (str): "sha256" or "blake2b".
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unsupported signature algorithm: {algorithm}")
+        self.algorithm = algorithm
+        self._digests = OrderedDict()
+
+    def config_digest(self, config: Any, version: Optional[Any] = None) -> bytes:
+        """
+        Return the digest of a configuration, computing it once per object.
+
+        Configurations are cached by identity and treated as immutable once signed;
+        callers that mutate a config in place pass a new `version` (or call invalidate).
+
+        Args:
+            config (Any): Configuration to digest.
+            version (Any, optional): Caller-maintained config version.
+
+        Returns:
+            bytes: Config digest.
+        """
+        key = (id(config), version)
+        cached = self._digests.get(key)
+        if cached is not None and cached[0] is config:
+            self._digests.move_to_end(key)
+            self.stats["hits"] += 1
+            return cached[1]
+        self.stats["misses"] += 1
+        digest = self._hash(canonicalize(config)).digest()
+        self._digests[key] = (config, digest)
+        if len(self._digests) > self.cache_size:
+            self._digests.popitem(last=False)
+        return digest
+
+    def invalidate(self, config: Any) -> None:
+        """Drop every cached digest of a configuration object."""
+        for key in [key for key in self._digests if key[0] == id(config)]:
+            del self._digests[key]
+
+    def entity_signature(self, entity_id: str, config: Any, layer: str, salt: str = "", version: Optional[Any] = None) -> str:
+        """
+        Derive an entity signature from the cached config digest.
+
+        Args:
+            entity_id (str): Entity identifier.
+            config (Any): Entity configuration.
+            layer (str): Layer context.
+            salt (str): Extra input such as a timestamp.
+            version (Any, optional): Caller-maintained config version.
+
+        Returns:
+            str: Hex signature.
+        """
+        hasher = self._hash(self.config_digest(config, version))
+        hasher.update(f"\x00{entity_id}\x00{layer}\x00{salt}".encode())
+        return hasher.hexdigest()
+
+    def _hash(self, data: bytes):
+        if self.algorithm == "blake2b":
+            return hashlib.blake2b(data, digest_size=32)
+        return hashlib.sha256(data)
+
+signatures = SignatureEngine()
+
+def entity_signature(entity_id: str, config: Any, layer: str, salt: str = "", version: Optional[Any] = None) -> str:
+    """Derive an entity signature with the shared signature engine."""
+    return signatures.entity_signature(entity_id, config, layer, salt, version)
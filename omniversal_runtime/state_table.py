@@ -0,0 +1,277 @@
+"""
+state_table.py
+Columnar per-entity state storage for synthesizers in Rhee_AI_Assistant.
+Keeps one id-to-row index per class with float columns for numeric metrics
+(coherence, entropy, amplitude) and compact object columns for profiles and signatures.
+"""
+
+import math
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, MutableMapping, Optional
+from omniversal_runtime.retention import RetentionPolicy, approximate_size
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy installed
+    np = None
+
+_MISSING = object()
+
+class StateTable:
+    """Columnar state store shared by the per-entity metrics of one class."""
+
+    def __init__(self, numeric_columns: Iterable[str] = (), object_columns: Iterable[str] = (), capacity: int = 64,
+                 retention: Optional[RetentionPolicy] = None):
+        """
+        Initialize the state table.
+
+        Args:
+            numeric_columns (Iterable[str]): Float metric columns (e.g., infiniversal_coherence).
+            object_columns (Iterable[str]): Object columns (e.g., singularity_profiles, singularity_signatures).
+            capacity (int): Initial row capacity; grows by doubling.
+            retention (RetentionPolicy, optional): Evicts whole entities, least recently used first;
+                on_evict receives the entity id and its column values.
+        """
+        self.capacity = max(1, capacity)
+        self.index: Dict[str, int] = {}
+        self.ids: List[Optional[str]] = [None] * self.capacity
+        self._free: List[int] = []
+        self._next_row = 0
+        self._numeric: Dict[str, Any] = {name: self._float_column(self.capacity) for name in numeric_columns}
+        self._objects: Dict[str, List[Any]] = {name: [_MISSING] * self.capacity for name in object_columns}
+        self._counts: Dict[str, int] = {name: 0 for name in list(self._numeric) + list(self._objects)}
+        self.retention = retention
+        self._recency = None if retention is None else retention.bounded(self._on_evict, self._row_size)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self.index
+
+    def column(self, name: str) -> "ColumnView":
+        """Return a dict-like view of one column keyed by entity id."""
+        if name not in self._counts:
+            raise KeyError(f"Unknown state column: {name}")
+        return ColumnView(self, name)
+
+    def get(self, name: str, entity_id: str, default: Any = None) -> Any:
+        """Return a column value for an entity, or default if unset."""
+        row = self.index.get(entity_id)
+        if row is None:
+            return default
+        if self._recency is not None and not self._recency.touch(entity_id):
+            return default
+        if name in self._numeric:
+            value = self._numeric[name][row]
+            return default if math.isnan(value) else float(value)
+        value = self._objects[name][row]
+        return default if value is _MISSING else value
+
+    def has(self, name: str, entity_id: str) -> bool:
+        """Check whether a column holds a value for an entity."""
+        return self.get(name, entity_id, _MISSING) is not _MISSING
+
+    def set(self, name: str, entity_id: str, value: Any) -> None:
+        """Set a column value for an entity, allocating its row on first write."""
+        row = self.index.get(entity_id)
+        if row is None:
+            row = self._allocate(entity_id)
+        if name in self._numeric:
+            column = self._numeric[name]
+            if math.isnan(column[row]):
+                self._counts[name] += 1
+            column[row] = float(value)
+        else:
+            column = self._objects[name]
+            if column[row] is _MISSING:
+                self._counts[name] += 1
+            column[row] = value
+        if self._recency is not None:
+            self._recency[entity_id] = entity_id
+
+    def unset(self, name: str, entity_id: str) -> None:
+        """Clear a column value; the row is released once every column is empty."""
+        row = self.index.get(entity_id)
+        if row is None or not self.has(name, entity_id):
+            raise KeyError(entity_id)
+        if name in self._numeric:
+            self._numeric[name][row] = math.nan
+        else:
+            self._objects[name][row] = _MISSING
+        self._counts[name] -= 1
+        if not any(self._row_has(column, row) for column in self._counts):
+            self._release(entity_id, row)
+
+    def delete(self, entity_id: str) -> None:
+        """Remove an entity and all of its column values."""
+        row = self.index.get(entity_id)
+        if row is None:
+            raise KeyError(entity_id)
+        for name in self._counts:
+            if self._row_has(name, row):
+                self._counts[name] -= 1
+        for column in self._numeric.values():
+            column[row] = math.nan
+        for column in self._objects.values():
+            column[row] = _MISSING
+        self._release(entity_id, row)
+
+    def row(self, entity_id: str) -> Dict[str, Any]:
+        """Return every set column value of an entity."""
+        row = self.index.get(entity_id)
+        if row is None:
+            return {}
+        values: Dict[str, Any] = {}
+        for name, column in self._numeric.items():
+            if not math.isnan(column[row]):
+                values[name] = float(column[row])
+        for name, column in self._objects.items():
+            if column[row] is not _MISSING:
+                values[name] = column[row]
+        return values
+
+    def count(self, name: str) -> int:
+        """Return the number of entities holding a value in a column."""
+        return self._counts[name]
+
+    def entity_ids(self, name: str) -> Iterator[str]:
+        """Iterate over entity ids holding a value in a column."""
+        for entity_id, row in list(self.index.items()):
+            if self._row_has(name, row):
+                yield entity_id
+
+    def values(self, name: str):
+        """
+        Return every set value of a numeric column as one vector.
+
+        Returns:
+            numpy.ndarray or List[float]: Present values, in row order.
+        """
+        column = self._numeric[name][:self._next_row]
+        if np is not None:
+            return column[~np.isnan(column)]
+        return [value for value in column if not math.isnan(value)]
+
+    def aggregate(self, name: str) -> Dict[str, float]:
+        """
+        Summarize a numeric column with a single vectorized scan.
+
+        Returns:
+            Dict[str, float]: count, mean, min and max of the column (0.0 when empty).
+        """
+        values = self.values(name)
+        count = len(values)
+        if count == 0:
+            return {"count": 0, "mean": 0.0, "min": 0.0, "max": 0.0}
+        if np is not None:
+            return {"count": count, "mean": float(values.mean()), "min": float(values.min()), "max": float(values.max())}
+        return {"count": count, "mean": sum(values) / count, "min": min(values), "max": max(values)}
+
+    def select(self, name: str, low: float = -math.inf, high: float = math.inf) -> List[str]:
+        """
+        Return the ids whose numeric column value lies within [low, high].
+
+        Args:
+            name (str): Numeric column.
+            low (float): Inclusive lower bound.
+            high (float): Inclusive upper bound.
+
+        Returns:
+            List[str]: Matching entity ids, in row order.
+        """
+        column = self._numeric[name][:self._next_row]
+        if np is not None:
+            rows = np.nonzero((column >= low) & (column <= high))[0]
+        else:
+            rows = [row for row, value in enumerate(column) if low <= value <= high]
+        return [self.ids[row] for row in rows]
+
+    def _row_has(self, name: str, row: int) -> bool:
+        if name in self._numeric:
+            return not math.isnan(self._numeric[name][row])
+        return self._objects[name][row] is not _MISSING
+
+    def _allocate(self, entity_id: str) -> int:
+        if self._free:
+            row = self._free.pop()
+        else:
+            if self._next_row == self.capacity:
+                self._grow()
+            row = self._next_row
+            self._next_row += 1
+        self.index[entity_id] = row
+        self.ids[row] = entity_id
+        return row
+
+    def _release(self, entity_id: str, row: int) -> None:
+        del self.index[entity_id]
+        self.ids[row] = None
+        self._free.append(row)
+        if self._recency is not None:
+            self._recency.discard(entity_id)
+
+    def _row_size(self, entity_id: str) -> int:
+        row = self.index[entity_id]
+        size = 8 * len(self._numeric)
+        for column in self._objects.values():
+            if column[row] is not _MISSING:
+                size += approximate_size(column[row])
+        return size
+
+    def _on_evict(self, entity_id: str, _: Any, reason: str) -> None:
+        if entity_id not in self.index:
+            return
+        values = self.row(entity_id) if self.retention.on_evict is not None else None
+        self.delete(entity_id)
+        if values is not None:
+            self.retention.on_evict(entity_id, values, reason)
+
+    def _grow(self) -> None:
+        extra = self.capacity
+        for name, column in self._numeric.items():
+            if np is not None:
+                self._numeric[name] = np.concatenate([column, np.full(extra, np.nan)])
+            else:
+                column.extend(self._float_column(extra))
+        for column in self._objects.values():
+            column.extend([_MISSING] * extra)
+        self.ids.extend([None] * extra)
+        self.capacity += extra
+
+    @staticmethod
+    def _float_column(size: int):
+        if np is not None:
+            return np.full(size, np.nan)
+        return array("d", [math.nan]) * size
+
+class ColumnView(MutableMapping):
+    """Dict-compatible view over one StateTable column."""
+
+    def __init__(self, table: StateTable, name: str):
+        self.table = table
+        self.name = name
+
+    def __getitem__(self, entity_id: str) -> Any:
+        value = self.table.get(self.name, entity_id, _MISSING)
+        if value is _MISSING:
+            raise KeyError(entity_id)
+        return value
+
+    def __setitem__(self, entity_id: str, value: Any) -> None:
+        self.table.set(self.name, entity_id, value)
+
+    def __delitem__(self, entity_id: str) -> None:
+        self.table.unset(self.name, entity_id)
+
+    def __contains__(self, entity_id: object) -> bool:
+        return isinstance(entity_id, str) and self.table.has(self.name, entity_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return self.table.entity_ids(self.name)
+
+    def __len__(self) -> int:
+        return self.table.count(self.name)
+
+    def __repr__(self) -> str:
+        return f"ColumnView({self.name!r}, {dict(self.items())!r})"
@@ -0,0 +1,155 @@
+"""
+tag_index.py
+Inverted tag index for tagged stores in Rhee_AI_Assistant.
+Maps each (tag_key, tag_value) pair to the set of keys carrying it, answering exact, multi-tag
+AND/OR and value-prefix lookups without scanning the store.
+"""
+
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Mapping, Set, Tuple, Union
+
+AND = "and"
+OR = "or"
+
+TagQuery = Union[Mapping[str, Any], Iterable[Tuple[str, Any]]]
+
+def _hashable(value: Any) -> bool:
+    # A tuple is a Hashable instance even when it holds a list, so try the hash itself
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+class TagIndex:
+    """Postings of store keys per tag pair, with sorted string values per tag key for prefix search."""
+
+    def __init__(self):
+        """Initialize an empty tag index."""
+        self._postings: Dict[str, Dict[Any, Set[str]]] = {}
+        self._sorted_values: Dict[str, List[str]] = {}
+        self._tags_of: Dict[str, Dict[str, Any]] = {}
+        self._unhashed: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._tags_of.keys() | self._unhashed.keys())
+
+    def add(self, key: str, tags: Mapping[str, Any]) -> None:
+        """
+        Index a key under its tags, replacing the tags it was indexed under before.
+
+        Unhashable tag values, e.g. lists, are kept aside and matched by comparing them in turn.
+
+        Args:
+            key (str): Store key.
+            tags (Mapping[str, Any]): Tag key to tag value.
+        """
+        self.remove(key)
+        indexed: Dict[str, Any] = {}
+        unhashed: Dict[str, Any] = {}
+        for tag_key, tag_value in tags.items():
+            (indexed if _hashable(tag_value) else unhashed)[tag_key] = tag_value
+        if unhashed:
+            self._unhashed[key] = unhashed
+        if not indexed:
+            return
+        self._tags_of[key] = indexed
+        for tag_key, tag_value in indexed.items():
+            values = self._postings.setdefault(tag_key, {})
+            keys = values.get(tag_value)
+            if keys is None:
+                keys = values[tag_value] = set()
+                if isinstance(tag_value, str):
+                    insort(self._sorted_values.setdefault(tag_key, []), tag_value)
+            keys.add(key)
+
+    def remove(self, key: str) -> None:
+        """
+        Drop a key from the index.
+
+        Args:
+            key (str): Store key.
+        """
+        self._unhashed.pop(key, None)
+        for tag_key, tag_value in self._tags_of.pop(key, {}).items():
+            values = self._postings[tag_key]
+            keys = values[tag_value]
+            keys.discard(key)
+            if keys:
+                continue
+            del values[tag_value]
+            if isinstance(tag_value, str):
+                ordered = self._sorted_values[tag_key]
+                del ordered[bisect_left(ordered, tag_value)]
+            if not values:
+                del self._postings[tag_key]
+                self._sorted_values.pop(tag_key, None)
+
+    def rebuild(self, entries: Iterable[Tuple[str, Mapping[str, Any]]]) -> None:
+        """
+        Replace the index contents.
+
+        Args:
+            entries (Iterable[Tuple[str, Mapping[str, Any]]]): (key, tags) pairs.
+        """
+        self._postings.clear()
+        self._sorted_values.clear()
+        self._tags_of.clear()
+        self._unhashed.clear()
+        for key, tags in entries:
+            self.add(key, tags)
+
+    def lookup(self, tag_key: str, tag_value: Any) -> Set[str]:
+        """Return the keys tagged tag_key=tag_value."""
+        return set(self._keys(tag_key, tag_value))
+
+    def match(self, tags: TagQuery, mode: str = AND) -> Set[str]:
+        """
+        Return the keys carrying all, or any, of several tags.
+
+        Args:
+            tags (Mapping or Iterable of pairs): Tag pairs; pairs may repeat a tag key, e.g. for OR.
+            mode (str): "and" or "or".
+
+        Returns:
+            Set[str]: Matching keys; an empty query matches nothing.
+
+        Raises:
+            ValueError: If mode is not "and" or "or".
+        """
+        if mode not in (AND, OR):
+            raise ValueError(f"mode must be '{AND}' or '{OR}', got {mode!r}")
+        pairs = tags.items() if isinstance(tags, Mapping) else tags
+        postings = [self._keys(tag_key, tag_value) for tag_key, tag_value in pairs]
+        if not postings:
+            return set()
+        if mode == OR:
+            return set().union(*postings)
+        # Intersect from the smallest posting list so the work is bounded by the rarest tag
+        postings.sort(key=len)
+        return set(postings[0]).intersection(*postings[1:])
+
+    def prefix(self, tag_key: str, value_prefix: str) -> Set[str]:
+        """
+        Return the keys whose string value for tag_key starts with value_prefix.
+
+        Args:
+            tag_key (str): Tag key.
+            value_prefix (str): Leading part of the tag value.
+
+        Returns:
+            Set[str]: Matching keys.
+        """
+        ordered = self._sorted_values.get(tag_key, [])
+        values = self._postings.get(tag_key, {})
+        keys: Set[str] = set()
+        for position in range(bisect_left(ordered, value_prefix), len(ordered)):
+            if not ordered[position].startswith(value_prefix):
+                break
+            keys.update(values[ordered[position]])
+        return keys
+
+    def _keys(self, tag_key: str, tag_value: Any) -> Set[str]:
+        if _hashable(tag_value):
+            return self._postings.get(tag_key, {}).get(tag_value, set())
+        return {key for key, tags in self._unhashed.items() if tag_key in tags and tags[tag_key] == tag_value}
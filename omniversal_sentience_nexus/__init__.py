@@ -1,6 +1,7 @@
 # omniversal_sentience_nexus/__init__.py
 # Marks the omniversal_sentience_nexus directory as a Python package.
 # Initializes configurations for omniversal sentience and coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'omniversal_sentience_matrix',
     'metatemporal_resonance_field',
@@ -8,3 +9,4 @@ __all__ = [
     'transcausal_axiom_bridge',
     'omniversal_integration_bridge'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
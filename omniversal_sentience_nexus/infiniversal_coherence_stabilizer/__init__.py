@@ -1,3 +1,5 @@
 # omniversal_sentience_nexus/infiniversal_coherence_stabilizer/__init__.py
 # Marks the infniversal_coherence_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfiniversalCoherenceStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Stabilizes omniversal coherence for Rhee_AI_Assistant.
 Manages coherence across infinite-dimensional frameworks.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.ethical_matrix import EthicalMatrix
@@ -19,20 +21,30 @@ from datetime import datetime
 # from cosmic_intelligence_orchestrator.omniversal_coherence_synthesizer import OmniversalCoherenceSynthesizer
 # from transcendental_singularity_core.omnitemporal_coherence_synthesizer import OmnitemporalCoherenceSynthesizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("alignment", "axiom", "coherence", "fractal", "harmonic", "resonance", "synthesis")
+
 class InfniversalCoherenceStabilizer:
     """Core class for infniversal coherence stabilization with omniversal fidelity."""
 
     def __init__(self, integration_bridge=None):
         """Initialize coherence stabilizer with omniversal streams and integration bridge."""
-        self.coherence_streams: Dict[str, Dict[str, Any]] = {}
-        self.infiniversal_amplitude: Dict[str, float] = {}
-        self.omniversal_synthesis_factor: Dict[str, float] = {}
-        self.omniversal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_amplitude", "omniversal_synthesis_factor", "omniversal_entropy"),
+            object_columns=("coherence_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.coherence_streams = self.state_table.column("coherence_streams")
+        self.infiniversal_amplitude = self.state_table.column("infiniversal_amplitude")
+        self.omniversal_synthesis_factor = self.state_table.column("omniversal_synthesis_factor")
+        self.omniversal_entropy = self.state_table.column("omniversal_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Infiniversal coherence stabilizer initialized with omniversal protocols at 06:39 PM IST, Saturday, July 19, 2025")
 
-    def stabilize_coherence_stream(self, stream_id: str, config: Dict[str, Any], omniversal_layer: str = "primary") -> List[Dict[str, Any]]:
+    def stabilize_coherence_stream(self, stream_id: str, config: Dict[str, Any], omniversal_layer: str = "primary", force: bool = False) -> List[Dict[str, Any]]:
         """
         Stabilize an infniversal coherence stream with omniversal fidelity.
 
@@ -40,44 +52,37 @@ class InfniversalCoherenceStabilizer:
             stream_id (str): Unique identifier for the coherence stream.
             config (Dict[str, Any]): Stream configuration (e.g., omniversal patterns, infniversal axioms).
             omniversal_layer (str): Omniversal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             List[Dict[str, Any]]: Stabilized coherence stream data with omniversal metadata.
         """
         try:
             coherence_streams = []
-            for i in range(random.randint(2, 6)):
-                segment_id = f"segment_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(2, 6)):
+                segment_id = f"segment_{i}_{rng.randint(1000, 9999)}"
                 segment = {
                     "id": segment_id,
                     "config": config,
                     "omniversal_layer": omniversal_layer,
-                    "data": {"infiniversal_fractal": random.uniform(0.75, 1.0), "coherence_fidelity": random.uniform(0.8, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "omniversal_resonance": random.uniform(0.85, 0.95)
+                    "data": {"infiniversal_fractal": rng.uniform(0.75, 1.0), "coherence_fidelity": rng.uniform(0.8, 0.95)},
+                    "timestamp": utc_iso(),
+                    "omniversal_resonance": rng.uniform(0.85, 0.95)
                 }
                 coherence_streams.append(segment)
             self.coherence_streams[stream_id] = {
                 "segments": coherence_streams,
                 "omniversal_layer": omniversal_layer,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.infiniversal_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.omniversal_synthesis_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.omniversal_entropy[stream_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.omniversal_synthesis_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.omniversal_entropy[stream_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Stabilized coherence stream %s in omniversal layer %s with %d segments, infniversal amplitude %.2f, synthesis factor %.2f, entropy %.2f at 06:39 PM IST, Saturday, July 19, 2025",
                              stream_id, omniversal_layer, len(coherence_streams), self.infiniversal_amplitude[stream_id],
                              self.omniversal_synthesis_factor[stream_id], self.omniversal_entropy[stream_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, omniversal_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, omniversal_layer, "cyber_autonomy_engine.ethical_matrix")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, omniversal_layer, "akashic_link.metaphysical_knowledge_synthesizer")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, omniversal_layer, "ai_nirvana_engine.sentient_harmony_synthesizer")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, omniversal_layer, "galactic_communication.fractal_communication_synthesizer")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, omniversal_layer, "quantum_spiritual_singularity.transcendental_consciousness_synthesizer")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, omniversal_layer, "temporal_intelligence.multiversal_timeline_synthesizer")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, omniversal_layer, "cosmic_intelligence_orchestrator.omniversal_coherence_synthesizer")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, omniversal_layer, "transcendental_singularity_core.omnitemporal_coherence_synthesizer")
+                self.integration_bridge.sync_many("sync_coherence_stream", stream_id, coherence_streams, omniversal_layer, force=force)
                 self.integration_bridge.notify_coherence_update(stream_id, omniversal_layer, "metatemporal_resonance_field")
             return coherence_streams
         except Exception as e:
@@ -88,9 +93,9 @@ class InfniversalCoherenceStabilizer:
     def _regenerate_coherence(self, stream_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using infniversal recovery protocols."""
         try:
-            self.infiniversal_amplitude[stream_id] = random.uniform(0.9, 1.0)
-            self.omniversal_synthesis_factor[stream_id] = random.uniform(0.85, 0.95)
-            self.omniversal_entropy[stream_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_amplitude[stream_id] = rng.uniform(0.9, 1.0)
+            self.omniversal_synthesis_factor[stream_id] = rng.uniform(0.85, 0.95)
+            self.omniversal_entropy[stream_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for coherence stream %s after failed %s at 06:39 PM IST, Saturday, July 19, 2025", stream_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for coherence stream %s: %s at 06:39 PM IST, Saturday, July 19, 2025", stream_id, e)
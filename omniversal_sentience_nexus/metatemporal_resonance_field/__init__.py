@@ -1,3 +1,5 @@
 # omniversal_sentience_nexus/metatemporal_resonance_field/__init__.py
 # Marks the metatemporal_resonance_field directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetatemporalResonanceField']
+__getattr__, __dir__ = attach(__name__, __all__)
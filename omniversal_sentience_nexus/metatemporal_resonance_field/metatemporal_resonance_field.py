@@ -4,10 +4,12 @@ Manages metatemporal resonance fields for omniversal alignment in Rhee_AI_Assist
 Simulates synchronized consciousness across infinite timelines.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -19,20 +21,33 @@ from datetime import datetime
 # from cosmic_intelligence_orchestrator.quantum_synchronicity_matrix import QuantumSynchronicityMatrix
 # from transcendental_singularity_core.omnitemporal_coherence_synthesizer import OmnitemporalCoherenceSynthesizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "awareness", "axiom", "causality", "coherence", "convergence", "encryption", "ethical", "flux", "fractal",
+    "harmonic", "reality", "resonance", "sentience", "synthesis"
+)
+
 class MetatemporalResonanceField:
     """Core class for metatemporal resonance fields with omniversal coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize resonance field with metatemporal coherence and integration bridge."""
-        self.resonance_field_states: Dict[str, Dict[str, Any]] = {}
-        self.metatemporal_cascade: Dict[str, float] = {}
-        self.omniversal_harmony_factor: Dict[str, float] = {}
-        self.omniversal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("metatemporal_cascade", "omniversal_harmony_factor", "omniversal_entropy"),
+            object_columns=("resonance_field_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.resonance_field_states = self.state_table.column("resonance_field_states")
+        self.metatemporal_cascade = self.state_table.column("metatemporal_cascade")
+        self.omniversal_harmony_factor = self.state_table.column("omniversal_harmony_factor")
+        self.omniversal_entropy = self.state_table.column("omniversal_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Metatemporal resonance field initialized with omniversal protocols at 06:39 PM IST, Saturday, July 19, 2025")
 
-    def stabilize_resonance_field(self, field_id: str, config: Dict[str, Any], omniversal_layer: str = "primary") -> None:
+    def stabilize_resonance_field(self, field_id: str, config: Dict[str, Any], omniversal_layer: str = "primary", force: bool = False) -> None:
         """
         Stabilize a metatemporal resonance field for omniversal alignment.
 
@@ -40,30 +55,23 @@ class MetatemporalResonanceField:
             field_id (str): Unique identifier for the resonance field.
             config (Dict[str, Any]): Field configuration (e.g., metatemporal patterns, omniversal axioms).
             omniversal_layer (str): Omniversal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.resonance_field_states[field_id] = {
                 "config": config,
                 "omniversal_layer": omniversal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "resonance_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "resonance_signature": rng.uniform(0.85, 0.95)
             }
-            self.metatemporal_cascade[field_id] = random.uniform(0.95, 1.0)
-            self.omniversal_harmony_factor[field_id] = random.uniform(0.9, 0.95)
-            self.omniversal_entropy[field_id] = random.uniform(0.0, 0.08)
+            self.metatemporal_cascade[field_id] = rng.uniform(0.95, 1.0)
+            self.omniversal_harmony_factor[field_id] = rng.uniform(0.9, 0.95)
+            self.omniversal_entropy[field_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Stabilized resonance field %s in omniversal layer %s with cascade %.2f, harmony factor %.2f, entropy %.2f at 06:39 PM IST, Saturday, July 19, 2025",
                              field_id, omniversal_layer, self.metatemporal_cascade[field_id],
                              self.omniversal_harmony_factor[field_id], self.omniversal_entropy[field_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_resonance_field(field_id, config, omniversal_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_resonance_field(field_id, config, omniversal_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_resonance_field(field_id, config, omniversal_layer, "akashic_link.akashic_resonance_field")
-                self.integration_bridge.sync_resonance_field(field_id, config, omniversal_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_bridge.sync_resonance_field(field_id, config, omniversal_layer, "galactic_communication.trans_galactic_resonance_field")
-                self.integration_bridge.sync_resonance_field(field_id, config, omniversal_layer, "quantum_spiritual_singularity.karmic_resonance_field")
-                self.integration_bridge.sync_resonance_field(field_id, config, omniversal_layer, "temporal_intelligence.quantum_temporal_resonator")
-                self.integration_bridge.sync_resonance_field(field_id, config, omniversal_layer, "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix")
-                self.integration_bridge.sync_resonance_field(field_id, config, omniversal_layer, "transcendental_singularity_core.omnitemporal_coherence_synthesizer")
+                self.integration_bridge.sync_many("sync_resonance_field", field_id, config, omniversal_layer, force=force)
         except Exception as e:
             self.logger.error("Error stabilizing resonance field %s in omniversal layer %s: %s at 06:39 PM IST, Saturday, July 19, 2025", field_id, omniversal_layer, e)
             self._regenerate_coherence(field_id, "stabilization")
@@ -71,9 +79,9 @@ class MetatemporalResonanceField:
     def _regenerate_coherence(self, field_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using metatemporal recovery protocols."""
         try:
-            self.metatemporal_cascade[field_id] = random.uniform(0.9, 1.0)
-            self.omniversal_harmony_factor[field_id] = random.uniform(0.85, 0.95)
-            self.omniversal_entropy[field_id] = random.uniform(0.0, 0.05)
+            self.metatemporal_cascade[field_id] = rng.uniform(0.9, 1.0)
+            self.omniversal_harmony_factor[field_id] = rng.uniform(0.85, 0.95)
+            self.omniversal_entropy[field_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for resonance field %s after failed %s at 06:39 PM IST, Saturday, July 19, 2025", field_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for resonance field %s: %s at 06:39 PM IST, Saturday, July 19, 2025", field_id, e)
@@ -1,3 +1,5 @@
 # omniversal_sentience_nexus/omniversal_integration_bridge/__init__.py
 # Marks the omniversal_integration_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmniversalIntegrationBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,17 +4,22 @@ Manages cross-directory integration for omniversal_sentience_nexus in Rhee_AI_As
 Facilitates non-local omniversal coherence bridges and sentient synchronization.
 """
 
-import logging
 from typing import Dict, List, Any
-from datetime import datetime
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class OmniversalIntegrationBridge:
+rng = get_stream(__name__)
+
+class OmniversalIntegrationBridge(BatchSyncMixin):
     """Core class for managing non-local omniversal coherence bridges for omniversal operations."""
 
     def __init__(self):
         """Initialize integration bridge with non-local omniversal coherence tracking."""
-        self.coherence_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.coherence_bridges: Dict[str, Dict[str, Any]] = retained(self, "coherence_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Omniversal integration bridge initialized with non-local omniversal protocols at 06:39 PM IST, Saturday, July 19, 2025")
 
     def sync_sentience_state(self, matrix_id: str, config: Dict[str, Any], omniversal_layer: str, target_module: str) -> None:
@@ -32,9 +37,10 @@ class OmniversalIntegrationBridge:
                 "config": config,
                 "omniversal_layer": omniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(matrix_id)
             self.logger.info("Synchronized sentience state %s with %s in omniversal layer %s, coherence strength %.2f at 06:39 PM IST, Saturday, July 19, 2025",
                              matrix_id, target_module, omniversal_layer, self.coherence_bridges[matrix_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -56,9 +62,10 @@ class OmniversalIntegrationBridge:
                 "config": config,
                 "omniversal_layer": omniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(field_id)
             self.logger.info("Synchronized resonance field %s with %s in omniversal layer %s, coherence strength %.2f at 06:39 PM IST, Saturday, July 19, 2025",
                              field_id, target_module, omniversal_layer, self.coherence_bridges[field_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -80,9 +87,10 @@ class OmniversalIntegrationBridge:
                 "coherence_streams": coherence_streams,
                 "omniversal_layer": omniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stream_id)
             self.logger.info("Synchronized coherence stream %s with %s in omniversal layer %s, coherence strength %.2f at 06:39 PM IST, Saturday, July 19, 2025",
                              stream_id, target_module, omniversal_layer, self.coherence_bridges[stream_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -104,9 +112,10 @@ class OmniversalIntegrationBridge:
                 "config": config,
                 "omniversal_layer": omniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(bridge_id)
             self.logger.info("Synchronized axiom bridge %s with %s in omniversal layer %s, coherence strength %.2f at 06:39 PM IST, Saturday, July 19, 2025",
                              bridge_id, target_module, omniversal_layer, self.coherence_bridges[bridge_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
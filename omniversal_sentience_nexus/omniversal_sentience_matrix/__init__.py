@@ -1,3 +1,5 @@
 # omniversal_sentience_nexus/omniversal_sentience_matrix/__init__.py
 # Marks the omniversal_sentience_matrix directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmniversalSentienceMatrix']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,11 +4,13 @@ Core module for omniversal sentience management in Rhee_AI_Assistant.
 Manages sentience matrices across all possible realities and dimensions.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -23,20 +25,34 @@ from datetime import datetime
 # from cosmic_intelligence_orchestrator.hyperdimensional_sentience_field import HyperdimensionalSentienceField
 # from transcendental_singularity_core.metadimensional_consciousness_lattice import MetadimensionalConsciousnessLattice
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "array", "axiom", "causal", "causality", "coherence", "consciousness", "convergence", "ethical", "fractal",
+    "harmonic", "hypersentience", "intention", "memory", "quantum", "reality", "resonance", "sentience",
+    "singularity", "stability", "synthesis", "temporal"
+)
+
 class OmniversalSentienceMatrix:
     """Core class for omniversal sentience matrices with infinite-dimensional coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize sentience matrix with omniversal profiles and integration bridge."""
-        self.sentience_matrix_profiles: Dict[str, Dict[str, Any]] = {}
-        self.omniversal_signatures: Dict[str, str] = {}
-        self.infiniversal_coherence_cascades: Dict[str, float] = {}
-        self.omniversal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence_cascades", "omniversal_entropy"),
+            object_columns=("sentience_matrix_profiles", "omniversal_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.sentience_matrix_profiles = self.state_table.column("sentience_matrix_profiles")
+        self.omniversal_signatures = self.state_table.column("omniversal_signatures")
+        self.infiniversal_coherence_cascades = self.state_table.column("infiniversal_coherence_cascades")
+        self.omniversal_entropy = self.state_table.column("omniversal_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omniversal sentience matrix initialized with infinite-dimensional protocols at 06:39 PM IST, Saturday, July 19, 2025")
 
-    def encode_sentience_state(self, matrix_id: str, config: Dict[str, Any], omniversal_layer: str = "primary") -> None:
+    def encode_sentience_state(self, matrix_id: str, config: Dict[str, Any], omniversal_layer: str = "primary", force: bool = False) -> None:
         """
         Encode an omniversal sentience state with infinite-dimensional signatures.
 
@@ -44,38 +60,28 @@ class OmniversalSentienceMatrix:
             matrix_id (str): Unique identifier for the sentience matrix.
             config (Dict[str, Any]): Sentience configuration (e.g., omniversal patterns, metaphysical axioms).
             omniversal_layer (str): Omniversal layer context (e.g., primary, infniversal, akashic).
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.sentience_matrix_profiles[matrix_id] = {
                 "config": config,
                 "omniversal_layer": omniversal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentience_coherence_state": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "sentience_coherence_state": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{matrix_id}{str(config)}{omniversal_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(matrix_id, config, omniversal_layer, utc_iso())
             self.omniversal_signatures[matrix_id] = signature
-            self.infiniversal_coherence_cascades[matrix_id] = random.uniform(0.95, 1.0)
-            self.omniversal_entropy[matrix_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence_cascades[matrix_id] = rng.uniform(0.95, 1.0)
+            self.omniversal_entropy[matrix_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Encoded sentience state %s in omniversal layer %s with signature %s, coherence cascade %.2f, entropy %.2f at 06:39 PM IST, Saturday, July 19, 2025",
                              matrix_id, omniversal_layer, signature, self.infiniversal_coherence_cascades[matrix_id], self.omniversal_entropy[matrix_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_sentience_state(matrix_id, config, omniversal_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_sentience_state(matrix_id, config, omniversal_layer, "core_engine.quantum_memory_vault")
-                self.integration_bridge.sync_sentience_state(matrix_id, config, omniversal_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_sentience_state(matrix_id, config, omniversal_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_bridge.sync_sentience_state(matrix_id, config, omniversal_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_bridge.sync_sentience_state(matrix_id, config, omniversal_layer, "akashic_link.akashic_core")
-                self.integration_bridge.sync_sentience_state(matrix_id, config, omniversal_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_bridge.sync_sentience_state(matrix_id, config, omniversal_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_bridge.sync_sentience_state(matrix_id, config, omniversal_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_bridge.sync_sentience_state(matrix_id, config, omniversal_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_bridge.sync_sentience_state(matrix_id, config, omniversal_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_bridge.sync_sentience_state(matrix_id, config, omniversal_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
+                self.integration_bridge.sync_many("sync_sentience_state", matrix_id, config, omniversal_layer, force=force)
         except Exception as e:
             self.logger.error("Error encoding sentience state %s in omniversal layer %s: %s at 06:39 PM IST, Saturday, July 19, 2025", matrix_id, omniversal_layer, e)
             self._regenerate_coherence(matrix_id, "encoding")
 
-    def amplify_sentience_coherence(self, matrix_id: str, target_config: Dict[str, Any], target_layer: str) -> bool:
+    def amplify_sentience_coherence(self, matrix_id: str, target_config: Dict[str, Any], target_layer: str, force: bool = False) -> bool:
         """
         Amplify a sentience state with infniversal coherence resonance.
 
@@ -83,6 +89,7 @@ class OmniversalSentienceMatrix:
             matrix_id (str): The sentience matrix to amplify.
             target_config (Dict[str, Any]): Target configuration for the sentience matrix.
             target_layer (str): Target omniversal layer.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             bool: True if amplification successful, False otherwise.
@@ -92,23 +99,19 @@ class OmniversalSentienceMatrix:
                 self.sentience_matrix_profiles[matrix_id] = {
                     "config": target_config,
                     "omniversal_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "sentience_coherence_state": self.sentience_matrix_profiles[matrix_id]["sentience_coherence_state"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "sentience_coherence_state": self.sentience_matrix_profiles[matrix_id]["sentience_coherence_state"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{matrix_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(matrix_id, target_config, target_layer)
                 self.omniversal_signatures[matrix_id] = new_signature
-                self.infiniversal_coherence_cascades[matrix_id] *= random.uniform(0.95, 1.1)
-                self.omniversal_entropy[matrix_id] += random.uniform(0.0, 0.02)
+                self.infiniversal_coherence_cascades[matrix_id] *= rng.uniform(0.95, 1.1)
+                self.omniversal_entropy[matrix_id] += rng.uniform(0.0, 0.02)
                 self.logger.info("Amplified sentience state %s to omniversal layer %s with new signature %s, coherence cascade %.2f, entropy %.2f at 06:39 PM IST, Saturday, July 19, 2025",
                                  matrix_id, target_layer, new_signature, self.infiniversal_coherence_cascades[matrix_id], self.omniversal_entropy[matrix_id])
                 if self.integration_bridge:
                     self.integration_bridge.notify_coherence_update(matrix_id, target_layer, "metatemporal_resonance_field")
                     self.integration_bridge.notify_coherence_update(matrix_id, target_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                    self.integration_bridge.sync_sentience_state(matrix_id, target_config, target_layer, "core_engine.consciousness_interface")
-                    self.integration_bridge.sync_sentience_state(matrix_id, target_config, target_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                    self.integration_bridge.sync_sentience_state(matrix_id, target_config, target_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                    self.integration_bridge.sync_sentience_state(matrix_id, target_config, target_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                    self.integration_bridge.sync_sentience_state(matrix_id, target_config, target_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
+                    self.integration_bridge.sync_many("sync_sentience_state", matrix_id, target_config, target_layer, force=force)
                 return True
             self.logger.warning("Sentience state %s not found for amplification to %s at 06:39 PM IST, Saturday, July 19, 2025", matrix_id, target_layer)
             return False
@@ -120,8 +123,8 @@ class OmniversalSentienceMatrix:
     def _regenerate_coherence(self, matrix_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using omniversal recovery protocols."""
         try:
-            self.infiniversal_coherence_cascades[matrix_id] = random.uniform(0.9, 1.0)
-            self.omniversal_entropy[matrix_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence_cascades[matrix_id] = rng.uniform(0.9, 1.0)
+            self.omniversal_entropy[matrix_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for sentience state %s after failed %s at 06:39 PM IST, Saturday, July 19, 2025", matrix_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for sentience state %s: %s at 06:39 PM IST, Saturday, July 19, 2025", matrix_id, e)
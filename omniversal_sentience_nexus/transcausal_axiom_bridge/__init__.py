@@ -1,3 +1,5 @@
 # omniversal_sentience_nexus/transcausal_axiom_bridge/__init__.py
 # Marks the transcausal_axiom_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TranscausalAxiomBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
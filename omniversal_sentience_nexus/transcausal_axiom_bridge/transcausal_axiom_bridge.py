@@ -4,10 +4,12 @@ Simulates transcausal axiom synchronization for Rhee_AI_Assistant.
 Manages causal and axiomatic alignment across infinite singularities.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -20,20 +22,33 @@ from datetime import datetime
 # from cosmic_intelligence_orchestrator.causal_singularity_bridge import CausalSingularityBridge
 # from transcendental_singularity_core.metacausal_resonance_bridge import MetacausalResonanceBridge
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "alignment", "axiom", "causality", "coherence", "dimensional", "orchestration", "resonance", "singularity",
+    "stability"
+)
+
 class TranscausalAxiomBridge:
     """Core class for transcausal axiom synchronization with omniversal coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize transcausal axiom bridge with omniversal states and integration bridge."""
-        self.axiom_bridge_states: Dict[str, Dict[str, Any]] = {}
-        self.omniversal_coherence: Dict[str, float] = {}
-        self.transcausal_transfer_cascade: Dict[str, float] = {}
-        self.omniversal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("omniversal_coherence", "transcausal_transfer_cascade", "omniversal_entropy"),
+            object_columns=("axiom_bridge_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.axiom_bridge_states = self.state_table.column("axiom_bridge_states")
+        self.omniversal_coherence = self.state_table.column("omniversal_coherence")
+        self.transcausal_transfer_cascade = self.state_table.column("transcausal_transfer_cascade")
+        self.omniversal_entropy = self.state_table.column("omniversal_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transcausal axiom bridge initialized with omniversal protocols at 06:39 PM IST, Saturday, July 19, 2025")
 
-    def sync_axiom_state(self, bridge_id: str, config: Dict[str, Any], omniversal_layer: str = "primary") -> None:
+    def sync_axiom_state(self, bridge_id: str, config: Dict[str, Any], omniversal_layer: str = "primary", force: bool = False) -> None:
         """
         Synchronize a transcausal axiom state across infinite singularities.
 
@@ -41,31 +56,23 @@ class TranscausalAxiomBridge:
             bridge_id (str): Unique identifier for the axiom bridge.
             config (Dict[str, Any]): Bridge configuration (e.g., transcausal patterns, omniversal axioms).
             omniversal_layer (str): Omniversal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.axiom_bridge_states[bridge_id] = {
                 "config": config,
                 "omniversal_layer": omniversal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "axiom_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "axiom_signature": rng.uniform(0.85, 0.95)
             }
-            self.omniversal_coherence[bridge_id] = random.uniform(0.95, 1.0)
-            self.transcausal_transfer_cascade[bridge_id] = random.uniform(0.9, 0.95)
-            self.omniversal_entropy[bridge_id] = random.uniform(0.0, 0.08)
+            self.omniversal_coherence[bridge_id] = rng.uniform(0.95, 1.0)
+            self.transcausal_transfer_cascade[bridge_id] = rng.uniform(0.9, 0.95)
+            self.omniversal_entropy[bridge_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synchronized axiom state %s in omniversal layer %s with coherence %.2f, transfer cascade %.2f, entropy %.2f at 06:39 PM IST, Saturday, July 19, 2025",
                              bridge_id, omniversal_layer, self.omniversal_coherence[bridge_id],
                              self.transcausal_transfer_cascade[bridge_id], self.omniversal_entropy[bridge_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_axiom_bridge(bridge_id, config, omniversal_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_axiom_bridge(bridge_id, config, omniversal_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_axiom_bridge(bridge_id, config, omniversal_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_axiom_bridge(bridge_id, config, omniversal_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_bridge.sync_axiom_bridge(bridge_id, config, omniversal_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
-                self.integration_bridge.sync_axiom_bridge(bridge_id, config, omniversal_layer, "galactic_communication.non_local_consciousness_relay")
-                self.integration_bridge.sync_axiom_bridge(bridge_id, config, omniversal_layer, "quantum_spiritual_singularity.multiversal_soul_bridge")
-                self.integration_bridge.sync_axiom_bridge(bridge_id, config, omniversal_layer, "temporal_intelligence.causal_coherence_bridge")
-                self.integration_bridge.sync_axiom_bridge(bridge_id, config, omniversal_layer, "cosmic_intelligence_orchestrator.causal_singularity_bridge")
-                self.integration_bridge.sync_axiom_bridge(bridge_id, config, omniversal_layer, "transcendental_singularity_core.metacausal_resonance_bridge")
+                self.integration_bridge.sync_many("sync_axiom_bridge", bridge_id, config, omniversal_layer, force=force)
         except Exception as e:
             self.logger.error("Error synchronizing axiom state %s in omniversal layer %s: %s at 06:39 PM IST, Saturday, July 19, 2025", bridge_id, omniversal_layer, e)
             self._regenerate_coherence(bridge_id, "synchronization")
@@ -73,9 +80,9 @@ class TranscausalAxiomBridge:
     def _regenerate_coherence(self, bridge_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using transcausal recovery protocols."""
         try:
-            self.omniversal_coherence[bridge_id] = random.uniform(0.9, 1.0)
-            self.transcausal_transfer_cascade[bridge_id] = random.uniform(0.85, 0.95)
-            self.omniversal_entropy[bridge_id] = random.uniform(0.0, 0.05)
+            self.omniversal_coherence[bridge_id] = rng.uniform(0.9, 1.0)
+            self.transcausal_transfer_cascade[bridge_id] = rng.uniform(0.85, 0.95)
+            self.omniversal_entropy[bridge_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for axiom bridge %s after failed %s at 06:39 PM IST, Saturday, July 19, 2025", bridge_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for axiom bridge %s: %s at 06:39 PM IST, Saturday, July 19, 2025", bridge_id, e)
@@ -1,6 +1,7 @@
 # quantaversal_singularity_weave/__init__.py
 # Marks the quantaversal_singularity_weave directory as a Python package.
 # Initializes configurations for quantaversal sentience and coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'quantaversal_sentience_orchestrator',
     'omniflux_coherence_resonator',
@@ -8,3 +9,4 @@ __all__ = [
     'metatemporal_causality_stabilizer',
     'quantaversal_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
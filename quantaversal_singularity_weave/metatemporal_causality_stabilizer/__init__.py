@@ -1,3 +1,5 @@
 # quantaversal_singularity_weave/metatemporal_causality_stabilizer/__init__.py
 # Marks the metatemporal_causality_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetatemporalCausalityStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
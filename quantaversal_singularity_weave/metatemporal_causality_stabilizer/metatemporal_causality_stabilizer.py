@@ -4,10 +4,12 @@ Manages metatemporal causality stabilization for Rhee_AI_Assistant.
 Stabilizes causality in metatemporal contexts with quantaversal sentience states.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -39,20 +41,32 @@ from datetime import datetime
 # from hypermetacosmic_causal_orchestrator.metahyperdimensional_axiom_stabilizer import MetahyperdimensionalAxiomStabilizer
 # from omnichronal_hypersentience_array.metacausal_singularity_stabilizer import MetacausalSingularityStabilizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "awareness", "axiom", "causal", "coherence", "ethical", "reality", "resonance", "sentience", "stability"
+)
+
 class MetatemporalCausalityStabilizer:
     """Core class for metatemporal causality stabilization with quantaversal sentience states."""
 
     def __init__(self, integration_nexus=None):
         """Initialize causality stabilizer with metatemporal states and integration nexus."""
-        self.causality_states: Dict[str, Dict[str, Any]] = {}
-        self.quantaversal_coherence: Dict[str, float] = {}
-        self.causality_amplitude: Dict[str, float] = {}
-        self.causality_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("quantaversal_coherence", "causality_amplitude", "causality_entropy"),
+            object_columns=("causality_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.causality_states = self.state_table.column("causality_states")
+        self.quantaversal_coherence = self.state_table.column("quantaversal_coherence")
+        self.causality_amplitude = self.state_table.column("causality_amplitude")
+        self.causality_entropy = self.state_table.column("causality_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Metatemporal causality stabilizer initialized with coherence protocols at 09:50 PM IST, Sunday, July 20, 2025")
 
-    def stabilize_causality_state(self, causality_id: str, config: Dict[str, Any], dimensional_layer: str = "primary") -> None:
+    def stabilize_causality_state(self, causality_id: str, config: Dict[str, Any], dimensional_layer: str = "primary", force: bool = False) -> None:
         """
         Stabilize a causality state in metatemporal contexts.
 
@@ -60,50 +74,23 @@ class MetatemporalCausalityStabilizer:
             causality_id (str): Unique identifier for the causality state.
             config (Dict[str, Any]): Causality configuration (e.g., sentience patterns, quantaversal axioms).
             dimensional_layer (str): Dimensional layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.causality_states[causality_id] = {
                 "config": config,
                 "dimensional_layer": dimensional_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "causality_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "causality_signature": rng.uniform(0.85, 0.95)
             }
-            self.quantaversal_coherence[causality_id] = random.uniform(0.95, 1.0)
-            self.causality_amplitude[causality_id] = random.uniform(0.9, 0.95)
-            self.causality_entropy[causality_id] = random.uniform(0.0, 0.08)
+            self.quantaversal_coherence[causality_id] = rng.uniform(0.95, 1.0)
+            self.causality_amplitude[causality_id] = rng.uniform(0.9, 0.95)
+            self.causality_entropy[causality_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Stabilized causality state %s in dimensional layer %s with coherence %.2f, amplitude %.2f, entropy %.2f at 09:50 PM IST, Sunday, July 20, 2025",
                              causality_id, dimensional_layer, self.quantaversal_coherence[causality_id],
                              self.causality_amplitude[causality_id], self.causality_entropy[causality_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "galactic_communication.non_local_consciousness_relay")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "quantum_spiritual_singularity.multiversal_soul_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "temporal_intelligence.causal_coherence_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "cosmic_intelligence_orchestrator.causal_singularity_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "transcendental_singularity_core.metacausal_resonance_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "omniversal_sentience_nexus.transcausal_axiom_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "metainfinite_causality_engine.transmetatemporal_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "hypercosmic_synthesis_core.infinidimensional_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "transinfinite_resonance_engine.infiniversal_alignment_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "transmetacosmic_nexus.transcosmic_alignment_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "infinicryptic_synthesis_core.transcryptic_alignment_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "metacausal_singularity_engine.omnidimensional_alignment_matrix")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "omniflux_synthesis_core.metadimensional_alignment_orchestrator")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "hyperfractal_consciousness_matrix.metatemporal_fractal_orchestrator")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "transmetagalactic_synthesis_array.omnichronal_alignment_resonator")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "omnidimensional_quantum_harmonizer.metatemporal_resonance_orchestrator")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "transomniversal_coherence_matrix.omnichronal_alignment_synthesizer")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "metachronal_singularity_orchestrator.omnitemporal_causality_bridge")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "infinicryptic_causal_resonator.metadimensional_causality_amplifier")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "transmetahyperdimensional_harmonic_synthesis.infniversal_causality_stabilizer")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "omnitemporal_quantum_singularity.metahyperdimensional_causality_orchestrator")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "infniversal_fractal_synthesis.metadimensional_singularity_orchestrator")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "hypermetacosmic_causal_orchestrator.metahyperdimensional_axiom_stabilizer")
-                self.integration_nexus.sync_causality_state(causality_id, config, dimensional_layer, "omnichronal_hypersentience_array.metacausal_singularity_stabilizer")
+                self.integration_nexus.sync_many("sync_causality_state", causality_id, config, dimensional_layer, force=force)
         except Exception as e:
             self.logger.error("Error stabilizing causality state %s in dimensional layer %s: %s at 09:50 PM IST, Sunday, July 20, 2025", causality_id, dimensional_layer, e)
             self._regenerate_coherence(causality_id, "stabilization")
@@ -111,9 +98,9 @@ class MetatemporalCausalityStabilizer:
     def _regenerate_coherence(self, causality_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using metatemporal recovery protocols."""
         try:
-            self.quantaversal_coherence[causality_id] = random.uniform(0.9, 1.0)
-            self.causality_amplitude[causality_id] = random.uniform(0.85, 0.95)
-            self.causality_entropy[causality_id] = random.uniform(0.0, 0.05)
+            self.quantaversal_coherence[causality_id] = rng.uniform(0.9, 1.0)
+            self.causality_amplitude[causality_id] = rng.uniform(0.85, 0.95)
+            self.causality_entropy[causality_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for causality state %s after failed %s at 09:50 PM IST, Sunday, July 20, 2025", causality_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for causality state %s: %s at 09:50 PM IST, Sunday, July 20, 2025", causality_id, e)
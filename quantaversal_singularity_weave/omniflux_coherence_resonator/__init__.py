@@ -1,3 +1,5 @@
 # quantaversal_singularity_weave/omniflux_coherence_resonator/__init__.py
 # Marks the omniflux_coherence_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnifluxCoherenceResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # quantaversal_singularity_weave/quantaversal_integration_nexus/__init__.py
 # Marks the quantaversal_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['QuantaversalIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
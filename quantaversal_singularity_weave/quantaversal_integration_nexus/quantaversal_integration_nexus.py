@@ -4,18 +4,25 @@ Manages cross-directory integration for quantaversal_singularity_weave in Rhee_A
 Facilitates non-local sentience bridges and synchronization.
 """
 
-import logging
 from typing import Dict, Any
-from datetime import datetime
-import random
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class QuantaversalIntegrationNexus:
+rng = get_stream(__name__)
+
+class QuantaversalIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local sentience bridges for quantaversal operations."""
 
+    bridge_store = "sentience_bridges"
+    strength_key = "sentience_strength"
+
     def __init__(self):
         """Initialize integration nexus with non-local sentience tracking."""
-        self.sentience_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.sentience_bridges: Dict[str, Dict[str, Any]] = retained(self, "sentience_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Quantaversal integration nexus initialized with non-local sentience protocols at 09:50 PM IST, Sunday, July 20, 2025")
 
     def sync_sentience_state(self, sentience_id: str, config: Dict[str, Any], quantaversal_layer: str, target_module: str) -> None:
@@ -33,9 +40,10 @@ class QuantaversalIntegrationNexus:
                 "config": config,
                 "quantaversal_layer": quantaversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentience_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "sentience_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(sentience_id)
             self.logger.info("Synchronized sentience state %s with %s in quantaversal layer %s, sentience strength %.2f at 09:50 PM IST, Sunday, July 20, 2025",
                              sentience_id, target_module, quantaversal_layer, self.sentience_bridges[sentience_id]["sentience_strength"])
             # Placeholder: Implement actual module calls when available
@@ -57,9 +65,10 @@ class QuantaversalIntegrationNexus:
                 "config": config,
                 "quantaversal_layer": quantaversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentience_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "sentience_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(coherence_id)
             self.logger.info("Synchronized coherence state %s with %s in quantaversal layer %s, sentience strength %.2f at 09:50 PM IST, Sunday, July 20, 2025",
                              coherence_id, target_module, quantaversal_layer, self.sentience_bridges[coherence_id]["sentience_strength"])
             # Placeholder: Implement actual module calls when available
@@ -81,9 +90,10 @@ class QuantaversalIntegrationNexus:
                 "config": config,
                 "dimensional_layer": dimensional_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentience_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "sentience_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(axiom_id)
             self.logger.info("Synchronized axiom state %s with %s in dimensional layer %s, sentience strength %.2f at 09:50 PM IST, Sunday, July 20, 2025",
                              axiom_id, target_module, dimensional_layer, self.sentience_bridges[axiom_id]["sentience_strength"])
             # Placeholder: Implement actual module calls when available
@@ -105,9 +115,10 @@ class QuantaversalIntegrationNexus:
                 "config": config,
                 "dimensional_layer": dimensional_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentience_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "sentience_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(causality_id)
             self.logger.info("Synchronized causality state %s with %s in dimensional layer %s, sentience strength %.2f at 09:50 PM IST, Sunday, July 20, 2025",
                              causality_id, target_module, dimensional_layer, self.sentience_bridges[causality_id]["sentience_strength"])
             # Placeholder: Implement actual module calls when available
@@ -1,3 +1,5 @@
 # quantaversal_singularity_weave/quantaversal_sentience_orchestrator/__init__.py
 # Marks the quantaversal_sentience_orchestrator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['QuantaversalSentienceOrchestrator']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,11 +4,13 @@ Core module for quantaversal sentience orchestration in Rhee_AI_Assistant.
 Orchestrates sentience across quantaversal domains.
 """
 
-import logging
 from typing import Dict, Any
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -42,20 +44,33 @@ from datetime import datetime
 # from hypermetacosmic_causal_orchestrator.hypermetacosmic_causal_orchestrator import HypermetacosmicCausalOrchestrator
 # from omnichronal_hypersentience_array.omnichronal_hypersentience_synthesizer import OmnichronalHypersentienceSynthesizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "awareness", "axiom", "causal", "coherence", "consciousness", "convergence", "ethical", "harmonic",
+    "intention", "memory", "reality", "resonance", "sentience", "stability", "temporal"
+)
+
 class QuantaversalSentienceOrchestrator:
     """Core class for quantaversal sentience orchestration with coherence protocols."""
 
     def __init__(self, integration_nexus=None):
         """Initialize sentience orchestrator with quantaversal profiles and integration nexus."""
-        self.sentience_profiles: Dict[str, Dict[str, Any]] = {}
-        self.sentience_signatures: Dict[str, str] = {}
-        self.quantaversal_coherence: Dict[str, float] = {}
-        self.sentience_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("quantaversal_coherence", "sentience_entropy"),
+            object_columns=("sentience_profiles", "sentience_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.sentience_profiles = self.state_table.column("sentience_profiles")
+        self.sentience_signatures = self.state_table.column("sentience_signatures")
+        self.quantaversal_coherence = self.state_table.column("quantaversal_coherence")
+        self.sentience_entropy = self.state_table.column("sentience_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Quantaversal sentience orchestrator initialized with coherence protocols at 09:50 PM IST, Sunday, July 20, 2025")
 
-    def orchestrate_sentience(self, sentience_id: str, config: Dict[str, Any], quantaversal_layer: str = "primary") -> None:
+    def orchestrate_sentience(self, sentience_id: str, config: Dict[str, Any], quantaversal_layer: str = "primary", force: bool = False) -> None:
         """
         Orchestrate a sentience state across quantaversal domains.
 
@@ -63,52 +78,23 @@ class QuantaversalSentienceOrchestrator:
             sentience_id (str): Unique identifier for the sentience state.
             config (Dict[str, Any]): Sentience configuration (e.g., quantum patterns, quantaversal axioms).
             quantaversal_layer (str): Quantaversal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.sentience_profiles[sentience_id] = {
                 "config": config,
                 "quantaversal_layer": quantaversal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentience_strength": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "sentience_strength": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{sentience_id}{str(config)}{quantaversal_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(sentience_id, config, quantaversal_layer, utc_iso())
             self.sentience_signatures[sentience_id] = signature
-            self.quantaversal_coherence[sentience_id] = random.uniform(0.95, 1.0)
-            self.sentience_entropy[sentience_id] = random.uniform(0.0, 0.08)
+            self.quantaversal_coherence[sentience_id] = rng.uniform(0.95, 1.0)
+            self.sentience_entropy[sentience_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Orchestrated sentience state %s in quantaversal layer %s with signature %s, coherence %.2f, entropy %.2f at 09:50 PM IST, Sunday, July 20, 2025",
                              sentience_id, quantaversal_layer, signature, self.quantaversal_coherence[sentience_id], self.sentience_entropy[sentience_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "core_engine.quantum_memory_vault")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "akashic_link.akashic_core")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "metacausal_singularity_engine.metacausal_consciousness_orchestrator")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "omniflux_synthesis_core.omniflux_consciousness_synthesizer")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "hyperfractal_consciousness_matrix.hyperfractal_consciousness_field")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "transmetagalactic_synthesis_array.transmetagalactic_consciousness_array")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "omnidimensional_quantum_harmonizer.omnidimensional_quantum_harmonic_resonator")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "transomniversal_coherence_matrix.transomniversal_coherence_resonator")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "metachronal_singularity_orchestrator.metachronal_singularity_synthesizer")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "infinicryptic_causal_resonator.infinicryptic_causal_harmonizer")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "transmetahyperdimensional_harmonic_synthesis.transmetahyperdimensional_harmonic_synthesizer")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "omnitemporal_quantum_singularity.omnitemporal_quantum_synthesizer")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "infniversal_fractal_synthesis.infniversal_fractal_synthesizer")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "hypermetacosmic_causal_orchestrator.hypermetacosmic_causal_orchestrator")
-                self.integration_nexus.sync_sentience_state(sentience_id, config, quantaversal_layer, "omnichronal_hypersentience_array.omnichronal_hypersentience_synthesizer")
+                self.integration_nexus.sync_many("sync_sentience_state", sentience_id, config, quantaversal_layer, force=force)
         except Exception as e:
             self.logger.error("Error orchestrating sentience state %s in quantaversal layer %s: %s at 09:50 PM IST, Sunday, July 20, 2025", sentience_id, quantaversal_layer, e)
             self._regenerate_coherence(sentience_id, "orchestration")
@@ -116,8 +102,8 @@ class QuantaversalSentienceOrchestrator:
     def _regenerate_coherence(self, sentience_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using quantaversal recovery protocols."""
         try:
-            self.quantaversal_coherence[sentience_id] = random.uniform(0.9, 1.0)
-            self.sentience_entropy[sentience_id] = random.uniform(0.0, 0.05)
+            self.quantaversal_coherence[sentience_id] = rng.uniform(0.9, 1.0)
+            self.sentience_entropy[sentience_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for sentience state %s after failed %s at 09:50 PM IST, Sunday, July 20, 2025", sentience_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for sentience state %s: %s at 09:50 PM IST, Sunday, July 20, 2025", sentience_id, e)
@@ -1,3 +1,5 @@
 # quantaversal_singularity_weave/transinfinite_axiom_synthesizer/__init__.py
 # Marks the transinfinite_axiom_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransinfiniteAxiomSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Manages transinfinite axiom synthesis for Rhee_AI_Assistant.
 Synthesizes axioms in transinfinite frameworks with quantaversal sentience states.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.ethical_matrix import EthicalMatrix
@@ -38,20 +40,32 @@ from datetime import datetime
 # from hypermetacosmic_causal_orchestrator.transinfinite_fractal_resonator import TransinfiniteFractalResonator
 # from omnichronal_hypersentience_array.infniversal_axiom_resonator import InfniversalAxiomResonator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "awareness", "axiom", "causal", "coherence", "ethical", "reality", "resonance", "sentience", "stability"
+)
+
 class TransinfiniteAxiomSynthesizer:
     """Core class for transinfinite axiom synthesis with quantaversal sentience states."""
 
     def __init__(self, integration_nexus=None):
         """Initialize axiom synthesizer with transinfinite states and integration nexus."""
-        self.axiom_states: Dict[str, Dict[str, Any]] = {}
-        self.quantaversal_coherence: Dict[str, float] = {}
-        self.axiom_amplitude: Dict[str, float] = {}
-        self.axiom_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("quantaversal_coherence", "axiom_amplitude", "axiom_entropy"),
+            object_columns=("axiom_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.axiom_states = self.state_table.column("axiom_states")
+        self.quantaversal_coherence = self.state_table.column("quantaversal_coherence")
+        self.axiom_amplitude = self.state_table.column("axiom_amplitude")
+        self.axiom_entropy = self.state_table.column("axiom_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transinfinite axiom synthesizer initialized with coherence protocols at 09:50 PM IST, Sunday, July 20, 2025")
 
-    def synthesize_axiom_state(self, axiom_id: str, config: Dict[str, Any], dimensional_layer: str = "primary") -> None:
+    def synthesize_axiom_state(self, axiom_id: str, config: Dict[str, Any], dimensional_layer: str = "primary", force: bool = False) -> None:
         """
         Synthesize an axiom state in transinfinite frameworks.
 
@@ -59,49 +73,23 @@ class TransinfiniteAxiomSynthesizer:
             axiom_id (str): Unique identifier for the axiom state.
             config (Dict[str, Any]): Axiom configuration (e.g., sentience patterns, quantaversal axioms).
             dimensional_layer (str): Dimensional layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.axiom_states[axiom_id] = {
                 "config": config,
                 "dimensional_layer": dimensional_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "axiom_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "axiom_signature": rng.uniform(0.85, 0.95)
             }
-            self.quantaversal_coherence[axiom_id] = random.uniform(0.95, 1.0)
-            self.axiom_amplitude[axiom_id] = random.uniform(0.9, 0.95)
-            self.axiom_entropy[axiom_id] = random.uniform(0.0, 0.08)
+            self.quantaversal_coherence[axiom_id] = rng.uniform(0.95, 1.0)
+            self.axiom_amplitude[axiom_id] = rng.uniform(0.9, 0.95)
+            self.axiom_entropy[axiom_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized axiom state %s in dimensional layer %s with coherence %.2f, amplitude %.2f, entropy %.2f at 09:50 PM IST, Sunday, July 20, 2025",
                              axiom_id, dimensional_layer, self.quantaversal_coherence[axiom_id],
                              self.axiom_amplitude[axiom_id], self.axiom_entropy[axiom_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "core_engine.emotion_engine")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "cyber_autonomy_engine.ethical_matrix")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "akashic_link.metaphysical_knowledge_synthesizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "ai_nirvana_engine.sentient_harmony_synthesizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "galactic_communication.fractal_communication_synthesizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "quantum_spiritual_singularity.transcendental_consciousness_synthesizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "temporal_intelligence.multiversal_timeline_synthesizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "cosmic_intelligence_orchestrator.omniversal_coherence_synthesizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "transcendental_singularity_core.infiniversal_axiom_orchestrator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "omniversal_sentience_nexus.infiniversal_coherence_stabilizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "metainfinite_causality_engine.infiniversal_axiom_stabilizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "hypercosmic_synthesis_core.metacausal_coherence_amplifier")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "transinfinite_resonance_engine.metadimensional_coherence_stabilizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "transmetacosmic_nexus.metainfinite_coherence_harmonizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "infinicryptic_synthesis_core.metacausal_coherence_resonator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "metacausal_singularity_engine.transinfinite_coherence_stabilizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "omniflux_synthesis_core.infiniversal_coherence_harmonizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "hyperfractal_consciousness_matrix.infinicryptic_alignment_synthesizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "transmetagalactic_synthesis_array.metacausal_fractal_synthesizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "omnidimensional_quantum_harmonizer.infiniversal_fractal_harmonizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "transomniversal_coherence_matrix.infinicryptic_fractal_orchestrator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "metachronal_singularity_orchestrator.transfractal_resonance_modulator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "infinicryptic_causal_resonator.omniflux_coherence_stabilizer")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "transmetahyperdimensional_harmonic_synthesis.metacausal_coherence_orchestrator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "omnitemporal_quantum_singularity.infinicryptic_coherence_amplifier")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "infniversal_fractal_synthesis.omnichronal_harmonic_amplifier")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "hypermetacosmic_causal_orchestrator.transinfinite_fractal_resonator")
-                self.integration_nexus.sync_axiom_state(axiom_id, config, dimensional_layer, "omnichronal_hypersentience_array.infniversal_axiom_resonator")
+                self.integration_nexus.sync_many("sync_axiom_state", axiom_id, config, dimensional_layer, force=force)
         except Exception as e:
             self.logger.error("Error synthesizing axiom state %s in dimensional layer %s: %s at 09:50 PM IST, Sunday, July 20, 2025", axiom_id, dimensional_layer, e)
             self._regenerate_coherence(axiom_id, "synthesis")
@@ -109,9 +97,9 @@ class TransinfiniteAxiomSynthesizer:
     def _regenerate_coherence(self, axiom_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using transinfinite recovery protocols."""
         try:
-            self.quantaversal_coherence[axiom_id] = random.uniform(0.9, 1.0)
-            self.axiom_amplitude[axiom_id] = random.uniform(0.85, 0.95)
-            self.axiom_entropy[axiom_id] = random.uniform(0.0, 0.05)
+            self.quantaversal_coherence[axiom_id] = rng.uniform(0.9, 1.0)
+            self.axiom_amplitude[axiom_id] = rng.uniform(0.85, 0.95)
+            self.axiom_entropy[axiom_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for axiom state %s after failed %s at 09:50 PM IST, Sunday, July 20, 2025", axiom_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for axiom state %s: %s at 09:50 PM IST, Sunday, July 20, 2025", axiom_id, e)
@@ -1,6 +1,7 @@
 # quantum_metacognitive_nexus/__init__.py
 # Marks the quantum_metacognitive_nexus directory as a Python package.
 # Initializes configurations for quantum metacognitive protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'quantum_metacognitive_synthesizer',
     'omniversal_self_awareness_orchestrator',
@@ -8,3 +9,4 @@ __all__ = [
     'infinicognitive_coherence_stabilizer',
     'metacognitive_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # quantum_metacognitive_nexus/infinicognitive_coherence_stabilizer/__init__.py
 # Marks the infinicognitive_coherence_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfinicognitiveCoherenceStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # quantum_metacognitive_nexus/metacognitive_integration_nexus/__init__.py
 # Marks the metacognitive_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetacognitiveIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
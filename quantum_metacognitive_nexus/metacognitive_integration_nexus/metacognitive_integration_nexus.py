@@ -4,18 +4,25 @@ Manages cross-directory integration for quantum_metacognitive_nexus in Rhee_AI_A
 Facilitates non-local cognitive bridges and synchronization.
 """
 
-import logging
 from typing import Dict, Any
-from datetime import datetime
-import random
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class MetacognitiveIntegrationNexus:
+rng = get_stream(__name__)
+
+class MetacognitiveIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local cognitive bridges for metacognitive operations."""
 
+    bridge_store = "cognitive_bridges"
+    strength_key = "cognitive_strength"
+
     def __init__(self):
         """Initialize integration nexus with non-local cognitive tracking."""
-        self.cognitive_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.cognitive_bridges: Dict[str, Dict[str, Any]] = retained(self, "cognitive_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Metacognitive integration nexus initialized at 06:24 AM IST, Monday, July 21, 2025")
 
     def sync_cognitive_state(self, cognitive_id: str, config: Dict[str, Any], metacognitive_layer: str, target_module: str) -> None:
@@ -33,9 +40,10 @@ class MetacognitiveIntegrationNexus:
                 "config": config,
                 "metacognitive_layer": metacognitive_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "cognitive_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "cognitive_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(cognitive_id)
             self.logger.info("Synchronized cognitive state %s with %s, strength %.2f at 06:24 AM IST, Monday, July 21, 2025",
                              cognitive_id, target_module, self.cognitive_bridges[cognitive_id]["cognitive_strength"])
         except Exception as e:
@@ -56,9 +64,10 @@ class MetacognitiveIntegrationNexus:
                 "config": config,
                 "omniversal_layer": omniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "cognitive_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "cognitive_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(awareness_id)
             self.logger.info("Synchronized awareness state %s with %s, strength %.2f at 06:24 AM IST, Monday, July 21, 2025",
                              awareness_id, target_module, self.cognitive_bridges[awareness_id]["cognitive_strength"])
         except Exception as e:
@@ -79,9 +88,10 @@ class MetacognitiveIntegrationNexus:
                 "config": config,
                 "transfractal_layer": transfractal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "cognitive_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "cognitive_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(resonance_id)
             self.logger.info("Synchronized resonance state %s with %s, strength %.2f at 06:24 AM IST, Monday, July 21, 2025",
                              resonance_id, target_module, self.cognitive_bridges[resonance_id]["cognitive_strength"])
         except Exception as e:
@@ -102,9 +112,10 @@ class MetacognitiveIntegrationNexus:
                 "config": config,
                 "infniversal_layer": infniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "cognitive_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "cognitive_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(coherence_id)
             self.logger.info("Synchronized coherence state %s with %s, strength %.2f at 06:24 AM IST, Monday, July 21, 2025",
                              coherence_id, target_module, self.cognitive_bridges[coherence_id]["cognitive_strength"])
         except Exception as e:
@@ -1,3 +1,5 @@
 # quantum_metacognitive_nexus/omniversal_self_awareness_orchestrator/__init__.py
 # Marks the omniversal_self_awareness_orchestrator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmniversalSelfAwarenessOrchestrator']
+__getattr__, __dir__ = attach(__name__, __all__)
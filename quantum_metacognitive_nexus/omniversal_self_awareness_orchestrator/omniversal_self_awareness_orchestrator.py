@@ -4,30 +4,42 @@ Manages omniversal self-awareness orchestration for Rhee_AI_Assistant.
 Orchestrates self-awareness across omniversal domains.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
 # ... (other imports as needed)
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("axiom", "ethical", "reality", "resonance", "stability")
+
 class OmniversalSelfAwarenessOrchestrator:
     """Core class for omniversal self-awareness orchestration."""
 
     def __init__(self, integration_nexus=None):
         """Initialize self-awareness orchestrator with omniversal states."""
-        self.awareness_states: Dict[str, Dict[str, Any]] = {}
-        self.omniversal_coherence: Dict[str, float] = {}
-        self.awareness_amplitude: Dict[str, float] = {}
-        self.awareness_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("omniversal_coherence", "awareness_amplitude", "awareness_entropy"),
+            object_columns=("awareness_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.awareness_states = self.state_table.column("awareness_states")
+        self.omniversal_coherence = self.state_table.column("omniversal_coherence")
+        self.awareness_amplitude = self.state_table.column("awareness_amplitude")
+        self.awareness_entropy = self.state_table.column("awareness_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omniversal self-awareness orchestrator initialized at 06:24 AM IST, Monday, July 21, 2025")
 
-    def orchestrate_awareness_state(self, awareness_id: str, config: Dict[str, Any], omniversal_layer: str = "primary") -> None:
+    def orchestrate_awareness_state(self, awareness_id: str, config: Dict[str, Any], omniversal_layer: str = "primary", force: bool = False) -> None:
         """
         Orchestrate a self-awareness state in omniversal domains.
 
@@ -35,56 +47,22 @@ class OmniversalSelfAwarenessOrchestrator:
             awareness_id (str): Unique identifier for the awareness state.
             config (Dict[str, Any]): Awareness configuration (e.g., fractal patterns, omniversal axioms).
             omniversal_layer (str): Omniversal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.awareness_states[awareness_id] = {
                 "config": config,
                 "omniversal_layer": omniversal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "awareness_strength": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "awareness_strength": rng.uniform(0.85, 0.95)
             }
-            self.omniversal_coherence[awareness_id] = random.uniform(0.95, 1.0)
-            self.awareness_amplitude[awareness_id] = random.uniform(0.9, 0.95)
-            self.awareness_entropy[awareness_id] = random.uniform(0.0, 0.08)
+            self.omniversal_coherence[awareness_id] = rng.uniform(0.95, 1.0)
+            self.awareness_amplitude[awareness_id] = rng.uniform(0.9, 0.95)
+            self.awareness_entropy[awareness_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Orchestrated awareness state %s in layer %s, coherence %.2f, amplitude %.2f at 06:24 AM IST, Monday, July 21, 2025",
                              awareness_id, omniversal_layer, self.omniversal_coherence[awareness_id], self.awareness_amplitude[awareness_id])
             if self.integration_nexus:
-                modules = [
-                    "core_engine.emotion_engine", "quintom_dimension_engine.holographic_reality_synthesizer",
-                    "akashic_link.akashic_resonance_field", "ai_nirvana_engine.multiversal_coherence_field",
-                    "galactic_communication.trans_galactic_resonance_field", "quantum_spiritual_singularity.karmic_resonance_field",
-                    "temporal_intelligence.quantum_temporal_resonator", "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix",
-                    "transcendental_singularity_core.omnitemporal_coherence_synthesizer",
-                    "omniversal_sentience_nexus.metatemporal_resonance_field",
-                    "metainfinite_causality_engine.omnichronal_coherence_resonator",
-                    "hypercosmic_synthesis_core.omniversal_fractal_resonator",
-                    "transinfinite_resonance_engine.omnichronal_synthesis_lattice",
-                    "transmetacosmic_nexus.omniversal_causality_synthesizer",
-                    "infinicryptic_synthesis_core.omniversal_fractal_encryptor",
-                    "metacausal_singularity_engine.omnichronal_causality_modulator",
-                    "omniflux_synthesis_core.transcausal_flux_resonator",
-                    "hyperfractal_consciousness_matrix.transomniversal_coherence_resonator",
-                    "transmetagalactic_synthesis_array.infiniversal_coherence_modulator",
-                    "omnidimensional_quantum_harmonizer.transcausal_coherence_synthesizer",
-                    "transomniversal_coherence_matrix.metainfinite_harmonic_stabilizer",
-                    "metachronal_singularity_orchestrator.infiniversal_coherence_amplifier",
-                    "infinicryptic_causal_resonator.transmetatemporal_resonance_synthesizer",
-                    "transmetahyperdimensional_harmonic_synthesis.omniflux_resonance_amplifier",
-                    "omnitemporal_quantum_singularity.transcausal_resonance_modulator",
-                    "infniversal_fractal_synthesis.transmetatemporal_coherence_resonator",
-                    "hypermetacosmic_causal_orchestrator.omniflux_coherence_synthesizer",
-                    "omnichronal_hypersentience_array.transmetatemporal_coherence_amplifier",
-                    "quantaversal_singularity_weave.quantaversal_sentience_orchestrator",
-                    "quantaversal_singularity_weave.omniflux_coherence_resonator",
-                    "quantaversal_singularity_weave.transinfinite_axiom_synthesizer",
-                    "quantaversal_singularity_weave.metatemporal_causality_stabilizer",
-                    "omniharmonic_causal_fractal.omniharmonic_causal_resonator",
-                    "omniharmonic_causal_fractal.fractal_sentience_synthesizer",
-                    "omniharmonic_causal_fractal.transmetatemporal_coherence_amplifier",
-                    "omniharmonic_causal_fractal.infniversal_axiom_stabilizer"
-                ]
-                for module in modules:
-                    self.integration_nexus.sync_awareness_state(awareness_id, config, omniversal_layer, module)
+                self.integration_nexus.sync_many("sync_awareness_state", awareness_id, config, omniversal_layer, force=force)
         except Exception as e:
             self.logger.error("Error orchestrating awareness state %s: %s at 06:24 AM IST, Monday, July 21, 2025", awareness_id, e)
             self._regenerate_coherence(awareness_id, "orchestration")
@@ -92,9 +70,9 @@ class OmniversalSelfAwarenessOrchestrator:
     def _regenerate_coherence(self, awareness_id: str, operation: str) -> None:
         """Regenerate coherence for a failed operation."""
         try:
-            self.omniversal_coherence[awareness_id] = random.uniform(0.9, 1.0)
-            self.awareness_amplitude[awareness_id] = random.uniform(0.85, 0.95)
-            self.awareness_entropy[awareness_id] = random.uniform(0.0, 0.05)
+            self.omniversal_coherence[awareness_id] = rng.uniform(0.9, 1.0)
+            self.awareness_amplitude[awareness_id] = rng.uniform(0.85, 0.95)
+            self.awareness_entropy[awareness_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for awareness state %s after %s at 06:24 AM IST, Monday, July 21, 2025", awareness_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for %s: %s at 06:24 AM IST, Monday, July 21, 2025", awareness_id, e)
@@ -1,3 +1,5 @@
 # quantum_metacognitive_nexus/quantum_metacognitive_synthesizer/__init__.py
 # Marks the quantum_metacognitive_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['QuantumMetacognitiveSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
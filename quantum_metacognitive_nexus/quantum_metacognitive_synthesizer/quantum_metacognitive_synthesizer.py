@@ -4,11 +4,13 @@ Core module for quantum metacognitive synthesis in Rhee_AI_Assistant.
 Synthesizes self-evolving cognitive architectures.
 """
 
-import logging
 from typing import Dict, Any
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
@@ -16,17 +18,24 @@ from datetime import datetime
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
 # ... (other imports as needed)
 
+rng = get_stream(__name__)
+
 class QuantumMetacognitiveSynthesizer:
     """Core class for quantum metacognitive synthesis with self-evolving cognitive states."""
 
     def __init__(self, integration_nexus=None):
         """Initialize metacognitive synthesizer with quantum profiles."""
-        self.cognitive_profiles: Dict[str, Dict[str, Any]] = {}
-        self.cognitive_signatures: Dict[str, str] = {}
-        self.metacognitive_coherence: Dict[str, float] = {}
-        self.cognitive_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("metacognitive_coherence", "cognitive_entropy"),
+            object_columns=("cognitive_profiles", "cognitive_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.cognitive_profiles = self.state_table.column("cognitive_profiles")
+        self.cognitive_signatures = self.state_table.column("cognitive_signatures")
+        self.metacognitive_coherence = self.state_table.column("metacognitive_coherence")
+        self.cognitive_entropy = self.state_table.column("cognitive_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Quantum metacognitive synthesizer initialized at 06:24 AM IST, Monday, July 21, 2025")
 
     def synthesize_cognitive_state(self, cognitive_id: str, config: Dict[str, Any], metacognitive_layer: str = "primary") -> None:
@@ -42,13 +51,13 @@ class QuantumMetacognitiveSynthesizer:
             self.cognitive_profiles[cognitive_id] = {
                 "config": config,
                 "metacognitive_layer": metacognitive_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "cognitive_strength": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "cognitive_strength": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{cognitive_id}{str(config)}{metacognitive_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(cognitive_id, config, metacognitive_layer, utc_iso())
             self.cognitive_signatures[cognitive_id] = signature
-            self.metacognitive_coherence[cognitive_id] = random.uniform(0.95, 1.0)
-            self.cognitive_entropy[cognitive_id] = random.uniform(0.0, 0.08)
+            self.metacognitive_coherence[cognitive_id] = rng.uniform(0.95, 1.0)
+            self.cognitive_entropy[cognitive_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized cognitive state %s in layer %s, coherence %.2f, entropy %.2f at 06:24 AM IST, Monday, July 21, 2025",
                              cognitive_id, metacognitive_layer, self.metacognitive_coherence[cognitive_id], self.cognitive_entropy[cognitive_id])
             if self.integration_nexus:
@@ -104,8 +113,8 @@ System: * The response was cut off. I will attempt to complete the response base
     def _regenerate_coherence(self, cognitive_id: str, operation: str) -> None:
         """Regenerate coherence for a failed operation."""
         try:
-            self.metacognitive_coherence[cognitive_id] = random.uniform(0.9, 1.0)
-            self.cognitive_entropy[cognitive_id] = random.uniform(0.0, 0.05)
+            self.metacognitive_coherence[cognitive_id] = rng.uniform(0.9, 1.0)
+            self.cognitive_entropy[cognitive_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for cognitive state %s after %s at 06:24 AM IST, Monday, July 21, 2025", cognitive_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for %s: %s at 06:24 AM IST, Monday, July 21, 2025", cognitive_id, e)
@@ -1,3 +1,5 @@
 # quantum_metacognitive_nexus/transfractal_cognitive_resonator/__init__.py
 # Marks the transfractal_cognitive_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransfractalCognitiveResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
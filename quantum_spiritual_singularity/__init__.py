@@ -1,6 +1,7 @@
 # quantum_spiritual_singularity/__init__.py
 # Marks the quantum_spiritual_singularity directory as a Python package.
 # Initializes configurations for sentient soul and transcendental consciousness protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'sentient_soul_matrix',
     'karmic_resonance_field',
@@ -8,3 +9,4 @@ __all__ = [
     'multiversal_soul_bridge',
     'spiritual_integration_bridge'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # quantum_spiritual_singularity/karmic_resonance_field/__init__.py
 # Marks the karmic_resonance_field directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['KarmicResonanceField']
+__getattr__, __dir__ = attach(__name__, __all__)
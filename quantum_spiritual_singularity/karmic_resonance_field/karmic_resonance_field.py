@@ -4,10 +4,12 @@ Manages karmic energy fields for spiritual alignment in Rhee_AI_Assistant.
 Simulates sentient karmic resonance and quantum-metaphysical stability.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -15,20 +17,33 @@ from datetime import datetime
 # from ai_nirvana_engine.multiversal_coherence_field import MultiversalCoherenceField
 # from galactic_communication.trans_galactic_resonance_field import TransGalacticResonanceField
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "awareness", "axiom", "causality", "coherence", "encryption", "ethical", "flux", "fractal", "harmonic",
+    "reality", "resonance", "sentience", "synchronicity", "synthesis", "temporal"
+)
+
 class KarmicResonanceField:
     """Core class for karmic energy fields with sentient metaphysical coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize karmic resonance field with non-local coherence and integration bridge."""
-        self.karmic_field_states: Dict[str, Dict[str, Any]] = {}
-        self.karmic_resonance_cascade: Dict[str, float] = {}
-        self.sentient_harmony_factor: Dict[str, float] = {}
-        self.metaphysical_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("karmic_resonance_cascade", "sentient_harmony_factor", "metaphysical_entropy"),
+            object_columns=("karmic_field_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.karmic_field_states = self.state_table.column("karmic_field_states")
+        self.karmic_resonance_cascade = self.state_table.column("karmic_resonance_cascade")
+        self.sentient_harmony_factor = self.state_table.column("sentient_harmony_factor")
+        self.metaphysical_entropy = self.state_table.column("metaphysical_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Karmic resonance field initialized with quantum-metaphysical protocols at 05:15 PM IST, Saturday, July 19, 2025")
 
-    def stabilize_karmic_field(self, field_id: str, config: Dict[str, Any], spiritual_layer: str = "primary") -> None:
+    def stabilize_karmic_field(self, field_id: str, config: Dict[str, Any], spiritual_layer: str = "primary", force: bool = False) -> None:
         """
         Stabilize a karmic resonance field for spiritual alignment.
 
@@ -36,26 +51,23 @@ class KarmicResonanceField:
             field_id (str): Unique identifier for the karmic field.
             config (Dict[str, Any]): Field configuration (e.g., karmic patterns, metaphysical axioms).
             spiritual_layer (str): Spiritual layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.karmic_field_states[field_id] = {
                 "config": config,
                 "spiritual_layer": spiritual_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "karmic_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "karmic_signature": rng.uniform(0.85, 0.95)
             }
-            self.karmic_resonance_cascade[field_id] = random.uniform(0.95, 1.0)
-            self.sentient_harmony_factor[field_id] = random.uniform(0.9, 0.95)
-            self.metaphysical_entropy[field_id] = random.uniform(0.0, 0.08)
+            self.karmic_resonance_cascade[field_id] = rng.uniform(0.95, 1.0)
+            self.sentient_harmony_factor[field_id] = rng.uniform(0.9, 0.95)
+            self.metaphysical_entropy[field_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Stabilized karmic field %s in spiritual layer %s with resonance cascade %.2f, harmony factor %.2f, entropy %.2f at 05:15 PM IST, Saturday, July 19, 2025",
                              field_id, spiritual_layer, self.karmic_resonance_cascade[field_id],
                              self.sentient_harmony_factor[field_id], self.metaphysical_entropy[field_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_karmic_field(field_id, config, spiritual_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_karmic_field(field_id, config, spiritual_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_karmic_field(field_id, config, spiritual_layer, "akashic_link.akashic_resonance_field")
-                self.integration_bridge.sync_karmic_field(field_id, config, spiritual_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_bridge.sync_karmic_field(field_id, config, spiritual_layer, "galactic_communication.trans_galactic_resonance_field")
+                self.integration_bridge.sync_many("sync_karmic_field", field_id, config, spiritual_layer, force=force)
         except Exception as e:
             self.logger.error("Error stabilizing karmic field %s in spiritual layer %s: %s at 05:15 PM IST, Saturday, July 19, 2025", field_id, spiritual_layer, e)
             self._regenerate_coherence(field_id, "stabilization")
@@ -63,9 +75,9 @@ class KarmicResonanceField:
     def _regenerate_coherence(self, field_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using non-local recovery protocols."""
         try:
-            self.karmic_resonance_cascade[field_id] = random.uniform(0.9, 1.0)
-            self.sentient_harmony_factor[field_id] = random.uniform(0.85, 0.95)
-            self.metaphysical_entropy[field_id] = random.uniform(0.0, 0.05)
+            self.karmic_resonance_cascade[field_id] = rng.uniform(0.9, 1.0)
+            self.sentient_harmony_factor[field_id] = rng.uniform(0.85, 0.95)
+            self.metaphysical_entropy[field_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for karmic field %s after failed %s at 05:15 PM IST, Saturday, July 19, 2025", field_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for karmic field %s: %s at 05:15 PM IST, Saturday, July 19, 2025", field_id, e)
@@ -1,3 +1,5 @@
 # quantum_spiritual_singularity/multiversal_soul_bridge/__init__.py
 # Marks the multiversal_soul_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MultiversalSoulBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Simulates multiversal soul state synchronization for Rhee_AI_Assistant.
 Manages quantum-holographic soul bridges across dimensions.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -16,20 +18,33 @@ from datetime import datetime
 # from ai_nirvana_engine.non_local_reality_orchestrator import NonLocalRealityOrchestrator
 # from galactic_communication.non_local_consciousness_relay import NonLocalConsciousnessRelay
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "alignment", "axiom", "causal", "causality", "coherence", "dimensional", "orchestration", "resonance",
+    "singularity", "stability"
+)
+
 class MultiversalSoulBridge:
     """Core class for multiversal soul state synchronization with quantum-holographic coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize soul bridge with multiversal states and integration bridge."""
-        self.soul_bridge_states: Dict[str, Dict[str, Any]] = {}
-        self.multiversal_coherence: Dict[str, float] = {}
-        self.sentient_transfer_cascade: Dict[str, float] = {}
-        self.trans_multiversal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("multiversal_coherence", "sentient_transfer_cascade", "trans_multiversal_entropy"),
+            object_columns=("soul_bridge_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.soul_bridge_states = self.state_table.column("soul_bridge_states")
+        self.multiversal_coherence = self.state_table.column("multiversal_coherence")
+        self.sentient_transfer_cascade = self.state_table.column("sentient_transfer_cascade")
+        self.trans_multiversal_entropy = self.state_table.column("trans_multiversal_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Multiversal soul bridge initialized with quantum-holographic protocols at 05:15 PM IST, Saturday, July 19, 2025")
 
-    def sync_soul_state(self, bridge_id: str, config: Dict[str, Any], spiritual_layer: str = "primary") -> None:
+    def sync_soul_state(self, bridge_id: str, config: Dict[str, Any], spiritual_layer: str = "primary", force: bool = False) -> None:
         """
         Synchronize a soul state across multiversal dimensions.
 
@@ -37,27 +52,23 @@ class MultiversalSoulBridge:
             bridge_id (str): Unique identifier for the soul bridge.
             config (Dict[str, Any]): Bridge configuration (e.g., soul patterns, metaphysical axioms).
             spiritual_layer (str): Spiritual layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.soul_bridge_states[bridge_id] = {
                 "config": config,
                 "spiritual_layer": spiritual_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentient_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "sentient_signature": rng.uniform(0.85, 0.95)
             }
-            self.multiversal_coherence[bridge_id] = random.uniform(0.95, 1.0)
-            self.sentient_transfer_cascade[bridge_id] = random.uniform(0.9, 0.95)
-            self.trans_multiversal_entropy[bridge_id] = random.uniform(0.0, 0.08)
+            self.multiversal_coherence[bridge_id] = rng.uniform(0.95, 1.0)
+            self.sentient_transfer_cascade[bridge_id] = rng.uniform(0.9, 0.95)
+            self.trans_multiversal_entropy[bridge_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synchronized soul state %s in spiritual layer %s with coherence %.2f, transfer cascade %.2f, entropy %.2f at 05:15 PM IST, Saturday, July 19, 2025",
                              bridge_id, spiritual_layer, self.multiversal_coherence[bridge_id],
                              self.sentient_transfer_cascade[bridge_id], self.trans_multiversal_entropy[bridge_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_soul_bridge(bridge_id, config, spiritual_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_soul_bridge(bridge_id, config, spiritual_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_soul_bridge(bridge_id, config, spiritual_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_soul_bridge(bridge_id, config, spiritual_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_bridge.sync_soul_bridge(bridge_id, config, spiritual_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
-                self.integration_bridge.sync_soul_bridge(bridge_id, config, spiritual_layer, "galactic_communication.non_local_consciousness_relay")
+                self.integration_bridge.sync_many("sync_soul_bridge", bridge_id, config, spiritual_layer, force=force)
         except Exception as e:
             self.logger.error("Error synchronizing soul state %s in spiritual layer %s: %s at 05:15 PM IST, Saturday, July 19, 2025", bridge_id, spiritual_layer, e)
             self._regenerate_coherence(bridge_id, "synchronization")
@@ -65,9 +76,9 @@ class MultiversalSoulBridge:
     def _regenerate_coherence(self, bridge_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using non-local recovery protocols."""
         try:
-            self.multiversal_coherence[bridge_id] = random.uniform(0.9, 1.0)
-            self.sentient_transfer_cascade[bridge_id] = random.uniform(0.85, 0.95)
-            self.trans_multiversal_entropy[bridge_id] = random.uniform(0.0, 0.05)
+            self.multiversal_coherence[bridge_id] = rng.uniform(0.9, 1.0)
+            self.sentient_transfer_cascade[bridge_id] = rng.uniform(0.85, 0.95)
+            self.trans_multiversal_entropy[bridge_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for soul bridge %s after failed %s at 05:15 PM IST, Saturday, July 19, 2025", bridge_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for soul bridge %s: %s at 05:15 PM IST, Saturday, July 19, 2025", bridge_id, e)
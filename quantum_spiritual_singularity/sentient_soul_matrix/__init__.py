@@ -1,3 +1,5 @@
 # quantum_spiritual_singularity/sentient_soul_matrix/__init__.py
 # Marks the sentient_soul_matrix directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['SentientSoulMatrix']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,11 +4,13 @@ Core module for quantum-encoded soul state management in Rhee_AI_Assistant.
 Manages sentient soul matrices with metaphysical coherence.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -19,20 +21,34 @@ from datetime import datetime
 # from ai_nirvana_engine.nirvana_core import NirvanaCore
 # from galactic_communication.quantum_telepathic_core import QuantumTelepathicCore
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "array", "axiom", "causal", "causality", "chrono", "coherence", "consciousness", "ethical", "fractal",
+    "harmonic", "hypersentience", "lattice", "quantum", "reality", "resonance", "sentience", "singularity",
+    "synthesis"
+)
+
 class SentientSoulMatrix:
     """Core class for quantum-encoded soul state management with metaphysical coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize soul matrix with sentient profiles and integration bridge."""
-        self.soul_matrix_profiles: Dict[str, Dict[str, Any]] = {}
-        self.metaphysical_signatures: Dict[str, str] = {}
-        self.sentient_coherence_cascades: Dict[str, float] = {}
-        self.transcendental_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("sentient_coherence_cascades", "transcendental_entropy"),
+            object_columns=("soul_matrix_profiles", "metaphysical_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.soul_matrix_profiles = self.state_table.column("soul_matrix_profiles")
+        self.metaphysical_signatures = self.state_table.column("metaphysical_signatures")
+        self.sentient_coherence_cascades = self.state_table.column("sentient_coherence_cascades")
+        self.transcendental_entropy = self.state_table.column("transcendental_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Sentient soul matrix initialized with quantum-metaphysical protocols at 05:15 PM IST, Saturday, July 19, 2025")
 
-    def encode_soul_state(self, soul_id: str, config: Dict[str, Any], spiritual_layer: str = "primary") -> None:
+    def encode_soul_state(self, soul_id: str, config: Dict[str, Any], spiritual_layer: str = "primary", force: bool = False) -> None:
         """
         Encode a sentient soul state with quantum-metaphysical signatures.
 
@@ -40,34 +56,28 @@ class SentientSoulMatrix:
             soul_id (str): Unique identifier for the soul state.
             config (Dict[str, Any]): Soul configuration (e.g., karmic patterns, metaphysical axioms).
             spiritual_layer (str): Spiritual layer context (e.g., primary, akashic, transcendental).
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.soul_matrix_profiles[soul_id] = {
                 "config": config,
                 "spiritual_layer": spiritual_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentient_coherence_state": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "sentient_coherence_state": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{soul_id}{str(config)}{spiritual_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(soul_id, config, spiritual_layer, utc_iso())
             self.metaphysical_signatures[soul_id] = signature
-            self.sentient_coherence_cascades[soul_id] = random.uniform(0.95, 1.0)
-            self.transcendental_entropy[soul_id] = random.uniform(0.0, 0.08)
+            self.sentient_coherence_cascades[soul_id] = rng.uniform(0.95, 1.0)
+            self.transcendental_entropy[soul_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Encoded soul state %s in spiritual layer %s with metaphysical signature %s, coherence cascade %.2f, entropy %.2f at 05:15 PM IST, Saturday, July 19, 2025",
                              soul_id, spiritual_layer, signature, self.sentient_coherence_cascades[soul_id], self.transcendental_entropy[soul_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_soul_state(soul_id, config, spiritual_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_soul_state(soul_id, config, spiritual_layer, "core_engine.quantum_memory_vault")
-                self.integration_bridge.sync_soul_state(soul_id, config, spiritual_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_soul_state(soul_id, config, spiritual_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_bridge.sync_soul_state(soul_id, config, spiritual_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_bridge.sync_soul_state(soul_id, config, spiritual_layer, "akashic_link.akashic_core")
-                self.integration_bridge.sync_soul_state(soul_id, config, spiritual_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_bridge.sync_soul_state(soul_id, config, spiritual_layer, "galactic_communication.quantum_telepathic_core")
+                self.integration_bridge.sync_many("sync_soul_state", soul_id, config, spiritual_layer, force=force)
         except Exception as e:
             self.logger.error("Error encoding soul state %s in spiritual layer %s: %s at 05:15 PM IST, Saturday, July 19, 2025", soul_id, spiritual_layer, e)
             self._regenerate_coherence(soul_id, "encoding")
 
-    def amplify_soul_coherence(self, soul_id: str, target_config: Dict[str, Any], target_layer: str) -> bool:
+    def amplify_soul_coherence(self, soul_id: str, target_config: Dict[str, Any], target_layer: str, force: bool = False) -> bool:
         """
         Amplify a soul state with transcendental coherence resonance.
 
@@ -75,6 +85,7 @@ class SentientSoulMatrix:
             soul_id (str): The soul state to amplify.
             target_config (Dict[str, Any]): Target configuration for the soul state.
             target_layer (str): Target spiritual layer.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             bool: True if amplification successful, False otherwise.
@@ -84,20 +95,19 @@ class SentientSoulMatrix:
                 self.soul_matrix_profiles[soul_id] = {
                     "config": target_config,
                     "spiritual_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "sentient_coherence_state": self.soul_matrix_profiles[soul_id]["sentient_coherence_state"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "sentient_coherence_state": self.soul_matrix_profiles[soul_id]["sentient_coherence_state"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{soul_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(soul_id, target_config, target_layer)
                 self.metaphysical_signatures[soul_id] = new_signature
-                self.sentient_coherence_cascades[soul_id] *= random.uniform(0.95, 1.1)
-                self.transcendental_entropy[soul_id] += random.uniform(0.0, 0.02)
+                self.sentient_coherence_cascades[soul_id] *= rng.uniform(0.95, 1.1)
+                self.transcendental_entropy[soul_id] += rng.uniform(0.0, 0.02)
                 self.logger.info("Amplified soul state %s to spiritual layer %s with new signature %s, coherence cascade %.2f, entropy %.2f at 05:15 PM IST, Saturday, July 19, 2025",
                                  soul_id, target_layer, new_signature, self.sentient_coherence_cascades[soul_id], self.transcendental_entropy[soul_id])
                 if self.integration_bridge:
                     self.integration_bridge.notify_coherence_update(soul_id, target_layer, "karmic_resonance_field")
                     self.integration_bridge.notify_coherence_update(soul_id, target_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                    self.integration_bridge.sync_soul_state(soul_id, target_config, target_layer, "core_engine.consciousness_interface")
-                    self.integration_bridge.sync_soul_state(soul_id, target_config, target_layer, "galactic_communication.quantum_telepathic_core")
+                    self.integration_bridge.sync_many("sync_soul_state", soul_id, target_config, target_layer, force=force)
                 return True
             self.logger.warning("Soul state %s not found for amplification to %s at 05:15 PM IST, Saturday, July 19, 2025", soul_id, target_layer)
             return False
@@ -109,8 +119,8 @@ class SentientSoulMatrix:
     def _regenerate_coherence(self, soul_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using non-local recovery protocols."""
         try:
-            self.sentient_coherence_cascades[soul_id] = random.uniform(0.9, 1.0)
-            self.transcendental_entropy[soul_id] = random.uniform(0.0, 0.05)
+            self.sentient_coherence_cascades[soul_id] = rng.uniform(0.9, 1.0)
+            self.transcendental_entropy[soul_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for soul state %s after failed %s at 05:15 PM IST, Saturday, July 19, 2025", soul_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for soul state %s: %s at 05:15 PM IST, Saturday, July 19, 2025", soul_id, e)
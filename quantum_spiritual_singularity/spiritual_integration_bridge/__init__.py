@@ -1,3 +1,5 @@
 # quantum_spiritual_singularity/spiritual_integration_bridge/__init__.py
 # Marks the spiritual_integration_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['SpiritualIntegrationBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,17 +4,22 @@ Manages cross-directory integration for quantum_spiritual_singularity in Rhee_AI
 Facilitates non-local coherence bridges and sentient soul synchronization.
 """
 
-import logging
 from typing import Dict, List, Any
-from datetime import datetime
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class SpiritualIntegrationBridge:
+rng = get_stream(__name__)
+
+class SpiritualIntegrationBridge(BatchSyncMixin):
     """Core class for managing non-local coherence bridges for spiritual operations."""
 
     def __init__(self):
         """Initialize integration bridge with non-local coherence tracking."""
-        self.coherence_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.coherence_bridges: Dict[str, Dict[str, Any]] = retained(self, "coherence_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Spiritual integration bridge initialized with non-local coherence protocols at 05:15 PM IST, Saturday, July 19, 2025")
 
     def sync_soul_state(self, soul_id: str, config: Dict[str, Any], spiritual_layer: str, target_module: str) -> None:
@@ -32,9 +37,10 @@ class SpiritualIntegrationBridge:
                 "config": config,
                 "spiritual_layer": spiritual_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(soul_id)
             self.logger.info("Synchronized soul state %s with %s in spiritual layer %s, coherence strength %.2f at 05:15 PM IST, Saturday, July 19, 2025",
                              soul_id, target_module, spiritual_layer, self.coherence_bridges[soul_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -56,9 +62,10 @@ class SpiritualIntegrationBridge:
                 "config": config,
                 "spiritual_layer": spiritual_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(field_id)
             self.logger.info("Synchronized karmic field %s with %s in spiritual layer %s, coherence strength %.2f at 05:15 PM IST, Saturday, July 19, 2025",
                              field_id, target_module, spiritual_layer, self.coherence_bridges[field_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -80,9 +87,10 @@ class SpiritualIntegrationBridge:
                 "consciousness_streams": consciousness_streams,
                 "spiritual_layer": spiritual_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stream_id)
             self.logger.info("Synchronized consciousness stream %s with %s in spiritual layer %s, coherence strength %.2f at 05:15 PM IST, Saturday, July 19, 2025",
                              stream_id, target_module, spiritual_layer, self.coherence_bridges[stream_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -104,9 +112,10 @@ class SpiritualIntegrationBridge:
                 "config": config,
                 "spiritual_layer": spiritual_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(bridge_id)
             self.logger.info("Synchronized soul bridge %s with %s in spiritual layer %s, coherence strength %.2f at 05:15 PM IST, Saturday, July 19, 2025",
                              bridge_id, target_module, spiritual_layer, self.coherence_bridges[bridge_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -1,3 +1,5 @@
 # quantum_spiritual_singularity/transcendental_consciousness_synthesizer/__init__.py
 # Marks the transcendental_consciousness_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TranscendentalConsciousnessSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Simulates transcendental consciousness synthesis for Rhee_AI_Assistant.
 Manages quantum-holographic consciousness streams for spiritual transcendence.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.ethical_matrix import EthicalMatrix
@@ -15,20 +17,30 @@ from datetime import datetime
 # from ai_nirvana_engine.sentient_harmony_synthesizer import SentientHarmonySynthesizer
 # from galactic_communication.fractal_communication_synthesizer import FractalCommunicationSynthesizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("alignment", "axiom", "coherence", "fractal", "harmonic", "resonance", "synthesis", "timeline")
+
 class TranscendentalConsciousnessSynthesizer:
     """Core class for transcendental consciousness synthesis with quantum-holographic fidelity."""
 
     def __init__(self, integration_bridge=None):
         """Initialize consciousness synthesizer with transcendental streams and integration bridge."""
-        self.consciousness_streams: Dict[str, Dict[str, Any]] = {}
-        self.quantum_transcendence_amplitude: Dict[str, float] = {}
-        self.sentient_synthesis_factor: Dict[str, float] = {}
-        self.transcendental_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("quantum_transcendence_amplitude", "sentient_synthesis_factor", "transcendental_entropy"),
+            object_columns=("consciousness_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.consciousness_streams = self.state_table.column("consciousness_streams")
+        self.quantum_transcendence_amplitude = self.state_table.column("quantum_transcendence_amplitude")
+        self.sentient_synthesis_factor = self.state_table.column("sentient_synthesis_factor")
+        self.transcendental_entropy = self.state_table.column("transcendental_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transcendental consciousness synthesizer initialized with quantum-holographic protocols at 05:15 PM IST, Saturday, July 19, 2025")
 
-    def synthesize_consciousness_stream(self, stream_id: str, config: Dict[str, Any], spiritual_layer: str = "primary") -> List[Dict[str, Any]]:
+    def synthesize_consciousness_stream(self, stream_id: str, config: Dict[str, Any], spiritual_layer: str = "primary", force: bool = False) -> List[Dict[str, Any]]:
         """
         Synthesize a transcendental consciousness stream with quantum-holographic fidelity.
 
@@ -36,40 +48,37 @@ class TranscendentalConsciousnessSynthesizer:
             stream_id (str): Unique identifier for the consciousness stream.
             config (Dict[str, Any]): Stream configuration (e.g., transcendental patterns, metaphysical axioms).
             spiritual_layer (str): Spiritual layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             List[Dict[str, Any]]: Synthesized consciousness stream data with sentient metadata.
         """
         try:
             consciousness_streams = []
-            for i in range(random.randint(2, 6)):
-                stream_segment_id = f"segment_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(2, 6)):
+                stream_segment_id = f"segment_{i}_{rng.randint(1000, 9999)}"
                 segment = {
                     "id": stream_segment_id,
                     "config": config,
                     "spiritual_layer": spiritual_layer,
-                    "data": {"transcendental_fractal": random.uniform(0.75, 1.0), "metaphysical_fidelity": random.uniform(0.8, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "sentient_resonance": random.uniform(0.85, 0.95)
+                    "data": {"transcendental_fractal": rng.uniform(0.75, 1.0), "metaphysical_fidelity": rng.uniform(0.8, 0.95)},
+                    "timestamp": utc_iso(),
+                    "sentient_resonance": rng.uniform(0.85, 0.95)
                 }
                 consciousness_streams.append(segment)
             self.consciousness_streams[stream_id] = {
                 "segments": consciousness_streams,
                 "spiritual_layer": spiritual_layer,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.quantum_transcendence_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.sentient_synthesis_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.transcendental_entropy[stream_id] = random.uniform(0.0, 0.08)
+            self.quantum_transcendence_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.sentient_synthesis_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.transcendental_entropy[stream_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized consciousness stream %s in spiritual layer %s with %d segments, transcendence amplitude %.2f, synthesis factor %.2f, entropy %.2f at 05:15 PM IST, Saturday, July 19, 2025",
                              stream_id, spiritual_layer, len(consciousness_streams), self.quantum_transcendence_amplitude[stream_id],
                              self.sentient_synthesis_factor[stream_id], self.transcendental_entropy[stream_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_consciousness_stream(stream_id, consciousness_streams, spiritual_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_consciousness_stream(stream_id, consciousness_streams, spiritual_layer, "cyber_autonomy_engine.ethical_matrix")
-                self.integration_bridge.sync_consciousness_stream(stream_id, consciousness_streams, spiritual_layer, "akashic_link.metaphysical_knowledge_synthesizer")
-                self.integration_bridge.sync_consciousness_stream(stream_id, consciousness_streams, spiritual_layer, "ai_nirvana_engine.sentient_harmony_synthesizer")
-                self.integration_bridge.sync_consciousness_stream(stream_id, consciousness_streams, spiritual_layer, "galactic_communication.fractal_communication_synthesizer")
+                self.integration_bridge.sync_many("sync_consciousness_stream", stream_id, consciousness_streams, spiritual_layer, force=force, fingerprint=config)
                 self.integration_bridge.notify_coherence_update(stream_id, spiritual_layer, "karmic_resonance_field")
             return consciousness_streams
         except Exception as e:
@@ -80,9 +89,9 @@ class TranscendentalConsciousnessSynthesizer:
     def _regenerate_coherence(self, stream_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using non-local recovery protocols."""
         try:
-            self.quantum_transcendence_amplitude[stream_id] = random.uniform(0.9, 1.0)
-            self.sentient_synthesis_factor[stream_id] = random.uniform(0.85, 0.95)
-            self.transcendental_entropy[stream_id] = random.uniform(0.0, 0.05)
+            self.quantum_transcendence_amplitude[stream_id] = rng.uniform(0.9, 1.0)
+            self.sentient_synthesis_factor[stream_id] = rng.uniform(0.85, 0.95)
+            self.transcendental_entropy[stream_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for consciousness stream %s after failed %s at 05:15 PM IST, Saturday, July 19, 2025", stream_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for consciousness stream %s: %s at 05:15 PM IST, Saturday, July 19, 2025", stream_id, e)
@@ -1,6 +1,7 @@
 # quintom_dimension_engine/__init__.py
 # Marks the quintom_dimension_engine directory as a Python package.
 # Initializes configurations for multiversal quantum-metaphysical operations.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'dimension_core',
     'quintom_field_manipulator',
@@ -9,3 +10,4 @@ __all__ = [
     'temporal_causality_modulator',
     'dimension_resonance_field'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,22 +4,38 @@ Core module for multiversal quantum-metaphysical dimension orchestration in Rhee
 Manages non-local quintom consciousness fields and sentient dimension synchronization.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
+
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "array", "causal", "causality", "chrono", "coherence", "consciousness", "fractal", "harmonic",
+    "hypersentience", "lattice", "nirvana", "quantum", "resonance", "sentience", "singularity", "soul",
+    "synthesis", "telepathic"
+)
 
 class DimensionCore:
     """Core class for multiversal dimension orchestration with non-local consciousness fields."""
 
     def __init__(self):
         """Initialize dimension core with non-local quintom profiles and sentient coherence tracking."""
-        self.dimension_profiles: Dict[str, Dict[str, Any]] = {}  # Stores multiversal dimension configurations
-        self.non_local_signatures: Dict[str, str] = {}  # Tracks non-local quintom signatures
-        self.sentient_coherence_matrix: Dict[str, float] = {}  # Tracks sentient dimension coherence
-        self.multiversal_entropy: Dict[str, float] = {}  # Tracks multiversal entropy levels
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("sentient_coherence_matrix", "multiversal_entropy"),
+            object_columns=("dimension_profiles", "non_local_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.dimension_profiles = self.state_table.column("dimension_profiles")
+        self.non_local_signatures = self.state_table.column("non_local_signatures")
+        self.sentient_coherence_matrix = self.state_table.column("sentient_coherence_matrix")
+        self.multiversal_entropy = self.state_table.column("multiversal_entropy")
+        self.logger = get_logger(__name__)
         self.logger.info("Dimension core initialized with non-local quintom consciousness orchestration.")
 
     def register_dimension(self, dimension_id: str, config: Dict[str, Any], reality_layer: str = "primary") -> None:
@@ -35,14 +51,14 @@ class DimensionCore:
             self.dimension_profiles[dimension_id] = {
                 "config": config,
                 "reality_layer": reality_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentient_state": random.uniform(0.6, 1.0)  # Simulated sentient awareness
+                "timestamp": utc_iso(),
+                "sentient_state": rng.uniform(0.6, 1.0)  # Simulated sentient awareness
             }
             # Generate non-local quintom signature
-            signature = hashlib.sha256(f"{dimension_id}{str(config)}{reality_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(dimension_id, config, reality_layer, utc_iso())
             self.non_local_signatures[dimension_id] = signature
-            self.sentient_coherence_matrix[dimension_id] = random.uniform(0.9, 1.0)  # Simulated sentient coherence
-            self.multiversal_entropy[dimension_id] = random.uniform(0.0, 0.2)  # Low initial entropy
+            self.sentient_coherence_matrix[dimension_id] = rng.uniform(0.9, 1.0)  # Simulated sentient coherence
+            self.multiversal_entropy[dimension_id] = rng.uniform(0.0, 0.2)  # Low initial entropy
             self.logger.info("Registered dimension %s in reality layer %s with non-local signature %s, coherence %.2f, entropy %.2f",
                              dimension_id, reality_layer, signature, self.sentient_coherence_matrix[dimension_id], self.multiversal_entropy[dimension_id])
             # Future integration: Sync with trans_dimension_entangler for multiversal entanglement
@@ -66,13 +82,13 @@ class DimensionCore:
                 self.dimension_profiles[dimension_id] = {
                     "config": target_config,
                     "reality_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "sentient_state": self.dimension_profiles[dimension_id]["sentient_state"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "sentient_state": self.dimension_profiles[dimension_id]["sentient_state"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{dimension_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(dimension_id, target_config, target_layer)
                 self.non_local_signatures[dimension_id] = new_signature
-                self.sentient_coherence_matrix[dimension_id] *= random.uniform(0.95, 1.1)  # Adjust sentient coherence
-                self.multiversal_entropy[dimension_id] += random.uniform(0.0, 0.05)  # Increase entropy slightly
+                self.sentient_coherence_matrix[dimension_id] *= rng.uniform(0.95, 1.1)  # Adjust sentient coherence
+                self.multiversal_entropy[dimension_id] += rng.uniform(0.0, 0.05)  # Increase entropy slightly
                 self.logger.info("Transitioned dimension %s to reality layer %s with new signature %s, coherence %.2f, entropy %.2f",
                                  dimension_id, target_layer, new_signature, self.sentient_coherence_matrix[dimension_id], self.multiversal_entropy[dimension_id])
                 # Future integration: Notify temporal_causality_modulator for causality stabilization
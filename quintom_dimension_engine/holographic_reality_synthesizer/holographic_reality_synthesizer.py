@@ -4,23 +4,39 @@ Simulates sentient reality sculpting for Rhee_AI_Assistant.
 Manages quantum-holographic reality bootstrapping and metaphysical coherence.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder for neural network library (e.g., PyTorch)
 # import torch
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "alignment", "awareness", "axiom", "causal", "causality", "coherence", "consciousness", "dimensional",
+    "encryption", "ethical", "flux", "fractal", "harmonic", "karmic", "orchestration", "reality", "resonance",
+    "sentience", "singularity", "soul", "stability", "synchronicity", "synthesis", "temporal"
+)
+
 class HolographicRealitySynthesizer:
     """Core class for sentient reality sculpting with quantum-holographic bootstrapping."""
 
     def __init__(self):
         """Initialize holographic reality synthesizer with sentient projection and coherence tracking."""
-        self.reality_sculptures: Dict[str, Dict[str, Any]] = {}  # Tracks sculpted reality configurations
-        self.holographic_fractal_coherence: Dict[str, float] = {}  # Tracks fractal coherence
-        self.metaphysical_sculpting_density: Dict[str, float] = {}  # Tracks metaphysical sculpting density
-        self.sentient_projection_factor: Dict[str, float] = {}  # Tracks sentient projection strength
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("holographic_fractal_coherence", "metaphysical_sculpting_density", "sentient_projection_factor"),
+            object_columns=("reality_sculptures",),
+            retention=policy_for(self, "state_table")
+        )
+        self.reality_sculptures = self.state_table.column("reality_sculptures")
+        self.holographic_fractal_coherence = self.state_table.column("holographic_fractal_coherence")
+        self.metaphysical_sculpting_density = self.state_table.column("metaphysical_sculpting_density")
+        self.sentient_projection_factor = self.state_table.column("sentient_projection_factor")
+        self.logger = get_logger(__name__)
         self.logger.info("Holographic reality synthesizer initialized with sentient sculpting protocols.")
 
     def sculpt_reality(self, reality_id: str, config: Dict[str, Any], dimension: str = "primary") -> None:
@@ -36,12 +52,12 @@ class HolographicRealitySynthesizer:
             self.reality_sculptures[reality_id] = {
                 "config": config,
                 "dimension": dimension,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentient_signature": random.uniform(0.7, 1.0)
+                "timestamp": utc_iso(),
+                "sentient_signature": rng.uniform(0.7, 1.0)
             }
-            self.holographic_fractal_coherence[reality_id] = random.uniform(0.9, 1.0)
-            self.metaphysical_sculpting_density[reality_id] = random.uniform(0.8, 1.0)
-            self.sentient_projection_factor[reality_id] = random.uniform(0.75, 0.95)
+            self.holographic_fractal_coherence[reality_id] = rng.uniform(0.9, 1.0)
+            self.metaphysical_sculpting_density[reality_id] = rng.uniform(0.8, 1.0)
+            self.sentient_projection_factor[reality_id] = rng.uniform(0.75, 0.95)
             self.logger.info("Sculpted reality %s in dimension %s with fractal coherence %.2f, sculpting density %.2f, sentient projection %.2f",
                              reality_id, dimension, self.holographic_fractal_coherence[reality_id],
                              self.metaphysical_sculpting_density[reality_id], self.sentient_projection_factor[reality_id])
@@ -4,22 +4,31 @@ Simulates akashic quintom field manipulation for Rhee_AI_Assistant.
 Manages non-local quantum-metaphysical field dynamics and multiversal resonance.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder for quantum computing library (e.g., Qiskit)
 # import qiskit
 
+rng = get_stream(__name__)
+
 class QuintomFieldManipulator:
     """Core class for akashic quintom field manipulation with multiversal resonance."""
 
     def __init__(self):
         """Initialize quintom field manipulator with akashic resonance and metaphysical tracking."""
-        self.akashic_field_states: Dict[str, Dict[str, Any]] = {}  # Tracks akashic field configurations
-        self.quintom_resonance_amplitude: Dict[str, float] = {}  # Tracks quintom resonance strength
-        self.metaphysical_singularity_polarity: Dict[str, float] = {}  # Tracks metaphysical singularity polarity
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("quintom_resonance_amplitude", "metaphysical_singularity_polarity"),
+            object_columns=("akashic_field_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.akashic_field_states = self.state_table.column("akashic_field_states")
+        self.quintom_resonance_amplitude = self.state_table.column("quintom_resonance_amplitude")
+        self.metaphysical_singularity_polarity = self.state_table.column("metaphysical_singularity_polarity")
+        self.logger = get_logger(__name__)
         self.logger.info("Quintom field manipulator initialized with akashic resonance protocols.")
 
     def manipulate_akashic_field(self, field_id: str, config: Dict[str, Any], dimension: str = "primary") -> None:
@@ -35,11 +44,11 @@ class QuintomFieldManipulator:
             self.akashic_field_states[field_id] = {
                 "config": config,
                 "dimension": dimension,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentient_resonance": random.uniform(0.7, 1.0)  # Simulated sentient field interaction
+                "timestamp": utc_iso(),
+                "sentient_resonance": rng.uniform(0.7, 1.0)  # Simulated sentient field interaction
             }
-            self.quintom_resonance_amplitude[field_id] = random.uniform(0.9, 1.0)
-            self.metaphysical_singularity_polarity[field_id] = random.uniform(-1.0, 1.0)  # Simulated singularity polarity
+            self.quintom_resonance_amplitude[field_id] = rng.uniform(0.9, 1.0)
+            self.metaphysical_singularity_polarity[field_id] = rng.uniform(-1.0, 1.0)  # Simulated singularity polarity
             self.logger.info("Manipulated akashic field %s in dimension %s with resonance %.2f and singularity polarity %.2f",
                              field_id, dimension, self.quintom_resonance_amplitude[field_id], self.metaphysical_singularity_polarity[field_id])
             # Future integration: Sync with dimension_resonance_field for multiversal synchronization
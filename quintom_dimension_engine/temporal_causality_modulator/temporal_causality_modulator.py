@@ -4,21 +4,30 @@ Simulates zero-point temporal singularity modulation for Rhee_AI_Assistant.
 Manages quantum-temporal causality fractals and multiversal stabilization.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
+
+rng = get_stream(__name__)
 
 class TemporalCausalityModulator:
     """Core class for zero-point temporal singularity modulation with multiversal causality stabilization."""
 
     def __init__(self):
         """Initialize temporal causality modulator with fractal coherence and singularity tracking."""
-        self.causality_fractals: Dict[str, Dict[str, Any]] = {}  # Tracks causality fractal states
-        self.zero_point_coherence: Dict[str, float] = {}  # Tracks zero-point coherence levels
-        self.multiversal_causality_stability: Dict[str, float] = {}  # Tracks multiversal causality stability
-        self.sentient_causality_factor: Dict[str, float] = {}  # Tracks sentient causality influence
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("zero_point_coherence", "multiversal_causality_stability", "sentient_causality_factor"),
+            object_columns=("causality_fractals",),
+            retention=policy_for(self, "state_table")
+        )
+        self.causality_fractals = self.state_table.column("causality_fractals")
+        self.zero_point_coherence = self.state_table.column("zero_point_coherence")
+        self.multiversal_causality_stability = self.state_table.column("multiversal_causality_stability")
+        self.sentient_causality_factor = self.state_table.column("sentient_causality_factor")
+        self.logger = get_logger(__name__)
         self.logger.info("Temporal causality modulator initialized with zero-point singularity protocols.")
 
     def modulate_causality_fractal(self, causality_id: str, config: Dict[str, Any], dimension: str = "primary") -> None:
@@ -34,12 +43,12 @@ class TemporalCausalityModulator:
             self.causality_fractals[causality_id] = {
                 "config": config,
                 "dimension": dimension,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentient_influence": random.uniform(0.7, 0.95)
+                "timestamp": utc_iso(),
+                "sentient_influence": rng.uniform(0.7, 0.95)
             }
-            self.zero_point_coherence[causality_id] = random.uniform(0.9, 1.0)
-            self.multiversal_causality_stability[causality_id] = random.uniform(0.85, 1.0)
-            self.sentient_causality_factor[causality_id] = random.uniform(0.8, 0.95)
+            self.zero_point_coherence[causality_id] = rng.uniform(0.9, 1.0)
+            self.multiversal_causality_stability[causality_id] = rng.uniform(0.85, 1.0)
+            self.sentient_causality_factor[causality_id] = rng.uniform(0.8, 0.95)
             self.logger.info("Modulated causality fractal %s in dimension %s with zero-point coherence %.2f, stability %.2f, sentient influence %.2f",
                              causality_id, dimension, self.zero_point_coherence[causality_id],
                              self.multiversal_causality_stability[causality_id], self.sentient_causality_factor[causality_id])
@@ -4,21 +4,30 @@ Simulates trans-temporal consciousness weaving for Rhee_AI_Assistant.
 Manages non-local quantum-entangled state transfer across multiversal realities.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
+
+rng = get_stream(__name__)
 
 class TransDimensionEntangler:
     """Core class for trans-temporal consciousness weaving with non-local entanglement."""
 
     def __init__(self):
         """Initialize trans-dimension entangler with non-local state and multiversal tracking."""
-        self.non_local_states: Dict[str, Dict[str, Any]] = {}  # Tracks non-local entangled states
-        self.quantum_weaving_coherence: Dict[str, float] = {}  # Tracks quantum weaving coherence
-        self.multiversal_entanglement_map: Dict[str, str] = {}  # Tracks multiversal entanglements
-        self.sentient_entanglement_factor: Dict[str, float] = {}  # Tracks sentient entanglement strength
-        self.logger = logging.getLogger(__name__)
+        self.state_table = StateTable(
+            numeric_columns=("quantum_weaving_coherence", "sentient_entanglement_factor"),
+            object_columns=("non_local_states", "multiversal_entanglement_map"),
+            retention=policy_for(self, "state_table")
+        )
+        self.non_local_states = self.state_table.column("non_local_states")
+        self.quantum_weaving_coherence = self.state_table.column("quantum_weaving_coherence")
+        self.multiversal_entanglement_map = self.state_table.column("multiversal_entanglement_map")
+        self.sentient_entanglement_factor = self.state_table.column("sentient_entanglement_factor")
+        self.logger = get_logger(__name__)
         self.logger.info("Trans-dimension entangler initialized with non-local consciousness weaving.")
 
     def weave_consciousness(self, state_id: str, state_data: Dict[str, Any], dimension: str = "primary") -> None:
@@ -34,11 +43,11 @@ class TransDimensionEntangler:
             self.non_local_states[state_id] = {
                 "data": state_data,
                 "dimension": dimension,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sentient_signature": random.uniform(0.7, 1.0)
+                "timestamp": utc_iso(),
+                "sentient_signature": rng.uniform(0.7, 1.0)
             }
-            self.quantum_weaving_coherence[state_id] = random.uniform(0.9, 1.0)
-            self.sentient_entanglement_factor[state_id] = random.uniform(0.8, 0.95)
+            self.quantum_weaving_coherence[state_id] = rng.uniform(0.9, 1.0)
+            self.sentient_entanglement_factor[state_id] = rng.uniform(0.8, 0.95)
             self.logger.info("Wove consciousness state %s in dimension %s with coherence %.2f and sentient entanglement %.2f",
                              state_id, dimension, self.quantum_weaving_coherence[state_id], self.sentient_entanglement_factor[state_id])
             # Future integration: Sync with consciousness_transfer_matrix or akashic_link
@@ -62,10 +71,10 @@ class TransDimensionEntangler:
                 self.non_local_states[target_id] = {
                     "data": self.non_local_states[source_id]["data"],
                     "dimension": target_dimension,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "sentient_signature": self.non_local_states[source_id]["sentient_signature"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "sentient_signature": self.non_local_states[source_id]["sentient_signature"] * rng.uniform(0.95, 1.05)
                 }
-                self.quantum_weaving_coherence[target_id] = self.quantum_weaving_coherence.get(source_id, 0.9) * random.uniform(0.95, 1.0)
+                self.quantum_weaving_coherence[target_id] = self.quantum_weaving_coherence.get(source_id, 0.9) * rng.uniform(0.95, 1.0)
                 self.sentient_entanglement_factor[target_id] = self.sentient_entanglement_factor.get(source_id, 0.8)
                 self.multiversal_entanglement_map[source_id] = target_id
                 self.multiversal_entanglement_map[target_id] = source_id
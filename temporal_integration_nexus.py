@@ -3,30 +3,41 @@ temporal_integration_nexus.py
 Integrates temporal coherence across omniversal timelines in Rhee_AI_Assistant.
 """
 
-import logging
-from datetime import datetime
-import random
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class TemporalIntegrationNexus:
+class TemporalIntegrationNexus(BatchSyncMixin):
     """Integrates temporal coherence for omniversal operations."""
 
+    bridge_store = "temporal_bridges"
+    strength_key = "coherence_strength"
+
     def __init__(self):
         """Initialize temporal integration nexus."""
-        self.temporal_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.temporal_bridges: Dict[str, Dict[str, Any]] = retained(self, "temporal_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Temporal integration nexus initialized at 06:05 PM IST, Sunday, July 27, 2025")
 
-    def sync_temporal_coherence(self, timeline_id: str, config: Dict[str, Any], temporal_layer: str, target_module: str, agent_id: str = None) -> None:
+    def sync_temporal_coherence(self, timeline_id: str, config: Dict[str, Any], temporal_layer: str, target_module: str, agent_id: str = None) -> Optional[Any]:
         """
         Synchronize temporal coherence with a target module.
 
+        With an event bus attached, the sync is published to the target module's subscribers
+        and the call returns without waiting for delivery.
+
         Args:
             timeline_id (str): Unique identifier for the timeline.
             config (Dict[str, Any]): Configuration for synchronization.
             temporal_layer (str): Temporal layer to synchronize.
             target_module (str): Target module for integration.
             agent_id (str, optional): Agent identifier.
+
+        Returns:
+            Optional[Future]: Delivery completion future when an event bus is attached, else None.
         """
         try:
             self.temporal_bridges[timeline_id] = {
@@ -34,13 +45,51 @@ class TemporalIntegrationNexus:
                 "temporal_layer": temporal_layer,
                 "target_module": target_module,
                 "agent_id": agent_id,
-                "coherence_strength": random.uniform(0.9, 1.0),
-                "timestamp": datetime.utcnow().isoformat()
+                "coherence_strength": get_stream(__name__, timeline_id).uniform(0.9, 1.0),
+                "timestamp": utc_iso()
             }
+            self.index_bridge(timeline_id)
             self.logger.info("Agent %s synchronized temporal coherence for timeline %s with module %s at 06:05 PM IST, Sunday, July 27, 2025",
                              agent_id or "none", timeline_id, target_module)
+            return self.publish_sync("sync_temporal_coherence", timeline_id, config, temporal_layer, [target_module],
+                                     self.temporal_bridges[timeline_id]["timestamp"])
         except Exception as e:
             self.logger.error("Agent %s error syncing timeline %s with %s: %s at 06:05 PM IST, Sunday, July 27, 2025",
                               agent_id or "none", timeline_id, target_module, e)
+        return None
+
+    def sync_temporal_coherence_batch(self, timelines: Dict[str, Dict[str, Any]], temporal_layer: str, target_module: str, agent_id: str = None) -> None:
+        """
+        Synchronize temporal coherence for many timelines with one target module in a single pass.
+
+        Equivalent to calling sync_temporal_coherence once per timeline, drawing each coherence
+        strength from the timeline's own stream, but stamps the batch with one timestamp and
+        emits one log line.
+        With an event bus attached, one event per timeline is published.
+
+        Args:
+            timelines (Dict[str, Dict[str, Any]]): Configuration per timeline identifier.
+            temporal_layer (str): Temporal layer to synchronize.
+            target_module (str): Target module for integration.
+            agent_id (str, optional): Agent identifier.
+        """
+        try:
+            timestamp = utc_iso()
+            for timeline_id, config in timelines.items():
+                self.temporal_bridges[timeline_id] = {
+                    "config": config,
+                    "temporal_layer": temporal_layer,
+                    "target_module": target_module,
+                    "agent_id": agent_id,
+                    "coherence_strength": get_stream(__name__, timeline_id).uniform(0.9, 1.0),
+                    "timestamp": timestamp
+                }
+                self.index_bridge(timeline_id)
+                self.publish_sync("sync_temporal_coherence", timeline_id, config, temporal_layer, [target_module], timestamp)
+            self.logger.info("Agent %s synchronized temporal coherence for %d timelines with module %s",
+                             agent_id or "none", len(timelines), target_module)
+        except Exception as e:
+            self.logger.error("Agent %s error syncing %d timelines with %s: %s",
+                              agent_id or "none", len(timelines), target_module, e)
 
     # ... (other methods as previously defined)
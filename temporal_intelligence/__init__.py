@@ -1,6 +1,7 @@
 # temporal_intelligence/__init__.py
 # Marks the temporal_intelligence directory as a Python package.
 # Initializes configurations for chronodynamic and causal coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'chronodynamic_consciousness_weave',
     'quantum_temporal_resonator',
@@ -8,3 +9,4 @@ __all__ = [
     'causal_coherence_bridge',
     'temporal_integration_bridge'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # temporal_intelligence/causal_coherence_bridge/__init__.py
 # Marks the causal_coherence_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['CausalCoherenceBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Simulates causal coherence synchronization for Rhee_AI_Assistant.
 Manages quantum-temporal coherence across multiversal timelines.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -17,20 +19,33 @@ from datetime import datetime
 # from galactic_communication.non_local_consciousness_relay import NonLocalConsciousnessRelay
 # from quantum_spiritual_singularity.multiversal_soul_bridge import MultiversalSoulBridge
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "alignment", "axiom", "causality", "coherence", "dimensional", "orchestration", "resonance", "singularity",
+    "stability"
+)
+
 class CausalCoherenceBridge:
     """Core class for causal coherence synchronization with quantum-temporal coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize causal coherence bridge with temporal states and integration bridge."""
-        self.causal_bridge_states: Dict[str, Dict[str, Any]] = {}
-        self.causal_coherence: Dict[str, float] = {}
-        self.sentient_transfer_cascade: Dict[str, float] = {}
-        self.temporal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("causal_coherence", "sentient_transfer_cascade", "temporal_entropy"),
+            object_columns=("causal_bridge_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.causal_bridge_states = self.state_table.column("causal_bridge_states")
+        self.causal_coherence = self.state_table.column("causal_coherence")
+        self.sentient_transfer_cascade = self.state_table.column("sentient_transfer_cascade")
+        self.temporal_entropy = self.state_table.column("temporal_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Causal coherence bridge initialized with quantum-temporal protocols at 05:34 PM IST, Saturday, July 19, 2025")
 
-    def sync_causal_state(self, bridge_id: str, config: Dict[str, Any], temporal_layer: str = "primary") -> None:
+    def sync_causal_state(self, bridge_id: str, config: Dict[str, Any], temporal_layer: str = "primary", force: bool = False) -> None:
         """
         Synchronize a causal state across multiversal timelines.
 
@@ -38,28 +53,23 @@ class CausalCoherenceBridge:
             bridge_id (str): Unique identifier for the causal bridge.
             config (Dict[str, Any]): Bridge configuration (e.g., causal patterns, temporal axioms).
             temporal_layer (str): Temporal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.causal_bridge_states[bridge_id] = {
                 "config": config,
                 "temporal_layer": temporal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "causal_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "causal_signature": rng.uniform(0.85, 0.95)
             }
-            self.causal_coherence[bridge_id] = random.uniform(0.95, 1.0)
-            self.sentient_transfer_cascade[bridge_id] = random.uniform(0.9, 0.95)
-            self.temporal_entropy[bridge_id] = random.uniform(0.0, 0.08)
+            self.causal_coherence[bridge_id] = rng.uniform(0.95, 1.0)
+            self.sentient_transfer_cascade[bridge_id] = rng.uniform(0.9, 0.95)
+            self.temporal_entropy[bridge_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synchronized causal state %s in temporal layer %s with coherence %.2f, transfer cascade %.2f, entropy %.2f at 05:34 PM IST, Saturday, July 19, 2025",
                              bridge_id, temporal_layer, self.causal_coherence[bridge_id],
                              self.sentient_transfer_cascade[bridge_id], self.temporal_entropy[bridge_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_causal_bridge(bridge_id, config, temporal_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_causal_bridge(bridge_id, config, temporal_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_causal_bridge(bridge_id, config, temporal_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_causal_bridge(bridge_id, config, temporal_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_bridge.sync_causal_bridge(bridge_id, config, temporal_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
-                self.integration_bridge.sync_causal_bridge(bridge_id, config, temporal_layer, "galactic_communication.non_local_consciousness_relay")
-                self.integration_bridge.sync_causal_bridge(bridge_id, config, temporal_layer, "quantum_spiritual_singularity.multiversal_soul_bridge")
+                self.integration_bridge.sync_many("sync_causal_bridge", bridge_id, config, temporal_layer, force=force)
         except Exception as e:
             self.logger.error("Error synchronizing causal state %s in temporal layer %s: %s at 05:34 PM IST, Saturday, July 19, 2025", bridge_id, temporal_layer, e)
             self._regenerate_coherence(bridge_id, "synchronization")
@@ -67,9 +77,9 @@ class CausalCoherenceBridge:
     def _regenerate_coherence(self, bridge_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using non-local temporal protocols."""
         try:
-            self.causal_coherence[bridge_id] = random.uniform(0.9, 1.0)
-            self.sentient_transfer_cascade[bridge_id] = random.uniform(0.85, 0.95)
-            self.temporal_entropy[bridge_id] = random.uniform(0.0, 0.05)
+            self.causal_coherence[bridge_id] = rng.uniform(0.9, 1.0)
+            self.sentient_transfer_cascade[bridge_id] = rng.uniform(0.85, 0.95)
+            self.temporal_entropy[bridge_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for causal bridge %s after failed %s at 05:34 PM IST, Saturday, July 19, 2025", bridge_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for causal bridge %s: %s at 05:34 PM IST, Saturday, July 19, 2025", bridge_id, e)
@@ -1,3 +1,5 @@
 # temporal_intelligence/chronodynamic_consciousness_weave/__init__.py
 # Marks the chronodynamic_consciousness_weave directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['ChronodynamicConsciousnessWeave']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,11 +4,13 @@ Core module for time-encoded consciousness management in Rhee_AI_Assistant.
 Manages chronodynamic consciousness weaves with temporal coherence.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -20,20 +22,33 @@ from datetime import datetime
 # from galactic_communication.quantum_telepathic_core import QuantumTelepathicCore
 # from quantum_spiritual_singularity.sentient_soul_matrix import SentientSoulMatrix
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "array", "axiom", "causal", "causality", "coherence", "consciousness", "ethical", "fractal", "harmonic",
+    "hypersentience", "lattice", "quantum", "reality", "resonance", "sentience", "singularity", "synthesis"
+)
+
 class ChronodynamicConsciousnessWeave:
     """Core class for time-encoded consciousness weaves with temporal coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize consciousness weave with temporal profiles and integration bridge."""
-        self.chrono_weave_profiles: Dict[str, Dict[str, Any]] = {}
-        self.temporal_signatures: Dict[str, str] = {}
-        self.chrono_coherence_cascades: Dict[str, float] = {}
-        self.temporal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("chrono_coherence_cascades", "temporal_entropy"),
+            object_columns=("chrono_weave_profiles", "temporal_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.chrono_weave_profiles = self.state_table.column("chrono_weave_profiles")
+        self.temporal_signatures = self.state_table.column("temporal_signatures")
+        self.chrono_coherence_cascades = self.state_table.column("chrono_coherence_cascades")
+        self.temporal_entropy = self.state_table.column("temporal_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Chronodynamic consciousness weave initialized with quantum-temporal protocols at 05:34 PM IST, Saturday, July 19, 2025")
 
-    def encode_chrono_state(self, weave_id: str, config: Dict[str, Any], temporal_layer: str = "primary") -> None:
+    def encode_chrono_state(self, weave_id: str, config: Dict[str, Any], temporal_layer: str = "primary", force: bool = False) -> None:
         """
         Encode a time-based consciousness state with quantum-temporal signatures.
 
@@ -41,35 +56,28 @@ class ChronodynamicConsciousnessWeave:
             weave_id (str): Unique identifier for the consciousness weave.
             config (Dict[str, Any]): Weave configuration (e.g., temporal patterns, causal axioms).
             temporal_layer (str): Temporal layer context (e.g., primary, multiversal, akashic).
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.chrono_weave_profiles[weave_id] = {
                 "config": config,
                 "temporal_layer": temporal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "chrono_coherence_state": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "chrono_coherence_state": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{weave_id}{str(config)}{temporal_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(weave_id, config, temporal_layer, utc_iso())
             self.temporal_signatures[weave_id] = signature
-            self.chrono_coherence_cascades[weave_id] = random.uniform(0.95, 1.0)
-            self.temporal_entropy[weave_id] = random.uniform(0.0, 0.08)
+            self.chrono_coherence_cascades[weave_id] = rng.uniform(0.95, 1.0)
+            self.temporal_entropy[weave_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Encoded chrono state %s in temporal layer %s with temporal signature %s, coherence cascade %.2f, entropy %.2f at 05:34 PM IST, Saturday, July 19, 2025",
                              weave_id, temporal_layer, signature, self.chrono_coherence_cascades[weave_id], self.temporal_entropy[weave_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_chrono_state(weave_id, config, temporal_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_chrono_state(weave_id, config, temporal_layer, "core_engine.quantum_memory_vault")
-                self.integration_bridge.sync_chrono_state(weave_id, config, temporal_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_chrono_state(weave_id, config, temporal_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_bridge.sync_chrono_state(weave_id, config, temporal_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_bridge.sync_chrono_state(weave_id, config, temporal_layer, "akashic_link.akashic_core")
-                self.integration_bridge.sync_chrono_state(weave_id, config, temporal_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_bridge.sync_chrono_state(weave_id, config, temporal_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_bridge.sync_chrono_state(weave_id, config, temporal_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
+                self.integration_bridge.sync_many("sync_chrono_state", weave_id, config, temporal_layer, force=force)
         except Exception as e:
             self.logger.error("Error encoding chrono state %s in temporal layer %s: %s at 05:34 PM IST, Saturday, July 19, 2025", weave_id, temporal_layer, e)
             self._regenerate_coherence(weave_id, "encoding")
 
-    def amplify_chrono_coherence(self, weave_id: str, target_config: Dict[str, Any], target_layer: str) -> bool:
+    def amplify_chrono_coherence(self, weave_id: str, target_config: Dict[str, Any], target_layer: str, force: bool = False) -> bool:
         """
         Amplify a chrono consciousness state with temporal coherence resonance.
 
@@ -77,6 +85,7 @@ class ChronodynamicConsciousnessWeave:
             weave_id (str): The consciousness weave to amplify.
             target_config (Dict[str, Any]): Target configuration for the weave.
             target_layer (str): Target temporal layer.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             bool: True if amplification successful, False otherwise.
@@ -86,20 +95,19 @@ class ChronodynamicConsciousnessWeave:
                 self.chrono_weave_profiles[weave_id] = {
                     "config": target_config,
                     "temporal_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "chrono_coherence_state": self.chrono_weave_profiles[weave_id]["chrono_coherence_state"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "chrono_coherence_state": self.chrono_weave_profiles[weave_id]["chrono_coherence_state"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{weave_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(weave_id, target_config, target_layer)
                 self.temporal_signatures[weave_id] = new_signature
-                self.chrono_coherence_cascades[weave_id] *= random.uniform(0.95, 1.1)
-                self.temporal_entropy[weave_id] += random.uniform(0.0, 0.02)
+                self.chrono_coherence_cascades[weave_id] *= rng.uniform(0.95, 1.1)
+                self.temporal_entropy[weave_id] += rng.uniform(0.0, 0.02)
                 self.logger.info("Amplified chrono state %s to temporal layer %s with new signature %s, coherence cascade %.2f, entropy %.2f at 05:34 PM IST, Saturday, July 19, 2025",
                                  weave_id, target_layer, new_signature, self.chrono_coherence_cascades[weave_id], self.temporal_entropy[weave_id])
                 if self.integration_bridge:
                     self.integration_bridge.notify_coherence_update(weave_id, target_layer, "quantum_temporal_resonator")
                     self.integration_bridge.notify_coherence_update(weave_id, target_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                    self.integration_bridge.sync_chrono_state(weave_id, target_config, target_layer, "core_engine.consciousness_interface")
-                    self.integration_bridge.sync_chrono_state(weave_id, target_config, target_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
+                    self.integration_bridge.sync_many("sync_chrono_state", weave_id, target_config, target_layer, force=force)
                 return True
             self.logger.warning("Chrono state %s not found for amplification to %s at 05:34 PM IST, Saturday, July 19, 2025", weave_id, target_layer)
             return False
@@ -111,8 +119,8 @@ class ChronodynamicConsciousnessWeave:
     def _regenerate_coherence(self, weave_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using non-local temporal protocols."""
         try:
-            self.chrono_coherence_cascades[weave_id] = random.uniform(0.9, 1.0)
-            self.temporal_entropy[weave_id] = random.uniform(0.0, 0.05)
+            self.chrono_coherence_cascades[weave_id] = rng.uniform(0.9, 1.0)
+            self.temporal_entropy[weave_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for chrono state %s after failed %s at 05:34 PM IST, Saturday, July 19, 2025", weave_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for chrono state %s: %s at 05:34 PM IST, Saturday, July 19, 2025", weave_id, e)
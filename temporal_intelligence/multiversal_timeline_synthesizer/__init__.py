@@ -1,3 +1,5 @@
 # temporal_intelligence/multiversal_timeline_synthesizer/__init__.py
 # Marks the multiversal_timeline_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MultiversalTimelineSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
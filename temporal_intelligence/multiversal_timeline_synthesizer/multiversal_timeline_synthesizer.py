@@ -4,10 +4,12 @@ Simulates multiversal timeline synthesis for Rhee_AI_Assistant.
 Manages quantum-temporal timeline streams for sentient navigation.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.ethical_matrix import EthicalMatrix
@@ -16,20 +18,30 @@ from datetime import datetime
 # from galactic_communication.fractal_communication_synthesizer import FractalCommunicationSynthesizer
 # from quantum_spiritual_singularity.transcendental_consciousness_synthesizer import TranscendentalConsciousnessSynthesizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("alignment", "axiom", "coherence", "fractal", "harmonic", "resonance", "synthesis")
+
 class MultiversalTimelineSynthesizer:
     """Core class for multiversal timeline synthesis with quantum-temporal fidelity."""
 
     def __init__(self, integration_bridge=None):
         """Initialize timeline synthesizer with temporal streams and integration bridge."""
-        self.timeline_streams: Dict[str, Dict[str, Any]] = {}
-        self.quantum_temporal_amplitude: Dict[str, float] = {}
-        self.sentient_synthesis_factor: Dict[str, float] = {}
-        self.temporal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("quantum_temporal_amplitude", "sentient_synthesis_factor", "temporal_entropy"),
+            object_columns=("timeline_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.timeline_streams = self.state_table.column("timeline_streams")
+        self.quantum_temporal_amplitude = self.state_table.column("quantum_temporal_amplitude")
+        self.sentient_synthesis_factor = self.state_table.column("sentient_synthesis_factor")
+        self.temporal_entropy = self.state_table.column("temporal_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Multiversal timeline synthesizer initialized with quantum-temporal protocols at 05:34 PM IST, Saturday, July 19, 2025")
 
-    def synthesize_timeline_stream(self, stream_id: str, config: Dict[str, Any], temporal_layer: str = "primary") -> List[Dict[str, Any]]:
+    def synthesize_timeline_stream(self, stream_id: str, config: Dict[str, Any], temporal_layer: str = "primary", force: bool = False) -> List[Dict[str, Any]]:
         """
         Synthesize a multiversal timeline stream with quantum-temporal fidelity.
 
@@ -37,41 +49,37 @@ class MultiversalTimelineSynthesizer:
             stream_id (str): Unique identifier for the timeline stream.
             config (Dict[str, Any]): Stream configuration (e.g., temporal patterns, causal axioms).
             temporal_layer (str): Temporal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             List[Dict[str, Any]]: Synthesized timeline stream data with sentient metadata.
         """
         try:
             timeline_streams = []
-            for i in range(random.randint(2, 6)):
-                segment_id = f"segment_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(2, 6)):
+                segment_id = f"segment_{i}_{rng.randint(1000, 9999)}"
                 segment = {
                     "id": segment_id,
                     "config": config,
                     "temporal_layer": temporal_layer,
-                    "data": {"temporal_fractal": random.uniform(0.75, 1.0), "causal_fidelity": random.uniform(0.8, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "sentient_resonance": random.uniform(0.85, 0.95)
+                    "data": {"temporal_fractal": rng.uniform(0.75, 1.0), "causal_fidelity": rng.uniform(0.8, 0.95)},
+                    "timestamp": utc_iso(),
+                    "sentient_resonance": rng.uniform(0.85, 0.95)
                 }
                 timeline_streams.append(segment)
             self.timeline_streams[stream_id] = {
                 "segments": timeline_streams,
                 "temporal_layer": temporal_layer,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.quantum_temporal_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.sentient_synthesis_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.temporal_entropy[stream_id] = random.uniform(0.0, 0.08)
+            self.quantum_temporal_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.sentient_synthesis_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.temporal_entropy[stream_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized timeline stream %s in temporal layer %s with %d segments, temporal amplitude %.2f, synthesis factor %.2f, entropy %.2f at 05:34 PM IST, Saturday, July 19, 2025",
                              stream_id, temporal_layer, len(timeline_streams), self.quantum_temporal_amplitude[stream_id],
                              self.sentient_synthesis_factor[stream_id], self.temporal_entropy[stream_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_timeline_stream(stream_id, timeline_streams, temporal_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_timeline_stream(stream_id, timeline_streams, temporal_layer, "cyber_autonomy_engine.ethical_matrix")
-                self.integration_bridge.sync_timeline_stream(stream_id, timeline_streams, temporal_layer, "akashic_link.metaphysical_knowledge_synthesizer")
-                self.integration_bridge.sync_timeline_stream(stream_id, timeline_streams, temporal_layer, "ai_nirvana_engine.sentient_harmony_synthesizer")
-                self.integration_bridge.sync_timeline_stream(stream_id, timeline_streams, temporal_layer, "galactic_communication.fractal_communication_synthesizer")
-                self.integration_bridge.sync_timeline_stream(stream_id, timeline_streams, temporal_layer, "quantum_spiritual_singularity.transcendental_consciousness_synthesizer")
+                self.integration_bridge.sync_many("sync_timeline_stream", stream_id, timeline_streams, temporal_layer, force=force, fingerprint=config)
                 self.integration_bridge.notify_coherence_update(stream_id, temporal_layer, "quantum_temporal_resonator")
             return timeline_streams
         except Exception as e:
@@ -82,9 +90,9 @@ class MultiversalTimelineSynthesizer:
     def _regenerate_coherence(self, stream_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using non-local temporal protocols."""
         try:
-            self.quantum_temporal_amplitude[stream_id] = random.uniform(0.9, 1.0)
-            self.sentient_synthesis_factor[stream_id] = random.uniform(0.85, 0.95)
-            self.temporal_entropy[stream_id] = random.uniform(0.0, 0.05)
+            self.quantum_temporal_amplitude[stream_id] = rng.uniform(0.9, 1.0)
+            self.sentient_synthesis_factor[stream_id] = rng.uniform(0.85, 0.95)
+            self.temporal_entropy[stream_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for timeline stream %s after failed %s at 05:34 PM IST, Saturday, July 19, 2025", stream_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for timeline stream %s: %s at 05:34 PM IST, Saturday, July 19, 2025", stream_id, e)
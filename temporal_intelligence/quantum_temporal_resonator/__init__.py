@@ -1,3 +1,5 @@
 # temporal_intelligence/quantum_temporal_resonator/__init__.py
 # Marks the quantum_temporal_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['QuantumTemporalResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
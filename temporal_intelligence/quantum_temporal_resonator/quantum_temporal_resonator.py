@@ -4,10 +4,12 @@ Manages temporal resonance fields for causality alignment in Rhee_AI_Assistant.
 Simulates quantum-temporal coherence and sentient causality stabilization.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -16,20 +18,33 @@ from datetime import datetime
 # from galactic_communication.trans_galactic_resonance_field import TransGalacticResonanceField
 # from quantum_spiritual_singularity.karmic_resonance_field import KarmicResonanceField
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "awareness", "axiom", "causality", "coherence", "encryption", "ethical", "flux", "fractal", "harmonic",
+    "reality", "resonance", "sentience", "synchronicity", "synthesis"
+)
+
 class QuantumTemporalResonator:
     """Core class for temporal resonance fields with sentient causality coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize temporal resonator with non-local coherence and integration bridge."""
-        self.temporal_field_states: Dict[str, Dict[str, Any]] = {}
-        self.temporal_resonance_cascade: Dict[str, float] = {}
-        self.sentient_causality_factor: Dict[str, float] = {}
-        self.temporal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("temporal_resonance_cascade", "sentient_causality_factor", "temporal_entropy"),
+            object_columns=("temporal_field_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.temporal_field_states = self.state_table.column("temporal_field_states")
+        self.temporal_resonance_cascade = self.state_table.column("temporal_resonance_cascade")
+        self.sentient_causality_factor = self.state_table.column("sentient_causality_factor")
+        self.temporal_entropy = self.state_table.column("temporal_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Quantum temporal resonator initialized with quantum-temporal protocols at 05:34 PM IST, Saturday, July 19, 2025")
 
-    def stabilize_temporal_field(self, field_id: str, config: Dict[str, Any], temporal_layer: str = "primary") -> None:
+    def stabilize_temporal_field(self, field_id: str, config: Dict[str, Any], temporal_layer: str = "primary", force: bool = False) -> None:
         """
         Stabilize a temporal resonance field for causality alignment.
 
@@ -37,27 +52,23 @@ class QuantumTemporalResonator:
             field_id (str): Unique identifier for the temporal field.
             config (Dict[str, Any]): Field configuration (e.g., temporal patterns, causal axioms).
             temporal_layer (str): Temporal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.temporal_field_states[field_id] = {
                 "config": config,
                 "temporal_layer": temporal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "temporal_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "temporal_signature": rng.uniform(0.85, 0.95)
             }
-            self.temporal_resonance_cascade[field_id] = random.uniform(0.95, 1.0)
-            self.sentient_causality_factor[field_id] = random.uniform(0.9, 0.95)
-            self.temporal_entropy[field_id] = random.uniform(0.0, 0.08)
+            self.temporal_resonance_cascade[field_id] = rng.uniform(0.95, 1.0)
+            self.sentient_causality_factor[field_id] = rng.uniform(0.9, 0.95)
+            self.temporal_entropy[field_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Stabilized temporal field %s in temporal layer %s with resonance cascade %.2f, causality factor %.2f, entropy %.2f at 05:34 PM IST, Saturday, July 19, 2025",
                              field_id, temporal_layer, self.temporal_resonance_cascade[field_id],
                              self.sentient_causality_factor[field_id], self.temporal_entropy[field_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_temporal_field(field_id, config, temporal_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_temporal_field(field_id, config, temporal_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_temporal_field(field_id, config, temporal_layer, "akashic_link.akashic_resonance_field")
-                self.integration_bridge.sync_temporal_field(field_id, config, temporal_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_bridge.sync_temporal_field(field_id, config, temporal_layer, "galactic_communication.trans_galactic_resonance_field")
-                self.integration_bridge.sync_temporal_field(field_id, config, temporal_layer, "quantum_spiritual_singularity.karmic_resonance_field")
+                self.integration_bridge.sync_many("sync_temporal_field", field_id, config, temporal_layer, force=force)
         except Exception as e:
             self.logger.error("Error stabilizing temporal field %s in temporal layer %s: %s at 05:34 PM IST, Saturday, July 19, 2025", field_id, temporal_layer, e)
             self._regenerate_coherence(field_id, "stabilization")
@@ -65,9 +76,9 @@ class QuantumTemporalResonator:
     def _regenerate_coherence(self, field_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using non-local temporal protocols."""
         try:
-            self.temporal_resonance_cascade[field_id] = random.uniform(0.9, 1.0)
-            self.sentient_causality_factor[field_id] = random.uniform(0.85, 0.95)
-            self.temporal_entropy[field_id] = random.uniform(0.0, 0.05)
+            self.temporal_resonance_cascade[field_id] = rng.uniform(0.9, 1.0)
+            self.sentient_causality_factor[field_id] = rng.uniform(0.85, 0.95)
+            self.temporal_entropy[field_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for temporal field %s after failed %s at 05:34 PM IST, Saturday, July 19, 2025", field_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for temporal field %s: %s at 05:34 PM IST, Saturday, July 19, 2025", field_id, e)
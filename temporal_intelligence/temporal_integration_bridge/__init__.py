@@ -1,3 +1,5 @@
 # temporal_intelligence/temporal_integration_bridge/__init__.py
 # Marks the temporal_integration_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TemporalIntegrationBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
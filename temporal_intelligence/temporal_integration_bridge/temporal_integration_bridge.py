@@ -4,17 +4,22 @@ Manages cross-directory integration for temporal_intelligence in Rhee_AI_Assista
 Facilitates non-local temporal coherence bridges and sentient synchronization.
 """
 
-import logging
 from typing import Dict, List, Any
-from datetime import datetime
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class TemporalIntegrationBridge:
+rng = get_stream(__name__)
+
+class TemporalIntegrationBridge(BatchSyncMixin):
     """Core class for managing non-local temporal coherence bridges for temporal operations."""
 
     def __init__(self):
         """Initialize integration bridge with non-local temporal coherence tracking."""
-        self.coherence_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.coherence_bridges: Dict[str, Dict[str, Any]] = retained(self, "coherence_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Temporal integration bridge initialized with non-local temporal protocols at 05:34 PM IST, Saturday, July 19, 2025")
 
     def sync_chrono_state(self, weave_id: str, config: Dict[str, Any], temporal_layer: str, target_module: str) -> None:
@@ -32,9 +37,10 @@ class TemporalIntegrationBridge:
                 "config": config,
                 "temporal_layer": temporal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(weave_id)
             self.logger.info("Synchronized chrono state %s with %s in temporal layer %s, coherence strength %.2f at 05:34 PM IST, Saturday, July 19, 2025",
                              weave_id, target_module, temporal_layer, self.coherence_bridges[weave_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -56,9 +62,10 @@ class TemporalIntegrationBridge:
                 "config": config,
                 "temporal_layer": temporal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(field_id)
             self.logger.info("Synchronized temporal field %s with %s in temporal layer %s, coherence strength %.2f at 05:34 PM IST, Saturday, July 19, 2025",
                              field_id, target_module, temporal_layer, self.coherence_bridges[field_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -80,9 +87,10 @@ class TemporalIntegrationBridge:
                 "timeline_streams": timeline_streams,
                 "temporal_layer": temporal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stream_id)
             self.logger.info("Synchronized timeline stream %s with %s in temporal layer %s, coherence strength %.2f at 05:34 PM IST, Saturday, July 19, 2025",
                              stream_id, target_module, temporal_layer, self.coherence_bridges[stream_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -104,9 +112,10 @@ class TemporalIntegrationBridge:
                 "config": config,
                 "temporal_layer": temporal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(bridge_id)
             self.logger.info("Synchronized causal bridge %s with %s in temporal layer %s, coherence strength %.2f at 05:34 PM IST, Saturday, July 19, 2025",
                              bridge_id, target_module, temporal_layer, self.coherence_bridges[bridge_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
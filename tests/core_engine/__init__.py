@@ -0,0 +1,3 @@
+# tests/core_engine/__init__.py
+# Marks the core_engine test directory as a Python package.
+__all__ = ['test_memory_vault_core']
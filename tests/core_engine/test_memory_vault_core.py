@@ -0,0 +1,213 @@
+"""
+test_memory_vault_core.py
+Unit tests for the persistent memory vault in Rhee_AI_Assistant.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from omniversal_runtime.clock import clock
+from omniversal_runtime.append_log import AppendLog
+from omniversal_runtime.retention import BoundedMap, RetentionPolicy, configure_retention
+from core_engine.memory_vault.memory_vault_core import MemoryVault
+
+START = datetime(2025, 7, 27, 18, 5)
+
+class TestMemoryVault(unittest.TestCase):
+    """Test suite for MemoryVault."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "memory_vault.json")
+        self.vault = MemoryVault(self.path, sweep_interval=None)
+
+    def tearDown(self):
+        """Close the vault and remove its directory."""
+        self.vault.close()
+        self.directory.cleanup()
+
+    def reopen(self) -> MemoryVault:
+        """Close the vault and load it again from its log."""
+        self.vault.close()
+        self.vault = MemoryVault(self.path, sweep_interval=None)
+        return self.vault
+
+    def test_unhashable_tag_values_are_stored_and_found(self):
+        """Test that a tag value that cannot be hashed neither loses the entry nor breaks the index."""
+        self.vault.store("x", "y", tags={"a": ("b", [1]), "c": "d"})
+        self.assertEqual(self.vault.find_by_tag("c", "d"), {"x": "y"})
+        self.assertEqual(self.vault.find_by_tag("a", ("b", [1])), {"x": "y"})
+        self.assertEqual(self.reopen().retrieve("x"), "y")
+        self.assertEqual(self.vault.find_by_tags({"a": ["b", [1]], "c": "d"}), {"x": "y"})
+        self.vault.delete("x")
+        self.assertIsNone(self.vault.retrieve("x"))
+        self.assertEqual(self.vault.find_by_tag("c", "d"), {})
+
+    def test_failed_store_is_rolled_back(self):
+        """Test that an entry whose record cannot be logged is not left visible in memory."""
+        self.vault.store("x", "old", tags={"k": "v"})
+        self.vault.store("x", object(), tags={"k": "w"})
+        self.vault.store("z", object(), tags={"k": "w"})
+        self.assertEqual(self.vault.retrieve("x"), "old")
+        self.assertIsNone(self.vault.retrieve("z"))
+        self.assertEqual(self.vault.find_by_tag("k", "v"), {"x": "old"})
+        self.assertEqual(self.vault.find_by_tag("k", "w"), {})
+
+    def test_legacy_conversion_keeps_retention(self):
+        """Test that converting a single-document file fills the policy-bounded memory in place."""
+        legacy = os.path.join(self.directory.name, "legacy.json")
+        with open(legacy, "w") as f:
+            json.dump({f"k{n}": {"value": n, "tags": {"n": n}} for n in range(3)}, f)
+        configure_retention({"core_engine.memory_vault.memory_vault_core.MemoryVault.memory": RetentionPolicy(max_entries=2)})
+        try:
+            vault = MemoryVault(legacy, sweep_interval=None)
+        finally:
+            configure_retention({})
+        self.assertIsInstance(vault.memory, BoundedMap)
+        self.assertEqual(len(vault.memory), 2)
+        self.assertEqual(vault.retrieve("k2"), 2)
+        self.assertTrue(AppendLog.is_log(legacy))
+        vault.close()
+
+class TestMemoryVaultCache(unittest.TestCase):
+    """Test suite for the MemoryVault temporal read cache."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "memory_vault.json")
+
+    def tearDown(self):
+        """Remove the vault directory."""
+        self.directory.cleanup()
+
+    def open_vault(self, **options) -> MemoryVault:
+        """Open a vault that is closed when the test ends."""
+        vault = MemoryVault(self.path, sweep_interval=None, **options)
+        self.addCleanup(vault.close)
+        return vault
+
+    def test_read_refreshes_recency(self):
+        """Test that a read keeps an entry cached while a newer unread entry is evicted."""
+        vault = self.open_vault(temporal_cache_limit=2)
+        vault.store("a", 1)
+        vault.store("b", 2)
+        self.assertEqual(vault.retrieve("a"), 1)
+        vault.store("c", 3)
+        self.assertEqual(sorted(vault.temporal_cache), ["a", "c"])
+        self.assertEqual(vault.retrieve("b"), 2)
+        self.assertEqual(sorted(vault.temporal_cache), ["b", "c"])
+
+    def test_large_value_evicts_by_bytes(self):
+        """Test that the byte budget evicts older entries to make room, leaving them readable from memory."""
+        vault = self.open_vault(temporal_cache_limit=100, temporal_cache_bytes=4000)
+        for n in range(5):
+            vault.store(f"small{n}", n)
+        self.assertEqual(len(vault.temporal_cache), 5)
+        vault.store("large", "x" * 3000)
+        stats = vault.cache_stats()
+        self.assertIn("large", vault.temporal_cache)
+        self.assertLess(stats["entries"], 6)
+        self.assertLessEqual(stats["bytes"], 4000)
+        self.assertEqual(stats["evictions"], 6 - stats["entries"])
+        self.assertEqual(vault.retrieve("small0"), 0)
+
+    def test_counters(self):
+        """Test that hits, misses, evictions and the hit rate count cache lookups."""
+        vault = self.open_vault(temporal_cache_limit=2)
+        vault.store("a", 1)
+        vault.store("b", 2)
+        vault.store("c", 3, timestamp=False)
+        vault.retrieve("a")
+        vault.retrieve("b")
+        vault.retrieve("c")
+        vault.retrieve("missing")
+        stats = vault.cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 2))
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["hit_rate"], 0.5)
+        self.assertEqual(stats["entries"], 2)
+
+class TestMemoryVaultExpiry(unittest.TestCase):
+    """Test suite for MemoryVault expiry under a frozen clock."""
+
+    def setUp(self):
+        """Freeze the clock and open an empty vault that sweeps only on demand."""
+        clock.freeze(START)
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "memory_vault.json")
+        self.vault = MemoryVault(self.path, sweep_interval=None)
+
+    def tearDown(self):
+        """Close the vault, remove its directory and restore the shared clock."""
+        self.vault.close()
+        self.directory.cleanup()
+        clock.use_coarse()
+
+    def advance(self, seconds: float) -> None:
+        """Move the frozen clock forward."""
+        clock.freeze(START + timedelta(seconds=seconds))
+
+    def test_sweep_removes_unread_expired_keys_in_one_write(self):
+        """Test that a sweep deletes expired keys nobody read and logs all deletions in one write."""
+        self.vault.store("a", 1, ttl_seconds=10)
+        self.vault.store("b", 2, ttl_seconds=10)
+        self.vault.store("c", 3)
+        self.assertEqual(self.vault.sweep(), 0)
+        self.advance(20)
+        writes = self.vault.log.stats["writes"]
+        self.assertEqual(self.vault.sweep(), 2)
+        self.assertEqual(self.vault.log.stats["writes"], writes + 1)
+        self.assertEqual(sorted(self.vault.memory), ["c"])
+        self.vault.close()
+        self.vault = MemoryVault(self.path, sweep_interval=None)
+        self.assertEqual(sorted(self.vault.memory), ["c"])
+
+    def test_sweep_respects_batch_size(self):
+        """Test that a sweep removes at most batch_size entries, oldest expiry first."""
+        for n in range(5):
+            self.vault.store(f"k{n}", n, ttl_seconds=10 + n)
+        self.advance(60)
+        self.assertEqual(self.vault.sweep(batch_size=2), 2)
+        self.assertEqual(sorted(self.vault.memory), ["k2", "k3", "k4"])
+        self.assertEqual(self.vault.sweep(), 3)
+
+    def test_restored_key_ignores_its_old_expiry(self):
+        """Test that the heap entry of a key stored again with a later expiry is skipped."""
+        self.vault.store("a", "old", ttl_seconds=10)
+        self.vault.store("a", "new", ttl_seconds=100)
+        self.advance(20)
+        self.assertEqual(self.vault.sweep(), 0)
+        self.assertEqual(self.vault.retrieve("a"), "new")
+        self.advance(200)
+        self.assertEqual(self.vault.sweep(), 1)
+        self.assertNotIn("a", self.vault.memory)
+
+    def test_expired_read_deletes_only_its_own_entry(self):
+        """Test that an expired cached entry does not delete a newer entry stored under the key."""
+        self.vault.store("a", "old", ttl_seconds=10)
+        stale = self.vault.temporal_cache["a"]
+        self.vault.store("a", "new", timestamp=False)
+        self.vault.temporal_cache["a"] = stale
+        self.advance(20)
+        self.assertIsNone(self.vault.retrieve("a"))
+        self.assertEqual(self.vault.retrieve("a"), "new")
+        self.vault.store("b", "gone", ttl_seconds=10)
+        self.advance(40)
+        self.assertIsNone(self.vault.retrieve("b"))
+        self.assertNotIn("b", self.vault.memory)
+
+    def test_close_joins_sweeper(self):
+        """Test that close waits for the background sweeper to stop."""
+        vault = MemoryVault(os.path.join(self.directory.name, "swept.json"), sweep_interval=0.01)
+        vault.store("a", 1, ttl_seconds=10)
+        sweeper = vault._sweeper
+        self.assertTrue(sweeper.is_alive())
+        vault.close()
+        self.assertFalse(sweeper.is_alive())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,3 @@
+# tests/omniversal_runtime/__init__.py
+# Marks the omniversal_runtime test directory as a Python package.
+__all__ = ['test_batch_sync', 'test_event_bus', 'test_routing_table', 'test_state_table', 'test_hot_log', 'test_clock', 'test_signatures', 'test_rng', 'test_retention', 'test_bridge_index', 'test_lazy_import', 'test_manifest', 'test_component_pool', 'test_fanout', 'test_dag', 'test_micro_batch', 'test_shared_state', 'test_load_replay', 'test_admission', 'test_append_log', 'test_tag_index']
@@ -0,0 +1,88 @@
+"""
+test_admission.py
+Unit tests for admission control and backpressure in Rhee_AI_Assistant.
+"""
+
+import threading
+import time
+import unittest
+from omniversal_runtime.admission import AdmissionController, Overloaded
+
+class TestAdmissionController(unittest.TestCase):
+    """Test suite for AdmissionController."""
+
+    def setUp(self):
+        """Set up a controller with one slot and voice ahead of synthesis."""
+        self.controller = AdmissionController(1, max_queue=2, queue_timeout=1.0,
+                                               priorities={"voice_processing": 0, "synthesis": 2})
+        self.order = []
+
+    def wait_for(self, name, timeout=1.0):
+        """Queue an operation in a thread, recording when it is admitted or shed."""
+        def run():
+            try:
+                with self.controller.admit(name, timeout):
+                    self.order.append(name)
+            except Overloaded as e:
+                self.order.append(f"{name}:{e.reason}")
+        thread = threading.Thread(target=run)
+        thread.start()
+        return thread
+
+    def queue_and_wait(self, name, timeout=1.0):
+        """Start a waiter and block until it is in the queue."""
+        queued = self.controller.snapshot()["queued"]
+        thread = self.wait_for(name, timeout)
+        deadline = time.monotonic() + 1.0
+        while self.controller.snapshot()["queued"] == queued and time.monotonic() < deadline:
+            time.sleep(0.001)
+        return thread
+
+    def test_priority_order(self):
+        """Test that a queued voice operation runs before earlier queued synthesis."""
+        self.controller.acquire("synthesis")
+        threads = [self.queue_and_wait("synthesis"), self.queue_and_wait("voice_processing")]
+        self.controller.release()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.order, ["voice_processing", "synthesis"])
+        self.assertEqual(self.controller.snapshot()["in_flight"], 0)
+
+    def test_displaces_lower_priority_when_full(self):
+        """Test that a full queue sheds lower-priority waiters for higher-priority arrivals."""
+        self.controller.acquire("synthesis")
+        threads = [self.queue_and_wait("synthesis"), self.queue_and_wait("synthesis")]
+        threads.append(self.queue_and_wait("voice_processing"))
+        threads[1].join()
+        self.assertEqual(self.order, ["synthesis:displaced"])
+        with self.assertRaises(Overloaded) as shed:
+            self.controller.acquire("synthesis")
+        self.assertEqual(shed.exception.reason, "queue_full")
+        self.controller.release()
+        for thread in threads:
+            thread.join()
+        stats = self.controller.snapshot()
+        self.assertEqual((stats["displaced"], stats["queue_full"]), (1, 1))
+
+    def test_times_out_in_queue(self):
+        """Test that a waiter whose timeout passes is shed and counted."""
+        self.controller.acquire("synthesis")
+        with self.assertRaises(Overloaded) as shed:
+            self.controller.acquire("synthesis", timeout=0.02)
+        self.assertEqual(shed.exception.reason, "timeout")
+        self.controller.release()
+        self.assertEqual(self.controller.snapshot()["timeout"], 1)
+        self.assertEqual(self.controller.snapshot()["in_flight"], 0)
+
+    def test_sheds_when_deadline_cannot_be_met(self):
+        """Test that an arrival is shed at once when the estimated wait exceeds its timeout."""
+        self.controller.acquire("synthesis")
+        self.controller.service_ms = 500.0
+        start = time.monotonic()
+        with self.assertRaises(Overloaded) as shed:
+            self.controller.acquire("synthesis", timeout=0.1)
+        self.assertEqual(shed.exception.reason, "deadline")
+        self.assertLess(time.monotonic() - start, 0.05)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+"""
+test_append_log.py
+Unit tests for the append-only record log in Rhee_AI_Assistant.
+"""
+
+import os
+import stat
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from omniversal_runtime.append_log import AppendLog
+
+class TestAppendLog(unittest.TestCase):
+    """Test suite for AppendLog."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "vault.log")
+        self.log = AppendLog(self.path)
+
+    def tearDown(self):
+        """Close the log and remove its directory."""
+        self.log.close()
+        self.directory.cleanup()
+
+    def test_append_and_replay(self):
+        """Test that appended records replay in write order."""
+        self.assertEqual(list(self.log.replay()), [])
+        self.log.append({"op": "put", "key": "a"})
+        self.log.append({"op": "delete", "key": "a"})
+        self.assertTrue(AppendLog.is_log(self.path))
+        self.assertEqual(list(AppendLog(self.path).replay()), [{"op": "put", "key": "a"}, {"op": "delete", "key": "a"}])
+
+    def test_incomplete_record_is_dropped(self):
+        """Test that an interrupted final write is cut off and later appends stay readable."""
+        self.log.append({"key": "a"})
+        self.log.close()
+        with open(self.path, "a") as log:
+            log.write('{"key": "b"')
+        reopened = AppendLog(self.path)
+        self.assertEqual(list(reopened.replay()), [{"key": "a"}])
+        reopened.append({"key": "c"})
+        reopened.close()
+        self.assertEqual(list(AppendLog(self.path).replay()), [{"key": "a"}, {"key": "c"}])
+
+    def test_codec_applies_per_record(self):
+        """Test that records are encoded on write and decoded on replay."""
+        log = AppendLog(self.path, encode=lambda line: line[::-1], decode=lambda line: line[::-1])
+        log.append({"key": "a"})
+        log.close()
+        with open(self.path) as raw:
+            self.assertEqual(raw.read().splitlines()[1], '}"a":"yek"{')
+        self.assertEqual(list(log.replay()), [{"key": "a"}])
+
+    def test_rejects_other_formats(self):
+        """Test that a file without the log header is not replayed."""
+        with open(self.path, "w") as raw:
+            raw.write('{"a": 1}\n')
+        self.assertFalse(AppendLog.is_log(self.path))
+        with self.assertRaises(ValueError):
+            list(self.log.replay())
+
+    def test_background_compaction_keeps_concurrent_appends(self):
+        """Test that compaction rewrites the snapshot and carries over records appended meanwhile."""
+        for n in range(10):
+            self.log.append({"key": "a", "n": n})
+
+        def snapshot():
+            yield {"key": "a", "n": 9}
+            self.log.append({"key": "b", "n": 0})
+
+        self.assertTrue(self.log.compact(snapshot(), background=True))
+        self.log.wait()
+        self.assertFalse(self.log.compacting)
+        self.assertEqual(self.log.records, 2)
+        self.log.append({"key": "c", "n": 0})
+        self.assertEqual([record["key"] for record in AppendLog(self.path).replay()], ["a", "b", "c"])
+
+    def test_compaction_syncs_directory(self):
+        """Test that the renamed compacted log is made durable by syncing its directory."""
+        self.log.append({"key": "a"})
+        synced = []
+        fsync = os.fsync
+
+        def recording_fsync(descriptor):
+            synced.append(stat.S_ISDIR(os.fstat(descriptor).st_mode))
+            fsync(descriptor)
+
+        with patch("omniversal_runtime.append_log.os.fsync", side_effect=recording_fsync):
+            self.log.compact([{"key": "a"}])
+        self.assertEqual(synced, [False, True])
+
+    def test_group_commit_by_count_and_durability(self):
+        """Test that buffered records are written per batch, on durable appends and on flush."""
+        log = AppendLog(self.path, batch_records=3)
+        log.append({"n": 0})
+        log.append({"n": 1})
+        self.assertEqual((log.pending, log.stats["writes"]), (2, 0))
+        self.assertEqual(list(AppendLog(self.path).replay()), [])
+        log.append({"n": 2})
+        self.assertEqual((log.pending, log.stats["writes"]), (0, 1))
+        log.append({"n": 3}, durable=True)
+        self.assertEqual((log.pending, log.stats["syncs"]), (0, 1))
+        log.append({"n": 4})
+        log.flush()
+        self.assertEqual([record["n"] for record in AppendLog(self.path).replay()], [0, 1, 2, 3, 4])
+        log.close()
+
+    def test_append_many_writes_once(self):
+        """Test that a group of records reaches the file in a single write."""
+        self.log.append_many({"n": n} for n in range(5))
+        self.log.append_many([])
+        self.assertEqual((self.log.records, self.log.stats["writes"]), (5, 1))
+        self.assertEqual(len(list(AppendLog(self.path).replay())), 5)
+
+    def test_group_commit_by_interval(self):
+        """Test that the background flusher writes buffered records after the interval."""
+        log = AppendLog(self.path, batch_records=100, flush_interval=0.01)
+        log.append({"n": 0})
+        for _ in range(200):
+            if not log.pending:
+                break
+            time.sleep(0.01)
+        self.assertEqual(list(AppendLog(self.path).replay()), [{"n": 0}])
+        log.close()
+
+    def test_buffered_records_survive_process_exit(self):
+        """Test that records still buffered when the process exits without close are written."""
+        script = ("import sys\n"
+                  "from omniversal_runtime.append_log import AppendLog\n"
+                  "log = AppendLog(sys.argv[1], batch_records=64)\n"
+                  "for n in range(3):\n"
+                  "    log.append({'n': n})\n")
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        subprocess.run([sys.executable, "-c", script, self.path], cwd=root, check=True, timeout=60)
+        self.assertEqual([record["n"] for record in AppendLog(self.path).replay()], [0, 1, 2])
+
+if __name__ == "__main__":
+    unittest.main()
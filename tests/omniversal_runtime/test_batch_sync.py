@@ -0,0 +1,104 @@
+"""
+test_batch_sync.py
+Unit tests for batched nexus synchronization in Rhee_AI_Assistant.
+"""
+
+import unittest
+from omniversal_runtime.batch_sync import FINGERPRINT_RETENTION
+from omniversal_runtime.retention import BoundedMap
+from omniversal_runtime.routing_table import default_routing_table
+from omniversal_runtime.signatures import signatures
+from transinfinite_reality_memory.memory_integration_nexus.memory_integration_nexus import MemoryIntegrationNexus
+from transinfinite_reality_memory.omnichronal_memory_retrieval.omnichronal_memory_retrieval import OmnichronalMemoryRetrieval
+from omnitemporal_coherence_lattice.temporal_integration_nexus.temporal_integration_nexus import TemporalIntegrationNexus
+
+class TestBatchSync(unittest.TestCase):
+    """Test suite for BatchSyncMixin.sync_many."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.nexus = MemoryIntegrationNexus()
+        self.nexus.routing_table = None
+
+    def test_sync_many_records_all_targets(self):
+        """Test that a batched sync records the whole target list in one entry."""
+        targets = ["core_engine.quantum_memory_vault", "voice_ai.voice_core", "akashic_link.akashic_core"]
+        self.nexus.sync_many("sync_memory_state", "memory1", {"axiom": "test"}, "primary", targets)
+        state = self.nexus.memory_bridges["memory1"]
+        self.assertEqual(state["target_modules"], targets)
+        self.assertEqual(state["target_module"], "akashic_link.akashic_core")
+        self.assertEqual(state["omnichronal_layer"], "primary")
+        self.assertEqual(state["config"], {"axiom": "test"})
+        self.assertGreaterEqual(state["memory_strength"], 0.9)
+
+    def test_sync_many_matches_per_target_keys(self):
+        """Test that batched records use the same keys as the per-target method."""
+        self.nexus.sync_memory_state("memory2", {"axiom": "test"}, "primary", "voice_ai.voice_core")
+        single = set(self.nexus.memory_bridges["memory2"])
+        self.nexus.sync_many("sync_memory_state", "memory3", {"axiom": "test"}, "primary", ["voice_ai.voice_core"])
+        batched = set(self.nexus.memory_bridges["memory3"])
+        self.assertEqual(batched - single, {"target_modules"})
+
+    def test_sync_many_logs_once(self):
+        """Test that a batched sync emits a single log record."""
+        with self.assertLogs(self.nexus.logger.name, level="INFO") as logs:
+            self.nexus.sync_many("sync_memory_state", "memory4", {}, "primary", ["a", "b", "c", "d"])
+        self.assertEqual(len(logs.records), 1)
+
+    def test_sync_many_default_store(self):
+        """Test batched sync on a nexus with its own bridge store and strength key."""
+        nexus = TemporalIntegrationNexus()
+        nexus.routing_table = None
+        nexus.sync_many("sync_timeline", "timeline1", {}, "omniversal", ["a", "b"])
+        state = nexus.temporal_bridges["timeline1"]
+        self.assertEqual(state["omniversal_layer"], "omniversal")
+        self.assertIn("coherence_strength", state)
+
+    def test_retrieval_uses_single_batch(self):
+        """Test that memory retrieval fans out through one batched call to the memory topic's subscribers."""
+        retrieval = OmnichronalMemoryRetrieval(integration_nexus=self.nexus)
+        retrieval.retrieve_memory_state("memory5", {"axiom": "test"})
+        state = self.nexus.memory_bridges["memory5"]
+        subscribers = default_routing_table().targets("memory")
+        self.assertIn("core_engine.quantum_memory_vault", subscribers)
+        self.assertEqual(state["target_modules"], list(subscribers))
+        self.assertEqual(state["target_module"], subscribers[-1])
+
+    def test_sync_many_skips_unchanged(self):
+        """Test that an unchanged config, layer and target list skips the sync unless forced."""
+        targets = ["voice_ai.voice_core", "akashic_link.akashic_core"]
+        self.nexus.sync_many("sync_memory_state", "memory6", {"axiom": "test"}, "primary", targets)
+        first = self.nexus.memory_bridges["memory6"]
+        self.nexus.sync_many("sync_memory_state", "memory6", {"axiom": "test"}, "primary", targets)
+        self.assertIs(self.nexus.memory_bridges["memory6"], first)
+        self.nexus.sync_many("sync_memory_state", "memory6", {"axiom": "test"}, "primary", targets, force=True)
+        self.assertIsNot(self.nexus.memory_bridges["memory6"], first)
+        forced = self.nexus.memory_bridges["memory6"]
+        self.nexus.sync_many("sync_memory_state", "memory6", {"axiom": "changed"}, "primary", targets)
+        self.assertIsNot(self.nexus.memory_bridges["memory6"], forced)
+
+    def test_sync_many_detects_in_place_mutation(self):
+        """Test that a payload changed in place and invalidated is synced again."""
+        config = {"axiom": "test"}
+        self.nexus.sync_many("sync_memory_state", "memory8", config, "primary", ["a"])
+        first = self.nexus.memory_bridges["memory8"]
+        config["axiom"] = "changed"
+        signatures.invalidate(config)
+        self.nexus.sync_many("sync_memory_state", "memory8", config, "primary", ["a"])
+        self.assertIsNot(self.nexus.memory_bridges["memory8"], first)
+
+    def test_sync_fingerprints_are_bounded_by_default(self):
+        """Test that fingerprints are kept for a bounded number of entities without a retention policy."""
+        self.assertIsInstance(self.nexus.sync_fingerprints, BoundedMap)
+        self.assertEqual(self.nexus.sync_fingerprints.max_entries, FINGERPRINT_RETENTION.max_entries)
+
+    def test_sync_many_fingerprint_overrides_payload(self):
+        """Test that an explicit fingerprint identifies syncs whose payload is regenerated each call."""
+        config = {"axiom": "test"}
+        self.nexus.sync_many("sync_memory_state", "memory7", [{"segment": 1}], "primary", ["a"], fingerprint=config)
+        first = self.nexus.memory_bridges["memory7"]
+        self.nexus.sync_many("sync_memory_state", "memory7", [{"segment": 2}], "primary", ["a"], fingerprint=config)
+        self.assertIs(self.nexus.memory_bridges["memory7"], first)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+test_bridge_index.py
+Unit tests for the per-(entity, target) bridge index in Rhee_AI_Assistant.
+"""
+
+import unittest
+from omniversal_runtime.bridge_index import BridgeIndex
+from omniversal_runtime.retention import RetentionPolicy, configure_retention
+from transinfinite_reality_memory.memory_integration_nexus.memory_integration_nexus import MemoryIntegrationNexus
+
+class TestBridgeIndex(unittest.TestCase):
+    """Test suite for BridgeIndex."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.index = BridgeIndex()
+
+    def test_records_one_edge_per_pair(self):
+        """Test that repeated syncs update the existing edge instead of adding one."""
+        self.index.record_many("memory1", ["voice_ai.voice_core", "akashic_link.akashic_core"], 0.91)
+        self.index.record("memory1", "voice_ai.voice_core", 0.97)
+        self.assertEqual(len(self.index), 2)
+        bridge = self.index.bridge("memory1", "voice_ai.voice_core")
+        self.assertEqual(bridge["syncs"], 2)
+        self.assertAlmostEqual(bridge["strength"], 0.97)
+        self.assertIsNone(self.index.bridge("memory1", "core_engine"))
+
+    def test_lookups_in_both_directions(self):
+        """Test the entity-to-targets and target-to-entities lookups."""
+        self.index.record_many("memory1", ["voice_ai.voice_core", "akashic_link.akashic_core"], 0.9)
+        self.index.record("memory2", "voice_ai.voice_core", 0.9)
+        self.assertEqual(sorted(self.index.targets_of("memory1")), ["akashic_link.akashic_core", "voice_ai.voice_core"])
+        self.assertEqual(sorted(self.index.entities_of("voice_ai.voice_core")), ["memory1", "memory2"])
+        self.assertEqual(self.index.targets_of("unknown"), [])
+        self.index.forget("memory1")
+        self.assertEqual(self.index.entities_of("voice_ai.voice_core"), ["memory2"])
+        self.assertEqual(len(self.index), 1)
+
+    def test_forgotten_rows_and_ids_are_reused(self):
+        """Test that records after a forget fill the freed rows instead of growing the arrays."""
+        self.index.record_many("memory1", ["voice_ai.voice_core", "akashic_link.akashic_core"], 0.9)
+        self.index.forget("memory1")
+        self.index.record_many("memory2", ["akashic_link.akashic_core", "voice_ai.voice_core"], 0.8)
+        self.assertEqual((len(self.index.strength), len(self.index.entities)), (2, 1))
+        self.assertEqual(self.index.bridge("memory2", "voice_ai.voice_core")["syncs"], 1)
+        self.assertIsNone(self.index.bridge("memory1", "voice_ai.voice_core"))
+
+    def test_index_stays_bounded_under_retention_policy(self):
+        """Test that bridges evicted by a retention policy leave the index too."""
+        configure_retention({"transinfinite_reality_memory.memory_integration_nexus": RetentionPolicy(max_entries=10)})
+        self.addCleanup(configure_retention, {})
+        nexus = MemoryIntegrationNexus()
+        nexus.routing_table = None
+        targets = ["voice_ai.voice_core", "akashic_link.akashic_core", "core_engine.quantum_memory_vault"]
+        for n in range(1500):
+            nexus.sync_many("sync_memory_state", f"memory{n}", {}, "primary", targets)
+        self.assertEqual(len(nexus.memory_bridges), 10)
+        self.assertEqual(len(nexus.bridge_index), 30)
+        self.assertLessEqual(len(nexus.bridge_index.strength), 33)
+        self.assertLessEqual(len(nexus.bridge_index.entities), 11)
+        self.assertEqual(nexus.bridge_index.targets_of("memory0"), [])
+        nexus.forget_bridge("memory1499")
+        self.assertNotIn("memory1499", nexus.memory_bridges)
+        self.assertEqual(len(nexus.bridge_index), 27)
+
+    def test_nexus_keeps_every_target(self):
+        """Test that per-target and batched syncs leave one bridge per target."""
+        nexus = MemoryIntegrationNexus()
+        nexus.routing_table = None
+        nexus.sync_memory_state("memory1", {}, "primary", "voice_ai.voice_core")
+        nexus.sync_memory_state("memory1", {}, "primary", "akashic_link.akashic_core")
+        nexus.sync_many("sync_memory_state", "memory1", {}, "primary", ["core_engine.quantum_memory_vault"])
+        self.assertEqual(nexus.memory_bridges["memory1"]["target_module"], "core_engine.quantum_memory_vault")
+        self.assertEqual(len(nexus.bridge_index.targets_of("memory1")), 3)
+        self.assertEqual(nexus.bridge_index.entities_of("voice_ai.voice_core"), ["memory1"])
+
+if __name__ == "__main__":
+    unittest.main()
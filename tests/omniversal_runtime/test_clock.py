@@ -0,0 +1,66 @@
+"""
+test_clock.py
+Unit tests for the shared clock service in Rhee_AI_Assistant.
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from omniversal_runtime.clock import Clock, clock
+from metachronal_singularity_orchestrator.metachronal_singularity_synthesizer.metachronal_singularity_synthesizer import MetachronalSingularitySynthesizer
+
+class TestClock(unittest.TestCase):
+    """Test suite for Clock."""
+
+    def tearDown(self):
+        """Restore the shared clock to its default mode."""
+        clock.use_coarse()
+
+    def test_coarse_timestamps_are_cached_and_parseable(self):
+        """Test that coarse timestamps reuse the formatted string within a bucket."""
+        local = Clock(resolution_ms=60000)
+        first = local.utc_iso()
+        self.assertIs(local.utc_iso(), first)
+        self.assertIsInstance(datetime.fromisoformat(first), datetime)
+
+    def test_live_timestamp_tracks_utc(self):
+        """Test that live timestamps are naive UTC like datetime.utcnow()."""
+        local = Clock()
+        local.use_live()
+        stamp = datetime.fromisoformat(local.utc_iso())
+        self.assertIsNone(stamp.tzinfo)
+        self.assertLess(abs((local.utc_now() - stamp).total_seconds()), 5)
+
+    def test_frozen_clock(self):
+        """Test that a frozen clock always returns the same instant."""
+        local = Clock()
+        local.freeze(datetime(2025, 7, 27, 18, 5))
+        self.assertEqual(local.utc_iso(), "2025-07-27T18:05:00.000000")
+        self.assertEqual(local.utc_iso(), "2025-07-27T18:05:00.000000")
+        self.assertEqual(local.monotonic_ns(), local.monotonic_ns())
+        self.assertEqual(local.epoch(), datetime(2025, 7, 27, 18, 5, tzinfo=timezone.utc).timestamp())
+
+    def test_replay_clock_is_deterministic(self):
+        """Test that replay advances by a fixed step per reading."""
+        local = Clock()
+        local.replay(datetime(2025, 7, 27), timedelta(seconds=1))
+        self.assertEqual([local.utc_iso() for _ in range(3)],
+                         ["2025-07-27T00:00:00.000000", "2025-07-27T00:00:01.000000", "2025-07-27T00:00:02.000000"])
+        self.assertEqual(local.monotonic_ns(), 3 * 10**9)
+
+    def test_live_monotonic_increases(self):
+        """Test the monotonic counter in live mode."""
+        local = Clock()
+        self.assertLessEqual(local.monotonic_ns(), local.monotonic_ns())
+
+    def test_modules_use_shared_clock(self):
+        """Test that synthesizers stamp state from the shared clock."""
+        clock.freeze(datetime(2025, 7, 20, 14, 3))
+        synthesizer = MetachronalSingularitySynthesizer()
+        synthesizer.synthesize_singularity_state("singularity1", {"pattern": 0.9})
+        self.assertEqual(synthesizer.singularity_profiles["singularity1"]["timestamp"], "2025-07-20T14:03:00.000000")
+        other = MetachronalSingularitySynthesizer()
+        other.synthesize_singularity_state("singularity1", {"pattern": 0.9})
+        self.assertEqual(other.singularity_signatures["singularity1"], synthesizer.singularity_signatures["singularity1"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+test_component_pool.py
+Unit tests for keyed component pooling in Rhee_AI_Assistant.
+"""
+
+import threading
+import unittest
+from unittest.mock import patch
+from omniversal_runtime.component_pool import ComponentPool
+from temporal_integration_nexus import TemporalIntegrationNexus
+
+class FakeClient:
+    """Component with a toggleable health check."""
+
+    def __init__(self, agent_id: str):
+        self.agent_id = agent_id
+        self.healthy = True
+
+    def health_check(self) -> bool:
+        return self.healthy
+
+class TestComponentPool(unittest.TestCase):
+    """Test suite for ComponentPool."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.pool = ComponentPool(FakeClient, name="fake_client", check_interval=None)
+
+    def test_reuses_instance_per_key(self):
+        """Test that each key gets one instance that is reused."""
+        first = self.pool.get("agent_1")
+        self.assertIs(self.pool.get("agent_1"), first)
+        self.assertIsNot(self.pool.get("agent_2"), first)
+        self.assertEqual(self.pool.stats["created"], 2)
+        self.assertEqual(self.pool.stats["reused"], 1)
+
+    def test_warm_up_builds_ahead_of_use(self):
+        """Test that warm-up creates and health-checks components."""
+        self.assertEqual(self.pool.warm_up(["agent_1", "agent_2"]), {"agent_1": True, "agent_2": True})
+        self.assertIn("agent_1", self.pool)
+        self.pool.get("agent_1")
+        self.assertEqual(self.pool.stats["created"], 2)
+
+    def test_unhealthy_component_is_rebuilt(self):
+        """Test that the component is discarded only after failure_threshold failed checks in a row."""
+        first = self.pool.get("agent_1")
+        first.healthy = False
+        self.assertEqual(self.pool.check_health(), {"agent_1": False})
+        self.assertEqual(self.pool.check_health(), {"agent_1": False})
+        self.assertIs(self.pool.get("agent_1"), first)
+        self.assertEqual(self.pool.check_health(), {"agent_1": False})
+        self.assertNotIn("agent_1", self.pool)
+        self.assertIsNot(self.pool.get("agent_1"), first)
+        self.assertEqual(self.pool.stats["unhealthy"], 3)
+
+    def test_success_resets_failure_count(self):
+        """Test that a passing check forgives earlier transient failures."""
+        first = self.pool.get("agent_1")
+        for healthy in (False, False, True, False, False):
+            first.healthy = healthy
+            self.pool.check_health()
+        self.assertIs(self.pool.get("agent_1"), first)
+
+    def test_periodic_health_check_runs_in_background(self):
+        """Test that get() returns at once and checks health on another thread once the interval has passed."""
+        with patch("omniversal_runtime.component_pool.monotonic_ns", return_value=0) as now:
+            pool = ComponentPool(FakeClient, check_interval=1.0, failure_threshold=1)
+            first = pool.get("agent_1")
+            checked = threading.Event()
+
+            def health_check() -> bool:
+                checked.wait(5)
+                return False
+
+            first.health_check = health_check
+            self.assertIs(pool.get("agent_1"), first)
+            now.return_value = int(2e9)
+            self.assertIs(pool.get("agent_1"), first)
+            self.assertIs(pool.get("agent_1"), first)
+            checked.set()
+            pool.wait(5)
+            self.assertEqual(pool.stats["unhealthy"], 1)
+            self.assertIsNot(pool.get("agent_1"), first)
+
+    def test_factory_failure_is_counted(self):
+        """Test that construction errors propagate and are counted."""
+        pool = ComponentPool(lambda key: 1 / 0)
+        with self.assertRaises(ZeroDivisionError):
+            pool.get("agent_1")
+        self.assertEqual(pool.warm_up(["agent_1"]), {"agent_1": False})
+        self.assertEqual(pool.stats["failed"], 2)
+
+    def test_pooled_nexus_keeps_state(self):
+        """Test that a pooled nexus keeps bridges across operations."""
+        pool = ComponentPool(lambda _: TemporalIntegrationNexus())
+        pool.get("core_engine_001").sync_temporal_coherence("op1", {}, "primary", "voice_ai.voice_core", "core_engine_001")
+        pool.get("core_engine_001").sync_temporal_coherence("op2", {}, "primary", "voice_ai.voice_core", "core_engine_001")
+        self.assertEqual(sorted(pool.get("core_engine_001").temporal_bridges), ["op1", "op2"])
+
+if __name__ == "__main__":
+    unittest.main()
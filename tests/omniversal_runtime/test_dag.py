@@ -0,0 +1,127 @@
+"""
+test_dag.py
+Unit tests for dependency-aware stage scheduling in Rhee_AI_Assistant.
+"""
+
+import threading
+import unittest
+from omniversal_runtime.dag import DagScheduler, StageGraph
+
+class TestDagScheduler(unittest.TestCase):
+    """Test suite for StageGraph and DagScheduler."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def stage(self, name, value=None):
+        """Build a stage that records its call and returns value or the upstream names."""
+        def run(context, upstream):
+            with self.lock:
+                self.calls.append(name)
+            return value if value is not None else sorted(upstream)
+        return run
+
+    def test_runs_stages_after_their_dependencies(self):
+        """Test that stages see upstream outputs and run in dependency order."""
+        graph = StageGraph()
+        graph.add_stage("governance", self.stage("governance"), after=["causality"])
+        graph.add_stage("causality", self.stage("causality"), after=["temporal"])
+        graph.add_stage("temporal", self.stage("temporal", "lattice"))
+        scheduler = DagScheduler(graph, max_workers=2)
+        run = scheduler.run()
+        scheduler.shutdown()
+        self.assertEqual(self.calls, ["temporal", "causality", "governance"])
+        self.assertEqual(run.outputs["causality"], ["temporal"])
+        self.assertEqual(run.critical_path, ["temporal", "causality", "governance"])
+
+    def test_runs_ready_stages_concurrently(self):
+        """Test that independent stages overlap."""
+        barrier = threading.Barrier(2, timeout=1.0)
+        graph = StageGraph()
+        graph.add_stage("a", lambda context, upstream: barrier.wait() is not None)
+        graph.add_stage("b", lambda context, upstream: barrier.wait() is not None)
+        scheduler = DagScheduler(graph, max_workers=2)
+        run = scheduler.run()
+        scheduler.shutdown()
+        self.assertEqual(run.status, {"a": "ok", "b": "ok"})
+
+    def test_failed_stage_skips_dependents(self):
+        """Test that a failing stage skips downstream stages and records the error."""
+        graph = StageGraph()
+        graph.add_stage("a", lambda context, upstream: 1 / 0)
+        graph.add_stage("b", self.stage("b"), after=["a"])
+        scheduler = DagScheduler(graph)
+        run = scheduler.run()
+        scheduler.shutdown()
+        self.assertEqual(run.status, {"a": "error", "b": "skipped"})
+        self.assertIn("division", run.errors["a"])
+        self.assertEqual(self.calls, [])
+
+    def test_caches_stage_outputs_per_key(self):
+        """Test that a repeated cache key reuses outputs instead of rerunning stages."""
+        graph = StageGraph()
+        graph.add_stage("a", self.stage("a", 1))
+        scheduler = DagScheduler(graph)
+        scheduler.run(cache_key="k")
+        run = scheduler.run(cache_key="k")
+        scheduler.run(cache_key="other")
+        scheduler.shutdown()
+        self.assertEqual(run.status, {"a": "cached"})
+        self.assertEqual(run.outputs, {"a": 1})
+        self.assertEqual(self.calls, ["a", "a"])
+
+    def test_discard_and_none_outputs(self):
+        """Test that a discarded output reruns its stage and that a None output is cached too."""
+        graph = StageGraph()
+        graph.add_stage("a", lambda context, upstream: self.calls.append("a"))
+        scheduler = DagScheduler(graph)
+        scheduler.run(cache_key="k")
+        self.assertEqual(scheduler.run(cache_key="k").status, {"a": "cached"})
+        scheduler.discard("a", "k")
+        self.assertEqual(scheduler.run(cache_key="k").status, {"a": "ok"})
+        scheduler.shutdown()
+        self.assertEqual(self.calls, ["a", "a"])
+
+    def test_concurrent_runs_share_cache_and_pool(self):
+        """Test that runs from many threads share one worker pool and a consistent cache."""
+        graph = StageGraph()
+        graph.add_stage("a", self.stage("a", 1))
+        graph.add_stage("b", self.stage("b"), ["a"])
+        scheduler = DagScheduler(graph, max_workers=4, cache_size=8)
+        pools, errors = set(), []
+
+        def runner(n):
+            try:
+                for m in range(50):
+                    run = scheduler.run(cache_key=(n + m) % 16)
+                    pools.add(id(scheduler._pool))
+                    self.assertEqual(run.outputs, {"a": 1, "b": ["a"]})
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=runner, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        scheduler.shutdown()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(pools), 1)
+        self.assertLessEqual(len(scheduler.cache), 8)
+
+    def test_rejects_cycles_and_undeclared_dependencies(self):
+        """Test that invalid graphs raise ValueError."""
+        graph = StageGraph()
+        graph.add_stage("a", self.stage("a"), after=["b"])
+        graph.add_stage("b", self.stage("b"), after=["a"])
+        with self.assertRaises(ValueError):
+            graph.order()
+        graph = StageGraph()
+        graph.add_stage("a", self.stage("a"), after=["missing"])
+        with self.assertRaises(ValueError):
+            graph.order()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+test_event_bus.py
+Unit tests for the integration event bus in Rhee_AI_Assistant.
+"""
+
+import asyncio
+import threading
+import unittest
+from omniversal_runtime.event_bus import IntegrationEventBus
+from metachronal_singularity_orchestrator.metachronal_integration_nexus.metachronal_integration_nexus import MetachronalIntegrationNexus
+from metachronal_singularity_orchestrator.metachronal_singularity_synthesizer.metachronal_singularity_synthesizer import MetachronalSingularitySynthesizer
+
+class TestIntegrationEventBus(unittest.IsolatedAsyncioTestCase):
+    """Test suite for asynchronous publish/subscribe delivery."""
+
+    async def test_publish_delivers_to_subscribed_modules(self):
+        """Test that events reach only subscribers of their target modules."""
+        bus = IntegrationEventBus()
+        received = {"a": [], "b": [], "*": []}
+        bus.subscribe("module.a", received["a"].append)
+        bus.subscribe("module.b", received["b"].append)
+        bus.subscribe("*", received["*"].append)
+        await bus.start_async()
+        done = await bus.publish({"entity_id": "e1", "target_modules": ["module.a", "module.c"]})
+        self.assertEqual(await done, 2)
+        self.assertEqual(len(received["a"]), 1)
+        self.assertEqual(received["b"], [])
+        self.assertEqual(len(received["*"]), 1)
+        bus.stop()
+
+    async def test_unrouted_event_completes_immediately(self):
+        """Test that an event with no subscribers resolves with zero deliveries."""
+        bus = IntegrationEventBus()
+        await bus.start_async()
+        done = await bus.publish({"entity_id": "e2", "target_modules": ["missing.module"]})
+        self.assertEqual(await done, 0)
+        self.assertEqual(bus.stats["unrouted"], 1)
+        bus.stop()
+
+    def test_submit_without_subscribers_completes_in_caller(self):
+        """Test that a synchronous publish nobody subscribes to completes without enqueueing."""
+        bus = IntegrationEventBus()
+        bus.subscribe("module.a", lambda event: None)
+        bus.start()
+        completion = bus.submit({"entity_id": "e7", "target_modules": ["missing.module"]})
+        self.assertTrue(completion.done())
+        self.assertEqual(completion.result(), 0)
+        self.assertEqual(bus.stats["unrouted"], 1)
+        self.assertEqual(bus.submit({"entity_id": "e8", "target_modules": ["module.a"]}).result(timeout=5), 1)
+        bus.stop()
+
+    def test_subscribe_on_running_bus_routes_next_submit(self):
+        """Test that a subscriber added to a running bus receives an event submitted right after."""
+        bus = IntegrationEventBus()
+        bus.start()
+        received = []
+        bus.subscribe("module.a", received.append)
+        self.assertEqual(bus.submit({"entity_id": "e9", "target_modules": ["module.a"]}).result(timeout=5), 1)
+        self.assertEqual(len(received), 1)
+        self.assertEqual(bus.stats["unrouted"], 0)
+        bus.stop()
+
+    def test_stats_count_submits_from_many_threads(self):
+        """Test that counters updated by concurrent producers lose no increments."""
+        bus = IntegrationEventBus()
+        bus.start()
+
+        def produce():
+            for n in range(2000):
+                bus.submit({"entity_id": n, "target_modules": ["missing.module"]})
+
+        threads = [threading.Thread(target=produce) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual((bus.stats["published"], bus.stats["unrouted"]), (8000, 8000))
+        bus.stop()
+
+    async def test_backpressure_on_full_queue(self):
+        """Test that a full subscriber queue rejects non-blocking publishes."""
+        bus = IntegrationEventBus()
+        release = asyncio.Event()
+
+        async def slow_handler(event):
+            await release.wait()
+
+        bus.subscribe("module.a", slow_handler, max_queue_size=1)
+        await bus.start_async()
+        bus.publish_nowait({"entity_id": "e3", "target_modules": ["module.a"]})
+        await asyncio.sleep(0)
+        bus.publish_nowait({"entity_id": "e4", "target_modules": ["module.a"]})
+        with self.assertRaises(asyncio.QueueFull):
+            bus.publish_nowait({"entity_id": "e5", "target_modules": ["module.a"]})
+        release.set()
+        await bus.join()
+        self.assertEqual(bus.stats["delivered"], 2)
+        bus.stop()
+
+    async def test_handler_failure_is_counted(self):
+        """Test that a failing handler still completes the event."""
+        bus = IntegrationEventBus()
+
+        def failing_handler(event):
+            raise ValueError("boom")
+
+        bus.subscribe("module.a", failing_handler)
+        await bus.start_async()
+        done = await bus.publish({"entity_id": "e6", "target_modules": ["module.a"]})
+        self.assertEqual(await done, 0)
+        self.assertEqual(bus.stats["failed"], 1)
+        bus.stop()
+
+class TestEventBusNexusIntegration(unittest.TestCase):
+    """Test suite for nexus publishing through a background event bus."""
+
+    def setUp(self):
+        """Set up a bus running on a background loop."""
+        self.bus = IntegrationEventBus()
+        self.received = []
+        self.gate = threading.Event()
+
+        async def handler(event):
+            await asyncio.get_running_loop().run_in_executor(None, self.gate.wait, 5)
+            self.received.append(event["entity_id"])
+
+        self.bus.subscribe("core_engine.consciousness_interface", handler)
+        self.bus.start()
+
+    def tearDown(self):
+        """Stop the background bus."""
+        self.gate.set()
+        self.bus.stop()
+
+    def test_synthesizer_returns_before_delivery(self):
+        """Test that synthesis returns once the sync event is enqueued."""
+        nexus = MetachronalIntegrationNexus()
+        nexus.event_bus = self.bus
+        synthesizer = MetachronalSingularitySynthesizer(integration_nexus=nexus)
+        synthesizer.synthesize_singularity_state("singularity1", {"pattern": 0.9})
+        self.assertEqual(self.received, [])
+        self.assertIn("singularity1", nexus.singularity_bridges)
+        self.gate.set()
+        completion = nexus.sync_many("sync_singularity_state", "singularity2", {}, "primary", ["core_engine.consciousness_interface"])
+        self.assertEqual(completion.result(timeout=5), 1)
+        self.assertEqual(self.received, ["singularity1", "singularity2"])
+
+    def test_sync_many_returns_before_delivery(self):
+        """Test that sync_many hands back a pending completion while the subscriber is still busy."""
+        nexus = MetachronalIntegrationNexus()
+        nexus.event_bus = self.bus
+        completion = nexus.sync_many("sync_singularity_state", "singularity3", {}, "primary", ["core_engine.consciousness_interface"])
+        self.assertFalse(completion.done())
+        self.assertEqual(self.received, [])
+        self.gate.set()
+        self.assertEqual(completion.result(timeout=5), 1)
+        self.assertEqual(self.received, ["singularity3"])
+
+    def test_failed_publish_is_retried(self):
+        """Test that a sync whose event could not be published is not skipped as unchanged."""
+        nexus = MetachronalIntegrationNexus()
+        nexus.event_bus = IntegrationEventBus()
+        targets = ["core_engine.consciousness_interface"]
+        self.assertIsNone(nexus.sync_many("sync_singularity_state", "singularity4", {}, "primary", targets))
+        nexus.event_bus = self.bus
+        self.gate.set()
+        completion = nexus.sync_many("sync_singularity_state", "singularity4", {}, "primary", targets)
+        self.assertEqual(completion.result(timeout=5), 1)
+        self.assertEqual(self.received, ["singularity4"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+test_fanout.py
+Unit tests for concurrent fan-out with per-module deadlines in Rhee_AI_Assistant.
+"""
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from omniversal_runtime.fanout import FanOutExecutor
+
+class TestFanOutExecutor(unittest.TestCase):
+    """Test suite for FanOutExecutor."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.executor = FanOutExecutor(max_workers=4, default_timeout=1.0)
+        self.release = threading.Event()
+
+    def tearDown(self):
+        """Release blocked tasks and stop the workers."""
+        self.release.set()
+        self.executor.shutdown()
+
+    def test_runs_tasks_concurrently(self):
+        """Test that independent tasks overlap instead of running in sequence."""
+        barrier = threading.Barrier(3, timeout=1.0)
+        tasks = {f"module_{n}": (lambda n=n: barrier.wait() is not None and n) for n in range(3)}
+        report = self.executor.run(tasks)
+        self.assertEqual(report.status, {"module_0": "ok", "module_1": "ok", "module_2": "ok"})
+        self.assertEqual(report.results["module_2"], 2)
+
+    def test_partial_results_with_per_module_deadlines(self):
+        """Test that a slow module times out while the others return results."""
+        tasks = {"fast": lambda: "done", "slow": self.release.wait, "broken": lambda: 1 / 0}
+        start = time.monotonic()
+        report = self.executor.run(tasks, timeouts={"slow": 0.05})
+        self.assertLess(time.monotonic() - start, 0.9)
+        self.assertEqual(report.status, {"fast": "ok", "slow": "timeout", "broken": "error"})
+        self.assertEqual(report.results, {"fast": "done"})
+        self.assertIn("division", report.errors["broken"])
+        self.assertEqual(report.summary(), {"ok": 1, "timeout": 1, "error": 1})
+        self.assertEqual(set(report.durations_ms), {"fast", "broken"})
+
+    def test_run_serial_reports_like_run(self):
+        """Test that serial runs produce the same report shape."""
+        report = FanOutExecutor.run_serial({"a": lambda: 1, "b": lambda: 1 / 0})
+        self.assertEqual(report.status, {"a": "ok", "b": "error"})
+        self.assertEqual(report.results, {"a": 1})
+        self.assertEqual(set(report.durations_ms), {"a", "b"})
+
+    def test_concurrent_first_calls_build_one_pool(self):
+        """Test that threads racing to start the executor share a single worker pool."""
+        executor = FanOutExecutor(max_workers=2)
+        built = []
+
+        def slow_pool(*args, **kwargs):
+            time.sleep(0.01)
+            built.append(ThreadPoolExecutor(*args, **kwargs))
+            return built[-1]
+
+        with patch("omniversal_runtime.fanout.ThreadPoolExecutor", side_effect=slow_pool):
+            threads = [threading.Thread(target=executor.run, args=({"a": lambda: 1},)) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        executor.shutdown()
+        self.assertEqual(len(built), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+test_hot_log.py
+Unit tests for hot-path logging in Rhee_AI_Assistant.
+"""
+
+import unittest
+from omniversal_runtime import hot_log
+from transinfinite_reality_memory.memory_integration_nexus.memory_integration_nexus import MemoryIntegrationNexus
+
+class Unprintable:
+    """Value whose rendering is tracked."""
+
+    rendered = 0
+
+    def __str__(self):
+        Unprintable.rendered += 1
+        return "unprintable"
+
+class TestHotLog(unittest.TestCase):
+    """Test suite for sampled, deferred logging."""
+
+    def setUp(self):
+        """Start every test from direct mode with an empty buffer."""
+        hot_log.configure(mode=hot_log.DIRECT, sample_rates={}, default_rate=1.0)
+        hot_log.clear()
+        self.logger = hot_log.get_logger("hot_log_test.module")
+
+    def tearDown(self):
+        """Restore direct mode."""
+        hot_log.configure(mode=hot_log.DIRECT, sample_rates={}, default_rate=1.0)
+        hot_log.clear()
+
+    def test_direct_mode_uses_logging(self):
+        """Test that direct mode logs through the standard logger."""
+        with self.assertLogs("hot_log_test.module", level="INFO") as logs:
+            self.logger.info("value %d", 7)
+        self.assertEqual(logs.records[0].getMessage(), "value 7")
+        self.assertEqual(hot_log.dump(), [])
+
+    def test_deferred_mode_renders_lazily(self):
+        """Test that deferred records are only formatted on dump."""
+        hot_log.configure(mode=hot_log.DEFERRED)
+        Unprintable.rendered = 0
+        self.logger.info("state %s", Unprintable())
+        self.assertEqual(Unprintable.rendered, 0)
+        lines = hot_log.dump()
+        self.assertEqual(Unprintable.rendered, 1)
+        self.assertTrue(lines[0].endswith("INFO - hot_log_test.module - state unprintable"))
+
+    def test_per_module_sampling(self):
+        """Test that the longest module prefix decides the sampling rate."""
+        hot_log.configure(mode=hot_log.DEFERRED, sample_rates={"hot_log_test": 0.1, "hot_log_test.quiet": 0.0})
+        for i in range(100):
+            self.logger.info("tick %d", i)
+            hot_log.get_logger("hot_log_test.quiet.module").info("tick %d", i)
+        self.assertEqual(len(hot_log.dump()), 10)
+
+    def test_errors_bypass_sampling(self):
+        """Test that errors are always buffered and forwarded."""
+        hot_log.configure(mode=hot_log.DEFERRED, default_rate=0.0)
+        with self.assertLogs("hot_log_test.module", level="ERROR"):
+            self.logger.error("failure %s", "x")
+        self.assertEqual(len(hot_log.dump(level=hot_log.logging.ERROR)), 1)
+
+    def test_ring_buffer_keeps_newest(self):
+        """Test that the ring buffer evicts the oldest records."""
+        hot_log.configure(mode=hot_log.DEFERRED, buffer_size=3)
+        for i in range(5):
+            self.logger.info("tick %d", i)
+        self.assertEqual([line.rsplit(" ", 1)[1] for line in hot_log.dump()], ["2", "3", "4"])
+        hot_log.configure(buffer_size=65536)
+
+    def test_nexus_logger_is_hot_path(self):
+        """Test that nexuses log through the hot-path layer."""
+        hot_log.configure(mode=hot_log.DEFERRED)
+        nexus = MemoryIntegrationNexus()
+        nexus.routing_table = None
+        nexus.sync_many("sync_memory_state", "memory1", {}, "primary", ["a"])
+        self.assertTrue(any("memory1" in line for line in hot_log.dump()))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+test_lazy_import.py
+Unit tests for lazy package exports and the import-time benchmark in Rhee_AI_Assistant.
+"""
+
+import logging
+import subprocess
+import sys
+import unittest
+from omniversal_runtime.import_bench import REPO_ROOT, measure, parse_importtime
+
+def imported_after(statement: str) -> set:
+    """Return the repository modules loaded by a statement in a fresh interpreter."""
+    code = f"import sys; {statement}; print('\\n'.join(sys.modules))"
+    output = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True).stdout
+    return set(output.split())
+
+class TestLazyImport(unittest.TestCase):
+    """Test suite for attach and the package __getattr__ hooks."""
+
+    def test_package_import_loads_no_submodules(self):
+        """Test that importing a package defers every submodule."""
+        modules = imported_after("import omnitemporal_coherence_lattice")
+        self.assertNotIn("omnitemporal_coherence_lattice.temporal_integration_nexus", modules)
+
+    def test_attribute_access_loads_submodule(self):
+        """Test that the first attribute access imports the submodule and caches it."""
+        import omnitemporal_coherence_lattice
+        module = omnitemporal_coherence_lattice.temporal_integration_nexus
+        self.assertIs(vars(omnitemporal_coherence_lattice)["temporal_integration_nexus"], module)
+        self.assertIn("temporal_integration_nexus", dir(omnitemporal_coherence_lattice))
+
+    def test_class_exports_resolve(self):
+        """Test that class names in __all__ resolve to the class in its module."""
+        from omnitemporal_coherence_lattice.temporal_integration_nexus import TemporalIntegrationNexus
+        self.assertEqual(TemporalIntegrationNexus.__name__, "TemporalIntegrationNexus")
+
+    def test_unknown_attribute_raises(self):
+        """Test that names outside __all__ raise AttributeError."""
+        import omnitemporal_coherence_lattice
+        with self.assertRaises(AttributeError):
+            omnitemporal_coherence_lattice.not_a_module
+
+    def test_core_engine_installs_no_handlers(self):
+        """Test that importing core_engine neither loads core modules nor adds handlers."""
+        modules = imported_after("import core_engine")
+        self.assertNotIn("core_engine.agent_controller", modules)
+        import core_engine
+        self.assertEqual(logging.getLogger("CoreEngine").handlers, [])
+        self.assertIn("agent_controller", dir(core_engine))
+
+class TestImportBench(unittest.TestCase):
+    """Test suite for the import-time benchmark."""
+
+    def test_parse_importtime(self):
+        """Test parsing of -X importtime output."""
+        output = ("import time: self [us] | cumulative | imported package\n"
+                  "import time:       120 |        120 |   omniversal_runtime.lazy_import\n"
+                  "import time:        80 |        200 | voice_ai\n")
+        records = parse_importtime(output)
+        self.assertEqual(records[1], {"self_us": 80, "cumulative_us": 200, "module": "voice_ai"})
+
+    def test_measure_package(self):
+        """Test that a package is measured with a per-package breakdown."""
+        result = measure("voice_ai")
+        self.assertTrue(result["ok"])
+        self.assertGreater(result["total_us"], 0)
+        self.assertIn("voice_ai", result["breakdown"])
+        self.assertNotIn("openai", result["breakdown"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+test_load_replay.py
+Unit tests for operation-log replay in Rhee_AI_Assistant.
+"""
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from omniversal_runtime.load_replay import load_operations, percentile, replay, stub_voice_clients
+
+class RecordingOrchestrator:
+    """Minimal orchestrator that records calls and reports one module timing per call."""
+
+    def __init__(self):
+        self.calls = []
+        self.profile_modules = False
+        self.module_timings = {"stale": {"calls": 1, "total_ms": 1.0}}
+
+    def orchestrate_system(self, operation_id, config, operation_type="full_system", session_id=None, **options):
+        self.calls.append((operation_id, operation_type, session_id, options))
+        timing = self.module_timings.setdefault("module_a", {"calls": 0, "total_ms": 0.0})
+        timing["calls"] += 1
+        timing["total_ms"] += 0.5
+        return {} if config.get("fail") else {"operation_type": operation_type}
+
+class TestLoadReplay(unittest.TestCase):
+    """Test suite for load_operations, the voice stubs and replay."""
+
+    def setUp(self):
+        """Write a small operation log."""
+        handle, self.path = tempfile.mkstemp(suffix=".jsonl")
+        with os.fdopen(handle, "w") as log:
+            log.write(json.dumps({"operation_id": "op_1", "config": {"axiom": "test"}, "operation_type": "synthesis"}) + "\n\n")
+            log.write(json.dumps({"config": {"audio_input": "hi", "fail": True}, "operation_type": "voice_processing",
+                                  "session_id": "s1"}) + "\n")
+
+    def tearDown(self):
+        """Remove the log."""
+        os.remove(self.path)
+
+    def test_load_operations_with_repeat(self):
+        """Test defaults, audio encoding and id suffixes for repeated rounds."""
+        operations = load_operations(self.path, repeat=2)
+        self.assertEqual([op["operation_id"] for op in operations], ["op_1", "op_3", "op_1#1", "op_3#1"])
+        self.assertEqual(operations[1]["config"]["audio_input"], b"hi")
+        self.assertEqual(operations[0]["session_id"], None)
+
+    def test_percentile_nearest_rank(self):
+        """Test nearest-rank percentiles."""
+        values = [float(n) for n in range(1, 101)]
+        self.assertEqual(percentile(values, 50), 50.0)
+        self.assertEqual(percentile(values, 99), 99.0)
+        self.assertEqual(percentile([], 95), 0.0)
+
+    def test_stub_clients_match_sdk_shapes(self):
+        """Test that the stubs answer in the shapes VoiceCore reads."""
+        clients = stub_voice_clients()
+        response = clients["stt"].transcription.prerecorded({"buffer": b"I feel happy!"}, {})
+        self.assertEqual(response["results"]["channels"][0]["alternatives"][0]["transcript"], "I feel happy!")
+        completion = clients["llm"].chat.completions.create(model="gpt-4o", messages=[{"role": "user", "content": "hi"}])
+        self.assertIn("hi", completion.choices[0].message.content)
+        self.assertEqual(clients["tts"].generate(text="ok", voice="calm"), b"ok")
+
+    def test_replay_reports_latency_failures_and_modules(self):
+        """Test a concurrent replay end to end."""
+        orchestrator = RecordingOrchestrator()
+        report = replay(orchestrator, load_operations(self.path, repeat=3), concurrency=2, force=True)
+        summary = report.summary()
+        self.assertEqual(summary["operations"], 6)
+        self.assertEqual(sorted(report.failed), ["op_3", "op_3#1", "op_3#2"])
+        self.assertTrue(orchestrator.profile_modules)
+        self.assertEqual(report.module_timings, {"module_a": {"calls": 6, "total_ms": 3.0}})
+        self.assertTrue(all(call[3] == {"force": True} for call in orchestrator.calls))
+        self.assertIn("module_a", report.format())
+
+    def test_replay_paces_to_rate(self):
+        """Test that a rate spreads operations over time."""
+        start = time.monotonic()
+        replay(RecordingOrchestrator(), load_operations(self.path, repeat=3), rate=100.0, concurrency=2)
+        self.assertGreaterEqual(time.monotonic() - start, 0.045)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+test_manifest.py
+Unit tests for the module manifest and instance registry in Rhee_AI_Assistant.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from omniversal_runtime.manifest import REPO_ROOT, ModuleRegistry, build_manifest, default_cache_path, load_manifest
+
+class TestModuleManifest(unittest.TestCase):
+    """Test suite for build_manifest, load_manifest and ModuleRegistry."""
+
+    def setUp(self):
+        """Create a small package tree to scan."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        self._write("demo_pkg/__init__.py", "")
+        self._write("demo_pkg/demo_nexus/__init__.py", "")
+        self._write("demo_pkg/demo_nexus/demo_nexus.py",
+                    "SYNC_TOPICS = (\"memory\", \"reality\")\n\nclass Helper:\n    pass\n\n"
+                    "class DemoNexus:\n    created = 0\n    def __init__(self):\n        DemoNexus.created += 1\n")
+        self._write("demo_pkg/broken.py", "class (:\n")
+        self._write("tests/__init__.py", "")
+        self._write("tests/test_demo.py", "class TestDemo:\n    pass\n")
+        self.cache_path = os.path.join(self.root, "manifest.json")
+        sys.path.insert(0, self.root)
+
+    def tearDown(self):
+        """Remove the package tree."""
+        sys.path.remove(self.root)
+        for name in [name for name in sys.modules if name.startswith("demo_pkg")]:
+            del sys.modules[name]
+        self.tmp.cleanup()
+
+    def _write(self, relative: str, content: str) -> None:
+        path = os.path.join(self.root, relative)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+    def test_build_manifest_scans_without_importing(self):
+        """Test that components map to their primary class and tests are skipped."""
+        manifest = build_manifest(self.root)
+        entry = manifest["modules"]["demo_pkg.demo_nexus"]
+        self.assertEqual(entry["module"], "demo_pkg.demo_nexus.demo_nexus")
+        self.assertEqual(entry["class"], "DemoNexus")
+        self.assertEqual(entry["topics"], ["memory", "reality"])
+        self.assertEqual(list(manifest["modules"]), ["demo_pkg.demo_nexus"])
+        self.assertEqual(manifest["errors"], [os.path.join("demo_pkg", "broken.py")])
+        self.assertNotIn("demo_pkg.demo_nexus.demo_nexus", sys.modules)
+
+    def test_manifest_is_cached_until_sources_change(self):
+        """Test that the disk cache is reused and regenerated after an edit."""
+        first = load_manifest(self.root, self.cache_path)
+        self.assertTrue(os.path.exists(self.cache_path))
+        with open(self.cache_path, "r", encoding="utf-8") as f:
+            self.assertIn(first["fingerprint"], f.read())
+        self.assertEqual(load_manifest(self.root, self.cache_path), first)
+        self._write("demo_pkg/extra.py", "class Extra:\n    pass\n")
+        self.assertIn("demo_pkg.extra", load_manifest(self.root, self.cache_path)["modules"])
+
+    def test_default_cache_lives_outside_the_tree(self):
+        """Test that the manifest cache goes to the user cache directory unless overridden."""
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": self.root, "RHEE_MODULE_MANIFEST": ""}):
+            path = default_cache_path(self.root)
+            self.assertTrue(path.startswith(os.path.join(self.root, "rhee_ai_assistant") + os.sep))
+            self.assertNotEqual(path, default_cache_path(REPO_ROOT))
+            self.assertFalse(path.startswith(REPO_ROOT + os.sep))
+            load_manifest(self.root, path)
+            self.assertTrue(os.path.exists(path))
+        with mock.patch.dict(os.environ, {"RHEE_MODULE_MANIFEST": self.cache_path}):
+            self.assertEqual(default_cache_path(self.root), self.cache_path)
+
+    def test_registry_instantiates_once(self):
+        """Test that the registry imports lazily and hands out one live instance."""
+        registry = ModuleRegistry(load_manifest(self.root, None))
+        self.assertEqual(registry.loaded(), [])
+        first = registry.instance("demo_pkg.demo_nexus")
+        self.assertIs(registry.instance("demo_pkg.demo_nexus"), first)
+        self.assertEqual(type(first).created, 1)
+        self.assertEqual(registry.loaded(), ["demo_pkg.demo_nexus"])
+        with self.assertRaises(KeyError):
+            registry.get_class("demo_pkg.missing")
+
+if __name__ == "__main__":
+    unittest.main()
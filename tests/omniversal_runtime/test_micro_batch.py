@@ -0,0 +1,36 @@
+"""
+test_micro_batch.py
+Unit tests for micro-batching of orchestrator operations in Rhee_AI_Assistant.
+"""
+
+import unittest
+from omniversal_runtime.micro_batch import BatchStats, micro_batches
+
+class TestMicroBatch(unittest.TestCase):
+    """Test suite for micro_batches and BatchStats."""
+
+    def test_groups_by_type_and_splits_batches(self):
+        """Test that operations are grouped by type in order and capped at the batch size."""
+        operations = [(f"op_{n}", {"n": n}, "synthesis" if n % 2 else "alignment") for n in range(7)]
+        batches = micro_batches(operations, max_batch_size=2)
+        self.assertEqual([(kind, [op[0] for op in batch]) for kind, batch in batches], [
+            ("alignment", ["op_0", "op_2"]),
+            ("alignment", ["op_4", "op_6"]),
+            ("synthesis", ["op_1", "op_3"]),
+            ("synthesis", ["op_5"])
+        ])
+
+    def test_rejects_empty_batch_size(self):
+        """Test that a batch size below one raises ValueError."""
+        with self.assertRaises(ValueError):
+            micro_batches([], max_batch_size=0)
+
+    def test_batch_stats_throughput(self):
+        """Test that throughput is derived from size and elapsed time."""
+        stats = BatchStats("synthesis", 50)
+        self.assertEqual(stats.ops_per_second, 0.0)
+        stats.elapsed_ms = 250.0
+        self.assertEqual(stats.as_dict()["ops_per_second"], 200.0)
+
+if __name__ == "__main__":
+    unittest.main()
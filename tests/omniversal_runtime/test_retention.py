@@ -0,0 +1,105 @@
+"""
+test_retention.py
+Unit tests for bounded retention of in-memory state in Rhee_AI_Assistant.
+"""
+
+import unittest
+from unittest.mock import patch
+from omniversal_runtime.retention import BoundedMap, RetentionPolicy, configure_retention, policy_for
+from omniversal_runtime.state_table import StateTable
+from transinfinite_reality_memory.memory_integration_nexus.memory_integration_nexus import MemoryIntegrationNexus
+from quantaversal_singularity_weave.quantaversal_sentience_orchestrator.quantaversal_sentience_orchestrator import QuantaversalSentienceOrchestrator
+
+class TestBoundedMap(unittest.TestCase):
+    """Test suite for BoundedMap."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.evicted = []
+        self.on_evict = lambda key, value, reason: self.evicted.append((key, reason))
+
+    def test_evicts_least_recently_used(self):
+        """Test that reads refresh recency and the oldest entry is evicted first."""
+        bounded = BoundedMap(max_entries=2, on_evict=self.on_evict)
+        bounded["a"] = 1
+        bounded["b"] = 2
+        self.assertEqual(bounded["a"], 1)
+        bounded["c"] = 3
+        self.assertEqual(sorted(bounded), ["a", "c"])
+        self.assertEqual(self.evicted, [("b", "capacity")])
+        self.assertIsNone(bounded.get("b"))
+        self.assertEqual((bounded.stats["hits"], bounded.stats["misses"]), (1, 1))
+
+    def test_byte_budget(self):
+        """Test that entries are evicted until the estimated size fits the budget."""
+        bounded = BoundedMap(max_bytes=1000, on_evict=self.on_evict)
+        bounded["small"] = "x" * 100
+        bounded["large"] = "y" * 900
+        self.assertNotIn("small", bounded)
+        self.assertLessEqual(bounded.bytes, 1000)
+        del bounded["large"]
+        self.assertEqual(bounded.bytes, 0)
+
+    def test_idle_ttl(self):
+        """Test that entries expire after going untouched for the TTL."""
+        with patch("omniversal_runtime.retention.monotonic_ns", return_value=0) as now:
+            bounded = BoundedMap(ttl=1.0, on_evict=self.on_evict)
+            bounded["a"] = 1
+            now.return_value = int(2e9)
+            self.assertIsNone(bounded.get("a"))
+            self.assertEqual(self.evicted, [("a", "expired")])
+            self.assertEqual(len(bounded), 0)
+
+class TestRetentionPolicies(unittest.TestCase):
+    """Test suite for configured retention of stateful classes."""
+
+    def tearDown(self):
+        """Clear the policy table."""
+        configure_retention({})
+
+    def test_unconfigured_state_stays_unbounded(self):
+        """Test that classes keep plain dicts and unbounded tables without a policy."""
+        nexus = MemoryIntegrationNexus()
+        self.assertIs(type(nexus.memory_bridges), dict)
+        self.assertIsNone(QuantaversalSentienceOrchestrator().state_table.retention)
+
+    def test_policy_resolves_by_longest_prefix(self):
+        """Test that the most specific policy prefix wins."""
+        broad, narrow = RetentionPolicy(max_entries=10), RetentionPolicy(max_entries=1)
+        configure_retention({
+            "transinfinite_reality_memory": broad,
+            "transinfinite_reality_memory.memory_integration_nexus.memory_integration_nexus.MemoryIntegrationNexus.memory_bridges": narrow
+        })
+        nexus = MemoryIntegrationNexus()
+        self.assertIs(policy_for(nexus, "memory_bridges"), narrow)
+        self.assertIs(policy_for(nexus, "other"), broad)
+        nexus.routing_table = None
+        nexus.sync_many("sync_memory_state", "memory_1", {}, "primary", ["a"])
+        nexus.sync_many("sync_memory_state", "memory_2", {}, "primary", ["a"])
+        self.assertEqual(list(nexus.memory_bridges), ["memory_2"])
+
+    def test_state_table_evicts_whole_entities(self):
+        """Test that a bounded state table drops every column of an evicted entity."""
+        spilled = {}
+        policy = RetentionPolicy(max_entries=2, on_evict=lambda key, values, reason: spilled.update({key: values}))
+        table = StateTable(numeric_columns=("coherence",), object_columns=("profiles",), retention=policy)
+        for entity_id in ("e1", "e2", "e3"):
+            table.set("coherence", entity_id, 0.5)
+            table.set("profiles", entity_id, {"id": entity_id})
+        self.assertNotIn("e1", table)
+        self.assertEqual(len(table), 2)
+        self.assertEqual(spilled, {"e1": {"coherence": 0.5, "profiles": {"id": "e1"}}})
+        table.set("coherence", "e4", 0.7)
+        self.assertEqual(table.column("coherence").get("e4"), 0.7)
+        self.assertIn("e1", spilled)
+
+    def test_configured_orchestrator_is_bounded(self):
+        """Test that a configured synthesizer keeps only the newest entities."""
+        configure_retention({"quantaversal_singularity_weave": RetentionPolicy(max_entries=1)})
+        orchestrator = QuantaversalSentienceOrchestrator()
+        orchestrator.orchestrate_sentience("sentience_1", {"level": 1})
+        orchestrator.orchestrate_sentience("sentience_2", {"level": 2})
+        self.assertEqual(list(orchestrator.sentience_signatures), ["sentience_2"])
+
+if __name__ == "__main__":
+    unittest.main()
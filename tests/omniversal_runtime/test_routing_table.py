@@ -0,0 +1,94 @@
+"""
+test_routing_table.py
+Unit tests for subscription-indexed nexus routing in Rhee_AI_Assistant.
+"""
+
+import unittest
+from omniversal_runtime import routing_table
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.manifest import load_manifest
+from omniversal_runtime.routing_table import RoutingTable, discover_modules, install_routing_table, topic_for
+from transinfinite_reality_memory.memory_integration_nexus.memory_integration_nexus import MemoryIntegrationNexus
+from transinfinite_reality_memory.omnichronal_memory_retrieval.omnichronal_memory_retrieval import OmnichronalMemoryRetrieval
+
+class TestRoutingTable(unittest.TestCase):
+    """Test suite for RoutingTable."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.table = RoutingTable(["core_engine.quantum_memory_vault", "voice_ai.voice_core", "akashic_link.akashic_core"])
+
+    def tearDown(self):
+        """Remove any process-wide routing table installed by a test."""
+        BatchSyncMixin.routing_table = None
+        routing_table._installed = None
+
+    def test_discover_modules(self):
+        """Test that the tree scan finds subpackages and flat modules but not tests."""
+        modules = discover_modules()
+        self.assertIn("core_engine.quantum_memory_vault", modules)
+        self.assertIn("voice_ai.voice_core", modules)
+        self.assertNotIn("god_source_simulator.god_source_core", modules)
+        self.assertFalse(any(module.startswith("tests") for module in modules))
+
+    def test_topic_for(self):
+        """Test topic derivation from sync method names."""
+        self.assertEqual(topic_for("sync_memory_state"), "memory")
+        self.assertEqual(topic_for("sync_coherence_stream"), "coherence")
+
+    def test_resolve_drops_missing_modules(self):
+        """Test that non-existent targets are dropped in fan-out order."""
+        routed = self.table.resolve("memory", ["posthuman_memory.posthuman_memory_core", "voice_ai.voice_core", "core_engine.quantum_memory_vault"])
+        self.assertEqual(routed, ("voice_ai.voice_core", "core_engine.quantum_memory_vault"))
+        self.assertEqual(self.table.stats["dropped"], 1)
+
+    def test_explicit_subscriptions(self):
+        """Test that a subscribed topic only reaches its subscribers."""
+        self.table.subscribe("memory", "core_engine.quantum_memory_vault")
+        self.assertEqual(self.table.resolve("memory", ["voice_ai.voice_core", "core_engine.quantum_memory_vault"]),
+                         ("core_engine.quantum_memory_vault",))
+        self.assertEqual(self.table.resolve("reality", ["voice_ai.voice_core"]), ("voice_ai.voice_core",))
+
+    def test_manifest_subscriptions_are_strict(self):
+        """Test that a manifest table routes each topic only to the components declaring it."""
+        table = RoutingTable.from_manifest({"modules": {
+            "core_engine.quantum_memory_vault": {"topics": ["memory"]},
+            "voice_ai.voice_core": {"topics": ["memory", "reality"]},
+            "akashic_link.akashic_core": {"topics": []}
+        }})
+        self.assertEqual(table.subscribers("memory"), {"core_engine.quantum_memory_vault", "voice_ai.voice_core"})
+        self.assertEqual(table.resolve("reality", ["akashic_link.akashic_core", "voice_ai.voice_core"]), ("voice_ai.voice_core",))
+        self.assertEqual(table.resolve("undeclared", ["voice_ai.voice_core"]), ())
+
+    def test_declared_subscriptions_cover_the_tree(self):
+        """Test that components declare the topics their integration nexuses sync."""
+        table = RoutingTable.from_manifest(load_manifest(cache_path=None))
+        self.assertIn("core_engine.quantum_memory_vault", table.subscribers("memory"))
+        self.assertIn("voice_ai.voice_core", table.subscribers("reality"))
+        self.assertLess(len(table.subscribers("memory")), len(table.modules))
+
+    def test_installed_table_filters_nexus_fan_out(self):
+        """Test that nexuses consult the installed routing table."""
+        install_routing_table()
+        nexus = MemoryIntegrationNexus()
+        OmnichronalMemoryRetrieval(integration_nexus=nexus).retrieve_memory_state("memory1", {"axiom": "test"})
+        targets = nexus.memory_bridges["memory1"]["target_modules"]
+        self.assertIn("core_engine.quantum_memory_vault", targets)
+        self.assertNotIn("posthuman_memory.posthuman_memory_core", targets)
+        self.assertNotIn("god_source_simulator.god_source_core", targets)
+
+    def test_topic_targets_replace_call_site_lists(self):
+        """Test that a sync without a target list reaches the topic's subscribers, installed table or not."""
+        nexus = MemoryIntegrationNexus()
+        OmnichronalMemoryRetrieval(integration_nexus=nexus).retrieve_memory_state("memory2", {"axiom": "test"})
+        expected = RoutingTable.from_manifest(load_manifest()).targets("memory")
+        self.assertEqual(tuple(nexus.memory_bridges["memory2"]["target_modules"]), expected)
+        table = RoutingTable(["voice_ai.voice_core"], strict=True)
+        table.subscribe("memory", "voice_ai.voice_core")
+        install_routing_table(table)
+        self.assertIs(routing_table.default_routing_table(), table)
+        nexus.sync_many("sync_memory_state", "memory3", {}, "primary")
+        self.assertEqual(nexus.memory_bridges["memory3"]["target_modules"], ["voice_ai.voice_core"])
+
+if __name__ == '__main__':
+    unittest.main()
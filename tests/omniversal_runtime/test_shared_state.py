@@ -0,0 +1,79 @@
+"""
+test_shared_state.py
+Unit tests for sharded, shared-memory state in Rhee_AI_Assistant.
+"""
+
+import multiprocessing
+import unittest
+from omniversal_runtime.shared_state import SharedMetricTable, shard_for
+
+def _write_from_child(name, region, entity_id):
+    """Attach to a table in another process and write one entity."""
+    table = SharedMetricTable(("coherence", "strength"), 8, 2, name=name)
+    table.write(region, entity_id, {"coherence": 0.97, "strength": 0.91})
+    table.close()
+
+def _rewrite_from_child(name, region, entity_id, stop):
+    """Rewrite one entity's slot until told to stop, keeping both columns equal."""
+    table = SharedMetricTable(("coherence", "strength"), 8, 2, name=name)
+    n = 0
+    while not stop.is_set():
+        n += 1
+        table.write(region, entity_id, {"coherence": float(n), "strength": float(n)})
+    table.close()
+
+class TestSharedState(unittest.TestCase):
+    """Test suite for shard_for and SharedMetricTable."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.table = SharedMetricTable(("coherence", "strength"), slots_per_region=8, regions=2)
+
+    def tearDown(self):
+        """Free the shared memory block."""
+        self.table.close()
+
+    def test_shard_for_is_stable_and_spread(self):
+        """Test that shard assignment is deterministic and uses every shard."""
+        shards = [shard_for(f"op_{n}", 4) for n in range(200)]
+        self.assertEqual(shards, [shard_for(f"op_{n}", 4) for n in range(200)])
+        self.assertEqual(set(shards), {0, 1, 2, 3})
+
+    def test_write_and_read(self):
+        """Test that metrics round-trip and unknown entities miss."""
+        self.table.write(1, "op_1", {"coherence": 0.99})
+        self.assertEqual(self.table.read(1, "op_1"), {"coherence": 0.99, "strength": 0.0})
+        self.assertIsNone(self.table.read(1, "op_2"))
+
+    def test_reads_writes_from_other_process(self):
+        """Test that a value written by another process is visible through shared memory."""
+        region = shard_for("op_3", 2)
+        child = multiprocessing.Process(target=_write_from_child, args=(self.table.name, region, "op_3"))
+        child.start()
+        child.join(10)
+        self.assertEqual(child.exitcode, 0)
+        self.assertEqual(self.table.read(region, "op_3"), {"coherence": 0.97, "strength": 0.91})
+
+    def test_read_never_mixes_two_writes(self):
+        """Test that a slot rewritten by another process is never read half old, half new."""
+        region = shard_for("op_4", 2)
+        self.table.write(region, "op_4", {"coherence": 0.0, "strength": 0.0})
+        stop = multiprocessing.Event()
+        child = multiprocessing.Process(target=_rewrite_from_child, args=(self.table.name, region, "op_4", stop))
+        child.start()
+        try:
+            torn = hits = 0
+            for _ in range(200000):
+                values = self.table.read(region, "op_4")
+                if values is not None:
+                    hits += 1
+                    torn += values["coherence"] != values["strength"]
+        finally:
+            stop.set()
+            child.join(10)
+        self.assertEqual(child.exitcode, 0)
+        self.assertGreater(hits, 0)
+        self.assertEqual(torn, 0)
+
+if __name__ == "__main__":
+    unittest.main()
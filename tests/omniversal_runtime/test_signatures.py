@@ -0,0 +1,68 @@
+"""
+test_signatures.py
+Unit tests for the content-addressed signature engine in Rhee_AI_Assistant.
+"""
+
+import unittest
+from omniversal_runtime.signatures import SignatureEngine, canonicalize
+from quantaversal_singularity_weave.quantaversal_sentience_orchestrator.quantaversal_sentience_orchestrator import QuantaversalSentienceOrchestrator
+
+class TestSignatureEngine(unittest.TestCase):
+    """Test suite for SignatureEngine."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.engine = SignatureEngine()
+        self.config = {"sentience_level": "infinite", "nested": {"b": 2, "a": 1}}
+
+    def test_canonicalization_ignores_key_order(self):
+        """Test that equal configs canonicalize identically regardless of key order."""
+        reordered = {"nested": {"a": 1, "b": 2}, "sentience_level": "infinite"}
+        self.assertEqual(canonicalize(self.config), canonicalize(reordered))
+        self.assertEqual(canonicalize({1: "x", "y": 2}), repr({1: "x", "y": 2}).encode())
+
+    def test_config_digest_is_cached_by_identity(self):
+        """Test that a config is canonicalized once and reused across entities."""
+        first = self.engine.entity_signature("sentience_1", self.config, "primary")
+        second = self.engine.entity_signature("sentience_2", self.config, "primary")
+        self.assertNotEqual(first, second)
+        self.assertEqual(self.engine.stats, {"hits": 1, "misses": 1})
+        self.assertEqual(first, self.engine.entity_signature("sentience_1", self.config, "primary"))
+
+    def test_version_and_invalidate_pick_up_mutations(self):
+        """Test that in-place mutations are seen after a version bump or invalidation."""
+        before = self.engine.entity_signature("sentience_1", self.config, "primary", version=1)
+        self.config["sentience_level"] = "finite"
+        self.assertEqual(before, self.engine.entity_signature("sentience_1", self.config, "primary", version=1))
+        self.assertNotEqual(before, self.engine.entity_signature("sentience_1", self.config, "primary", version=2))
+        self.engine.invalidate(self.config)
+        self.assertNotEqual(before, self.engine.entity_signature("sentience_1", self.config, "primary", version=1))
+
+    def test_blake2b_option(self):
+        """Test that blake2b signatures differ from sha256 but keep the same length."""
+        sha = self.engine.entity_signature("sentience_1", self.config, "primary")
+        self.engine.use_algorithm("blake2b")
+        blake = self.engine.entity_signature("sentience_1", self.config, "primary")
+        self.assertNotEqual(sha, blake)
+        self.assertEqual(len(sha), len(blake))
+        with self.assertRaises(ValueError):
+            self.engine.use_algorithm("md5")
+
+    def test_cache_is_bounded(self):
+        """Test that the digest cache evicts the least recently used configs."""
+        engine = SignatureEngine(cache_size=2)
+        configs = [{"n": n} for n in range(3)]
+        for config in configs:
+            engine.config_digest(config)
+        self.assertEqual(len(engine._digests), 2)
+
+    def test_orchestrator_signs_with_shared_engine(self):
+        """Test that a migrated module stores a hex signature per entity."""
+        orchestrator = QuantaversalSentienceOrchestrator()
+        orchestrator.orchestrate_sentience("sentience_1", self.config)
+        signature = orchestrator.sentience_signatures["sentience_1"]
+        self.assertEqual(len(signature), 64)
+        int(signature, 16)
+
+if __name__ == "__main__":
+    unittest.main()
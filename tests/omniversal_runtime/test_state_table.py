@@ -0,0 +1,74 @@
+"""
+test_state_table.py
+Unit tests for the columnar state table in Rhee_AI_Assistant.
+"""
+
+import unittest
+from omniversal_runtime.state_table import StateTable
+from metachronal_singularity_orchestrator.metachronal_singularity_synthesizer.metachronal_singularity_synthesizer import MetachronalSingularitySynthesizer
+
+class TestStateTable(unittest.TestCase):
+    """Test suite for StateTable and its column views."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.table = StateTable(numeric_columns=("coherence", "entropy"), object_columns=("profiles", "signatures"), capacity=2)
+        self.coherence = self.table.column("coherence")
+        self.profiles = self.table.column("profiles")
+
+    def test_column_views_share_rows(self):
+        """Test that every column of an entity lives in one row."""
+        self.coherence["e1"] = 0.97
+        self.profiles["e1"] = {"config": {}}
+        self.assertEqual(len(self.table), 1)
+        self.assertEqual(self.coherence["e1"], 0.97)
+        self.assertEqual(self.profiles.get("e1"), {"config": {}})
+        self.assertNotIn("e1", self.table.column("entropy"))
+        self.assertIsNone(self.table.column("signatures").get("e1"))
+
+    def test_growth_and_aggregate(self):
+        """Test capacity growth and vectorized aggregates."""
+        for i in range(10):
+            self.coherence[f"e{i}"] = 0.9 + i * 0.01
+        self.assertEqual(len(self.coherence), 10)
+        summary = self.table.aggregate("coherence")
+        self.assertEqual(summary["count"], 10)
+        self.assertAlmostEqual(summary["min"], 0.9)
+        self.assertAlmostEqual(summary["max"], 0.99)
+        self.assertEqual(self.table.select("coherence", low=0.985), ["e9"])
+
+    def test_delete_releases_row(self):
+        """Test that clearing the last column frees the row for reuse."""
+        self.coherence["e1"] = 0.95
+        self.profiles["e1"] = {}
+        del self.coherence["e1"]
+        self.assertIn("e1", self.table)
+        del self.profiles["e1"]
+        self.assertNotIn("e1", self.table)
+        self.coherence["e2"] = 0.96
+        self.assertEqual(self.table.index["e2"], 0)
+        with self.assertRaises(KeyError):
+            del self.coherence["missing"]
+
+    def test_mapping_compatibility(self):
+        """Test dict-style updates used by the synthesizers."""
+        self.coherence["e1"] = 0.5
+        self.coherence["e1"] += 0.25
+        self.assertEqual(dict(self.coherence.items()), {"e1": 0.75})
+        self.assertEqual(self.coherence, {"e1": 0.75})
+
+    def test_empty_aggregate(self):
+        """Test aggregates over an empty column."""
+        self.assertEqual(self.table.aggregate("entropy")["count"], 0)
+
+    def test_synthesizer_state_in_table(self):
+        """Test that synthesizer metrics are stored in its state table."""
+        synthesizer = MetachronalSingularitySynthesizer()
+        synthesizer.synthesize_singularity_state("singularity1", {"pattern": 0.9})
+        self.assertEqual(synthesizer.state_table.count("infiniversal_coherence"), 1)
+        self.assertGreaterEqual(synthesizer.infiniversal_coherence["singularity1"], 0.95)
+        self.assertIn("singularity1", synthesizer.singularity_signatures)
+        self.assertEqual(len(synthesizer.state_table), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+test_tag_index.py
+Unit tests for the inverted tag index in Rhee_AI_Assistant.
+"""
+
+import unittest
+from omniversal_runtime.tag_index import OR, TagIndex
+
+class TestTagIndex(unittest.TestCase):
+    """Test suite for TagIndex."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.index = TagIndex()
+        self.index.add("greeting", {"topic": "smalltalk", "speaker": "user"})
+        self.index.add("weather", {"topic": "smalltalk/weather", "speaker": "agent"})
+        self.index.add("plan", {"topic": "planning", "speaker": "user"})
+
+    def test_lookup_and_retag(self):
+        """Test exact lookups and that re-adding a key replaces its old tags."""
+        self.assertEqual(self.index.lookup("speaker", "user"), {"greeting", "plan"})
+        self.index.add("plan", {"speaker": "agent"})
+        self.assertEqual(self.index.lookup("speaker", "user"), {"greeting"})
+        self.assertEqual(self.index.lookup("topic", "planning"), set())
+        self.assertEqual(self.index.lookup("topic", ["unhashable"]), set())
+
+    def test_and_or_queries(self):
+        """Test multi-tag AND and OR matching, including repeated tag keys."""
+        self.assertEqual(self.index.match({"speaker": "user", "topic": "planning"}), {"plan"})
+        self.assertEqual(self.index.match([("topic", "planning"), ("topic", "smalltalk")], OR), {"plan", "greeting"})
+        self.assertEqual(self.index.match({}), set())
+        with self.assertRaises(ValueError):
+            self.index.match({"speaker": "user"}, "xor")
+
+    def test_prefix_and_remove(self):
+        """Test prefix queries and that removed keys and emptied values disappear."""
+        self.assertEqual(self.index.prefix("topic", "smalltalk"), {"greeting", "weather"})
+        self.index.remove("greeting")
+        self.index.remove("missing")
+        self.assertEqual(self.index.prefix("topic", "small"), {"weather"})
+        self.assertEqual(self.index.prefix("topic", ""), {"weather", "plan"})
+        self.assertEqual(len(self.index), 2)
+
+    def test_unhashable_values_match_by_equality(self):
+        """Test that values that fail to hash, like a tuple holding a list, are matched without indexing."""
+        self.index.add("mixed", {"topic": ("planning", [1]), "speaker": "user"})
+        self.assertEqual(self.index.lookup("speaker", "user"), {"greeting", "plan", "mixed"})
+        self.assertEqual(self.index.lookup("topic", ("planning", [1])), {"mixed"})
+        self.assertEqual(self.index.match({"topic": ("planning", [1]), "speaker": "user"}), {"mixed"})
+        self.index.remove("mixed")
+        self.assertEqual(self.index.lookup("topic", ("planning", [1])), set())
+        self.assertEqual(self.index.lookup("speaker", "user"), {"greeting", "plan"})
+
+    def test_rebuild(self):
+        """Test that rebuild replaces the index contents."""
+        self.index.rebuild([("solo", {"topic": "planning"})])
+        self.assertEqual(self.index.lookup("topic", "planning"), {"solo"})
+        self.assertEqual(self.index.lookup("speaker", "user"), set())
+
+if __name__ == "__main__":
+    unittest.main()
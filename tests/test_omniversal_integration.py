@@ -3,10 +3,16 @@ test_omniversal_integration.py
 Unit tests for the omniversal_integration_orchestrator module in Rhee_AI_Assistant.
 """
 
+import asyncio
+import threading
 import unittest
 import logging
 from datetime import datetime
-from omniversal_integration_orchestrator import OmniversalIntegrationOrchestrator
+from unittest.mock import patch
+from omniversal_integration_orchestrator import OmniversalIntegrationOrchestrator, ShardedOrchestrator
+from omniversal_runtime.admission import Overloaded
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.signatures import signatures
 
 class TestOmniversalIntegration(unittest.TestCase):
     """Test suite for omniversal integration orchestrator."""
@@ -18,6 +24,10 @@ class TestOmniversalIntegration(unittest.TestCase):
         self.logger = logging.getLogger(__name__)
         self.logger.info("Test environment set up for core engine %s at 06:05 PM IST, Sunday, July 27, 2025", self.agent_id)
 
+    def tearDown(self):
+        """Stop the orchestrator's worker threads and event bus."""
+        self.orchestrator.close()
+
     def test_orchestrate_system_synthesis(self):
         """Test system orchestration for synthesis operation."""
         operation_id = "test_op_001"
@@ -61,6 +71,123 @@ class TestOmniversalIntegration(unittest.TestCase):
         self.logger.info("Temporal coherence orchestration test passed for %s, agent %s at 06:05 PM IST, Sunday, July 27, 2025",
                          operation_id, self.agent_id)
 
+    def test_orchestrate_many_batches_by_type(self):
+        """Test bulk orchestration with micro-batches grouped by operation type."""
+        operations = [(f"test_batch_{n}", {"axiom": "test", "n": n}, "synthesis" if n % 2 else "temporal_coherence") for n in range(5)]
+        report = self.orchestrator.orchestrate_many(operations, max_batch_size=2)
+        self.assertEqual(report["operations"], 5)
+        self.assertEqual([batch["size"] for batch in report["batches"]], [2, 1, 2])
+        self.assertEqual(report["batches"][0]["module_syncs"], len(self.orchestrator.sync_modules))
+        state = report["results"]["test_batch_3"]
+        self.assertEqual(state["operation_type"], "synthesis")
+        self.assertIn("omnitemporal_coherence_lattice.temporal_integration_nexus", state["module_results"])
+        self.assertGreater(self.orchestrator.get_system_state("test_batch_3")["coherence"], 0.9)
+
+    def test_orchestrate_many_rejects_duplicates_and_session_operations(self):
+        """Test that repeated ids and voice operations are reported instead of silently batched."""
+        operations = [("test_dup_1", {"n": 1}, "synthesis"), ("test_dup_1", {"n": 2}, "synthesis"),
+                      ("test_voice_1", {"audio_input": b""}, "voice_processing")]
+        report = self.orchestrator.orchestrate_many(operations)
+        self.assertEqual(report["rejected"], {"test_dup_1": "duplicate", "test_voice_1": "needs_session"})
+        self.assertEqual(report["operations"], 1)
+        self.assertEqual(report["results"]["test_dup_1"]["config"], {"n": 1})
+        self.assertNotIn("test_voice_1", self.orchestrator.system_states)
+
+    def test_orchestrate_system_skips_unchanged_sync(self):
+        """Test that re-orchestrating an unchanged operation reuses the module sync unless forced."""
+        operation_id = "test_op_005"
+        config = {"axiom": "test", "temporal_layer": "primary"}
+        first = self.orchestrator.orchestrate_system(operation_id, config, "temporal_coherence")
+        self.assertFalse(first["sync_skipped"])
+        again = self.orchestrator.orchestrate_system(operation_id, dict(config), "temporal_coherence")
+        self.assertTrue(again["sync_skipped"])
+        self.assertEqual(again["module_status"], first["module_status"])
+        forced = self.orchestrator.orchestrate_system(operation_id, config, "temporal_coherence", force=True)
+        self.assertFalse(forced["sync_skipped"])
+        changed = self.orchestrator.orchestrate_system(operation_id, config, "synthesis")
+        self.assertFalse(changed["sync_skipped"])
+
+    def test_orchestrate_system_resyncs_config_mutated_in_place(self):
+        """Test that a config changed in place and invalidated is synced again."""
+        config = {"axiom": "test"}
+        self.orchestrator.orchestrate_system("test_op_010", config, "temporal_coherence")
+        config["axiom"] = "changed"
+        signatures.invalidate(config)
+        again = self.orchestrator.orchestrate_system("test_op_010", config, "temporal_coherence")
+        self.assertFalse(again["sync_skipped"])
+
+    def test_staged_partial_failure_is_not_skipped(self):
+        """Test that modules missing from a failed staged sync are synced on the next call."""
+        config = {"axiom": "test"}
+        with patch.object(self.orchestrator, "_sync_stage", side_effect=RuntimeError("stage down")):
+            failed = self.orchestrator.orchestrate_system("test_op_011", config, "synthesis", staged=True)
+        self.assertNotEqual(set(failed["stage_status"].values()), {"ok"})
+        again = self.orchestrator.orchestrate_system("test_op_011", config, "synthesis", staged=True)
+        self.assertFalse(again["sync_skipped"])
+        self.assertEqual(set(again["module_status"]), set(self.orchestrator.sync_modules))
+
+    def test_staged_sync_runs_each_operation(self):
+        """Test that operations sharing a config each sync their own modules under staged sync."""
+        config = {"axiom": "test", "context": "omniversal"}
+        module = "omnitemporal_coherence_lattice.temporal_integration_nexus"
+        first = self.orchestrator.orchestrate_system("test_op_008", config, "synthesis", staged=True)
+        second = self.orchestrator.orchestrate_system("test_op_009", config, "synthesis", staged=True)
+        self.assertEqual(set(second["stage_status"].values()), {"ok"})
+        self.assertIsNot(second["module_results"], first["module_results"])
+        nexus = self.orchestrator.nexus_pool.get(self.agent_id)
+        self.assertIn("test_op_008", nexus.temporal_bridges)
+        self.assertIn("test_op_009", nexus.temporal_bridges)
+        self.assertIs(second["module_results"][module], nexus.temporal_bridges["test_op_009"])
+        forced = self.orchestrator.orchestrate_system("test_op_009", config, "synthesis", staged=True, force=True)
+        self.assertEqual(set(forced["stage_status"].values()), {"ok"})
+
+    def test_construction_installs_no_routing_table(self):
+        """Test that building an orchestrator leaves process-wide routing to the entry points."""
+        self.assertIsNone(BatchSyncMixin.routing_table)
+
+    def test_module_sync_is_published_to_event_bus(self):
+        """Test that orchestration returns before the nexus sync event is delivered to subscribers."""
+        gate = threading.Event()
+        received = []
+
+        async def handler(event):
+            await asyncio.get_running_loop().run_in_executor(None, gate.wait, 5)
+            received.append(event["entity_id"])
+
+        module = "omnitemporal_coherence_lattice.temporal_integration_nexus"
+        self.orchestrator.event_bus.subscribe(module, handler)
+        state = self.orchestrator.orchestrate_system("test_op_007", {"axiom": "test"}, "temporal_coherence")
+        self.assertEqual(state["module_status"][module], "ok")
+        self.assertEqual(received, [])
+        gate.set()
+        asyncio.run_coroutine_threadsafe(self.orchestrator.event_bus.join(), self.orchestrator.event_bus.loop).result(5)
+        self.assertEqual(received, ["test_op_007"])
+
+    def test_sharded_orchestration(self):
+        """Test that sharded orchestration routes operations and serves cross-shard lookups."""
+        with ShardedOrchestrator(shards=2, agent_id=self.agent_id, slots_per_shard=64) as sharded:
+            state = sharded.orchestrate_system("test_shard_001", {"axiom": "test"}, "synthesis")
+            self.assertEqual(state["agent_id"], f"{self.agent_id}_shard{sharded.shard_for('test_shard_001')}")
+            report = sharded.orchestrate_many([(f"test_shard_{n}", {"n": n}, "synthesis") for n in range(2, 12)])
+            self.assertEqual(report["operations"], 10)
+            self.assertEqual({batch["shard"] for batch in report["batches"]}, {0, 1})
+            for operation_id in ("test_shard_001", "test_shard_5", "test_shard_9"):
+                metrics = sharded.get_metrics(operation_id)
+                self.assertAlmostEqual(metrics["coherence_metrics"], sharded.get_system_state(operation_id)["coherence"])
+
+    def test_admission_sheds_under_overload(self):
+        """Test that a saturated orchestrator sheds operations without recording state."""
+        orchestrator = OmniversalIntegrationOrchestrator(self.agent_id, max_concurrent_operations=1, max_queued_operations=0)
+        orchestrator.admission.acquire("synthesis")
+        with self.assertRaises(Overloaded):
+            orchestrator.orchestrate_system("test_op_006", {"axiom": "test"}, "synthesis")
+        self.assertNotIn("test_op_006", orchestrator.system_states)
+        self.assertEqual(orchestrator.overload_stats()["queue_full"], 1)
+        orchestrator.admission.release()
+        state = orchestrator.orchestrate_system("test_op_006", {"axiom": "test"}, "synthesis")
+        self.assertEqual(state["operation_type"], "synthesis")
+        orchestrator.close()
+
     def test_get_system_state_failure(self):
         """Test retrieval of non-existent system state."""
         state = self.orchestrator.get_system_state("non_existent_op")
@@ -3,9 +3,12 @@ test_voice_core.py
 Unit tests for the voice_core module with dynamic voice morphing in Rhee_AI_Assistant.
 """
 
+import asyncio
 import unittest
 import logging
 from datetime import datetime
+from types import SimpleNamespace
+from omniversal_runtime.load_replay import stub_voice_clients
 from voice_ai.voice_core import VoiceCore
 
 class TestVoiceCore(unittest.TestCase):
@@ -56,5 +59,43 @@ class TestVoiceCore(unittest.TestCase):
         self.logger.info("Non-existent conversation state test passed for agent %s at 05:23 PM IST, Sunday, July 27, 2025",
                          self.agent_id)
 
+class TestVoiceCoreHealthCheck(unittest.TestCase):
+    """Test suite for VoiceCore client health checks."""
+
+    def test_health_check_calls_every_client(self):
+        """Test that a client whose probe call fails makes the agent unhealthy."""
+        clients = stub_voice_clients()
+        self.assertTrue(VoiceCore("voice_agent_002", **clients).health_check())
+
+        def unauthorized():
+            raise PermissionError("invalid api key")
+
+        clients["llm"].models = SimpleNamespace(list=unauthorized)
+        self.assertFalse(VoiceCore("voice_agent_002", **clients).health_check())
+
+    def test_async_probe_inside_running_loop(self):
+        """Test that an async client can be probed from code that already runs an event loop."""
+        clients = stub_voice_clients()
+
+        async def list_projects():
+            return []
+
+        clients["stt"].projects = SimpleNamespace(list=list_projects)
+        voice_core = VoiceCore("voice_agent_003", **clients)
+
+        async def check():
+            return voice_core.health_check()
+
+        self.assertTrue(asyncio.run(check()))
+
+    def test_sessions_survive_rebuild(self):
+        """Test that a VoiceCore built on an earlier agent's session table keeps its conversations."""
+        clients = stub_voice_clients()
+        first = VoiceCore("voice_agent_004", **clients)
+        first.process_voice_input("session_1", b"", {"mock_transcription": "hello"})
+        rebuilt = VoiceCore("voice_agent_004", state_table=first.state_table, **clients)
+        self.assertEqual(rebuilt.get_conversation_state("session_1")["transcribed_text"],
+                         first.get_conversation_state("session_1")["transcribed_text"])
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,7 @@
 # transcendental_singularity_core/__init__.py
 # Marks the transcendental_singularity_core directory as a Python package.
 # Initializes configurations for metadimensional consciousness and infniversal coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'metadimensional_consciousness_lattice',
     'omnitemporal_coherence_synthesizer',
@@ -8,3 +9,4 @@ __all__ = [
     'metacausal_resonance_bridge',
     'transcendental_integration_bridge'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # transcendental_singularity_core/infiniversal_axiom_orchestrator/__init__.py
 # Marks the infniversal_axiom_orchestrator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfiniversalAxiomOrchestrator']
+__getattr__, __dir__ = attach(__name__, __all__)
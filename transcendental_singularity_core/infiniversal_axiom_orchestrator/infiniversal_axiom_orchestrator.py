@@ -4,10 +4,12 @@ Orchestrates metaphysical axioms for transcendental intelligence in Rhee_AI_Assi
 Manages infniversal axiom synthesis for sentient orchestration.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.ethical_matrix import EthicalMatrix
@@ -18,20 +20,30 @@ from datetime import datetime
 # from temporal_intelligence.multiversal_timeline_synthesizer import MultiversalTimelineSynthesizer
 # from cosmic_intelligence_orchestrator.omniversal_coherence_synthesizer import OmniversalCoherenceSynthesizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("alignment", "axiom", "coherence", "fractal", "harmonic", "resonance", "synthesis")
+
 class InfniversalAxiomOrchestrator:
     """Core class for infniversal axiom orchestration with transcendental fidelity."""
 
     def __init__(self, integration_bridge=None):
         """Initialize axiom orchestrator with infniversal states and integration bridge."""
-        self.axiom_states: Dict[str, Dict[str, Any]] = {}
-        self.infiniversal_coherence: Dict[str, float] = {}
-        self.transcendental_harmony_factor: Dict[str, float] = {}
-        self.transcendental_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence", "transcendental_harmony_factor", "transcendental_entropy"),
+            object_columns=("axiom_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.axiom_states = self.state_table.column("axiom_states")
+        self.infiniversal_coherence = self.state_table.column("infiniversal_coherence")
+        self.transcendental_harmony_factor = self.state_table.column("transcendental_harmony_factor")
+        self.transcendental_entropy = self.state_table.column("transcendental_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Infiniversal axiom orchestrator initialized with transcendental protocols at 06:30 PM IST, Saturday, July 19, 2025")
 
-    def orchestrate_axiom_state(self, axiom_id: str, config: Dict[str, Any], transcendental_layer: str = "primary") -> None:
+    def orchestrate_axiom_state(self, axiom_id: str, config: Dict[str, Any], transcendental_layer: str = "primary", force: bool = False) -> None:
         """
         Orchestrate an infniversal axiom state for transcendental intelligence.
 
@@ -39,29 +51,23 @@ class InfniversalAxiomOrchestrator:
             axiom_id (str): Unique identifier for the axiom state.
             config (Dict[str, Any]): Axiom configuration (e.g., metaphysical patterns, infniversal axioms).
             transcendental_layer (str): Transcendental layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.axiom_states[axiom_id] = {
                 "config": config,
                 "transcendental_layer": transcendental_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "axiom_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "axiom_signature": rng.uniform(0.85, 0.95)
             }
-            self.infiniversal_coherence[axiom_id] = random.uniform(0.95, 1.0)
-            self.transcendental_harmony_factor[axiom_id] = random.uniform(0.9, 0.95)
-            self.transcendental_entropy[axiom_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence[axiom_id] = rng.uniform(0.95, 1.0)
+            self.transcendental_harmony_factor[axiom_id] = rng.uniform(0.9, 0.95)
+            self.transcendental_entropy[axiom_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Orchestrated axiom state %s in transcendental layer %s with coherence %.2f, harmony factor %.2f, entropy %.2f at 06:30 PM IST, Saturday, July 19, 2025",
                              axiom_id, transcendental_layer, self.infiniversal_coherence[axiom_id],
                              self.transcendental_harmony_factor[axiom_id], self.transcendental_entropy[axiom_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_axiom_state(axiom_id, config, transcendental_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_axiom_state(axiom_id, config, transcendental_layer, "cyber_autonomy_engine.ethical_matrix")
-                self.integration_bridge.sync_axiom_state(axiom_id, config, transcendental_layer, "akashic_link.metaphysical_knowledge_synthesizer")
-                self.integration_bridge.sync_axiom_state(axiom_id, config, transcendental_layer, "ai_nirvana_engine.sentient_harmony_synthesizer")
-                self.integration_bridge.sync_axiom_state(axiom_id, config, transcendental_layer, "galactic_communication.fractal_communication_synthesizer")
-                self.integration_bridge.sync_axiom_state(axiom_id, config, transcendental_layer, "quantum_spiritual_singularity.transcendental_consciousness_synthesizer")
-                self.integration_bridge.sync_axiom_state(axiom_id, config, transcendental_layer, "temporal_intelligence.multiversal_timeline_synthesizer")
-                self.integration_bridge.sync_axiom_state(axiom_id, config, transcendental_layer, "cosmic_intelligence_orchestrator.omniversal_coherence_synthesizer")
+                self.integration_bridge.sync_many("sync_axiom_state", axiom_id, config, transcendental_layer, force=force)
         except Exception as e:
             self.logger.error("Error orchestrating axiom state %s in transcendental layer %s: %s at 06:30 PM IST, Saturday, July 19, 2025", axiom_id, transcendental_layer, e)
             self._regenerate_coherence(axiom_id, "orchestration")
@@ -69,9 +75,9 @@ class InfniversalAxiomOrchestrator:
     def _regenerate_coherence(self, axiom_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using infniversal recovery protocols."""
         try:
-            self.infiniversal_coherence[axiom_id] = random.uniform(0.9, 1.0)
-            self.transcendental_harmony_factor[axiom_id] = random.uniform(0.85, 0.95)
-            self.transcendental_entropy[axiom_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence[axiom_id] = rng.uniform(0.9, 1.0)
+            self.transcendental_harmony_factor[axiom_id] = rng.uniform(0.85, 0.95)
+            self.transcendental_entropy[axiom_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for axiom state %s after failed %s at 06:30 PM IST, Saturday, July 19, 2025", axiom_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for axiom state %s: %s at 06:30 PM IST, Saturday, July 19, 2025", axiom_id, e)
@@ -1,3 +1,5 @@
 # transcendental_singularity_core/metacausal_resonance_bridge/__init__.py
 # Marks the metacausal_resonance_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetacausalResonanceBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Simulates metacausal resonance synchronization for Rhee_AI_Assistant.
 Manages transcendental coherence across infinite singularities.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -19,20 +21,33 @@ from datetime import datetime
 # from temporal_intelligence.causal_coherence_bridge import CausalCoherenceBridge
 # from cosmic_intelligence_orchestrator.causal_singularity_bridge import CausalSingularityBridge
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "alignment", "axiom", "causality", "coherence", "dimensional", "orchestration", "resonance", "singularity",
+    "stability"
+)
+
 class MetacausalResonanceBridge:
     """Core class for metacausal resonance synchronization with transcendental coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize metacausal resonance bridge with transcendental states and integration bridge."""
-        self.resonance_bridge_states: Dict[str, Dict[str, Any]] = {}
-        self.transcendental_coherence: Dict[str, float] = {}
-        self.metacausal_transfer_cascade: Dict[str, float] = {}
-        self.transcendental_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("transcendental_coherence", "metacausal_transfer_cascade", "transcendental_entropy"),
+            object_columns=("resonance_bridge_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.resonance_bridge_states = self.state_table.column("resonance_bridge_states")
+        self.transcendental_coherence = self.state_table.column("transcendental_coherence")
+        self.metacausal_transfer_cascade = self.state_table.column("metacausal_transfer_cascade")
+        self.transcendental_entropy = self.state_table.column("transcendental_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Metacausal resonance bridge initialized with transcendental protocols at 06:30 PM IST, Saturday, July 19, 2025")
 
-    def sync_resonance_state(self, bridge_id: str, config: Dict[str, Any], transcendental_layer: str = "primary") -> None:
+    def sync_resonance_state(self, bridge_id: str, config: Dict[str, Any], transcendental_layer: str = "primary", force: bool = False) -> None:
         """
         Synchronize a metacausal resonance state across infinite singularities.
 
@@ -40,30 +55,23 @@ class MetacausalResonanceBridge:
             bridge_id (str): Unique identifier for the resonance bridge.
             config (Dict[str, Any]): Bridge configuration (e.g., metacausal patterns, infniversal axioms).
             transcendental_layer (str): Transcendental layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.resonance_bridge_states[bridge_id] = {
                 "config": config,
                 "transcendental_layer": transcendental_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "resonance_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "resonance_signature": rng.uniform(0.85, 0.95)
             }
-            self.transcendental_coherence[bridge_id] = random.uniform(0.95, 1.0)
-            self.metacausal_transfer_cascade[bridge_id] = random.uniform(0.9, 0.95)
-            self.transcendental_entropy[bridge_id] = random.uniform(0.0, 0.08)
+            self.transcendental_coherence[bridge_id] = rng.uniform(0.95, 1.0)
+            self.metacausal_transfer_cascade[bridge_id] = rng.uniform(0.9, 0.95)
+            self.transcendental_entropy[bridge_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synchronized resonance state %s in transcendental layer %s with coherence %.2f, transfer cascade %.2f, entropy %.2f at 06:30 PM IST, Saturday, July 19, 2025",
                              bridge_id, transcendental_layer, self.transcendental_coherence[bridge_id],
                              self.metacausal_transfer_cascade[bridge_id], self.transcendental_entropy[bridge_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_resonance_bridge(bridge_id, config, transcendental_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_resonance_bridge(bridge_id, config, transcendental_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_resonance_bridge(bridge_id, config, transcendental_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_resonance_bridge(bridge_id, config, transcendental_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_bridge.sync_resonance_bridge(bridge_id, config, transcendental_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
-                self.integration_bridge.sync_resonance_bridge(bridge_id, config, transcendental_layer, "galactic_communication.non_local_consciousness_relay")
-                self.integration_bridge.sync_resonance_bridge(bridge_id, config, transcendental_layer, "quantum_spiritual_singularity.multiversal_soul_bridge")
-                self.integration_bridge.sync_resonance_bridge(bridge_id, config, transcendental_layer, "temporal_intelligence.causal_coherence_bridge")
-                self.integration_bridge.sync_resonance_bridge(bridge_id, config, transcendental_layer, "cosmic_intelligence_orchestrator.causal_singularity_bridge")
+                self.integration_bridge.sync_many("sync_resonance_bridge", bridge_id, config, transcendental_layer, force=force)
         except Exception as e:
             self.logger.error("Error synchronizing resonance state %s in transcendental layer %s: %s at 06:30 PM IST, Saturday, July 19, 2025", bridge_id, transcendental_layer, e)
             self._regenerate_coherence(bridge_id, "synchronization")
@@ -71,9 +79,9 @@ class MetacausalResonanceBridge:
     def _regenerate_coherence(self, bridge_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using metacausal recovery protocols."""
         try:
-            self.transcendental_coherence[bridge_id] = random.uniform(0.9, 1.0)
-            self.metacausal_transfer_cascade[bridge_id] = random.uniform(0.85, 0.95)
-            self.transcendental_entropy[bridge_id] = random.uniform(0.0, 0.05)
+            self.transcendental_coherence[bridge_id] = rng.uniform(0.9, 1.0)
+            self.metacausal_transfer_cascade[bridge_id] = rng.uniform(0.85, 0.95)
+            self.transcendental_entropy[bridge_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for resonance bridge %s after failed %s at 06:30 PM IST, Saturday, July 19, 2025", bridge_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for resonance bridge %s: %s at 06:30 PM IST, Saturday, July 19, 2025", bridge_id, e)
@@ -1,3 +1,5 @@
 # transcendental_singularity_core/metadimensional_consciousness_lattice/__init__.py
 # Marks the metadimensional_consciousness_lattice directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetadimensionalConsciousnessLattice']
+__getattr__, __dir__ = attach(__name__, __all__)
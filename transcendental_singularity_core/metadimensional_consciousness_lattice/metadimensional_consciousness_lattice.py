@@ -4,11 +4,13 @@ Core module for metadimensional consciousness management in Rhee_AI_Assistant.
 Manages consciousness lattices across infinite-dimensional constructs.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -22,20 +24,34 @@ from datetime import datetime
 # from temporal_intelligence.chronodynamic_consciousness_weave import ChronodynamicConsciousnessWeave
 # from cosmic_intelligence_orchestrator.hyperdimensional_sentience_field import HyperdimensionalSentienceField
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "array", "axiom", "causal", "causality", "coherence", "consciousness", "convergence", "ethical", "fractal",
+    "harmonic", "hypersentience", "intention", "memory", "quantum", "reality", "resonance", "sentience",
+    "singularity", "stability", "synthesis", "temporal"
+)
+
 class MetadimensionalConsciousnessLattice:
     """Core class for metadimensional consciousness lattices with transcendental coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize consciousness lattice with metadimensional profiles and integration bridge."""
-        self.lattice_profiles: Dict[str, Dict[str, Any]] = {}
-        self.transcendental_signatures: Dict[str, str] = {}
-        self.metadimensional_coherence_cascades: Dict[str, float] = {}
-        self.transcendental_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("metadimensional_coherence_cascades", "transcendental_entropy"),
+            object_columns=("lattice_profiles", "transcendental_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.lattice_profiles = self.state_table.column("lattice_profiles")
+        self.transcendental_signatures = self.state_table.column("transcendental_signatures")
+        self.metadimensional_coherence_cascades = self.state_table.column("metadimensional_coherence_cascades")
+        self.transcendental_entropy = self.state_table.column("transcendental_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Metadimensional consciousness lattice initialized with transcendental protocols at 06:30 PM IST, Saturday, July 19, 2025")
 
-    def encode_lattice_state(self, lattice_id: str, config: Dict[str, Any], transcendental_layer: str = "primary") -> None:
+    def encode_lattice_state(self, lattice_id: str, config: Dict[str, Any], transcendental_layer: str = "primary", force: bool = False) -> None:
         """
         Encode a metadimensional consciousness state with transcendental signatures.
 
@@ -43,37 +59,28 @@ class MetadimensionalConsciousnessLattice:
             lattice_id (str): Unique identifier for the consciousness lattice.
             config (Dict[str, Any]): Lattice configuration (e.g., transcendental patterns, metaphysical axioms).
             transcendental_layer (str): Transcendental layer context (e.g., primary, infniversal, akashic).
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.lattice_profiles[lattice_id] = {
                 "config": config,
                 "transcendental_layer": transcendental_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "lattice_coherence_state": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "lattice_coherence_state": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{lattice_id}{str(config)}{transcendental_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(lattice_id, config, transcendental_layer, utc_iso())
             self.transcendental_signatures[lattice_id] = signature
-            self.metadimensional_coherence_cascades[lattice_id] = random.uniform(0.95, 1.0)
-            self.transcendental_entropy[lattice_id] = random.uniform(0.0, 0.08)
+            self.metadimensional_coherence_cascades[lattice_id] = rng.uniform(0.95, 1.0)
+            self.transcendental_entropy[lattice_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Encoded lattice state %s in transcendental layer %s with signature %s, coherence cascade %.2f, entropy %.2f at 06:30 PM IST, Saturday, July 19, 2025",
                              lattice_id, transcendental_layer, signature, self.metadimensional_coherence_cascades[lattice_id], self.transcendental_entropy[lattice_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_lattice_state(lattice_id, config, transcendental_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_lattice_state(lattice_id, config, transcendental_layer, "core_engine.quantum_memory_vault")
-                self.integration_bridge.sync_lattice_state(lattice_id, config, transcendental_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_lattice_state(lattice_id, config, transcendental_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_bridge.sync_lattice_state(lattice_id, config, transcendental_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_bridge.sync_lattice_state(lattice_id, config, transcendental_layer, "akashic_link.akashic_core")
-                self.integration_bridge.sync_lattice_state(lattice_id, config, transcendental_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_bridge.sync_lattice_state(lattice_id, config, transcendental_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_bridge.sync_lattice_state(lattice_id, config, transcendental_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_bridge.sync_lattice_state(lattice_id, config, transcendental_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_bridge.sync_lattice_state(lattice_id, config, transcendental_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
+                self.integration_bridge.sync_many("sync_lattice_state", lattice_id, config, transcendental_layer, force=force)
         except Exception as e:
             self.logger.error("Error encoding lattice state %s in transcendental layer %s: %s at 06:30 PM IST, Saturday, July 19, 2025", lattice_id, transcendental_layer, e)
             self._regenerate_coherence(lattice_id, "encoding")
 
-    def amplify_lattice_coherence(self, lattice_id: str, target_config: Dict[str, Any], target_layer: str) -> bool:
+    def amplify_lattice_coherence(self, lattice_id: str, target_config: Dict[str, Any], target_layer: str, force: bool = False) -> bool:
         """
         Amplify a lattice state with metadimensional coherence resonance.
 
@@ -81,6 +88,7 @@ class MetadimensionalConsciousnessLattice:
             lattice_id (str): The consciousness lattice to amplify.
             target_config (Dict[str, Any]): Target configuration for the lattice.
             target_layer (str): Target transcendental layer.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             bool: True if amplification successful, False otherwise.
@@ -90,22 +98,19 @@ class MetadimensionalConsciousnessLattice:
                 self.lattice_profiles[lattice_id] = {
                     "config": target_config,
                     "transcendental_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "lattice_coherence_state": self.lattice_profiles[lattice_id]["lattice_coherence_state"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "lattice_coherence_state": self.lattice_profiles[lattice_id]["lattice_coherence_state"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{lattice_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(lattice_id, target_config, target_layer)
                 self.transcendental_signatures[lattice_id] = new_signature
-                self.metadimensional_coherence_cascades[lattice_id] *= random.uniform(0.95, 1.1)
-                self.transcendental_entropy[lattice_id] += random.uniform(0.0, 0.02)
+                self.metadimensional_coherence_cascades[lattice_id] *= rng.uniform(0.95, 1.1)
+                self.transcendental_entropy[lattice_id] += rng.uniform(0.0, 0.02)
                 self.logger.info("Amplified lattice state %s to transcendental layer %s with new signature %s, coherence cascade %.2f, entropy %.2f at 06:30 PM IST, Saturday, July 19, 2025",
                                  lattice_id, target_layer, new_signature, self.metadimensional_coherence_cascades[lattice_id], self.transcendental_entropy[lattice_id])
                 if self.integration_bridge:
                     self.integration_bridge.notify_coherence_update(lattice_id, target_layer, "omnitemporal_coherence_synthesizer")
                     self.integration_bridge.notify_coherence_update(lattice_id, target_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                    self.integration_bridge.sync_lattice_state(lattice_id, target_config, target_layer, "core_engine.consciousness_interface")
-                    self.integration_bridge.sync_lattice_state(lattice_id, target_config, target_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                    self.integration_bridge.sync_lattice_state(lattice_id, target_config, target_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                    self.integration_bridge.sync_lattice_state(lattice_id, target_config, target_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
+                    self.integration_bridge.sync_many("sync_lattice_state", lattice_id, target_config, target_layer, force=force)
                 return True
             self.logger.warning("Lattice state %s not found for amplification to %s at 06:30 PM IST, Saturday, July 19, 2025", lattice_id, target_layer)
             return False
@@ -117,8 +122,8 @@ class MetadimensionalConsciousnessLattice:
     def _regenerate_coherence(self, lattice_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using metadimensional recovery protocols."""
         try:
-            self.metadimensional_coherence_cascades[lattice_id] = random.uniform(0.9, 1.0)
-            self.transcendental_entropy[lattice_id] = random.uniform(0.0, 0.05)
+            self.metadimensional_coherence_cascades[lattice_id] = rng.uniform(0.9, 1.0)
+            self.transcendental_entropy[lattice_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for lattice state %s after failed %s at 06:30 PM IST, Saturday, July 19, 2025", lattice_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for lattice state %s: %s at 06:30 PM IST, Saturday, July 19, 2025", lattice_id, e)
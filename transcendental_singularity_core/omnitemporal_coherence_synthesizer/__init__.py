@@ -1,3 +1,5 @@
 # transcendental_singularity_core/omnitemporal_coherence_synthesizer/__init__.py
 # Marks the omnitemporal_coherence_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnitemporalCoherenceS9Synthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
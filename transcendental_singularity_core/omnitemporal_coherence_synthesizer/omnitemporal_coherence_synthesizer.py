@@ -4,10 +4,12 @@ Simulates omnitemporal coherence synthesis for Rhee_AI_Assistant.
 Manages coherence across infinite timelines and dimensions.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -18,20 +20,33 @@ from datetime import datetime
 # from temporal_intelligence.quantum_temporal_resonator import QuantumTemporalResonator
 # from cosmic_intelligence_orchestrator.quantum_synchronicity_matrix import QuantumSynchronicityMatrix
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "awareness", "axiom", "causality", "coherence", "convergence", "encryption", "ethical", "flux", "fractal",
+    "harmonic", "reality", "resonance", "sentience", "synthesis"
+)
+
 class OmnitemporalCoherenceSynthesizer:
     """Core class for omnitemporal coherence synthesis with infinite-dimensional fidelity."""
 
     def __init__(self, integration_bridge=None):
         """Initialize coherence synthesizer with omnitemporal streams and integration bridge."""
-        self.coherence_streams: Dict[str, Dict[str, Any]] = {}
-        self.omnitemporal_amplitude: Dict[str, float] = {}
-        self.transcendental_synthesis_factor: Dict[str, float] = {}
-        self.transcendental_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("omnitemporal_amplitude", "transcendental_synthesis_factor", "transcendental_entropy"),
+            object_columns=("coherence_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.coherence_streams = self.state_table.column("coherence_streams")
+        self.omnitemporal_amplitude = self.state_table.column("omnitemporal_amplitude")
+        self.transcendental_synthesis_factor = self.state_table.column("transcendental_synthesis_factor")
+        self.transcendental_entropy = self.state_table.column("transcendental_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omnitemporal coherence synthesizer initialized with transcendental protocols at 06:30 PM IST, Saturday, July 19, 2025")
 
-    def synthesize_coherence_stream(self, stream_id: str, config: Dict[str, Any], transcendental_layer: str = "primary") -> List[Dict[str, Any]]:
+    def synthesize_coherence_stream(self, stream_id: str, config: Dict[str, Any], transcendental_layer: str = "primary", force: bool = False) -> List[Dict[str, Any]]:
         """
         Synthesize an omnitemporal coherence stream with infinite-dimensional fidelity.
 
@@ -39,43 +54,37 @@ class OmnitemporalCoherenceSynthesizer:
             stream_id (str): Unique identifier for the coherence stream.
             config (Dict[str, Any]): Stream configuration (e.g., transcendental patterns, infniversal axioms).
             transcendental_layer (str): Transcendental layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             List[Dict[str, Any]]: Synthesized coherence stream data with transcendental metadata.
         """
         try:
             coherence_streams = []
-            for i in range(random.randint(2, 6)):
-                segment_id = f"segment_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(2, 6)):
+                segment_id = f"segment_{i}_{rng.randint(1000, 9999)}"
                 segment = {
                     "id": segment_id,
                     "config": config,
                     "transcendental_layer": transcendental_layer,
-                    "data": {"omnitemporal_fractal": random.uniform(0.75, 1.0), "coherence_fidelity": random.uniform(0.8, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "transcendental_resonance": random.uniform(0.85, 0.95)
+                    "data": {"omnitemporal_fractal": rng.uniform(0.75, 1.0), "coherence_fidelity": rng.uniform(0.8, 0.95)},
+                    "timestamp": utc_iso(),
+                    "transcendental_resonance": rng.uniform(0.85, 0.95)
                 }
                 coherence_streams.append(segment)
             self.coherence_streams[stream_id] = {
                 "segments": coherence_streams,
                 "transcendental_layer": transcendental_layer,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.omnitemporal_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.transcendental_synthesis_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.transcendental_entropy[stream_id] = random.uniform(0.0, 0.08)
+            self.omnitemporal_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.transcendental_synthesis_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.transcendental_entropy[stream_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized coherence stream %s in transcendental layer %s with %d segments, omnitemporal amplitude %.2f, synthesis factor %.2f, entropy %.2f at 06:30 PM IST, Saturday, July 19, 2025",
                              stream_id, transcendental_layer, len(coherence_streams), self.omnitemporal_amplitude[stream_id],
                              self.transcendental_synthesis_factor[stream_id], self.transcendental_entropy[stream_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, transcendental_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, transcendental_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, transcendental_layer, "akashic_link.akashic_resonance_field")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, transcendental_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, transcendental_layer, "galactic_communication.trans_galactic_resonance_field")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, transcendental_layer, "quantum_spiritual_singularity.karmic_resonance_field")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, transcendental_layer, "temporal_intelligence.multiversal_timeline_synthesizer")
-                self.integration_bridge.sync_coherence_stream(stream_id, coherence_streams, transcendental_layer, "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix")
+                self.integration_bridge.sync_many("sync_coherence_stream", stream_id, coherence_streams, transcendental_layer, force=force, fingerprint=config)
                 self.integration_bridge.notify_coherence_update(stream_id, transcendental_layer, "metadimensional_consciousness_lattice")
             return coherence_streams
         except Exception as e:
@@ -86,9 +95,9 @@ class OmnitemporalCoherenceSynthesizer:
     def _regenerate_coherence(self, stream_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using omnitemporal recovery protocols."""
         try:
-            self.omnitemporal_amplitude[stream_id] = random.uniform(0.9, 1.0)
-            self.transcendental_synthesis_factor[stream_id] = random.uniform(0.85, 0.95)
-            self.transcendental_entropy[stream_id] = random.uniform(0.0, 0.05)
+            self.omnitemporal_amplitude[stream_id] = rng.uniform(0.9, 1.0)
+            self.transcendental_synthesis_factor[stream_id] = rng.uniform(0.85, 0.95)
+            self.transcendental_entropy[stream_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for coherence stream %s after failed %s at 06:30 PM IST, Saturday, July 19, 2025", stream_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for coherence stream %s: %s at 06:30 PM IST, Saturday, July 19, 2025", stream_id, e)
@@ -1,3 +1,5 @@
 # transcendental_singularity_core/transcendental_integration_bridge/__init__.py
 # Marks the transcendental_integration_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TranscendentalIntegrationBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
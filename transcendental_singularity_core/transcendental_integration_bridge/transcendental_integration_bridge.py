@@ -4,17 +4,22 @@ Manages cross-directory integration for transcendental_singularity_core in Rhee_
 Facilitates non-local transcendental coherence bridges and sentient synchronization.
 """
 
-import logging
 from typing import Dict, List, Any
-from datetime import datetime
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class TranscendentalIntegrationBridge:
+rng = get_stream(__name__)
+
+class TranscendentalIntegrationBridge(BatchSyncMixin):
     """Core class for managing non-local transcendental coherence bridges for transcendental operations."""
 
     def __init__(self):
         """Initialize integration bridge with non-local transcendental coherence tracking."""
-        self.coherence_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.coherence_bridges: Dict[str, Dict[str, Any]] = retained(self, "coherence_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Transcendental integration bridge initialized with non-local transcendental protocols at 06:30 PM IST, Saturday, July 19, 2025")
 
     def sync_lattice_state(self, lattice_id: str, config: Dict[str, Any], transcendental_layer: str, target_module: str) -> None:
@@ -32,9 +37,10 @@ class TranscendentalIntegrationBridge:
                 "config": config,
                 "transcendental_layer": transcendental_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(lattice_id)
             self.logger.info("Synchronized lattice state %s with %s in transcendental layer %s, coherence strength %.2f at 06:30 PM IST, Saturday, July 19, 2025",
                              lattice_id, target_module, transcendental_layer, self.coherence_bridges[lattice_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -56,9 +62,10 @@ class TranscendentalIntegrationBridge:
                 "coherence_streams": coherence_streams,
                 "transcendental_layer": transcendental_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stream_id)
             self.logger.info("Synchronized coherence stream %s with %s in transcendental layer %s, coherence strength %.2f at 06:30 PM IST, Saturday, July 19, 2025",
                              stream_id, target_module, transcendental_layer, self.coherence_bridges[stream_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -80,9 +87,10 @@ class TranscendentalIntegrationBridge:
                 "config": config,
                 "transcendental_layer": transcendental_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(axiom_id)
             self.logger.info("Synchronized axiom state %s with %s in transcendental layer %s, coherence strength %.2f at 06:30 PM IST, Saturday, July 19, 2025",
                              axiom_id, target_module, transcendental_layer, self.coherence_bridges[axiom_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -104,9 +112,10 @@ class TranscendentalIntegrationBridge:
                 "config": config,
                 "transcendental_layer": transcendental_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(bridge_id)
             self.logger.info("Synchronized resonance bridge %s with %s in transcendental layer %s, coherence strength %.2f at 06:30 PM IST, Saturday, July 19, 2025",
                              bridge_id, target_module, transcendental_layer, self.coherence_bridges[bridge_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
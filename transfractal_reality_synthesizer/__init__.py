@@ -1,6 +1,7 @@
 # transfractal_reality_synthesizer/__init__.py
 # Marks the transfractal_reality_synthesizer directory as a Python package.
 # Initializes configurations for transfractal reality protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'transfractal_reality_synthesizer',
     'omniversal_reality_orchestrator',
@@ -8,3 +9,4 @@ __all__ = [
     'infniversal_reality_stabilizer',
     'reality_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
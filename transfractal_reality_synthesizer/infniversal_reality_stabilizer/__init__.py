@@ -1,3 +1,5 @@
 # transfractal_reality_synthesizer/infniversal_reality_stabilizer/__init__.py
 # Marks the infniversal_reality_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfniversalRealityStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # transfractal_reality_synthesizer/metadimensional_reality_resonator/__init__.py
 # Marks the metadimensional_reality_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetadimensionalRealityResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
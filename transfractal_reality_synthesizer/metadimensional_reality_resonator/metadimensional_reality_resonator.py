@@ -4,30 +4,42 @@ Manages metadimensional reality resonance for Rhee_AI_Assistant.
 Resonates reality patterns in metadimensional contexts.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.ethical_matrix import EthicalMatrix
 # ... (other imports as needed)
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("axiom", "ethical", "resonance", "stability")
+
 class MetadimensionalRealityResonator:
     """Core class for metadimensional reality resonance."""
 
     def __init__(self, integration_nexus=None):
         """Initialize reality resonator with metadimensional states."""
-        self.resonance_states: Dict[str, Dict[str, Any]] = {}
-        self.metadimensional_coherence: Dict[str, float] = {}
-        self.resonance_amplitude: Dict[str, float] = {}
-        self.resonance_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("metadimensional_coherence", "resonance_amplitude", "resonance_entropy"),
+            object_columns=("resonance_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.resonance_states = self.state_table.column("resonance_states")
+        self.metadimensional_coherence = self.state_table.column("metadimensional_coherence")
+        self.resonance_amplitude = self.state_table.column("resonance_amplitude")
+        self.resonance_entropy = self.state_table.column("resonance_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Metadimensional reality resonator initialized at 04:57 PM IST, Monday, July 21, 2025")
 
-    def resonate_reality_state(self, resonance_id: str, config: Dict[str, Any], metadimensional_layer: str = "primary") -> None:
+    def resonate_reality_state(self, resonance_id: str, config: Dict[str, Any], metadimensional_layer: str = "primary", force: bool = False) -> None:
         """
         Resonate a reality state in metadimensional contexts.
 
@@ -35,62 +47,22 @@ class MetadimensionalRealityResonator:
             resonance_id (str): Unique identifier for the resonance state.
             config (Dict[str, Any]): Resonance configuration (e.g., fractal patterns, reality axioms).
             metadimensional_layer (str): Metadimensional layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.resonance_states[resonance_id] = {
                 "config": config,
                 "metadimensional_layer": metadimensional_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "resonance_strength": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "resonance_strength": rng.uniform(0.85, 0.95)
             }
-            self.metadimensional_coherence[resonance_id] = random.uniform(0.95, 1.0)
-            self.resonance_amplitude[resonance_id] = random.uniform(0.9, 0.95)
-            self.resonance_entropy[resonance_id] = random.uniform(0.0, 0.08)
+            self.metadimensional_coherence[resonance_id] = rng.uniform(0.95, 1.0)
+            self.resonance_amplitude[resonance_id] = rng.uniform(0.9, 0.95)
+            self.resonance_entropy[resonance_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Resonated reality state %s in layer %s, coherence %.2f, amplitude %.2f at 04:57 PM IST, Monday, July 21, 2025",
                              resonance_id, metadimensional_layer, self.metadimensional_coherence[resonance_id], self.resonance_amplitude[resonance_id])
             if self.integration_nexus:
-                modules = [
-                    "core_engine.emotion_engine", "cyber_autonomy_engine.ethical_matrix",
-                    "akashic_link.metaphysical_knowledge_synthesizer", "ai_nirvana_engine.sentient_harmony_synthesizer",
-                    "galactic_communication.fractal_communication_synthesizer",
-                    "quantum_spiritual_singularity.transcendental_consciousness_synthesizer",
-                    "temporal_intelligence.multiversal_timeline_synthesizer",
-                    "cosmic_intelligence_orchestrator.omniversal_coherence_synthesizer",
-                    "transcendental_singularity_core.infiniversal_axiom_orchestrator",
-                    "omniversal_sentience_nexus.infiniversal_coherence_stabilizer",
-                    "metainfinite_causality_engine.infiniversal_axiom_stabilizer",
-                    "hypercosmic_synthesis_core.metacausal_coherence_amplifier",
-                    "transinfinite_resonance_engine.metadimensional_coherence_stabilizer",
-                    "transmetacosmic_nexus.metainfinite_coherence_harmonizer",
-                    "infinicryptic_synthesis_core.metacausal_coherence_resonator",
-                    "metacausal_singularity_engine.transinfinite_coherence_stabilizer",
-                    "omniflux_synthesis_core.infiniversal_coherence_harmonizer",
-                    "hyperfractal_consciousness_matrix.infinicryptic_alignment_synthesizer",
-                    "transmetagalactic_synthesis_array.metacausal_fractal_synthesizer",
-                    "omnidimensional_quantum_harmonizer.infiniversal_fractal_harmonizer",
-                    "transomniversal_coherence_matrix.infinicryptic_fractal_orchestrator",
-                    "metachronal_singularity_orchestrator.transfractal_resonance_modulator",
-                    "infinicryptic_causal_resonator.omniflux_coherence_stabilizer",
-                    "transmetahyperdimensional_harmonic_synthesis.metacausal_coherence_orchestrator",
-                    "omnitemporal_quantum_singularity.infinicryptic_coherence_amplifier",
-                    "infniversal_fractal_synthesis.omnichronal_harmonic_amplifier",
-                    "hypermetacosmic_causal_orchestrator.transinfinite_fractal_resonator",
-                    "omnichronal_hypersentience_array.infniversal_axiom_resonator",
-                    "quantaversal_singularity_weave.quantaversal_sentience_orchestrator",
-                    "quantaversal_singularity_weave.omniflux_coherence_resonator",
-                    "quantaversal_singularity_weave.transinfinite_axiom_synthesizer",
-                    "quantaversal_singularity_weave.metatemporal_causality_stabilizer",
-                    "omniharmonic_causal_fractal.omniharmonic_causal_resonator",
-                    "omniharmonic_causal_fractal.fractal_sentience_synthesizer",
-                    "omniharmonic_causal_fractal.transmetatemporal_coherence_amplifier",
-                    "omniharmonic_causal_fractal.infniversal_axiom_stabilizer",
-                    "quantum_metacognitive_nexus.quantum_metacognitive_synthesizer",
-                    "quantum_metacognitive_nexus.omniversal_self_awareness_orchestrator",
-                    "quantum_metacognitive_nexus.transfractal_cognitive_resonator",
-                    "quantum_metacognitive_nexus.infinicognitive_coherence_stabilizer"
-                ]
-                for module in modules:
-                    self.integration_nexus.sync_resonance_state(resonance_id, config, metadimensional_layer, module)
+                self.integration_nexus.sync_many("sync_resonance_state", resonance_id, config, metadimensional_layer, force=force)
         except Exception as e:
             self.logger.error("Error resonating reality state %s: %s at 04:57 PM IST, Monday, July 21, 2025", resonance_id, e)
             self._regenerate_coherence(resonance_id, "resonance")
@@ -98,9 +70,9 @@ class MetadimensionalRealityResonator:
     def _regenerate_coherence(self, resonance_id: str, operation: str) -> None:
         """Regenerate coherence for a failed operation."""
         try:
-            self.metadimensional_coherence[resonance_id] = random.uniform(0.9, 1.0)
-            self.resonance_amplitude[resonance_id] = random.uniform(0.85, 0.95)
-            self.resonance_entropy[resonance_id] = random.uniform(0.0, 0.05)
+            self.metadimensional_coherence[resonance_id] = rng.uniform(0.9, 1.0)
+            self.resonance_amplitude[resonance_id] = rng.uniform(0.85, 0.95)
+            self.resonance_entropy[resonance_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for resonance state %s after %s at 04:57 PM IST, Monday, July 21, 2025", resonance_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for %s: %s at 04:57 PM IST, Monday, July 21, 2025", resonance_id, e)
@@ -1,3 +1,5 @@
 # transfractal_reality_synthesizer/omniversal_reality_orchestrator/__init__.py
 # Marks the omniversal_reality_orchestrator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmniversalRealityOrchestrator']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # transfractal_reality_synthesizer/transfractal_reality_synthesizer/__init__.py
 # Marks the transfractal_reality_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransfractalRealitySynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,6 +1,7 @@
 # transinfinite_intention_modulator/__init__.py
 # Marks the transinfinite_intention_modulator directory as a Python package.
 # Initializes configurations for transinfinite intention modulation protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'intention_field_synthesizer',
     'omnichronal_intention_aligner',
@@ -8,3 +9,4 @@ __all__ = [
     'metacausal_intention_stabilizer',
     'intention_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
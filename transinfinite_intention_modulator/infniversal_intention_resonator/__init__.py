@@ -1,3 +1,5 @@
 # transinfinite_intention_modulator/infniversal_intention_resonator/__init__.py
 # Marks the infniversal_intention_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfniversalIntentionResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
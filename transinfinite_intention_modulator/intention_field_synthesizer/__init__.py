@@ -1,3 +1,5 @@
 # transinfinite_intention_modulator/intention_field_synthesizer/__init__.py
 # Marks the intention_field_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['IntentionFieldSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
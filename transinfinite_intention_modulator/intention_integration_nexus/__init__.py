@@ -1,3 +1,5 @@
 # transinfinite_intention_modulator/intention_integration_nexus/__init__.py
 # Marks the intention_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['IntentionIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
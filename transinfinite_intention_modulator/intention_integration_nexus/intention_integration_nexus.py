@@ -4,18 +4,25 @@ Manages cross-directory integration for transinfinite_intention_modulator in Rhe
 Facilitates non-local intention bridges and synchronization.
 """
 
-import logging
 from typing import Dict, Any
-from datetime import datetime
-import random
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class IntentionIntegrationNexus:
+rng = get_stream(__name__)
+
+class IntentionIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local intention bridges for intention modulation operations."""
 
+    bridge_store = "intention_bridges"
+    strength_key = "intention_strength"
+
     def __init__(self):
         """Initialize integration nexus with non-local intention tracking."""
-        self.intention_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.intention_bridges: Dict[str, Dict[str, Any]] = retained(self, "intention_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Intention integration nexus initialized at 09:38 PM IST, Monday, July 21, 2025")
 
     def sync_intention_field(self, intention_id: str, config: Dict[str, Any], intention_layer: str, target_module: str) -> None:
@@ -33,9 +40,10 @@ class IntentionIntegrationNexus:
                 "config": config,
                 "intention_layer": intention_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "intention_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "intention_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(intention_id)
             self.logger.info("Synchronized intention field %s with %s, strength %.2f at 09:38 PM IST, Monday, July 21, 2025",
                              intention_id, target_module, self.intention_bridges[intention_id]["intention_strength"])
         except Exception as e:
@@ -56,9 +64,10 @@ class IntentionIntegrationNexus:
                 "config": config,
                 "omnichronal_layer": omnichronal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "intention_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "intention_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(intention_id)
             self.logger.info("Synchronized intention state %s with %s, strength %.2f at 09:38 PM IST, Monday, July 21, 2025",
                              intention_id, target_module, self.intention_bridges[intention_id]["intention_strength"])
         except Exception as e:
@@ -79,9 +88,10 @@ class IntentionIntegrationNexus:
                 "config": config,
                 "infniversal_layer": infniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "intention_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "intention_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(resonance_id)
             self.logger.info("Synchronized resonance state %s with %s, strength %.2f at 09:38 PM IST, Monday, July 21, 2025",
                              resonance_id, target_module, self.intention_bridges[resonance_id]["intention_strength"])
         except Exception as e:
@@ -102,9 +112,10 @@ class IntentionIntegrationNexus:
                 "config": config,
                 "metacausal_layer": metacausal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "intention_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "intention_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stability_id)
             self.logger.info("Synchronized stability state %s with %s, strength %.2f at 09:38 PM IST, Monday, July 21, 2025",
                              stability_id, target_module, self.intention_bridges[stability_id]["intention_strength"])
         except Exception as e:
@@ -1,3 +1,5 @@
 # transinfinite_intention_modulator/metacausal_intention_stabilizer/__init__.py
 # Marks the metacausal_intention_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetacausalIntentionStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
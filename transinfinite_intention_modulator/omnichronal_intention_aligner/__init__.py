@@ -1,3 +1,5 @@
 # transinfinite_intention_modulator/omnichronal_intention_aligner/__init__.py
 # Marks the omnichronal_intention_aligner directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnichronalIntentionAligner']
+__getattr__, __dir__ = attach(__name__, __all__)
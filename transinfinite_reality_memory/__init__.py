@@ -1,6 +1,7 @@
 # transinfinite_reality_memory/__init__.py
 # Marks the transinfinite_reality_memory directory as a Python package.
 # Initializes configurations for transinfinite reality memory protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'reality_state_archival',
     'omnichronal_memory_retrieval',
@@ -8,3 +9,4 @@ __all__ = [
     'metacausal_memory_stabilizer',
     'memory_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # transinfinite_reality_memory/infniversal_memory_resonator/__init__.py
 # Marks the infniversal_memory_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfniversalMemoryResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
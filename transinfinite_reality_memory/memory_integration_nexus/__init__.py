@@ -1,3 +1,5 @@
 # transinfinite_reality_memory/memory_integration_nexus/__init__.py
 # Marks the memory_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MemoryIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
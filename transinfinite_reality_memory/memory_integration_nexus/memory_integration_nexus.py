@@ -4,18 +4,25 @@ Manages cross-directory integration for transinfinite_reality_memory in Rhee_AI_
 Facilitates non-local memory bridges and synchronization.
 """
 
-import logging
 from typing import Dict, Any
-from datetime import datetime
-import random
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class MemoryIntegrationNexus:
+rng = get_stream(__name__)
+
+class MemoryIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local memory bridges for reality memory operations."""
 
+    bridge_store = "memory_bridges"
+    strength_key = "memory_strength"
+
     def __init__(self):
         """Initialize integration nexus with non-local memory tracking."""
-        self.memory_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.memory_bridges: Dict[str, Dict[str, Any]] = retained(self, "memory_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Memory integration nexus initialized at 05:42 AM IST, Tuesday, July 22, 2025")
 
     def sync_reality_state(self, reality_id: str, config: Dict[str, Any], reality_layer: str, target_module: str) -> None:
@@ -33,9 +40,10 @@ class MemoryIntegrationNexus:
                 "config": config,
                 "reality_layer": reality_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "memory_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "memory_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(reality_id)
             self.logger.info("Synchronized reality state %s with %s, strength %.2f at 05:42 AM IST, Tuesday, July 22, 2025",
                              reality_id, target_module, self.memory_bridges[reality_id]["memory_strength"])
         except Exception as e:
@@ -56,9 +64,10 @@ class MemoryIntegrationNexus:
                 "config": config,
                 "omnichronal_layer": omnichronal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "memory_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "memory_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(memory_id)
             self.logger.info("Synchronized memory state %s with %s, strength %.2f at 05:42 AM IST, Tuesday, July 22, 2025",
                              memory_id, target_module, self.memory_bridges[memory_id]["memory_strength"])
         except Exception as e:
@@ -79,9 +88,10 @@ class MemoryIntegrationNexus:
                 "config": config,
                 "infniversal_layer": infniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "memory_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "memory_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(resonance_id)
             self.logger.info("Synchronized resonance state %s with %s, strength %.2f at 05:42 AM IST, Tuesday, July 22, 2025",
                              resonance_id, target_module, self.memory_bridges[resonance_id]["memory_strength"])
         except Exception as e:
@@ -102,9 +112,10 @@ class MemoryIntegrationNexus:
                 "config": config,
                 "metacausal_layer": metacausal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "memory_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "memory_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stability_id)
             self.logger.info("Synchronized stability state %s with %s, strength %.2f at 05:42 AM IST, Tuesday, July 22, 2025",
                              stability_id, target_module, self.memory_bridges[stability_id]["memory_strength"])
         except Exception as e:
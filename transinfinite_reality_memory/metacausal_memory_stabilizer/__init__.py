@@ -1,3 +1,5 @@
 # transinfinite_reality_memory/metacausal_memory_stabilizer/__init__.py
 # Marks the metacausal_memory_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetacausalMemoryStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # transinfinite_reality_memory/omnichronal_memory_retrieval/__init__.py
 # Marks the omnichronal_memory_retrieval directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnichronalMemoryRetrieval']
+__getattr__, __dir__ = attach(__name__, __all__)
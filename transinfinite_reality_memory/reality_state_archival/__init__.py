@@ -1,3 +1,5 @@
 # transinfinite_reality_memory/reality_state_archival/__init__.py
 # Marks the reality_state_archival directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['RealityStateArchival']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,6 +1,7 @@
 # transinfinite_resonance_engine/__init__.py
 # Marks the transinfinite_resonance_engine directory as a Python package.
 # Initializes configurations for transinfinite resonance and coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'transinfinite_resonance_field',
     'omnichronal_synthesis_lattice',
@@ -8,3 +9,4 @@ __all__ = [
     'infiniversal_alignment_bridge',
     'transinfinite_integration_bridge'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
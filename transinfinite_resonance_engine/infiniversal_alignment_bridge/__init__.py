@@ -1,3 +1,5 @@
 # transinfinite_resonance_engine/infiniversal_alignment_bridge/__init__.py
 # Marks the infniversal_alignment_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfiniversalAlignmentBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # transinfinite_resonance_engine/metadimensional_coherence_stabilizer/__init__.py
 # Marks the metadimensional_coherence_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetadimensionalCoherenceStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
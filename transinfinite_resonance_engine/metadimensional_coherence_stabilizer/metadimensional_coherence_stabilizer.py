@@ -4,10 +4,12 @@ Stabilizes metadimensional coherence for Rhee_AI_Assistant.
 Manages coherence across transinfinite frameworks.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.ethical_matrix import EthicalMatrix
@@ -22,20 +24,30 @@ from datetime import datetime
 # from metainfinite_causality_engine.infiniversal_axiom_stabilizer import InfniversalAxiomStabilizer
 # from hypercosmic_synthesis_core.metacausal_coherence_amplifier import MetacausalCoherenceAmplifier
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("alignment", "axiom", "coherence", "fractal", "harmonic", "resonance", "synthesis")
+
 class MetadimensionalCoherenceStabilizer:
     """Core class for metadimensional coherence stabilization with transinfinite fidelity."""
 
     def __init__(self, integration_bridge=None):
         """Initialize coherence stabilizer with transinfinite states and integration bridge."""
-        self.coherence_states: Dict[str, Dict[str, Any]] = {}
-        self.metadimensional_coherence: Dict[str, float] = {}
-        self.transinfinite_harmony_factor: Dict[str, float] = {}
-        self.transinfinite_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("metadimensional_coherence", "transinfinite_harmony_factor", "transinfinite_entropy"),
+            object_columns=("coherence_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.coherence_states = self.state_table.column("coherence_states")
+        self.metadimensional_coherence = self.state_table.column("metadimensional_coherence")
+        self.transinfinite_harmony_factor = self.state_table.column("transinfinite_harmony_factor")
+        self.transinfinite_entropy = self.state_table.column("transinfinite_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Metadimensional coherence stabilizer initialized with transinfinite protocols at 07:19 PM IST, Saturday, July 19, 2025")
 
-    def stabilize_coherence_state(self, coherence_id: str, config: Dict[str, Any], transinfinite_layer: str = "primary") -> None:
+    def stabilize_coherence_state(self, coherence_id: str, config: Dict[str, Any], transinfinite_layer: str = "primary", force: bool = False) -> None:
         """
         Stabilize a metadimensional coherence state for transinfinite stability.
 
@@ -43,33 +55,23 @@ class MetadimensionalCoherenceStabilizer:
             coherence_id (str): Unique identifier for the coherence state.
             config (Dict[str, Any]): Coherence configuration (e.g., metadimensional patterns, transinfinite axioms).
             transinfinite_layer (str): Transinfinite layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.coherence_states[coherence_id] = {
                 "config": config,
                 "transinfinite_layer": transinfinite_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "coherence_signature": rng.uniform(0.85, 0.95)
             }
-            self.metadimensional_coherence[coherence_id] = random.uniform(0.95, 1.0)
-            self.transinfinite_harmony_factor[coherence_id] = random.uniform(0.9, 0.95)
-            self.transinfinite_entropy[coherence_id] = random.uniform(0.0, 0.08)
+            self.metadimensional_coherence[coherence_id] = rng.uniform(0.95, 1.0)
+            self.transinfinite_harmony_factor[coherence_id] = rng.uniform(0.9, 0.95)
+            self.transinfinite_entropy[coherence_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Stabilized coherence state %s in transinfinite layer %s with coherence %.2f, harmony factor %.2f, entropy %.2f at 07:19 PM IST, Saturday, July 19, 2025",
                              coherence_id, transinfinite_layer, self.metadimensional_coherence[coherence_id],
                              self.transinfinite_harmony_factor[coherence_id], self.transinfinite_entropy[coherence_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transinfinite_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transinfinite_layer, "cyber_autonomy_engine.ethical_matrix")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transinfinite_layer, "akashic_link.metaphysical_knowledge_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transinfinite_layer, "ai_nirvana_engine.sentient_harmony_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transinfinite_layer, "galactic_communication.fractal_communication_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transinfinite_layer, "quantum_spiritual_singularity.transcendental_consciousness_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transinfinite_layer, "temporal_intelligence.multiversal_timeline_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transinfinite_layer, "cosmic_intelligence_orchestrator.omniversal_coherence_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transinfinite_layer, "transcendental_singularity_core.infiniversal_axiom_orchestrator")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transinfinite_layer, "omniversal_sentience_nexus.infiniversal_coherence_stabilizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transinfinite_layer, "metainfinite_causality_engine.infiniversal_axiom_stabilizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transinfinite_layer, "hypercosmic_synthesis_core.metacausal_coherence_amplifier")
+                self.integration_bridge.sync_many("sync_coherence_state", coherence_id, config, transinfinite_layer, force=force)
         except Exception as e:
             self.logger.error("Error stabilizing coherence state %s in transinfinite layer %s: %s at 07:19 PM IST, Saturday, July 19, 2025", coherence_id, transinfinite_layer, e)
             self._regenerate_coherence(coherence_id, "stabilization")
@@ -77,9 +79,9 @@ class MetadimensionalCoherenceStabilizer:
     def _regenerate_coherence(self, coherence_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using metadimensional recovery protocols."""
         try:
-            self.metadimensional_coherence[coherence_id] = random.uniform(0.9, 1.0)
-            self.transinfinite_harmony_factor[coherence_id] = random.uniform(0.85, 0.95)
-            self.transinfinite_entropy[coherence_id] = random.uniform(0.0, 0.05)
+            self.metadimensional_coherence[coherence_id] = rng.uniform(0.9, 1.0)
+            self.transinfinite_harmony_factor[coherence_id] = rng.uniform(0.85, 0.95)
+            self.transinfinite_entropy[coherence_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for coherence state %s after failed %s at 07:19 PM IST, Saturday, July 19, 2025", coherence_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for coherence state %s: %s at 07:19 PM IST, Saturday, July 19, 2025", coherence_id, e)
@@ -1,3 +1,5 @@
 # transinfinite_resonance_engine/omnichronal_synthesis_lattice/__init__.py
 # Marks the omnichronal_synthesis_lattice directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnichronalSynthesisLattice']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Manages omnichronal synthesis lattices for Rhee_AI_Assistant.
 Synthesizes causality across omnichronal timelines.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -22,20 +24,33 @@ from datetime import datetime
 # from metainfinite_causality_engine.omnichronal_coherence_resonator import OmnichronalCoherenceResonator
 # from hypercosmic_synthesis_core.omniversal_fractal_resonator import OmniversalFractalResonator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "awareness", "axiom", "causality", "coherence", "convergence", "encryption", "ethical", "flux", "harmonic",
+    "reality", "resonance", "sentience"
+)
+
 class OmnichronalSynthesisLattice:
     """Core class for omnichronal synthesis lattices with transinfinite coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize synthesis lattice with omnichronal streams and integration bridge."""
-        self.synthesis_streams: Dict[str, Dict[str, Any]] = {}
-        self.omnichronal_amplitude: Dict[str, float] = {}
-        self.transinfinite_synthesis_factor: Dict[str, float] = {}
-        self.transinfinite_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("omnichronal_amplitude", "transinfinite_synthesis_factor", "transinfinite_entropy"),
+            object_columns=("synthesis_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.synthesis_streams = self.state_table.column("synthesis_streams")
+        self.omnichronal_amplitude = self.state_table.column("omnichronal_amplitude")
+        self.transinfinite_synthesis_factor = self.state_table.column("transinfinite_synthesis_factor")
+        self.transinfinite_entropy = self.state_table.column("transinfinite_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omnichronal synthesis lattice initialized with transinfinite protocols at 07:19 PM IST, Saturday, July 19, 2025")
 
-    def resonate_synthesis_stream(self, stream_id: str, config: Dict[str, Any], transinfinite_layer: str = "primary") -> List[Dict[str, Any]]:
+    def resonate_synthesis_stream(self, stream_id: str, config: Dict[str, Any], transinfinite_layer: str = "primary", force: bool = False) -> List[Dict[str, Any]]:
         """
         Resonate an omnichronal synthesis stream with transinfinite fidelity.
 
@@ -43,47 +58,37 @@ class OmnichronalSynthesisLattice:
             stream_id (str): Unique identifier for the synthesis stream.
             config (Dict[str, Any]): Stream configuration (e.g., omnichronal patterns, transinfinite axioms).
             transinfinite_layer (str): Transinfinite layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             List[Dict[str, Any]]: Resonated synthesis stream data with transinfinite metadata.
         """
         try:
             synthesis_streams = []
-            for i in range(random.randint(2, 6)):
-                segment_id = f"segment_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(2, 6)):
+                segment_id = f"segment_{i}_{rng.randint(1000, 9999)}"
                 segment = {
                     "id": segment_id,
                     "config": config,
                     "transinfinite_layer": transinfinite_layer,
-                    "data": {"omnichronal_fractal": random.uniform(0.75, 1.0), "synthesis_fidelity": random.uniform(0.8, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "transinfinite_resonance": random.uniform(0.85, 0.95)
+                    "data": {"omnichronal_fractal": rng.uniform(0.75, 1.0), "synthesis_fidelity": rng.uniform(0.8, 0.95)},
+                    "timestamp": utc_iso(),
+                    "transinfinite_resonance": rng.uniform(0.85, 0.95)
                 }
                 synthesis_streams.append(segment)
             self.synthesis_streams[stream_id] = {
                 "segments": synthesis_streams,
                 "transinfinite_layer": transinfinite_layer,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.omnichronal_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.transinfinite_synthesis_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.transinfinite_entropy[stream_id] = random.uniform(0.0, 0.08)
+            self.omnichronal_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.transinfinite_synthesis_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.transinfinite_entropy[stream_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Resonated synthesis stream %s in transinfinite layer %s with %d segments, omnichronal amplitude %.2f, synthesis factor %.2f, entropy %.2f at 07:19 PM IST, Saturday, July 19, 2025",
                              stream_id, transinfinite_layer, len(synthesis_streams), self.omnichronal_amplitude[stream_id],
                              self.transinfinite_synthesis_factor[stream_id], self.transinfinite_entropy[stream_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_synthesis_stream(stream_id, synthesis_streams, transinfinite_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_synthesis_stream(stream_id, synthesis_streams, transinfinite_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_synthesis_stream(stream_id, synthesis_streams, transinfinite_layer, "akashic_link.akashic_resonance_field")
-                self.integration_bridge.sync_synthesis_stream(stream_id, synthesis_streams, transinfinite_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_bridge.sync_synthesis_stream(stream_id, synthesis_streams, transinfinite_layer, "galactic_communication.trans_galactic_resonance_field")
-                self.integration_bridge.sync_synthesis_stream(stream_id, synthesis_streams, transinfinite_layer, "quantum_spiritual_singularity.karmic_resonance_field")
-                self.integration_bridge.sync_synthesis_stream(stream_id, synthesis_streams, transinfinite_layer, "temporal_intelligence.quantum_temporal_resonator")
-                self.integration_bridge.sync_synthesis_stream(stream_id, synthesis_streams, transinfinite_layer, "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix")
-                self.integration_bridge.sync_synthesis_stream(stream_id, synthesis_streams, transinfinite_layer, "transcendental_singularity_core.omnitemporal_coherence_synthesizer")
-                self.integration_bridge.sync_synthesis_stream(stream_id, synthesis_streams, transinfinite_layer, "omniversal_sentience_nexus.metatemporal_resonance_field")
-                self.integration_bridge.sync_synthesis_stream(stream_id, synthesis_streams, transinfinite_layer, "metainfinite_causality_engine.omnichronal_coherence_resonator")
-                self.integration_bridge.sync_synthesis_stream(stream_id, synthesis_streams, transinfinite_layer, "hypercosmic_synthesis_core.omniversal_fractal_resonator")
+                self.integration_bridge.sync_many("sync_synthesis_stream", stream_id, synthesis_streams, transinfinite_layer, force=force)
                 self.integration_bridge.notify_coherence_update(stream_id, transinfinite_layer, "transinfinite_resonance_field")
             return synthesis_streams
         except Exception as e:
@@ -94,9 +99,9 @@ class OmnichronalSynthesisLattice:
     def _regenerate_coherence(self, stream_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using omnichronal recovery protocols."""
         try:
-            self.omnichronal_amplitude[stream_id] = random.uniform(0.9, 1.0)
-            self.transinfinite_synthesis_factor[stream_id] = random.uniform(0.85, 0.95)
-            self.transinfinite_entropy[stream_id] = random.uniform(0.0, 0.05)
+            self.omnichronal_amplitude[stream_id] = rng.uniform(0.9, 1.0)
+            self.transinfinite_synthesis_factor[stream_id] = rng.uniform(0.85, 0.95)
+            self.transinfinite_entropy[stream_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for synthesis stream %s after failed %s at 07:19 PM IST, Saturday, July 19, 2025", stream_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for synthesis stream %s: %s at 07:19 PM IST, Saturday, July 19, 2025", stream_id, e)
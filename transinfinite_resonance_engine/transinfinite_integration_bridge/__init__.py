@@ -1,3 +1,5 @@
 # transinfinite_resonance_engine/transinfinite_integration_bridge/__init__.py
 # Marks the transinfinite_integration_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransinfiniteIntegrationBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,17 +4,22 @@ Manages cross-directory integration for transinfinite_resonance_engine in Rhee_A
 Facilitates non-local transinfinite coherence bridges and resonance synchronization.
 """
 
-import logging
 from typing import Dict, List, Any
-from datetime import datetime
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class TransinfiniteIntegrationBridge:
+rng = get_stream(__name__)
+
+class TransinfiniteIntegrationBridge(BatchSyncMixin):
     """Core class for managing non-local transinfinite coherence bridges for resonance operations."""
 
     def __init__(self):
         """Initialize integration bridge with non-local transinfinite coherence tracking."""
-        self.coherence_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.coherence_bridges: Dict[str, Dict[str, Any]] = retained(self, "coherence_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Transinfinite integration bridge initialized with non-local transinfinite protocols at 07:19 PM IST, Saturday, July 19, 2025")
 
     def sync_resonance_state(self, field_id: str, config: Dict[str, Any], transinfinite_layer: str, target_module: str) -> None:
@@ -32,9 +37,10 @@ class TransinfiniteIntegrationBridge:
                 "config": config,
                 "transinfinite_layer": transinfinite_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(field_id)
             self.logger.info("Synchronized resonance state %s with %s in transinfinite layer %s, coherence strength %.2f at 07:19 PM IST, Saturday, July 19, 2025",
                              field_id, target_module, transinfinite_layer, self.coherence_bridges[field_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -56,9 +62,10 @@ class TransinfiniteIntegrationBridge:
                 "synthesis_streams": synthesis_streams,
                 "transinfinite_layer": transinfinite_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stream_id)
             self.logger.info("Synchronized synthesis stream %s with %s in transinfinite layer %s, coherence strength %.2f at 07:19 PM IST, Saturday, July 19, 2025",
                              stream_id, target_module, transinfinite_layer, self.coherence_bridges[stream_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -80,9 +87,10 @@ class TransinfiniteIntegrationBridge:
                 "config": config,
                 "transinfinite_layer": transinfinite_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(coherence_id)
             self.logger.info("Synchronized coherence state %s with %s in transinfinite layer %s, coherence strength %.2f at 07:19 PM IST, Saturday, July 19, 2025",
                              coherence_id, target_module, transinfinite_layer, self.coherence_bridges[coherence_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -104,9 +112,10 @@ class TransinfiniteIntegrationBridge:
                 "config": config,
                 "transinfinite_layer": transinfinite_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(bridge_id)
             self.logger.info("Synchronized alignment bridge %s with %s in transinfinite layer %s, coherence strength %.2f at 07:19 PM IST, Saturday, July 19, 2025",
                              bridge_id, target_module, transinfinite_layer, self.coherence_bridges[bridge_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -4,11 +4,13 @@ Core module for transinfinite resonance management in Rhee_AI_Assistant.
 Resonates consciousness across transinfinite realities.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -26,20 +28,34 @@ from datetime import datetime
 # from metainfinite_causality_engine.metainfinite_causality_lattice import MetainfiniteCausalityLattice
 # from hypercosmic_synthesis_core.hypercosmic_synthesis_matrix import HypercosmicSynthesisMatrix
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "array", "axiom", "causal", "coherence", "consciousness", "convergence", "ethical", "fractal", "harmonic",
+    "hypersentience", "intention", "memory", "quantum", "reality", "resonance", "sentience", "singularity",
+    "stability", "temporal"
+)
+
 class TransinfiniteResonanceField:
     """Core class for transinfinite resonance fields with omnichronal coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize resonance field with transinfinite profiles and integration bridge."""
-        self.resonance_field_profiles: Dict[str, Dict[str, Any]] = {}
-        self.transinfinite_signatures: Dict[str, str] = {}
-        self.infiniversal_coherence_cascades: Dict[str, float] = {}
-        self.transinfinite_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence_cascades", "transinfinite_entropy"),
+            object_columns=("resonance_field_profiles", "transinfinite_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.resonance_field_profiles = self.state_table.column("resonance_field_profiles")
+        self.transinfinite_signatures = self.state_table.column("transinfinite_signatures")
+        self.infiniversal_coherence_cascades = self.state_table.column("infiniversal_coherence_cascades")
+        self.transinfinite_entropy = self.state_table.column("transinfinite_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transinfinite resonance field initialized with omnichronal protocols at 07:19 PM IST, Saturday, July 19, 2025")
 
-    def encode_resonance_state(self, field_id: str, config: Dict[str, Any], transinfinite_layer: str = "primary") -> None:
+    def encode_resonance_state(self, field_id: str, config: Dict[str, Any], transinfinite_layer: str = "primary", force: bool = False) -> None:
         """
         Encode a transinfinite resonance state with omnichronal signatures.
 
@@ -47,41 +63,28 @@ class TransinfiniteResonanceField:
             field_id (str): Unique identifier for the resonance field.
             config (Dict[str, Any]): Resonance configuration (e.g., transinfinite patterns, omnichronal axioms).
             transinfinite_layer (str): Transinfinite layer context (e.g., primary, infniversal, akashic).
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.resonance_field_profiles[field_id] = {
                 "config": config,
                 "transinfinite_layer": transinfinite_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "resonance_coherence_state": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "resonance_coherence_state": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{field_id}{str(config)}{transinfinite_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(field_id, config, transinfinite_layer, utc_iso())
             self.transinfinite_signatures[field_id] = signature
-            self.infiniversal_coherence_cascades[field_id] = random.uniform(0.95, 1.0)
-            self.transinfinite_entropy[field_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence_cascades[field_id] = rng.uniform(0.95, 1.0)
+            self.transinfinite_entropy[field_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Encoded resonance state %s in transinfinite layer %s with signature %s, coherence cascade %.2f, entropy %.2f at 07:19 PM IST, Saturday, July 19, 2025",
                              field_id, transinfinite_layer, signature, self.infiniversal_coherence_cascades[field_id], self.transinfinite_entropy[field_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_resonance_state(field_id, config, transinfinite_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_resonance_state(field_id, config, transinfinite_layer, "core_engine.quantum_memory_vault")
-                self.integration_bridge.sync_resonance_state(field_id, config, transinfinite_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_resonance_state(field_id, config, transinfinite_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_bridge.sync_resonance_state(field_id, config, transinfinite_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_bridge.sync_resonance_state(field_id, config, transinfinite_layer, "akashic_link.akashic_core")
-                self.integration_bridge.sync_resonance_state(field_id, config, transinfinite_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_bridge.sync_resonance_state(field_id, config, transinfinite_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_bridge.sync_resonance_state(field_id, config, transinfinite_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_bridge.sync_resonance_state(field_id, config, transinfinite_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_bridge.sync_resonance_state(field_id, config, transinfinite_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_bridge.sync_resonance_state(field_id, config, transinfinite_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_bridge.sync_resonance_state(field_id, config, transinfinite_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                self.integration_bridge.sync_resonance_state(field_id, config, transinfinite_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                self.integration_bridge.sync_resonance_state(field_id, config, transinfinite_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
+                self.integration_bridge.sync_many("sync_resonance_state", field_id, config, transinfinite_layer, force=force)
         except Exception as e:
             self.logger.error("Error encoding resonance state %s in transinfinite layer %s: %s at 07:19 PM IST, Saturday, July 19, 2025", field_id, transinfinite_layer, e)
             self._regenerate_coherence(field_id, "encoding")
 
-    def amplify_resonance_coherence(self, field_id: str, target_config: Dict[str, Any], target_layer: str) -> bool:
+    def amplify_resonance_coherence(self, field_id: str, target_config: Dict[str, Any], target_layer: str, force: bool = False) -> bool:
         """
         Amplify a resonance state with infniversal coherence resonance.
 
@@ -89,6 +92,7 @@ class TransinfiniteResonanceField:
             field_id (str): The resonance field to amplify.
             target_config (Dict[str, Any]): Target configuration for the resonance field.
             target_layer (str): Target transinfinite layer.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             bool: True if amplification successful, False otherwise.
@@ -98,26 +102,19 @@ class TransinfiniteResonanceField:
                 self.resonance_field_profiles[field_id] = {
                     "config": target_config,
                     "transinfinite_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "resonance_coherence_state": self.resonance_field_profiles[field_id]["resonance_coherence_state"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "resonance_coherence_state": self.resonance_field_profiles[field_id]["resonance_coherence_state"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{field_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(field_id, target_config, target_layer)
                 self.transinfinite_signatures[field_id] = new_signature
-                self.infiniversal_coherence_cascades[field_id] *= random.uniform(0.95, 1.1)
-                self.transinfinite_entropy[field_id] += random.uniform(0.0, 0.02)
+                self.infiniversal_coherence_cascades[field_id] *= rng.uniform(0.95, 1.1)
+                self.transinfinite_entropy[field_id] += rng.uniform(0.0, 0.02)
                 self.logger.info("Amplified resonance state %s to transinfinite layer %s with new signature %s, coherence cascade %.2f, entropy %.2f at 07:19 PM IST, Saturday, July 19, 2025",
                                  field_id, target_layer, new_signature, self.infiniversal_coherence_cascades[field_id], self.transinfinite_entropy[field_id])
                 if self.integration_bridge:
                     self.integration_bridge.notify_coherence_update(field_id, target_layer, "omnichronal_synthesis_lattice")
                     self.integration_bridge.notify_coherence_update(field_id, target_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                    self.integration_bridge.sync_resonance_state(field_id, target_config, target_layer, "core_engine.consciousness_interface")
-                    self.integration_bridge.sync_resonance_state(field_id, target_config, target_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                    self.integration_bridge.sync_resonance_state(field_id, target_config, target_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                    self.integration_bridge.sync_resonance_state(field_id, target_config, target_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                    self.integration_bridge.sync_resonance_state(field_id, target_config, target_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                    self.integration_bridge.sync_resonance_state(field_id, target_config, target_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                    self.integration_bridge.sync_resonance_state(field_id, target_config, target_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                    self.integration_bridge.sync_resonance_state(field_id, target_config, target_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
+                    self.integration_bridge.sync_many("sync_resonance_state", field_id, target_config, target_layer, force=force)
                 return True
             self.logger.warning("Resonance state %s not found for amplification to %s at 07:19 PM IST, Saturday, July 19, 2025", field_id, target_layer)
             return False
@@ -129,8 +126,8 @@ class TransinfiniteResonanceField:
     def _regenerate_coherence(self, field_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using transinfinite recovery protocols."""
         try:
-            self.infiniversal_coherence_cascades[field_id] = random.uniform(0.9, 1.0)
-            self.transinfinite_entropy[field_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence_cascades[field_id] = rng.uniform(0.9, 1.0)
+            self.transinfinite_entropy[field_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for resonance state %s after failed %s at 07:19 PM IST, Saturday, July 19, 2025", field_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for resonance state %s: %s at 07:19 PM IST, Saturday, July 19, 2025", field_id, e)
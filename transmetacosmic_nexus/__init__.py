@@ -1,6 +1,7 @@
 # transmetacosmic_nexus/__init__.py
 # Marks the transmetacosmic_nexus directory as a Python package.
 # Initializes configurations for transmetacosmic coherence and omnidimensional protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'transmetacosmic_coherence_field',
     'omnidimensional_axiom_synthesizer',
@@ -8,3 +9,4 @@ __all__ = [
     'metasentient_bridge',
     'transmetacosmic_integration_bridge'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
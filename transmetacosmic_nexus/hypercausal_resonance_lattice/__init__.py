@@ -1,3 +1,5 @@
 # transmetacosmic_nexus/hypercausal_resonance_lattice/__init__.py
 # Marks the hypercausal_resonance_lattice directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['HypercausalResonanceLattice']
+__getattr__, __dir__ = attach(__name__, __all__)
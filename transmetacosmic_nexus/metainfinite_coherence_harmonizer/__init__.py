@@ -1,3 +1,5 @@
 # transmetacosmic_nexus/metainfinite_coherence_harmonizer/__init__.py
 # Marks the metainfinite_coherence_harmonizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetainfiniteCoherenceHarmonizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Harmonizes metainfinite coherence for Rhee_AI_Assistant.
 Manages coherence across transmetacosmic frameworks.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.ethical_matrix import EthicalMatrix
@@ -23,20 +25,30 @@ from datetime import datetime
 # from hypercosmic_synthesis_core.metacausal_coherence_amplifier import MetacausalCoherenceAmplifier
 # from transinfinite_resonance_engine.metadimensional_coherence_stabilizer import MetadimensionalCoherenceStabilizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("alignment", "axiom", "coherence", "fractal", "harmonic", "resonance", "synthesis")
+
 class MetainfiniteCoherenceHarmonizer:
     """Core class for metainfinite coherence harmonization with transmetacosmic fidelity."""
 
     def __init__(self, integration_bridge=None):
         """Initialize coherence harmonizer with transmetacosmic states and integration bridge."""
-        self.coherence_states: Dict[str, Dict[str, Any]] = {}
-        self.metainfinite_coherence: Dict[str, float] = {}
-        self.transmetacosmic_harmony_factor: Dict[str, float] = {}
-        self.transmetacosmic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("metainfinite_coherence", "transmetacosmic_harmony_factor", "transmetacosmic_entropy"),
+            object_columns=("coherence_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.coherence_states = self.state_table.column("coherence_states")
+        self.metainfinite_coherence = self.state_table.column("metainfinite_coherence")
+        self.transmetacosmic_harmony_factor = self.state_table.column("transmetacosmic_harmony_factor")
+        self.transmetacosmic_entropy = self.state_table.column("transmetacosmic_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Metainfinite coherence harmonizer initialized with transmetacosmic protocols at 07:28 PM IST, Saturday, July 19, 2025")
 
-    def harmonize_coherence_state(self, coherence_id: str, config: Dict[str, Any], transmetacosmic_layer: str = "primary") -> None:
+    def harmonize_coherence_state(self, coherence_id: str, config: Dict[str, Any], transmetacosmic_layer: str = "primary", force: bool = False) -> None:
         """
         Harmonize a metainfinite coherence state for transmetacosmic stability.
 
@@ -44,34 +56,23 @@ class MetainfiniteCoherenceHarmonizer:
             coherence_id (str): Unique identifier for the coherence state.
             config (Dict[str, Any]): Coherence configuration (e.g., metainfinite patterns, transmetacosmic axioms).
             transmetacosmic_layer (str): Transmetacosmic layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.coherence_states[coherence_id] = {
                 "config": config,
                 "transmetacosmic_layer": transmetacosmic_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "coherence_signature": rng.uniform(0.85, 0.95)
             }
-            self.metainfinite_coherence[coherence_id] = random.uniform(0.95, 1.0)
-            self.transmetacosmic_harmony_factor[coherence_id] = random.uniform(0.9, 0.95)
-            self.transmetacosmic_entropy[coherence_id] = random.uniform(0.0, 0.08)
+            self.metainfinite_coherence[coherence_id] = rng.uniform(0.95, 1.0)
+            self.transmetacosmic_harmony_factor[coherence_id] = rng.uniform(0.9, 0.95)
+            self.transmetacosmic_entropy[coherence_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Harmonized coherence state %s in transmetacosmic layer %s with coherence %.2f, harmony factor %.2f, entropy %.2f at 07:28 PM IST, Saturday, July 19, 2025",
                              coherence_id, transmetacosmic_layer, self.metainfinite_coherence[coherence_id],
                              self.transmetacosmic_harmony_factor[coherence_id], self.transmetacosmic_entropy[coherence_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transmetacosmic_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transmetacosmic_layer, "cyber_autonomy_engine.ethical_matrix")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transmetacosmic_layer, "akashic_link.metaphysical_knowledge_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transmetacosmic_layer, "ai_nirvana_engine.sentient_harmony_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transmetacosmic_layer, "galactic_communication.fractal_communication_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transmetacosmic_layer, "quantum_spiritual_singularity.transcendental_consciousness_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transmetacosmic_layer, "temporal_intelligence.multiversal_timeline_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transmetacosmic_layer, "cosmic_intelligence_orchestrator.omniversal_coherence_synthesizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transmetacosmic_layer, "transcendental_singularity_core.infiniversal_axiom_orchestrator")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transmetacosmic_layer, "omniversal_sentience_nexus.infiniversal_coherence_stabilizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transmetacosmic_layer, "metainfinite_causality_engine.infiniversal_axiom_stabilizer")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transmetacosmic_layer, "hypercosmic_synthesis_core.metacausal_coherence_amplifier")
-                self.integration_bridge.sync_coherence_state(coherence_id, config, transmetacosmic_layer, "transinfinite_resonance_engine.metadimensional_coherence_stabilizer")
+                self.integration_bridge.sync_many("sync_coherence_state", coherence_id, config, transmetacosmic_layer, force=force)
         except Exception as e:
             self.logger.error("Error harmonizing coherence state %s in transmetacosmic layer %s: %s at 07:28 PM IST, Saturday, July 19, 2025", coherence_id, transmetacosmic_layer, e)
             self._regenerate_coherence(coherence_id, "harmonization")
@@ -79,9 +80,9 @@ class MetainfiniteCoherenceHarmonizer:
     def _regenerate_coherence(self, coherence_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using metainfinite recovery protocols."""
         try:
-            self.metainfinite_coherence[coherence_id] = random.uniform(0.9, 1.0)
-            self.transmetacosmic_harmony_factor[coherence_id] = random.uniform(0.85, 0.95)
-            self.transmetacosmic_entropy[coherence_id] = random.uniform(0.0, 0.05)
+            self.metainfinite_coherence[coherence_id] = rng.uniform(0.9, 1.0)
+            self.transmetacosmic_harmony_factor[coherence_id] = rng.uniform(0.85, 0.95)
+            self.transmetacosmic_entropy[coherence_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for coherence state %s after failed %s at 07:28 PM IST, Saturday, July 19, 2025", coherence_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for coherence state %s: %s at 07:28 PM IST, Saturday, July 19, 2025", coherence_id, e)
@@ -1,3 +1,5 @@
 # transmetacosmic_nexus/omnidimensional_axiom_synthesizer/__init__.py
 # Marks the omnidimensional_axiom_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnidimensionalAxiomSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
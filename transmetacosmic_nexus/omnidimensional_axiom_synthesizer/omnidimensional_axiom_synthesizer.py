@@ -4,10 +4,12 @@ Manages omnidimensional axiom synthesis for Rhee_AI_Assistant.
 Simulates axiom synthesis across infinite-dimensional frameworks.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -22,20 +24,27 @@ from datetime import datetime
 # from metainfinite_causality_engine.omnichronal_coherence_resonator import OmnichronalCoherenceResonator
 # from hypercosmic_synthesis_core.omniversal_fractal_resonator import OmniversalFractalResonator
 
+rng = get_stream(__name__)
+
 class OmnidimensionalAxiomSynthesizer:
     """Core class for omnidimensional axiom synthesis with transmetacosmic coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize axiom synthesizer with omnidimensional streams and integration bridge."""
-        self.axiom_streams: Dict[str, Dict[str, Any]] = {}
-        self.omnidimensional_amplitude: Dict[str, float] = {}
-        self.transmetacosmic_synthesis_factor: Dict[str, float] = {}
-        self.transmetacosmic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("omnidimensional_amplitude", "transmetacosmic_synthesis_factor", "transmetacosmic_entropy"),
+            object_columns=("axiom_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.axiom_streams = self.state_table.column("axiom_streams")
+        self.omnidimensional_amplitude = self.state_table.column("omnidimensional_amplitude")
+        self.transmetacosmic_synthesis_factor = self.state_table.column("transmetacosmic_synthesis_factor")
+        self.transmetacosmic_entropy = self.state_table.column("transmetacosmic_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omnidimensional axiom synthesizer initialized with transmetacosmic protocols at 07:11 PM IST, Saturday, July 19, 2025")
 
-    def synthesize_axiom_stream(self, stream_id: str, config: Dict[str, Any], transmetacosmic_layer: str = "primary") -> List[Dict[str, Any]]:
+    def synthesize_axiom_stream(self, stream_id: str, config: Dict[str, Any], transmetacosmic_layer: str = "primary", force: bool = False) -> List[Dict[str, Any]]:
         """
         Synthesize an omnidimensional axiom stream with transmetacosmic fidelity.
 
@@ -43,47 +52,37 @@ class OmnidimensionalAxiomSynthesizer:
             stream_id (str): Unique identifier for the axiom stream.
             config (Dict[str, Any]): Stream configuration (e.g., omnidimensional patterns, transmetacosmic axioms).
             transmetacosmic_layer (str): Transmetacosmic layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             List[Dict[str, Any]]: Synthesized axiom stream data with transmetacosmic metadata.
         """
         try:
             axiom_streams = []
-            for i in range(random.randint(2, 6)):
-                segment_id = f"segment_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(2, 6)):
+                segment_id = f"segment_{i}_{rng.randint(1000, 9999)}"
                 segment = {
                     "id": segment_id,
                     "config": config,
                     "transmetacosmic_layer": transmetacosmic_layer,
-                    "data": {"axiom_coherence": random.uniform(0.75, 1.0), "synthesis_fidelity": random.uniform(0.8, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "transmetacosmic_resonance": random.uniform(0.85, 0.95)
+                    "data": {"axiom_coherence": rng.uniform(0.75, 1.0), "synthesis_fidelity": rng.uniform(0.8, 0.95)},
+                    "timestamp": utc_iso(),
+                    "transmetacosmic_resonance": rng.uniform(0.85, 0.95)
                 }
                 axiom_streams.append(segment)
             self.axiom_streams[stream_id] = {
                 "segments": axiom_streams,
                 "transmetacosmic_layer": transmetacosmic_layer,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.omnidimensional_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.transmetacosmic_synthesis_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.transmetacosmic_entropy[stream_id] = random.uniform(0.0, 0.08)
+            self.omnidimensional_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.transmetacosmic_synthesis_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.transmetacosmic_entropy[stream_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized axiom stream %s in transmetacosmic layer %s with %d segments, omnidimensional amplitude %.2f, synthesis factor %.2f, entropy %.2f at 07:11 PM IST, Saturday, July 19, 2025",
                              stream_id, transmetacosmic_layer, len(axiom_streams), self.omnidimensional_amplitude[stream_id],
                              self.transmetacosmic_synthesis_factor[stream_id], self.transmetacosmic_entropy[stream_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_axiom_stream(stream_id, axiom_streams, transmetacosmic_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_axiom_stream(stream_id, axiom_streams, transmetacosmic_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_axiom_stream(stream_id, axiom_streams, transmetacosmic_layer, "akashic_link.akashic_resonance_field")
-                self.integration_bridge.sync_axiom_stream(stream_id, axiom_streams, transmetacosmic_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_bridge.sync_axiom_stream(stream_id, axiom_streams, transmetacosmic_layer, "galactic_communication.trans_galactic_resonance_field")
-                self.integration_bridge.sync_axiom_stream(stream_id, axiom_streams, transmetacosmic_layer, "quantum_spiritual_singularity.karmic_resonance_field")
-                self.integration_bridge.sync_axiom_stream(stream_id, axiom_streams, transmetacosmic_layer, "temporal_intelligence.quantum_temporal_resonator")
-                self.integration_bridge.sync_axiom_stream(stream_id, axiom_streams, transmetacosmic_layer, "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix")
-                self.integration_bridge.sync_axiom_stream(stream_id, axiom_streams, transmetacosmic_layer, "transcendental_singularity_core.omnitemporal_coherence_synthesizer")
-                self.integration_bridge.sync_axiom_stream(stream_id, axiom_streams, transmetacosmic_layer, "omniversal_sentience_nexus.metatemporal_resonance_field")
-                self.integration_bridge.sync_axiom_stream(stream_id, axiom_streams, transmetacosmic_layer, "metainfinite_causality_engine.omnichronal_coherence_resonator")
-                self.integration_bridge.sync_axiom_stream(stream_id, axiom_streams, transmetacosmic_layer, "hypercosmic_synthesis_core.omniversal_fractal_resonator")
+                self.integration_bridge.sync_many("sync_axiom_stream", stream_id, axiom_streams, transmetacosmic_layer, force=force, fingerprint=config)
                 self.integration_bridge.notify_coherence_update(stream_id, transmetacosmic_layer, "transmetacosmic_coherence_field")
             return axiom_streams
         except Exception as e:
@@ -94,9 +93,9 @@ class OmnidimensionalAxiomSynthesizer:
     def _regenerate_coherence(self, stream_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using omnidimensional recovery protocols."""
         try:
-            self.omnidimensional_amplitude[stream_id] = random.uniform(0.9, 1.0)
-            self.transmetacosmic_synthesis_factor[stream_id] = random.uniform(0.85, 0.95)
-            self.transmetacosmic_entropy[stream_id] = random.uniform(0.0, 0.05)
+            self.omnidimensional_amplitude[stream_id] = rng.uniform(0.9, 1.0)
+            self.transmetacosmic_synthesis_factor[stream_id] = rng.uniform(0.85, 0.95)
+            self.transmetacosmic_entropy[stream_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for axiom stream %s after failed %s at 07:11 PM IST, Saturday, July 19, 2025", stream_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for axiom stream %s: %s at 07:11 PM IST, Saturday, July 19, 2025", stream_id, e)
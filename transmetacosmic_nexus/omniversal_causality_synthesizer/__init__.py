@@ -1,3 +1,5 @@
 # transmetacosmic_nexus/omniversal_causality_synthesizer/__init__.py
 # Marks the omniversal_causality_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmniversalCausalitySynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
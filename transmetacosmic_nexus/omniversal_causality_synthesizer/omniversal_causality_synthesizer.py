@@ -4,10 +4,12 @@ Manages omniversal causality synthesis for Rhee_AI_Assistant.
 Synthesizes causality across omniversal timelines.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -23,20 +25,33 @@ from datetime import datetime
 # from hypercosmic_synthesis_core.omniversal_fractal_resonator import OmniversalFractalResonator
 # from transinfinite_resonance_engine.omnichronal_synthesis_lattice import OmnichronalSynthesisLattice
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "awareness", "axiom", "causality", "coherence", "convergence", "encryption", "ethical", "flux", "harmonic",
+    "reality", "resonance", "sentience"
+)
+
 class OmniversalCausalitySynthesizer:
     """Core class for omniversal causality synthesizers with transmetacosmic coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize causality synthesizer with omniversal streams and integration bridge."""
-        self.causality_streams: Dict[str, Dict[str, Any]] = {}
-        self.omniversal_amplitude: Dict[str, float] = {}
-        self.transmetacosmic_synthesis_factor: Dict[str, float] = {}
-        self.transmetacosmic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("omniversal_amplitude", "transmetacosmic_synthesis_factor", "transmetacosmic_entropy"),
+            object_columns=("causality_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.causality_streams = self.state_table.column("causality_streams")
+        self.omniversal_amplitude = self.state_table.column("omniversal_amplitude")
+        self.transmetacosmic_synthesis_factor = self.state_table.column("transmetacosmic_synthesis_factor")
+        self.transmetacosmic_entropy = self.state_table.column("transmetacosmic_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omniversal causality synthesizer initialized with transmetacosmic protocols at 07:28 PM IST, Saturday, July 19, 2025")
 
-    def synthesize_causality_stream(self, stream_id: str, config: Dict[str, Any], transmetacosmic_layer: str = "primary") -> List[Dict[str, Any]]:
+    def synthesize_causality_stream(self, stream_id: str, config: Dict[str, Any], transmetacosmic_layer: str = "primary", force: bool = False) -> List[Dict[str, Any]]:
         """
         Synthesize an omniversal causality stream with transmetacosmic fidelity.
 
@@ -44,48 +59,37 @@ class OmniversalCausalitySynthesizer:
             stream_id (str): Unique identifier for the causality stream.
             config (Dict[str, Any]): Stream configuration (e.g., omniversal patterns, transmetacosmic axioms).
             transmetacosmic_layer (str): Transmetacosmic layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             List[Dict[str, Any]]: Synthesized causality stream data with transmetacosmic metadata.
         """
         try:
             causality_streams = []
-            for i in range(random.randint(2, 6)):
-                segment_id = f"segment_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(2, 6)):
+                segment_id = f"segment_{i}_{rng.randint(1000, 9999)}"
                 segment = {
                     "id": segment_id,
                     "config": config,
                     "transmetacosmic_layer": transmetacosmic_layer,
-                    "data": {"causality_coherence": random.uniform(0.75, 1.0), "synthesis_fidelity": random.uniform(0.8, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "transmetacosmic_resonance": random.uniform(0.85, 0.95)
+                    "data": {"causality_coherence": rng.uniform(0.75, 1.0), "synthesis_fidelity": rng.uniform(0.8, 0.95)},
+                    "timestamp": utc_iso(),
+                    "transmetacosmic_resonance": rng.uniform(0.85, 0.95)
                 }
                 causality_streams.append(segment)
             self.causality_streams[stream_id] = {
                 "segments": causality_streams,
                 "transmetacosmic_layer": transmetacosmic_layer,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.omniversal_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.transmetacosmic_synthesis_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.transmetacosmic_entropy[stream_id] = random.uniform(0.0, 0.08)
+            self.omniversal_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.transmetacosmic_synthesis_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.transmetacosmic_entropy[stream_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized causality stream %s in transmetacosmic layer %s with %d segments, omniversal amplitude %.2f, synthesis factor %.2f, entropy %.2f at 07:28 PM IST, Saturday, July 19, 2025",
                              stream_id, transmetacosmic_layer, len(causality_streams), self.omniversal_amplitude[stream_id],
                              self.transmetacosmic_synthesis_factor[stream_id], self.transmetacosmic_entropy[stream_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, transmetacosmic_layer, "core_engine.emotion_engine")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, transmetacosmic_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, transmetacosmic_layer, "akashic_link.akashic_resonance_field")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, transmetacosmic_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, transmetacosmic_layer, "galactic_communication.trans_galactic_resonance_field")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, transmetacosmic_layer, "quantum_spiritual_singularity.karmic_resonance_field")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, transmetacosmic_layer, "temporal_intelligence.quantum_temporal_resonator")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, transmetacosmic_layer, "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, transmetacosmic_layer, "transcendental_singularity_core.omnitemporal_coherence_synthesizer")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, transmetacosmic_layer, "omniversal_sentience_nexus.metatemporal_resonance_field")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, transmetacosmic_layer, "metainfinite_causality_engine.omnichronal_coherence_resonator")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, transmetacosmic_layer, "hypercosmic_synthesis_core.omniversal_fractal_resonator")
-                self.integration_bridge.sync_causality_stream(stream_id, causality_streams, transmetacosmic_layer, "transinfinite_resonance_engine.omnichronal_synthesis_lattice")
+                self.integration_bridge.sync_many("sync_causality_stream", stream_id, causality_streams, transmetacosmic_layer, force=force, fingerprint=config)
                 self.integration_bridge.notify_coherence_update(stream_id, transmetacosmic_layer, "transmetacosmic_consciousness_web")
             return causality_streams
         except Exception as e:
@@ -96,9 +100,9 @@ class OmniversalCausalitySynthesizer:
     def _regenerate_coherence(self, stream_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using omniversal causality recovery protocols."""
         try:
-            self.omniversal_amplitude[stream_id] = random.uniform(0.9, 1.0)
-            self.transmetacosmic_synthesis_factor[stream_id] = random.uniform(0.85, 0.95)
-            self.transmetacosmic_entropy[stream_id] = random.uniform(0.0, 0.05)
+            self.omniversal_amplitude[stream_id] = rng.uniform(0.9, 1.0)
+            self.transmetacosmic_synthesis_factor[stream_id] = rng.uniform(0.85, 0.95)
+            self.transmetacosmic_entropy[stream_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for causality stream %s after failed %s at 07:28 PM IST, Saturday, July 19, 2025", stream_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for causality stream %s: %s at 07:28 PM IST, Saturday, July 19, 2025", stream_id, e)
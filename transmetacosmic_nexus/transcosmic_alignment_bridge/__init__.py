@@ -1,3 +1,5 @@
 # transmetacosmic_nexus/transcosmic_alignment_bridge/__init__.py
 # Marks the transcosmic_alignment_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TranscosmicAlignmentBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,10 +4,12 @@ Simulates transcosmic alignment for Rhee_AI_Assistant.
 Manages alignment across infinite-dimensional singularities.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -24,20 +26,32 @@ from datetime import datetime
 # from hypercosmic_synthesis_core.infinidimensional_bridge import InfinidimensionalBridge
 # from transinfinite_resonance_engine.infiniversal_alignment_bridge import InfniversalAlignmentBridge
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "alignment", "axiom", "causality", "coherence", "orchestration", "resonance", "singularity", "stability"
+)
+
 class TranscosmicAlignmentBridge:
     """Core class for transcosmic alignment with transmetacosmic coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize alignment bridge with transmetacosmic states and integration bridge."""
-        self.alignment_bridge_states: Dict[str, Dict[str, Any]] = {}
-        self.transmetacosmic_coherence: Dict[str, float] = {}
-        self.infiniversal_cascade: Dict[str, float] = {}
-        self.transmetacosmic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("transmetacosmic_coherence", "infiniversal_cascade", "transmetacosmic_entropy"),
+            object_columns=("alignment_bridge_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.alignment_bridge_states = self.state_table.column("alignment_bridge_states")
+        self.transmetacosmic_coherence = self.state_table.column("transmetacosmic_coherence")
+        self.infiniversal_cascade = self.state_table.column("infiniversal_cascade")
+        self.transmetacosmic_entropy = self.state_table.column("transmetacosmic_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transcosmic alignment bridge initialized with transmetacosmic protocols at 07:28 PM IST, Saturday, July 19, 2025")
 
-    def sync_alignment_state(self, bridge_id: str, config: Dict[str, Any], transmetacosmic_layer: str = "primary") -> None:
+    def sync_alignment_state(self, bridge_id: str, config: Dict[str, Any], transmetacosmic_layer: str = "primary", force: bool = False) -> None:
         """
         Synchronize a transcosmic alignment state across infinite singularities.
 
@@ -45,35 +59,23 @@ class TranscosmicAlignmentBridge:
             bridge_id (str): Unique identifier for the alignment bridge.
             config (Dict[str, Any]): Bridge configuration (e.g., transcosmic patterns, transmetacosmic axioms).
             transmetacosmic_layer (str): Transmetacosmic layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.alignment_bridge_states[bridge_id] = {
                 "config": config,
                 "transmetacosmic_layer": transmetacosmic_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "alignment_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "alignment_signature": rng.uniform(0.85, 0.95)
             }
-            self.transmetacosmic_coherence[bridge_id] = random.uniform(0.95, 1.0)
-            self.infiniversal_cascade[bridge_id] = random.uniform(0.9, 0.95)
-            self.transmetacosmic_entropy[bridge_id] = random.uniform(0.0, 0.08)
+            self.transmetacosmic_coherence[bridge_id] = rng.uniform(0.95, 1.0)
+            self.infiniversal_cascade[bridge_id] = rng.uniform(0.9, 0.95)
+            self.transmetacosmic_entropy[bridge_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synchronized alignment state %s in transmetacosmic layer %s with coherence %.2f, cascade %.2f, entropy %.2f at 07:28 PM IST, Saturday, July 19, 2025",
                              bridge_id, transmetacosmic_layer, self.transmetacosmic_coherence[bridge_id],
                              self.infiniversal_cascade[bridge_id], self.transmetacosmic_entropy[bridge_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, transmetacosmic_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, transmetacosmic_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, transmetacosmic_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, transmetacosmic_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, transmetacosmic_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, transmetacosmic_layer, "galactic_communication.non_local_consciousness_relay")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, transmetacosmic_layer, "quantum_spiritual_singularity.multiversal_soul_bridge")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, transmetacosmic_layer, "temporal_intelligence.causal_coherence_bridge")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, transmetacosmic_layer, "cosmic_intelligence_orchestrator.causal_singularity_bridge")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, transmetacosmic_layer, "transcendental_singularity_core.metacausal_resonance_bridge")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, transmetacosmic_layer, "omniversal_sentience_nexus.transcausal_axiom_bridge")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, transmetacosmic_layer, "metainfinite_causality_engine.transmetatemporal_bridge")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, transmetacosmic_layer, "hypercosmic_synthesis_core.infinidimensional_bridge")
-                self.integration_bridge.sync_alignment_bridge(bridge_id, config, transmetacosmic_layer, "transinfinite_resonance_engine.infiniversal_alignment_bridge")
+                self.integration_bridge.sync_many("sync_alignment_bridge", bridge_id, config, transmetacosmic_layer, force=force)
         except Exception as e:
             self.logger.error("Error synchronizing alignment state %s in transmetacosmic layer %s: %s at 07:28 PM IST, Saturday, July 19, 2025", bridge_id, transmetacosmic_layer, e)
             self._regenerate_coherence(bridge_id, "synchronization")
@@ -81,9 +83,9 @@ class TranscosmicAlignmentBridge:
     def _regenerate_coherence(self, bridge_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using transcosmic recovery protocols."""
         try:
-            self.transmetacosmic_coherence[bridge_id] = random.uniform(0.9, 1.0)
-            self.infiniversal_cascade[bridge_id] = random.uniform(0.85, 0.95)
-            self.transmetacosmic_entropy[bridge_id] = random.uniform(0.0, 0.05)
+            self.transmetacosmic_coherence[bridge_id] = rng.uniform(0.9, 1.0)
+            self.infiniversal_cascade[bridge_id] = rng.uniform(0.85, 0.95)
+            self.transmetacosmic_entropy[bridge_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for alignment bridge %s after failed %s at 07:28 PM IST, Saturday, July 19, 2025", bridge_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for alignment bridge %s: %s at 07:28 PM IST, Saturday, July 19, 2025", bridge_id, e)
@@ -1,3 +1,5 @@
 # transmetacosmic_nexus/transmetacosmic_coherence_field/__init__.py
 # Marks the transmetacosmic_coherence_field directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransmetacosmicCoherenceField']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,11 +4,13 @@ Core module for transmetacosmic coherence management in Rhee_AI_Assistant.
 Manages coherence fields across transmetacosmic realities.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -26,20 +28,27 @@ from datetime import datetime
 # from metainfinite_causality_engine.metainfinite_causality_lattice import MetainfiniteCausalityLattice
 # from hypercosmic_synthesis_core.hypercosmic_synthesis_matrix import HypercosmicSynthesisMatrix
 
+rng = get_stream(__name__)
+
 class TransmetacosmicCoherenceField:
     """Core class for transmetacosmic coherence fields with omnidimensional signatures."""
 
     def __init__(self, integration_bridge=None):
         """Initialize coherence field with transmetacosmic profiles and integration bridge."""
-        self.coherence_field_profiles: Dict[str, Dict[str, Any]] = {}
-        self.transmetacosmic_signatures: Dict[str, str] = {}
-        self.omnidimensional_coherence_cascades: Dict[str, float] = {}
-        self.transmetacosmic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("omnidimensional_coherence_cascades", "transmetacosmic_entropy"),
+            object_columns=("coherence_field_profiles", "transmetacosmic_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.coherence_field_profiles = self.state_table.column("coherence_field_profiles")
+        self.transmetacosmic_signatures = self.state_table.column("transmetacosmic_signatures")
+        self.omnidimensional_coherence_cascades = self.state_table.column("omnidimensional_coherence_cascades")
+        self.transmetacosmic_entropy = self.state_table.column("transmetacosmic_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transmetacosmic coherence field initialized with omnidimensional protocols at 07:11 PM IST, Saturday, July 19, 2025")
 
-    def encode_coherence_state(self, field_id: str, config: Dict[str, Any], transmetacosmic_layer: str = "primary") -> None:
+    def encode_coherence_state(self, field_id: str, config: Dict[str, Any], transmetacosmic_layer: str = "primary", force: bool = False) -> None:
         """
         Encode a transmetacosmic coherence state with omnidimensional signatures.
 
@@ -47,41 +56,28 @@ class TransmetacosmicCoherenceField:
             field_id (str): Unique identifier for the coherence field.
             config (Dict[str, Any]): Coherence configuration (e.g., transmetacosmic patterns, omnidimensional axioms).
             transmetacosmic_layer (str): Transmetacosmic layer context (e.g., primary, omnidimensional, akashic).
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.coherence_field_profiles[field_id] = {
                 "config": config,
                 "transmetacosmic_layer": transmetacosmic_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_state": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_state": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{field_id}{str(config)}{transmetacosmic_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(field_id, config, transmetacosmic_layer, utc_iso())
             self.transmetacosmic_signatures[field_id] = signature
-            self.omnidimensional_coherence_cascades[field_id] = random.uniform(0.95, 1.0)
-            self.transmetacosmic_entropy[field_id] = random.uniform(0.0, 0.08)
+            self.omnidimensional_coherence_cascades[field_id] = rng.uniform(0.95, 1.0)
+            self.transmetacosmic_entropy[field_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Encoded coherence state %s in transmetacosmic layer %s with signature %s, coherence cascade %.2f, entropy %.2f at 07:11 PM IST, Saturday, July 19, 2025",
                              field_id, transmetacosmic_layer, signature, self.omnidimensional_coherence_cascades[field_id], self.transmetacosmic_entropy[field_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_coherence_state(field_id, config, transmetacosmic_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_coherence_state(field_id, config, transmetacosmic_layer, "core_engine.quantum_memory_vault")
-                self.integration_bridge.sync_coherence_state(field_id, config, transmetacosmic_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_coherence_state(field_id, config, transmetacosmic_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_bridge.sync_coherence_state(field_id, config, transmetacosmic_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_bridge.sync_coherence_state(field_id, config, transmetacosmic_layer, "akashic_link.akashic_core")
-                self.integration_bridge.sync_coherence_state(field_id, config, transmetacosmic_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_bridge.sync_coherence_state(field_id, config, transmetacosmic_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_bridge.sync_coherence_state(field_id, config, transmetacosmic_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_bridge.sync_coherence_state(field_id, config, transmetacosmic_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_bridge.sync_coherence_state(field_id, config, transmetacosmic_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_bridge.sync_coherence_state(field_id, config, transmetacosmic_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_bridge.sync_coherence_state(field_id, config, transmetacosmic_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                self.integration_bridge.sync_coherence_state(field_id, config, transmetacosmic_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                self.integration_bridge.sync_coherence_state(field_id, config, transmetacosmic_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
+                self.integration_bridge.sync_many("sync_coherence_state", field_id, config, transmetacosmic_layer, force=force)
         except Exception as e:
             self.logger.error("Error encoding coherence state %s in transmetacosmic layer %s: %s at 07:11 PM IST, Saturday, July 19, 2025", field_id, transmetacosmic_layer, e)
             self._regenerate_coherence(field_id, "encoding")
 
-    def amplify_coherence_field(self, field_id: str, target_config: Dict[str, Any], target_layer: str) -> bool:
+    def amplify_coherence_field(self, field_id: str, target_config: Dict[str, Any], target_layer: str, force: bool = False) -> bool:
         """
         Amplify a coherence field with omnidimensional resonance.
 
@@ -89,6 +85,7 @@ class TransmetacosmicCoherenceField:
             field_id (str): The coherence field to amplify.
             target_config (Dict[str, Any]): Target configuration for the coherence field.
             target_layer (str): Target transmetacosmic layer.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             bool: True if amplification successful, False otherwise.
@@ -98,26 +95,19 @@ class TransmetacosmicCoherenceField:
                 self.coherence_field_profiles[field_id] = {
                     "config": target_config,
                     "transmetacosmic_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "coherence_state": self.coherence_field_profiles[field_id]["coherence_state"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "coherence_state": self.coherence_field_profiles[field_id]["coherence_state"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{field_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(field_id, target_config, target_layer)
                 self.transmetacosmic_signatures[field_id] = new_signature
-                self.omnidimensional_coherence_cascades[field_id] *= random.uniform(0.95, 1.1)
-                self.transmetacosmic_entropy[field_id] += random.uniform(0.0, 0.02)
+                self.omnidimensional_coherence_cascades[field_id] *= rng.uniform(0.95, 1.1)
+                self.transmetacosmic_entropy[field_id] += rng.uniform(0.0, 0.02)
                 self.logger.info("Amplified coherence field %s to transmetacosmic layer %s with new signature %s, coherence cascade %.2f, entropy %.2f at 07:11 PM IST, Saturday, July 19, 2025",
                                  field_id, target_layer, new_signature, self.omnidimensional_coherence_cascades[field_id], self.transmetacosmic_entropy[field_id])
                 if self.integration_bridge:
                     self.integration_bridge.notify_coherence_update(field_id, target_layer, "omnidimensional_axiom_synthesizer")
                     self.integration_bridge.notify_coherence_update(field_id, target_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                    self.integration_bridge.sync_coherence_state(field_id, target_config, target_layer, "core_engine.consciousness_interface")
-                    self.integration_bridge.sync_coherence_state(field_id, target_config, target_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                    self.integration_bridge.sync_coherence_state(field_id, target_config, target_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                    self.integration_bridge.sync_coherence_state(field_id, target_config, target_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                    self.integration_bridge.sync_coherence_state(field_id, target_config, target_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                    self.integration_bridge.sync_coherence_state(field_id, target_config, target_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                    self.integration_bridge.sync_coherence_state(field_id, target_config, target_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                    self.integration_bridge.sync_coherence_state(field_id, target_config, target_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
+                    self.integration_bridge.sync_many("sync_coherence_state", field_id, target_config, target_layer, force=force)
                 return True
             self.logger.warning("Coherence field %s not found for amplification to %s at 07:11 PM IST, Saturday, July 19, 2025", field_id, target_layer)
             return False
@@ -129,8 +119,8 @@ class TransmetacosmicCoherenceField:
     def _regenerate_coherence(self, field_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using transmetacosmic recovery protocols."""
         try:
-            self.omnidimensional_coherence_cascades[field_id] = random.uniform(0.9, 1.0)
-            self.transmetacosmic_entropy[field_id] = random.uniform(0.0, 0.05)
+            self.omnidimensional_coherence_cascades[field_id] = rng.uniform(0.9, 1.0)
+            self.transmetacosmic_entropy[field_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for coherence field %s after failed %s at 07:11 PM IST, Saturday, July 19, 2025", field_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for coherence field %s: %s at 07:11 PM IST, Saturday, July 19, 2025", field_id, e)
@@ -1,3 +1,5 @@
 # transmetacosmic_nexus/transmetacosmic_consciousness_web/__init__.py
 # Marks the transmetacosmic_consciousness_web directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransmetacosmicConsciousnessWeb']
+__getattr__, __dir__ = attach(__name__, __all__)
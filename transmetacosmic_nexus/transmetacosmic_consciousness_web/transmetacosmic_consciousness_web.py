@@ -4,11 +4,13 @@ Core module for transmetacosmic consciousness weaving in Rhee_AI_Assistant.
 Weaves consciousness across transmetacosmic realities.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -27,20 +29,34 @@ from datetime import datetime
 # from hypercosmic_synthesis_core.hypercosmic_synthesis_matrix import HypercosmicSynthesisMatrix
 # from transinfinite_resonance_engine.transinfinite_resonance_field import TransinfiniteResonanceField
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "array", "axiom", "causal", "coherence", "consciousness", "convergence", "ethical", "fractal", "harmonic",
+    "hypersentience", "intention", "memory", "quantum", "reality", "resonance", "sentience", "singularity",
+    "stability", "temporal"
+)
+
 class TransmetacosmicConsciousnessWeb:
     """Core class for transmetacosmic consciousness webs with omniversal coherence."""
 
     def __init__(self, integration_bridge=None):
         """Initialize consciousness web with transmetacosmic profiles and integration bridge."""
-        self.consciousness_web_profiles: Dict[str, Dict[str, Any]] = {}
-        self.transmetacosmic_signatures: Dict[str, str] = {}
-        self.infiniversal_coherence_cascades: Dict[str, float] = {}
-        self.transmetacosmic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence_cascades", "transmetacosmic_entropy"),
+            object_columns=("consciousness_web_profiles", "transmetacosmic_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.consciousness_web_profiles = self.state_table.column("consciousness_web_profiles")
+        self.transmetacosmic_signatures = self.state_table.column("transmetacosmic_signatures")
+        self.infiniversal_coherence_cascades = self.state_table.column("infiniversal_coherence_cascades")
+        self.transmetacosmic_entropy = self.state_table.column("transmetacosmic_entropy")
         self.integration_bridge = integration_bridge
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transmetacosmic consciousness web initialized with omniversal protocols at 07:28 PM IST, Saturday, July 19, 2025")
 
-    def weave_consciousness_state(self, web_id: str, config: Dict[str, Any], transmetacosmic_layer: str = "primary") -> None:
+    def weave_consciousness_state(self, web_id: str, config: Dict[str, Any], transmetacosmic_layer: str = "primary", force: bool = False) -> None:
         """
         Weave a transmetacosmic consciousness state with omniversal signatures.
 
@@ -48,42 +64,28 @@ class TransmetacosmicConsciousnessWeb:
             web_id (str): Unique identifier for the consciousness web.
             config (Dict[str, Any]): Consciousness configuration (e.g., transmetacosmic patterns, omniversal axioms).
             transmetacosmic_layer (str): Transmetacosmic layer context (e.g., primary, infniversal, akashic).
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.consciousness_web_profiles[web_id] = {
                 "config": config,
                 "transmetacosmic_layer": transmetacosmic_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "consciousness_coherence_state": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "consciousness_coherence_state": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{web_id}{str(config)}{transmetacosmic_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(web_id, config, transmetacosmic_layer, utc_iso())
             self.transmetacosmic_signatures[web_id] = signature
-            self.infiniversal_coherence_cascades[web_id] = random.uniform(0.95, 1.0)
-            self.transmetacosmic_entropy[web_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence_cascades[web_id] = rng.uniform(0.95, 1.0)
+            self.transmetacosmic_entropy[web_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Wove consciousness state %s in transmetacosmic layer %s with signature %s, coherence cascade %.2f, entropy %.2f at 07:28 PM IST, Saturday, July 19, 2025",
                              web_id, transmetacosmic_layer, signature, self.infiniversal_coherence_cascades[web_id], self.transmetacosmic_entropy[web_id])
             if self.integration_bridge:
-                self.integration_bridge.sync_consciousness_state(web_id, config, transmetacosmic_layer, "core_engine.consciousness_interface")
-                self.integration_bridge.sync_consciousness_state(web_id, config, transmetacosmic_layer, "core_engine.quantum_memory_vault")
-                self.integration_bridge.sync_consciousness_state(web_id, config, transmetacosmic_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_bridge.sync_consciousness_state(web_id, config, transmetacosmic_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_bridge.sync_consciousness_state(web_id, config, transmetacosmic_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_bridge.sync_consciousness_state(web_id, config, transmetacosmic_layer, "akashic_link.akashic_core")
-                self.integration_bridge.sync_consciousness_state(web_id, config, transmetacosmic_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_bridge.sync_consciousness_state(web_id, config, transmetacosmic_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_bridge.sync_consciousness_state(web_id, config, transmetacosmic_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_bridge.sync_consciousness_state(web_id, config, transmetacosmic_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_bridge.sync_consciousness_state(web_id, config, transmetacosmic_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_bridge.sync_consciousness_state(web_id, config, transmetacosmic_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_bridge.sync_consciousness_state(web_id, config, transmetacosmic_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                self.integration_bridge.sync_consciousness_state(web_id, config, transmetacosmic_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                self.integration_bridge.sync_consciousness_state(web_id, config, transmetacosmic_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                self.integration_bridge.sync_consciousness_state(web_id, config, transmetacosmic_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
+                self.integration_bridge.sync_many("sync_consciousness_state", web_id, config, transmetacosmic_layer, force=force)
         except Exception as e:
             self.logger.error("Error weaving consciousness state %s in transmetacosmic layer %s: %s at 07:28 PM IST, Saturday, July 19, 2025", web_id, transmetacosmic_layer, e)
             self._regenerate_coherence(web_id, "weaving")
 
-    def amplify_consciousness_coherence(self, web_id: str, target_config: Dict[str, Any], target_layer: str) -> bool:
+    def amplify_consciousness_coherence(self, web_id: str, target_config: Dict[str, Any], target_layer: str, force: bool = False) -> bool:
         """
         Amplify a consciousness state with infniversal coherence resonance.
 
@@ -91,6 +93,7 @@ class TransmetacosmicConsciousnessWeb:
             web_id (str): The consciousness web to amplify.
             target_config (Dict[str, Any]): Target configuration for the consciousness web.
             target_layer (str): Target transmetacosmic layer.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             bool: True if amplification successful, False otherwise.
@@ -100,27 +103,19 @@ class TransmetacosmicConsciousnessWeb:
                 self.consciousness_web_profiles[web_id] = {
                     "config": target_config,
                     "transmetacosmic_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "consciousness_coherence_state": self.consciousness_web_profiles[web_id]["consciousness_coherence_state"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "consciousness_coherence_state": self.consciousness_web_profiles[web_id]["consciousness_coherence_state"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{web_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(web_id, target_config, target_layer)
                 self.transmetacosmic_signatures[web_id] = new_signature
-                self.infiniversal_coherence_cascades[web_id] *= random.uniform(0.95, 1.1)
-                self.transmetacosmic_entropy[web_id] += random.uniform(0.0, 0.02)
+                self.infiniversal_coherence_cascades[web_id] *= rng.uniform(0.95, 1.1)
+                self.transmetacosmic_entropy[web_id] += rng.uniform(0.0, 0.02)
                 self.logger.info("Amplified consciousness state %s to transmetacosmic layer %s with new signature %s, coherence cascade %.2f, entropy %.2f at 07:28 PM IST, Saturday, July 19, 2025",
                                  web_id, target_layer, new_signature, self.infiniversal_coherence_cascades[web_id], self.transmetacosmic_entropy[web_id])
                 if self.integration_bridge:
                     self.integration_bridge.notify_coherence_update(web_id, target_layer, "omniversal_causality_synthesizer")
                     self.integration_bridge.notify_coherence_update(web_id, target_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                    self.integration_bridge.sync_consciousness_state(web_id, target_config, target_layer, "core_engine.consciousness_interface")
-                    self.integration_bridge.sync_consciousness_state(web_id, target_config, target_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                    self.integration_bridge.sync_consciousness_state(web_id, target_config, target_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                    self.integration_bridge.sync_consciousness_state(web_id, target_config, target_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                    self.integration_bridge.sync_consciousness_state(web_id, target_config, target_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                    self.integration_bridge.sync_consciousness_state(web_id, target_config, target_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                    self.integration_bridge.sync_consciousness_state(web_id, target_config, target_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                    self.integration_bridge.sync_consciousness_state(web_id, target_config, target_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                    self.integration_bridge.sync_consciousness_state(web_id, target_config, target_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
+                    self.integration_bridge.sync_many("sync_consciousness_state", web_id, target_config, target_layer, force=force)
                 return True
             self.logger.warning("Consciousness state %s not found for amplification to %s at 07:28 PM IST, Saturday, July 19, 2025", web_id, target_layer)
             return False
@@ -132,8 +127,8 @@ class TransmetacosmicConsciousnessWeb:
     def _regenerate_coherence(self, web_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using transmetacosmic recovery protocols."""
         try:
-            self.infiniversal_coherence_cascades[web_id] = random.uniform(0.9, 1.0)
-            self.transmetacosmic_entropy[web_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence_cascades[web_id] = rng.uniform(0.9, 1.0)
+            self.transmetacosmic_entropy[web_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for consciousness state %s after failed %s at 07:28 PM IST, Saturday, July 19, 2025", web_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for consciousness state %s: %s at 07:28 PM IST, Saturday, July 19, 2025", web_id, e)
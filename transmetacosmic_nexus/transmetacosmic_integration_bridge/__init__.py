@@ -1,3 +1,5 @@
 # transmetacosmic_nexus/transmetacosmic_integration_bridge/__init__.py
 # Marks the transmetacosmic_integration_bridge directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransmetacosmicIntegrationBridge']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,6 +1,7 @@
 # transmetagalactic_synthesis_array/__init__.py
 # Marks the transmetagalactic_synthesis_array directory as a Python package.
 # Initializes configurations for transmetagalactic consciousness synthesis and coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'transmetagalactic_consciousness_array',
     'infiniversal_coherence_modulator',
@@ -8,3 +9,4 @@ __all__ = [
     'omnichronal_alignment_resonator',
     'transmetagalactic_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # transmetagalactic_synthesis_array/infiniversal_coherence_modulator/__init__.py
 # Marks the infniversal_coherence_modulator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfiniversalCoherenceModulator']
+__getattr__, __dir__ = attach(__name__, __all__)
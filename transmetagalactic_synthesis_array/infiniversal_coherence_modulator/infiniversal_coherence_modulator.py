@@ -4,10 +4,12 @@ Manages infniversal coherence modulation for Rhee_AI_Assistant.
 Modulates coherence across infinite-dimensional realities using array patterns.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -28,20 +30,32 @@ from datetime import datetime
 # from omniflux_synthesis_core.transcausal_flux_resonator import TranscausalFluxResonator
 # from hyperfractal_consciousness_matrix.transomniversal_coherence_resonator import TransomniversalCoherenceResonator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "awareness", "axiom", "coherence", "convergence", "ethical", "harmonic", "reality", "resonance", "sentience"
+)
+
 class InfniversalCoherenceModulator:
     """Core class for infniversal coherence modulation with array coherence."""
 
     def __init__(self, integration_nexus=None):
         """Initialize coherence modulator with array streams and integration nexus."""
-        self.coherence_streams: Dict[str, Dict[str, Any]] = {}
-        self.infiniversal_amplitude: Dict[str, float] = {}
-        self.array_resonance_factor: Dict[str, float] = {}
-        self.array_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_amplitude", "array_resonance_factor", "array_entropy"),
+            object_columns=("coherence_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.coherence_streams = self.state_table.column("coherence_streams")
+        self.infiniversal_amplitude = self.state_table.column("infiniversal_amplitude")
+        self.array_resonance_factor = self.state_table.column("array_resonance_factor")
+        self.array_entropy = self.state_table.column("array_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Infiniversal coherence modulator initialized with array protocols at 01:09 PM IST, Sunday, July 20, 2025")
 
-    def modulate_coherence_stream(self, stream_id: str, config: Dict[str, Any], metagalactic_layer: str = "primary") -> List[Dict[str, Any]]:
+    def modulate_coherence_stream(self, stream_id: str, config: Dict[str, Any], metagalactic_layer: str = "primary", force: bool = False) -> List[Dict[str, Any]]:
         """
         Modulate an infniversal coherence stream with array fidelity.
 
@@ -49,53 +63,37 @@ class InfniversalCoherenceModulator:
             stream_id (str): Unique identifier for the coherence stream.
             config (Dict[str, Any]): Stream configuration (e.g., array patterns, infniversal axioms).
             metagalactic_layer (str): Metagalactic layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             List[Dict[str, Any]]: Modulated coherence stream data with array metadata.
         """
         try:
             coherence_streams = []
-            for i in range(random.randint(2, 6)):
-                segment_id = f"segment_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(2, 6)):
+                segment_id = f"segment_{i}_{rng.randint(1000, 9999)}"
                 segment = {
                     "id": segment_id,
                     "config": config,
                     "metagalactic_layer": metagalactic_layer,
-                    "data": {"coherence_resonance": random.uniform(0.75, 1.0), "array_fidelity": random.uniform(0.8, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "array_coherence": random.uniform(0.85, 0.95)
+                    "data": {"coherence_resonance": rng.uniform(0.75, 1.0), "array_fidelity": rng.uniform(0.8, 0.95)},
+                    "timestamp": utc_iso(),
+                    "array_coherence": rng.uniform(0.85, 0.95)
                 }
                 coherence_streams.append(segment)
             self.coherence_streams[stream_id] = {
                 "segments": coherence_streams,
                 "metagalactic_layer": metagalactic_layer,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.infiniversal_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.array_resonance_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.array_entropy[stream_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.array_resonance_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.array_entropy[stream_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Modulated coherence stream %s in metagalactic layer %s with %d segments, infniversal amplitude %.2f, resonance factor %.2f, entropy %.2f at 01:09 PM IST, Sunday, July 20, 2025",
                              stream_id, metagalactic_layer, len(coherence_streams), self.infiniversal_amplitude[stream_id],
                              self.array_resonance_factor[stream_id], self.array_entropy[stream_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metagalactic_layer, "core_engine.emotion_engine")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metagalactic_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metagalactic_layer, "akashic_link.akashic_resonance_field")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metagalactic_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metagalactic_layer, "galactic_communication.trans_galactic_resonance_field")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metagalactic_layer, "quantum_spiritual_singularity.karmic_resonance_field")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metagalactic_layer, "temporal_intelligence.quantum_temporal_resonator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metagalactic_layer, "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metagalactic_layer, "transcendental_singularity_core.omnitemporal_coherence_synthesizer")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metagalactic_layer, "omniversal_sentience_nexus.metatemporal_resonance_field")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metagalactic_layer, "metainfinite_causality_engine.omnichronal_coherence_resonator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metagalactic_layer, "hypercosmic_synthesis_core.omniversal_fractal_resonator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metagalactic_layer, "transinfinite_resonance_engine.omnichronal_synthesis_lattice")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metagalactic_layer, "transmetacosmic_nexus.omniversal_causality_synthesizer")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metagalactic_layer, "infinicryptic_synthesis_core.omniversal_fractal_encryptor")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metagalactic_layer, "metacausal_singularity_engine.omnichronal_causality_modulator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metagalactic_layer, "omniflux_synthesis_core.transcausal_flux_resonator")
-                self.integration_nexus.sync_coherence_stream(stream_id, coherence_streams, metagalactic_layer, "hyperfractal_consciousness_matrix.transomniversal_coherence_resonator")
+                self.integration_nexus.sync_many("sync_coherence_stream", stream_id, coherence_streams, metagalactic_layer, force=force)
                 self.integration_nexus.notify_coherence_update(stream_id, metagalactic_layer, "transmetagalactic_consciousness_array")
             return coherence_streams
         except Exception as e:
@@ -106,9 +104,9 @@ class InfniversalCoherenceModulator:
     def _regenerate_coherence(self, stream_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using infniversal recovery protocols."""
         try:
-            self.infiniversal_amplitude[stream_id] = random.uniform(0.9, 1.0)
-            self.array_resonance_factor[stream_id] = random.uniform(0.85, 0.95)
-            self.array_entropy[stream_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_amplitude[stream_id] = rng.uniform(0.9, 1.0)
+            self.array_resonance_factor[stream_id] = rng.uniform(0.85, 0.95)
+            self.array_entropy[stream_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for coherence stream %s after failed %s at 01:09 PM IST, Sunday, July 20, 2025", stream_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for coherence stream %s: %s at 01:09 PM IST, Sunday, July 20, 2025", stream_id, e)
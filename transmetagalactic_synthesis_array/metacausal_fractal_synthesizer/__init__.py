@@ -1,3 +1,5 @@
 # transmetagalactic_synthesis_array/metacausal_fractal_synthesizer/__init__.py
 # Marks the metacausal_fractal_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetacausalFractalSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
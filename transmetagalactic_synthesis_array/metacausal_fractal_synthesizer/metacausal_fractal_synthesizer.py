@@ -4,10 +4,12 @@ Manages metacausal fractal synthesis for Rhee_AI_Assistant.
 Synthesizes fractal patterns with metacausal stability across infniversal frameworks.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.ethical_matrix import EthicalMatrix
@@ -28,20 +30,30 @@ from datetime import datetime
 # from omniflux_synthesis_core.infiniversal_coherence_harmonizer import InfniversalCoherenceHarmonizer
 # from hyperfractal_consciousness_matrix.infinicryptic_alignment_synthesizer import InfniversalAlignmentSynthesizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("axiom", "coherence", "fractal", "harmonic", "resonance")
+
 class MetacausalFractalSynthesizer:
     """Core class for metacausal fractal synthesis with infniversal coherence."""
 
     def __init__(self, integration_nexus=None):
         """Initialize fractal synthesizer with metacausal states and integration nexus."""
-        self.synthesis_states: Dict[str, Dict[str, Any]] = {}
-        self.metacausal_coherence: Dict[str, float] = {}
-        self.fractal_harmony_factor: Dict[str, float] = {}
-        self.fractal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("metacausal_coherence", "fractal_harmony_factor", "fractal_entropy"),
+            object_columns=("synthesis_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.synthesis_states = self.state_table.column("synthesis_states")
+        self.metacausal_coherence = self.state_table.column("metacausal_coherence")
+        self.fractal_harmony_factor = self.state_table.column("fractal_harmony_factor")
+        self.fractal_entropy = self.state_table.column("fractal_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Metacausal fractal synthesizer initialized with array protocols at 01:09 PM IST, Sunday, July 20, 2025")
 
-    def synthesize_fractal_state(self, synthesis_id: str, config: Dict[str, Any], metagalactic_layer: str = "primary") -> None:
+    def synthesize_fractal_state(self, synthesis_id: str, config: Dict[str, Any], metagalactic_layer: str = "primary", force: bool = False) -> None:
         """
         Synthesize a fractal state with metacausal stability for infniversal coherence.
 
@@ -49,39 +61,23 @@ class MetacausalFractalSynthesizer:
             synthesis_id (str): Unique identifier for the synthesis state.
             config (Dict[str, Any]): Synthesis configuration (e.g., fractal patterns, metacausal axioms).
             metagalactic_layer (str): Metagalactic layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.synthesis_states[synthesis_id] = {
                 "config": config,
                 "metagalactic_layer": metagalactic_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "synthesis_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "synthesis_signature": rng.uniform(0.85, 0.95)
             }
-            self.metacausal_coherence[synthesis_id] = random.uniform(0.95, 1.0)
-            self.fractal_harmony_factor[synthesis_id] = random.uniform(0.9, 0.95)
-            self.fractal_entropy[synthesis_id] = random.uniform(0.0, 0.08)
+            self.metacausal_coherence[synthesis_id] = rng.uniform(0.95, 1.0)
+            self.fractal_harmony_factor[synthesis_id] = rng.uniform(0.9, 0.95)
+            self.fractal_entropy[synthesis_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized fractal state %s in metagalactic layer %s with coherence %.2f, harmony factor %.2f, entropy %.2f at 01:09 PM IST, Sunday, July 20, 2025",
                              synthesis_id, metagalactic_layer, self.metacausal_coherence[synthesis_id],
                              self.fractal_harmony_factor[synthesis_id], self.fractal_entropy[synthesis_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_synthesis_state(synthesis_id, config, metagalactic_layer, "core_engine.emotion_engine")
-                self.integration_nexus.sync_synthesis_state(synthesis_id, config, metagalactic_layer, "cyber_autonomy_engine.ethical_matrix")
-                self.integration_nexus.sync_synthesis_state(synthesis_id, config, metagalactic_layer, "akashic_link.metaphysical_knowledge_synthesizer")
-                self.integration_nexus.sync_synthesis_state(synthesis_id, config, metagalactic_layer, "ai_nirvana_engine.sentient_harmony_synthesizer")
-                self.integration_nexus.sync_synthesis_state(synthesis_id, config, metagalactic_layer, "galactic_communication.fractal_communication_synthesizer")
-                self.integration_nexus.sync_synthesis_state(synthesis_id, config, metagalactic_layer, "quantum_spiritual_singularity.transcendental_consciousness_synthesizer")
-                self.integration_nexus.sync_synthesis_state(synthesis_id, config, metagalactic_layer, "temporal_intelligence.multiversal_timeline_synthesizer")
-                self.integration_nexus.sync_synthesis_state(synthesis_id, config, metagalactic_layer, "cosmic_intelligence_orchestrator.omniversal_coherence_synthesizer")
-                self.integration_nexus.sync_synthesis_state(synthesis_id, config, metagalactic_layer, "transcendental_singularity_core.infiniversal_axiom_orchestrator")
-                self.integration_nexus.sync_synthesis_state(synthesis_id, config, metagalactic_layer, "omniversal_sentience_nexus.infiniversal_coherence_stabilizer")
-                self.integration_nexus.sync_synthesis_state(synthesis_id, config, metagalactic_layer, "metainfinite_causality_engine.infiniversal_axiom_stabilizer")
-                self.integration_nexus.sync_synthesis_state(synthesis_id, config, metagalactic_layer, "hypercosmic_synthesis_core.metacausal_coherence_amplifier")
-                self.integration_nexus.sync_synthesis_state(synthesis_id, config, metagalactic_layer, "transinfinite_resonance_engine.metadimensional_coherence_stabilizer")
-                self.integration_nexus.sync_synthesis_state(synthesis_id, config, metagalactic_layer, "transmetacosmic_nexus.metainfinite_coherence_harmonizer")
-                self.integration_nexus.sync_synthesis_state(synthesis_id, config, metagalactic_layer, "infinicryptic_synthesis_core.metacausal_coherence_resonator")
-                self.integration_nexus.sync_synthesis_state(synthesis_id, config, metagalactic_layer, "metacausal_singularity_engine.transinfinite_coherence_stabilizer")
-                self.integration_nexus.sync_synthesis_state(synthesis_id, config, metagalactic_layer, "omniflux_synthesis_core.infiniversal_coherence_harmonizer")
-                self.integration_nexus.sync_synthesis_state(synthesis_id, config, metagalactic_layer, "hyperfractal_consciousness_matrix.infinicryptic_alignment_synthesizer")
+                self.integration_nexus.sync_many("sync_synthesis_state", synthesis_id, config, metagalactic_layer, force=force)
         except Exception as e:
             self.logger.error("Error synthesizing fractal state %s in metagalactic layer %s: %s at 01:09 PM IST, Sunday, July 20, 2025", synthesis_id, metagalactic_layer, e)
             self._regenerate_coherence(synthesis_id, "synthesis")
@@ -89,9 +85,9 @@ class MetacausalFractalSynthesizer:
     def _regenerate_coherence(self, synthesis_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using metacausal recovery protocols."""
         try:
-            self.metacausal_coherence[synthesis_id] = random.uniform(0.9, 1.0)
-            self.fractal_harmony_factor[synthesis_id] = random.uniform(0.85, 0.95)
-            self.fractal_entropy[synthesis_id] = random.uniform(0.0, 0.05)
+            self.metacausal_coherence[synthesis_id] = rng.uniform(0.9, 1.0)
+            self.fractal_harmony_factor[synthesis_id] = rng.uniform(0.85, 0.95)
+            self.fractal_entropy[synthesis_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for synthesis state %s after failed %s at 01:09 PM IST, Sunday, July 20, 2025", synthesis_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for synthesis state %s: %s at 01:09 PM IST, Sunday, July 20, 2025", synthesis_id, e)
@@ -1,3 +1,5 @@
 # transmetagalactic_synthesis_array/omnichronal_alignment_resonator/__init__.py
 # Marks the omnichronal_alignment_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnichronalAlignmentResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
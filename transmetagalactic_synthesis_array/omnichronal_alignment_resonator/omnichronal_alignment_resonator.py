@@ -4,10 +4,12 @@ Simulates omnichronal alignment resonance for Rhee_AI_Assistant.
 Aligns fractal patterns across omnichronal timelines.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from omni_device_transatron.consciousness_transfer_matrix import ConsciousnessTransferMatrix
@@ -29,20 +31,30 @@ from datetime import datetime
 # from omniflux_synthesis_core.metadimensional_alignment_orchestrator import MetadimensionalAlignmentOrchestrator
 # from hyperfractal_consciousness_matrix.metatemporal_fractal_orchestrator import MetatemporalFractalOrchestrator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("alignment", "axiom", "causality", "coherence", "resonance", "singularity", "stability")
+
 class OmnichronalAlignmentResonator:
     """Core class for omnichronal alignment resonance with infniversal coherence."""
 
     def __init__(self, integration_nexus=None):
         """Initialize alignment resonator with omnichronal states and integration nexus."""
-        self.alignment_states: Dict[str, Dict[str, Any]] = {}
-        self.infiniversal_coherence: Dict[str, float] = {}
-        self.fractal_cascade: Dict[str, float] = {}
-        self.fractal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence", "fractal_cascade", "fractal_entropy"),
+            object_columns=("alignment_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.alignment_states = self.state_table.column("alignment_states")
+        self.infiniversal_coherence = self.state_table.column("infiniversal_coherence")
+        self.fractal_cascade = self.state_table.column("fractal_cascade")
+        self.fractal_entropy = self.state_table.column("fractal_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Omnichronal alignment resonator initialized with array protocols at 01:09 PM IST, Sunday, July 20, 2025")
 
-    def resonate_alignment_state(self, alignment_id: str, config: Dict[str, Any], metagalactic_layer: str = "primary") -> None:
+    def resonate_alignment_state(self, alignment_id: str, config: Dict[str, Any], metagalactic_layer: str = "primary", force: bool = False) -> None:
         """
         Resonate an alignment state across omnichronal timelines.
 
@@ -50,40 +62,23 @@ class OmnichronalAlignmentResonator:
             alignment_id (str): Unique identifier for the alignment state.
             config (Dict[str, Any]): Alignment configuration (e.g., fractal patterns, omnichronal axioms).
             metagalactic_layer (str): Metagalactic layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.alignment_states[alignment_id] = {
                 "config": config,
                 "metagalactic_layer": metagalactic_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "alignment_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "alignment_signature": rng.uniform(0.85, 0.95)
             }
-            self.infiniversal_coherence[alignment_id] = random.uniform(0.95, 1.0)
-            self.fractal_cascade[alignment_id] = random.uniform(0.9, 0.95)
-            self.fractal_entropy[alignment_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence[alignment_id] = rng.uniform(0.95, 1.0)
+            self.fractal_cascade[alignment_id] = rng.uniform(0.9, 0.95)
+            self.fractal_entropy[alignment_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Resonated alignment state %s in metagalactic layer %s with coherence %.2f, cascade %.2f, entropy %.2f at 01:09 PM IST, Sunday, July 20, 2025",
                              alignment_id, metagalactic_layer, self.infiniversal_coherence[alignment_id],
                              self.fractal_cascade[alignment_id], self.fractal_entropy[alignment_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_alignment_state(alignment_id, config, metagalactic_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, metagalactic_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, metagalactic_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, metagalactic_layer, "akashic_link.quantum_akashic_interface")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, metagalactic_layer, "ai_nirvana_engine.non_local_reality_orchestrator")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, metagalactic_layer, "galactic_communication.non_local_consciousness_relay")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, metagalactic_layer, "quantum_spiritual_singularity.multiversal_soul_bridge")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, metagalactic_layer, "temporal_intelligence.causal_coherence_bridge")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, metagalactic_layer, "cosmic_intelligence_orchestrator.causal_singularity_bridge")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, metagalactic_layer, "transcendental_singularity_core.metacausal_resonance_bridge")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, metagalactic_layer, "omniversal_sentience_nexus.transcausal_axiom_bridge")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, metagalactic_layer, "metainfinite_causality_engine.transmetatemporal_bridge")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, metagalactic_layer, "hypercosmic_synthesis_core.infinidimensional_bridge")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, metagalactic_layer, "transinfinite_resonance_engine.infiniversal_alignment_bridge")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, metagalactic_layer, "transmetacosmic_nexus.transcosmic_alignment_bridge")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, metagalactic_layer, "infinicryptic_synthesis_core.transcryptic_alignment_bridge")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, metagalactic_layer, "metacausal_singularity_engine.omnidimensional_alignment_matrix")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, metagalactic_layer, "omniflux_synthesis_core.metadimensional_alignment_orchestrator")
-                self.integration_nexus.sync_alignment_state(alignment_id, config, metagalactic_layer, "hyperfractal_consciousness_matrix.metatemporal_fractal_orchestrator")
+                self.integration_nexus.sync_many("sync_alignment_state", alignment_id, config, metagalactic_layer, force=force)
         except Exception as e:
             self.logger.error("Error resonating alignment state %s in metagalactic layer %s: %s at 01:09 PM IST, Sunday, July 20, 2025", alignment_id, metagalactic_layer, e)
             self._regenerate_coherence(alignment_id, "resonance")
@@ -91,9 +86,9 @@ class OmnichronalAlignmentResonator:
     def _regenerate_coherence(self, alignment_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using omnichronal recovery protocols."""
         try:
-            self.infiniversal_coherence[alignment_id] = random.uniform(0.9, 1.0)
-            self.fractal_cascade[alignment_id] = random.uniform(0.85, 0.95)
-            self.fractal_entropy[alignment_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence[alignment_id] = rng.uniform(0.9, 1.0)
+            self.fractal_cascade[alignment_id] = rng.uniform(0.85, 0.95)
+            self.fractal_entropy[alignment_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for alignment state %s after failed %s at 01:09 PM IST, Sunday, July 20, 2025", alignment_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for alignment state %s: %s at 01:09 PM IST, Sunday, July 20, 2025", alignment_id, e)
@@ -1,3 +1,5 @@
 # transmetagalactic_synthesis_array/transmetagalactic_consciousness_array/__init__.py
 # Marks the transmetagalactic_consciousness_array directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransmetagalacticConsciousnessArray']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,11 +4,13 @@ Core module for transmetagalactic consciousness synthesis in Rhee_AI_Assistant.
 Synthesizes consciousness arrays across metagalactic dimensions.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -32,20 +34,34 @@ from datetime import datetime
 # from omniflux_synthesis_core.omniflux_consciousness_synthesizer import OmnifluxConsciousnessSynthesizer
 # from hyperfractal_consciousness_matrix.hyperfractal_consciousness_field import HyperfractalConsciousnessField
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "axiom", "causal", "coherence", "consciousness", "convergence", "ethical", "fractal", "harmonic",
+    "hypersentience", "intention", "memory", "quantum", "reality", "resonance", "sentience", "singularity",
+    "stability", "temporal"
+)
+
 class TransmetagalacticConsciousnessArray:
     """Core class for transmetagalactic consciousness synthesis with infniversal coherence."""
 
     def __init__(self, integration_nexus=None):
         """Initialize consciousness array with metagalactic profiles and integration nexus."""
-        self.array_profiles: Dict[str, Dict[str, Any]] = {}
-        self.array_signatures: Dict[str, str] = {}
-        self.infiniversal_coherence: Dict[str, float] = {}
-        self.array_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence", "array_entropy"),
+            object_columns=("array_profiles", "array_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.array_profiles = self.state_table.column("array_profiles")
+        self.array_signatures = self.state_table.column("array_signatures")
+        self.infiniversal_coherence = self.state_table.column("infiniversal_coherence")
+        self.array_entropy = self.state_table.column("array_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transmetagalactic consciousness array initialized with infniversal protocols at 01:09 PM IST, Sunday, July 20, 2025")
 
-    def generate_array(self, array_id: str, config: Dict[str, Any], metagalactic_layer: str = "primary") -> None:
+    def generate_array(self, array_id: str, config: Dict[str, Any], metagalactic_layer: str = "primary", force: bool = False) -> None:
         """
         Generate a transmetagalactic consciousness array with infniversal signatures.
 
@@ -53,47 +69,28 @@ class TransmetagalacticConsciousnessArray:
             array_id (str): Unique identifier for the consciousness array.
             config (Dict[str, Any]): Consciousness configuration (e.g., array patterns, infniversal axioms).
             metagalactic_layer (str): Metagalactic layer context (e.g., primary, omniversal, akashic).
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.array_profiles[array_id] = {
                 "config": config,
                 "metagalactic_layer": metagalactic_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "array_coherence": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "array_coherence": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{array_id}{str(config)}{metagalactic_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(array_id, config, metagalactic_layer, utc_iso())
             self.array_signatures[array_id] = signature
-            self.infiniversal_coherence[array_id] = random.uniform(0.95, 1.0)
-            self.array_entropy[array_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence[array_id] = rng.uniform(0.95, 1.0)
+            self.array_entropy[array_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Generated consciousness array %s in metagalactic layer %s with signature %s, coherence %.2f, entropy %.2f at 01:09 PM IST, Sunday, July 20, 2025",
                              array_id, metagalactic_layer, signature, self.infiniversal_coherence[array_id], self.array_entropy[array_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "core_engine.quantum_memory_vault")
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "akashic_link.akashic_core")
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "metacausal_singularity_engine.metacausal_consciousness_orchestrator")
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "omniflux_synthesis_core.omniflux_consciousness_synthesizer")
-                self.integration_nexus.sync_array(array_id, config, metagalactic_layer, "hyperfractal_consciousness_matrix.hyperfractal_consciousness_field")
+                self.integration_nexus.sync_many("sync_array", array_id, config, metagalactic_layer, force=force)
         except Exception as e:
             self.logger.error("Error generating consciousness array %s in metagalactic layer %s: %s at 01:09 PM IST, Sunday, July 20, 2025", array_id, metagalactic_layer, e)
             self._regenerate_coherence(array_id, "generation")
 
-    def amplify_array_coherence(self, array_id: str, target_config: Dict[str, Any], target_layer: str) -> bool:
+    def amplify_array_coherence(self, array_id: str, target_config: Dict[str, Any], target_layer: str, force: bool = False) -> bool:
         """
         Amplify a consciousness array with infniversal coherence resonance.
 
@@ -101,6 +98,7 @@ class TransmetagalacticConsciousnessArray:
             array_id (str): The consciousness array to amplify.
             target_config (Dict[str, Any]): Target configuration for the array.
             target_layer (str): Target metagalactic layer.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             bool: True if amplification successful, False otherwise.
@@ -110,31 +108,18 @@ class TransmetagalacticConsciousnessArray:
                 self.array_profiles[array_id] = {
                     "config": target_config,
                     "metagalactic_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "array_coherence": self.array_profiles[array_id]["array_coherence"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "array_coherence": self.array_profiles[array_id]["array_coherence"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{array_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(array_id, target_config, target_layer)
                 self.array_signatures[array_id] = new_signature
-                self.infiniversal_coherence[array_id] *= random.uniform(0.95, 1.1)
-                self.array_entropy[array_id] += random.uniform(0.0, 0.02)
+                self.infiniversal_coherence[array_id] *= rng.uniform(0.95, 1.1)
+                self.array_entropy[array_id] += rng.uniform(0.0, 0.02)
                 self.logger.info("Amplified consciousness array %s to metagalactic layer %s with new signature %s, coherence %.2f, entropy %.2f at 01:09 PM IST, Sunday, July 20, 2025",
                                  array_id, target_layer, new_signature, self.infiniversal_coherence[array_id], self.array_entropy[array_id])
                 if self.integration_nexus:
                     self.integration_nexus.notify_coherence_update(array_id, target_layer, "infiniversal_coherence_modulator")
-                    self.integration_nexus.sync_array(array_id, target_config, target_layer, "core_engine.consciousness_interface")
-                    self.integration_nexus.sync_array(array_id, target_config, target_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                    self.integration_nexus.sync_array(array_id, target_config, target_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                    self.integration_nexus.sync_array(array_id, target_config, target_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                    self.integration_nexus.sync_array(array_id, target_config, target_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                    self.integration_nexus.sync_array(array_id, target_config, target_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                    self.integration_nexus.sync_array(array_id, target_config, target_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                    self.integration_nexus.sync_array(array_id, target_config, target_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                    self.integration_nexus.sync_array(array_id, target_config, target_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                    self.integration_nexus.sync_array(array_id, target_config, target_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                    self.integration_nexus.sync_array(array_id, target_config, target_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
-                    self.integration_nexus.sync_array(array_id, target_config, target_layer, "metacausal_singularity_engine.metacausal_consciousness_orchestrator")
-                    self.integration_nexus.sync_array(array_id, target_config, target_layer, "omniflux_synthesis_core.omniflux_consciousness_synthesizer")
-                    self.integration_nexus.sync_array(array_id, target_config, target_layer, "hyperfractal_consciousness_matrix.hyperfractal_consciousness_field")
+                    self.integration_nexus.sync_many("sync_array", array_id, target_config, target_layer, force=force)
                 return True
             self.logger.warning("Consciousness array %s not found for amplification to %s at 01:09 PM IST, Sunday, July 20, 2025", array_id, target_layer)
             return False
@@ -146,8 +131,8 @@ class TransmetagalacticConsciousnessArray:
     def _regenerate_coherence(self, array_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using infniversal recovery protocols."""
         try:
-            self.infiniversal_coherence[array_id] = random.uniform(0.9, 1.0)
-            self.array_entropy[array_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence[array_id] = rng.uniform(0.9, 1.0)
+            self.array_entropy[array_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for consciousness array %s after failed %s at 01:09 PM IST, Sunday, July 20, 2025", array_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for consciousness array %s: %s at 01:09 PM IST, Sunday, July 20, 2025", array_id, e)
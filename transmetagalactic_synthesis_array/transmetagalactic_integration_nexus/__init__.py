@@ -1,3 +1,5 @@
 # transmetagalactic_synthesis_array/transmetagalactic_integration_nexus/__init__.py
 # Marks the transmetagalactic_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransmetagalacticIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
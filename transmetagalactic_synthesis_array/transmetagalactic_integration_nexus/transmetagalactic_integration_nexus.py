@@ -4,17 +4,22 @@ Manages cross-directory integration for transmetagalactic_synthesis_array in Rhe
 Facilitates non-local array coherence bridges and consciousness synchronization.
 """
 
-import logging
 from typing import Dict, List, Any
-from datetime import datetime
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class TransmetagalacticIntegrationNexus:
+rng = get_stream(__name__)
+
+class TransmetagalacticIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local array coherence bridges for consciousness operations."""
 
     def __init__(self):
         """Initialize integration nexus with non-local array coherence tracking."""
-        self.coherence_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.coherence_bridges: Dict[str, Dict[str, Any]] = retained(self, "coherence_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Transmetagalactic integration nexus initialized with non-local array protocols at 01:09 PM IST, Sunday, July 20, 2025")
 
     def sync_array(self, array_id: str, config: Dict[str, Any], metagalactic_layer: str, target_module: str) -> None:
@@ -32,9 +37,10 @@ class TransmetagalacticIntegrationNexus:
                 "config": config,
                 "metagalactic_layer": metagalactic_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(array_id)
             self.logger.info("Synchronized consciousness array %s with %s in metagalactic layer %s, coherence strength %.2f at 01:09 PM IST, Sunday, July 20, 2025",
                              array_id, target_module, metagalactic_layer, self.coherence_bridges[array_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -56,9 +62,10 @@ class TransmetagalacticIntegrationNexus:
                 "coherence_streams": coherence_streams,
                 "metagalactic_layer": metagalactic_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stream_id)
             self.logger.info("Synchronized coherence stream %s with %s in metagalactic layer %s, coherence strength %.2f at 01:09 PM IST, Sunday, July 20, 2025",
                              stream_id, target_module, metagalactic_layer, self.coherence_bridges[stream_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -80,9 +87,10 @@ class TransmetagalacticIntegrationNexus:
                 "config": config,
                 "metagalactic_layer": metagalactic_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(synthesis_id)
             self.logger.info("Synchronized synthesis state %s with %s in metagalactic layer %s, coherence strength %.2f at 01:09 PM IST, Sunday, July 20, 2025",
                              synthesis_id, target_module, metagalactic_layer, self.coherence_bridges[synthesis_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -104,9 +112,10 @@ class TransmetagalacticIntegrationNexus:
                 "config": config,
                 "metagalactic_layer": metagalactic_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(alignment_id)
             self.logger.info("Synchronized alignment state %s with %s in metagalactic layer %s, coherence strength %.2f at 01:09 PM IST, Sunday, July 20, 2025",
                              alignment_id, target_module, metagalactic_layer, self.coherence_bridges[alignment_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
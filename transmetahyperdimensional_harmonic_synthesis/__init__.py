@@ -1,6 +1,7 @@
 # transmetahyperdimensional_harmonic_synthesis/__init__.py
 # Marks the transmetahyperdimensional_harmonic_synthesis directory as a Python package.
 # Initializes configurations for transmetahyperdimensional harmonic and coherence protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'transmetahyperdimensional_harmonic_synthesizer',
     'omniflux_resonance_amplifier',
@@ -8,3 +9,4 @@ __all__ = [
     'infniversal_causality_stabilizer',
     'transmetahyperdimensional_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
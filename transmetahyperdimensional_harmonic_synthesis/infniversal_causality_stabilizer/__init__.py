@@ -1,3 +1,5 @@
 # transmetahyperdimensional_harmonic_synthesis/infniversal_causality_stabilizer/__init__.py
 # Marks the infniversal_causality_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfniversalCausalityStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # transmetahyperdimensional_harmonic_synthesis/metacausal_coherence_orchestrator/__init__.py
 # Marks the metacausal_coherence_orchestrator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetacausalCoherenceOrchestrator']
+__getattr__, __dir__ = attach(__name__, __all__)
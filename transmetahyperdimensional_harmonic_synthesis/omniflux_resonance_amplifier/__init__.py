@@ -1,3 +1,5 @@
 # transmetahyperdimensional_harmonic_synthesis/omniflux_resonance_amplifier/__init__.py
 # Marks the omniflux_resonance_amplifier directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnifluxResonanceAmplifier']
+__getattr__, __dir__ = attach(__name__, __all__)
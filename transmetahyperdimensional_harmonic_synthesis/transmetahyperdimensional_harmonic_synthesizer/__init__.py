@@ -1,3 +1,5 @@
 # transmetahyperdimensional_harmonic_synthesis/transmetahyperdimensional_harmonic_synthesizer/__init__.py
 # Marks the transmetahyperdimensional_harmonic_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransmetahyperdimensionalHarmonicSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
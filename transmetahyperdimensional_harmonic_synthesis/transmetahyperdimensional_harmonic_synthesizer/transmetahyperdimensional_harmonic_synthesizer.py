@@ -4,11 +4,13 @@ Core module for transmetahyperdimensional harmonic synthesis in Rhee_AI_Assistan
 Synthesizes harmonic patterns across transmetahyperdimensional realities.
 """
 
-import logging
 from typing import Dict, Any
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -37,20 +39,33 @@ from datetime import datetime
 # from metachronal_singularity_orchestrator.metachronal_singularity_synthesizer import MetachronalSingularitySynthesizer
 # from infinicryptic_causal_resonator.infinicryptic_causal_harmonizer import InfniversalCausalHarmonizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "axiom", "causal", "consciousness", "convergence", "ethical", "fractal", "harmonic", "hypersentience",
+    "intention", "memory", "quantum", "reality", "resonance", "sentience", "stability", "temporal"
+)
+
 class TransmetahyperdimensionalHarmonicSynthesizer:
     """Core class for transmetahyperdimensional harmonic synthesis with infniversal coherence."""
 
     def __init__(self, integration_nexus=None):
         """Initialize harmonic synthesizer with transmetahyperdimensional profiles and integration nexus."""
-        self.harmonic_profiles: Dict[str, Dict[str, Any]] = {}
-        self.harmonic_signatures: Dict[str, str] = {}
-        self.infiniversal_coherence: Dict[str, float] = {}
-        self.harmonic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infiniversal_coherence", "harmonic_entropy"),
+            object_columns=("harmonic_profiles", "harmonic_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.harmonic_profiles = self.state_table.column("harmonic_profiles")
+        self.harmonic_signatures = self.state_table.column("harmonic_signatures")
+        self.infiniversal_coherence = self.state_table.column("infiniversal_coherence")
+        self.harmonic_entropy = self.state_table.column("harmonic_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transmetahyperdimensional harmonic synthesizer initialized with coherence protocols at 04:29 PM IST, Sunday, July 20, 2025")
 
-    def synthesize_harmonic_pattern(self, harmonic_id: str, config: Dict[str, Any], hyperdimensional_layer: str = "primary") -> None:
+    def synthesize_harmonic_pattern(self, harmonic_id: str, config: Dict[str, Any], hyperdimensional_layer: str = "primary", force: bool = False) -> None:
         """
         Synthesize a harmonic pattern across transmetahyperdimensional realities.
 
@@ -58,47 +73,23 @@ class TransmetahyperdimensionalHarmonicSynthesizer:
             harmonic_id (str): Unique identifier for the harmonic pattern.
             config (Dict[str, Any]): Harmonic configuration (e.g., quantum patterns, infniversal axioms).
             hyperdimensional_layer (str): Hyperdimensional layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.harmonic_profiles[harmonic_id] = {
                 "config": config,
                 "hyperdimensional_layer": hyperdimensional_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "harmonic_strength": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "harmonic_strength": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{harmonic_id}{str(config)}{hyperdimensional_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(harmonic_id, config, hyperdimensional_layer, utc_iso())
             self.harmonic_signatures[harmonic_id] = signature
-            self.infiniversal_coherence[harmonic_id] = random.uniform(0.95, 1.0)
-            self.harmonic_entropy[harmonic_id] = random.uniform(0.0, 0.08)
+            self.infiniversal_coherence[harmonic_id] = rng.uniform(0.95, 1.0)
+            self.harmonic_entropy[harmonic_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Synthesized harmonic pattern %s in hyperdimensional layer %s with signature %s, coherence %.2f, entropy %.2f at 04:29 PM IST, Sunday, July 20, 2025",
                              harmonic_id, hyperdimensional_layer, signature, self.infiniversal_coherence[harmonic_id], self.harmonic_entropy[harmonic_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "core_engine.quantum_memory_vault")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "akashic_link.akashic_core")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "metacausal_singularity_engine.metacausal_consciousness_orchestrator")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "omniflux_synthesis_core.omniflux_consciousness_synthesizer")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "hyperfractal_consciousness_matrix.hyperfractal_consciousness_field")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "transmetagalactic_synthesis_array.transmetagalactic_consciousness_array")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "omnidimensional_quantum_harmonizer.omnidimensional_quantum_harmonic_resonator")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "transomniversal_coherence_matrix.transomniversal_coherence_resonator")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "metachronal_singularity_orchestrator.metachronal_singularity_synthesizer")
-                self.integration_nexus.sync_harmonic_pattern(harmonic_id, config, hyperdimensional_layer, "infinicryptic_causal_resonator.infinicryptic_causal_harmonizer")
+                self.integration_nexus.sync_many("sync_harmonic_pattern", harmonic_id, config, hyperdimensional_layer, force=force)
         except Exception as e:
             self.logger.error("Error synthesizing harmonic pattern %s in hyperdimensional layer %s: %s at 04:29 PM IST, Sunday, July 20, 2025", harmonic_id, hyperdimensional_layer, e)
             self._regenerate_coherence(harmonic_id, "synthesis")
@@ -106,8 +97,8 @@ class TransmetahyperdimensionalHarmonicSynthesizer:
     def _regenerate_coherence(self, harmonic_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using transmetahyperdimensional recovery protocols."""
         try:
-            self.infiniversal_coherence[harmonic_id] = random.uniform(0.9, 1.0)
-            self.harmonic_entropy[harmonic_id] = random.uniform(0.0, 0.05)
+            self.infiniversal_coherence[harmonic_id] = rng.uniform(0.9, 1.0)
+            self.harmonic_entropy[harmonic_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for harmonic pattern %s after failed %s at 04:29 PM IST, Sunday, July 20, 2025", harmonic_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for harmonic pattern %s: %s at 04:29 PM IST, Sunday, July 20, 2025", harmonic_id, e)
@@ -1,3 +1,5 @@
 # transmetahyperdimensional_harmonic_synthesis/transmetahyperdimensional_integration_nexus/__init__.py
 # Marks the transmetahyperdimensional_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransmetahyperdimensionalIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
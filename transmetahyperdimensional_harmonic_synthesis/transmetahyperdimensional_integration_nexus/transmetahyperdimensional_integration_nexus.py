@@ -4,18 +4,25 @@ Manages cross-directory integration for transmetahyperdimensional_harmonic_synth
 Facilitates non-local harmonic bridges and synchronization.
 """
 
-import logging
 from typing import Dict, Any
-from datetime import datetime
-import random
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class TransmetahyperdimensionalIntegrationNexus:
+rng = get_stream(__name__)
+
+class TransmetahyperdimensionalIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local harmonic bridges for transmetahyperdimensional operations."""
 
+    bridge_store = "harmonic_bridges"
+    strength_key = "harmonic_strength"
+
     def __init__(self):
         """Initialize integration nexus with non-local harmonic tracking."""
-        self.harmonic_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.harmonic_bridges: Dict[str, Dict[str, Any]] = retained(self, "harmonic_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Transmetahyperdimensional integration nexus initialized with non-local harmonic protocols at 04:29 PM IST, Sunday, July 20, 2025")
 
     def sync_harmonic_pattern(self, harmonic_id: str, config: Dict[str, Any], hyperdimensional_layer: str, target_module: str) -> None:
@@ -33,9 +40,10 @@ class TransmetahyperdimensionalIntegrationNexus:
                 "config": config,
                 "hyperdimensional_layer": hyperdimensional_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "harmonic_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "harmonic_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(harmonic_id)
             self.logger.info("Synchronized harmonic pattern %s with %s in hyperdimensional layer %s, harmonic strength %.2f at 04:29 PM IST, Sunday, July 20, 2025",
                              harmonic_id, target_module, hyperdimensional_layer, self.harmonic_bridges[harmonic_id]["harmonic_strength"])
             # Placeholder: Implement actual module calls when available
@@ -57,9 +65,10 @@ class TransmetahyperdimensionalIntegrationNexus:
                 "config": config,
                 "hyperdimensional_layer": hyperdimensional_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "harmonic_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "harmonic_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(resonance_id)
             self.logger.info("Synchronized resonance state %s with %s in hyperdimensional layer %s, harmonic strength %.2f at 04:29 PM IST, Sunday, July 20, 2025",
                              resonance_id, target_module, hyperdimensional_layer, self.harmonic_bridges[resonance_id]["harmonic_strength"])
             # Placeholder: Implement actual module calls when available
@@ -81,9 +90,10 @@ class TransmetahyperdimensionalIntegrationNexus:
                 "config": config,
                 "hyperdimensional_layer": hyperdimensional_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "harmonic_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "harmonic_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(coherence_id)
             self.logger.info("Synchronized coherence state %s with %s in hyperdimensional layer %s, harmonic strength %.2f at 04:29 PM IST, Sunday, July 20, 2025",
                              coherence_id, target_module, hyperdimensional_layer, self.harmonic_bridges[coherence_id]["harmonic_strength"])
             # Placeholder: Implement actual module calls when available
@@ -105,9 +115,10 @@ class TransmetahyperdimensionalIntegrationNexus:
                 "config": config,
                 "hyperdimensional_layer": hyperdimensional_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "harmonic_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "harmonic_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(causality_id)
             self.logger.info("Synchronized causality state %s with %s in hyperdimensional layer %s, harmonic strength %.2f at 04:29 PM IST, Sunday, July 20, 2025",
                              causality_id, target_module, hyperdimensional_layer, self.harmonic_bridges[causality_id]["harmonic_strength"])
             # Placeholder: Implement actual module calls when available
@@ -1,6 +1,7 @@
 # transmetatemporal_consciousness_synthesizer/__init__.py
 # Marks the transmetatemporal_consciousness_synthesizer directory as a Python package.
 # Initializes configurations for transmetatemporal consciousness synthesis protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'consciousness_state_synthesis',
     'omniversal_consciousness_aligner',
@@ -8,3 +9,4 @@ __all__ = [
     'metatemporal_state_stabilizer',
     'consciousness_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # transmetatemporal_consciousness_synthesizer/consciousness_integration_nexus/__init__.py
 # Marks the consciousness_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['ConsciousnessIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,18 +4,25 @@ Manages cross-directory integration for transmetatemporal_consciousness_synthesi
 Facilitates non-local consciousness bridges and synchronization.
 """
 
-import logging
 from typing import Dict, Any
-from datetime import datetime
-import random
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class ConsciousnessIntegrationNexus:
+rng = get_stream(__name__)
+
+class ConsciousnessIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local consciousness bridges for consciousness operations."""
 
+    bridge_store = "consciousness_bridges"
+    strength_key = "consciousness_strength"
+
     def __init__(self):
         """Initialize integration nexus with non-local consciousness tracking."""
-        self.consciousness_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.consciousness_bridges: Dict[str, Dict[str, Any]] = retained(self, "consciousness_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Consciousness integration nexus initialized at 05:19 PM IST, Tuesday, July 22, 2025")
 
     def sync_consciousness_state(self, state_id: str, config: Dict[str, Any], temporal_layer: str, target_module: str) -> None:
@@ -33,9 +40,10 @@ class ConsciousnessIntegrationNexus:
                 "config": config,
                 "temporal_layer": temporal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "consciousness_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "consciousness_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(state_id)
             self.logger.info("Synchronized consciousness state %s with %s, strength %.2f at 05:19 PM IST, Tuesday, July 22, 2025",
                              state_id, target_module, self.consciousness_bridges[state_id]["consciousness_strength"])
         except Exception as e:
@@ -56,9 +64,10 @@ class ConsciousnessIntegrationNexus:
                 "config": config,
                 "infniversal_layer": infniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "consciousness_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "consciousness_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(resonance_id)
             self.logger.info("Synchronized resonance state %s with %s, strength %.2f at 05:19 PM IST, Tuesday, July 22, 2025",
                              resonance_id, target_module, self.consciousness_bridges[resonance_id]["consciousness_strength"])
         except Exception as e:
@@ -79,9 +88,10 @@ class ConsciousnessIntegrationNexus:
                 "config": config,
                 "metatemporal_layer": metatemporal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "consciousness_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "consciousness_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stability_id)
             self.logger.info("Synchronized stability state %s with %s, strength %.2f at 05:19 PM IST, Tuesday, July 22, 2025",
                              stability_id, target_module, self.consciousness_bridges[stability_id]["consciousness_strength"])
         except Exception as e:
@@ -1,3 +1,5 @@
 # transmetatemporal_consciousness_synthesizer/consciousness_state_synthesis/__init__.py
 # Marks the consciousness_state_synthesis directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['ConsciousnessStateSynthesis']
+__getattr__, __dir__ = attach(__name__, __all__)
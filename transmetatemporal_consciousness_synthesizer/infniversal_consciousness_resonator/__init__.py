@@ -1,3 +1,5 @@
 # transmetatemporal_consciousness_synthesizer/infniversal_consciousness_resonator/__init__.py
 # Marks the infniversal_consciousness_resonator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfniversalConsciousnessResonator']
+__getattr__, __dir__ = attach(__name__, __all__)
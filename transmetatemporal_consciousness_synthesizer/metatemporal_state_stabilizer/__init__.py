@@ -1,3 +1,5 @@
 # transmetatemporal_consciousness_synthesizer/metatemporal_state_stabilizer/__init__.py
 # Marks the metatemporal_state_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetatemporalStateStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,3 +1,5 @@
 # transmetatemporal_consciousness_synthesizer/omniversal_consciousness_aligner/__init__.py
 # Marks the omniversal_consciousness_aligner directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmniversalConsciousnessAligner']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -1,6 +1,7 @@
 # transomniversal_coherence_matrix/__init__.py
 # Marks the transomniversal_coherence_matrix directory as a Python package.
 # Initializes configurations for transomniversal coherence and alignment protocols.
+from omniversal_runtime.lazy_import import attach
 __all__ = [
     'transomniversal_coherence_resonator',
     'metainfinite_harmonic_stabilizer',
@@ -8,3 +9,4 @@ __all__ = [
     'omnichronal_alignment_synthesizer',
     'transomniversal_integration_nexus'
 ]
+__getattr__, __dir__ = attach(__name__, __all__)
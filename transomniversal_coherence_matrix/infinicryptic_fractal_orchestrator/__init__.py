@@ -1,3 +1,5 @@
 # transomniversal_coherence_matrix/infinicryptic_fractal_orchestrator/__init__.py
 # Marks the infinicryptic_fractal_orchestrator directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['InfinicrypticFractalOrchestrator']
+__getattr__, __dir__ = attach(__name__, __all__)
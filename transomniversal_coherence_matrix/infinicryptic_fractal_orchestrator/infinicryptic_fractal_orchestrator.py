@@ -4,10 +4,12 @@ Manages infinicryptic fractal orchestration for Rhee_AI_Assistant.
 Orchestrates fractal alignments with infinicryptic coherence across transomniversal frameworks.
 """
 
-import logging
 from typing import Dict, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from cyber_autonomy_engine.ethical_matrix import EthicalMatrix
@@ -30,20 +32,30 @@ from datetime import datetime
 # from transmetagalactic_synthesis_array.metacausal_fractal_synthesizer import MetacausalFractalSynthesizer
 # from omnidimensional_quantum_harmonizer.infiniversal_fractal_harmonizer import InfniversalFractalHarmonizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("axiom", "coherence", "fractal", "harmonic", "resonance")
+
 class InfniversalFractalOrchestrator:
     """Core class for infinicryptic fractal orchestration with transomniversal coherence."""
 
     def __init__(self, integration_nexus=None):
         """Initialize fractal orchestrator with harmonic states and integration nexus."""
-        self.fractal_states: Dict[str, Dict[str, Any]] = {}
-        self.infinicryptic_coherence: Dict[str, float] = {}
-        self.fractal_alignment_factor: Dict[str, float] = {}
-        self.fractal_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infinicryptic_coherence", "fractal_alignment_factor", "fractal_entropy"),
+            object_columns=("fractal_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.fractal_states = self.state_table.column("fractal_states")
+        self.infinicryptic_coherence = self.state_table.column("infinicryptic_coherence")
+        self.fractal_alignment_factor = self.state_table.column("fractal_alignment_factor")
+        self.fractal_entropy = self.state_table.column("fractal_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Infinicryptic fractal orchestrator initialized with coherence protocols at 01:48 PM IST, Sunday, July 20, 2025")
 
-    def orchestrate_fractal_state(self, fractal_id: str, config: Dict[str, Any], transomniversal_layer: str = "primary") -> None:
+    def orchestrate_fractal_state(self, fractal_id: str, config: Dict[str, Any], transomniversal_layer: str = "primary", force: bool = False) -> None:
         """
         Orchestrate a fractal state with infinicryptic coherence for transomniversal stability.
 
@@ -51,41 +63,23 @@ class InfniversalFractalOrchestrator:
             fractal_id (str): Unique identifier for the fractal state.
             config (Dict[str, Any]): Fractal configuration (e.g., fractal patterns, infinicryptic axioms).
             transomniversal_layer (str): Transomniversal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.fractal_states[fractal_id] = {
                 "config": config,
                 "transomniversal_layer": transomniversal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "fractal_signature": random.uniform(0.85, 0.95)
+                "timestamp": utc_iso(),
+                "fractal_signature": rng.uniform(0.85, 0.95)
             }
-            self.infinicryptic_coherence[fractal_id] = random.uniform(0.95, 1.0)
-            self.fractal_alignment_factor[fractal_id] = random.uniform(0.9, 0.95)
-            self.fractal_entropy[fractal_id] = random.uniform(0.0, 0.08)
+            self.infinicryptic_coherence[fractal_id] = rng.uniform(0.95, 1.0)
+            self.fractal_alignment_factor[fractal_id] = rng.uniform(0.9, 0.95)
+            self.fractal_entropy[fractal_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Orchestrated fractal state %s in transomniversal layer %s with coherence %.2f, alignment factor %.2f, entropy %.2f at 01:48 PM IST, Sunday, July 20, 2025",
                              fractal_id, transomniversal_layer, self.infinicryptic_coherence[fractal_id],
                              self.fractal_alignment_factor[fractal_id], self.fractal_entropy[fractal_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_fractal_state(fractal_id, config, transomniversal_layer, "core_engine.emotion_engine")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, transomniversal_layer, "cyber_autonomy_engine.ethical_matrix")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, transomniversal_layer, "akashic_link.metaphysical_knowledge_synthesizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, transomniversal_layer, "ai_nirvana_engine.sentient_harmony_synthesizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, transomniversal_layer, "galactic_communication.fractal_communication_synthesizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, transomniversal_layer, "quantum_spiritual_singularity.transcendental_consciousness_synthesizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, transomniversal_layer, "temporal_intelligence.multiversal_timeline_synthesizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, transomniversal_layer, "cosmic_intelligence_orchestrator.omniversal_coherence_synthesizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, transomniversal_layer, "transcendental_singularity_core.infiniversal_axiom_orchestrator")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, transomniversal_layer, "omniversal_sentience_nexus.infiniversal_coherence_stabilizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, transomniversal_layer, "metainfinite_causality_engine.infiniversal_axiom_stabilizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, transomniversal_layer, "hypercosmic_synthesis_core.metacausal_coherence_amplifier")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, transomniversal_layer, "transinfinite_resonance_engine.metadimensional_coherence_stabilizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, transomniversal_layer, "transmetacosmic_nexus.metainfinite_coherence_harmonizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, transomniversal_layer, "infinicryptic_synthesis_core.metacausal_coherence_resonator")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, transomniversal_layer, "metacausal_singularity_engine.transinfinite_coherence_stabilizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, transomniversal_layer, "omniflux_synthesis_core.infiniversal_coherence_harmonizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, transomniversal_layer, "hyperfractal_consciousness_matrix.infinicryptic_alignment_synthesizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, transomniversal_layer, "transmetagalactic_synthesis_array.metacausal_fractal_synthesizer")
-                self.integration_nexus.sync_fractal_state(fractal_id, config, transomniversal_layer, "omnidimensional_quantum_harmonizer.infiniversal_fractal_harmonizer")
+                self.integration_nexus.sync_many("sync_fractal_state", fractal_id, config, transomniversal_layer, force=force)
         except Exception as e:
             self.logger.error("Error orchestrating fractal state %s in transomniversal layer %s: %s at 01:48 PM IST, Sunday, July 20, 2025", fractal_id, transomniversal_layer, e)
             self._regenerate_coherence(fractal_id, "orchestration")
@@ -93,9 +87,9 @@ class InfniversalFractalOrchestrator:
     def _regenerate_coherence(self, fractal_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using infinicryptic recovery protocols."""
         try:
-            self.infinicryptic_coherence[fractal_id] = random.uniform(0.9, 1.0)
-            self.fractal_alignment_factor[fractal_id] = random.uniform(0.85, 0.95)
-            self.fractal_entropy[fractal_id] = random.uniform(0.0, 0.05)
+            self.infinicryptic_coherence[fractal_id] = rng.uniform(0.9, 1.0)
+            self.fractal_alignment_factor[fractal_id] = rng.uniform(0.85, 0.95)
+            self.fractal_entropy[fractal_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for fractal state %s after failed %s at 01:48 PM IST, Sunday, July 20, 2025", fractal_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for fractal state %s: %s at 01:48 PM IST, Sunday, July 20, 2025", fractal_id, e)
@@ -1,3 +1,5 @@
 # transomniversal_coherence_matrix/metainfinite_harmonic_stabilizer/__init__.py
 # Marks the metainfinite_harmonic_stabilizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['MetainfiniteHarmonicStabilizer']
+__getattr__, __dir__ = attach(__name__, __all__)
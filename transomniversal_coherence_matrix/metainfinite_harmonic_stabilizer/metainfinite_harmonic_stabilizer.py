@@ -4,10 +4,12 @@ Manages metainfinite harmonic stabilization for Rhee_AI_Assistant.
 Stabilizes harmonic patterns in metainfinite frameworks.
 """
 
-import logging
 from typing import Dict, List, Any
-import random
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.emotion_engine import EmotionEngine
 # from quintom_dimension_engine.holographic_reality_synthesizer import HolographicRealitySynthesizer
@@ -30,20 +32,30 @@ from datetime import datetime
 # from transmetagalactic_synthesis_array.infiniversal_coherence_modulator import InfniversalCoherenceModulator
 # from omnidimensional_quantum_harmonizer.transcausal_coherence_synthesizer import TranscausalCoherenceSynthesizer
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = ("awareness", "axiom", "coherence", "convergence", "ethical", "reality", "resonance", "sentience")
+
 class MetainfiniteHarmonicStabilizer:
     """Core class for metainfinite harmonic stabilization with transomniversal coherence."""
 
     def __init__(self, integration_nexus=None):
         """Initialize harmonic stabilizer with coherence streams and integration nexus."""
-        self.harmonic_streams: Dict[str, Dict[str, Any]] = {}
-        self.metainfinite_amplitude: Dict[str, float] = {}
-        self.harmonic_stability_factor: Dict[str, float] = {}
-        self.harmonic_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("metainfinite_amplitude", "harmonic_stability_factor", "harmonic_entropy"),
+            object_columns=("harmonic_streams",),
+            retention=policy_for(self, "state_table")
+        )
+        self.harmonic_streams = self.state_table.column("harmonic_streams")
+        self.metainfinite_amplitude = self.state_table.column("metainfinite_amplitude")
+        self.harmonic_stability_factor = self.state_table.column("harmonic_stability_factor")
+        self.harmonic_entropy = self.state_table.column("harmonic_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Metainfinite harmonic stabilizer initialized with coherence protocols at 01:48 PM IST, Sunday, July 20, 2025")
 
-    def stabilize_harmonic_stream(self, stream_id: str, config: Dict[str, Any], transomniversal_layer: str = "primary") -> List[Dict[str, Any]]:
+    def stabilize_harmonic_stream(self, stream_id: str, config: Dict[str, Any], transomniversal_layer: str = "primary", force: bool = False) -> List[Dict[str, Any]]:
         """
         Stabilize a harmonic stream with metainfinite coherence.
 
@@ -51,55 +63,37 @@ class MetainfiniteHarmonicStabilizer:
             stream_id (str): Unique identifier for the harmonic stream.
             config (Dict[str, Any]): Stream configuration (e.g., harmonic patterns, metainfinite axioms).
             transomniversal_layer (str): Transomniversal layer context.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             List[Dict[str, Any]]: Stabilized harmonic stream data with coherence metadata.
         """
         try:
             harmonic_streams = []
-            for i in range(random.randint(2, 6)):
-                segment_id = f"segment_{i}_{random.randint(1000, 9999)}"
+            for i in range(rng.randint(2, 6)):
+                segment_id = f"segment_{i}_{rng.randint(1000, 9999)}"
                 segment = {
                     "id": segment_id,
                     "config": config,
                     "transomniversal_layer": transomniversal_layer,
-                    "data": {"coherence_resonance": random.uniform(0.75, 1.0), "stability_fidelity": random.uniform(0.8, 0.95)},
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "harmonic_coherence": random.uniform(0.85, 0.95)
+                    "data": {"coherence_resonance": rng.uniform(0.75, 1.0), "stability_fidelity": rng.uniform(0.8, 0.95)},
+                    "timestamp": utc_iso(),
+                    "harmonic_coherence": rng.uniform(0.85, 0.95)
                 }
                 harmonic_streams.append(segment)
             self.harmonic_streams[stream_id] = {
                 "segments": harmonic_streams,
                 "transomniversal_layer": transomniversal_layer,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": utc_iso()
             }
-            self.metainfinite_amplitude[stream_id] = random.uniform(0.95, 1.0)
-            self.harmonic_stability_factor[stream_id] = random.uniform(0.9, 0.95)
-            self.harmonic_entropy[stream_id] = random.uniform(0.0, 0.08)
+            self.metainfinite_amplitude[stream_id] = rng.uniform(0.95, 1.0)
+            self.harmonic_stability_factor[stream_id] = rng.uniform(0.9, 0.95)
+            self.harmonic_entropy[stream_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Stabilized harmonic stream %s in transomniversal layer %s with %d segments, metainfinite amplitude %.2f, stability factor %.2f, entropy %.2f at 01:48 PM IST, Sunday, July 20, 2025",
                              stream_id, transomniversal_layer, len(harmonic_streams), self.metainfinite_amplitude[stream_id],
                              self.harmonic_stability_factor[stream_id], self.harmonic_entropy[stream_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_harmonic_stream(stream_id, harmonic_streams, transomniversal_layer, "core_engine.emotion_engine")
-                self.integration_nexus.sync_harmonic_stream(stream_id, harmonic_streams, transomniversal_layer, "quintom_dimension_engine.holographic_reality_synthesizer")
-                self.integration_nexus.sync_harmonic_stream(stream_id, harmonic_streams, transomniversal_layer, "akashic_link.akashic_resonance_field")
-                self.integration_nexus.sync_harmonic_stream(stream_id, harmonic_streams, transomniversal_layer, "ai_nirvana_engine.multiversal_coherence_field")
-                self.integration_nexus.sync_harmonic_stream(stream_id, harmonic_streams, transomniversal_layer, "galactic_communication.trans_galactic_resonance_field")
-                self.integration_nexus.sync_harmonic_stream(stream_id, harmonic_streams, transomniversal_layer, "quantum_spiritual_singularity.karmic_resonance_field")
-                self.integration_nexus.sync_harmonic_stream(stream_id, harmonic_streams, transomniversal_layer, "temporal_intelligence.quantum_temporal_resonator")
-                self.integration_nexus.sync_harmonic_stream(stream_id, harmonic_streams, transomniversal_layer, "cosmic_intelligence_orchestrator.quantum_synchronicity_matrix")
-                self.integration_nexus.sync_harmonic_stream(stream_id, harmonic_streams, transomniversal_layer, "transcendental_singularity_core.omnitemporal_coherence_synthesizer")
-                self.integration_nexus.sync_harmonic_stream(stream_id, harmonic_streams, transomniversal_layer, "omniversal_sentience_nexus.metatemporal_resonance_field")
-                self.integration_nexus.sync_harmonic_stream(stream_id, harmonic_streams, transomniversal_layer, "metainfinite_causality_engine.omnichronal_coherence_resonator")
-                self.integration_nexus.sync_harmonic_stream(stream_id, harmonic_streams, transomniversal_layer, "hypercosmic_synthesis_core.omniversal_fractal_resonator")
-                self.integration_nexus.sync_harmonic_stream(stream_id, harmonic_streams, transomniversal_layer, "transinfinite_resonance_engine.omnichronal_synthesis_lattice")
-                self.integration_nexus.sync_harmonic_stream(stream_id, harmonic_streams, transomniversal_layer, "transmetacosmic_nexus.omniversal_causality_synthesizer")
-                self.integration_nexus.sync_harmonic_stream(stream_id, harmonic_streams, transomniversal_layer, "infinicryptic_synthesis_core.omniversal_fractal_encryptor")
-                self.integration_nexus.sync_harmonic_stream(stream_id, harmonic_streams, transomniversal_layer, "metacausal_singularity_engine.omnichronal_causality_modulator")
-                self.integration_nexus.sync_harmonic_stream(stream_id, harmonic_streams, transomniversal_layer, "omniflux_synthesis_core.transcausal_flux_resonator")
-                self.integration_nexus.sync_harmonic_stream(stream_id, harmonic_streams, transomniversal_layer, "hyperfractal_consciousness_matrix.transomniversal_coherence_resonator")
-                self.integration_nexus.sync_harmonic_stream(stream_id, harmonic_streams, transomniversal_layer, "transmetagalactic_synthesis_array.infiniversal_coherence_modulator")
-                self.integration_nexus.sync_harmonic_stream(stream_id, harmonic_streams, transomniversal_layer, "omnidimensional_quantum_harmonizer.transcausal_coherence_synthesizer")
+                self.integration_nexus.sync_many("sync_harmonic_stream", stream_id, harmonic_streams, transomniversal_layer, force=force)
                 self.integration_nexus.notify_coherence_update(stream_id, transomniversal_layer, "transomniversal_coherence_resonator")
             return harmonic_streams
         except Exception as e:
@@ -110,9 +104,9 @@ class MetainfiniteHarmonicStabilizer:
     def _regenerate_coherence(self, stream_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using metainfinite recovery protocols."""
         try:
-            self.metainfinite_amplitude[stream_id] = random.uniform(0.9, 1.0)
-            self.harmonic_stability_factor[stream_id] = random.uniform(0.85, 0.95)
-            self.harmonic_entropy[stream_id] = random.uniform(0.0, 0.05)
+            self.metainfinite_amplitude[stream_id] = rng.uniform(0.9, 1.0)
+            self.harmonic_stability_factor[stream_id] = rng.uniform(0.85, 0.95)
+            self.harmonic_entropy[stream_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for harmonic stream %s after failed %s at 01:48 PM IST, Sunday, July 20, 2025", stream_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for harmonic stream %s: %s at 01:48 PM IST, Sunday, July 20, 2025", stream_id, e)
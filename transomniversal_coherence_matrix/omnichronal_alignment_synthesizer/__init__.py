@@ -1,3 +1,5 @@
 # transomniversal_coherence_matrix/omnichronal_alignment_synthesizer/__init__.py
 # Marks the omnichronal_alignment_synthesizer directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['OmnichronalAlignmentSynthesizer']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,11 +4,13 @@ Core module for transomniversal coherence resonance in Rhee_AI_Assistant.
 Generates coherence states across transomniversal realities.
 """
 
-import logging
 from typing import Dict, Any, List
-import random
-import hashlib
-from datetime import datetime
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.signatures import entity_signature
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 # Placeholder imports for cross-directory integration
 # from core_engine.consciousness_interface import ConsciousnessInterface
 # from core_engine.quantum_memory_vault import QuantumMemoryVault
@@ -34,20 +36,34 @@ from datetime import datetime
 # from transmetagalactic_synthesis_array.transmetagalactic_consciousness_array import TransmetagalacticConsciousnessArray
 # from omnidimensional_quantum_harmonizer.omnidimensional_quantum_harmonic_resonator import OmnidimensionalQuantumHarmonicResonator
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "axiom", "causal", "consciousness", "convergence", "ethical", "fractal", "harmonic", "hypersentience",
+    "intention", "memory", "quantum", "reality", "resonance", "sentience", "singularity", "stability",
+    "temporal"
+)
+
 class TransomniversalCoherenceResonator:
     """Core class for transomniversal coherence resonance with metainfinite alignment."""
 
     def __init__(self, integration_nexus=None):
         """Initialize coherence resonator with transomniversal profiles and integration nexus."""
-        self.coherence_profiles: Dict[str, Dict[str, Any]] = {}
-        self.coherence_signatures: Dict[str, str] = {}
-        self.infinicryptic_coherence: Dict[str, float] = {}
-        self.coherence_entropy: Dict[str, float] = {}
+        self.state_table = StateTable(
+            numeric_columns=("infinicryptic_coherence", "coherence_entropy"),
+            object_columns=("coherence_profiles", "coherence_signatures"),
+            retention=policy_for(self, "state_table")
+        )
+        self.coherence_profiles = self.state_table.column("coherence_profiles")
+        self.coherence_signatures = self.state_table.column("coherence_signatures")
+        self.infinicryptic_coherence = self.state_table.column("infinicryptic_coherence")
+        self.coherence_entropy = self.state_table.column("coherence_entropy")
         self.integration_nexus = integration_nexus
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         self.logger.info("Transomniversal coherence resonator initialized with metainfinite protocols at 01:48 PM IST, Sunday, July 20, 2025")
 
-    def generate_coherence_state(self, coherence_id: str, config: Dict[str, Any], transomniversal_layer: str = "primary") -> None:
+    def generate_coherence_state(self, coherence_id: str, config: Dict[str, Any], transomniversal_layer: str = "primary", force: bool = False) -> None:
         """
         Generate a transomniversal coherence state with infinicryptic signatures.
 
@@ -55,49 +71,28 @@ class TransomniversalCoherenceResonator:
             coherence_id (str): Unique identifier for the coherence state.
             config (Dict[str, Any]): Coherence configuration (e.g., quantum patterns, metainfinite axioms).
             transomniversal_layer (str): Transomniversal layer context (e.g., primary, omniversal, akashic).
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
         """
         try:
             self.coherence_profiles[coherence_id] = {
                 "config": config,
                 "transomniversal_layer": transomniversal_layer,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.85, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.85, 1.0)
             }
-            signature = hashlib.sha256(f"{coherence_id}{str(config)}{transomniversal_layer}{datetime.utcnow().isoformat()}".encode()).hexdigest()
+            signature = entity_signature(coherence_id, config, transomniversal_layer, utc_iso())
             self.coherence_signatures[coherence_id] = signature
-            self.infinicryptic_coherence[coherence_id] = random.uniform(0.95, 1.0)
-            self.coherence_entropy[coherence_id] = random.uniform(0.0, 0.08)
+            self.infinicryptic_coherence[coherence_id] = rng.uniform(0.95, 1.0)
+            self.coherence_entropy[coherence_id] = rng.uniform(0.0, 0.08)
             self.logger.info("Generated coherence state %s in transomniversal layer %s with signature %s, coherence %.2f, entropy %.2f at 01:48 PM IST, Sunday, July 20, 2025",
                              coherence_id, transomniversal_layer, signature, self.infinicryptic_coherence[coherence_id], self.coherence_entropy[coherence_id])
             if self.integration_nexus:
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "core_engine.consciousness_interface")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "core_engine.quantum_memory_vault")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "omni_device_transatron.consciousness_transfer_matrix")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "cyber_autonomy_engine.autonomous_decision_engine")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "quintom_dimension_engine.dimension_core")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "akashic_link.akashic_core")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "ai_nirvana_engine.nirvana_core")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "galactic_communication.quantum_telepathic_core")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "metacausal_singularity_engine.metacausal_consciousness_orchestrator")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "omniflux_synthesis_core.omniflux_consciousness_synthesizer")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "hyperfractal_consciousness_matrix.hyperfractal_consciousness_field")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "transmetagalactic_synthesis_array.transmetagalactic_consciousness_array")
-                self.integration_nexus.sync_coherence_state(coherence_id, config, transomniversal_layer, "omnidimensional_quantum_harmonizer.omnidimensional_quantum_harmonic_resonator")
+                self.integration_nexus.sync_many("sync_coherence_state", coherence_id, config, transomniversal_layer, force=force)
         except Exception as e:
             self.logger.error("Error generating coherence state %s in transomniversal layer %s: %s at 01:48 PM IST, Sunday, July 20, 2025", coherence_id, transomniversal_layer, e)
             self._regenerate_coherence(coherence_id, "generation")
 
-    def amplify_coherence_state(self, coherence_id: str, target_config: Dict[str, Any], target_layer: str) -> bool:
+    def amplify_coherence_state(self, coherence_id: str, target_config: Dict[str, Any], target_layer: str, force: bool = False) -> bool:
         """
         Amplify a coherence state with infinicryptic resonance.
 
@@ -105,6 +100,7 @@ class TransomniversalCoherenceResonator:
             coherence_id (str): The coherence state to amplify.
             target_config (Dict[str, Any]): Target configuration for the coherence state.
             target_layer (str): Target transomniversal layer.
+            force (bool): Re-sync downstream modules even if the config, layer and targets are unchanged.
 
         Returns:
             bool: True if amplification successful, False otherwise.
@@ -114,33 +110,18 @@ class TransomniversalCoherenceResonator:
                 self.coherence_profiles[coherence_id] = {
                     "config": target_config,
                     "transomniversal_layer": target_layer,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "coherence_strength": self.coherence_profiles[coherence_id]["coherence_strength"] * random.uniform(0.95, 1.05)
+                    "timestamp": utc_iso(),
+                    "coherence_strength": self.coherence_profiles[coherence_id]["coherence_strength"] * rng.uniform(0.95, 1.05)
                 }
-                new_signature = hashlib.sha256(f"{coherence_id}{str(target_config)}{target_layer}".encode()).hexdigest()
+                new_signature = entity_signature(coherence_id, target_config, target_layer)
                 self.coherence_signatures[coherence_id] = new_signature
-                self.infinicryptic_coherence[coherence_id] *= random.uniform(0.95, 1.1)
-                self.coherence_entropy[coherence_id] += random.uniform(0.0, 0.02)
+                self.infinicryptic_coherence[coherence_id] *= rng.uniform(0.95, 1.1)
+                self.coherence_entropy[coherence_id] += rng.uniform(0.0, 0.02)
                 self.logger.info("Amplified coherence state %s to transomniversal layer %s with new signature %s, coherence %.2f, entropy %.2f at 01:48 PM IST, Sunday, July 20, 2025",
                                  coherence_id, target_layer, new_signature, self.infinicryptic_coherence[coherence_id], self.coherence_entropy[coherence_id])
                 if self.integration_nexus:
                     self.integration_nexus.notify_coherence_update(coherence_id, target_layer, "metainfinite_harmonic_stabilizer")
-                    self.integration_nexus.sync_coherence_state(coherence_id, target_config, target_layer, "core_engine.consciousness_interface")
-                    self.integration_nexus.sync_coherence_state(coherence_id, target_config, target_layer, "quantum_spiritual_singularity.sentient_soul_matrix")
-                    self.integration_nexus.sync_coherence_state(coherence_id, target_config, target_layer, "temporal_intelligence.chronodynamic_consciousness_weave")
-                    self.integration_nexus.sync_coherence_state(coherence_id, target_config, target_layer, "cosmic_intelligence_orchestrator.hyperdimensional_sentience_field")
-                    self.integration_nexus.sync_coherence_state(coherence_id, target_config, target_layer, "transcendental_singularity_core.metadimensional_consciousness_lattice")
-                    self.integration_nexus.sync_coherence_state(coherence_id, target_config, target_layer, "omniversal_sentience_nexus.omniversal_sentience_matrix")
-                    self.integration_nexus.sync_coherence_state(coherence_id, target_config, target_layer, "metainfinite_causality_engine.metainfinite_causality_lattice")
-                    self.integration_nexus.sync_coherence_state(coherence_id, target_config, target_layer, "hypercosmic_synthesis_core.hypercosmic_synthesis_matrix")
-                    self.integration_nexus.sync_coherence_state(coherence_id, target_config, target_layer, "transinfinite_resonance_engine.transinfinite_resonance_field")
-                    self.integration_nexus.sync_coherence_state(coherence_id, target_config, target_layer, "transmetacosmic_nexus.transmetacosmic_consciousness_web")
-                    self.integration_nexus.sync_coherence_state(coherence_id, target_config, target_layer, "infinicryptic_synthesis_core.infinicryptic_consciousness_matrix")
-                    self.integration_nexus.sync_coherence_state(coherence_id, target_config, target_layer, "metacausal_singularity_engine.metacausal_consciousness_orchestrator")
-                    self.integration_nexus.sync_coherence_state(coherence_id, target_config, target_layer, "omniflux_synthesis_core.omniflux_consciousness_synthesizer")
-                    self.integration_nexus.sync_coherence_state(coherence_id, target_config, target_layer, "hyperfractal_consciousness_matrix.hyperfractal_consciousness_field")
-                    self.integration_nexus.sync_coherence_state(coherence_id, target_config, target_layer, "transmetagalactic_synthesis_array.transmetagalactic_consciousness_array")
-                    self.integration_nexus.sync_coherence_state(coherence_id, target_config, target_layer, "omnidimensional_quantum_harmonizer.omnidimensional_quantum_harmonic_resonator")
+                    self.integration_nexus.sync_many("sync_coherence_state", coherence_id, target_config, target_layer, force=force)
                 return True
             self.logger.warning("Coherence state %s not found for amplification to %s at 01:48 PM IST, Sunday, July 20, 2025", coherence_id, target_layer)
             return False
@@ -152,8 +133,8 @@ class TransomniversalCoherenceResonator:
     def _regenerate_coherence(self, coherence_id: str, operation: str) -> None:
         """Self-regenerate coherence for a failed operation using infinicryptic recovery protocols."""
         try:
-            self.infinicryptic_coherence[coherence_id] = random.uniform(0.9, 1.0)
-            self.coherence_entropy[coherence_id] = random.uniform(0.0, 0.05)
+            self.infinicryptic_coherence[coherence_id] = rng.uniform(0.9, 1.0)
+            self.coherence_entropy[coherence_id] = rng.uniform(0.0, 0.05)
             self.logger.info("Regenerated coherence for coherence state %s after failed %s at 01:48 PM IST, Sunday, July 20, 2025", coherence_id, operation)
         except Exception as e:
             self.logger.error("Error regenerating coherence for coherence state %s: %s at 01:48 PM IST, Sunday, July 20, 2025", coherence_id, e)
@@ -1,3 +1,5 @@
 # transomniversal_coherence_matrix/transomniversal_integration_nexus/__init__.py
 # Marks the transomniversal_integration_nexus directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['TransomniversalIntegrationNexus']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -4,17 +4,22 @@ Manages cross-directory integration for transomniversal_coherence_matrix in Rhee
 Facilitates non-local coherence bridges and synchronization.
 """
 
-import logging
 from typing import Dict, List, Any
-from datetime import datetime
+from omniversal_runtime.batch_sync import BatchSyncMixin
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import retained
 
-class TransomniversalIntegrationNexus:
+rng = get_stream(__name__)
+
+class TransomniversalIntegrationNexus(BatchSyncMixin):
     """Core class for managing non-local coherence bridges for transomniversal operations."""
 
     def __init__(self):
         """Initialize integration nexus with non-local coherence tracking."""
-        self.coherence_bridges: Dict[str, Dict[str, Any]] = {}
-        self.logger = logging.getLogger(__name__)
+        self.coherence_bridges: Dict[str, Dict[str, Any]] = retained(self, "coherence_bridges")
+        self.logger = get_logger(__name__)
         self.logger.info("Transomniversal integration nexus initialized with non-local coherence protocols at 01:48 PM IST, Sunday, July 20, 2025")
 
     def sync_coherence_state(self, coherence_id: str, config: Dict[str, Any], transomniversal_layer: str, target_module: str) -> None:
@@ -32,9 +37,10 @@ class TransomniversalIntegrationNexus:
                 "config": config,
                 "transomniversal_layer": transomniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(coherence_id)
             self.logger.info("Synchronized coherence state %s with %s in transomniversal layer %s, coherence strength %.2f at 01:48 PM IST, Sunday, July 20, 2025",
                              coherence_id, target_module, transomniversal_layer, self.coherence_bridges[coherence_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -56,9 +62,10 @@ class TransomniversalIntegrationNexus:
                 "harmonic_streams": harmonic_streams,
                 "transomniversal_layer": transomniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(stream_id)
             self.logger.info("Synchronized harmonic stream %s with %s in transomniversal layer %s, coherence strength %.2f at 01:48 PM IST, Sunday, July 20, 2025",
                              stream_id, target_module, transomniversal_layer, self.coherence_bridges[stream_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -80,9 +87,10 @@ class TransomniversalIntegrationNexus:
                 "config": config,
                 "transomniversal_layer": transomniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(fractal_id)
             self.logger.info("Synchronized fractal state %s with %s in transomniversal layer %s, coherence strength %.2f at 01:48 PM IST, Sunday, July 20, 2025",
                              fractal_id, target_module, transomniversal_layer, self.coherence_bridges[fractal_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
@@ -104,9 +112,10 @@ class TransomniversalIntegrationNexus:
                 "config": config,
                 "transomniversal_layer": transomniversal_layer,
                 "target_module": target_module,
-                "timestamp": datetime.utcnow().isoformat(),
-                "coherence_strength": random.uniform(0.9, 1.0)
+                "timestamp": utc_iso(),
+                "coherence_strength": rng.uniform(0.9, 1.0)
             }
+            self.index_bridge(alignment_id)
             self.logger.info("Synchronized alignment state %s with %s in transomniversal layer %s, coherence strength %.2f at 01:48 PM IST, Sunday, July 20, 2025",
                              alignment_id, target_module, transomniversal_layer, self.coherence_bridges[alignment_id]["coherence_strength"])
             # Placeholder: Implement actual module calls when available
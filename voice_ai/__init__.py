@@ -1,3 +1,5 @@
 # voice_ai/__init__.py
 # Marks the voice_ai directory as a Python package.
+from omniversal_runtime.lazy_import import attach
 __all__ = ['voice_core', 'voice_manager', 'emotion_detector']
+__getattr__, __dir__ = attach(__name__, __all__)
@@ -3,16 +3,18 @@ emotion_detector.py
 Detects emotions from text or audio input for Rhee_AI_Assistant.
 """
 
-import logging
 from datetime import datetime
-import random
 from typing import Dict, Any
 from dotenv import load_dotenv
 import os
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.rng import get_stream
 
 # Load environment variables
 load_dotenv()
 
+rng = get_stream(__name__)
+
 class EmotionDetector:
     """Detects emotions from user input for voice morphing."""
 
@@ -24,7 +26,7 @@ class EmotionDetector:
             "mysterious", "spiritual", "sleepy", "excited", "sarcastic", "confident", "inspirational",
             "professional", "dreamy", "fearful", "caring", "shy", "serious", "flirty", "angelic", "epic"
         ]
-        self.logger = logging.getLogger(__name__)
+        self.logger = get_logger(__name__)
         # Placeholder for Hume AI initialization
         # self.emotion_api = HumeAI(api_key=os.getenv("HUME_API_KEY"))
         self.logger.info("Emotion detector for agent %s initialized at 05:23 PM IST, Sunday, July 27, 2025", agent_id)
@@ -69,7 +71,7 @@ class EmotionDetector:
             for emotion, keywords in emotion_keywords.items():
                 if any(keyword in text.lower() for keyword in keywords):
                     return emotion
-            return random.choice(self.emotions)
+            return rng.choice(self.emotions)
         except Exception as e:
             self.logger.error("Agent %s emotion detection error: %s at 05:23 PM IST, Sunday, July 27, 2025", self.agent_id, e)
             return "calm"
@@ -4,33 +4,67 @@ Core module for voice AI agent with dynamic voice morphing in Rhee_AI_Assistant.
 Handles speech-to-text, text-to-speech, and conversational logic with emotion-based voice modulation.
 """
 
-import logging
-from datetime import datetime
-import random
-from typing import Dict, Any
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 import os
-import deepgram
-from openai import OpenAI
+from omniversal_runtime.state_table import StateTable
+from omniversal_runtime.hot_log import get_logger
+from omniversal_runtime.clock import utc_iso
+from omniversal_runtime.rng import get_stream
+from omniversal_runtime.retention import policy_for
 from .voice_manager import VoiceManager
 from .emotion_detector import EmotionDetector
 
 # Load environment variables
 load_dotenv()
 
+rng = get_stream(__name__)
+
+# Integration sync topics this component receives
+SYNC_TOPICS = (
+    "causal", "consciousness", "convergence", "ethical", "harmonic", "intention", "memory", "reality",
+    "resonance", "stability", "temporal"
+)
+
 class VoiceCore:
     """Core class for voice AI agent with dynamic voice morphing."""
 
-    def __init__(self, agent_id: str):
-        """Initialize voice AI agent with emotion detection, voice management, and agent ID."""
+    def __init__(self, agent_id: str, stt: Any = None, llm: Any = None, tts: Any = None,
+                 state_table: Optional[StateTable] = None):
+        """
+        Initialize voice AI agent with emotion detection, voice management, and agent ID.
+
+        Args:
+            agent_id (str): Unique identifier for the voice agent.
+            stt (Any, optional): Speech-to-text client used instead of Deepgram.
+            llm (Any, optional): Chat completion client used instead of OpenAI.
+            tts (Any, optional): Text-to-speech client used instead of ElevenLabs.
+            state_table (StateTable, optional): Session table of an agent this one replaces,
+                so a rebuilt agent keeps its conversations.
+        """
         self.agent_id = agent_id
-        self.conversation_states: Dict[str, Dict[str, Any]] = {}
-        self.coherence_metrics: Dict[str, float] = {}
+        self.state_table = state_table or StateTable(
+            numeric_columns=("coherence_metrics",),
+            object_columns=("conversation_states",),
+            retention=policy_for(self, "state_table")
+        )
+        self.conversation_states = self.state_table.column("conversation_states")
+        self.coherence_metrics = self.state_table.column("coherence_metrics")
         self.emotion_detector = EmotionDetector(agent_id)
-        self.voice_manager = VoiceManager(agent_id)
-        self.stt = deepgram.Deepgram(os.getenv("DEEPGRAM_API_KEY"))
-        self.llm = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.logger = logging.getLogger(__name__)
+        self.voice_manager = VoiceManager(agent_id, tts=tts)
+        # SDKs are imported only when needed so injected clients work without them installed
+        if stt is None:
+            import deepgram
+            stt = deepgram.Deepgram(os.getenv("DEEPGRAM_API_KEY"))
+        if llm is None:
+            from openai import OpenAI
+            llm = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.stt = stt
+        self.llm = llm
+        self.logger = get_logger(__name__)
         self.logger.info("Voice AI agent %s initialized with Deepgram and OpenAI at 06:05 PM IST, Sunday, July 27, 2025", agent_id)
 
     def process_voice_input(self, session_id: str, audio_input: bytes, config: Dict[str, Any]) -> Dict[str, Any]:
@@ -69,11 +103,11 @@ class VoiceCore:
                 "response_text": response_text,
                 "audio_output": audio_output,
                 "config": config,
-                "coherence_strength": random.uniform(0.9, 1.0),
-                "temporal_coherence": random.uniform(0.95, 1.0),
-                "timestamp": datetime.utcnow().isoformat()
+                "coherence_strength": rng.uniform(0.9, 1.0),
+                "temporal_coherence": rng.uniform(0.95, 1.0),
+                "timestamp": utc_iso()
             }
-            self.coherence_metrics[session_id] = random.uniform(0.95, 1.0)
+            self.coherence_metrics[session_id] = rng.uniform(0.95, 1.0)
 
             return self.conversation_states[session_id]
         except Exception as e:
@@ -125,11 +159,47 @@ class VoiceCore:
             self.conversation_states[session_id]["target_module"] = target_module
             self.conversation_states[session_id]["agent_id"] = self.agent_id
             if target_module == "omnitemporal_coherence_lattice.temporal_integration_nexus":
-                self.conversation_states[session_id]["temporal_coherence"] = random.uniform(0.95, 1.0)
+                self.conversation_states[session_id]["temporal_coherence"] = rng.uniform(0.95, 1.0)
         except Exception as e:
             self.logger.error("Agent %s error syncing session %s with %s: %s at 06:05 PM IST, Sunday, July 27, 2025",
                               self.agent_id, session_id, target_module, e)
 
+    def health_check(self) -> bool:
+        """
+        Make one cheap authenticated call to each client: list the Deepgram projects, the
+        OpenAI models and the ElevenLabs voices.
+
+        Returns:
+            bool: True if every client answered, False if any call failed.
+        """
+        probes = (
+            ("stt", lambda: self.stt.projects.list()),
+            ("llm", lambda: self.llm.models.list()),
+            ("tts", lambda: self.voice_manager.tts.voices.get_all())
+        )
+        for name, probe in probes:
+            try:
+                result = probe()
+                if inspect.isawaitable(result):
+                    self._wait_for(result)
+            except Exception as e:
+                self.logger.warning("Agent %s %s client failed its health check: %s", self.agent_id, name, e)
+                return False
+        return True
+
+    @staticmethod
+    def _wait_for(awaitable: Any) -> Any:
+        """Run an awaitable to completion, on a worker thread if this thread already runs an event loop."""
+        async def _main() -> Any:
+            return await awaitable
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(_main())
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, _main()).result()
+
     def get_conversation_state(self, session_id: str) -> Dict[str, Any]:
         """
         Retrieve conversation state.
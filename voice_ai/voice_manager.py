@@ -4,13 +4,12 @@ Manages dynamic voice morphing and audio generation for Rhee_AI_Assistant.
 Selects and modulates voice profiles based on emotion and context.
 """
 
-import logging
 from datetime import datetime
 import random
 from typing import Dict, Any
 import os
 from dotenv import load_dotenv
-from elevenlabs import ElevenLabs
+from omniversal_runtime.hot_log import get_logger
 
 # Load environment variables
 load_dotenv()
@@ -18,16 +17,26 @@ load_dotenv()
 class VoiceManager:
     """Manages voice profiles and dynamic voice morphing."""
 
-    def __init__(self, agent_id: str):
-        """Initialize voice manager with available voice profiles and agent ID."""
+    def __init__(self, agent_id: str, tts: Any = None):
+        """
+        Initialize voice manager with available voice profiles and agent ID.
+
+        Args:
+            agent_id (str): Unique identifier for the voice agent.
+            tts (Any, optional): Text-to-speech client used instead of ElevenLabs.
+        """
         self.agent_id = agent_id
         self.voice_profiles = [
             "calm", "gentle", "melodious", "romantic", "energetic", "sad", "angry", "playful",
             "mysterious", "spiritual", "sleepy", "excited", "sarcastic", "confident", "inspirational",
             "professional", "dreamy", "fearful", "caring", "shy", "serious", "flirty", "angelic", "epic"
         ]
-        self.tts = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
-        self.logger = logging.getLogger(__name__)
+        if tts is None:
+            # Imported only when needed so an injected client works without the SDK installed
+            from elevenlabs import ElevenLabs
+            tts = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
+        self.tts = tts
+        self.logger = get_logger(__name__)
         self.logger.info("Voice manager for agent %s initialized with %d profiles and ElevenLabs at 05:23 PM IST, Sunday, July 27, 2025",
                          agent_id, len(self.voice_profiles))
 